@@ -0,0 +1,172 @@
+import argparse
+import asyncio
+import time
+from asyncio import AbstractEventLoop
+from typing import Final
+
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from src.storage.jsonStaticReader import JsonStaticReader
+from src.timber.timber import Timber
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberSettings import TimberSettings
+from src.trivia.answerChecker.triviaAnswerCheckResult import TriviaAnswerCheckResult
+from src.trivia.answerChecker.triviaAnswerChecker import TriviaAnswerChecker
+from src.trivia.answerChecker.triviaAnswerCheckerInterface import TriviaAnswerCheckerInterface
+from src.trivia.compilers.triviaAnswerCompiler import TriviaAnswerCompiler
+from src.trivia.compilers.triviaAnswerCompilerInterface import TriviaAnswerCompilerInterface
+from src.trivia.compilers.triviaQuestionCompiler import TriviaQuestionCompiler
+from src.trivia.compilers.triviaQuestionCompilerInterface import TriviaQuestionCompilerInterface
+from src.trivia.misc.triviaSourceParser import TriviaSourceParser
+from src.trivia.questions.questionAnswerTriviaQuestion import QuestionAnswerTriviaQuestion
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.settings.triviaSettingsRepository import TriviaSettingsRepository
+from src.trivia.settings.triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
+from src.trivia.triviaDifficulty import TriviaDifficulty
+
+# Measures how many question/answer guesses per second TriviaAnswerChecker can get through,
+# using a corpus of the kinds of guesses that chat actually sends in during a super trivia
+# burst. Every guess is checked twice per round: once against a fresh checker (nothing has been
+# memoized yet), and then once more against the same checker (every guess is memoized). For
+# example:
+#
+#   python benchmarkTriviaAnswerChecker.py --rounds 50
+
+argumentParser: Final[argparse.ArgumentParser] = argparse.ArgumentParser(description = 'Benchmark the trivia answer checker')
+argumentParser.add_argument('--rounds', type = int, default = 20, help = 'number of times to run through the corpus (default: 20)')
+arguments: Final[argparse.Namespace] = argumentParser.parse_args()
+
+corpus: Final[dict[str, dict[str, TriviaAnswerCheckResult]]] = {
+    'The Legend of Zelda: Ocarina of Time': {
+        'the legend of zelda ocarina of time': TriviaAnswerCheckResult.CORRECT,
+        'The Legend of Zelda: Ocarina of Time': TriviaAnswerCheckResult.CORRECT,
+        'legend  of zelda   ocarina of time!!': TriviaAnswerCheckResult.CORRECT,
+        'legend of zelda ocarrina of time': TriviaAnswerCheckResult.CORRECT,
+        'ocarina of time': TriviaAnswerCheckResult.INCORRECT,
+        'majoras mask': TriviaAnswerCheckResult.INCORRECT,
+        'zelda': TriviaAnswerCheckResult.INCORRECT,
+        'oot': TriviaAnswerCheckResult.INCORRECT,
+    },
+    'George Washington': {
+        'George Washington': TriviaAnswerCheckResult.CORRECT,
+        'george washingtn': TriviaAnswerCheckResult.CORRECT,
+        'georgewashington': TriviaAnswerCheckResult.CORRECT,
+        'washington': TriviaAnswerCheckResult.INCORRECT,
+        'lincoln': TriviaAnswerCheckResult.INCORRECT,
+        'abraham lincoln': TriviaAnswerCheckResult.INCORRECT,
+        'thomas jefferson': TriviaAnswerCheckResult.INCORRECT,
+    },
+    'World War II': {
+        'world war 2': TriviaAnswerCheckResult.CORRECT,
+        'world war two': TriviaAnswerCheckResult.CORRECT,
+        'World War II': TriviaAnswerCheckResult.CORRECT,
+        'world war 1': TriviaAnswerCheckResult.INCORRECT,
+        'the cold war': TriviaAnswerCheckResult.INCORRECT,
+        'ww2': TriviaAnswerCheckResult.INCORRECT,
+    },
+}
+
+eventLoop: Final[AbstractEventLoop] = asyncio.new_event_loop()
+asyncio.set_event_loop(eventLoop)
+
+backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = BackgroundTaskHelper(
+    eventLoop = eventLoop,
+)
+
+timeZoneRepository: Final[TimeZoneRepositoryInterface] = TimeZoneRepository()
+
+# never started and kept off the console, so log entries are still built (just as they would
+# be in the bot) but never get written out anywhere
+timber: Final[TimberInterface] = Timber(
+    backgroundTaskHelper = backgroundTaskHelper,
+    timeZoneRepository = timeZoneRepository,
+    timberSettings = TimberSettings(
+        consoleEnabled = False,
+    ),
+)
+
+triviaAnswerCompiler: Final[TriviaAnswerCompilerInterface] = TriviaAnswerCompiler(
+    timber = timber,
+)
+
+triviaQuestionCompiler: Final[TriviaQuestionCompilerInterface] = TriviaQuestionCompiler(
+    timber = timber,
+)
+
+triviaSettingsRepository: Final[TriviaSettingsRepositoryInterface] = TriviaSettingsRepository(
+    settingsJsonReader = JsonStaticReader(dict()),
+    triviaSourceParser = TriviaSourceParser(),
+)
+
+async def createQuestion(originalCorrectAnswer: str, triviaId: str) -> QuestionAnswerTriviaQuestion:
+    originalCorrectAnswers: list[str] = [ originalCorrectAnswer ]
+    correctAnswers = await triviaQuestionCompiler.compileResponses(originalCorrectAnswers)
+    compiledCorrectAnswers = await triviaAnswerCompiler.compileTextAnswersList(originalCorrectAnswers)
+
+    expandedCompiledCorrectAnswers: set[str] = set()
+    for compiledCorrectAnswer in compiledCorrectAnswers:
+        expandedCompiledCorrectAnswers.update(await triviaAnswerCompiler.expandNumerals(compiledCorrectAnswer))
+
+    return QuestionAnswerTriviaQuestion(
+        allWords = None,
+        compiledCorrectAnswers = list(expandedCompiledCorrectAnswers),
+        correctAnswers = correctAnswers,
+        originalCorrectAnswers = originalCorrectAnswers,
+        category = None,
+        categoryId = None,
+        question = 'What is the answer?',
+        triviaId = triviaId,
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        originalTriviaSource = None,
+        triviaSource = TriviaSource.FUNTOON,
+    )
+
+async def checkCorpus(
+    triviaAnswerChecker: TriviaAnswerCheckerInterface,
+    questions: dict[str, QuestionAnswerTriviaQuestion],
+) -> float:
+    start = time.perf_counter()
+
+    for originalCorrectAnswer, guesses in corpus.items():
+        question = questions[originalCorrectAnswer]
+
+        for guess, expectedResult in guesses.items():
+            result = await triviaAnswerChecker.checkAnswer(guess, question)
+
+            if result is not expectedResult:
+                raise RuntimeError(f'Guess was checked incorrectly ({guess=}) ({originalCorrectAnswer=}) ({result=}) ({expectedResult=})')
+
+    return time.perf_counter() - start
+
+async def benchmark():
+    if arguments.rounds < 1:
+        raise ValueError(f'rounds argument is out of bounds: {arguments.rounds}')
+
+    questions: dict[str, QuestionAnswerTriviaQuestion] = dict()
+    for index, originalCorrectAnswer in enumerate(corpus.keys()):
+        questions[originalCorrectAnswer] = await createQuestion(originalCorrectAnswer, f'question{index}')
+
+    guessCount = sum(len(guesses) for guesses in corpus.values()) * arguments.rounds
+    coldSeconds = 0.0
+    warmSeconds = 0.0
+
+    for _ in range(arguments.rounds):
+        triviaAnswerChecker = TriviaAnswerChecker(
+            timber = timber,
+            triviaAnswerCompiler = triviaAnswerCompiler,
+            triviaSettingsRepository = triviaSettingsRepository,
+        )
+
+        for question in questions.values():
+            await triviaAnswerChecker.prepareQuestion(question)
+
+        coldSeconds += await checkCorpus(triviaAnswerChecker, questions)
+        warmSeconds += await checkCorpus(triviaAnswerChecker, questions)
+
+    print(f'Checked {guessCount} guess(es) both cold and warm, over {arguments.rounds} round(s)')
+    print(f'cold: {coldSeconds:.3f}s total, {guessCount / coldSeconds:.0f} guesses/s')
+    print(f'warm: {warmSeconds:.3f}s total, {guessCount / warmSeconds:.0f} guesses/s')
+
+eventLoop.run_until_complete(benchmark())
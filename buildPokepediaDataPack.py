@@ -0,0 +1,68 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from typing import Final
+
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from src.network.networkClientProvider import NetworkClientProvider
+from src.network.requests.requestsClientProvider import RequestsClientProvider
+from src.pkmn.dataPack.pokepediaDataPackBuilder import PokepediaDataPackBuilder
+from src.pkmn.dataPack.pokepediaDataPackBuilderInterface import PokepediaDataPackBuilderInterface
+from src.pkmn.dataPack.pokepediaDataPackJsonMapper import PokepediaDataPackJsonMapper
+from src.pkmn.dataPack.pokepediaDataPackJsonMapperInterface import PokepediaDataPackJsonMapperInterface
+from src.pkmn.pokepediaGeneration import PokepediaGeneration
+from src.pkmn.pokepediaJsonMapper import PokepediaJsonMapper
+from src.pkmn.pokepediaJsonMapperInterface import PokepediaJsonMapperInterface
+from src.pkmn.pokepediaRepository import PokepediaRepository
+from src.pkmn.pokepediaRepositoryInterface import PokepediaRepositoryInterface
+from src.timber.timber import Timber
+from src.timber.timberInterface import TimberInterface
+
+# Pulls every move and Pokemon from PokeAPI (this takes a while) and writes them into the
+# offline data pack that PokepediaDataPackRepository reads from.
+
+eventLoop: Final[AbstractEventLoop] = asyncio.new_event_loop()
+asyncio.set_event_loop(eventLoop)
+
+backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = BackgroundTaskHelper(
+    eventLoop = eventLoop,
+)
+
+timeZoneRepository: Final[TimeZoneRepositoryInterface] = TimeZoneRepository()
+
+timber: Final[TimberInterface] = Timber(
+    backgroundTaskHelper = backgroundTaskHelper,
+    timeZoneRepository = timeZoneRepository,
+)
+
+networkClientProvider: Final[NetworkClientProvider] = RequestsClientProvider(
+    timber = timber,
+)
+
+pokepediaJsonMapper: Final[PokepediaJsonMapperInterface] = PokepediaJsonMapper(
+    timber = timber,
+)
+
+pokepediaRepository: Final[PokepediaRepositoryInterface] = PokepediaRepository(
+    networkClientProvider = networkClientProvider,
+    pokepediaJsonMapper = pokepediaJsonMapper,
+    timber = timber,
+)
+
+pokepediaDataPackJsonMapper: Final[PokepediaDataPackJsonMapperInterface] = PokepediaDataPackJsonMapper(
+    timber = timber,
+)
+
+pokepediaDataPackBuilder: Final[PokepediaDataPackBuilderInterface] = PokepediaDataPackBuilder(
+    pokepediaDataPackJsonMapper = pokepediaDataPackJsonMapper,
+    pokepediaRepository = pokepediaRepository,
+    timber = timber,
+)
+
+eventLoop.run_until_complete(pokepediaDataPackBuilder.buildDataPack(
+    maxGeneration = PokepediaGeneration.GENERATION_8,
+))
+
+eventLoop.run_until_complete(networkClientProvider.close())
@@ -1,8 +1,11 @@
 import asyncio
 import locale
+import time
 from asyncio import AbstractEventLoop
 from typing import Final
 
+importStartTime: Final[float] = time.perf_counter()
+
 from src.accessLevelChecking.accessLevelCheckingHelper import AccessLevelCheckingHelper
 from src.accessLevelChecking.accessLevelCheckingHelperInterface import AccessLevelCheckingHelperInterface
 from src.aniv.contentScanner.anivContentScanner import AnivContentScanner
@@ -28,7 +31,6 @@ from src.aniv.settings.anivSettingsInterface import AnivSettingsInterface
 from src.asplodieStats.asplodieStatsPresenter import AsplodieStatsPresenter
 from src.asplodieStats.repository.asplodieStatsRepository import AsplodieStatsRepository
 from src.asplodieStats.repository.asplodieStatsRepositoryInterface import AsplodieStatsRepositoryInterface
-from src.beanStats.beanStatsPresenter import BeanStatsPresenter
 from src.beanStats.beanStatsPresenterInterface import BeanStatsPresenterInterface
 from src.beanStats.beanStatsRepository import BeanStatsRepository
 from src.beanStats.beanStatsRepositoryInterface import BeanStatsRepositoryInterface
@@ -60,6 +62,8 @@ from src.chatActions.soundAlertChatAction import SoundAlertChatAction
 from src.chatActions.supStreamerChatAction import SupStreamerChatAction
 from src.chatActions.ttsChatterChatAction import TtsChatterChatAction
 from src.chatActions.voicemailChatAction import VoicemailChatAction
+from src.chatLogger.archive.chatLogArchive import ChatLogArchive
+from src.chatLogger.archive.chatLogArchiveInterface import ChatLogArchiveInterface
 from src.chatLogger.chatLogger import ChatLogger
 from src.chatLogger.chatLoggerInterface import ChatLoggerInterface
 from src.chatterInventory.configuration.absChatterItemEventHandler import AbsChatterItemEventHandler
@@ -176,15 +180,10 @@ from src.decTalk.mapper.decTalkVoiceMapper import DecTalkVoiceMapper
 from src.decTalk.mapper.decTalkVoiceMapperInterface import DecTalkVoiceMapperInterface
 from src.decTalk.settings.decTalkSettingsRepository import DecTalkSettingsRepository
 from src.decTalk.settings.decTalkSettingsRepositoryInterface import DecTalkSettingsRepositoryInterface
-from src.deepL.deepLApiService import DeepLApiService
 from src.deepL.deepLApiServiceInterface import DeepLApiServiceInterface
-from src.deepL.deepLJsonMapper import DeepLJsonMapper
 from src.deepL.deepLJsonMapperInterface import DeepLJsonMapperInterface
-from src.ecco.eccoApiService import EccoApiService
 from src.ecco.eccoApiServiceInterface import EccoApiServiceInterface
-from src.ecco.eccoHelper import EccoHelper
 from src.ecco.eccoHelperInterface import EccoHelperInterface
-from src.ecco.eccoResponseParser import EccoResponseParser
 from src.ecco.eccoResponseParserInterface import EccoResponseParserInterface
 from src.emojiHelper.emojiHelper import EmojiHelper
 from src.emojiHelper.emojiHelperInterface import EmojiHelperInterface
@@ -238,21 +237,14 @@ from src.halfLife.service.halfLifeTtsService import HalfLifeTtsService
 from src.halfLife.service.halfLifeTtsServiceInterface import HalfLifeTtsServiceInterface
 from src.halfLife.settings.halfLifeSettingsRepository import HalfLifeSettingsRepository
 from src.halfLife.settings.halfLifeSettingsRepositoryInterface import HalfLifeSettingsRepositoryInterface
-from src.jisho.jishoApiService import JishoApiService
 from src.jisho.jishoApiServiceInterface import JishoApiServiceInterface
-from src.jisho.jishoJsonMapper import JishoJsonMapper
 from src.jisho.jishoJsonMapperInterface import JishoJsonMapperInterface
-from src.jisho.jishoPresenter import JishoPresenter
 from src.jisho.jishoPresenterInterface import JishoPresenterInterface
-from src.language.jishoHelper import JishoHelper
 from src.language.jishoHelperInterface import JishoHelperInterface
 from src.language.jsonMapper.languageEntryJsonMapper import LanguageEntryJsonMapper
 from src.language.jsonMapper.languageEntryJsonMapperInterface import LanguageEntryJsonMapperInterface
 from src.language.languagesRepository import LanguagesRepository
 from src.language.languagesRepositoryInterface import LanguagesRepositoryInterface
-from src.language.translation.deepLTranslationApi import DeepLTranslationApi
-from src.language.translation.googleTranslationApi import GoogleTranslationApi
-from src.language.translationHelper import TranslationHelper
 from src.language.translationHelperInterface import TranslationHelperInterface
 from src.language.wordOfTheDay.wordOfTheDayPresenter import WordOfTheDayPresenter
 from src.language.wordOfTheDay.wordOfTheDayPresenterInterface import WordOfTheDayPresenterInterface
@@ -298,6 +290,11 @@ from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
 from src.misc.cynanBotUserIdsProvider import CynanBotUserIdsProvider
 from src.misc.cynanBotUserIdsProviderInterface import CynanBotUserIdsProviderInterface
 from src.misc.generalSettingsRepository import GeneralSettingsRepository
+from src.misc.localProcessPool.localProcessPool import LocalProcessPool
+from src.misc.localProcessPool.localProcessPoolInterface import LocalProcessPoolInterface
+from src.misc.serviceContainer.serviceContainer import ServiceContainer
+from src.misc.serviceContainer.serviceContainerInterface import ServiceContainerInterface
+from src.misc.serviceContainer.serviceContainerSettings import ServiceContainerSettings
 from src.mostRecentChat.mostRecentChatsRepository import MostRecentChatsRepository
 from src.mostRecentChat.mostRecentChatsRepositoryInterface import MostRecentChatsRepositoryInterface
 from src.network.aioHttp.aioHttpClientProvider import AioHttpClientProvider
@@ -317,6 +314,9 @@ from src.pixelsDice.mappers.pixelsDiceStateMapper import PixelsDiceStateMapper
 from src.pixelsDice.mappers.pixelsDiceStateMapperInterface import PixelsDiceStateMapperInterface
 from src.pixelsDice.pixelsDiceSettings import PixelsDiceSettings
 from src.pixelsDice.pixelsDiceSettingsInterface import PixelsDiceSettingsInterface
+from src.pkmn.dataPack.pokepediaDataPackJsonMapper import PokepediaDataPackJsonMapper
+from src.pkmn.dataPack.pokepediaDataPackJsonMapperInterface import PokepediaDataPackJsonMapperInterface
+from src.pkmn.dataPack.pokepediaDataPackRepository import PokepediaDataPackRepository
 from src.pkmn.pokepediaJsonMapper import PokepediaJsonMapper
 from src.pkmn.pokepediaJsonMapperInterface import PokepediaJsonMapperInterface
 from src.pkmn.pokepediaRepository import PokepediaRepository
@@ -356,7 +356,6 @@ from src.soundPlayerManager.randomizerHelper.soundPlayerRandomizerHelperInterfac
 from src.soundPlayerManager.settings.soundPlayerSettingsRepository import SoundPlayerSettingsRepository
 from src.soundPlayerManager.settings.soundPlayerSettingsRepositoryInterface import \
     SoundPlayerSettingsRepositoryInterface
-from src.starWars.starWarsQuotesRepository import StarWarsQuotesRepository
 from src.starWars.starWarsQuotesRepositoryInterface import StarWarsQuotesRepositoryInterface
 from src.storage.backingDatabase import BackingDatabase
 from src.storage.databaseType import DatabaseType
@@ -397,6 +396,7 @@ from src.supStreamer.supStreamerRepository import SupStreamerRepository
 from src.supStreamer.supStreamerRepositoryInterface import SupStreamerRepositoryInterface
 from src.timber.timber import Timber
 from src.timber.timberInterface import TimberInterface
+from src.timber.timberSettingsReader import TimberSettingsReader
 from src.timeout.configuration.absTimeoutEventHandler import AbsTimeoutEventHandler
 from src.timeout.configuration.timeoutEventHandler import TimeoutEventHandler
 from src.timeout.guaranteedTimeoutUsersRepository import GuaranteedTimeoutUsersRepository
@@ -745,6 +745,9 @@ from src.websocketConnection.settings.websocketConnectionServerSettingsInterface
 from src.websocketConnection.websocketConnectionServer import WebsocketConnectionServer
 from src.websocketConnection.websocketConnectionServerInterface import WebsocketConnectionServerInterface
 
+# the wall clock time spent importing all of the modules above
+importSeconds: Final[float] = time.perf_counter() - importStartTime
+
 locale.setlocale(locale.LC_ALL, 'en_US.utf8')
 
 
@@ -764,6 +767,21 @@ timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
 timber: TimberInterface = Timber(
     backgroundTaskHelper = backgroundTaskHelper,
     timeZoneRepository = timeZoneRepository,
+    timberSettings = TimberSettingsReader(
+        settingsJsonReader = JsonFileReader(
+            eventLoop = eventLoop,
+            fileName = '../config/timberSettings.json',
+        ),
+    ).readSettings(),
+)
+
+serviceContainer: ServiceContainerInterface = ServiceContainer(
+    disabledServiceNames = ServiceContainerSettings(
+        settingsJsonReader = JsonFileReader(
+            eventLoop = eventLoop,
+            fileName = '../config/serviceContainerSettings.json',
+        ),
+    ).getDisabledServiceNames(),
 )
 
 networkJsonMapper: NetworkJsonMapperInterface = NetworkJsonMapper()
@@ -845,6 +863,7 @@ twitchApiService: TwitchApiServiceInterface = TwitchApiService(
 )
 
 userIdsRepository: Final[UserIdsRepositoryInterface] = UserIdsRepository(
+    backgroundTaskHelper = backgroundTaskHelper,
     backingDatabase = backingDatabase,
     timber = timber,
     twitchApiService = twitchApiService,
@@ -990,10 +1009,15 @@ addOrRemoveUserDataHelper: AddOrRemoveUserDataHelperInterface = AddOrRemoveUserD
     timeZoneRepository = timeZoneRepository
 )
 
+chatLogArchive: ChatLogArchiveInterface = ChatLogArchive(
+    timber = timber,
+)
+
 chatLogger: ChatLoggerInterface = ChatLogger(
     backgroundTaskHelper = backgroundTaskHelper,
     timber = timber,
     timeZoneRepository = timeZoneRepository,
+    chatLogArchive = chatLogArchive,
 )
 
 activeChattersRepository: ActiveChattersRepositoryInterface = ActiveChattersRepository(
@@ -1080,6 +1104,7 @@ locationsRepository: LocationsRepositoryInterface = LocationsRepository(
 )
 
 mostRecentChatsRepository: MostRecentChatsRepositoryInterface = MostRecentChatsRepository(
+    backgroundTaskHelper = backgroundTaskHelper,
     backingDatabase = backingDatabase,
     timber = timber,
     timeZoneRepository = timeZoneRepository
@@ -1089,12 +1114,20 @@ pokepediaJsonMapper: PokepediaJsonMapperInterface = PokepediaJsonMapper(
     timber = timber
 )
 
-pokepediaRepository: PokepediaRepositoryInterface = PokepediaRepository(
-    networkClientProvider = networkClientProvider,
-    pokepediaJsonMapper = pokepediaJsonMapper,
+pokepediaDataPackJsonMapper: PokepediaDataPackJsonMapperInterface = PokepediaDataPackJsonMapper(
     timber = timber
 )
 
+pokepediaRepository: PokepediaRepositoryInterface = PokepediaDataPackRepository(
+    pokepediaDataPackJsonMapper = pokepediaDataPackJsonMapper,
+    timber = timber,
+    fallbackRepository = PokepediaRepository(
+        networkClientProvider = networkClientProvider,
+        pokepediaJsonMapper = pokepediaJsonMapper,
+        timber = timber
+    )
+)
+
 twitchIrcTagsParser: TwitchIrcTagsParserInterface = TwitchIrcTagsParser()
 
 twitchConfiguration: TwitchConfiguration = TwitchIoConfiguration(
@@ -1381,6 +1414,11 @@ ttsCommandBuilder: Final[TtsCommandBuilderInterface] = TtsCommandBuilder(
 
 ttsDirectoryProvider: Final[TtsDirectoryProviderInterface] = TtsDirectoryProvider()
 
+localProcessPool: Final[LocalProcessPoolInterface] = LocalProcessPool(
+    backgroundTaskHelper = backgroundTaskHelper,
+    timber = timber,
+)
+
 
 ########################################
 ## Glacial TTS initialization section ##
@@ -1419,6 +1457,7 @@ commodoreSamSettingsRepository: CommodoreSamSettingsRepositoryInterface = Commod
 commodoreSamApiService: CommodoreSamApiServiceInterface = CommodoreSamApiService(
     eventLoop = eventLoop,
     commodoreSamSettingsRepository = commodoreSamSettingsRepository,
+    localProcessPool = localProcessPool,
     timber = timber,
     ttsDirectoryProvider = ttsDirectoryProvider,
 )
@@ -1426,8 +1465,8 @@ commodoreSamApiService: CommodoreSamApiServiceInterface = CommodoreSamApiService
 commodoreSamHelper: CommodoreSamHelperInterface = CommodoreSamHelper(
     commodoreSamApiService = commodoreSamApiService,
     commodoreSamSettingsRepository = commodoreSamSettingsRepository,
+    glacialTtsFileRetriever = glacialTtsFileRetriever,
     timber = timber,
-    timeZoneRepository = timeZoneRepository,
 )
 
 commodoreSamMessageCleaner: CommodoreSamMessageCleanerInterface = CommodoreSamMessageCleaner(
@@ -1461,6 +1500,7 @@ decTalkSettingsRepository: DecTalkSettingsRepositoryInterface = DecTalkSettingsR
 decTalkApiService: DecTalkApiServiceInterface = DecTalkApiService(
     eventLoop = eventLoop,
     decTalkSettingsRepository = decTalkSettingsRepository,
+    localProcessPool = localProcessPool,
     timber = timber,
     ttsDirectoryProvider = ttsDirectoryProvider
 )
@@ -1468,8 +1508,8 @@ decTalkApiService: DecTalkApiServiceInterface = DecTalkApiService(
 decTalkHelper: DecTalkHelperInterface = DecTalkHelper(
     decTalkApiService = decTalkApiService,
     decTalkSettingsRepository = decTalkSettingsRepository,
+    glacialTtsFileRetriever = glacialTtsFileRetriever,
     timber = timber,
-    timeZoneRepository = timeZoneRepository
 )
 
 decTalkMessageCleaner: DecTalkMessageCleanerInterface = DecTalkMessageCleaner(
@@ -2730,7 +2770,12 @@ recurringActionsEventHandler: AbsRecurringActionsEventHandler = RecurringActions
 ## Bean initialization section ##
 #################################
 
-beanStatsPresenter: BeanStatsPresenterInterface = BeanStatsPresenter()
+def createBeanStatsPresenter() -> BeanStatsPresenterInterface:
+    from src.beanStats.beanStatsPresenter import BeanStatsPresenter
+
+    return BeanStatsPresenter()
+
+serviceContainer.register('beanStatsPresenter', createBeanStatsPresenter)
 
 beanStatsRepository: BeanStatsRepositoryInterface = BeanStatsRepository(
     backingDatabase = backingDatabase,
@@ -2744,37 +2789,46 @@ beanStatsRepository: BeanStatsRepositoryInterface = BeanStatsRepository(
 ## Translation initialization section ##
 ########################################
 
-deepLJsonMapper: DeepLJsonMapperInterface = DeepLJsonMapper(
-    languagesRepository = languagesRepository,
-    timber = timber
-)
+def createTranslationHelper() -> TranslationHelperInterface:
+    from src.deepL.deepLApiService import DeepLApiService
+    from src.deepL.deepLJsonMapper import DeepLJsonMapper
+    from src.language.translation.deepLTranslationApi import DeepLTranslationApi
+    from src.language.translation.googleTranslationApi import GoogleTranslationApi
+    from src.language.translationHelper import TranslationHelper
 
-deepLApiService: DeepLApiServiceInterface = DeepLApiService(
-    deepLAuthKeyProvider = authRepository,
-    deepLJsonMapper = deepLJsonMapper,
-    networkClientProvider = networkClientProvider,
-    timber = timber
-)
+    deepLJsonMapper: DeepLJsonMapperInterface = DeepLJsonMapper(
+        languagesRepository = languagesRepository,
+        timber = timber,
+    )
 
-deepLTranslationApi = DeepLTranslationApi(
-    deepLApiService = deepLApiService,
-    deepLAuthKeyProvider = authRepository,
-    timber = timber
-)
+    deepLApiService: DeepLApiServiceInterface = DeepLApiService(
+        deepLAuthKeyProvider = authRepository,
+        deepLJsonMapper = deepLJsonMapper,
+        networkClientProvider = networkClientProvider,
+        timber = timber,
+    )
 
-googleTranslationApi = GoogleTranslationApi(
-    googleApiService = googleApiService,
-    googleCloudProjectCredentialsProvider = authRepository,
-    languagesRepository = languagesRepository,
-    timber = timber
-)
+    deepLTranslationApi = DeepLTranslationApi(
+        deepLApiService = deepLApiService,
+        deepLAuthKeyProvider = authRepository,
+        timber = timber,
+    )
 
-translationHelper: TranslationHelperInterface = TranslationHelper(
-    deepLTranslationApi = deepLTranslationApi,
-    googleTranslationApi = googleTranslationApi,
-    languagesRepository = languagesRepository,
-    timber = timber
-)
+    googleTranslationApi = GoogleTranslationApi(
+        googleApiService = googleApiService,
+        googleCloudProjectCredentialsProvider = authRepository,
+        languagesRepository = languagesRepository,
+        timber = timber,
+    )
+
+    return TranslationHelper(
+        deepLTranslationApi = deepLTranslationApi,
+        googleTranslationApi = googleTranslationApi,
+        languagesRepository = languagesRepository,
+        timber = timber,
+    )
+
+serviceContainer.register('translationHelper', createTranslationHelper)
 
 
 ##########################################
@@ -2929,35 +2983,48 @@ cheerActionHelper: CheerActionHelperInterface = CheerActionHelper(
 ## Star Wars Quotes initialization section ##
 #############################################
 
-starWarsQuotesRepository: StarWarsQuotesRepositoryInterface = StarWarsQuotesRepository(
-    quotesJsonReader = JsonFileReader(
-        eventLoop = eventLoop,
-        fileName = 'starWarsQuotesRepository.json',
-    ),
-)
+def createStarWarsQuotesRepository() -> StarWarsQuotesRepositoryInterface:
+    from src.starWars.starWarsQuotesRepository import StarWarsQuotesRepository
+
+    return StarWarsQuotesRepository(
+        quotesJsonReader = JsonFileReader(
+            eventLoop = eventLoop,
+            fileName = 'starWarsQuotesRepository.json',
+        ),
+    )
+
+serviceContainer.register('starWarsQuotesRepository', createStarWarsQuotesRepository)
 
 
 ##################################
 ## Jisho initialization section ##
 ##################################
 
-jishoJsonMapper: JishoJsonMapperInterface = JishoJsonMapper(
-    timber = timber,
-)
+def createJishoHelper() -> JishoHelperInterface:
+    from src.jisho.jishoApiService import JishoApiService
+    from src.jisho.jishoJsonMapper import JishoJsonMapper
+    from src.jisho.jishoPresenter import JishoPresenter
+    from src.language.jishoHelper import JishoHelper
 
-jishoApiService: JishoApiServiceInterface = JishoApiService(
-    jishoJsonMapper = jishoJsonMapper,
-    networkClientProvider = networkClientProvider,
-    timber = timber,
-)
+    jishoJsonMapper: JishoJsonMapperInterface = JishoJsonMapper(
+        timber = timber,
+    )
 
-jishoPresenter: JishoPresenterInterface = JishoPresenter()
+    jishoApiService: JishoApiServiceInterface = JishoApiService(
+        jishoJsonMapper = jishoJsonMapper,
+        networkClientProvider = networkClientProvider,
+        timber = timber,
+    )
 
-jishoHelper: JishoHelperInterface = JishoHelper(
-    jishoApiService = jishoApiService,
-    jishoPresenter = jishoPresenter,
-    timber = timber,
-)
+    jishoPresenter: JishoPresenterInterface = JishoPresenter()
+
+    return JishoHelper(
+        jishoApiService = jishoApiService,
+        jishoPresenter = jishoPresenter,
+        timber = timber,
+    )
+
+serviceContainer.register('jishoHelper', createJishoHelper)
 
 
 #########################################
@@ -3186,22 +3253,29 @@ ttsChatterPointRedemption: TtsChatterPointRedemption | None = TtsChatterPointRed
 ## Ecco initialization section ##
 #################################
 
-eccoResponseParser: Final[EccoResponseParserInterface] = EccoResponseParser(
-    timber = timber,
-    timeZoneRepository = timeZoneRepository,
-)
+def createEccoHelper() -> EccoHelperInterface:
+    from src.ecco.eccoApiService import EccoApiService
+    from src.ecco.eccoHelper import EccoHelper
+    from src.ecco.eccoResponseParser import EccoResponseParser
 
-eccoApiService: Final[EccoApiServiceInterface] = EccoApiService(
-    eccoResponseParser = eccoResponseParser,
-    networkClientProvider = networkClientProvider,
-    timber = timber,
-)
+    eccoResponseParser: EccoResponseParserInterface = EccoResponseParser(
+        timber = timber,
+        timeZoneRepository = timeZoneRepository,
+    )
 
-eccoHelper: Final[EccoHelperInterface] = EccoHelper(
-    eccoApiService = eccoApiService,
-    timber = timber,
-    timeZoneRepository = timeZoneRepository,
-)
+    eccoApiService: EccoApiServiceInterface = EccoApiService(
+        eccoResponseParser = eccoResponseParser,
+        networkClientProvider = networkClientProvider,
+        timber = timber,
+    )
+
+    return EccoHelper(
+        eccoApiService = eccoApiService,
+        timber = timber,
+        timeZoneRepository = timeZoneRepository,
+    )
+
+serviceContainer.register('eccoHelper', createEccoHelper)
 
 
 ########################################################
@@ -3378,10 +3452,10 @@ cynanBot: Final[CynanBot] = CynanBot(
     asplodieStatsRepository = asplodieStatsRepository,
     authRepository = authRepository,
     backgroundTaskHelper = backgroundTaskHelper,
+    backingDatabase = backingDatabase,
     bannedTriviaGameControllersRepository = bannedTriviaGameControllersRepository,
     bannedWordsRepository = bannedWordsRepository,
     beanChanceCheerActionHelper = beanChanceCheerActionHelper,
-    beanStatsPresenter = beanStatsPresenter,
     beanStatsRepository = beanStatsRepository,
     bizhawkSettingsRepository = bizhawkSettingsRepository,
     chatActionsManager = chatActionsManager,
@@ -3418,21 +3492,21 @@ cynanBot: Final[CynanBot] = CynanBot(
     cutenessRepository = cutenessRepository,
     cutenessUtils = cutenessUtils,
     decTalkSettingsRepository = decTalkSettingsRepository,
-    eccoHelper = eccoHelper,
     funtoonHelper = funtoonHelper,
     funtoonTokensRepository = funtoonTokensRepository,
     generalSettingsRepository = generalSettingsRepository,
+    glacialTtsStorageRepository = glacialTtsStorageRepository,
     googleSettingsRepository = googleSettingsRepository,
     guaranteedTimeoutUsersRepository = guaranteedTimeoutUsersRepository,
     halfLifeSettingsRepository = halfLifeSettingsRepository,
     isLiveOnTwitchRepository = isLiveOnTwitchRepository,
-    jishoHelper = jishoHelper,
     languagesRepository = languagesRepository,
     locationsRepository = locationsRepository,
     microsoftSamSettingsRepository = microsoftSamSettingsRepository,
     mostRecentAnivMessageRepository = mostRecentAnivMessageRepository,
     mostRecentAnivMessageTimeoutHelper = mostRecentAnivMessageTimeoutHelper,
     mostRecentChatsRepository = mostRecentChatsRepository,
+    networkClientProvider = networkClientProvider,
     openTriviaDatabaseSessionTokenRepository = openTriviaDatabaseSessionTokenRepository,
     pixelsDiceEventListener = pixelsDiceEventHandler,
     pixelsDiceMachine = pixelsDiceMachine,
@@ -3444,11 +3518,11 @@ cynanBot: Final[CynanBot] = CynanBot(
     recurringActionsRepository = recurringActionsRepository,
     recurringActionsWizard = recurringActionsWizard,
     sentMessageLogger = sentMessageLogger,
+    serviceContainer = serviceContainer,
     shinyTriviaOccurencesRepository = shinyTriviaOccurencesRepository,
     soundPlayerManagerProvider = soundPlayerManagerProvider,
     soundPlayerRandomizerHelper = soundPlayerRandomizerHelper,
     soundPlayerSettingsRepository = soundPlayerSettingsRepository,
-    starWarsQuotesRepository = starWarsQuotesRepository,
     streamAlertsManager = streamAlertsManager,
     streamAlertsSettingsRepository = streamAlertsSettingsRepository,
     streamElementsSettingsRepository = streamElementsSettingsRepository,
@@ -3461,7 +3535,6 @@ cynanBot: Final[CynanBot] = CynanBot(
     timeoutImmuneUserIdsRepository = timeoutImmuneUserIdsRepository,
     timeZoneRepository = timeZoneRepository,
     toxicTriviaOccurencesRepository = toxicTriviaOccurencesRepository,
-    translationHelper = translationHelper,
     triviaBanHelper = triviaBanHelper,
     triviaEmoteGenerator = triviaEmoteGenerator,
     triviaEventHandler = triviaEventHandler,
@@ -3521,5 +3594,6 @@ cynanBot: Final[CynanBot] = CynanBot(
 ## Section for starting the actual bot ##
 #########################################
 
+timber.log('initCynanBot', serviceContainer.buildBootReport(importSeconds))
 timber.log('initCynanBot', 'Starting CynanBot...')
 cynanBot.run()
@@ -1,8 +1,11 @@
 import asyncio
 import locale
+import time
 from asyncio import AbstractEventLoop
 from typing import Final
 
+importStartTime: Final[float] = time.perf_counter()
+
 from src.aniv.contentScanner.anivContentScanner import AnivContentScanner
 from src.aniv.contentScanner.anivContentScannerInterface import AnivContentScannerInterface
 from src.aniv.helpers.anivCopyMessageTimeoutScoreHelper import AnivCopyMessageTimeoutScoreHelper
@@ -45,6 +48,8 @@ from src.chatActions.manager.chatActionsManagerInterface import ChatActionsManag
 from src.chatActions.persistAllUsersChatAction import PersistAllUsersChatAction
 from src.chatActions.recurringActionsWizardChatAction import RecurringActionsWizardChatAction
 from src.chatActions.saveMostRecentAnivMessageChatAction import SaveMostRecentAnivMessageChatAction
+from src.chatLogger.archive.chatLogArchive import ChatLogArchive
+from src.chatLogger.archive.chatLogArchiveInterface import ChatLogArchiveInterface
 from src.chatLogger.chatLogger import ChatLogger
 from src.chatLogger.chatLoggerInterface import ChatLoggerInterface
 from src.chatterInventory.helpers.chatterInventoryHelperInterface import ChatterInventoryHelperInterface
@@ -72,15 +77,10 @@ from src.cuteness.cutenessRepositoryInterface import CutenessRepositoryInterface
 from src.cuteness.cutenessUtils import CutenessUtils
 from src.cuteness.cutenessUtilsInterface import CutenessUtilsInterface
 from src.cynanBot import CynanBot
-from src.deepL.deepLApiService import DeepLApiService
 from src.deepL.deepLApiServiceInterface import DeepLApiServiceInterface
-from src.deepL.deepLJsonMapper import DeepLJsonMapper
 from src.deepL.deepLJsonMapperInterface import DeepLJsonMapperInterface
-from src.ecco.eccoApiService import EccoApiService
 from src.ecco.eccoApiServiceInterface import EccoApiServiceInterface
-from src.ecco.eccoHelper import EccoHelper
 from src.ecco.eccoHelperInterface import EccoHelperInterface
-from src.ecco.eccoResponseParser import EccoResponseParser
 from src.ecco.eccoResponseParserInterface import EccoResponseParserInterface
 from src.emojiHelper.emojiHelper import EmojiHelper
 from src.emojiHelper.emojiHelperInterface import EmojiHelperInterface
@@ -102,21 +102,14 @@ from src.google.jsonMapper.googleJsonMapper import GoogleJsonMapper
 from src.google.jsonMapper.googleJsonMapperInterface import GoogleJsonMapperInterface
 from src.google.jwtBuilder.googleJwtBuilder import GoogleJwtBuilder
 from src.google.jwtBuilder.googleJwtBuilderInterface import GoogleJwtBuilderInterface
-from src.jisho.jishoApiService import JishoApiService
 from src.jisho.jishoApiServiceInterface import JishoApiServiceInterface
-from src.jisho.jishoJsonMapper import JishoJsonMapper
 from src.jisho.jishoJsonMapperInterface import JishoJsonMapperInterface
-from src.jisho.jishoPresenter import JishoPresenter
 from src.jisho.jishoPresenterInterface import JishoPresenterInterface
-from src.language.jishoHelper import JishoHelper
 from src.language.jishoHelperInterface import JishoHelperInterface
 from src.language.jsonMapper.languageEntryJsonMapper import LanguageEntryJsonMapper
 from src.language.jsonMapper.languageEntryJsonMapperInterface import LanguageEntryJsonMapperInterface
 from src.language.languagesRepository import LanguagesRepository
 from src.language.languagesRepositoryInterface import LanguagesRepositoryInterface
-from src.language.translation.deepLTranslationApi import DeepLTranslationApi
-from src.language.translation.googleTranslationApi import GoogleTranslationApi
-from src.language.translationHelper import TranslationHelper
 from src.language.translationHelperInterface import TranslationHelperInterface
 from src.language.wordOfTheDay.wordOfTheDayPresenter import WordOfTheDayPresenter
 from src.language.wordOfTheDay.wordOfTheDayPresenterInterface import WordOfTheDayPresenterInterface
@@ -134,6 +127,9 @@ from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
 from src.misc.cynanBotUserIdsProvider import CynanBotUserIdsProvider
 from src.misc.cynanBotUserIdsProviderInterface import CynanBotUserIdsProviderInterface
 from src.misc.generalSettingsRepository import GeneralSettingsRepository
+from src.misc.serviceContainer.serviceContainer import ServiceContainer
+from src.misc.serviceContainer.serviceContainerInterface import ServiceContainerInterface
+from src.misc.serviceContainer.serviceContainerSettings import ServiceContainerSettings
 from src.mostRecentChat.mostRecentChatsRepository import MostRecentChatsRepository
 from src.mostRecentChat.mostRecentChatsRepositoryInterface import MostRecentChatsRepositoryInterface
 from src.network.aioHttp.aioHttpClientProvider import AioHttpClientProvider
@@ -145,6 +141,9 @@ from src.openWeather.apiService.openWeatherApiService import OpenWeatherApiServi
 from src.openWeather.apiService.openWeatherApiServiceInterface import OpenWeatherApiServiceInterface
 from src.openWeather.jsonMapper.openWeatherJsonMapper import OpenWeatherJsonMapper
 from src.openWeather.jsonMapper.openWeatherJsonMapperInterface import OpenWeatherJsonMapperInterface
+from src.pkmn.dataPack.pokepediaDataPackJsonMapper import PokepediaDataPackJsonMapper
+from src.pkmn.dataPack.pokepediaDataPackJsonMapperInterface import PokepediaDataPackJsonMapperInterface
+from src.pkmn.dataPack.pokepediaDataPackRepository import PokepediaDataPackRepository
 from src.pkmn.pokepediaJsonMapper import PokepediaJsonMapper
 from src.pkmn.pokepediaJsonMapperInterface import PokepediaJsonMapperInterface
 from src.pkmn.pokepediaRepository import PokepediaRepository
@@ -179,7 +178,6 @@ from src.soundPlayerManager.provider.stub.stubSoundPlayerManagerProvider import
 from src.soundPlayerManager.randomizerHelper.soundPlayerRandomizerHelperInterface import \
     SoundPlayerRandomizerHelperInterface
 from src.soundPlayerManager.randomizerHelper.stub.stubSoundPlayerRandomizerHelper import StubSoundPlayerRandomizerHelper
-from src.starWars.starWarsQuotesRepository import StarWarsQuotesRepository
 from src.starWars.starWarsQuotesRepositoryInterface import StarWarsQuotesRepositoryInterface
 from src.storage.backingDatabase import BackingDatabase
 from src.storage.databaseType import DatabaseType
@@ -195,6 +193,7 @@ from src.streamAlertsManager.streamAlertsManagerInterface import StreamAlertsMan
 from src.streamAlertsManager.stub.stubStreamAlertsManager import StubStreamAlertsManager
 from src.timber.timber import Timber
 from src.timber.timberInterface import TimberInterface
+from src.timber.timberSettingsReader import TimberSettingsReader
 from src.timeout.configuration.absTimeoutEventHandler import AbsTimeoutEventHandler
 from src.timeout.configuration.timeoutEventHandler import TimeoutEventHandler
 from src.timeout.guaranteedTimeoutUsersRepository import GuaranteedTimeoutUsersRepository
@@ -485,6 +484,9 @@ from src.weather.weatherRepositoryInterface import WeatherRepositoryInterface
 from src.websocketConnection.stub.stubWebsocketConnectionServer import StubWebsocketConnectionServer
 from src.websocketConnection.websocketConnectionServerInterface import WebsocketConnectionServerInterface
 
+# the wall clock time spent importing all of the modules above
+importSeconds: Final[float] = time.perf_counter() - importStartTime
+
 # should just inherit LC_ALL from the environment
 locale.setlocale(locale.LC_ALL, '')
 
@@ -505,6 +507,21 @@ timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
 timber: TimberInterface = Timber(
     backgroundTaskHelper = backgroundTaskHelper,
     timeZoneRepository = timeZoneRepository,
+    timberSettings = TimberSettingsReader(
+        settingsJsonReader = JsonFileReader(
+            eventLoop = eventLoop,
+            fileName = '../config/timberSettings.json',
+        ),
+    ).readSettings(),
+)
+
+serviceContainer: ServiceContainerInterface = ServiceContainer(
+    disabledServiceNames = ServiceContainerSettings(
+        settingsJsonReader = JsonFileReader(
+            eventLoop = eventLoop,
+            fileName = '../config/serviceContainerSettings.json',
+        ),
+    ).getDisabledServiceNames(),
 )
 
 networkJsonMapper: NetworkJsonMapperInterface = NetworkJsonMapper()
@@ -588,6 +605,7 @@ twitchApiService: TwitchApiServiceInterface = TwitchApiService(
 officialTwitchAccountUserIdProvider: OfficialTwitchAccountUserIdProviderInterface = OfficialTwitchAccountUserIdProvider()
 
 userIdsRepository: Final[UserIdsRepositoryInterface] = UserIdsRepository(
+    backgroundTaskHelper = backgroundTaskHelper,
     backingDatabase = backingDatabase,
     timber = timber,
     twitchApiService = twitchApiService,
@@ -725,10 +743,15 @@ addOrRemoveUserDataHelper: AddOrRemoveUserDataHelperInterface = AddOrRemoveUserD
     timeZoneRepository = timeZoneRepository
 )
 
+chatLogArchive: ChatLogArchiveInterface = ChatLogArchive(
+    timber = timber,
+)
+
 chatLogger: ChatLoggerInterface = ChatLogger(
     backgroundTaskHelper = backgroundTaskHelper,
     timber = timber,
     timeZoneRepository = timeZoneRepository,
+    chatLogArchive = chatLogArchive,
 )
 
 activeChattersRepository: ActiveChattersRepositoryInterface = ActiveChattersRepository(
@@ -847,6 +870,7 @@ locationsRepository: LocationsRepositoryInterface = LocationsRepository(
 )
 
 mostRecentChatsRepository: MostRecentChatsRepositoryInterface = MostRecentChatsRepository(
+    backgroundTaskHelper = backgroundTaskHelper,
     backingDatabase = backingDatabase,
     timber = timber,
     timeZoneRepository = timeZoneRepository
@@ -856,12 +880,20 @@ pokepediaJsonMapper: PokepediaJsonMapperInterface = PokepediaJsonMapper(
     timber = timber
 )
 
-pokepediaRepository: PokepediaRepositoryInterface = PokepediaRepository(
-    networkClientProvider = networkClientProvider,
-    pokepediaJsonMapper = pokepediaJsonMapper,
+pokepediaDataPackJsonMapper: PokepediaDataPackJsonMapperInterface = PokepediaDataPackJsonMapper(
     timber = timber
 )
 
+pokepediaRepository: PokepediaRepositoryInterface = PokepediaDataPackRepository(
+    pokepediaDataPackJsonMapper = pokepediaDataPackJsonMapper,
+    timber = timber,
+    fallbackRepository = PokepediaRepository(
+        networkClientProvider = networkClientProvider,
+        pokepediaJsonMapper = pokepediaJsonMapper,
+        timber = timber
+    )
+)
+
 twitchIrcTagsParser: TwitchIrcTagsParserInterface = TwitchIrcTagsParser()
 
 twitchConfiguration: TwitchConfiguration = TwitchIoConfiguration(
@@ -937,24 +969,6 @@ wordOfTheDayRepository: WordOfTheDayRepositoryInterface = WordOfTheDayRepository
 
 wordOfTheDayPresenter: WordOfTheDayPresenterInterface = WordOfTheDayPresenter()
 
-deepLJsonMapper: DeepLJsonMapperInterface = DeepLJsonMapper(
-    languagesRepository = languagesRepository,
-    timber = timber
-)
-
-deepLApiService: DeepLApiServiceInterface = DeepLApiService(
-    deepLAuthKeyProvider = authRepository,
-    deepLJsonMapper = deepLJsonMapper,
-    networkClientProvider = networkClientProvider,
-    timber = timber
-)
-
-deepLTranslationApi = DeepLTranslationApi(
-    deepLApiService = deepLApiService,
-    deepLAuthKeyProvider = authRepository,
-    timber = timber
-)
-
 
 ###################################
 ## Google initialization section ##
@@ -985,19 +999,46 @@ googleApiService: GoogleApiServiceInterface = GoogleApiService(
     timber = timber,
 )
 
-googleTranslationApi = GoogleTranslationApi(
-    googleApiService = googleApiService,
-    googleCloudProjectCredentialsProvider = authRepository,
-    languagesRepository = languagesRepository,
-    timber = timber,
-)
+def createTranslationHelper() -> TranslationHelperInterface:
+    from src.deepL.deepLApiService import DeepLApiService
+    from src.deepL.deepLJsonMapper import DeepLJsonMapper
+    from src.language.translation.deepLTranslationApi import DeepLTranslationApi
+    from src.language.translation.googleTranslationApi import GoogleTranslationApi
+    from src.language.translationHelper import TranslationHelper
 
-translationHelper: TranslationHelperInterface = TranslationHelper(
-    deepLTranslationApi = deepLTranslationApi,
-    googleTranslationApi = googleTranslationApi,
-    languagesRepository = languagesRepository,
-    timber = timber,
-)
+    deepLJsonMapper: DeepLJsonMapperInterface = DeepLJsonMapper(
+        languagesRepository = languagesRepository,
+        timber = timber,
+    )
+
+    deepLApiService: DeepLApiServiceInterface = DeepLApiService(
+        deepLAuthKeyProvider = authRepository,
+        deepLJsonMapper = deepLJsonMapper,
+        networkClientProvider = networkClientProvider,
+        timber = timber,
+    )
+
+    deepLTranslationApi = DeepLTranslationApi(
+        deepLApiService = deepLApiService,
+        deepLAuthKeyProvider = authRepository,
+        timber = timber,
+    )
+
+    googleTranslationApi = GoogleTranslationApi(
+        googleApiService = googleApiService,
+        googleCloudProjectCredentialsProvider = authRepository,
+        languagesRepository = languagesRepository,
+        timber = timber,
+    )
+
+    return TranslationHelper(
+        deepLTranslationApi = deepLTranslationApi,
+        googleTranslationApi = googleTranslationApi,
+        languagesRepository = languagesRepository,
+        timber = timber,
+    )
+
+serviceContainer.register('translationHelper', createTranslationHelper)
 
 twitchWebsocketAllowedUsersRepository: TwitchWebsocketAllowedUsersRepositoryInterface = TwitchWebsocketAllowedUsersRepository(
     timber = timber,
@@ -1791,35 +1832,48 @@ cheerActionHelper: CheerActionHelperInterface = CheerActionHelper(
 ## Star Wars Quotes initialization section ##
 #############################################
 
-starWarsQuotesRepository: StarWarsQuotesRepositoryInterface = StarWarsQuotesRepository(
-    quotesJsonReader = JsonFileReader(
-        eventLoop = eventLoop,
-        fileName = 'starWarsQuotesRepository.json',
-    ),
-)
+def createStarWarsQuotesRepository() -> StarWarsQuotesRepositoryInterface:
+    from src.starWars.starWarsQuotesRepository import StarWarsQuotesRepository
+
+    return StarWarsQuotesRepository(
+        quotesJsonReader = JsonFileReader(
+            eventLoop = eventLoop,
+            fileName = 'starWarsQuotesRepository.json',
+        ),
+    )
+
+serviceContainer.register('starWarsQuotesRepository', createStarWarsQuotesRepository)
 
 
 ##################################
 ## Jisho initialization section ##
 ##################################
 
-jishoJsonMapper: JishoJsonMapperInterface = JishoJsonMapper(
-    timber = timber,
-)
+def createJishoHelper() -> JishoHelperInterface:
+    from src.jisho.jishoApiService import JishoApiService
+    from src.jisho.jishoJsonMapper import JishoJsonMapper
+    from src.jisho.jishoPresenter import JishoPresenter
+    from src.language.jishoHelper import JishoHelper
 
-jishoApiService: JishoApiServiceInterface = JishoApiService(
-    jishoJsonMapper = jishoJsonMapper,
-    networkClientProvider = networkClientProvider,
-    timber = timber,
-)
+    jishoJsonMapper: JishoJsonMapperInterface = JishoJsonMapper(
+        timber = timber,
+    )
+
+    jishoApiService: JishoApiServiceInterface = JishoApiService(
+        jishoJsonMapper = jishoJsonMapper,
+        networkClientProvider = networkClientProvider,
+        timber = timber,
+    )
 
-jishoPresenter: JishoPresenterInterface = JishoPresenter()
+    jishoPresenter: JishoPresenterInterface = JishoPresenter()
 
-jishoHelper: JishoHelperInterface = JishoHelper(
-    jishoApiService = jishoApiService,
-    jishoPresenter = jishoPresenter,
-    timber = timber,
-)
+    return JishoHelper(
+        jishoApiService = jishoApiService,
+        jishoPresenter = jishoPresenter,
+        timber = timber,
+    )
+
+serviceContainer.register('jishoHelper', createJishoHelper)
 
 
 #########################################
@@ -1973,22 +2027,29 @@ if cutenessRepository is not None and triviaGameBuilder is not None and triviaGa
 ## Ecco initialization section ##
 #################################
 
-eccoResponseParser: Final[EccoResponseParserInterface] = EccoResponseParser(
-    timber = timber,
-    timeZoneRepository = timeZoneRepository,
-)
+def createEccoHelper() -> EccoHelperInterface:
+    from src.ecco.eccoApiService import EccoApiService
+    from src.ecco.eccoHelper import EccoHelper
+    from src.ecco.eccoResponseParser import EccoResponseParser
 
-eccoApiService: Final[EccoApiServiceInterface] = EccoApiService(
-    eccoResponseParser = eccoResponseParser,
-    networkClientProvider = networkClientProvider,
-    timber = timber,
-)
+    eccoResponseParser: EccoResponseParserInterface = EccoResponseParser(
+        timber = timber,
+        timeZoneRepository = timeZoneRepository,
+    )
 
-eccoHelper: Final[EccoHelperInterface] = EccoHelper(
-    eccoApiService = eccoApiService,
-    timber = timber,
-    timeZoneRepository = timeZoneRepository,
-)
+    eccoApiService: EccoApiServiceInterface = EccoApiService(
+        eccoResponseParser = eccoResponseParser,
+        networkClientProvider = networkClientProvider,
+        timber = timber,
+    )
+
+    return EccoHelper(
+        eccoApiService = eccoApiService,
+        timber = timber,
+        timeZoneRepository = timeZoneRepository,
+    )
+
+serviceContainer.register('eccoHelper', createEccoHelper)
 
 
 ########################################################
@@ -2150,10 +2211,10 @@ cynanBot: Final[CynanBot] = CynanBot(
     asplodieStatsRepository = asplodieStatsRepository,
     authRepository = authRepository,
     backgroundTaskHelper = backgroundTaskHelper,
+    backingDatabase = backingDatabase,
     bannedTriviaGameControllersRepository = bannedTriviaGameControllersRepository,
     bannedWordsRepository = bannedWordsRepository,
     beanChanceCheerActionHelper = None,
-    beanStatsPresenter = None,
     beanStatsRepository = None,
     bizhawkSettingsRepository = None,
     chatActionsManager = chatActionsManager,
@@ -2190,21 +2251,21 @@ cynanBot: Final[CynanBot] = CynanBot(
     cutenessRepository = cutenessRepository,
     cutenessUtils = cutenessUtils,
     decTalkSettingsRepository = None,
-    eccoHelper = eccoHelper,
     funtoonHelper = funtoonHelper,
     funtoonTokensRepository = funtoonTokensRepository,
     generalSettingsRepository = generalSettingsRepository,
+    glacialTtsStorageRepository = None,
     googleSettingsRepository = None,
     guaranteedTimeoutUsersRepository = guaranteedTimeoutUsersRepository,
     halfLifeSettingsRepository = None,
     isLiveOnTwitchRepository = isLiveOnTwitchRepository,
-    jishoHelper = jishoHelper,
     languagesRepository = languagesRepository,
     locationsRepository = locationsRepository,
     microsoftSamSettingsRepository = None,
     mostRecentAnivMessageRepository = mostRecentAnivMessageRepository,
     mostRecentAnivMessageTimeoutHelper = mostRecentAnivMessageTimeoutHelper,
     mostRecentChatsRepository = mostRecentChatsRepository,
+    networkClientProvider = networkClientProvider,
     openTriviaDatabaseSessionTokenRepository = openTriviaDatabaseSessionTokenRepository,
     pokepediaRepository = pokepediaRepository,
     pixelsDiceEventListener = None,
@@ -2216,11 +2277,11 @@ cynanBot: Final[CynanBot] = CynanBot(
     recurringActionsRepository = recurringActionsRepository,
     recurringActionsWizard = recurringActionsWizard,
     sentMessageLogger = sentMessageLogger,
+    serviceContainer = serviceContainer,
     shinyTriviaOccurencesRepository = shinyTriviaOccurencesRepository,
     soundPlayerManagerProvider = soundPlayerManagerProvider,
     soundPlayerRandomizerHelper = soundPlayerRandomizerHelper,
     soundPlayerSettingsRepository = None,
-    starWarsQuotesRepository = starWarsQuotesRepository,
     streamAlertsManager = streamAlertsManager,
     streamAlertsSettingsRepository = None,
     streamElementsSettingsRepository = None,
@@ -2233,7 +2294,6 @@ cynanBot: Final[CynanBot] = CynanBot(
     timeoutImmuneUserIdsRepository = timeoutImmuneUserIdsRepository,
     timeZoneRepository = timeZoneRepository,
     toxicTriviaOccurencesRepository = toxicTriviaOccurencesRepository,
-    translationHelper = translationHelper,
     triviaBanHelper = triviaBanHelper,
     triviaEmoteGenerator = triviaEmoteGenerator,
     triviaEventHandler = triviaEventHandler,
@@ -2293,5 +2353,6 @@ cynanBot: Final[CynanBot] = CynanBot(
 ## Section for starting the actual bot ##
 #########################################
 
+timber.log('initCynanBot', serviceContainer.buildBootReport(importSeconds))
 timber.log('initCynanBot', 'Starting CynanBot...')
 cynanBot.run()
@@ -1,8 +1,11 @@
 import asyncio
 import locale
+import time
 from asyncio import AbstractEventLoop
 from typing import Final
 
+importStartTime: Final[float] = time.perf_counter()
+
 from src.accessLevelChecking.accessLevelCheckingHelper import AccessLevelCheckingHelper
 from src.accessLevelChecking.accessLevelCheckingHelperInterface import AccessLevelCheckingHelperInterface
 from src.aniv.contentScanner.anivContentScanner import AnivContentScanner
@@ -28,7 +31,6 @@ from src.aniv.settings.anivSettingsInterface import AnivSettingsInterface
 from src.asplodieStats.asplodieStatsPresenter import AsplodieStatsPresenter
 from src.asplodieStats.repository.asplodieStatsRepository import AsplodieStatsRepository
 from src.asplodieStats.repository.asplodieStatsRepositoryInterface import AsplodieStatsRepositoryInterface
-from src.beanStats.beanStatsPresenter import BeanStatsPresenter
 from src.beanStats.beanStatsPresenterInterface import BeanStatsPresenterInterface
 from src.beanStats.beanStatsRepository import BeanStatsRepository
 from src.beanStats.beanStatsRepositoryInterface import BeanStatsRepositoryInterface
@@ -48,6 +50,8 @@ from src.chatActions.soundAlertChatAction import SoundAlertChatAction
 from src.chatActions.supStreamerChatAction import SupStreamerChatAction
 from src.chatActions.ttsChatterChatAction import TtsChatterChatAction
 from src.chatActions.voicemailChatAction import VoicemailChatAction
+from src.chatLogger.archive.chatLogArchive import ChatLogArchive
+from src.chatLogger.archive.chatLogArchiveInterface import ChatLogArchiveInterface
 from src.chatLogger.chatLogger import ChatLogger
 from src.chatLogger.chatLoggerInterface import ChatLoggerInterface
 from src.chatterInventory.configuration.absChatterItemEventHandler import AbsChatterItemEventHandler
@@ -158,9 +162,7 @@ from src.decTalk.mapper.decTalkVoiceMapper import DecTalkVoiceMapper
 from src.decTalk.mapper.decTalkVoiceMapperInterface import DecTalkVoiceMapperInterface
 from src.decTalk.settings.decTalkSettingsRepository import DecTalkSettingsRepository
 from src.decTalk.settings.decTalkSettingsRepositoryInterface import DecTalkSettingsRepositoryInterface
-from src.deepL.deepLApiService import DeepLApiService
 from src.deepL.deepLApiServiceInterface import DeepLApiServiceInterface
-from src.deepL.deepLJsonMapper import DeepLJsonMapper
 from src.deepL.deepLJsonMapperInterface import DeepLJsonMapperInterface
 from src.emojiHelper.emojiHelper import EmojiHelper
 from src.emojiHelper.emojiHelperInterface import EmojiHelperInterface
@@ -218,9 +220,6 @@ from src.language.jsonMapper.languageEntryJsonMapper import LanguageEntryJsonMap
 from src.language.jsonMapper.languageEntryJsonMapperInterface import LanguageEntryJsonMapperInterface
 from src.language.languagesRepository import LanguagesRepository
 from src.language.languagesRepositoryInterface import LanguagesRepositoryInterface
-from src.language.translation.deepLTranslationApi import DeepLTranslationApi
-from src.language.translation.googleTranslationApi import GoogleTranslationApi
-from src.language.translationHelper import TranslationHelper
 from src.language.translationHelperInterface import TranslationHelperInterface
 from src.location.locationsRepository import LocationsRepository
 from src.location.locationsRepositoryInterface import LocationsRepositoryInterface
@@ -262,6 +261,11 @@ from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
 from src.misc.cynanBotUserIdsProvider import CynanBotUserIdsProvider
 from src.misc.cynanBotUserIdsProviderInterface import CynanBotUserIdsProviderInterface
 from src.misc.generalSettingsRepository import GeneralSettingsRepository
+from src.misc.localProcessPool.localProcessPool import LocalProcessPool
+from src.misc.localProcessPool.localProcessPoolInterface import LocalProcessPoolInterface
+from src.misc.serviceContainer.serviceContainer import ServiceContainer
+from src.misc.serviceContainer.serviceContainerInterface import ServiceContainerInterface
+from src.misc.serviceContainer.serviceContainerSettings import ServiceContainerSettings
 from src.mostRecentChat.mostRecentChatsRepository import MostRecentChatsRepository
 from src.mostRecentChat.mostRecentChatsRepositoryInterface import MostRecentChatsRepositoryInterface
 from src.network.aioHttp.aioHttpClientProvider import AioHttpClientProvider
@@ -330,6 +334,7 @@ from src.supStreamer.supStreamerRepository import SupStreamerRepository
 from src.supStreamer.supStreamerRepositoryInterface import SupStreamerRepositoryInterface
 from src.timber.timber import Timber
 from src.timber.timberInterface import TimberInterface
+from src.timber.timberSettingsReader import TimberSettingsReader
 from src.timeout.configuration.absTimeoutEventHandler import AbsTimeoutEventHandler
 from src.timeout.configuration.timeoutEventHandler import TimeoutEventHandler
 from src.timeout.guaranteedTimeoutUsersRepository import GuaranteedTimeoutUsersRepository
@@ -541,6 +546,9 @@ from src.websocketConnection.settings.websocketConnectionServerSettingsInterface
 from src.websocketConnection.websocketConnectionServer import WebsocketConnectionServer
 from src.websocketConnection.websocketConnectionServerInterface import WebsocketConnectionServerInterface
 
+# the wall clock time spent importing all of the modules above
+importSeconds: Final[float] = time.perf_counter() - importStartTime
+
 locale.setlocale(locale.LC_ALL, 'en_US.utf8')
 
 
@@ -560,6 +568,21 @@ timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
 timber: TimberInterface = Timber(
     backgroundTaskHelper = backgroundTaskHelper,
     timeZoneRepository = timeZoneRepository,
+    timberSettings = TimberSettingsReader(
+        settingsJsonReader = JsonFileReader(
+            eventLoop = eventLoop,
+            fileName = '../config/timberSettings.json',
+        ),
+    ).readSettings(),
+)
+
+serviceContainer: ServiceContainerInterface = ServiceContainer(
+    disabledServiceNames = ServiceContainerSettings(
+        settingsJsonReader = JsonFileReader(
+            eventLoop = eventLoop,
+            fileName = '../config/serviceContainerSettings.json',
+        ),
+    ).getDisabledServiceNames(),
 )
 
 networkJsonMapper: NetworkJsonMapperInterface = NetworkJsonMapper()
@@ -643,6 +666,7 @@ twitchApiService: TwitchApiServiceInterface = TwitchApiService(
 officialTwitchAccountUserIdProvider: OfficialTwitchAccountUserIdProviderInterface = OfficialTwitchAccountUserIdProvider()
 
 userIdsRepository: Final[UserIdsRepositoryInterface] = UserIdsRepository(
+    backgroundTaskHelper = backgroundTaskHelper,
     backingDatabase = backingDatabase,
     timber = timber,
     twitchApiService = twitchApiService,
@@ -788,10 +812,15 @@ addOrRemoveUserDataHelper: AddOrRemoveUserDataHelperInterface = AddOrRemoveUserD
     timeZoneRepository = timeZoneRepository
 )
 
+chatLogArchive: ChatLogArchiveInterface = ChatLogArchive(
+    timber = timber,
+)
+
 chatLogger: ChatLoggerInterface = ChatLogger(
     backgroundTaskHelper = backgroundTaskHelper,
     timber = timber,
     timeZoneRepository = timeZoneRepository,
+    chatLogArchive = chatLogArchive,
 )
 
 activeChattersRepository: ActiveChattersRepositoryInterface = ActiveChattersRepository(
@@ -896,6 +925,7 @@ locationsRepository: LocationsRepositoryInterface = LocationsRepository(
 )
 
 mostRecentChatsRepository: MostRecentChatsRepositoryInterface = MostRecentChatsRepository(
+    backgroundTaskHelper = backgroundTaskHelper,
     backingDatabase = backingDatabase,
     timber = timber,
     timeZoneRepository = timeZoneRepository
@@ -1024,7 +1054,12 @@ twitchWebsocketClient: TwitchWebsocketClientInterface = TwitchWebsocketClient(
 ## Bean initialization section ##
 #################################
 
-beanStatsPresenter: BeanStatsPresenterInterface = BeanStatsPresenter()
+def createBeanStatsPresenter() -> BeanStatsPresenterInterface:
+    from src.beanStats.beanStatsPresenter import BeanStatsPresenter
+
+    return BeanStatsPresenter()
+
+serviceContainer.register('beanStatsPresenter', createBeanStatsPresenter)
 
 beanStatsRepository: BeanStatsRepositoryInterface = BeanStatsRepository(
     backingDatabase = backingDatabase,
@@ -1178,6 +1213,11 @@ ttsCommandBuilder: Final[TtsCommandBuilderInterface] = TtsCommandBuilder(
 
 ttsDirectoryProvider: Final[TtsDirectoryProviderInterface] = TtsDirectoryProvider()
 
+localProcessPool: Final[LocalProcessPoolInterface] = LocalProcessPool(
+    backgroundTaskHelper = backgroundTaskHelper,
+    timber = timber,
+)
+
 
 ########################################
 ## Glacial TTS initialization section ##
@@ -1216,6 +1256,7 @@ commodoreSamSettingsRepository: CommodoreSamSettingsRepositoryInterface = Commod
 commodoreSamApiService: CommodoreSamApiServiceInterface = CommodoreSamApiService(
     eventLoop = eventLoop,
     commodoreSamSettingsRepository = commodoreSamSettingsRepository,
+    localProcessPool = localProcessPool,
     timber = timber,
     ttsDirectoryProvider = ttsDirectoryProvider
 )
@@ -1223,8 +1264,8 @@ commodoreSamApiService: CommodoreSamApiServiceInterface = CommodoreSamApiService
 commodoreSamHelper: CommodoreSamHelperInterface = CommodoreSamHelper(
     commodoreSamApiService = commodoreSamApiService,
     commodoreSamSettingsRepository = commodoreSamSettingsRepository,
+    glacialTtsFileRetriever = glacialTtsFileRetriever,
     timber = timber,
-    timeZoneRepository = timeZoneRepository
 )
 
 commodoreSamMessageCleaner: CommodoreSamMessageCleanerInterface = CommodoreSamMessageCleaner(
@@ -1258,6 +1299,7 @@ decTalkSettingsRepository: DecTalkSettingsRepositoryInterface = DecTalkSettingsR
 decTalkApiService: DecTalkApiServiceInterface = DecTalkApiService(
     eventLoop = eventLoop,
     decTalkSettingsRepository = decTalkSettingsRepository,
+    localProcessPool = localProcessPool,
     timber = timber,
     ttsDirectoryProvider = ttsDirectoryProvider
 )
@@ -1265,8 +1307,8 @@ decTalkApiService: DecTalkApiServiceInterface = DecTalkApiService(
 decTalkHelper: DecTalkHelperInterface = DecTalkHelper(
     decTalkApiService = decTalkApiService,
     decTalkSettingsRepository = decTalkSettingsRepository,
+    glacialTtsFileRetriever = glacialTtsFileRetriever,
     timber = timber,
-    timeZoneRepository = timeZoneRepository
 )
 
 decTalkMessageCleaner: DecTalkMessageCleanerInterface = DecTalkMessageCleaner(
@@ -2108,37 +2150,46 @@ crowdControlActionHandler: CrowdControlActionHandler = BizhawkActionHandler(
 ## Translation initialization section ##
 ########################################
 
-deepLJsonMapper: DeepLJsonMapperInterface = DeepLJsonMapper(
-    languagesRepository = languagesRepository,
-    timber = timber
-)
+def createTranslationHelper() -> TranslationHelperInterface:
+    from src.deepL.deepLApiService import DeepLApiService
+    from src.deepL.deepLJsonMapper import DeepLJsonMapper
+    from src.language.translation.deepLTranslationApi import DeepLTranslationApi
+    from src.language.translation.googleTranslationApi import GoogleTranslationApi
+    from src.language.translationHelper import TranslationHelper
 
-deepLApiService: DeepLApiServiceInterface = DeepLApiService(
-    deepLAuthKeyProvider = authRepository,
-    deepLJsonMapper = deepLJsonMapper,
-    networkClientProvider = networkClientProvider,
-    timber = timber
-)
+    deepLJsonMapper: DeepLJsonMapperInterface = DeepLJsonMapper(
+        languagesRepository = languagesRepository,
+        timber = timber,
+    )
 
-deepLTranslationApi = DeepLTranslationApi(
-    deepLApiService = deepLApiService,
-    deepLAuthKeyProvider = authRepository,
-    timber = timber
-)
+    deepLApiService: DeepLApiServiceInterface = DeepLApiService(
+        deepLAuthKeyProvider = authRepository,
+        deepLJsonMapper = deepLJsonMapper,
+        networkClientProvider = networkClientProvider,
+        timber = timber,
+    )
 
-googleTranslationApi = GoogleTranslationApi(
-    googleApiService = googleApiService,
-    googleCloudProjectCredentialsProvider = authRepository,
-    languagesRepository = languagesRepository,
-    timber = timber
-)
+    deepLTranslationApi = DeepLTranslationApi(
+        deepLApiService = deepLApiService,
+        deepLAuthKeyProvider = authRepository,
+        timber = timber,
+    )
 
-translationHelper: TranslationHelperInterface = TranslationHelper(
-    deepLTranslationApi = deepLTranslationApi,
-    googleTranslationApi = googleTranslationApi,
-    languagesRepository = languagesRepository,
-    timber = timber,
-)
+    googleTranslationApi = GoogleTranslationApi(
+        googleApiService = googleApiService,
+        googleCloudProjectCredentialsProvider = authRepository,
+        languagesRepository = languagesRepository,
+        timber = timber,
+    )
+
+    return TranslationHelper(
+        deepLTranslationApi = deepLTranslationApi,
+        googleTranslationApi = googleTranslationApi,
+        languagesRepository = languagesRepository,
+        timber = timber,
+    )
+
+serviceContainer.register('translationHelper', createTranslationHelper)
 
 
 ##########################################
@@ -2509,10 +2560,10 @@ cynanBot: Final[CynanBot] = CynanBot(
     asplodieStatsRepository = asplodieStatsRepository,
     authRepository = authRepository,
     backgroundTaskHelper = backgroundTaskHelper,
+    backingDatabase = backingDatabase,
     bannedTriviaGameControllersRepository = None,
     bannedWordsRepository = bannedWordsRepository,
     beanChanceCheerActionHelper = beanChanceCheerActionHelper,
-    beanStatsPresenter = beanStatsPresenter,
     beanStatsRepository = beanStatsRepository,
     bizhawkSettingsRepository = bizhawkSettingsRepository,
     chatActionsManager = chatActionsManager,
@@ -2549,21 +2600,21 @@ cynanBot: Final[CynanBot] = CynanBot(
     cutenessRepository = None,
     cutenessUtils = None,
     decTalkSettingsRepository = decTalkSettingsRepository,
-    eccoHelper = None,
     funtoonHelper = funtoonHelper,
     funtoonTokensRepository = funtoonTokensRepository,
     generalSettingsRepository = generalSettingsRepository,
+    glacialTtsStorageRepository = glacialTtsStorageRepository,
     googleSettingsRepository = googleSettingsRepository,
     guaranteedTimeoutUsersRepository = guaranteedTimeoutUsersRepository,
     halfLifeSettingsRepository = halfLifeSettingsRepository,
     isLiveOnTwitchRepository = isLiveOnTwitchRepository,
-    jishoHelper = None,
     languagesRepository = languagesRepository,
     locationsRepository = locationsRepository,
     microsoftSamSettingsRepository = microsoftSamSettingsRepository,
     mostRecentAnivMessageRepository = mostRecentAnivMessageRepository,
     mostRecentAnivMessageTimeoutHelper = mostRecentAnivMessageTimeoutHelper,
     mostRecentChatsRepository = mostRecentChatsRepository,
+    networkClientProvider = networkClientProvider,
     openTriviaDatabaseSessionTokenRepository = None,
     pixelsDiceEventListener = pixelsDiceEventHandler,
     pixelsDiceMachine = pixelsDiceMachine,
@@ -2575,11 +2626,11 @@ cynanBot: Final[CynanBot] = CynanBot(
     recurringActionsRepository = None,
     recurringActionsWizard = None,
     sentMessageLogger = sentMessageLogger,
+    serviceContainer = serviceContainer,
     shinyTriviaOccurencesRepository = None,
     soundPlayerManagerProvider = soundPlayerManagerProvider,
     soundPlayerRandomizerHelper = soundPlayerRandomizerHelper,
     soundPlayerSettingsRepository = soundPlayerSettingsRepository,
-    starWarsQuotesRepository = None,
     streamAlertsManager = streamAlertsManager,
     streamAlertsSettingsRepository = streamAlertsSettingsRepository,
     streamElementsSettingsRepository = streamElementsSettingsRepository,
@@ -2592,7 +2643,6 @@ cynanBot: Final[CynanBot] = CynanBot(
     timeoutImmuneUserIdsRepository = timeoutImmuneUserIdsRepository,
     timeZoneRepository = timeZoneRepository,
     toxicTriviaOccurencesRepository = None,
-    translationHelper = translationHelper,
     triviaBanHelper = None,
     triviaEmoteGenerator = None,
     triviaEventHandler = None,
@@ -2652,5 +2702,6 @@ cynanBot: Final[CynanBot] = CynanBot(
 ## Section for starting the actual bot ##
 #########################################
 
+timber.log('initCynanBot', serviceContainer.buildBootReport(importSeconds))
 timber.log('initCynanBot', 'Starting CynanBot...')
 cynanBot.run()
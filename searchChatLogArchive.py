@@ -0,0 +1,93 @@
+import argparse
+import asyncio
+from asyncio import AbstractEventLoop
+from datetime import datetime
+from typing import Final
+
+from src.chatLogger.archive.chatLogArchive import ChatLogArchive
+from src.chatLogger.archive.chatLogArchiveInterface import ChatLogArchiveInterface
+from src.chatLogger.archive.chatLogArchiveQuery import ChatLogArchiveQuery
+from src.chatLogger.chatEventType import ChatEventType
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from src.timber.timber import Timber
+from src.timber.timberInterface import TimberInterface
+
+# Searches the chat log archive that ChatLogger writes into. For example, to find everything
+# that a given chatter said in a given channel over the course of October:
+#
+#   python searchChatLogArchive.py --channel smCharles --user someChatter --start 2026-10-01 --end 2026-11-01
+
+argumentParser: Final[argparse.ArgumentParser] = argparse.ArgumentParser(description = 'Search the chat log archive')
+argumentParser.add_argument('--channel', help = 'Twitch channel name')
+argumentParser.add_argument('--channelId', help = 'Twitch channel ID')
+argumentParser.add_argument('--user', help = 'chatter login')
+argumentParser.add_argument('--userId', help = 'chatter user ID')
+argumentParser.add_argument('--start', help = 'inclusive start date/time, in ISO 8601 format (e.g. 2026-10-01 or 2026-10-01T18:30)')
+argumentParser.add_argument('--end', help = 'exclusive end date/time, in ISO 8601 format')
+argumentParser.add_argument('--text', help = 'full text search of message contents')
+argumentParser.add_argument('--type', choices = [ chatEventType.name.lower() for chatEventType in ChatEventType ], help = 'type of chat event')
+argumentParser.add_argument('--limit', type = int, default = 500, help = 'maximum number of results (default: 500)')
+argumentParser.add_argument('--databaseFile', default = '../db/chatLogArchive.sqlite', help = 'chat log archive index file')
+arguments: Final[argparse.Namespace] = argumentParser.parse_args()
+
+eventLoop: Final[AbstractEventLoop] = asyncio.new_event_loop()
+asyncio.set_event_loop(eventLoop)
+
+backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = BackgroundTaskHelper(
+    eventLoop = eventLoop,
+)
+
+timeZoneRepository: Final[TimeZoneRepositoryInterface] = TimeZoneRepository()
+
+timber: Final[TimberInterface] = Timber(
+    backgroundTaskHelper = backgroundTaskHelper,
+    timeZoneRepository = timeZoneRepository,
+)
+
+chatLogArchive: Final[ChatLogArchiveInterface] = ChatLogArchive(
+    timber = timber,
+    databaseFile = arguments.databaseFile,
+)
+
+def parseDateTime(dateTimeStr: str | None) -> datetime | None:
+    if dateTimeStr is None:
+        return None
+
+    dateTime = datetime.fromisoformat(dateTimeStr)
+
+    if dateTime.tzinfo is None:
+        dateTime = dateTime.replace(tzinfo = timeZoneRepository.getDefault())
+
+    return dateTime
+
+chatEventType: ChatEventType | None = None
+if arguments.type is not None:
+    chatEventType = ChatEventType[arguments.type.upper()]
+
+entries = eventLoop.run_until_complete(chatLogArchive.search(ChatLogArchiveQuery(
+    chatEventType = chatEventType,
+    startDateTime = parseDateTime(arguments.start),
+    endDateTime = parseDateTime(arguments.end),
+    limit = arguments.limit,
+    text = arguments.text,
+    twitchChannel = arguments.channel,
+    twitchChannelId = arguments.channelId,
+    userId = arguments.userId,
+    userLogin = arguments.user,
+)))
+
+for entry in entries:
+    if entry.chatEventType is ChatEventType.CHEER:
+        description = f'cheered {entry.bits} bit(s)'
+    elif entry.chatEventType is ChatEventType.RAID:
+        description = f'raided with {entry.viewers} viewer(s)'
+    else:
+        description = f'— {entry.message}'
+
+    dateTimeStr = entry.dateTime.isoformat(sep = ' ', timespec = 'seconds')
+    print(f'{dateTimeStr} — #{entry.twitchChannel} — {entry.userLogin} ({entry.userId}) {description}')
+
+print(f'{len(entries)} result(s)')
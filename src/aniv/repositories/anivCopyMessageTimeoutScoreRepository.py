@@ -42,16 +42,18 @@ class AnivCopyMessageTimeoutScoreRepository(AnivCopyMessageTimeoutScoreRepositor
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT mostrecentdodge, mostrecenttimeout, dodgescore, timeoutscore FROM anivcopymessagetimeoutscores
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-                LIMIT 1
-            ''',
-            chatterUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT mostrecentdodge, mostrecenttimeout, dodgescore, timeoutscore FROM anivcopymessagetimeoutscores
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                    LIMIT 1
+                ''',
+                chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
 
         if record is None or len(record) == 0:
             return AnivCopyMessageTimeoutScore(
@@ -144,41 +146,42 @@ class AnivCopyMessageTimeoutScoreRepository(AnivCopyMessageTimeoutScoreRepositor
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
-                            mostrecentdodge text DEFAULT NULL,
-                            mostrecenttimeout text DEFAULT NULL,
-                            dodgescore int DEFAULT 0 NOT NULL,
-                            timeoutscore int DEFAULT 0 NOT NULL,
-                            chatteruserid text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
-                            mostrecentdodge TEXT DEFAULT NULL,
-                            mostrecenttimeout TEXT DEFAULT NULL,
-                            dodgescore INTEGER NOT NULL DEFAULT 0,
-                            timeoutscore INTEGER NOT NULL DEFAULT 0,
-                            chatteruserid TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
+                                mostrecentdodge text DEFAULT NULL,
+                                mostrecenttimeout text DEFAULT NULL,
+                                dodgescore int DEFAULT 0 NOT NULL,
+                                timeoutscore int DEFAULT 0 NOT NULL,
+                                chatteruserid text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
+                                mostrecentdodge TEXT DEFAULT NULL,
+                                mostrecenttimeout TEXT DEFAULT NULL,
+                                dodgescore INTEGER NOT NULL DEFAULT 0,
+                                timeoutscore INTEGER NOT NULL DEFAULT 0,
+                                chatteruserid TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def __saveScoreToDatabase(self, score: AnivCopyMessageTimeoutScore):
         if not isinstance(score, AnivCopyMessageTimeoutScore):
@@ -193,13 +196,15 @@ class AnivCopyMessageTimeoutScoreRepository(AnivCopyMessageTimeoutScoreRepositor
             mostRecentTimeout = score.mostRecentTimeout.isoformat()
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO anivcopymessagetimeoutscores (mostrecentdodge, mostrecenttimeout, dodgescore, timeoutscore, chatteruserid, twitchchannelid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET mostrecentdodge = EXCLUDED.mostrecentdodge, mostrecenttimeout = EXCLUDED.mostrecenttimeout, dodgescore = EXCLUDED.dodgescore, timeoutscore = EXCLUDED.timeoutscore
-            ''',
-            mostRecentDodge, mostRecentTimeout, score.dodgeScore, score.timeoutScore, score.chatterUserId, score.twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO anivcopymessagetimeoutscores (mostrecentdodge, mostrecenttimeout, dodgescore, timeoutscore, chatteruserid, twitchchannelid)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET mostrecentdodge = EXCLUDED.mostrecentdodge, mostrecenttimeout = EXCLUDED.mostrecenttimeout, dodgescore = EXCLUDED.dodgescore, timeoutscore = EXCLUDED.timeoutscore
+                ''',
+                mostRecentDodge, mostRecentTimeout, score.dodgeScore, score.timeoutScore, score.chatterUserId, score.twitchChannelId
+            )
+        finally:
+            await connection.close()
@@ -72,16 +72,18 @@ class AsplodieStatsRepository(AsplodieStatsRepositoryInterface):
         )
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO asplodiestats (selfasplodies, totalasplodies, totaldurationasplodiedseconds, chatteruserid, twitchchannelid)
-                VALUES ($1, $2, $3, $4, $5)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET selfasplodies = EXCLUDED.selfasplodies, totalasplodies = EXCLUDED.totalasplodies, totaldurationasplodiedseconds = EXCLUDED.totaldurationasplodiedseconds
-            ''',
-            newSelfAsplodies, newTotalAsplodies, newTotalDurationAsplodiedSeconds, chatterUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO asplodiestats (selfasplodies, totalasplodies, totaldurationasplodiedseconds, chatteruserid, twitchchannelid)
+                    VALUES ($1, $2, $3, $4, $5)
+                    ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET selfasplodies = EXCLUDED.selfasplodies, totalasplodies = EXCLUDED.totalasplodies, totaldurationasplodiedseconds = EXCLUDED.totaldurationasplodiedseconds
+                ''',
+                newSelfAsplodies, newTotalAsplodies, newTotalDurationAsplodiedSeconds, chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__cache[f'{twitchChannelId}:{chatterUserId}'] = newAsplodieStats
         self.__timber.log('AsplodieStatsRepository', f'Updated asplodie stats ({newAsplodieStats=})')
 
@@ -107,16 +109,18 @@ class AsplodieStatsRepository(AsplodieStatsRepositoryInterface):
             return result
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT selfasplodies, totalasplodies, totaldurationasplodiedseconds FROM asplodiestats
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-                LIMIT 1
-            ''',
-            chatterUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT selfasplodies, totalasplodies, totaldurationasplodiedseconds FROM asplodiestats
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                    LIMIT 1
+                ''',
+                chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
 
         if record is None or len(record) == 0:
             result = AsplodieStats(
@@ -149,36 +153,37 @@ class AsplodieStatsRepository(AsplodieStatsRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS asplodiestats (
-                            selfasplodies int DEFAULT 0 NOT NULL,
-                            totalasplodies int DEFAULT 0 NOT NULL,
-                            totaldurationasplodiedseconds bigint DEFAULT 0 NOT NULL,
-                            chatteruserid text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS asplodiestats (
-                            selfasplodies INTEGER NOT NULL DEFAULT 0,
-                            totalasplodies INTEGER NOT NULL DEFAULT 0,
-                            totaldurationasplodiedseconds INTEGER NOT NULL DEFAULT 0,
-                            chatteruserid TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS asplodiestats (
+                                selfasplodies int DEFAULT 0 NOT NULL,
+                                totalasplodies int DEFAULT 0 NOT NULL,
+                                totaldurationasplodiedseconds bigint DEFAULT 0 NOT NULL,
+                                chatteruserid text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS asplodiestats (
+                                selfasplodies INTEGER NOT NULL DEFAULT 0,
+                                totalasplodies INTEGER NOT NULL DEFAULT 0,
+                                totaldurationasplodiedseconds INTEGER NOT NULL DEFAULT 0,
+                                chatteruserid TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
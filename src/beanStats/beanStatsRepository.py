@@ -58,16 +58,18 @@ class BeanStatsRepository(BeanStatsRepositoryInterface):
         )
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT fails, successes, mostrecentfail, mostrecentsuccess FROM beanstats
-                WHERE userid = $1 AND twitchchannelid = $2
-                LIMIT 1
-            ''',
-            chatterUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT fails, successes, mostrecentfail, mostrecentsuccess FROM beanstats
+                    WHERE userid = $1 AND twitchchannelid = $2
+                    LIMIT 1
+                ''',
+                chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
 
         if record is None or len(record) == 0:
             return None
@@ -212,41 +214,42 @@ class BeanStatsRepository(BeanStatsRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS beanstats (
-                            fails int DEFAULT 0 NOT NULL,
-                            successes int DEFAULT 0 NOT NULL,
-                            mostrecentfail text DEFAULT NULL,
-                            mostrecentsuccess text DEFAULT NULL,
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS beanstats (
-                            fails INTEGER NOT NULL DEFAULT 0,
-                            successes INTEGER NOT NULL DEFAULT 0,
-                            mostrecentfail TEXT DEFAULT NULL,
-                            mostrecentsuccess TEXT DEFAULT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS beanstats (
+                                fails int DEFAULT 0 NOT NULL,
+                                successes int DEFAULT 0 NOT NULL,
+                                mostrecentfail text DEFAULT NULL,
+                                mostrecentsuccess text DEFAULT NULL,
+                                twitchchannelid text NOT NULL,
+                                userid text NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS beanstats (
+                                fails INTEGER NOT NULL DEFAULT 0,
+                                successes INTEGER NOT NULL DEFAULT 0,
+                                mostrecentfail TEXT DEFAULT NULL,
+                                mostrecentsuccess TEXT DEFAULT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                userid TEXT NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def __saveStatsToDatabase(self, stats: ChatterBeanStats):
         if not isinstance(stats, ChatterBeanStats):
@@ -261,13 +264,15 @@ class BeanStatsRepository(BeanStatsRepositoryInterface):
             mostRecentSuccessString = stats.mostRecentSuccess.isoformat()
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO beanstats (fails, successes, mostrecentfail, mostrecentsuccess, twitchchannelid, userid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                ON CONFLICT (twitchchannelid, userid) DO UPDATE SET fails = EXCLUDED.fails, successes = EXCLUDED.successes, mostrecentfail = EXCLUDED.mostrecentfail, mostrecentsuccess = EXCLUDED.mostrecentsuccess
-            ''',
-            stats.failedBeanAttempts, stats.successfulBeans, mostRecentFailString, mostRecentSuccessString, stats.twitchChannelId, stats.chatterUserId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO beanstats (fails, successes, mostrecentfail, mostrecentsuccess, twitchchannelid, userid)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    ON CONFLICT (twitchchannelid, userid) DO UPDATE SET fails = EXCLUDED.fails, successes = EXCLUDED.successes, mostrecentfail = EXCLUDED.mostrecentfail, mostrecentsuccess = EXCLUDED.mostrecentsuccess
+                ''',
+                stats.failedBeanAttempts, stats.successfulBeans, mostRecentFailString, mostRecentSuccessString, stats.twitchChannelId, stats.chatterUserId
+            )
+        finally:
+            await connection.close()
@@ -306,6 +306,7 @@ class ClearCachesChatCommand(AbsChatCommand):
         self.__clearables.append(ttsMonsterTokensRepository)
         self.__clearables.append(ttsSettingsRepository)
         self.__clearables.append(twitchChannelEditorsRepository)
+        self.__clearables.append(twitchChatMessenger)
         self.__clearables.append(twitchEmotesHelper)
         self.__clearables.append(twitchFollowingStatusRepository)
         self.__clearables.append(twitchSubscriptionsRepository)
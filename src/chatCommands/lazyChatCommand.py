@@ -0,0 +1,38 @@
+from typing import Callable, Final
+
+from .absChatCommand import AbsChatCommand
+from ..twitch.configuration.twitchContext import TwitchContext
+
+
+class LazyChatCommand(AbsChatCommand):
+
+    # Wraps a chat command whose dependencies are expensive to import or construct, so that
+    # none of that work happens until the command is first used in chat.
+
+    def __init__(self, commandFactory: Callable[[], AbsChatCommand]):
+        if not callable(commandFactory):
+            raise TypeError(f'commandFactory argument is malformed: \"{commandFactory}\"')
+
+        self.__commandFactory: Final[Callable[[], AbsChatCommand]] = commandFactory
+
+        self.__command: AbsChatCommand | None = None
+
+    def getCommand(self) -> AbsChatCommand:
+        command = self.__command
+
+        if command is None:
+            command = self.__commandFactory()
+
+            if not isinstance(command, AbsChatCommand):
+                raise TypeError(f'commandFactory returned a malformed command: \"{command}\"')
+
+            self.__command = command
+
+        return command
+
+    async def handleChatCommand(self, ctx: TwitchContext):
+        await self.getCommand().handleChatCommand(ctx)
+
+    @property
+    def isConstructed(self) -> bool:
+        return self.__command is not None
@@ -0,0 +1,305 @@
+import asyncio
+import gzip
+import json
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Collection, Final
+
+import aiosqlite
+from frozenlist import FrozenList
+
+from .chatLogArchiveEntry import ChatLogArchiveEntry
+from .chatLogArchiveInterface import ChatLogArchiveInterface
+from .chatLogArchiveQuery import ChatLogArchiveQuery
+from ..chatEventType import ChatEventType
+from ..models.absChatLog import AbsChatLog
+from ..models.cheerChatLog import CheerChatLog
+from ..models.messageChatLog import MessageChatLog
+from ..models.raidChatLog import RaidChatLog
+from ...misc import utils as utils
+from ...timber.timberInterface import TimberInterface
+from ...timber.timberLevel import TimberLevel
+
+
+class ChatLogArchive(ChatLogArchiveInterface):
+
+    # Every batch of chat logs is appended to a gzip compressed NDJSON segment file, one per
+    # channel per day. Consecutive gzip members decompress as one stream, so a day's segment
+    # file can be read back with any ordinary gzip tool. Alongside that, every chat log is also
+    # indexed into a local SQLite database (with an FTS5 table for the message text), which is
+    # what searches are run against.
+
+    def __init__(
+        self,
+        timber: TimberInterface,
+        archiveRootDirectory: str = '../logs/chatLogArchive',
+        databaseFile: str = '../db/chatLogArchive.sqlite',
+    ):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidStr(archiveRootDirectory):
+            raise TypeError(f'archiveRootDirectory argument is malformed: \"{archiveRootDirectory}\"')
+        elif not utils.isValidStr(databaseFile):
+            raise TypeError(f'databaseFile argument is malformed: \"{databaseFile}\"')
+
+        self.__timber: Final[TimberInterface] = timber
+        self.__archiveRootDirectory: Final[str] = archiveRootDirectory
+        self.__databaseFile: Final[str] = databaseFile
+
+        self.__databaseLock: Final[asyncio.Lock] = asyncio.Lock()
+        self.__isDatabaseReady: bool = False
+
+    async def archive(self, chatLogs: Collection[AbsChatLog]):
+        if not isinstance(chatLogs, Collection):
+            raise TypeError(f'chatLogs argument is malformed: \"{chatLogs}\"')
+
+        if len(chatLogs) == 0:
+            return
+
+        segments: dict[str, list[dict[str, Any]]] = defaultdict(lambda: list())
+
+        for chatLog in chatLogs:
+            record = self.__toRecord(chatLog)
+            segments[self.__getSegmentFile(chatLog)].append(record)
+
+        await asyncio.to_thread(self.__writeSegments, segments)
+
+        async with self.__databaseLock:
+            connection = await self.__connect()
+
+            try:
+                cursor = await connection.execute('SELECT COALESCE(MAX(chatLogId), 0) FROM chatLogs')
+                row = await cursor.fetchone()
+                await cursor.close()
+                previousChatLogId: int = 0 if row is None else row[0]
+
+                await connection.executemany(
+                    '''
+                        INSERT INTO chatLogs (bits, chatEventType, dateTime, epochMillis, message, segmentFile, twitchChannel, twitchChannelId, userId, userLogin, viewers)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+                    ''',
+                    [
+                        (
+                            record['bits'], record['chatEventType'], record['dateTime'], record['epochMillis'], record['message'], segmentFile,
+                            record['twitchChannel'], record['twitchChannelId'], record['userId'], record['userLogin'], record['viewers']
+                        )
+                        for segmentFile, records in segments.items()
+                        for record in records
+                    ]
+                )
+
+                await connection.execute(
+                    '''
+                        INSERT INTO chatLogsText (rowid, message)
+                        SELECT chatLogId, message FROM chatLogs
+                        WHERE chatLogId > $1 AND message IS NOT NULL
+                    ''',
+                    (previousChatLogId, )
+                )
+
+                await connection.commit()
+            finally:
+                await connection.close()
+
+        self.__timber.log(
+            tag = 'ChatLogArchive',
+            msg = lambda: f'Archived {len(chatLogs)} chat log(s) into {len(segments)} segment(s)',
+            level = TimberLevel.DEBUG,
+        )
+
+    async def __connect(self) -> aiosqlite.Connection:
+        # this method expects the database lock to already be held
+        if not self.__isDatabaseReady:
+            databaseDirectory = os.path.dirname(self.__databaseFile)
+
+            if utils.isValidStr(databaseDirectory):
+                await asyncio.to_thread(os.makedirs, databaseDirectory, exist_ok = True)
+
+        connection = await aiosqlite.connect(self.__databaseFile)
+
+        if not self.__isDatabaseReady:
+            await connection.execute('PRAGMA journal_mode = WAL')
+
+            await connection.execute(
+                '''
+                    CREATE TABLE IF NOT EXISTS chatLogs (
+                        chatLogId INTEGER PRIMARY KEY,
+                        bits INTEGER DEFAULT NULL,
+                        chatEventType TEXT NOT NULL,
+                        dateTime TEXT NOT NULL,
+                        epochMillis INTEGER NOT NULL,
+                        message TEXT DEFAULT NULL,
+                        segmentFile TEXT NOT NULL,
+                        twitchChannel TEXT NOT NULL COLLATE NOCASE,
+                        twitchChannelId TEXT NOT NULL,
+                        userId TEXT NOT NULL,
+                        userLogin TEXT NOT NULL COLLATE NOCASE,
+                        viewers INTEGER DEFAULT NULL
+                    )
+                '''
+            )
+
+            await connection.execute('CREATE INDEX IF NOT EXISTS chatLogs_twitchChannel ON chatLogs (twitchChannel, epochMillis)')
+            await connection.execute('CREATE INDEX IF NOT EXISTS chatLogs_twitchChannelId ON chatLogs (twitchChannelId, epochMillis)')
+            await connection.execute('CREATE INDEX IF NOT EXISTS chatLogs_userId ON chatLogs (userId, epochMillis)')
+            await connection.execute('CREATE INDEX IF NOT EXISTS chatLogs_userLogin ON chatLogs (userLogin, epochMillis)')
+            await connection.execute('CREATE INDEX IF NOT EXISTS chatLogs_epochMillis ON chatLogs (epochMillis)')
+
+            await connection.execute(
+                '''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS chatLogsText USING fts5 (
+                        message,
+                        content = 'chatLogs',
+                        content_rowid = 'chatLogId'
+                    )
+                '''
+            )
+
+            await connection.commit()
+            self.__isDatabaseReady = True
+
+        return connection
+
+    def __getSegmentFile(self, chatLog: AbsChatLog) -> str:
+        twitchChannel = chatLog.getTwitchChannel().lower()
+        dateTime = chatLog.getDateTime()
+        return f'{self.__archiveRootDirectory}/{twitchChannel}/{dateTime.getYearStr()}/{dateTime.getMonthStr()}/{dateTime.getDayStr()}.ndjson.gz'
+
+    async def search(self, query: ChatLogArchiveQuery) -> FrozenList[ChatLogArchiveEntry]:
+        if not isinstance(query, ChatLogArchiveQuery):
+            raise TypeError(f'query argument is malformed: \"{query}\"')
+        elif not utils.isValidInt(query.limit):
+            raise TypeError(f'query.limit argument is malformed: \"{query.limit}\"')
+        elif query.limit < 1 or query.limit > utils.getIntMaxSafeSize():
+            raise ValueError(f'query.limit argument is out of bounds: {query.limit}')
+
+        tables = 'chatLogs'
+        conditions: list[str] = list()
+        parameters: list[Any] = list()
+
+        def addCondition(condition: str, parameter: Any):
+            parameters.append(parameter)
+            conditions.append(condition.replace('?', f'${len(parameters)}'))
+
+        if utils.isValidStr(query.text):
+            tables = 'chatLogs INNER JOIN chatLogsText ON chatLogsText.rowid = chatLogs.chatLogId'
+            # quote the text as a single FTS phrase, so that nothing in it is taken as query syntax
+            phrase = query.text.replace('"', '""')
+            addCondition('chatLogsText MATCH ?', f'"{phrase}"')
+
+        if query.chatEventType is not None:
+            addCondition('chatLogs.chatEventType = ?', query.chatEventType.name)
+
+        if query.startDateTime is not None:
+            addCondition('chatLogs.epochMillis >= ?', self.__toEpochMillis(query.startDateTime))
+
+        if query.endDateTime is not None:
+            addCondition('chatLogs.epochMillis < ?', self.__toEpochMillis(query.endDateTime))
+
+        if utils.isValidStr(query.twitchChannel):
+            addCondition('chatLogs.twitchChannel = ?', query.twitchChannel)
+
+        if utils.isValidStr(query.twitchChannelId):
+            addCondition('chatLogs.twitchChannelId = ?', query.twitchChannelId)
+
+        if utils.isValidStr(query.userId):
+            addCondition('chatLogs.userId = ?', query.userId)
+
+        if utils.isValidStr(query.userLogin):
+            addCondition('chatLogs.userLogin = ?', query.userLogin)
+
+        whereClause = ''
+        if len(conditions) >= 1:
+            whereClause = 'WHERE ' + ' AND '.join(conditions)
+
+        parameters.append(query.limit)
+
+        statement = f'''
+            SELECT chatLogs.bits, chatLogs.chatEventType, chatLogs.dateTime, chatLogs.message, chatLogs.twitchChannel,
+                chatLogs.twitchChannelId, chatLogs.userId, chatLogs.userLogin, chatLogs.viewers
+            FROM {tables}
+            {whereClause}
+            ORDER BY chatLogs.epochMillis ASC, chatLogs.chatLogId ASC
+            LIMIT ${len(parameters)}
+        '''
+
+        async with self.__databaseLock:
+            connection = await self.__connect()
+
+            try:
+                cursor = await connection.execute(statement, tuple(parameters))
+                rows = await cursor.fetchall()
+                await cursor.close()
+            finally:
+                await connection.close()
+
+        entries: FrozenList[ChatLogArchiveEntry] = FrozenList()
+
+        for row in rows:
+            entries.append(ChatLogArchiveEntry(
+                dateTime = datetime.fromisoformat(row[2]),
+                chatEventType = ChatEventType[row[1]],
+                bits = row[0],
+                viewers = row[8],
+                message = row[3],
+                twitchChannel = row[4],
+                twitchChannelId = row[5],
+                userId = row[6],
+                userLogin = row[7],
+            ))
+
+        entries.freeze()
+        return entries
+
+    def __toEpochMillis(self, dateTime: datetime) -> int:
+        if not isinstance(dateTime, datetime):
+            raise TypeError(f'dateTime argument is malformed: \"{dateTime}\"')
+
+        return int(dateTime.timestamp() * 1000)
+
+    def __toRecord(self, chatLog: AbsChatLog) -> dict[str, Any]:
+        dateTime = chatLog.getDateTime().getDateTime()
+
+        record: dict[str, Any] = {
+            'bits': None,
+            'dateTime': dateTime.isoformat(),
+            'epochMillis': self.__toEpochMillis(dateTime),
+            'message': None,
+            'twitchChannel': chatLog.getTwitchChannel().lower(),
+            'twitchChannelId': chatLog.getTwitchChannelId(),
+            'viewers': None,
+        }
+
+        if isinstance(chatLog, CheerChatLog):
+            record['bits'] = chatLog.bits
+            record['chatEventType'] = ChatEventType.CHEER.name
+            record['userId'] = chatLog.cheerUserId
+            record['userLogin'] = chatLog.cheerUserLogin.lower()
+
+        elif isinstance(chatLog, MessageChatLog):
+            record['bits'] = chatLog.bits
+            record['chatEventType'] = ChatEventType.MESSAGE.name
+            record['message'] = chatLog.message
+            record['userId'] = chatLog.chatterUserId
+            record['userLogin'] = chatLog.chatterUserLogin.lower()
+
+        elif isinstance(chatLog, RaidChatLog):
+            record['chatEventType'] = ChatEventType.RAID.name
+            record['userId'] = chatLog.raidUserId
+            record['userLogin'] = chatLog.raidUserLogin.lower()
+            record['viewers'] = chatLog.viewers
+
+        else:
+            raise RuntimeError(f'AbsChatLog is of an unknown type ({chatLog=})')
+
+        return record
+
+    def __writeSegments(self, segments: dict[str, list[dict[str, Any]]]):
+        # This runs on a worker thread. Each call appends one new gzip member per segment file.
+        for segmentFile, records in segments.items():
+            os.makedirs(os.path.dirname(segmentFile), exist_ok = True)
+            lines = ''.join(f'{json.dumps(record, ensure_ascii = False)}\n' for record in records)
+
+            with gzip.open(segmentFile, mode = 'ab') as file:
+                file.write(lines.encode('utf-8'))
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from ..chatEventType import ChatEventType
+
+
+@dataclass(frozen = True)
+class ChatLogArchiveEntry:
+    dateTime: datetime
+    chatEventType: ChatEventType
+    bits: int | None
+    viewers: int | None
+    message: str | None
+    twitchChannel: str
+    twitchChannelId: str
+    userId: str
+    userLogin: str
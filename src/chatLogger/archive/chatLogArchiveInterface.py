@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Collection
+
+from frozenlist import FrozenList
+
+from .chatLogArchiveEntry import ChatLogArchiveEntry
+from .chatLogArchiveQuery import ChatLogArchiveQuery
+from ..models.absChatLog import AbsChatLog
+
+
+class ChatLogArchiveInterface(ABC):
+
+    @abstractmethod
+    async def archive(self, chatLogs: Collection[AbsChatLog]):
+        pass
+
+    @abstractmethod
+    async def search(self, query: ChatLogArchiveQuery) -> FrozenList[ChatLogArchiveEntry]:
+        pass
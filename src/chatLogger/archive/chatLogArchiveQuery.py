@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from ..chatEventType import ChatEventType
+
+
+@dataclass(frozen = True)
+class ChatLogArchiveQuery:
+    chatEventType: ChatEventType | None = None
+    # inclusive
+    startDateTime: datetime | None = None
+    # exclusive
+    endDateTime: datetime | None = None
+    limit: int = 500
+    # full text search, matched as a phrase
+    text: str | None = None
+    twitchChannel: str | None = None
+    twitchChannelId: str | None = None
+    userId: str | None = None
+    userLogin: str | None = None
@@ -1,8 +1,6 @@
 import asyncio
-import queue
 import traceback
 from collections import defaultdict
-from queue import SimpleQueue
 from typing import Final
 
 import aiofiles
@@ -10,6 +8,7 @@ import aiofiles.os
 import aiofiles.ospath
 from frozenlist import FrozenList
 
+from .archive.chatLogArchiveInterface import ChatLogArchiveInterface
 from .chatLoggerInterface import ChatLoggerInterface
 from .models.absChatLog import AbsChatLog
 from .models.cheerChatLog import CheerChatLog
@@ -19,6 +18,7 @@ from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
 from ..misc.simpleDateTime import SimpleDateTime
+from ..misc.workQueue.workQueue import WorkQueue
 from ..timber.timberInterface import TimberInterface
 
 
@@ -29,28 +29,38 @@ class ChatLogger(ChatLoggerInterface):
         backgroundTaskHelper: BackgroundTaskHelperInterface,
         timber: TimberInterface,
         timeZoneRepository: TimeZoneRepositoryInterface,
+        chatLogArchive: ChatLogArchiveInterface | None = None,
         sleepTimeSeconds: float = 8,
+        maxBatchSize: int = 512,
         logRootDirectory: str = '../logs/chatLogger',
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif chatLogArchive is not None and not isinstance(chatLogArchive, ChatLogArchiveInterface):
+            raise TypeError(f'chatLogArchive argument is malformed: \"{chatLogArchive}\"')
         elif not utils.isValidNum(sleepTimeSeconds):
             raise TypeError(f'sleepTimeSeconds argument is malformed: \"{sleepTimeSeconds}\"')
         elif sleepTimeSeconds < 1 or sleepTimeSeconds > 60:
             raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
+        elif not utils.isValidInt(maxBatchSize):
+            raise TypeError(f'maxBatchSize argument is malformed: \"{maxBatchSize}\"')
+        elif maxBatchSize < 1 or maxBatchSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxBatchSize argument is out of bounds: {maxBatchSize}')
         elif not utils.isValidStr(logRootDirectory):
             raise TypeError(f'logRootDirectory argument is malformed: \"{logRootDirectory}\"')
 
         self.__backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = backgroundTaskHelper
         self.__timber: Final[TimberInterface] = timber
         self.__timeZoneRepository: Final[TimeZoneRepositoryInterface] = timeZoneRepository
+        self.__chatLogArchive: Final[ChatLogArchiveInterface | None] = chatLogArchive
         self.__sleepTimeSeconds: Final[float] = sleepTimeSeconds
+        self.__maxBatchSize: Final[int] = maxBatchSize
         self.__logRootDirectory: Final[str] = logRootDirectory
 
         self.__isStarted: bool = False
-        self.__chatLogQueue: Final[SimpleQueue[AbsChatLog]] = SimpleQueue()
+        self.__chatLogQueue: Final[WorkQueue[AbsChatLog]] = WorkQueue(backgroundTaskHelper.eventLoop)
 
     def __getLogStatement(self, chatLog: AbsChatLog) -> str:
         if not isinstance(chatLog, AbsChatLog):
@@ -189,19 +199,26 @@ class ChatLogger(ChatLoggerInterface):
 
     async def __startChatLogLoop(self):
         while True:
-            chatLogs: FrozenList[AbsChatLog] = FrozenList()
+            # block until a chat log arrives, then briefly sleep after writing so that logs can batch up
+            chatLogs = await self.__chatLogQueue.getBatch(
+                maxBatchSize = self.__maxBatchSize,
+            )
 
-            try:
-                while not self.__chatLogQueue.empty():
-                    chatLog = self.__chatLogQueue.get_nowait()
-                    chatLogs.append(chatLog)
-            except queue.Empty as e:
-                self.__timber.log('ChatLogger', f'Encountered queue.Empty when building up chatLogs list (queue size: {self.__chatLogQueue.qsize()}) (chatLogs size: {len(chatLogs)}): {e}', e, traceback.format_exc())
-
-            chatLogs.freeze()
             await self.__writeToLogFiles(chatLogs)
+            await self.__writeToChatLogArchive(chatLogs)
             await asyncio.sleep(self.__sleepTimeSeconds)
 
+    async def __writeToChatLogArchive(self, chatLogs: FrozenList[AbsChatLog]):
+        chatLogArchive = self.__chatLogArchive
+
+        if chatLogArchive is None or len(chatLogs) == 0:
+            return
+
+        try:
+            await chatLogArchive.archive(chatLogs)
+        except Exception as e:
+            self.__timber.log('ChatLogger', f'Encountered exception when writing chat logs to the chat log archive ({len(chatLogs)=}): {e}', e, traceback.format_exc())
+
     async def __writeToLogFiles(self, chatLogs: FrozenList[AbsChatLog]):
         if len(chatLogs) == 0:
             return
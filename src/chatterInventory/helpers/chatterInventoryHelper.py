@@ -1,4 +1,4 @@
-from typing import Final
+from typing import Collection, Final
 
 from frozendict import frozendict
 
@@ -142,3 +142,42 @@ class ChatterInventoryHelper(ChatterInventoryHelperInterface):
             chatterUserName = chatterUserName,
             twitchChannel = twitchChannel,
         )
+
+    async def giveToChatters(
+        self,
+        itemType: ChatterItemType,
+        giveAmount: int,
+        chatterUserIds: Collection[str],
+        twitchChannelId: str,
+    ) -> frozendict[str, ChatterInventoryData]:
+        if not isinstance(itemType, ChatterItemType):
+            raise TypeError(f'itemType argument is malformed: \"{itemType}\"')
+        elif not utils.isValidInt(giveAmount):
+            raise TypeError(f'giveAmount argument is malformed: \"{giveAmount}\"')
+        elif giveAmount < utils.getIntMinSafeSize() or giveAmount > utils.getIntMaxSafeSize():
+            raise ValueError(f'giveAmount argument is out of bounds: {giveAmount}')
+        elif not isinstance(chatterUserIds, Collection) or not all(utils.isValidStr(chatterUserId) for chatterUserId in chatterUserIds):
+            raise TypeError(f'chatterUserIds argument is malformed: \"{chatterUserIds}\"')
+        elif not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+
+        if len(chatterUserIds) == 0:
+            return frozendict()
+        elif not await self.__chatterInventorySettings.isEnabled():
+            chatterInventories: dict[str, ChatterInventoryData] = dict()
+
+            for chatterUserId in chatterUserIds:
+                chatterInventories[chatterUserId] = ChatterInventoryData(
+                    inventory = frozendict(),
+                    chatterUserId = chatterUserId,
+                    twitchChannelId = twitchChannelId,
+                )
+
+            return frozendict(chatterInventories)
+
+        return await self.__chatterInventoryRepository.updateForChatters(
+            itemType = itemType,
+            changeAmount = giveAmount,
+            chatterUserIds = chatterUserIds,
+            twitchChannelId = twitchChannelId,
+        )
@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Collection
 
+from frozendict import frozendict
+
+from ..models.chatterInventoryData import ChatterInventoryData
 from ..models.chatterItemGiveResult import ChatterItemGiveResult
 from ..models.chatterItemType import ChatterItemType
 from ..models.preparedChatterInventoryData import PreparedChatterInventoryData
@@ -24,3 +28,13 @@ class ChatterInventoryHelperInterface(ABC):
         twitchChannelId: str,
     ) -> ChatterItemGiveResult:
         pass
+
+    @abstractmethod
+    async def giveToChatters(
+        self,
+        itemType: ChatterItemType,
+        giveAmount: int,
+        chatterUserIds: Collection[str],
+        twitchChannelId: str,
+    ) -> frozendict[str, ChatterInventoryData]:
+        pass
@@ -1,4 +1,4 @@
-from typing import Final
+from typing import Collection, Final
 
 from frozendict import frozendict
 
@@ -114,3 +114,37 @@ class StubChatterInventoryHelper(ChatterInventoryHelperInterface):
             chatterUserName = chatterUserName,
             twitchChannel = twitchChannel,
         )
+
+    async def giveToChatters(
+        self,
+        itemType: ChatterItemType,
+        giveAmount: int,
+        chatterUserIds: Collection[str],
+        twitchChannelId: str,
+    ) -> frozendict[str, ChatterInventoryData]:
+        if not isinstance(itemType, ChatterItemType):
+            raise TypeError(f'itemType argument is malformed: \"{itemType}\"')
+        elif not utils.isValidInt(giveAmount):
+            raise TypeError(f'giveAmount argument is malformed: \"{giveAmount}\"')
+        elif giveAmount < utils.getIntMinSafeSize() or giveAmount > utils.getIntMaxSafeSize():
+            raise ValueError(f'giveAmount argument is out of bounds: {giveAmount}')
+        elif not isinstance(chatterUserIds, Collection) or not all(utils.isValidStr(chatterUserId) for chatterUserId in chatterUserIds):
+            raise TypeError(f'chatterUserIds argument is malformed: \"{chatterUserIds}\"')
+        elif not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+
+        inventory: dict[ChatterItemType, int] = dict()
+
+        for itemType in ChatterItemType:
+            inventory[itemType] = 0
+
+        chatterInventories: dict[str, ChatterInventoryData] = dict()
+
+        for chatterUserId in chatterUserIds:
+            chatterInventories[chatterUserId] = ChatterInventoryData(
+                inventory = frozendict(inventory),
+                chatterUserId = chatterUserId,
+                twitchChannelId = twitchChannelId,
+            )
+
+        return frozendict(chatterInventories)
@@ -396,25 +396,15 @@ class ChatterInventoryItemUseMachine(ChatterInventoryItemUseMachineInterface):
             ))
             return
 
-        await self.__chatterInventoryRepository.update(
-            itemType = ChatterItemType.GASHAPON,
-            changeAmount = -1,
-            chatterUserId = action.chatterUserId,
-            twitchChannelId = action.twitchChannelId,
-        )
+        # the spent gashapon and everything it awarded all land in the inventory at once
+        inventoryChanges: dict[ChatterItemType, int] = {
+            itemType: changeAmount for itemType, changeAmount in awardedItems.items() if changeAmount != 0
+        }
 
-        for itemType in enabledItemTypes:
-            changeAmount = awardedItems.get(itemType, 0)
+        inventoryChanges[ChatterItemType.GASHAPON] = inventoryChanges.get(ChatterItemType.GASHAPON, 0) - 1
 
-            if changeAmount != 0:
-                await self.__chatterInventoryRepository.update(
-                    itemType = itemType,
-                    changeAmount = awardedItems[itemType],
-                    chatterUserId = action.chatterUserId,
-                    twitchChannelId = action.twitchChannelId,
-                )
-
-        updatedInventory = await self.__chatterInventoryRepository.get(
+        updatedInventory = await self.__chatterInventoryRepository.updateMultiple(
+            changes = inventoryChanges,
             chatterUserId = action.chatterUserId,
             twitchChannelId = action.twitchChannelId,
         )
@@ -547,19 +537,20 @@ class ChatterInventoryItemUseMachine(ChatterInventoryItemUseMachineInterface):
             ),
         )
 
-        fromChatterCurrentInventory = await self.__chatterInventoryRepository.get(
-            chatterUserId = action.fromChatterUserId,
+        # There is a lot of room for exploitation if the trade amount isn't carefully normalized.
+        # We really, really don't want to allow for anyone to sneak in trade amounts that could
+        # cause item duplications, may cause people to be ripped off, or for people to end up
+        # with negative inventory amounts. The repository clamps the trade amount to what the
+        # giving chatter actually has, and does so atomically with the trade itself.
+        tradeResult = await self.__chatterInventoryRepository.trade(
+            itemType = action.itemType,
+            tradeAmount = action.tradeAmount,
+            fromChatterUserId = action.fromChatterUserId,
+            toChatterUserId = action.toChatterUserId,
             twitchChannelId = action.twitchChannelId,
         )
 
-        # There is a lot of room for exploitation without this fairly obtuse line.
-        # We really, really don't want to allow for anyone to sneak in trade amounts
-        # that could cause item duplications, may cause people to be ripped off, or
-        # for people to end up with negative inventory amounts.
-        #
-        # This line intends to normalize/handle all of these potentially weird
-        # interactions by forcing us down to a tradeAmount of 0.
-        tradeAmount = int(max(min(action.tradeAmount, fromChatterCurrentInventory[action.itemType]), 0))
+        tradeAmount = tradeResult.tradeAmount
 
         if tradeAmount < 1:
             await self.__submitEvent(TradeChatterNotEnoughInventoryItemEvent(
@@ -571,19 +562,8 @@ class ChatterInventoryItemUseMachine(ChatterInventoryItemUseMachineInterface):
             ))
             return
 
-        toChatterInventory = await self.__chatterInventoryRepository.update(
-            itemType = action.itemType,
-            changeAmount = tradeAmount,
-            chatterUserId = action.toChatterUserId,
-            twitchChannelId = action.twitchChannelId,
-        )
-
-        fromChatterInventory = await self.__chatterInventoryRepository.update(
-            itemType = action.itemType,
-            changeAmount = tradeAmount * -1,
-            chatterUserId = action.fromChatterUserId,
-            twitchChannelId = action.twitchChannelId,
-        )
+        fromChatterInventory = tradeResult.fromChatterInventory
+        toChatterInventory = tradeResult.toChatterInventory
 
         await self.__submitEvent(TradeChatterItemEvent(
             fromChatterInventory = fromChatterInventory,
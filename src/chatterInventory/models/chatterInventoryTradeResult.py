@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from .chatterInventoryData import ChatterInventoryData
+
+
+@dataclass(frozen = True)
+class ChatterInventoryTradeResult:
+    fromChatterInventory: ChatterInventoryData
+    toChatterInventory: ChatterInventoryData
+    tradeAmount: int
@@ -1,11 +1,14 @@
+import asyncio
 import json
-from typing import Final
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Collection, Final
 
 from frozendict import frozendict
 
 from .chatterInventoryRepositoryInterface import ChatterInventoryRepositoryInterface
 from ..mappers.chatterInventoryMapperInterface import ChatterInventoryMapperInterface
 from ..models.chatterInventoryData import ChatterInventoryData
+from ..models.chatterInventoryTradeResult import ChatterInventoryTradeResult
 from ..models.chatterItemType import ChatterItemType
 from ...location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ...misc import utils as utils
@@ -40,6 +43,49 @@ class ChatterInventoryRepository(ChatterInventoryRepositoryInterface):
 
         self.__isDatabaseReady: bool = False
         self.__cache: Final[dict[str, ChatterInventoryData | None]] = dict()
+        self.__locks: Final[dict[str, asyncio.Lock]] = dict()
+        self.__lockHolders: Final[dict[str, int]] = dict()
+
+    async def __applyChanges(
+        self,
+        changes: dict[str, dict[ChatterItemType, int]],
+        twitchChannelId: str,
+    ) -> frozendict[str, ChatterInventoryData]:
+        # Every inventory being changed stays locked from the moment it's read until the moment
+        # its new contents have been written, so concurrent pulls, trades, and item uses for the
+        # same chatter can't step on each other's updates.
+        async with self.__lockInventories(changes.keys(), twitchChannelId):
+            connection = await self.__getDatabaseConnection()
+
+            try:
+                inventories = await self.__getInventories(
+                    connection = connection,
+                    chatterUserIds = changes.keys(),
+                    twitchChannelId = twitchChannelId,
+                )
+
+                newInventories: dict[str, ChatterInventoryData] = dict()
+
+                for chatterUserId, itemChanges in changes.items():
+                    newInventory = dict(inventories[chatterUserId].inventory)
+
+                    for itemType, changeAmount in itemChanges.items():
+                        newInventory[itemType] = max(0, newInventory.get(itemType, 0) + changeAmount)
+
+                    newInventories[chatterUserId] = ChatterInventoryData(
+                        inventory = frozendict(newInventory),
+                        chatterUserId = chatterUserId,
+                        twitchChannelId = twitchChannelId,
+                    )
+
+                await self.__saveInventories(
+                    connection = connection,
+                    inventories = newInventories.values(),
+                )
+            finally:
+                await connection.close()
+
+        return frozendict(newInventories)
 
     async def clearCaches(self):
         self.__cache.clear()
@@ -59,14 +105,20 @@ class ChatterInventoryRepository(ChatterInventoryRepositoryInterface):
         if inventoryData is not None:
             return inventoryData
 
-        connection = await self.__getDatabaseConnection()
-        inventoryData = await self.__get(
-            connection = connection,
-            chatterUserId = chatterUserId,
-            twitchChannelId = twitchChannelId,
-        )
+        # a concurrent update must not be able to land in between this read and the cache write
+        async with self.__lockInventories([ chatterUserId ], twitchChannelId):
+            connection = await self.__getDatabaseConnection()
 
-        await connection.close()
+            try:
+                inventories = await self.__getInventories(
+                    connection = connection,
+                    chatterUserIds = [ chatterUserId ],
+                    twitchChannelId = twitchChannelId,
+                )
+            finally:
+                await connection.close()
+
+        inventoryData = inventories[chatterUserId]
         self.__cache[f'{twitchChannelId}:{chatterUserId}'] = inventoryData
         return inventoryData
 
@@ -102,6 +154,62 @@ class ChatterInventoryRepository(ChatterInventoryRepositoryInterface):
         await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
+    async def __getInventories(
+        self,
+        connection: DatabaseConnection,
+        chatterUserIds: Collection[str],
+        twitchChannelId: str,
+    ) -> dict[str, ChatterInventoryData]:
+        inventories: dict[str, ChatterInventoryData] = dict()
+        uncachedChatterUserIds: set[str] = set()
+
+        for chatterUserId in chatterUserIds:
+            inventoryData = self.__cache.get(f'{twitchChannelId}:{chatterUserId}', None)
+
+            if inventoryData is None:
+                uncachedChatterUserIds.add(chatterUserId)
+            else:
+                inventories[chatterUserId] = inventoryData
+
+        if len(uncachedChatterUserIds) == 0:
+            return inventories
+        elif len(uncachedChatterUserIds) == 1:
+            chatterUserId = next(iter(uncachedChatterUserIds))
+
+            inventories[chatterUserId] = await self.__get(
+                connection = connection,
+                chatterUserId = chatterUserId,
+                twitchChannelId = twitchChannelId,
+            )
+
+            return inventories
+
+        records = await connection.fetchRows(
+            '''
+                SELECT chatteruserid, inventory FROM chatterinventories
+                WHERE twitchchannelid = $1
+            ''',
+            twitchChannelId,
+        )
+
+        inventoryJsons: dict[str, dict[str, int | None] | None] = dict()
+
+        if records is not None:
+            for record in records:
+                if record[0] in uncachedChatterUserIds and utils.isValidStr(record[1]):
+                    inventoryJsons[record[0]] = json.loads(record[1])
+
+        for chatterUserId in uncachedChatterUserIds:
+            inventory = await self.__chatterInventoryMapper.parseInventory(inventoryJsons.get(chatterUserId, None))
+
+            inventories[chatterUserId] = ChatterInventoryData(
+                inventory = frozendict(inventory),
+                chatterUserId = chatterUserId,
+                twitchChannelId = twitchChannelId,
+            )
+
+        return inventories
+
     async def __initDatabaseTable(self):
         if self.__isDatabaseReady:
             return
@@ -109,35 +217,164 @@ class ChatterInventoryRepository(ChatterInventoryRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS chatterinventories (
-                            chatteruserid text NOT NULL,
-                            inventory jsonb DEFAULT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS chatterinventories (
+                                chatteruserid text NOT NULL,
+                                inventory jsonb DEFAULT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS chatterinventories (
+                                chatteruserid TEXT NOT NULL,
+                                inventory TEXT DEFAULT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
+
+    @asynccontextmanager
+    async def __lockInventories(
+        self,
+        chatterUserIds: Collection[str],
+        twitchChannelId: str,
+    ) -> AsyncIterator[None]:
+        # locks are always taken in sorted order, so that two operations that each touch
+        # several of the same chatters can never end up waiting on one another
+        cacheKeys = sorted({ f'{twitchChannelId}:{chatterUserId}' for chatterUserId in chatterUserIds })
+        acquiredLocks: list[asyncio.Lock] = list()
+
+        for cacheKey in cacheKeys:
+            self.__lockHolders[cacheKey] = self.__lockHolders.get(cacheKey, 0) + 1
+
+            if cacheKey not in self.__locks:
+                self.__locks[cacheKey] = asyncio.Lock()
+
+        try:
+            for cacheKey in cacheKeys:
+                lock = self.__locks[cacheKey]
+                await lock.acquire()
+                acquiredLocks.append(lock)
+
+            yield
+        finally:
+            for lock in acquiredLocks:
+                lock.release()
+
+            for cacheKey in cacheKeys:
+                lockHolders = self.__lockHolders[cacheKey] - 1
+
+                if lockHolders >= 1:
+                    self.__lockHolders[cacheKey] = lockHolders
+                else:
+                    del self.__lockHolders[cacheKey]
+                    del self.__locks[cacheKey]
+
+    async def __saveInventories(
+        self,
+        connection: DatabaseConnection,
+        inventories: Collection[ChatterInventoryData],
+    ):
+        async with connection.transaction():
+            for inventoryData in inventories:
+                inventoryJson = await self.__chatterInventoryMapper.serializeInventory(inventoryData.inventory)
+                inventoryJsonString = json.dumps(inventoryJson, sort_keys = True, allow_nan = False)
 
-            case DatabaseType.SQLITE:
                 await connection.execute(
                     '''
-                        CREATE TABLE IF NOT EXISTS chatterinventories (
-                            chatteruserid TEXT NOT NULL,
-                            inventory TEXT DEFAULT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        ) STRICT
-                    '''
+                        INSERT INTO chatterinventories (chatteruserid, inventory, twitchchannelid)
+                        VALUES ($1, $2, $3)
+                        ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET inventory = EXCLUDED.inventory
+                    ''',
+                    inventoryData.chatterUserId, inventoryJsonString, inventoryData.twitchChannelId,
                 )
 
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        for inventoryData in inventories:
+            self.__cache[f'{inventoryData.twitchChannelId}:{inventoryData.chatterUserId}'] = inventoryData
+
+    async def trade(
+        self,
+        itemType: ChatterItemType,
+        tradeAmount: int,
+        fromChatterUserId: str,
+        toChatterUserId: str,
+        twitchChannelId: str,
+    ) -> ChatterInventoryTradeResult:
+        if not isinstance(itemType, ChatterItemType):
+            raise TypeError(f'itemType argument is malformed: \"{itemType}\"')
+        elif not utils.isValidInt(tradeAmount):
+            raise TypeError(f'tradeAmount argument is malformed: \"{tradeAmount}\"')
+        elif not utils.isValidStr(fromChatterUserId):
+            raise TypeError(f'fromChatterUserId argument is malformed: \"{fromChatterUserId}\"')
+        elif not utils.isValidStr(toChatterUserId):
+            raise TypeError(f'toChatterUserId argument is malformed: \"{toChatterUserId}\"')
+        elif not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+
+        async with self.__lockInventories([ fromChatterUserId, toChatterUserId ], twitchChannelId):
+            connection = await self.__getDatabaseConnection()
+
+            try:
+                inventories = await self.__getInventories(
+                    connection = connection,
+                    chatterUserIds = [ fromChatterUserId, toChatterUserId ],
+                    twitchChannelId = twitchChannelId,
+                )
 
-        await connection.close()
+                fromChatterInventory = inventories[fromChatterUserId]
+                toChatterInventory = inventories[toChatterUserId]
+
+                # clamping happens while both inventories are locked, so that no one can spend
+                # these items elsewhere in between the amount being checked and the trade happening
+                tradeAmount = int(max(min(tradeAmount, fromChatterInventory[itemType]), 0))
+
+                if tradeAmount >= 1 and fromChatterUserId != toChatterUserId:
+                    fromInventory = dict(fromChatterInventory.inventory)
+                    fromInventory[itemType] = fromChatterInventory[itemType] - tradeAmount
+                    toInventory = dict(toChatterInventory.inventory)
+                    toInventory[itemType] = toChatterInventory[itemType] + tradeAmount
+
+                    fromChatterInventory = ChatterInventoryData(
+                        inventory = frozendict(fromInventory),
+                        chatterUserId = fromChatterUserId,
+                        twitchChannelId = twitchChannelId,
+                    )
+
+                    toChatterInventory = ChatterInventoryData(
+                        inventory = frozendict(toInventory),
+                        chatterUserId = toChatterUserId,
+                        twitchChannelId = twitchChannelId,
+                    )
+
+                    await self.__saveInventories(
+                        connection = connection,
+                        inventories = [ fromChatterInventory, toChatterInventory ],
+                    )
+            finally:
+                await connection.close()
+
+        self.__timber.log('ChatterInventoryRepository', f'Traded items ({itemType=}) ({tradeAmount=}) ({fromChatterUserId=}) ({toChatterUserId=}) ({twitchChannelId=})')
+
+        return ChatterInventoryTradeResult(
+            fromChatterInventory = fromChatterInventory,
+            toChatterInventory = toChatterInventory,
+            tradeAmount = tradeAmount,
+        )
 
     async def update(
         self,
@@ -157,37 +394,68 @@ class ChatterInventoryRepository(ChatterInventoryRepositoryInterface):
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        connection = await self.__getDatabaseConnection()
-        inventoryData = await self.__get(
-            connection = connection,
-            chatterUserId = chatterUserId,
+        inventories = await self.__applyChanges(
+            changes = { chatterUserId: { itemType: changeAmount } },
             twitchChannelId = twitchChannelId,
         )
 
-        newInventory = dict(inventoryData.inventory)
-        newInventory[itemType] = max(0, newInventory.get(itemType, 0) + changeAmount)
+        inventoryData = inventories[chatterUserId]
+        self.__timber.log('ChatterInventoryRepository', f'Updated inventory ({inventoryData=}) ({itemType=}) ({changeAmount=}) ({chatterUserId=}) ({twitchChannelId=})')
 
-        inventoryJson = await self.__chatterInventoryMapper.serializeInventory(newInventory)
-        inventoryJsonString = json.dumps(inventoryJson, sort_keys = True, allow_nan = False)
+        return inventoryData
 
-        await connection.execute(
-            '''
-                INSERT INTO chatterinventories (chatteruserid, inventory, twitchchannelid)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET inventory = EXCLUDED.inventory
-            ''',
-            chatterUserId, inventoryJsonString, twitchChannelId,
+    async def updateForChatters(
+        self,
+        itemType: ChatterItemType,
+        changeAmount: int,
+        chatterUserIds: Collection[str],
+        twitchChannelId: str,
+    ) -> frozendict[str, ChatterInventoryData]:
+        if not isinstance(itemType, ChatterItemType):
+            raise TypeError(f'itemType argument is malformed: \"{itemType}\"')
+        elif not utils.isValidInt(changeAmount):
+            raise TypeError(f'changeAmount argument is malformed: \"{changeAmount}\"')
+        elif changeAmount < utils.getIntMinSafeSize() or changeAmount > utils.getIntMaxSafeSize():
+            raise ValueError(f'changeAmount argument is out of bounds: {changeAmount}')
+        elif not isinstance(chatterUserIds, Collection) or not all(utils.isValidStr(chatterUserId) for chatterUserId in chatterUserIds):
+            raise TypeError(f'chatterUserIds argument is malformed: \"{chatterUserIds}\"')
+        elif not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+
+        if len(chatterUserIds) == 0:
+            return frozendict()
+
+        inventories = await self.__applyChanges(
+            changes = { chatterUserId: { itemType: changeAmount } for chatterUserId in chatterUserIds },
+            twitchChannelId = twitchChannelId,
         )
 
-        await connection.close()
+        self.__timber.log('ChatterInventoryRepository', f'Updated inventories ({itemType=}) ({changeAmount=}) ({len(inventories)=}) ({twitchChannelId=})')
+        return inventories
 
-        inventoryData = ChatterInventoryData(
-            inventory = frozendict(newInventory),
-            chatterUserId = chatterUserId,
+    async def updateMultiple(
+        self,
+        changes: dict[ChatterItemType, int],
+        chatterUserId: str,
+        twitchChannelId: str,
+    ) -> ChatterInventoryData:
+        if not isinstance(changes, dict):
+            raise TypeError(f'changes argument is malformed: \"{changes}\"')
+        elif not all(isinstance(itemType, ChatterItemType) for itemType in changes.keys()):
+            raise TypeError(f'changes argument contains a malformed item type: \"{changes}\"')
+        elif not all(utils.isValidInt(changeAmount) and utils.getIntMinSafeSize() <= changeAmount <= utils.getIntMaxSafeSize() for changeAmount in changes.values()):
+            raise ValueError(f'changes argument contains a malformed change amount: \"{changes}\"')
+        elif not utils.isValidStr(chatterUserId):
+            raise TypeError(f'chatterUserId argument is malformed: \"{chatterUserId}\"')
+        elif not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+
+        inventories = await self.__applyChanges(
+            changes = { chatterUserId: dict(changes) },
             twitchChannelId = twitchChannelId,
         )
 
-        self.__cache[f'{twitchChannelId}:{chatterUserId}'] = inventoryData
-        self.__timber.log('ChatterInventoryRepository', f'Updated inventory ({newInventory=}) ({itemType=}) ({changeAmount=}) ({chatterUserId=}) ({twitchChannelId=})')
+        inventoryData = inventories[chatterUserId]
+        self.__timber.log('ChatterInventoryRepository', f'Updated inventory ({inventoryData=}) ({changes=}) ({chatterUserId=}) ({twitchChannelId=})')
 
         return inventoryData
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Collection
+
+from frozendict import frozendict
 
 from ..models.chatterInventoryData import ChatterInventoryData
+from ..models.chatterInventoryTradeResult import ChatterInventoryTradeResult
 from ..models.chatterItemType import ChatterItemType
 from ...misc.clearable import Clearable
 
@@ -15,6 +19,17 @@ class ChatterInventoryRepositoryInterface(Clearable, ABC):
     ) -> ChatterInventoryData:
         pass
 
+    @abstractmethod
+    async def trade(
+        self,
+        itemType: ChatterItemType,
+        tradeAmount: int,
+        fromChatterUserId: str,
+        toChatterUserId: str,
+        twitchChannelId: str,
+    ) -> ChatterInventoryTradeResult:
+        pass
+
     @abstractmethod
     async def update(
         self,
@@ -24,3 +39,22 @@ class ChatterInventoryRepositoryInterface(Clearable, ABC):
         twitchChannelId: str,
     ) -> ChatterInventoryData:
         pass
+
+    @abstractmethod
+    async def updateForChatters(
+        self,
+        itemType: ChatterItemType,
+        changeAmount: int,
+        chatterUserIds: Collection[str],
+        twitchChannelId: str,
+    ) -> frozendict[str, ChatterInventoryData]:
+        pass
+
+    @abstractmethod
+    async def updateMultiple(
+        self,
+        changes: dict[ChatterItemType, int],
+        chatterUserId: str,
+        twitchChannelId: str,
+    ) -> ChatterInventoryData:
+        pass
@@ -56,25 +56,27 @@ class GashaponRewardHistoryRepository(GashaponRewardHistoryRepositoryInterface):
             return rewardHistory
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT mostrecentreward FROM gashaponrewardhistory
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-                LIMIT 1
-            ''',
-            chatterUserId, twitchChannelId,
-        )
-
-        if record is not None and len(record) >= 1:
-            mostRecentReward = datetime.fromisoformat(record[0])
 
-            rewardHistory = GashaponRewardHistory(
-                mostRecentReward = mostRecentReward,
-                chatterUserId = chatterUserId,
-                twitchChannelId = twitchChannelId,
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT mostrecentreward FROM gashaponrewardhistory
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                    LIMIT 1
+                ''',
+                chatterUserId, twitchChannelId,
             )
 
-        await connection.close()
+            if record is not None and len(record) >= 1:
+                mostRecentReward = datetime.fromisoformat(record[0])
+
+                rewardHistory = GashaponRewardHistory(
+                    mostRecentReward = mostRecentReward,
+                    chatterUserId = chatterUserId,
+                    twitchChannelId = twitchChannelId,
+                )
+        finally:
+            await connection.close()
         self.__cache[f'{twitchChannelId}:{chatterUserId}'] = rewardHistory
         return rewardHistory
 
@@ -85,35 +87,36 @@ class GashaponRewardHistoryRepository(GashaponRewardHistoryRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS gashaponrewardhistory (
-                            chatteruserid text NOT NULL,
-                            mostrecentreward text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS gashaponrewardhistory (
-                            chatteruserid TEXT NOT NULL,
-                            mostrecentreward TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS gashaponrewardhistory (
+                                chatteruserid text NOT NULL,
+                                mostrecentreward text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS gashaponrewardhistory (
+                                chatteruserid TEXT NOT NULL,
+                                mostrecentreward TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def noteRewardGiven(
         self,
@@ -129,16 +132,18 @@ class GashaponRewardHistoryRepository(GashaponRewardHistoryRepositoryInterface):
         mostRecentRewardString = mostRecentReward.isoformat()
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO gashaponrewardhistory (chatteruserid, mostrecentreward, twitchchannelid)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET mostrecentreward = EXCLUDED.mostrecentreward
-            ''',
-            chatterUserId, mostRecentRewardString, twitchChannelId,
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO gashaponrewardhistory (chatteruserid, mostrecentreward, twitchchannelid)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET mostrecentreward = EXCLUDED.mostrecentreward
+                ''',
+                chatterUserId, mostRecentRewardString, twitchChannelId,
+            )
+        finally:
+            await connection.close()
 
         self.__cache[f'{twitchChannelId}:{chatterUserId}'] = GashaponRewardHistory(
             mostRecentReward = mostRecentReward,
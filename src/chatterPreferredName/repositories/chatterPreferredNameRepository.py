@@ -59,16 +59,18 @@ class ChatterPreferredNameRepository(ChatterPreferredNameRepositoryInterface):
             return self.__cache.get(f'{twitchChannelId}:{chatterUserId}', None)
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT preferredname FROM chatterpreferrednames
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-                LIMIT 1
-            ''',
-            chatterUserId, twitchChannelId,
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT preferredname FROM chatterpreferrednames
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                    LIMIT 1
+                ''',
+                chatterUserId, twitchChannelId,
+            )
+        finally:
+            await connection.close()
         preferredName: str | None = None
 
         if record is not None and len(record) >= 1:
@@ -98,35 +100,36 @@ class ChatterPreferredNameRepository(ChatterPreferredNameRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS chatterpreferrednames (
-                            chatteruserid text NOT NULL,
-                            preferredname text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS chatterpreferrednames (
-                            chatteruserid TEXT NOT NULL,
-                            preferredname TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS chatterpreferrednames (
+                                chatteruserid text NOT NULL,
+                                preferredname text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS chatterpreferrednames (
+                                chatteruserid TEXT NOT NULL,
+                                preferredname TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def remove(
         self,
@@ -149,15 +152,17 @@ class ChatterPreferredNameRepository(ChatterPreferredNameRepositoryInterface):
         self.__cache.pop(f'{twitchChannelId}:{chatterUserId}')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM chatterpreferrednames
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-            ''',
-            chatterUserId, twitchChannelId,
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM chatterpreferrednames
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                ''',
+                chatterUserId, twitchChannelId,
+            )
+        finally:
+            await connection.close()
         self.__timber.log('ChatterPreferredNameRepository', f'Removed preferred name ({preferredNameData=})')
 
         return preferredNameData
@@ -184,16 +189,18 @@ class ChatterPreferredNameRepository(ChatterPreferredNameRepositoryInterface):
             )
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO chatterpreferrednames (chatteruserid, preferredname, twitchchannelid)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET preferredname = EXCLUDED.preferredname
-            ''',
-            chatterUserId, preferredName, twitchChannelId,
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO chatterpreferrednames (chatteruserid, preferredname, twitchchannelid)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET preferredname = EXCLUDED.preferredname
+                ''',
+                chatterUserId, preferredName, twitchChannelId,
+            )
+        finally:
+            await connection.close()
 
         preferredNameData = ChatterPreferredNameData(
             chatterUserId = chatterUserId,
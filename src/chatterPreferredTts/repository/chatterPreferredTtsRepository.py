@@ -63,16 +63,18 @@ class ChatterPreferredTtsRepository(ChatterPreferredTtsRepositoryInterface):
             return self.__cache.get(f'{twitchChannelId}:{chatterUserId}', None)
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT configurationjson, provider FROM chatterpreferredtts
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-                LIMIT 1
-            ''',
-            chatterUserId, twitchChannelId,
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT configurationjson, provider FROM chatterpreferredtts
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                    LIMIT 1
+                ''',
+                chatterUserId, twitchChannelId,
+            )
+        finally:
+            await connection.close()
         configurationJsonString: str | None = None
         preferredTtsProviderString: str | None = None
 
@@ -115,37 +117,38 @@ class ChatterPreferredTtsRepository(ChatterPreferredTtsRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS chatterpreferredtts (
-                            chatteruserid text NOT NULL,
-                            configurationjson jsonb NOT NULL,
-                            provider text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS chatterpreferredtts (
-                            chatteruserid TEXT NOT NULL,
-                            configurationjson TEXT NOT NULL,
-                            provider TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS chatterpreferredtts (
+                                chatteruserid text NOT NULL,
+                                configurationjson jsonb NOT NULL,
+                                provider text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS chatterpreferredtts (
+                                chatteruserid TEXT NOT NULL,
+                                configurationjson TEXT NOT NULL,
+                                provider TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def remove(
         self,
@@ -168,15 +171,17 @@ class ChatterPreferredTtsRepository(ChatterPreferredTtsRepositoryInterface):
         self.__cache.pop(f'{twitchChannelId}:{chatterUserId}')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM chatterpreferredtts
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-            ''',
-            chatterUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM chatterpreferredtts
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                ''',
+                chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('ChatterPreferredTtsRepository', f'Removed preferred TTS ({preferredTts=})')
 
         return preferredTts
@@ -196,15 +201,17 @@ class ChatterPreferredTtsRepository(ChatterPreferredTtsRepositoryInterface):
         )
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO chatterpreferredtts (chatteruserid, configurationjson, provider, twitchchannelid)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET configurationjson = EXCLUDED.configurationjson, provider = EXCLUDED.provider
-            ''',
-            preferredTts.chatterUserId, configurationJsonString, preferredTtsProvider, preferredTts.twitchChannelId,
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO chatterpreferredtts (chatteruserid, configurationjson, provider, twitchchannelid)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET configurationjson = EXCLUDED.configurationjson, provider = EXCLUDED.provider
+                ''',
+                preferredTts.chatterUserId, configurationJsonString, preferredTtsProvider, preferredTts.twitchChannelId,
+            )
+        finally:
+            await connection.close()
         self.__cache[f'{preferredTts.twitchChannelId}:{preferredTts.chatterUserId}'] = preferredTts
         self.__timber.log('ChatterPreferredTtsRepository', f'Set preferred TTS ({preferredTts=})')
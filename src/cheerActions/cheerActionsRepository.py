@@ -1,4 +1,5 @@
 import traceback
+from datetime import timedelta
 from typing import Final
 
 from frozendict import frozendict
@@ -17,6 +18,7 @@ from .editCheerActionResult.successfullyEnabledEditCheerActionResult import Succ
 from .exceptions import CheerActionAlreadyExistsException, TooManyCheerActionsException
 from .settings.cheerActionSettingsRepositoryInterface import CheerActionSettingsRepositoryInterface
 from ..misc import utils as utils
+from ..misc.ttlCache import TtlCache
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
 from ..storage.databaseType import DatabaseType
@@ -31,6 +33,8 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         cheerActionJsonMapper: CheerActionJsonMapperInterface,
         cheerActionSettingsRepository: CheerActionSettingsRepositoryInterface,
         timber: TimberInterface,
+        cacheSize: int = 128,
+        cacheTimeToLive: timedelta = timedelta(hours = 1),
     ):
         if not isinstance(backingDatabase, BackingDatabase):
             raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
@@ -40,6 +44,12 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
             raise TypeError(f'cheerActionSettingsRepository argument is malformed: \"{cheerActionSettingsRepository}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidInt(cacheSize):
+            raise TypeError(f'cacheSize argument is malformed: \"{cacheSize}\"')
+        elif cacheSize < 1 or cacheSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'cacheSize argument is out of bounds: {cacheSize}')
+        elif not isinstance(cacheTimeToLive, timedelta):
+            raise TypeError(f'cacheTimeToLive argument is malformed: \"{cacheTimeToLive}\"')
 
         self.__backingDatabase: Final[BackingDatabase] = backingDatabase
         self.__cheerActionJsonMapper: Final[CheerActionJsonMapperInterface] = cheerActionJsonMapper
@@ -47,11 +57,15 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         self.__timber: Final[TimberInterface] = timber
 
         self.__isDatabaseReady: bool = False
-        self.__cache: Final[dict[str, frozendict[int, AbsCheerAction]]] = dict()
+        self.__cache: Final[TtlCache[frozendict[int, AbsCheerAction]]] = TtlCache(
+            maxSize = cacheSize,
+            timeToLive = cacheTimeToLive,
+        )
 
     async def clearCaches(self):
-        self.__cache.clear()
-        self.__timber.log('CheerActionsRepository', 'Caches cleared')
+        cacheStats = self.__cache.getStats()
+        await self.__cache.clearCaches()
+        self.__timber.log('CheerActionsRepository', f'Caches cleared ({cacheStats=})')
 
     async def __createCheerAction(
         self,
@@ -178,16 +192,18 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
             return None
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM cheeractions
-                WHERE bits = $1 AND twitchchannelid = $2
-            ''',
-            bits, twitchChannelId
-        )
 
-        await connection.close()
-        self.__cache.pop(twitchChannelId, None)
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM cheeractions
+                    WHERE bits = $1 AND twitchchannelid = $2
+                ''',
+                bits, twitchChannelId
+            )
+        finally:
+            await connection.close()
+        self.__cache.pop(twitchChannelId)
         self.__timber.log('CheerActionsRepository', f'Deleted cheer action ({bits=}) ({twitchChannelId=}) ({action=})')
 
         return action
@@ -251,17 +267,19 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
             return AlreadyDisabledEditCheerActionResult(action)
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                UPDATE cheeractions
-                SET isenabled = $1
-                WHERE bits = $2 AND twitchchannelid = $3
-            ''',
-            utils.boolToInt(enable), bits, twitchChannelId
-        )
 
-        await connection.close()
-        self.__cache.pop(twitchChannelId, None)
+        try:
+            await connection.execute(
+                '''
+                    UPDATE cheeractions
+                    SET isenabled = $1
+                    WHERE bits = $2 AND twitchchannelid = $3
+                ''',
+                utils.boolToInt(enable), bits, twitchChannelId
+            )
+        finally:
+            await connection.close()
+        self.__cache.pop(twitchChannelId)
 
         action = await self.getAction(
             bits = bits,
@@ -296,22 +314,78 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        cachedActions = self.__cache.get(twitchChannelId, None)
+        actions = await self.__cache.getOrLoad(
+            key = twitchChannelId,
+            loader = lambda: self.__loadActions(twitchChannelId),
+        )
 
-        if cachedActions is not None:
-            return cachedActions
+        if actions is None:
+            return frozendict()
+
+        return actions
 
+    async def __getDatabaseConnection(self) -> DatabaseConnection:
+        await self.__initDatabaseTable()
+        return await self.__backingDatabase.getConnection()
+
+    async def __initDatabaseTable(self):
+        if self.__isDatabaseReady:
+            return
+
+        self.__isDatabaseReady = True
+        connection = await self.__backingDatabase.getConnection()
+
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS cheeractions (
+                                bits integer NOT NULL,
+                                isenabled smallint DEFAULT 1 NOT NULL,
+                                actiontype text NOT NULL,
+                                configurationjson jsonb DEFAULT NULL,
+                                streamstatusrequirement text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (bits, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS cheeractions (
+                                bits INTEGER NOT NULL,
+                                isenabled INTEGER DEFAULT 1 NOT NULL,
+                                actiontype TEXT NOT NULL,
+                                configurationjson TEXT DEFAULT NULL,
+                                streamstatusrequirement TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (bits, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
+
+    async def __loadActions(self, twitchChannelId: str) -> frozendict[int, AbsCheerAction]:
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT isenabled, bits, actiontype, configurationjson, streamstatusrequirement FROM cheeractions
-                WHERE twitchchannelid = $1
-                ORDER BY bits DESC
-            ''',
-            twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT isenabled, bits, actiontype, configurationjson, streamstatusrequirement FROM cheeractions
+                    WHERE twitchchannelid = $1
+                    ORDER BY bits DESC
+                ''',
+                twitchChannelId
+            )
+        finally:
+            await connection.close()
         actions: dict[int, AbsCheerAction] = dict()
 
         if records is not None and len(records) >= 1:
@@ -333,56 +407,7 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
 
                 actions[bits] = cheerAction
 
-        frozenActions: frozendict[int, AbsCheerAction] = frozendict(actions)
-        self.__cache[twitchChannelId] = frozenActions
-        return frozenActions
-
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS cheeractions (
-                            bits integer NOT NULL,
-                            isenabled smallint DEFAULT 1 NOT NULL,
-                            actiontype text NOT NULL,
-                            configurationjson jsonb DEFAULT NULL,
-                            streamstatusrequirement text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (bits, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS cheeractions (
-                            bits INTEGER NOT NULL,
-                            isenabled INTEGER DEFAULT 1 NOT NULL,
-                            actiontype TEXT NOT NULL,
-                            configurationjson TEXT DEFAULT NULL,
-                            streamstatusrequirement TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (bits, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        return frozendict(actions)
 
     async def setAction(self, action: AbsCheerAction):
         if not isinstance(action, AbsCheerAction):
@@ -408,14 +433,16 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         streamStatusRequirementString = await self.__cheerActionJsonMapper.serializeCheerActionStreamStatusRequirement(action.streamStatusRequirement)
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO cheeractions (bits, isenabled, actiontype, configurationjson, streamstatusrequirement, twitchchannelid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-            ''',
-            action.bits, isEnabled, actionTypeString, configurationJson, streamStatusRequirementString, action.twitchChannelId
-        )
 
-        await connection.close()
-        self.__cache.pop(action.twitchChannelId, None)
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO cheeractions (bits, isenabled, actiontype, configurationjson, streamstatusrequirement, twitchchannelid)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                ''',
+                action.bits, isEnabled, actionTypeString, configurationJson, streamStatusRequirementString, action.twitchChannelId
+            )
+        finally:
+            await connection.close()
+        self.__cache.pop(action.twitchChannelId)
         self.__timber.log('CheerActionsRepository', f'Added new cheer action ({action=})')
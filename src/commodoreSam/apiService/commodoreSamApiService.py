@@ -1,22 +1,21 @@
-import asyncio
 import os
 import re
 import uuid
-from asyncio import AbstractEventLoop, CancelledError as AsyncioCancelledError
-from asyncio import TimeoutError as AsyncioTimeoutError
-from asyncio.subprocess import Process
+from asyncio import AbstractEventLoop
 from dataclasses import dataclass
-from typing import ByteString, Final, Pattern
+from typing import Final, Pattern
 
 import aiofiles
 import aiofiles.os
 import aiofiles.ospath
-import psutil
+from frozenlist import FrozenList
 
 from .commodoreSamApiServiceInterface import CommodoreSamApiServiceInterface
 from ..exceptions import CommodoreSamExecutableIsMissingException, CommodoreSamFailedToGenerateSpeechFileException
 from ..settings.commodoreSamSettingsRepositoryInterface import CommodoreSamSettingsRepositoryInterface
 from ...misc import utils as utils
+from ...misc.localProcessPool.localProcessPoolInterface import LocalProcessPoolInterface
+from ...misc.localProcessPool.localProcessResult import LocalProcessResult
 from ...timber.timberInterface import TimberInterface
 from ...tts.directoryProvider.ttsDirectoryProviderInterface import TtsDirectoryProviderInterface
 from ...tts.models.ttsProvider import TtsProvider
@@ -30,7 +29,7 @@ class CommodoreSamApiService(CommodoreSamApiServiceInterface):
         pitch: int | None
         speed: int | None
         throat: int | None
-        fullArgumentString: str
+        arguments: FrozenList[str]
 
     @dataclass(frozen = True)
     class FilePaths:
@@ -43,26 +42,42 @@ class CommodoreSamApiService(CommodoreSamApiServiceInterface):
         self,
         eventLoop: AbstractEventLoop,
         commodoreSamSettingsRepository: CommodoreSamSettingsRepositoryInterface,
+        localProcessPool: LocalProcessPoolInterface,
         timber: TimberInterface,
         ttsDirectoryProvider: TtsDirectoryProviderInterface,
         fileExtension: str = 'wav',
+        maxAttempts: int = 2,
+        timeoutSeconds: float = 3,
     ):
         if not isinstance(eventLoop, AbstractEventLoop):
             raise TypeError(f'eventLoop argument is malformed: \"{eventLoop}\"')
         elif not isinstance(commodoreSamSettingsRepository, CommodoreSamSettingsRepositoryInterface):
             raise TypeError(f'commodoreSamSettingsRepository argument is malformed: \"{commodoreSamSettingsRepository}\"')
+        elif not isinstance(localProcessPool, LocalProcessPoolInterface):
+            raise TypeError(f'localProcessPool argument is malformed: \"{localProcessPool}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(ttsDirectoryProvider, TtsDirectoryProviderInterface):
             raise TypeError(f'ttsDirectoryProvider argument is malformed: \"{ttsDirectoryProvider}\"')
         elif not utils.isValidStr(fileExtension):
             raise TypeError(f'fileExtension argument is malformed: \"{fileExtension}\"')
+        elif not utils.isValidInt(maxAttempts):
+            raise TypeError(f'maxAttempts argument is malformed: \"{maxAttempts}\"')
+        elif maxAttempts < 1 or maxAttempts > 8:
+            raise ValueError(f'maxAttempts argument is out of bounds: {maxAttempts}')
+        elif not utils.isValidNum(timeoutSeconds):
+            raise TypeError(f'timeoutSeconds argument is malformed: \"{timeoutSeconds}\"')
+        elif timeoutSeconds < 0.25 or timeoutSeconds > 300:
+            raise ValueError(f'timeoutSeconds argument is out of bounds: {timeoutSeconds}')
 
         self.__eventLoop: Final[AbstractEventLoop] = eventLoop
         self.__commodoreSamSettingsRepository: Final[CommodoreSamSettingsRepositoryInterface] = commodoreSamSettingsRepository
+        self.__localProcessPool: Final[LocalProcessPoolInterface] = localProcessPool
         self.__timber: Final[TimberInterface] = timber
         self.__ttsDirectoryProvider: Final[TtsDirectoryProviderInterface] = ttsDirectoryProvider
         self.__fileExtension: Final[str] = fileExtension
+        self.__maxAttempts: Final[int] = maxAttempts
+        self.__timeoutSeconds: Final[float] = timeoutSeconds
 
         self.__fileNameRegEx: Final[Pattern] = re.compile(r'[^a-z0-9]', re.IGNORECASE)
 
@@ -86,26 +101,28 @@ class CommodoreSamApiService(CommodoreSamApiServiceInterface):
         speed = await self.__commodoreSamSettingsRepository.getSpeedParameter()
         throat = await self.__commodoreSamSettingsRepository.getThroatParameter()
 
-        fullArgumentString = ''
+        arguments: FrozenList[str] = FrozenList()
 
         if mouth is not None:
-            fullArgumentString = fullArgumentString + f'-mouth {mouth} '
+            arguments.extend([ '-mouth', str(mouth) ])
 
         if pitch is not None:
-            fullArgumentString = fullArgumentString + f'-pitch {pitch} '
+            arguments.extend([ '-pitch', str(pitch) ])
 
         if speed is not None:
-            fullArgumentString = fullArgumentString + f'-speed {speed} '
+            arguments.extend([ '-speed', str(speed) ])
 
         if throat is not None:
-            fullArgumentString = fullArgumentString + f'-throat {throat} '
+            arguments.extend([ '-throat', str(throat) ])
+
+        arguments.freeze()
 
         return CommodoreSamApiService.CommodoreSamArguments(
             mouth = mouth,
             pitch = pitch,
             speed = speed,
             throat = throat,
-            fullArgumentString = fullArgumentString.strip(),
+            arguments = arguments,
         )
 
     async def __generateFilePaths(self) -> FilePaths:
@@ -141,64 +158,33 @@ class CommodoreSamApiService(CommodoreSamApiServiceInterface):
             raise CommodoreSamExecutableIsMissingException(f'Couldn\'t find Commodore SAM executable ({filePaths=})')
 
         commodoreSamArguments = await self.__fetchCommodoreSamArguments()
-        command = f'{filePaths.commodoreSamPath} -wav \"{filePaths.fullFilePath}\" {commodoreSamArguments.fullArgumentString} {text}'
 
-        commodoreSamProcess: Process | None = None
-        outputTuple: tuple[ByteString, ByteString] | None = None
-        exception: BaseException | None = None
+        # Commodore SAM reads every trailing argument as one more word to speak, so each
+        # word of the message is handed over as its own argument
+        arguments: list[str] = [ filePaths.commodoreSamPath, '-wav', filePaths.fullFilePath ]
+        arguments.extend(commodoreSamArguments.arguments)
+        arguments.extend(text.split())
 
-        try:
-            commodoreSamProcess = await asyncio.create_subprocess_shell(
-                cmd = command,
-                stdout = asyncio.subprocess.PIPE,
-                stderr = asyncio.subprocess.PIPE,
-            )
+        result: LocalProcessResult | None = None
+        exception: Exception | None = None
 
-            outputTuple = await asyncio.wait_for(
-                fut = commodoreSamProcess.communicate(),
-                timeout = 3,
+        try:
+            result = await self.__localProcessPool.run(
+                arguments = arguments,
+                engineName = 'CommodoreSam',
+                maxAttempts = self.__maxAttempts,
+                timeoutSeconds = self.__timeoutSeconds,
             )
-        except BaseException as e:
+        except Exception as e:
             exception = e
 
-        outputString: str | None = None
-
-        if outputTuple is not None and len(outputTuple) >= 2:
-            outputString = outputTuple[1].decode('utf-8').strip()
-
         textLength = len(text)
-        commandLength = len(command)
-
-        self.__timber.log('CommodoreSamApiService', f'Ran Commodore SAM system command ({textLength=}) ({commandLength=}) ({command=}) ({outputString=}) ({exception=})')
-
-        if isinstance(exception, AsyncioTimeoutError) or isinstance(exception, AsyncioCancelledError) or isinstance(exception, TimeoutError):
-            await self.__killCommodoreSamProcess(commodoreSamProcess)
+        self.__timber.log('CommodoreSamApiService', f'Ran Commodore SAM ({textLength=}) ({arguments=}) ({result=}) ({exception=})')
 
         if not await aiofiles.ospath.isfile(
             path = filePaths.fullFilePath,
             loop = self.__eventLoop,
         ):
-            raise CommodoreSamFailedToGenerateSpeechFileException(f'Failed to generate speech file ({filePaths=}) ({command=}) ({outputString=}) ({exception=})')
+            raise CommodoreSamFailedToGenerateSpeechFileException(f'Failed to generate speech file ({filePaths=}) ({arguments=}) ({result=}) ({exception=})')
 
         return filePaths.fullFilePath
-
-    async def __killCommodoreSamProcess(self, commodoreSamProcess: Process | None):
-        if commodoreSamProcess is None:
-            self.__timber.log('CommodoreSamApiService', f'Went to kill the Commodore SAM process, but the process is None ({commodoreSamProcess=})')
-            return
-        elif not isinstance(commodoreSamProcess, Process):
-            raise TypeError(f'process argument is malformed: \"{commodoreSamProcess}\"')
-        elif commodoreSamProcess.returncode is not None:
-            self.__timber.log('CommodoreSamApiService', f'Went to kill a Commodore SAM process, but the process has a return code ({commodoreSamProcess=}) ({commodoreSamProcess.returncode=})')
-            return
-
-        self.__timber.log('CommodoreSamApiService', f'Killing Commodore SAM process ({commodoreSamProcess=}) ({commodoreSamProcess.returncode=})...')
-        parent = psutil.Process(commodoreSamProcess.pid)
-        childCount = 0
-
-        for child in parent.children(recursive = True):
-            child.terminate()
-            childCount += 1
-
-        parent.terminate()
-        self.__timber.log('CommodoreSamApiService', f'Finished killing Commodore SAM process ({commodoreSamProcess=}) ({commodoreSamProcess.returncode=}) ({childCount=})')
@@ -1,14 +1,19 @@
+import os
 import traceback
-from datetime import datetime
+from typing import Final
+
+import aiofiles.os
 
 from .commodoreSamHelperInterface import CommodoreSamHelperInterface
 from ..apiService.commodoreSamApiService import CommodoreSamApiServiceInterface
 from ..exceptions import CommodoreSamFailedToGenerateSpeechFileException, CommodoreSamExecutableIsMissingException
 from ..models.commodoreSamFileReference import CommodoreSamFileReference
 from ..settings.commodoreSamSettingsRepositoryInterface import CommodoreSamSettingsRepositoryInterface
-from ...location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from ...glacialTtsStorage.fileRetriever.glacialTtsFileRetrieverInterface import GlacialTtsFileRetrieverInterface
+from ...glacialTtsStorage.models.glacialTtsFileReference import GlacialTtsFileReference
 from ...misc import utils as utils
 from ...timber.timberInterface import TimberInterface
+from ...tts.models.ttsProvider import TtsProvider
 
 
 class CommodoreSamHelper(CommodoreSamHelperInterface):
@@ -17,22 +22,26 @@ class CommodoreSamHelper(CommodoreSamHelperInterface):
         self,
         commodoreSamApiService: CommodoreSamApiServiceInterface,
         commodoreSamSettingsRepository: CommodoreSamSettingsRepositoryInterface,
+        glacialTtsFileRetriever: GlacialTtsFileRetrieverInterface,
         timber: TimberInterface,
-        timeZoneRepository: TimeZoneRepositoryInterface
+        fileExtension: str = 'wav'
     ):
         if not isinstance(commodoreSamApiService, CommodoreSamApiServiceInterface):
             raise TypeError(f'commodoreSamApiService argument is malformed: \"{commodoreSamApiService}\"')
         elif not isinstance(commodoreSamSettingsRepository, CommodoreSamSettingsRepositoryInterface):
             raise TypeError(f'commodoreSamSettingsRepository argument is malformed: \"{commodoreSamSettingsRepository}\"')
+        elif not isinstance(glacialTtsFileRetriever, GlacialTtsFileRetrieverInterface):
+            raise TypeError(f'glacialTtsFileRetriever argument is malformed: \"{glacialTtsFileRetriever}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
-        elif not isinstance(timeZoneRepository, TimeZoneRepositoryInterface):
-            raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
+        elif not utils.isValidStr(fileExtension):
+            raise TypeError(f'fileExtension argument is malformed: \"{fileExtension}\"')
 
-        self.__commodoreSamApiService: CommodoreSamApiServiceInterface = commodoreSamApiService
-        self.__commodoreSamSettingsRepository: CommodoreSamSettingsRepositoryInterface = commodoreSamSettingsRepository
-        self.__timber: TimberInterface = timber
-        self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
+        self.__commodoreSamApiService: Final[CommodoreSamApiServiceInterface] = commodoreSamApiService
+        self.__commodoreSamSettingsRepository: Final[CommodoreSamSettingsRepositoryInterface] = commodoreSamSettingsRepository
+        self.__glacialTtsFileRetriever: Final[GlacialTtsFileRetrieverInterface] = glacialTtsFileRetriever
+        self.__timber: Final[TimberInterface] = timber
+        self.__fileExtension: Final[str] = fileExtension
 
     async def __createFullMessage(
         self,
@@ -50,6 +59,44 @@ class CommodoreSamHelper(CommodoreSamHelperInterface):
         else:
             return None
 
+    async def __createSpeechFile(
+        self,
+        glacialFile: GlacialTtsFileReference,
+        fullMessage: str
+    ) -> bool:
+        try:
+            speechFile = await self.__commodoreSamApiService.generateSpeechFile(
+                text = fullMessage
+            )
+        except CommodoreSamExecutableIsMissingException as e:
+            self.__timber.log('CommodoreSamHelper', f'Encountered executable file is missing exception when generating speech ({fullMessage=}): {e}', e, traceback.format_exc())
+            return False
+        except CommodoreSamFailedToGenerateSpeechFileException as e:
+            self.__timber.log('CommodoreSamHelper', f'Encountered failure to create speech file exception when generating speech ({fullMessage=}): {e}', e, traceback.format_exc())
+            return False
+
+        try:
+            await aiofiles.os.makedirs(
+                name = os.path.dirname(glacialFile.filePath),
+                exist_ok = True
+            )
+
+            await aiofiles.os.replace(speechFile, glacialFile.filePath)
+        except Exception as e:
+            self.__timber.log('CommodoreSamHelper', f'Encountered exception when trying to move Commodore SAM speech file into glacial storage ({speechFile=}) ({glacialFile=}): {e}', e, traceback.format_exc())
+            return False
+
+        return True
+
+    async def __createVoiceKey(self) -> str:
+        # SAM doesn't have named voices, so the engine parameters themselves are what make
+        # one rendition of a message sound different from another
+        mouth = await self.__commodoreSamSettingsRepository.getMouthParameter()
+        pitch = await self.__commodoreSamSettingsRepository.getPitchParameter()
+        speed = await self.__commodoreSamSettingsRepository.getSpeedParameter()
+        throat = await self.__commodoreSamSettingsRepository.getThroatParameter()
+        return f'mouth={mouth},pitch={pitch},speed={speed},throat={throat}'
+
     async def generateTts(
         self,
         donationPrefix: str | None,
@@ -77,20 +124,21 @@ class CommodoreSamHelper(CommodoreSamHelperInterface):
         if not utils.isValidStr(fullMessage):
             return None
 
-        try:
-            speechFile = await self.__commodoreSamApiService.generateSpeechFile(
-                text = fullMessage
+        glacialFile = await self.__glacialTtsFileRetriever.findOrCreateFile(
+            fileExtension = self.__fileExtension,
+            message = fullMessage,
+            voice = await self.__createVoiceKey(),
+            provider = TtsProvider.COMMODORE_SAM,
+            createFile = lambda glacialFile: self.__createSpeechFile(
+                glacialFile = glacialFile,
+                fullMessage = fullMessage
             )
-        except CommodoreSamExecutableIsMissingException as e:
-            self.__timber.log('CommodoreSamHelper', f'Encountered executable file is missing exception when generating speech ({fullMessage=}): {e}', e, traceback.format_exc())
-            return None
-        except CommodoreSamFailedToGenerateSpeechFileException as e:
-            self.__timber.log('CommodoreSamHelper', f'Encountered failure to create speech file exception when generating speech ({fullMessage=}): {e}', e, traceback.format_exc())
-            return None
+        )
 
-        storeDateTime = datetime.now(self.__timeZoneRepository.getDefault())
+        if glacialFile is None:
+            return None
 
         return CommodoreSamFileReference(
-            storeDateTime = storeDateTime,
-            filePath = speechFile
+            storeDateTime = glacialFile.storeDateTime,
+            filePath = glacialFile.filePath
         )
@@ -0,0 +1,152 @@
+from collections import deque
+from typing import Collection, Final
+
+from .absBannedWord import AbsBannedWord
+from .bannedPhrase import BannedPhrase
+from .bannedWord import BannedWord
+
+
+class BannedWordsMatcher:
+
+    # The root node of the phrase automaton is always at index 0.
+    ROOT_NODE: Final[int] = 0
+
+    def __init__(self, bannedWords: Collection[AbsBannedWord]):
+        if not isinstance(bannedWords, Collection):
+            raise TypeError(f'bannedWords argument is malformed: \"{bannedWords}\"')
+
+        exactWords: dict[str, BannedWord] = dict()
+
+        # These three lists make up an Aho-Corasick automaton over every banned phrase. Each
+        # node is an index into all three: its outgoing edges, its failure link, and the
+        # banned phrase (if any) that has been fully matched once the scan reaches that node.
+        self.__transitions: Final[list[dict[str, int]]] = [ dict() ]
+        self.__failures: Final[list[int]] = [ BannedWordsMatcher.ROOT_NODE ]
+        self.__outputs: Final[list[BannedPhrase | None]] = [ None ]
+
+        phraseCount = 0
+
+        for bannedWord in bannedWords:
+            if isinstance(bannedWord, BannedWord):
+                exactWords[bannedWord.word.casefold()] = bannedWord
+            elif isinstance(bannedWord, BannedPhrase):
+                self.__insertPhrase(bannedWord)
+                phraseCount = phraseCount + 1
+            else:
+                raise RuntimeError(f'unknown BannedWordType ({bannedWord=})')
+
+        self.__buildFailureLinks()
+
+        self.__exactWords: Final[dict[str, BannedWord]] = exactWords
+        self.__phraseCount: Final[int] = phraseCount
+
+    def __buildFailureLinks(self):
+        queue: deque[int] = deque()
+
+        for childNode in self.__transitions[BannedWordsMatcher.ROOT_NODE].values():
+            self.__failures[childNode] = BannedWordsMatcher.ROOT_NODE
+            queue.append(childNode)
+
+        while len(queue) >= 1:
+            node = queue.popleft()
+
+            for character, childNode in self.__transitions[node].items():
+                failure = self.__failures[node]
+
+                while failure != BannedWordsMatcher.ROOT_NODE and character not in self.__transitions[failure]:
+                    failure = self.__failures[failure]
+
+                failure = self.__transitions[failure].get(character, BannedWordsMatcher.ROOT_NODE)
+                self.__failures[childNode] = failure
+
+                # A node also matches anything its failure link matches (a suffix of this node's
+                # path), so fold that in now rather than walking the chain at scan time.
+                if self.__outputs[childNode] is None:
+                    self.__outputs[childNode] = self.__outputs[failure]
+
+                queue.append(childNode)
+
+    @property
+    def exactWordCount(self) -> int:
+        return len(self.__exactWords)
+
+    def findBannedContent(
+        self,
+        phrases: Collection[str],
+        words: Collection[str]
+    ) -> AbsBannedWord | None:
+        bannedWord = self.findBannedWord(words)
+
+        if bannedWord is not None:
+            return bannedWord
+
+        for phrase in phrases:
+            bannedPhrase = self.findBannedPhrase(phrase)
+
+            if bannedPhrase is not None:
+                return bannedPhrase
+
+        return None
+
+    def findBannedPhrase(self, phrase: str) -> BannedPhrase | None:
+        if not isinstance(phrase, str):
+            raise TypeError(f'phrase argument is malformed: \"{phrase}\"')
+
+        if self.__phraseCount == 0:
+            return None
+
+        transitions = self.__transitions
+        failures = self.__failures
+        outputs = self.__outputs
+        node = BannedWordsMatcher.ROOT_NODE
+
+        for character in phrase:
+            while node != BannedWordsMatcher.ROOT_NODE and character not in transitions[node]:
+                node = failures[node]
+
+            node = transitions[node].get(character, BannedWordsMatcher.ROOT_NODE)
+            output = outputs[node]
+
+            if output is not None:
+                return output
+
+        return None
+
+    def findBannedWord(self, words: Collection[str]) -> BannedWord | None:
+        if not isinstance(words, Collection):
+            raise TypeError(f'words argument is malformed: \"{words}\"')
+
+        exactWords = self.__exactWords
+
+        if len(exactWords) == 0:
+            return None
+
+        for word in words:
+            bannedWord = exactWords.get(word, None)
+
+            if bannedWord is not None:
+                return bannedWord
+
+        return None
+
+    def __insertPhrase(self, bannedPhrase: BannedPhrase):
+        node = BannedWordsMatcher.ROOT_NODE
+
+        for character in bannedPhrase.phrase.casefold():
+            childNode = self.__transitions[node].get(character, None)
+
+            if childNode is None:
+                childNode = len(self.__transitions)
+                self.__transitions.append(dict())
+                self.__failures.append(BannedWordsMatcher.ROOT_NODE)
+                self.__outputs.append(None)
+                self.__transitions[node][character] = childNode
+
+            node = childNode
+
+        if self.__outputs[node] is None:
+            self.__outputs[node] = bannedPhrase
+
+    @property
+    def phraseCount(self) -> int:
+        return self.__phraseCount
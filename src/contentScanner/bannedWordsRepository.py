@@ -5,6 +5,7 @@ from typing import Pattern
 from .absBannedWord import AbsBannedWord
 from .bannedPhrase import BannedPhrase
 from .bannedWord import BannedWord
+from .bannedWordsMatcher import BannedWordsMatcher
 from .bannedWordsRepositoryInterface import BannedWordsRepositoryInterface
 from ..misc import utils as utils
 from ..storage.linesReaderInterface import LinesReaderInterface
@@ -28,11 +29,27 @@ class BannedWordsRepository(BannedWordsRepositoryInterface):
 
         self.__exactWordRegEx: Pattern = re.compile(r'^\"(.+)\"$', re.IGNORECASE)
         self.__cache: frozenset[AbsBannedWord] | None = None
+        self.__matcherCache: BannedWordsMatcher | None = None
 
     async def clearCaches(self):
         self.__cache = None
+        self.__matcherCache = None
         self.__timber.log('BannedWordsRepository', 'Caches cleared')
 
+        # Recompile right away so that the next scan doesn't have to pay for it. If the banned
+        # words file can't be read right now, then the next scan will just try again.
+        try:
+            await self.getBannedWordsMatcherAsync()
+        except FileNotFoundError:
+            pass
+
+    def __compileMatcher(self, bannedWords: frozenset[AbsBannedWord]) -> BannedWordsMatcher:
+        matcher = BannedWordsMatcher(bannedWords)
+        self.__matcherCache = matcher
+        self.__timber.log('BannedWordsRepository', f'Compiled banned words matcher ({matcher.exactWordCount=}) ({matcher.phraseCount=})')
+
+        return matcher
+
     def __createCleanedBannedWordsSetFromLines(
         self,
         lines: list[str] | None
@@ -97,6 +114,20 @@ class BannedWordsRepository(BannedWordsRepositoryInterface):
 
         return bannedWords
 
+    def getBannedWordsMatcher(self) -> BannedWordsMatcher:
+        matcher = self.__matcherCache
+        if matcher is not None:
+            return matcher
+
+        return self.__compileMatcher(self.getBannedWords())
+
+    async def getBannedWordsMatcherAsync(self) -> BannedWordsMatcher:
+        matcher = self.__matcherCache
+        if matcher is not None:
+            return matcher
+
+        return self.__compileMatcher(await self.getBannedWordsAsync())
+
     def __processLine(self, line: str | None) -> AbsBannedWord | None:
         if line is not None and not isinstance(line, str):
             raise TypeError(f'line argument is malformed: \"{line}\"')
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from .absBannedWord import AbsBannedWord
+from .bannedWordsMatcher import BannedWordsMatcher
 from ..misc.clearable import Clearable
 
 
@@ -13,3 +14,11 @@ class BannedWordsRepositoryInterface(Clearable, ABC):
     @abstractmethod
     async def getBannedWordsAsync(self) -> frozenset[AbsBannedWord]:
         pass
+
+    @abstractmethod
+    def getBannedWordsMatcher(self) -> BannedWordsMatcher:
+        pass
+
+    @abstractmethod
+    async def getBannedWordsMatcherAsync(self) -> BannedWordsMatcher:
+        pass
@@ -1,8 +1,9 @@
 import re
-from typing import Pattern
+from typing import Collection, Pattern
 
-from .bannedPhrase import BannedPhrase
-from .bannedWord import BannedWord
+from frozenlist import FrozenList
+
+from .bannedWordsMatcher import BannedWordsMatcher
 from .bannedWordsRepositoryInterface import BannedWordsRepositoryInterface
 from .contentCode import ContentCode
 from .contentScannerInterface import ContentScannerInterface
@@ -29,10 +30,37 @@ class ContentScanner(ContentScannerInterface):
         self.__wordRegEx: Pattern = re.compile(r'\w', re.IGNORECASE)
 
     async def scan(self, message: str | None) -> ContentCode:
+        if message is not None and not isinstance(message, str):
+            raise TypeError(f'string argument is malformed: \"{message}\"')
+
+        matcher = await self.__bannedWordsRepository.getBannedWordsMatcherAsync()
+        return await self.__scanMessage(matcher, message)
+
+    async def scanMany(self, messages: Collection[str | None]) -> FrozenList[ContentCode]:
+        if not isinstance(messages, Collection):
+            raise TypeError(f'messages argument is malformed: \"{messages}\"')
+
+        for message in messages:
+            if message is not None and not isinstance(message, str):
+                raise TypeError(f'messages argument contains a malformed message: \"{message}\"')
+
+        # fetch the compiled matcher once for the whole batch
+        matcher = await self.__bannedWordsRepository.getBannedWordsMatcherAsync()
+        contentCodes: FrozenList[ContentCode] = FrozenList()
+
+        for message in messages:
+            contentCodes.append(await self.__scanMessage(matcher, message))
+
+        contentCodes.freeze()
+        return contentCodes
+
+    async def __scanMessage(
+        self,
+        matcher: BannedWordsMatcher,
+        message: str | None
+    ) -> ContentCode:
         if message is None:
             return ContentCode.IS_NONE
-        elif not isinstance(message, str):
-            raise TypeError(f'string argument is malformed: \"{message}\"')
         elif len(message) == 0:
             return ContentCode.IS_EMPTY
         elif message.isspace():
@@ -48,40 +76,11 @@ class ContentScanner(ContentScannerInterface):
         words: set[str] = set()
         await self.updateWordsContent(words, message)
 
-        phrasesAndWordsContentCode = await self.__scanPhrasesAndWords(phrases, words)
-        if phrasesAndWordsContentCode is not ContentCode.OK:
-            return phrasesAndWordsContentCode
-
-        return ContentCode.OK
-
-    async def __scanPhrasesAndWords(
-        self,
-        phrases: set[str],
-        words: set[str]
-    ) -> ContentCode:
-        if not isinstance(phrases, set):
-            raise TypeError(f'phrases argument is malformed: \"{phrases}\"')
-        elif not isinstance(words, set):
-            raise TypeError(f'words argument is malformed: \"{words}\"')
-
-        absBannedWords = await self.__bannedWordsRepository.getBannedWordsAsync()
-
-        for absBannedWord in absBannedWords:
-            if isinstance(absBannedWord, BannedWord):
-                bannedWord: BannedWord = absBannedWord
-
-                if bannedWord.word in words:
-                    self.__timber.log('ContentScanner', f'Content contains a banned word ({bannedWord=}) ({phrases=}) ({words=})')
-                    return ContentCode.CONTAINS_BANNED_CONTENT
-            elif isinstance(absBannedWord, BannedPhrase):
-                bannedPhrase: BannedPhrase = absBannedWord
+        bannedContent = matcher.findBannedContent(phrases, words)
 
-                for phrase in phrases:
-                    if bannedPhrase.phrase in phrase:
-                        self.__timber.log('ContentScanner', f'Content contains a banned phrase ({bannedPhrase=}) ({phrases=}) ({words=})')
-                        return ContentCode.CONTAINS_BANNED_CONTENT
-            else:
-                raise RuntimeError(f'unknown BannedWordType ({absBannedWord=})')
+        if bannedContent is not None:
+            self.__timber.log('ContentScanner', f'Content contains banned content ({bannedContent=}) ({phrases=}) ({words=})')
+            return ContentCode.CONTAINS_BANNED_CONTENT
 
         return ContentCode.OK
 
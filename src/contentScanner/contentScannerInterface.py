@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Collection
+
+from frozenlist import FrozenList
 
 from .contentCode import ContentCode
 
@@ -9,6 +12,10 @@ class ContentScannerInterface(ABC):
     async def scan(self, message: str | None) -> ContentCode:
         pass
 
+    @abstractmethod
+    async def scanMany(self, messages: Collection[str | None]) -> FrozenList[ContentCode]:
+        pass
+
     @abstractmethod
     async def updatePhrasesContent(
         self,
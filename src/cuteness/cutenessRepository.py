@@ -75,17 +75,19 @@ class CutenessRepository(CutenessRepositoryInterface):
         cutenessDate = CutenessDate()
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
-                INNER JOIN userids ON cuteness.userid = userids.userid
-                WHERE cuteness.twitchchannelid = $1 AND cuteness.userid = $2 AND cuteness.utcyearandmonth = $3
-                LIMIT 1
-            ''',
-            twitchChannelId, userId, cutenessDate.getDatabaseString()
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
+                    INNER JOIN userids ON cuteness.userid = userids.userid
+                    WHERE cuteness.twitchchannelid = $1 AND cuteness.userid = $2 AND cuteness.utcyearandmonth = $3
+                    LIMIT 1
+                ''',
+                twitchChannelId, userId, cutenessDate.getDatabaseString()
+            )
+        finally:
+            await connection.close()
 
         if record is None or len(record) == 0:
             return CutenessResult(
@@ -113,19 +115,21 @@ class CutenessRepository(CutenessRepositoryInterface):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cuteness.userid, userids.username, SUM(cuteness.cuteness) AS totalcuteness FROM cuteness
-                INNER JOIN userids ON cuteness.userid = userids.userid
-                WHERE cuteness.twitchchannelid = $1 AND cuteness.userid != $2
-                GROUP BY cuteness.userid, userids.username
-                ORDER BY totalcuteness DESC
-                LIMIT $3
-            ''',
-            twitchChannelId, twitchChannelId, self.__leaderboardSize
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT cuteness.userid, userids.username, SUM(cuteness.cuteness) AS totalcuteness FROM cuteness
+                    INNER JOIN userids ON cuteness.userid = userids.userid
+                    WHERE cuteness.twitchchannelid = $1 AND cuteness.userid != $2
+                    GROUP BY cuteness.userid, userids.username
+                    ORDER BY totalcuteness DESC
+                    LIMIT $3
+                ''',
+                twitchChannelId, twitchChannelId, self.__leaderboardSize
+            )
+        finally:
+            await connection.close()
 
         if records is None or len(records) == 0:
             return CutenessChampionsResult(
@@ -175,76 +179,77 @@ class CutenessRepository(CutenessRepositoryInterface):
         await self.__userIdsRepository.setUser(userId = userId, userName = userName)
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cuteness, utcyearandmonth FROM cuteness
-                WHERE twitchchannelid = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
-                ORDER BY utcyearandmonth DESC
-                LIMIT $3
-            ''',
-            twitchChannelId, userId, self.__historySize
-        )
 
-        if records is None or len(records) == 0:
-            await connection.close()
-            return CutenessHistoryResult(
-                userId = userId,
-                userName = userName
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT cuteness, utcyearandmonth FROM cuteness
+                    WHERE twitchchannelid = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
+                    ORDER BY utcyearandmonth DESC
+                    LIMIT $3
+                ''',
+                twitchChannelId, userId, self.__historySize
             )
 
-        entries: list[CutenessHistoryEntry] = list()
-
-        for record in records:
-            entries.append(CutenessHistoryEntry(
-                cutenessDate = CutenessDate(record[1]),
-                cuteness = record[0],
-                userId = userId,
-                userName = userName
-            ))
+            if records is None or len(records) == 0:
+                return CutenessHistoryResult(
+                    userId = userId,
+                    userName = userName
+                )
 
-        # sort entries into newest to oldest order
-        entries.sort(key = lambda entry: entry.cutenessDate, reverse = True)
+            entries: list[CutenessHistoryEntry] = list()
 
-        frozenEntries: FrozenList[CutenessHistoryEntry] = FrozenList(entries)
-        frozenEntries.freeze()
+            for record in records:
+                entries.append(CutenessHistoryEntry(
+                    cutenessDate = CutenessDate(record[1]),
+                    cuteness = record[0],
+                    userId = userId,
+                    userName = userName
+                ))
 
-        record = await connection.fetchRow(
-            '''
-                SELECT SUM(cuteness) FROM cuteness
-                WHERE twitchchannelid = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
-                LIMIT 1
-            ''',
-            twitchChannelId, userId
-        )
+            # sort entries into newest to oldest order
+            entries.sort(key = lambda entry: entry.cutenessDate, reverse = True)
 
-        totalCuteness = 0
+            frozenEntries: FrozenList[CutenessHistoryEntry] = FrozenList(entries)
+            frozenEntries.freeze()
 
-        if record is not None and len(record) >= 1:
-            # this should be impossible at this point, but let's just be safe
-            totalCuteness = int(round(record[0]))
+            record = await connection.fetchRow(
+                '''
+                    SELECT SUM(cuteness) FROM cuteness
+                    WHERE twitchchannelid = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
+                    LIMIT 1
+                ''',
+                twitchChannelId, userId
+            )
 
-        record = await connection.fetchRow(
-            '''
-                SELECT cuteness, utcyearandmonth FROM cuteness
-                WHERE twitchchannelid = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
-                ORDER BY cuteness DESC
-                LIMIT 1
-            ''',
-            twitchChannelId, userId
-        )
+            totalCuteness = 0
 
-        bestCuteness: CutenessHistoryEntry | None = None
+            if record is not None and len(record) >= 1:
+                # this should be impossible at this point, but let's just be safe
+                totalCuteness = int(round(record[0]))
 
-        if record is not None and len(record) >= 1:
-            # again, this should be impossible here, but let's just be safe
-            bestCuteness = CutenessHistoryEntry(
-                cutenessDate = CutenessDate(record[1]),
-                cuteness = record[0],
-                userId = userId,
-                userName = userName
+            record = await connection.fetchRow(
+                '''
+                    SELECT cuteness, utcyearandmonth FROM cuteness
+                    WHERE twitchchannelid = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
+                    ORDER BY cuteness DESC
+                    LIMIT 1
+                ''',
+                twitchChannelId, userId
             )
 
-        await connection.close()
+            bestCuteness: CutenessHistoryEntry | None = None
+
+            if record is not None and len(record) >= 1:
+                # again, this should be impossible here, but let's just be safe
+                bestCuteness = CutenessHistoryEntry(
+                    cutenessDate = CutenessDate(record[1]),
+                    cuteness = record[0],
+                    userId = userId,
+                    userName = userName
+                )
+        finally:
+            await connection.close()
 
         return CutenessHistoryResult(
             userId = userId,
@@ -280,37 +285,39 @@ class CutenessRepository(CutenessRepositoryInterface):
         cutenessDate = CutenessDate()
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT cuteness FROM cuteness
-                WHERE twitchchannelid = $1 AND userid = $2 AND utcyearandmonth = $3
-                LIMIT 1
-            ''',
-            twitchChannelId, userId, cutenessDate.getDatabaseString()
-        )
 
-        previousCuteness = 0
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT cuteness FROM cuteness
+                    WHERE twitchchannelid = $1 AND userid = $2 AND utcyearandmonth = $3
+                    LIMIT 1
+                ''',
+                twitchChannelId, userId, cutenessDate.getDatabaseString()
+            )
 
-        if record is not None and len(record) >= 1:
-            previousCuteness = record[0]
+            previousCuteness = 0
 
-        newCuteness = previousCuteness + incrementAmount
+            if record is not None and len(record) >= 1:
+                previousCuteness = record[0]
 
-        if newCuteness < 0:
-            newCuteness = 0
-        elif newCuteness > utils.getLongMaxSafeSize():
-            raise OverflowError(f'New cuteness would be too large ({newCuteness=}) ({previousCuteness=}) ({incrementAmount=})')
+            newCuteness = previousCuteness + incrementAmount
 
-        await connection.execute(
-            '''
-                INSERT INTO cuteness (cuteness, twitchchannelid, userid, utcyearandmonth)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (twitchchannelid, userid, utcyearandmonth) DO UPDATE SET cuteness = EXCLUDED.cuteness
-            ''',
-            newCuteness, twitchChannelId, userId, cutenessDate.getDatabaseString()
-        )
+            if newCuteness < 0:
+                newCuteness = 0
+            elif newCuteness > utils.getLongMaxSafeSize():
+                raise OverflowError(f'New cuteness would be too large ({newCuteness=}) ({previousCuteness=}) ({incrementAmount=})')
 
-        await connection.close()
+            await connection.execute(
+                '''
+                    INSERT INTO cuteness (cuteness, twitchchannelid, userid, utcyearandmonth)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (twitchchannelid, userid, utcyearandmonth) DO UPDATE SET cuteness = EXCLUDED.cuteness
+                ''',
+                newCuteness, twitchChannelId, userId, cutenessDate.getDatabaseString()
+            )
+        finally:
+            await connection.close()
 
         return IncrementedCutenessResult(
             cutenessDate = cutenessDate,
@@ -339,18 +346,20 @@ class CutenessRepository(CutenessRepositoryInterface):
         cutenessDate = CutenessDate()
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
-                INNER JOIN userids ON cuteness.userid = userids.userid
-                WHERE cuteness.twitchchannelid = $1 AND cuteness.utcyearandmonth = $2 AND cuteness.cuteness IS NOT NULL AND cuteness.cuteness >= 1 AND cuteness.userid != $3
-                ORDER BY cuteness.cuteness DESC
-                LIMIT $4
-            ''',
-            twitchChannelId, cutenessDate.getDatabaseString(), twitchChannelId, self.__leaderboardSize
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
+                    INNER JOIN userids ON cuteness.userid = userids.userid
+                    WHERE cuteness.twitchchannelid = $1 AND cuteness.utcyearandmonth = $2 AND cuteness.cuteness IS NOT NULL AND cuteness.cuteness >= 1 AND cuteness.userid != $3
+                    ORDER BY cuteness.cuteness DESC
+                    LIMIT $4
+                ''',
+                twitchChannelId, cutenessDate.getDatabaseString(), twitchChannelId, self.__leaderboardSize
+            )
+        finally:
+            await connection.close()
 
         if records is None or len(records) == 0:
             return CutenessLeaderboardResult(cutenessDate = cutenessDate)
@@ -409,62 +418,64 @@ class CutenessRepository(CutenessRepositoryInterface):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT DISTINCT utcyearandmonth FROM cuteness
-                WHERE twitchchannelid = $1 AND utcyearandmonth != $2
-                ORDER BY utcyearandmonth DESC
-                LIMIT $3
-            ''',
-            twitchChannelId, CutenessDate().getDatabaseString(), self.__historyLeaderboardSize
-        )
 
-        if records is None or len(records) == 0:
-            await connection.close()
-            return CutenessLeaderboardHistoryResult(
-                twitchChannel = twitchChannel,
-                twitchChannelId = twitchChannelId
-            )
-
-        leaderboards: FrozenList[CutenessLeaderboardResult] = FrozenList()
-
-        for record in records:
-            cutenessDate = CutenessDate(record[0])
-            monthRecords = await connection.fetchRows(
+        try:
+            records = await connection.fetchRows(
                 '''
-                    SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
-                    INNER JOIN userids ON cuteness.userid = userids.userid
-                    WHERE cuteness.cuteness IS NOT NULL AND cuteness.cuteness >= 1 AND cuteness.twitchchannelid = $1 AND cuteness.userid != $2 AND cuteness.utcyearandmonth = $3
-                    ORDER BY cuteness.cuteness DESC
-                    LIMIT $4
+                    SELECT DISTINCT utcyearandmonth FROM cuteness
+                    WHERE twitchchannelid = $1 AND utcyearandmonth != $2
+                    ORDER BY utcyearandmonth DESC
+                    LIMIT $3
                 ''',
-                twitchChannelId, twitchChannelId, cutenessDate.getDatabaseString(), self.__historyLeaderboardSize
+                twitchChannelId, CutenessDate().getDatabaseString(), self.__historyLeaderboardSize
             )
 
-            if monthRecords is None or len(monthRecords) == 0:
-                continue
+            if records is None or len(records) == 0:
+                return CutenessLeaderboardHistoryResult(
+                    twitchChannel = twitchChannel,
+                    twitchChannelId = twitchChannelId
+                )
 
-            entries: FrozenList[CutenessLeaderboardEntry] = FrozenList()
-            rank = 1
+            leaderboards: FrozenList[CutenessLeaderboardResult] = FrozenList()
 
-            for monthRecord in monthRecords:
-                entries.append(CutenessLeaderboardEntry(
-                    cuteness = monthRecord[0],
-                    rank = rank,
-                    userId = monthRecord[1],
-                    userName = monthRecord[2]
-                ))
-                rank = rank + 1
+            for record in records:
+                cutenessDate = CutenessDate(record[0])
+                monthRecords = await connection.fetchRows(
+                    '''
+                        SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
+                        INNER JOIN userids ON cuteness.userid = userids.userid
+                        WHERE cuteness.cuteness IS NOT NULL AND cuteness.cuteness >= 1 AND cuteness.twitchchannelid = $1 AND cuteness.userid != $2 AND cuteness.utcyearandmonth = $3
+                        ORDER BY cuteness.cuteness DESC
+                        LIMIT $4
+                    ''',
+                    twitchChannelId, twitchChannelId, cutenessDate.getDatabaseString(), self.__historyLeaderboardSize
+                )
 
-            entries.freeze()
+                if monthRecords is None or len(monthRecords) == 0:
+                    continue
 
-            leaderboards.append(CutenessLeaderboardResult(
-                cutenessDate = cutenessDate,
-                entries = entries
-            ))
+                entries: FrozenList[CutenessLeaderboardEntry] = FrozenList()
+                rank = 1
+
+                for monthRecord in monthRecords:
+                    entries.append(CutenessLeaderboardEntry(
+                        cuteness = monthRecord[0],
+                        rank = rank,
+                        userId = monthRecord[1],
+                        userName = monthRecord[2]
+                    ))
+                    rank = rank + 1
 
-        leaderboards.freeze()
-        await connection.close()
+                entries.freeze()
+
+                leaderboards.append(CutenessLeaderboardResult(
+                    cutenessDate = cutenessDate,
+                    entries = entries
+                ))
+
+            leaderboards.freeze()
+        finally:
+            await connection.close()
 
         return CutenessLeaderboardHistoryResult(
             twitchChannel = twitchChannel,
@@ -483,34 +494,35 @@ class CutenessRepository(CutenessRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS cuteness (
-                            cuteness bigint DEFAULT 0 NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            utcyearandmonth text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid, utcyearandmonth)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS cuteness (
-                            cuteness INTEGER NOT NULL DEFAULT 0,
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            utcyearandmonth TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid, utcyearandmonth)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS cuteness (
+                                cuteness bigint DEFAULT 0 NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                userid text NOT NULL,
+                                utcyearandmonth text NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid, utcyearandmonth)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS cuteness (
+                                cuteness INTEGER NOT NULL DEFAULT 0,
+                                twitchchannelid TEXT NOT NULL,
+                                userid TEXT NOT NULL,
+                                utcyearandmonth TEXT NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid, utcyearandmonth)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
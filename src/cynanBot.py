@@ -15,7 +15,6 @@ from .aniv.repositories.mostRecentAnivMessageRepositoryInterface import MostRece
 from .aniv.settings.anivSettingsInterface import AnivSettingsInterface
 from .asplodieStats.asplodieStatsPresenter import AsplodieStatsPresenter
 from .asplodieStats.repository.asplodieStatsRepositoryInterface import AsplodieStatsRepositoryInterface
-from .beanStats.beanStatsPresenterInterface import BeanStatsPresenterInterface
 from .beanStats.beanStatsRepositoryInterface import BeanStatsRepositoryInterface
 from .chatActions.manager.chatActionsManagerInterface import ChatActionsManagerInterface
 from .chatCommands.absChatCommand import AbsChatCommand
@@ -69,6 +68,7 @@ from .chatCommands.getTriviaControllersChatCommand import GetTriviaControllersCh
 from .chatCommands.giveChatterItemChatCommand import GiveChatterItemChatCommand
 from .chatCommands.giveCutenessChatCommand import GiveCutenessChatCommand
 from .chatCommands.jishoChatCommand import JishoChatCommand
+from .chatCommands.lazyChatCommand import LazyChatCommand
 from .chatCommands.loremIpsumChatCommand import LoremIpsumChatCommand
 from .chatCommands.myCutenessChatCommand import MyCutenessChatCommand
 from .chatCommands.pkMonChatCommand import PkMonChatCommand
@@ -149,14 +149,12 @@ from .cuteness.cutenessPresenterInterface import CutenessPresenterInterface
 from .cuteness.cutenessRepositoryInterface import CutenessRepositoryInterface
 from .cuteness.cutenessUtilsInterface import CutenessUtilsInterface
 from .decTalk.settings.decTalkSettingsRepositoryInterface import DecTalkSettingsRepositoryInterface
-from .ecco.eccoHelperInterface import EccoHelperInterface
 from .funtoon.funtoonHelperInterface import FuntoonHelperInterface
 from .funtoon.tokens.funtoonTokensRepositoryInterface import FuntoonTokensRepositoryInterface
+from .glacialTtsStorage.repository.glacialTtsStorageRepositoryInterface import GlacialTtsStorageRepositoryInterface
 from .google.settings.googleSettingsRepositoryInterface import GoogleSettingsRepositoryInterface
 from .halfLife.settings.halfLifeSettingsRepositoryInterface import HalfLifeSettingsRepositoryInterface
-from .language.jishoHelperInterface import JishoHelperInterface
 from .language.languagesRepositoryInterface import LanguagesRepositoryInterface
-from .language.translationHelperInterface import TranslationHelperInterface
 from .language.wordOfTheDay.wordOfTheDayPresenterInterface import WordOfTheDayPresenterInterface
 from .language.wordOfTheDay.wordOfTheDayRepositoryInterface import WordOfTheDayRepositoryInterface
 from .location.locationsRepositoryInterface import LocationsRepositoryInterface
@@ -167,7 +165,9 @@ from .misc.administratorProviderInterface import AdministratorProviderInterface
 from .misc.authRepository import AuthRepository
 from .misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
 from .misc.generalSettingsRepository import GeneralSettingsRepository
+from .misc.serviceContainer.serviceContainerInterface import ServiceContainerInterface
 from .mostRecentChat.mostRecentChatsRepositoryInterface import MostRecentChatsRepositoryInterface
+from .network.networkClientProvider import NetworkClientProvider
 from .pixelsDice.listeners.pixelsDiceEventListener import PixelsDiceEventListener
 from .pixelsDice.machine.pixelsDiceMachineInterface import PixelsDiceMachineInterface
 from .pkmn.pokepediaRepositoryInterface import PokepediaRepositoryInterface
@@ -180,7 +180,7 @@ from .sentMessageLogger.sentMessageLoggerInterface import SentMessageLoggerInter
 from .soundPlayerManager.provider.soundPlayerManagerProviderInterface import SoundPlayerManagerProviderInterface
 from .soundPlayerManager.randomizerHelper.soundPlayerRandomizerHelper import SoundPlayerRandomizerHelperInterface
 from .soundPlayerManager.settings.soundPlayerSettingsRepositoryInterface import SoundPlayerSettingsRepositoryInterface
-from .starWars.starWarsQuotesRepositoryInterface import StarWarsQuotesRepositoryInterface
+from .storage.backingDatabase import BackingDatabase
 from .storage.psql.psqlCredentialsProviderInterface import PsqlCredentialsProviderInterface
 from .streamAlertsManager.streamAlertsManagerInterface import StreamAlertsManagerInterface
 from .streamAlertsManager.streamAlertsSettingsRepositoryInterface import StreamAlertsSettingsRepositoryInterface
@@ -312,10 +312,10 @@ class CynanBot(
         asplodieStatsRepository: AsplodieStatsRepositoryInterface | None,
         authRepository: AuthRepository,
         backgroundTaskHelper: BackgroundTaskHelperInterface,
+        backingDatabase: BackingDatabase,
         bannedTriviaGameControllersRepository: BannedTriviaGameControllersRepositoryInterface | None,
         bannedWordsRepository: BannedWordsRepositoryInterface | None,
         beanChanceCheerActionHelper: BeanChanceCheerActionHelperInterface | None,
-        beanStatsPresenter: BeanStatsPresenterInterface | None,
         beanStatsRepository: BeanStatsRepositoryInterface | None,
         bizhawkSettingsRepository: BizhawkSettingsRepositoryInterface | None,
         chatActionsManager: ChatActionsManagerInterface | None,
@@ -352,21 +352,21 @@ class CynanBot(
         cutenessRepository: CutenessRepositoryInterface | None,
         cutenessUtils: CutenessUtilsInterface | None,
         decTalkSettingsRepository: DecTalkSettingsRepositoryInterface | None,
-        eccoHelper: EccoHelperInterface | None,
         funtoonHelper: FuntoonHelperInterface | None,
         funtoonTokensRepository: FuntoonTokensRepositoryInterface | None,
         generalSettingsRepository: GeneralSettingsRepository,
+        glacialTtsStorageRepository: GlacialTtsStorageRepositoryInterface | None,
         googleSettingsRepository: GoogleSettingsRepositoryInterface | None,
         guaranteedTimeoutUsersRepository: GuaranteedTimeoutUsersRepositoryInterface | None,
         halfLifeSettingsRepository: HalfLifeSettingsRepositoryInterface | None,
         isLiveOnTwitchRepository: IsLiveOnTwitchRepositoryInterface | None,
-        jishoHelper: JishoHelperInterface | None,
         languagesRepository: LanguagesRepositoryInterface,
         locationsRepository: LocationsRepositoryInterface | None,
         microsoftSamSettingsRepository: MicrosoftSamSettingsRepositoryInterface | None,
         mostRecentAnivMessageRepository: MostRecentAnivMessageRepositoryInterface | None,
         mostRecentAnivMessageTimeoutHelper: MostRecentAnivMessageTimeoutHelperInterface | None,
         mostRecentChatsRepository: MostRecentChatsRepositoryInterface | None,
+        networkClientProvider: NetworkClientProvider,
         openTriviaDatabaseSessionTokenRepository: OpenTriviaDatabaseSessionTokenRepositoryInterface | None,
         pixelsDiceEventListener: PixelsDiceEventListener | None,
         pixelsDiceMachine: PixelsDiceMachineInterface | None,
@@ -378,11 +378,11 @@ class CynanBot(
         recurringActionsRepository: RecurringActionsRepositoryInterface | None,
         recurringActionsWizard: RecurringActionsWizardInterface | None,
         sentMessageLogger: SentMessageLoggerInterface,
+        serviceContainer: ServiceContainerInterface,
         shinyTriviaOccurencesRepository: ShinyTriviaOccurencesRepositoryInterface | None,
         soundPlayerManagerProvider: SoundPlayerManagerProviderInterface | None,
         soundPlayerRandomizerHelper: SoundPlayerRandomizerHelperInterface | None,
         soundPlayerSettingsRepository: SoundPlayerSettingsRepositoryInterface | None,
-        starWarsQuotesRepository: StarWarsQuotesRepositoryInterface | None,
         streamAlertsManager: StreamAlertsManagerInterface,
         streamAlertsSettingsRepository: StreamAlertsSettingsRepositoryInterface | None,
         streamElementsSettingsRepository: StreamElementsSettingsRepositoryInterface | None,
@@ -395,7 +395,6 @@ class CynanBot(
         timeoutImmuneUserIdsRepository: TimeoutImmuneUserIdsRepositoryInterface | None,
         timeZoneRepository: TimeZoneRepositoryInterface,
         toxicTriviaOccurencesRepository: ToxicTriviaOccurencesRepositoryInterface | None,
-        translationHelper: TranslationHelperInterface | None,
         triviaBanHelper: TriviaBanHelperInterface | None,
         triviaEmoteGenerator: TriviaEmoteGeneratorInterface | None,
         triviaEventHandler: AbsTriviaEventHandler | None,
@@ -504,14 +503,14 @@ class CynanBot(
             raise TypeError(f'authRepository argument is malformed: \"{authRepository}\"')
         elif not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(backingDatabase, BackingDatabase):
+            raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
         elif bannedTriviaGameControllersRepository is not None and not isinstance(bannedTriviaGameControllersRepository, BannedTriviaGameControllersRepositoryInterface):
             raise TypeError(f'bannedTriviaGameControllersRepository argument is malformed: \"{bannedTriviaGameControllersRepository}\"')
         elif bannedWordsRepository is not None and not isinstance(bannedWordsRepository, BannedWordsRepositoryInterface):
             raise TypeError(f'bannedWordsRepository argument is malformed: \"{bannedWordsRepository}\"')
         elif beanChanceCheerActionHelper is not None and not isinstance(beanChanceCheerActionHelper, BeanChanceCheerActionHelperInterface):
             raise TypeError(f'beanChanceCheerActionHelper argument is malformed: \"{beanChanceCheerActionHelper}\"')
-        elif beanStatsPresenter is not None and not isinstance(beanStatsPresenter, BeanStatsPresenterInterface):
-            raise TypeError(f'beanStatsPresenter argument is malformed: \"{beanStatsPresenter}\"')
         elif beanStatsRepository is not None and not isinstance(beanStatsRepository, BeanStatsRepositoryInterface):
             raise TypeError(f'beanStatsRepository argument is malformed: \"{beanStatsRepository}\"')
         elif bizhawkSettingsRepository is not None and not isinstance(bizhawkSettingsRepository, BizhawkSettingsRepositoryInterface):
@@ -584,12 +583,12 @@ class CynanBot(
             raise TypeError(f'cutenessUtils argument is malformed: \"{cutenessUtils}\"')
         elif decTalkSettingsRepository is not None and not isinstance(decTalkSettingsRepository, DecTalkSettingsRepositoryInterface):
             raise TypeError(f'decTalkSettingsRepository argument is malformed: \"{decTalkSettingsRepository}\"')
-        elif eccoHelper is not None and not isinstance(eccoHelper, EccoHelperInterface):
-            raise TypeError(f'eccoHelper argument is malformed: \"{eccoHelper}\"')
         elif funtoonHelper is not None and not isinstance(funtoonHelper, FuntoonHelperInterface):
             raise TypeError(f'funtoonHelper argument is malformed: \"{funtoonHelper}\"')
         elif not isinstance(generalSettingsRepository, GeneralSettingsRepository):
             raise TypeError(f'generalSettingsRepository argument is malformed: \"{generalSettingsRepository}\"')
+        elif glacialTtsStorageRepository is not None and not isinstance(glacialTtsStorageRepository, GlacialTtsStorageRepositoryInterface):
+            raise TypeError(f'glacialTtsStorageRepository argument is malformed: \"{glacialTtsStorageRepository}\"')
         elif googleSettingsRepository is not None and not isinstance(googleSettingsRepository, GoogleSettingsRepositoryInterface):
             raise TypeError(f'googleSettingsRepository argument is malformed: \"{googleSettingsRepository}\"')
         elif guaranteedTimeoutUsersRepository is not None and not isinstance(guaranteedTimeoutUsersRepository, GuaranteedTimeoutUsersRepositoryInterface):
@@ -598,8 +597,6 @@ class CynanBot(
             raise TypeError(f'halfLifeSettingsRepository argument is malformed: \"{halfLifeSettingsRepository}\"')
         elif isLiveOnTwitchRepository is not None and not isinstance(isLiveOnTwitchRepository, IsLiveOnTwitchRepositoryInterface):
             raise TypeError(f'isLiveOnTwitchRepository argument is malformed: \"{isLiveOnTwitchRepository}\"')
-        elif jishoHelper is not None and not isinstance(jishoHelper, JishoHelperInterface):
-            raise TypeError(f'jishoHelper argument is malformed: \"{jishoHelper}\"')
         elif not isinstance(languagesRepository, LanguagesRepositoryInterface):
             raise TypeError(f'languagesRepository argument is malformed: \"{languagesRepository}\"')
         elif locationsRepository is not None and not isinstance(locationsRepository, LocationsRepositoryInterface):
@@ -612,6 +609,8 @@ class CynanBot(
             raise TypeError(f'mostRecentAnivMessageTimeoutHelper argument is malformed: \"{mostRecentAnivMessageTimeoutHelper}\"')
         elif mostRecentChatsRepository is not None and not isinstance(mostRecentChatsRepository, MostRecentChatsRepositoryInterface):
             raise TypeError(f'mostRecentChatsRepository argument is malformed: \"{mostRecentChatsRepository}\"')
+        elif not isinstance(networkClientProvider, NetworkClientProvider):
+            raise TypeError(f'networkClientProvider argument is malformed: \"{networkClientProvider}\"')
         elif openTriviaDatabaseSessionTokenRepository is not None and not isinstance(openTriviaDatabaseSessionTokenRepository, OpenTriviaDatabaseSessionTokenRepositoryInterface):
             raise TypeError(f'openTriviaDatabaseSessionTokenRepository argument is malformed: \"{openTriviaDatabaseSessionTokenRepository}\"')
         elif pixelsDiceEventListener is not None and not isinstance(pixelsDiceEventListener, PixelsDiceEventListener):
@@ -634,6 +633,8 @@ class CynanBot(
             raise TypeError(f'recurringActionsWizard argument is malformed: \"{recurringActionsWizard}\"')
         elif not isinstance(sentMessageLogger, SentMessageLoggerInterface):
             raise TypeError(f'sentMessageLogger argument is malformed: \"{sentMessageLogger}\"')
+        elif not isinstance(serviceContainer, ServiceContainerInterface):
+            raise TypeError(f'serviceContainer argument is malformed: \"{serviceContainer}\"')
         elif shinyTriviaOccurencesRepository is not None and not isinstance(shinyTriviaOccurencesRepository, ShinyTriviaOccurencesRepositoryInterface):
             raise TypeError(f'shinyTriviaOccurencesRepository argument is malformed: \"{shinyTriviaOccurencesRepository}\"')
         elif soundPlayerManagerProvider is not None and not isinstance(soundPlayerManagerProvider, SoundPlayerManagerProviderInterface):
@@ -642,8 +643,6 @@ class CynanBot(
             raise TypeError(f'soundPlayerRandomizerHelper argument is malformed: \"{soundPlayerRandomizerHelper}\"')
         elif soundPlayerSettingsRepository is not None and not isinstance(soundPlayerSettingsRepository, SoundPlayerSettingsRepositoryInterface):
             raise TypeError(f'soundPlayerSettingsRepository argument is malformed: \"{soundPlayerSettingsRepository}\"')
-        elif starWarsQuotesRepository is not None and not isinstance(starWarsQuotesRepository, StarWarsQuotesRepositoryInterface):
-            raise TypeError(f'starWarsQuotesRepository argument is malformed: \"{starWarsQuotesRepository}\"')
         elif not isinstance(streamAlertsManager, StreamAlertsManagerInterface):
             raise TypeError(f'streamAlertsManager argument is malformed: \"{streamAlertsManager}\"')
         elif streamAlertsSettingsRepository is not None and not isinstance(streamAlertsSettingsRepository, StreamAlertsSettingsRepositoryInterface):
@@ -668,8 +667,6 @@ class CynanBot(
             raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
         elif toxicTriviaOccurencesRepository is not None and not isinstance(toxicTriviaOccurencesRepository, ToxicTriviaOccurencesRepositoryInterface):
             raise TypeError(f'toxicTriviaOccurencesRepository argument is malformed: \"{toxicTriviaOccurencesRepository}\"')
-        elif translationHelper is not None and not isinstance(translationHelper, TranslationHelperInterface):
-            raise TypeError(f'translationHelper argument is malformed: \"{translationHelper}\"')
         elif triviaBanHelper is not None and not isinstance(triviaBanHelper, TriviaBanHelperInterface):
             raise TypeError(f'triviaBanHelper argument is malformed: \"{triviaBanHelper}\"')
         elif triviaEmoteGenerator is not None and not isinstance(triviaEmoteGenerator, TriviaEmoteGeneratorInterface):
@@ -775,6 +772,7 @@ class CynanBot(
         elif wordOfTheDayRepository is not None and not isinstance(wordOfTheDayRepository, WordOfTheDayRepositoryInterface):
             raise TypeError(f'wordOfTheDayRepository argument is malformed: \"{wordOfTheDayRepository}\"')
 
+        self.__backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = backgroundTaskHelper
         self.__twitchChannelPointRedemptionHandler: Final[AbsTwitchChannelPointRedemptionHandler | None] = twitchChannelPointRedemptionHandler
         self.__twitchChatHandler: Final[AbsTwitchChatHandler | None] = twitchChatHandler
         self.__twitchCheerHandler: Final[AbsTwitchCheerHandler | None] = twitchCheerHandler
@@ -787,6 +785,7 @@ class CynanBot(
         self.__addOrRemoveUserDataHelper: Final[AddOrRemoveUserDataHelperInterface] = addOrRemoveUserDataHelper
         self.__airStrikeCheerActionHelper: Final[AirStrikeCheerActionHelperInterface | None] = airStrikeCheerActionHelper
         self.__authRepository: Final[AuthRepository] = authRepository
+        self.__backingDatabase: Final[BackingDatabase] = backingDatabase
         self.__beanChanceCheerActionHelper: Final[BeanChanceCheerActionHelperInterface | None] = beanChanceCheerActionHelper
         self.__chatActionsManager: Final[ChatActionsManagerInterface | None] = chatActionsManager
         self.__chatLogger: Final[ChatLoggerInterface] = chatLogger
@@ -796,7 +795,10 @@ class CynanBot(
         self.__crowdControlMachine: Final[CrowdControlMachineInterface | None] = crowdControlMachine
         self.__crowdControlMessageListener: Final[CrowdControlMessageListener | None] = crowdControlMessageListener
         self.__generalSettingsRepository: Final[GeneralSettingsRepository] = generalSettingsRepository
+        self.__glacialTtsStorageRepository: Final[GlacialTtsStorageRepositoryInterface | None] = glacialTtsStorageRepository
         self.__mostRecentAnivMessageTimeoutHelper: Final[MostRecentAnivMessageTimeoutHelperInterface | None] = mostRecentAnivMessageTimeoutHelper
+        self.__mostRecentChatsRepository: Final[MostRecentChatsRepositoryInterface | None] = mostRecentChatsRepository
+        self.__networkClientProvider: Final[NetworkClientProvider] = networkClientProvider
         self.__pixelsDiceEventListener: Final[PixelsDiceEventListener | None] = pixelsDiceEventListener
         self.__pixelsDiceMachine: Final[PixelsDiceMachineInterface | None] = pixelsDiceMachine
         self.__recurringActionsEventHandler: Final[AbsRecurringActionsEventHandler | None] = recurringActionsEventHandler
@@ -835,7 +837,7 @@ class CynanBot(
         self.__loremIpsumCommand: AbsChatCommand = LoremIpsumChatCommand(administratorProvider, timber, twitchChatMessenger, usersRepository)
         self.__removeUserCommand: AbsChatCommand = RemoveUserChatCommand(addOrRemoveUserDataHelper, administratorProvider, timber, twitchChatMessenger, twitchTokensRepository, userIdsRepository, usersRepository)
         self.__setTwitchCodeCommand: AbsChatCommand = SetTwitchCodeChatCommand(administratorProvider, timber, twitchTokensRepository, twitchChatMessenger, usersRepository)
-        self.__skipTtsCommand: AbsChatCommand = SkipTtsChatCommand(administratorProvider, compositeTtsManagerProvider, timber, twitchChannelEditorsRepository)
+        self.__skipTtsCommand: AbsChatCommand = SkipTtsChatCommand(administratorProvider, streamAlertsManager, timber, twitchChannelEditorsRepository)
         self.__timeCommand: AbsChatCommand = TimeChatCommand(timber, twitchChatMessenger, usersRepository)
         self.__twitchUserInfoCommand: AbsChatCommand = TwitchUserInfoChatCommand(administratorProvider, timber, twitchApiService, twitchChatMessenger, authRepository, twitchTokensRepository, userIdsRepository, usersRepository)
 
@@ -844,10 +846,10 @@ class CynanBot(
         else:
             self.__asplodieStatsCommand: AbsChatCommand = AsplodieStatsChatCommand(asplodieStatsPresenter, asplodieStatsRepository, timber, twitchChatMessenger, userIdsRepository, usersRepository)
 
-        if beanStatsPresenter is None or beanStatsRepository is None:
+        if beanStatsRepository is None or not serviceContainer.isEnabled('beanStatsPresenter'):
             self.__beanStatsCommand: AbsChatCommand = StubChatCommand()
         else:
-            self.__beanStatsCommand: AbsChatCommand = BeanStatsChatCommand(beanStatsPresenter, beanStatsRepository, timber, twitchChatMessenger, userIdsRepository, usersRepository)
+            self.__beanStatsCommand: AbsChatCommand = LazyChatCommand(lambda: BeanStatsChatCommand(serviceContainer.get('beanStatsPresenter'), beanStatsRepository, timber, twitchChatMessenger, userIdsRepository, usersRepository))
 
         if chatterInventoryHelper is None or chatterInventoryIdGenerator is None or chatterInventoryItemUseMachine is None or chatterInventoryMapper is None or chatterInventorySettings is None or useChatterItemHelper is None:
             self.__chatterInventoryCommand: AbsChatCommand = StubChatCommand()
@@ -995,10 +997,10 @@ class CynanBot(
         else:
             self.__setFuntoonTokenCommand: AbsChatCommand = SetFuntoonTokenChatCommand(administratorProvider, funtoonTokensRepository, timber, twitchChatMessenger, usersRepository)
 
-        if jishoHelper is None:
+        if not serviceContainer.isEnabled('jishoHelper'):
             self.__jishoCommand: AbsChatCommand = StubChatCommand()
         else:
-            self.__jishoCommand: AbsChatCommand = JishoChatCommand(generalSettingsRepository, jishoHelper, timber, twitchChatMessenger, usersRepository)
+            self.__jishoCommand: AbsChatCommand = LazyChatCommand(lambda: JishoChatCommand(generalSettingsRepository, serviceContainer.get('jishoHelper'), timber, twitchChatMessenger, usersRepository))
 
         if anivCopyMessageTimeoutScoreHelper is None or anivCopyMessageTimeoutScorePresenter is None or anivSettings is None:
             self.__anivTimeoutsCommand: AbsChatCommand = StubChatCommand()
@@ -1012,15 +1014,15 @@ class CynanBot(
             self.__pkMonCommand: AbsChatCommand = PkMonChatCommand(pokepediaRepository, timber, twitchChatMessenger, usersRepository)
             self.__pkMoveCommand: AbsChatCommand = PkMoveChatCommand(pokepediaRepository, timber, twitchChatMessenger, usersRepository)
 
-        if starWarsQuotesRepository is None:
+        if not serviceContainer.isEnabled('starWarsQuotesRepository'):
             self.__swQuoteCommand: AbsChatCommand = StubChatCommand()
         else:
-            self.__swQuoteCommand: AbsChatCommand = SwQuoteChatCommand(starWarsQuotesRepository, timber, twitchChatMessenger, usersRepository)
+            self.__swQuoteCommand: AbsChatCommand = LazyChatCommand(lambda: SwQuoteChatCommand(serviceContainer.get('starWarsQuotesRepository'), timber, twitchChatMessenger, usersRepository))
 
-        if translationHelper is None:
+        if not serviceContainer.isEnabled('translationHelper'):
             self.__translateCommand: AbsChatCommand = StubChatCommand()
         else:
-            self.__translateCommand: AbsChatCommand = TranslateChatCommand(languagesRepository, timber, translationHelper, twitchChatMessenger, usersRepository)
+            self.__translateCommand: AbsChatCommand = LazyChatCommand(lambda: TranslateChatCommand(languagesRepository, timber, serviceContainer.get('translationHelper'), twitchChatMessenger, usersRepository))
 
         if ttsChatterRepository is None:
             self.__removeTtsChatterCommand: AbsChatCommand = StubChatCommand()
@@ -1042,10 +1044,10 @@ class CynanBot(
         else:
             self.__testCheerCommand: AbsChatCommand = TestCheerChatCommand(twitchCheerHandler, timber, twitchChatMessenger, usersRepository)
 
-        if eccoHelper is None:
+        if not serviceContainer.isEnabled('eccoHelper'):
             self.__eccoCommand: AbsChatCommand = StubChatCommand()
         else:
-            self.__eccoCommand: AbsChatCommand = EccoChatCommand(eccoHelper, timber, twitchChatMessenger, usersRepository)
+            self.__eccoCommand: AbsChatCommand = LazyChatCommand(lambda: EccoChatCommand(serviceContainer.get('eccoHelper'), timber, twitchChatMessenger, usersRepository))
 
         if timeoutImmuneUserIdsRepository is None:
             self.__vulnerableChattersCommand: AbsChatCommand = StubChatCommand()
@@ -1066,6 +1068,24 @@ class CynanBot(
 
         self.__timber.log('CynanBot', f'Finished initialization of {self.__authRepository.getAll().requireTwitchHandle()}')
 
+    async def close(self):
+        self.__timber.log('CynanBot', 'Closing, flushing any pending writes...')
+
+        if self.__mostRecentChatsRepository is not None:
+            await self.__mostRecentChatsRepository.flush()
+
+        await self.__userIdsRepository.flush()
+        await super().close()
+
+        if self.__glacialTtsStorageRepository is not None:
+            await self.__glacialTtsStorageRepository.close()
+
+        if self.__triviaRepository is not None:
+            await self.__triviaRepository.close()
+
+        await self.__networkClientProvider.close()
+        await self.__backingDatabase.close()
+
     async def event_channel_join_failure(self, channel: str):
         self.__timber.log('CynanBot', f'Encountered channel join failure ({channel=})')
 
@@ -1251,6 +1271,7 @@ class CynanBot(
 
         if self.__twitchWebsocketClient is not None:
             self.__twitchWebsocketClient.setDataBundleListener(TwitchWebsocketDataBundleHandler(
+                backgroundTaskHelper = self.__backgroundTaskHelper,
                 channelPointRedemptionHandler = self.__twitchChannelPointRedemptionHandler,
                 chatHandler = self.__twitchChatHandler,
                 cheerHandler = self.__twitchCheerHandler,
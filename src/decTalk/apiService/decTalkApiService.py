@@ -1,23 +1,21 @@
-import asyncio
 import os
 import re
 import uuid
-from asyncio import AbstractEventLoop, CancelledError as AsyncioCancelledError
-from asyncio import TimeoutError as AsyncioTimeoutError
-from asyncio.subprocess import Process
+from asyncio import AbstractEventLoop
 from dataclasses import dataclass
-from typing import ByteString, Final, Pattern
+from typing import Final, Pattern
 
 import aiofiles
 import aiofiles.os
 import aiofiles.ospath
-import psutil
 
 from .decTalkApiServiceInterface import DecTalkApiServiceInterface
 from ..exceptions import DecTalkExecutableIsMissingException, DecTalkFailedToGenerateSpeechFileException
 from ..models.decTalkVoice import DecTalkVoice
 from ..settings.decTalkSettingsRepositoryInterface import DecTalkSettingsRepositoryInterface
 from ...misc import utils as utils
+from ...misc.localProcessPool.localProcessPoolInterface import LocalProcessPoolInterface
+from ...misc.localProcessPool.localProcessResult import LocalProcessResult
 from ...timber.timberInterface import TimberInterface
 from ...tts.directoryProvider.ttsDirectoryProviderInterface import TtsDirectoryProviderInterface
 from ...tts.models.ttsProvider import TtsProvider
@@ -36,26 +34,42 @@ class DecTalkApiService(DecTalkApiServiceInterface):
         self,
         eventLoop: AbstractEventLoop,
         decTalkSettingsRepository: DecTalkSettingsRepositoryInterface,
+        localProcessPool: LocalProcessPoolInterface,
         timber: TimberInterface,
         ttsDirectoryProvider: TtsDirectoryProviderInterface,
         fileExtension: str = 'wav',
+        maxAttempts: int = 2,
+        timeoutSeconds: float = 3,
     ):
         if not isinstance(eventLoop, AbstractEventLoop):
             raise TypeError(f'eventLoop argument is malformed: \"{eventLoop}\"')
         elif not isinstance(decTalkSettingsRepository, DecTalkSettingsRepositoryInterface):
             raise TypeError(f'decTalkSettingsRepository argument is malformed: \"{decTalkSettingsRepository}\"')
+        elif not isinstance(localProcessPool, LocalProcessPoolInterface):
+            raise TypeError(f'localProcessPool argument is malformed: \"{localProcessPool}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(ttsDirectoryProvider, TtsDirectoryProviderInterface):
             raise TypeError(f'ttsDirectoryProvider argument is malformed: \"{ttsDirectoryProvider}\"')
         elif not utils.isValidStr(fileExtension):
             raise TypeError(f'fileExtension argument is malformed: \"{fileExtension}\"')
+        elif not utils.isValidInt(maxAttempts):
+            raise TypeError(f'maxAttempts argument is malformed: \"{maxAttempts}\"')
+        elif maxAttempts < 1 or maxAttempts > 8:
+            raise ValueError(f'maxAttempts argument is out of bounds: {maxAttempts}')
+        elif not utils.isValidNum(timeoutSeconds):
+            raise TypeError(f'timeoutSeconds argument is malformed: \"{timeoutSeconds}\"')
+        elif timeoutSeconds < 0.25 or timeoutSeconds > 300:
+            raise ValueError(f'timeoutSeconds argument is out of bounds: {timeoutSeconds}')
 
         self.__eventLoop: Final[AbstractEventLoop] = eventLoop
         self.__decTalkSettingsRepository: Final[DecTalkSettingsRepositoryInterface] = decTalkSettingsRepository
+        self.__localProcessPool: Final[LocalProcessPoolInterface] = localProcessPool
         self.__timber: Final[TimberInterface] = timber
         self.__ttsDirectoryProvider: Final[TtsDirectoryProviderInterface] = ttsDirectoryProvider
         self.__fileExtension: Final[str] = fileExtension
+        self.__maxAttempts: Final[int] = maxAttempts
+        self.__timeoutSeconds: Final[float] = timeoutSeconds
 
         self.__fileNameRegEx: Final[Pattern] = re.compile(r'[^a-z0-9]', re.IGNORECASE)
 
@@ -111,68 +125,32 @@ class DecTalkApiService(DecTalkApiServiceInterface):
         ):
             raise DecTalkExecutableIsMissingException(f'Couldn\'t find DecTalk executable ({filePaths=})')
 
-        voiceArgument = await self.__generateVoiceArgument(voice)
-        command = f'{filePaths.decTalkPath} -w \"{filePaths.fullFilePath}\" -pre \"[:phone on]\" {voiceArgument} \"{text}\"'
+        arguments: list[str] = [ filePaths.decTalkPath, '-w', filePaths.fullFilePath, '-pre', '[:phone on]' ]
 
-        decTalkProcess: Process | None = None
-        outputTuple: tuple[ByteString, ByteString] | None = None
-        exception: BaseException | None = None
+        if voice is not None:
+            arguments.append(voice.commandString)
 
-        try:
-            decTalkProcess = await asyncio.create_subprocess_shell(
-                cmd = command,
-                stdout = asyncio.subprocess.PIPE,
-                stderr = asyncio.subprocess.PIPE
-            )
+        arguments.append(text)
 
-            outputTuple = await asyncio.wait_for(
-                fut = decTalkProcess.communicate(),
-                timeout = 3
+        result: LocalProcessResult | None = None
+        exception: Exception | None = None
+
+        try:
+            result = await self.__localProcessPool.run(
+                arguments = arguments,
+                engineName = 'DecTalk',
+                maxAttempts = self.__maxAttempts,
+                timeoutSeconds = self.__timeoutSeconds,
             )
-        except BaseException as e:
+        except Exception as e:
             exception = e
 
-        outputString: str | None = None
-
-        if outputTuple is not None and len(outputTuple) >= 2:
-            outputString = outputTuple[1].decode('utf-8').strip()
-
-        self.__timber.log('DecTalkApiService', f'Ran DecTalk system command ({command=}) ({outputString=}) ({exception=})')
-
-        if isinstance(exception, AsyncioTimeoutError) or isinstance(exception, AsyncioCancelledError) or isinstance(exception, TimeoutError):
-            await self.__killDecTalkProcess(decTalkProcess)
+        self.__timber.log('DecTalkApiService', f'Ran DecTalk ({arguments=}) ({result=}) ({exception=})')
 
         if not await aiofiles.ospath.isfile(
             path = filePaths.fullFilePath,
             loop = self.__eventLoop
         ):
-            raise DecTalkFailedToGenerateSpeechFileException(f'Failed to generate speech file ({filePaths=}) ({command=}) ({outputString=}) ({exception=})')
+            raise DecTalkFailedToGenerateSpeechFileException(f'Failed to generate speech file ({filePaths=}) ({arguments=}) ({result=}) ({exception=})')
 
         return filePaths.fullFilePath
-
-    async def __generateVoiceArgument(self, voice: DecTalkVoice | None) -> str:
-        if voice is None:
-            return ''
-        else:
-            return voice.commandString
-
-    async def __killDecTalkProcess(self, decTalkProcess: Process | None):
-        if decTalkProcess is None:
-            self.__timber.log('DecTalkApiService', f'Went to kill the DecTalk process, but the process is None ({decTalkProcess=})')
-            return
-        elif not isinstance(decTalkProcess, Process):
-            raise TypeError(f'process argument is malformed: \"{decTalkProcess}\"')
-        elif decTalkProcess.returncode is not None:
-            self.__timber.log('DecTalkApiService', f'Went to kill a DecTalk process, but the process has a return code ({decTalkProcess=}) ({decTalkProcess.returncode=})')
-            return
-
-        self.__timber.log('DecTalkApiService', f'Killing DecTalk process ({decTalkProcess=}) ({decTalkProcess.returncode=})...')
-        parent = psutil.Process(decTalkProcess.pid)
-        childCount = 0
-
-        for child in parent.children(recursive = True):
-            child.terminate()
-            childCount += 1
-
-        parent.terminate()
-        self.__timber.log('DecTalkApiService', f'Finished killing DecTalk process ({decTalkProcess=}) ({decTalkProcess.returncode=}) ({childCount=})')
@@ -1,16 +1,20 @@
+import os
 import traceback
-from datetime import datetime
 from typing import Final
 
+import aiofiles.os
+
 from .decTalkHelperInterface import DecTalkHelperInterface
 from ..apiService.decTalkApiServiceInterface import DecTalkApiServiceInterface
 from ..exceptions import DecTalkFailedToGenerateSpeechFileException, DecTalkExecutableIsMissingException
 from ..models.decTalkFileReference import DecTalkFileReference
 from ..models.decTalkVoice import DecTalkVoice
 from ..settings.decTalkSettingsRepositoryInterface import DecTalkSettingsRepositoryInterface
-from ...location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from ...glacialTtsStorage.fileRetriever.glacialTtsFileRetrieverInterface import GlacialTtsFileRetrieverInterface
+from ...glacialTtsStorage.models.glacialTtsFileReference import GlacialTtsFileReference
 from ...misc import utils as utils
 from ...timber.timberInterface import TimberInterface
+from ...tts.models.ttsProvider import TtsProvider
 
 
 class DecTalkHelper(DecTalkHelperInterface):
@@ -19,22 +23,26 @@ class DecTalkHelper(DecTalkHelperInterface):
         self,
         decTalkApiService: DecTalkApiServiceInterface,
         decTalkSettingsRepository: DecTalkSettingsRepositoryInterface,
+        glacialTtsFileRetriever: GlacialTtsFileRetrieverInterface,
         timber: TimberInterface,
-        timeZoneRepository: TimeZoneRepositoryInterface,
+        fileExtension: str = 'wav',
     ):
         if not isinstance(decTalkApiService, DecTalkApiServiceInterface):
             raise TypeError(f'decTalkApiService argument is malformed: \"{decTalkApiService}\"')
         elif not isinstance(decTalkSettingsRepository, DecTalkSettingsRepositoryInterface):
             raise TypeError(f'decTalkSettingsRepository argument is malformed: \"{decTalkSettingsRepository}\"')
+        elif not isinstance(glacialTtsFileRetriever, GlacialTtsFileRetrieverInterface):
+            raise TypeError(f'glacialTtsFileRetriever argument is malformed: \"{glacialTtsFileRetriever}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
-        elif not isinstance(timeZoneRepository, TimeZoneRepositoryInterface):
-            raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
+        elif not utils.isValidStr(fileExtension):
+            raise TypeError(f'fileExtension argument is malformed: \"{fileExtension}\"')
 
         self.__decTalkApiService: Final[DecTalkApiServiceInterface] = decTalkApiService
         self.__decTalkSettingsRepository: Final[DecTalkSettingsRepositoryInterface] = decTalkSettingsRepository
+        self.__glacialTtsFileRetriever: Final[GlacialTtsFileRetrieverInterface] = glacialTtsFileRetriever
         self.__timber: Final[TimberInterface] = timber
-        self.__timeZoneRepository: Final[TimeZoneRepositoryInterface] = timeZoneRepository
+        self.__fileExtension: Final[str] = fileExtension
 
     async def __createFullMessage(
         self,
@@ -52,6 +60,37 @@ class DecTalkHelper(DecTalkHelperInterface):
         else:
             return None
 
+    async def __createSpeechFile(
+        self,
+        glacialFile: GlacialTtsFileReference,
+        fullMessage: str,
+        voice: DecTalkVoice,
+    ) -> bool:
+        try:
+            speechFile = await self.__decTalkApiService.generateSpeechFile(
+                voice = voice,
+                text = fullMessage,
+            )
+        except DecTalkExecutableIsMissingException as e:
+            self.__timber.log('DecTalkHelper', f'Encountered executable file is missing exception when generating speech ({voice=}) ({fullMessage=}): {e}', e, traceback.format_exc())
+            return False
+        except DecTalkFailedToGenerateSpeechFileException as e:
+            self.__timber.log('DecTalkHelper', f'Encountered failure to create speech file exception when generating speech ({voice=}) ({fullMessage=}): {e}', e, traceback.format_exc())
+            return False
+
+        try:
+            await aiofiles.os.makedirs(
+                name = os.path.dirname(glacialFile.filePath),
+                exist_ok = True,
+            )
+
+            await aiofiles.os.replace(speechFile, glacialFile.filePath)
+        except Exception as e:
+            self.__timber.log('DecTalkHelper', f'Encountered exception when trying to move DecTalk speech file into glacial storage ({speechFile=}) ({glacialFile=}): {e}', e, traceback.format_exc())
+            return False
+
+        return True
+
     async def generateTts(
         self,
         voice: DecTalkVoice | None,
@@ -85,21 +124,22 @@ class DecTalkHelper(DecTalkHelperInterface):
         if not utils.isValidStr(fullMessage):
             return None
 
-        try:
-            speechFile = await self.__decTalkApiService.generateSpeechFile(
+        glacialFile = await self.__glacialTtsFileRetriever.findOrCreateFile(
+            fileExtension = self.__fileExtension,
+            message = fullMessage,
+            voice = voice.name,
+            provider = TtsProvider.DEC_TALK,
+            createFile = lambda glacialFile: self.__createSpeechFile(
+                glacialFile = glacialFile,
+                fullMessage = fullMessage,
                 voice = voice,
-                text = fullMessage,
-            )
-        except DecTalkExecutableIsMissingException as e:
-            self.__timber.log('DecTalkHelper', f'Encountered executable file is missing exception when generating speech ({voice=}) ({fullMessage=}): {e}', e, traceback.format_exc())
-            return None
-        except DecTalkFailedToGenerateSpeechFileException as e:
-            self.__timber.log('DecTalkHelper', f'Encountered failure to create speech file exception when generating speech ({voice=}) ({fullMessage=}): {e}', e, traceback.format_exc())
-            return None
+            ),
+        )
 
-        storeDateTime = datetime.now(self.__timeZoneRepository.getDefault())
+        if glacialFile is None:
+            return None
 
         return DecTalkFileReference(
-            storeDateTime = storeDateTime,
-            filePath = speechFile,
+            storeDateTime = glacialFile.storeDateTime,
+            filePath = glacialFile.filePath,
         )
@@ -92,16 +92,18 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
             return self.__cache[twitchChannelId]
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT token FROM funtoontokens
-                WHERE twitchchannelid = $1
-                LIMIT 1
-            ''',
-            twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT token FROM funtoontokens
+                    WHERE twitchchannelid = $1
+                    LIMIT 1
+                ''',
+                twitchChannelId
+            )
+        finally:
+            await connection.close()
         token: str | None = None
 
         if record is not None and len(record) >= 1:
@@ -117,31 +119,32 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS funtoontokens (
-                            token text DEFAULT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS funtoontokens (
-                            token TEXT DEFAULT NULL,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS funtoontokens (
+                                token text DEFAULT NULL,
+                                twitchchannelid text NOT NULL PRIMARY KEY
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS funtoontokens (
+                                token TEXT DEFAULT NULL,
+                                twitchchannelid TEXT NOT NULL PRIMARY KEY
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
         await self.__consumeSeedFile()
 
     async def requireToken(
@@ -172,28 +175,29 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
 
         connection = await self.__getDatabaseConnection()
 
-        if utils.isValidStr(token):
-            await connection.execute(
-                '''
-                    INSERT INTO funtoontokens (token, twitchchannelid)
-                    VALUES ($1, $2)
-                    ON CONFLICT (twitchchannelid) DO UPDATE SET token = EXCLUDED.token
-                ''',
-                token, twitchChannelId
-            )
-
-            self.__cache[twitchChannelId] = token
-            self.__timber.log('FuntoonTokensRepository', f'Funtoon token has been updated ({twitchChannelId=}) ({token=})')
-        else:
-            await connection.execute(
-                '''
-                    DELETE FROM funtoontokens
-                    WHERE twitchchannelid = $1
-                ''',
-                twitchChannelId
-            )
+        try:
+            if utils.isValidStr(token):
+                await connection.execute(
+                    '''
+                        INSERT INTO funtoontokens (token, twitchchannelid)
+                        VALUES ($1, $2)
+                        ON CONFLICT (twitchchannelid) DO UPDATE SET token = EXCLUDED.token
+                    ''',
+                    token, twitchChannelId
+                )
 
-            self.__cache[twitchChannelId] = None
-            self.__timber.log('FuntoonTokensRepository', f'Funtoon token has been deleted ({twitchChannelId=})')
+                self.__cache[twitchChannelId] = token
+                self.__timber.log('FuntoonTokensRepository', f'Funtoon token has been updated ({twitchChannelId=}) ({token=})')
+            else:
+                await connection.execute(
+                    '''
+                        DELETE FROM funtoontokens
+                        WHERE twitchchannelid = $1
+                    ''',
+                    twitchChannelId
+                )
 
-        await connection.close()
+                self.__cache[twitchChannelId] = None
+                self.__timber.log('FuntoonTokensRepository', f'Funtoon token has been deleted ({twitchChannelId=})')
+        finally:
+            await connection.close()
@@ -1,13 +1,15 @@
+import asyncio
+import os
 import re
+import traceback
 from asyncio import AbstractEventLoop
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Final, Pattern
-
-import aiofiles.os
-import aiofiles.ospath
+from typing import Awaitable, Callable, Final, Pattern
 
 from .glacialTtsFileRetrieverInterface import GlacialTtsFileRetrieverInterface
 from ..exceptions import GlacialTtsFolderIsNotAFolder
+from ..models.glacialTtsCacheMetrics import GlacialTtsCacheMetrics
 from ..models.glacialTtsFileReference import GlacialTtsFileReference
 from ..repository.glacialTtsStorageRepositoryInterface import GlacialTtsStorageRepositoryInterface
 from ...misc import utils as utils
@@ -18,10 +20,30 @@ from ...tts.models.ttsProvider import TtsProvider
 
 class GlacialTtsFileRetriever(GlacialTtsFileRetrieverInterface):
 
+    @dataclass(frozen = True)
+    class CacheKey:
+        glacialId: str
+        provider: TtsProvider
+
     @dataclass(frozen = True)
     class FileReference:
         fileName: str
         filePath: str
+        sizeBytes: int | None
+
+    @dataclass(frozen = True)
+    class InFlightKey:
+        message: str
+        voice: str | None
+        provider: TtsProvider
+
+    @dataclass(frozen = True)
+    class ScannedFile:
+        fileName: str
+        filePath: str
+        glacialId: str
+        modifiedTime: float
+        sizeBytes: int
 
     def __init__(
         self,
@@ -29,6 +51,7 @@ class GlacialTtsFileRetriever(GlacialTtsFileRetrieverInterface):
         glacialTtsStorageRepository: GlacialTtsStorageRepositoryInterface,
         timber: TimberInterface,
         ttsDirectoryProvider: TtsDirectoryProviderInterface,
+        maxCacheSizeBytes: int = 5 * 1024 * 1024 * 1024,
     ):
         if not isinstance(eventLoop, AbstractEventLoop):
             raise TypeError(f'eventLoop argument is malformed: \"{eventLoop}\"')
@@ -38,14 +61,86 @@ class GlacialTtsFileRetriever(GlacialTtsFileRetrieverInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(ttsDirectoryProvider, TtsDirectoryProviderInterface):
             raise TypeError(f'ttsDirectoryProvider argument is malformed: \"{ttsDirectoryProvider}\"')
+        elif not utils.isValidInt(maxCacheSizeBytes):
+            raise TypeError(f'maxCacheSizeBytes argument is malformed: \"{maxCacheSizeBytes}\"')
+        elif maxCacheSizeBytes < 1:
+            raise ValueError(f'maxCacheSizeBytes argument is out of bounds: {maxCacheSizeBytes}')
 
         self.__eventLoop: Final[AbstractEventLoop] = eventLoop
         self.__glacialTtsStorageRepository: Final[GlacialTtsStorageRepositoryInterface] = glacialTtsStorageRepository
         self.__timber: Final[TimberInterface] = timber
         self.__ttsDirectoryProvider: Final[TtsDirectoryProviderInterface] = ttsDirectoryProvider
+        self.__maxCacheSizeBytes: Final[int] = maxCacheSizeBytes
 
         self.__fileNameWithoutExtensionRegEx: Final[Pattern] = re.compile(r'^(\w+)\.\w+$', re.IGNORECASE)
 
+        # Ordered from least to most recently used. Entries whose file has not been written
+        # yet (saveFile() hands back a path for the caller to write to) have no known size.
+        self.__files: Final[OrderedDict[GlacialTtsFileRetriever.CacheKey, GlacialTtsFileRetriever.FileReference]] = OrderedDict()
+        self.__indexLock: Final[asyncio.Lock] = asyncio.Lock()
+        self.__invalidProviderFolders: Final[set[TtsProvider]] = set()
+        self.__unsizedFiles: Final[set[GlacialTtsFileRetriever.CacheKey]] = set()
+        self.__inFlightFiles: Final[dict[GlacialTtsFileRetriever.InFlightKey, asyncio.Future[GlacialTtsFileReference | None]]] = dict()
+        self.__cachedSizeBytes: int = 0
+        self.__deduplicatedRequests: int = 0
+        self.__evictedFiles: int = 0
+        self.__hits: int = 0
+        self.__isIndexLoaded: bool = False
+        self.__misses: int = 0
+
+    def __addFile(
+        self,
+        cacheKey: CacheKey,
+        fileReference: FileReference,
+    ):
+        self.__removeFile(cacheKey)
+        self.__files[cacheKey] = fileReference
+
+        if fileReference.sizeBytes is None:
+            self.__unsizedFiles.add(cacheKey)
+        else:
+            self.__cachedSizeBytes += fileReference.sizeBytes
+
+    def __deleteFile(self, filePath: str):
+        try:
+            os.remove(filePath)
+        except FileNotFoundError:
+            pass
+
+    async def __evictFilesIfNecessary(self, protectedKey: CacheKey):
+        await self.__resolveUnsizedFiles(protectedKey)
+        evictedFiles = 0
+
+        while self.__cachedSizeBytes > self.__maxCacheSizeBytes and len(self.__files) >= 2:
+            cacheKey = next(iter(self.__files))
+
+            if cacheKey == protectedKey:
+                self.__files.move_to_end(cacheKey)
+                continue
+
+            fileReference = self.__removeFile(cacheKey)
+
+            if fileReference is None:
+                continue
+
+            try:
+                await self.__eventLoop.run_in_executor(None, self.__deleteFile, fileReference.filePath)
+            except Exception as e:
+                self.__timber.log('GlacialTtsFileRetriever', f'Failed to delete an evicted Glacial TTS file ({cacheKey=}) ({fileReference=}): {e}', e, traceback.format_exc())
+
+            await self.__glacialTtsStorageRepository.remove(
+                glacialId = cacheKey.glacialId,
+                provider = cacheKey.provider,
+            )
+
+            evictedFiles += 1
+
+        if evictedFiles == 0:
+            return
+
+        self.__evictedFiles += evictedFiles
+        self.__timber.log('GlacialTtsFileRetriever', f'Evicted {evictedFiles} Glacial TTS file(s), the cache is now {self.__cachedSizeBytes} bytes across {len(self.__files)} file(s) ({self.__maxCacheSizeBytes=})')
+
     async def findFile(
         self,
         message: str,
@@ -66,6 +161,7 @@ class GlacialTtsFileRetriever(GlacialTtsFileRetrieverInterface):
         )
 
         if glacialTtsData is None:
+            self.__misses += 1
             return None
 
         fileReference = await self.__findFile(
@@ -74,8 +170,10 @@ class GlacialTtsFileRetriever(GlacialTtsFileRetrieverInterface):
         )
 
         if fileReference is None:
+            self.__misses += 1
             return None
 
+        self.__hits += 1
         self.__timber.log('GlacialTtsFileRetriever', f'Found a Glacial TTS file to reuse ({glacialTtsData=}) ({fileReference=})')
 
         return GlacialTtsFileReference(
@@ -84,50 +182,244 @@ class GlacialTtsFileRetriever(GlacialTtsFileRetrieverInterface):
             filePath = fileReference.filePath,
         )
 
+    async def findOrCreateFile(
+        self,
+        fileExtension: str,
+        message: str,
+        voice: str | None,
+        provider: TtsProvider,
+        createFile: Callable[[GlacialTtsFileReference], Awaitable[bool]],
+    ) -> GlacialTtsFileReference | None:
+        if not utils.isValidStr(fileExtension):
+            raise TypeError(f'fileExtension argument is malformed: \"{fileExtension}\"')
+        elif not utils.isValidStr(message):
+            raise TypeError(f'message argument is malformed: \"{message}\"')
+        elif voice is not None and not isinstance(voice, str):
+            raise TypeError(f'voice argument is malformed: \"{voice}\"')
+        elif not isinstance(provider, TtsProvider):
+            raise TypeError(f'provider argument is malformed: \"{provider}\"')
+        elif not callable(createFile):
+            raise TypeError(f'createFile argument is malformed: \"{createFile}\"')
+
+        # the voice column uses NOCASE collation, so this key has to ignore the voice's casing too
+        inFlightKey = GlacialTtsFileRetriever.InFlightKey(
+            message = message,
+            voice = voice.casefold() if utils.isValidStr(voice) else None,
+            provider = provider,
+        )
+
+        inFlightFile = self.__inFlightFiles.get(inFlightKey, None)
+
+        if inFlightFile is None:
+            glacialFile = await self.findFile(
+                message = message,
+                voice = voice,
+                provider = provider,
+            )
+
+            if glacialFile is not None:
+                return glacialFile
+
+            # someone else may have started creating this same file while we were looking
+            inFlightFile = self.__inFlightFiles.get(inFlightKey, None)
+
+        if inFlightFile is not None:
+            self.__deduplicatedRequests += 1
+            return await asyncio.shield(inFlightFile)
+
+        inFlightFile = self.__eventLoop.create_future()
+        self.__inFlightFiles[inFlightKey] = inFlightFile
+
+        try:
+            glacialFile = await self.__createFile(
+                fileExtension = fileExtension,
+                message = message,
+                voice = voice,
+                provider = provider,
+                createFile = createFile,
+            )
+
+            inFlightFile.set_result(glacialFile)
+            return glacialFile
+        finally:
+            del self.__inFlightFiles[inFlightKey]
+
+            if not inFlightFile.done():
+                # Creating the file failed outright. Whoever was waiting on it will just get
+                # nothing back, and is free to try creating the file again themselves.
+                inFlightFile.set_result(None)
+
+    async def __createFile(
+        self,
+        fileExtension: str,
+        message: str,
+        voice: str | None,
+        provider: TtsProvider,
+        createFile: Callable[[GlacialTtsFileReference], Awaitable[bool]],
+    ) -> GlacialTtsFileReference | None:
+        glacialFile = await self.saveFile(
+            fileExtension = fileExtension,
+            message = message,
+            voice = voice,
+            provider = provider,
+        )
+
+        isCreated = False
+
+        try:
+            isCreated = await createFile(glacialFile)
+        finally:
+            if not isCreated:
+                await self.__forgetFile(glacialFile)
+
+        if isCreated:
+            return glacialFile
+        else:
+            return None
+
     async def __findFile(
         self,
         glacialId: str,
         provider: TtsProvider,
     ) -> FileReference | None:
-        providerFolder = await self.__ttsDirectoryProvider.getFullTtsDirectoryFor(provider)
+        await self.__loadIndex()
 
-        if not await aiofiles.ospath.exists(
-            path = providerFolder,
-            loop = self.__eventLoop,
-        ):
-            self.__timber.log('GlacialTtsFileRetriever', f'A glacial ID exists for the given TTS, but its folder does not exist ({glacialId=}) ({providerFolder=})')
-            return None
-        elif not await aiofiles.ospath.isdir(
-            s = providerFolder,
-            loop = self.__eventLoop,
-        ):
+        if provider in self.__invalidProviderFolders:
+            providerFolder = await self.__ttsDirectoryProvider.getFullTtsDirectoryFor(provider)
             self.__timber.log('GlacialTtsFileRetriever', f'A glacial ID exists for the given TTS, but its folder is not a directory ({glacialId=}) ({providerFolder=})')
             raise GlacialTtsFolderIsNotAFolder(f'A glacial ID exists for the given TTS, but its folder is not a directory ({glacialId=}) ({providerFolder=})')
 
-        directoryContents = await aiofiles.os.scandir(
-            path = providerFolder,
-            loop = self.__eventLoop,
+        cacheKey = GlacialTtsFileRetriever.CacheKey(
+            glacialId = glacialId,
+            provider = provider,
+        )
+
+        fileReference = self.__files.get(cacheKey, None)
+
+        if fileReference is None:
+            return None
+
+        # Touching the file both confirms that it still exists and keeps its modified time in
+        # step with our LRU order, so that the order survives a restart of the bot.
+        try:
+            await self.__eventLoop.run_in_executor(None, os.utime, fileReference.filePath)
+        except FileNotFoundError:
+            self.__timber.log('GlacialTtsFileRetriever', f'A Glacial TTS file has disappeared from disk ({cacheKey=}) ({fileReference=})')
+            self.__removeFile(cacheKey)
+            return None
+
+        self.__files.move_to_end(cacheKey)
+        return fileReference
+
+    async def __forgetFile(self, glacialFile: GlacialTtsFileReference):
+        self.__timber.log('GlacialTtsFileRetriever', f'Forgetting about a Glacial TTS file that failed to be created ({glacialFile=})')
+
+        self.__removeFile(GlacialTtsFileRetriever.CacheKey(
+            glacialId = glacialFile.glacialTtsData.glacialId,
+            provider = glacialFile.glacialTtsData.provider,
+        ))
+
+        try:
+            await self.__eventLoop.run_in_executor(None, self.__deleteFile, glacialFile.filePath)
+        except Exception as e:
+            self.__timber.log('GlacialTtsFileRetriever', f'Failed to delete a Glacial TTS file that failed to be created ({glacialFile=}): {e}', e, traceback.format_exc())
+
+        await self.__glacialTtsStorageRepository.remove(
+            glacialId = glacialFile.glacialTtsData.glacialId,
+            provider = glacialFile.glacialTtsData.provider,
+        )
+
+    def getCacheMetrics(self) -> GlacialTtsCacheMetrics:
+        return GlacialTtsCacheMetrics(
+            cachedFiles = len(self.__files),
+            cachedSizeBytes = self.__cachedSizeBytes,
+            deduplicatedRequests = self.__deduplicatedRequests,
+            evictedFiles = self.__evictedFiles,
+            hits = self.__hits,
+            maxCacheSizeBytes = self.__maxCacheSizeBytes,
+            misses = self.__misses,
         )
 
-        for entry in directoryContents:
-            if not entry.is_file():
+    async def __loadIndex(self):
+        if self.__isIndexLoaded:
+            return
+
+        async with self.__indexLock:
+            if self.__isIndexLoaded:
+                return
+
+            scannedFiles: list[tuple[TtsProvider, GlacialTtsFileRetriever.ScannedFile]] = list()
+
+            for provider in TtsProvider:
+                providerFolder = await self.__ttsDirectoryProvider.getFullTtsDirectoryFor(provider)
+
+                try:
+                    providerFiles = await self.__eventLoop.run_in_executor(None, self.__scanProviderFolder, providerFolder)
+                except FileNotFoundError:
+                    continue
+                except NotADirectoryError:
+                    self.__invalidProviderFolders.add(provider)
+                    continue
+
+                for scannedFile in providerFiles:
+                    scannedFiles.append((provider, scannedFile))
+
+            # The least recently touched files go first, as they're the first to be evicted.
+            scannedFiles.sort(key = lambda scannedFile: scannedFile[1].modifiedTime)
+
+            for provider, scannedFile in scannedFiles:
+                self.__addFile(
+                    cacheKey = GlacialTtsFileRetriever.CacheKey(
+                        glacialId = scannedFile.glacialId,
+                        provider = provider,
+                    ),
+                    fileReference = GlacialTtsFileRetriever.FileReference(
+                        fileName = scannedFile.fileName,
+                        filePath = scannedFile.filePath,
+                        sizeBytes = scannedFile.sizeBytes,
+                    ),
+                )
+
+            self.__isIndexLoaded = True
+            self.__timber.log('GlacialTtsFileRetriever', f'Indexed {len(self.__files)} Glacial TTS file(s) totalling {self.__cachedSizeBytes} bytes')
+
+    def __removeFile(self, cacheKey: CacheKey) -> FileReference | None:
+        fileReference = self.__files.pop(cacheKey, None)
+
+        if fileReference is None:
+            return None
+        elif fileReference.sizeBytes is None:
+            self.__unsizedFiles.discard(cacheKey)
+        else:
+            self.__cachedSizeBytes -= fileReference.sizeBytes
+
+        return fileReference
+
+    async def __resolveUnsizedFiles(self, protectedKey: CacheKey):
+        for cacheKey in list(self.__unsizedFiles):
+            if cacheKey == protectedKey:
                 continue
 
-            fileNameWithoutExtensionMatch = self.__fileNameWithoutExtensionRegEx.fullmatch(entry.name)
-            if fileNameWithoutExtensionMatch is None:
+            fileReference = self.__files.get(cacheKey, None)
+
+            if fileReference is None:
+                self.__unsizedFiles.discard(cacheKey)
                 continue
 
-            fileNameWithoutExtension = fileNameWithoutExtensionMatch.group(1)
-            if not utils.isValidStr(fileNameWithoutExtension):
+            try:
+                statResult = await self.__eventLoop.run_in_executor(None, os.stat, fileReference.filePath)
+            except FileNotFoundError:
+                # the file hasn't been written (yet?), so leave it for the next pass
                 continue
 
-            if glacialId == fileNameWithoutExtension:
-                return GlacialTtsFileRetriever.FileReference(
-                    fileName = entry.name,
-                    filePath = f'{providerFolder}/{entry.name}',
-                )
+            self.__unsizedFiles.discard(cacheKey)
+            self.__cachedSizeBytes += statResult.st_size
 
-        return None
+            self.__files[cacheKey] = GlacialTtsFileRetriever.FileReference(
+                fileName = fileReference.fileName,
+                filePath = fileReference.filePath,
+                sizeBytes = statResult.st_size,
+            )
 
     async def saveFile(
         self,
@@ -151,11 +443,15 @@ class GlacialTtsFileRetriever(GlacialTtsFileRetrieverInterface):
             provider = provider,
         )
 
-        glacialTtsFileReference = await self.__findFile(
+        await self.__loadIndex()
+
+        cacheKey = GlacialTtsFileRetriever.CacheKey(
             glacialId = glacialTtsData.glacialId,
             provider = provider,
         )
 
+        glacialTtsFileReference = self.__files.get(cacheKey, None)
+
         if glacialTtsFileReference is not None:
             self.__timber.log('GlacialTtsFileRetriever', f'Clobbering a TTS file that already exists for the given arguments ({fileExtension=}) ({message=}) ({voice=}) ({provider=}) ({glacialTtsData=}) ({glacialTtsFileReference=})')
 
@@ -163,8 +459,47 @@ class GlacialTtsFileRetriever(GlacialTtsFileRetrieverInterface):
         fileName = f'{glacialTtsData.glacialId}.{fileExtension}'
         filePath = f'{providerFolder}/{fileName}'
 
+        self.__addFile(
+            cacheKey = cacheKey,
+            fileReference = GlacialTtsFileRetriever.FileReference(
+                fileName = fileName,
+                filePath = filePath,
+                sizeBytes = None,
+            ),
+        )
+
+        await self.__evictFilesIfNecessary(cacheKey)
+
         return GlacialTtsFileReference(
             glacialTtsData = glacialTtsData,
             fileName = fileName,
             filePath = filePath,
         )
+
+    def __scanProviderFolder(self, providerFolder: str) -> list[ScannedFile]:
+        scannedFiles: list[GlacialTtsFileRetriever.ScannedFile] = list()
+
+        with os.scandir(providerFolder) as directoryContents:
+            for entry in directoryContents:
+                if not entry.is_file():
+                    continue
+
+                fileNameWithoutExtensionMatch = self.__fileNameWithoutExtensionRegEx.fullmatch(entry.name)
+                if fileNameWithoutExtensionMatch is None:
+                    continue
+
+                fileNameWithoutExtension = fileNameWithoutExtensionMatch.group(1)
+                if not utils.isValidStr(fileNameWithoutExtension):
+                    continue
+
+                statResult = entry.stat()
+
+                scannedFiles.append(GlacialTtsFileRetriever.ScannedFile(
+                    fileName = entry.name,
+                    filePath = f'{providerFolder}/{entry.name}',
+                    glacialId = fileNameWithoutExtension,
+                    modifiedTime = statResult.st_mtime,
+                    sizeBytes = statResult.st_size,
+                ))
+
+        return scannedFiles
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
 
+from ..models.glacialTtsCacheMetrics import GlacialTtsCacheMetrics
 from ..models.glacialTtsFileReference import GlacialTtsFileReference
 from ...tts.models.ttsProvider import TtsProvider
 
@@ -15,6 +17,21 @@ class GlacialTtsFileRetrieverInterface(ABC):
     ) -> GlacialTtsFileReference | None:
         pass
 
+    @abstractmethod
+    async def findOrCreateFile(
+        self,
+        fileExtension: str,
+        message: str,
+        voice: str | None,
+        provider: TtsProvider,
+        createFile: Callable[[GlacialTtsFileReference], Awaitable[bool]],
+    ) -> GlacialTtsFileReference | None:
+        pass
+
+    @abstractmethod
+    def getCacheMetrics(self) -> GlacialTtsCacheMetrics:
+        pass
+
     @abstractmethod
     async def saveFile(
         self,
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class GlacialTtsCacheMetrics:
+    cachedFiles: int
+    cachedSizeBytes: int
+    deduplicatedRequests: int
+    evictedFiles: int
+    hits: int
+    maxCacheSizeBytes: int
+    misses: int
+
+    @property
+    def hitRate(self) -> float:
+        lookups = self.hits + self.misses
+
+        if lookups == 0:
+            return 0
+
+        return self.hits / lookups
@@ -1,3 +1,6 @@
+import asyncio
+import traceback
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Final
 
@@ -16,6 +19,12 @@ from ...tts.models.ttsProvider import TtsProvider
 
 class GlacialTtsStorageRepository(GlacialTtsStorageRepositoryInterface):
 
+    @dataclass(frozen = True)
+    class CacheKey:
+        message: str
+        voice: str | None
+        provider: TtsProvider
+
     def __init__(
         self,
         glacialTtsDataMapper: GlacialTtsDataMapperInterface,
@@ -41,7 +50,11 @@ class GlacialTtsStorageRepository(GlacialTtsStorageRepositoryInterface):
         self.__timeZoneRepository: Final[TimeZoneRepositoryInterface] = timeZoneRepository
         self.__databaseFile: Final[str] = databaseFile
 
-        self.__isDatabaseReady: bool = False
+        self.__cacheLock: Final[asyncio.Lock] = asyncio.Lock()
+        self.__connectionLock: Final[asyncio.Lock] = asyncio.Lock()
+        self.__cache: Final[dict[GlacialTtsStorageRepository.CacheKey, GlacialTtsData]] = dict()
+        self.__connection: Connection | None = None
+        self.__isCacheLoaded: bool = False
 
     async def add(
         self,
@@ -87,7 +100,6 @@ class GlacialTtsStorageRepository(GlacialTtsStorageRepositoryInterface):
         )
 
         await connection.commit()
-        await connection.close()
 
         glacialTtsData = GlacialTtsData(
             storeDateTime = storeDateTime,
@@ -97,8 +109,34 @@ class GlacialTtsStorageRepository(GlacialTtsStorageRepositoryInterface):
             provider = provider,
         )
 
+        self.__cache[self.__createCacheKey(message, voice, provider)] = glacialTtsData
         return glacialTtsData
 
+    async def close(self):
+        connection = self.__connection
+        self.__connection = None
+
+        if connection is not None:
+            await connection.close()
+
+    def __createCacheKey(
+        self,
+        message: str,
+        voice: str | None,
+        provider: TtsProvider,
+    ) -> CacheKey:
+        # the voice column uses NOCASE collation, so lookups must ignore its casing too
+        if utils.isValidStr(voice):
+            voice = voice.casefold()
+        else:
+            voice = None
+
+        return GlacialTtsStorageRepository.CacheKey(
+            message = message,
+            voice = voice,
+            provider = provider,
+        )
+
     async def get(
         self,
         message: str,
@@ -112,71 +150,99 @@ class GlacialTtsStorageRepository(GlacialTtsStorageRepositoryInterface):
         elif not isinstance(provider, TtsProvider):
             raise TypeError(f'provider argument is malformed: \"{provider}\"')
 
-        connection = await self.__getDatabaseConnection()
-        providerString = await self.__glacialTtsDataMapper.toDatabaseName(provider)
+        await self.__loadCache()
+        glacialTtsData = self.__cache.get(self.__createCacheKey(message, voice, provider), None)
+
+        if glacialTtsData is None:
+            return None
+
+        return GlacialTtsData(
+            storeDateTime = glacialTtsData.storeDateTime,
+            glacialId = glacialTtsData.glacialId,
+            message = message,
+            voice = voice,
+            provider = provider,
+        )
+
+    async def __getDatabaseConnection(self) -> Connection:
+        connection = self.__connection
+
+        if connection is not None:
+            return connection
+
+        async with self.__connectionLock:
+            connection = self.__connection
+
+            if connection is not None:
+                return connection
+
+            connection = await aiosqlite.connect(self.__databaseFile)
 
-        if utils.isValidStr(voice):
             cursor = await connection.execute(
                 '''
-                    SELECT storeDateTime, glacialId FROM glacialTtsStorage
-                    WHERE message = $1 AND provider = $2 AND voice = $3
-                    LIMIT 1
-                ''',
-                ( message, providerString, voice, ),
+                    CREATE TABLE IF NOT EXISTS glacialTtsStorage (
+                        storeDateTime TEXT NOT NULL,
+                        glacialId TEXT NOT NULL,
+                        message TEXT NOT NULL,
+                        provider TEXT NOT NULL,
+                        voice TEXT DEFAULT NULL COLLATE NOCASE,
+                        PRIMARY KEY (glacialId, provider)
+                    ) STRICT
+                '''
             )
-        else:
+
+            await cursor.close()
+
             cursor = await connection.execute(
                 '''
-                    SELECT storeDateTime, glacialId FROM glacialTtsStorage
-                    WHERE message = $1 AND provider = $2 AND voice is NULL
-                    LIMIT 1
-                ''',
-                ( message, providerString, ),
+                    CREATE INDEX IF NOT EXISTS glacialTtsStorage_message_provider_voice
+                    ON glacialTtsStorage (message, provider, voice)
+                '''
             )
 
-        row = await cursor.fetchone()
-        await cursor.close()
+            await cursor.close()
+            await connection.commit()
 
-        glacialTtsData: GlacialTtsData | None = None
+            self.__connection = connection
+            return connection
 
-        if row is not None and len(row) >= 1:
-            storeDateTime = datetime.fromisoformat(row[0])
+    async def __loadCache(self):
+        if self.__isCacheLoaded:
+            return
 
-            glacialTtsData = GlacialTtsData(
-                storeDateTime = storeDateTime,
-                glacialId = row[1],
-                message = message,
-                voice = voice,
-                provider = provider,
-            )
+        async with self.__cacheLock:
+            if self.__isCacheLoaded:
+                return
 
-        await connection.close()
-        return glacialTtsData
+            connection = await self.__getDatabaseConnection()
+            cursor = await connection.execute(
+                '''
+                    SELECT storeDateTime, glacialId, message, provider, voice FROM glacialTtsStorage
+                '''
+            )
 
-    async def __getDatabaseConnection(self) -> Connection:
-        connection = await aiosqlite.connect(self.__databaseFile)
+            rows = await cursor.fetchall()
+            await cursor.close()
 
-        if self.__isDatabaseReady:
-            return connection
+            for row in rows:
+                try:
+                    provider = await self.__glacialTtsDataMapper.fromDatabaseName(row[3])
+                except ValueError as e:
+                    self.__timber.log('GlacialTtsStorageRepository', f'Skipping a stored TTS with an unknown provider ({row=}): {e}', e, traceback.format_exc())
+                    continue
 
-        self.__isDatabaseReady = True
+                glacialTtsData = GlacialTtsData(
+                    storeDateTime = datetime.fromisoformat(row[0]),
+                    glacialId = row[1],
+                    message = row[2],
+                    voice = row[4],
+                    provider = provider,
+                )
 
-        cursor = await connection.execute(
-            '''
-                CREATE TABLE IF NOT EXISTS glacialTtsStorage (
-                    storeDateTime TEXT NOT NULL,
-                    glacialId TEXT NOT NULL,
-                    message TEXT NOT NULL,
-                    provider TEXT NOT NULL,
-                    voice TEXT DEFAULT NULL COLLATE NOCASE,
-                    PRIMARY KEY (glacialId, provider)
-                ) STRICT
-            '''
-        )
+                self.__cache[self.__createCacheKey(glacialTtsData.message, glacialTtsData.voice, provider)] = glacialTtsData
 
-        await cursor.close()
-        await connection.commit()
-        return connection
+            self.__isCacheLoaded = True
+            self.__timber.log('GlacialTtsStorageRepository', f'Loaded {len(self.__cache)} stored TTS entries into memory')
 
     async def remove(
         self,
@@ -203,28 +269,26 @@ class GlacialTtsStorageRepository(GlacialTtsStorageRepositoryInterface):
         row = await cursor.fetchone()
         await cursor.close()
 
-        glacialTtsData: GlacialTtsData | None = None
-
-        if row is not None and len(row) >= 1:
-            storeDateTime = datetime.fromisoformat(row[0])
+        if row is None or len(row) == 0:
+            return None
 
-            glacialTtsData = GlacialTtsData(
-                storeDateTime = storeDateTime,
-                glacialId = glacialId,
-                message = row[1],
-                voice = row[2],
-                provider = provider,
-            )
+        glacialTtsData = GlacialTtsData(
+            storeDateTime = datetime.fromisoformat(row[0]),
+            glacialId = glacialId,
+            message = row[1],
+            voice = row[2],
+            provider = provider,
+        )
 
-            await connection.execute(
-                '''
-                    DELETE FROM glacialTtsStorage
-                    WHERE glacialId = $1 AND provider = $2
-                ''',
-                ( glacialId, providerString, ),
-            )
+        await connection.execute(
+            '''
+                DELETE FROM glacialTtsStorage
+                WHERE glacialId = $1 AND provider = $2
+            ''',
+            ( glacialId, providerString, ),
+        )
 
-            await connection.commit()
+        await connection.commit()
 
-        await connection.close()
+        self.__cache.pop(self.__createCacheKey(glacialTtsData.message, glacialTtsData.voice, provider), None)
         return glacialTtsData
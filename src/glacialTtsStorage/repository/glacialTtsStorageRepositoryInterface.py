@@ -15,6 +15,10 @@ class GlacialTtsStorageRepositoryInterface(ABC):
     ) -> GlacialTtsData:
         pass
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @abstractmethod
     async def get(
         self,
@@ -1,9 +1,10 @@
 import re
 import uuid
 from datetime import datetime
-from typing import Final, Pattern
+from typing import Awaitable, Callable, Final, Pattern
 
 from ..fileRetriever.glacialTtsFileRetrieverInterface import GlacialTtsFileRetrieverInterface
+from ..models.glacialTtsCacheMetrics import GlacialTtsCacheMetrics
 from ..models.glacialTtsData import GlacialTtsData
 from ..models.glacialTtsFileReference import GlacialTtsFileReference
 from ...location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
@@ -42,10 +43,41 @@ class StubGlacialTtsFileRetriever(GlacialTtsFileRetrieverInterface):
         # this method is intentionally empty
         return None
 
+    async def findOrCreateFile(
+        self,
+        fileExtension: str,
+        message: str,
+        voice: str | None,
+        provider: TtsProvider,
+        createFile: Callable[[GlacialTtsFileReference], Awaitable[bool]],
+    ) -> GlacialTtsFileReference | None:
+        glacialFile = await self.saveFile(
+            fileExtension = fileExtension,
+            message = message,
+            voice = voice,
+            provider = provider,
+        )
+
+        if await createFile(glacialFile):
+            return glacialFile
+        else:
+            return None
+
     async def __generateRandomId(self) -> str:
         randomUuid = self.__fileNameRegEx.sub('', str(uuid.uuid4()))
         return randomUuid.casefold()
 
+    def getCacheMetrics(self) -> GlacialTtsCacheMetrics:
+        return GlacialTtsCacheMetrics(
+            cachedFiles = 0,
+            cachedSizeBytes = 0,
+            deduplicatedRequests = 0,
+            evictedFiles = 0,
+            hits = 0,
+            maxCacheSizeBytes = 0,
+            misses = 0,
+        )
+
     async def saveFile(
         self,
         fileExtension: str,
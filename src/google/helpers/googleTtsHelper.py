@@ -29,6 +29,7 @@ from ..models.googleVoicePreset import GoogleVoicePreset
 from ..models.googleVoiceSelectionParams import GoogleVoiceSelectionParams
 from ..settings.googleSettingsRepositoryInterface import GoogleSettingsRepositoryInterface
 from ...glacialTtsStorage.fileRetriever.glacialTtsFileRetrieverInterface import GlacialTtsFileRetrieverInterface
+from ...glacialTtsStorage.models.glacialTtsFileReference import GlacialTtsFileReference
 from ...misc import utils as utils
 from ...timber.timberInterface import TimberInterface
 from ...tts.models.ttsProvider import TtsProvider
@@ -253,6 +254,28 @@ class GoogleTtsHelper(GoogleTtsHelperInterface):
         chosenSpeakerCharacters.freeze()
         return chosenSpeakerCharacters
 
+    async def __createSpeechFile(
+        self,
+        glacialFile: GlacialTtsFileReference,
+        fullMessage: str,
+        googleSpeechRequest: GoogleSpeechRequestData,
+    ) -> bool:
+        speechBytes = await self.__googleTtsApiHelper.getSpeech(
+            request = googleSpeechRequest.synthesizeRequest,
+        )
+
+        if speechBytes is None:
+            return False
+        elif await self.__saveSpeechBytes(
+            speechBytes = speechBytes,
+            fileName = glacialFile.fileName,
+            filePath = glacialFile.filePath,
+        ):
+            return True
+        else:
+            self.__timber.log('GoogleTtsHelper', f'Failed to write Google TTS speechBytes to file ({fullMessage=}) ({glacialFile=})')
+            return False
+
     async def generateTts(
         self,
         voicePreset: AbsGoogleVoicePreset | None,
@@ -292,50 +315,30 @@ class GoogleTtsHelper(GoogleTtsHelperInterface):
             fullMessage = fullMessage,
         )
 
-        glacialFile = await self.__glacialTtsFileRetriever.findFile(
-            message = fullMessage,
-            voice = googleSpeechRequest.voicePreset.fullName,
-            provider = TtsProvider.GOOGLE,
-        )
-
-        if glacialFile is not None:
-            return GoogleTtsFileReference(
-                storeDateTime = glacialFile.storeDateTime,
-                filePath = glacialFile.filePath,
-                voicePreset = await self.__googleJsonMapper.requireVoicePreset(glacialFile.voice),
-            )
-
-        speechBytes = await self.__googleTtsApiHelper.getSpeech(
-            request = googleSpeechRequest.synthesizeRequest,
-        )
-
-        if speechBytes is None:
-            return None
-
         audioEncoding = await self.__googleSettingsRepository.getVoiceAudioEncoding()
         fileExtension = await self.__googleFileExtensionHelper.getFileExtension(audioEncoding)
 
-        glacialFile = await self.__glacialTtsFileRetriever.saveFile(
+        glacialFile = await self.__glacialTtsFileRetriever.findOrCreateFile(
             fileExtension = fileExtension,
             message = fullMessage,
             voice = await self.__googleJsonMapper.serializeVoicePreset(googleSpeechRequest.voicePreset),
             provider = TtsProvider.GOOGLE,
+            createFile = lambda glacialFile: self.__createSpeechFile(
+                glacialFile = glacialFile,
+                fullMessage = fullMessage,
+                googleSpeechRequest = googleSpeechRequest,
+            ),
         )
 
-        if await self.__saveSpeechBytes(
-            speechBytes = speechBytes,
-            fileName = glacialFile.fileName,
-            filePath = glacialFile.filePath,
-        ):
-            return GoogleTtsFileReference(
-                storeDateTime = glacialFile.storeDateTime,
-                voicePreset = googleSpeechRequest.voicePreset,
-                filePath = glacialFile.filePath,
-            )
-        else:
-            self.__timber.log('GoogleTtsHelper', f'Failed to write Google TTS speechBytes to file ({googleSpeechRequest=})')
+        if glacialFile is None:
             return None
 
+        return GoogleTtsFileReference(
+            storeDateTime = glacialFile.storeDateTime,
+            voicePreset = googleSpeechRequest.voicePreset,
+            filePath = glacialFile.filePath,
+        )
+
     async def __saveSpeechBytes(
         self,
         speechBytes: bytes,
@@ -16,6 +16,7 @@ from ..parser.microsoftTtsJsonParserInterface import MicrosoftTtsJsonParserInter
 from ..parser.microsoftTtsMessageVoiceParserInterface import MicrosoftTtsMessageVoiceParserInterface
 from ..settings.microsoftTtsSettingsRepositoryInterface import MicrosoftTtsSettingsRepositoryInterface
 from ...glacialTtsStorage.fileRetriever.glacialTtsFileRetrieverInterface import GlacialTtsFileRetrieverInterface
+from ...glacialTtsStorage.models.glacialTtsFileReference import GlacialTtsFileReference
 from ...misc import utils as utils
 from ...timber.timberInterface import TimberInterface
 from ...tts.models.ttsProvider import TtsProvider
@@ -96,6 +97,29 @@ class MicrosoftTtsHelper(MicrosoftTtsHelperInterface):
         else:
             return None
 
+    async def __createSpeechFile(
+        self,
+        glacialFile: GlacialTtsFileReference,
+        fullMessage: str,
+        voice: MicrosoftTtsVoice,
+    ) -> bool:
+        speechBytes = await self.__microsoftTtsApiHelper.getSpeech(
+            voice = voice,
+            message = fullMessage
+        )
+
+        if speechBytes is None:
+            return False
+        elif await self.__saveSpeechBytes(
+            speechBytes = speechBytes,
+            fileName = glacialFile.fileName,
+            filePath = glacialFile.filePath,
+        ):
+            return True
+        else:
+            self.__timber.log('MicrosoftTtsHelper', f'Failed to write Microsoft TTS speechBytes to file ({fullMessage=}) ({glacialFile=})')
+            return False
+
     async def generateTts(
         self,
         voice: MicrosoftTtsVoice | None,
@@ -135,48 +159,27 @@ class MicrosoftTtsHelper(MicrosoftTtsHelperInterface):
         if not utils.isValidStr(fullMessage):
             return None
 
-        glacialFile = await self.__glacialTtsFileRetriever.findFile(
+        glacialFile = await self.__glacialTtsFileRetriever.findOrCreateFile(
+            fileExtension = await self.__microsoftTtsSettingsRepository.getFileExtension(),
             message = fullMessage,
             voice = await self.__microsoftTtsJsonParser.serializeVoice(voice),
-            provider = TtsProvider.MICROSOFT
+            provider = TtsProvider.MICROSOFT,
+            createFile = lambda glacialFile: self.__createSpeechFile(
+                glacialFile = glacialFile,
+                fullMessage = fullMessage,
+                voice = voice,
+            ),
         )
 
-        if glacialFile is not None:
-            return MicrosoftTtsFileReference(
-                storeDateTime = glacialFile.storeDateTime,
-                filePath = glacialFile.filePath,
-                voice = await self.__microsoftTtsJsonParser.requireVoice(glacialFile.voice)
-            )
-
-        speechBytes = await self.__microsoftTtsApiHelper.getSpeech(
-            voice = voice,
-            message = fullMessage
-        )
-
-        if speechBytes is None:
+        if glacialFile is None:
             return None
 
-        glacialFile = await self.__glacialTtsFileRetriever.saveFile(
-            fileExtension = await self.__microsoftTtsSettingsRepository.getFileExtension(),
-            message = fullMessage,
-            voice = await self.__microsoftTtsJsonParser.serializeVoice(voice),
-            provider = TtsProvider.MICROSOFT
+        return MicrosoftTtsFileReference(
+            storeDateTime = glacialFile.storeDateTime,
+            filePath = glacialFile.filePath,
+            voice = voice
         )
 
-        if await self.__saveSpeechBytes(
-            speechBytes = speechBytes,
-            fileName = glacialFile.fileName,
-            filePath = glacialFile.filePath
-        ):
-            return MicrosoftTtsFileReference(
-                storeDateTime = glacialFile.storeDateTime,
-                filePath = glacialFile.filePath,
-                voice = voice
-            )
-        else:
-            self.__timber.log('MicrosoftTtsHelper', f'Failed to write Microsoft TTS speechBytes to file ({fullMessage=}) ({glacialFile=})')
-            return None
-
     async def __saveSpeechBytes(
         self,
         speechBytes: bytes,
@@ -16,6 +16,7 @@ from ..parser.microsoftSamJsonParserInterface import MicrosoftSamJsonParserInter
 from ..parser.microsoftSamMessageVoiceParserInterface import MicrosoftSamMessageVoiceParserInterface
 from ..settings.microsoftSamSettingsRepositoryInterface import MicrosoftSamSettingsRepositoryInterface
 from ...glacialTtsStorage.fileRetriever.glacialTtsFileRetrieverInterface import GlacialTtsFileRetrieverInterface
+from ...glacialTtsStorage.models.glacialTtsFileReference import GlacialTtsFileReference
 from ...misc import utils as utils
 from ...timber.timberInterface import TimberInterface
 from ...tts.models.ttsProvider import TtsProvider
@@ -96,6 +97,29 @@ class MicrosoftSamHelper(MicrosoftSamHelperInterface):
         else:
             return None
 
+    async def __createSpeechFile(
+        self,
+        glacialFile: GlacialTtsFileReference,
+        fullMessage: str,
+        voice: MicrosoftSamVoice,
+    ) -> bool:
+        speechBytes = await self.__microsoftSamApiHelper.getSpeech(
+            voice = voice,
+            message = fullMessage,
+        )
+
+        if speechBytes is None:
+            return False
+        elif await self.__saveSpeechBytes(
+            speechBytes = speechBytes,
+            fileName = glacialFile.fileName,
+            filePath = glacialFile.filePath,
+        ):
+            return True
+        else:
+            self.__timber.log('MicrosoftSamHelper', f'Failed to write Microsoft Sam TTS speechBytes to file ({fullMessage=}) ({glacialFile=})')
+            return False
+
     async def generateTts(
         self,
         voice: MicrosoftSamVoice | None,
@@ -135,47 +159,26 @@ class MicrosoftSamHelper(MicrosoftSamHelperInterface):
         if not utils.isValidStr(fullMessage):
             return None
 
-        glacialFile = await self.__glacialTtsFileRetriever.findFile(
+        glacialFile = await self.__glacialTtsFileRetriever.findOrCreateFile(
+            fileExtension = await self.__microsoftSamSettingsRepository.getFileExtension(),
             message = fullMessage,
             voice = await self.__microsoftSamJsonParser.serializeVoice(voice),
             provider = TtsProvider.MICROSOFT_SAM,
+            createFile = lambda glacialFile: self.__createSpeechFile(
+                glacialFile = glacialFile,
+                fullMessage = fullMessage,
+                voice = voice,
+            ),
         )
 
-        if glacialFile is not None:
-            return MicrosoftSamFileReference(
-                storeDateTime = glacialFile.storeDateTime,
-                voice = await self.__microsoftSamJsonParser.requireVoice(glacialFile.voice),
-                filePath = glacialFile.filePath,
-            )
-
-        speechBytes = await self.__microsoftSamApiHelper.getSpeech(
-            voice = voice,
-            message = fullMessage,
-        )
-
-        if speechBytes is None:
+        if glacialFile is None:
             return None
 
-        glacialFile = await self.__glacialTtsFileRetriever.saveFile(
-            fileExtension = await self.__microsoftSamSettingsRepository.getFileExtension(),
-            message = fullMessage,
-            voice = await self.__microsoftSamJsonParser.serializeVoice(voice),
-            provider = TtsProvider.MICROSOFT_SAM,
-        )
-
-        if await self.__saveSpeechBytes(
-            speechBytes = speechBytes,
-            fileName = glacialFile.fileName,
+        return MicrosoftSamFileReference(
+            storeDateTime = glacialFile.storeDateTime,
+            voice = voice,
             filePath = glacialFile.filePath,
-        ):
-            return MicrosoftSamFileReference(
-                storeDateTime = glacialFile.storeDateTime,
-                voice = voice,
-                filePath = glacialFile.filePath,
-            )
-        else:
-            self.__timber.log('MicrosoftSamHelper', f'Failed to write Microsoft Sam TTS speechBytes to file ({fullMessage=}) ({glacialFile=})')
-            return None
+        )
 
     async def __saveSpeechBytes(
         self,
@@ -13,13 +13,14 @@ class BackgroundTaskHelper(BackgroundTaskHelperInterface):
         self.__eventLoop: Final[AbstractEventLoop] = eventLoop
         self.__backgroundTasks: Final[set[Task]] = set()
 
-    def createTask(self, coro: Coroutine):
+    def createTask(self, coro: Coroutine) -> Task:
         if not isinstance(coro, Coroutine):
             raise TypeError(f'coro argument is malformed: \"{coro}\"')
 
         task = self.__eventLoop.create_task(coro)
         self.__backgroundTasks.add(task)
         task.add_done_callback(self.__backgroundTasks.discard)
+        return task
 
     @property
     def eventLoop(self) -> AbstractEventLoop:
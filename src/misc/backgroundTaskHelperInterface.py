@@ -1,12 +1,12 @@
 from abc import ABC, abstractmethod
-from asyncio import AbstractEventLoop
+from asyncio import AbstractEventLoop, Task
 from typing import Coroutine
 
 
 class BackgroundTaskHelperInterface(ABC):
 
     @abstractmethod
-    def createTask(self, coro: Coroutine):
+    def createTask(self, coro: Coroutine) -> Task:
         pass
 
     @property
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+
+class Flushable(ABC):
+
+    @abstractmethod
+    async def flush(self):
+        pass
@@ -0,0 +1,79 @@
+import traceback
+from collections import deque
+from typing import Any, Callable, Coroutine, Final, Generic, TypeVar
+
+from frozendict import frozendict
+
+from . import utils as utils
+from .backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..timber.timberInterface import TimberInterface
+
+T = TypeVar('T')
+
+
+class KeyedLanes(Generic[T]):
+
+    # Items that share a key are always handed to the lane handler one at a time and in the
+    # order that they were submitted in, but each key gets its own lane, so a slow item for one
+    # key doesn't hold up any of the others. A lane's task only lives for as long as its lane
+    # has items in it, and it's recreated as soon as a new item for that key arrives.
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
+        laneHandler: Callable[[str, T], Coroutine[Any, Any, None]],
+        timber: TimberInterface,
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not callable(laneHandler):
+            raise TypeError(f'laneHandler argument is malformed: \"{laneHandler}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+
+        self.__backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = backgroundTaskHelper
+        self.__laneHandler: Final[Callable[[str, T], Coroutine[Any, Any, None]]] = laneHandler
+        self.__timber: Final[TimberInterface] = timber
+
+        self.__lanes: Final[dict[str, deque[T]]] = dict()
+
+    def __len__(self) -> int:
+        return sum(len(lane) for lane in self.__lanes.values())
+
+    def getQueueDepths(self) -> frozendict[str, int]:
+        queueDepths: dict[str, int] = dict()
+
+        for key, lane in self.__lanes.items():
+            queueDepths[key] = len(lane)
+
+        return frozendict(queueDepths)
+
+    async def __startLane(self, key: str):
+        lane = self.__lanes[key]
+
+        try:
+            while len(lane) >= 1:
+                item = lane.popleft()
+
+                try:
+                    await self.__laneHandler(key, item)
+                except Exception as e:
+                    self.__timber.log('KeyedLanes', f'Encountered unknown Exception when handling lane item ({key=}) ({len(lane)=}) ({item=}): {e}', e, traceback.format_exc())
+        finally:
+            del self.__lanes[key]
+
+    def submit(self, key: str, item: T):
+        if not utils.isValidStr(key):
+            raise TypeError(f'key argument is malformed: \"{key}\"')
+
+        lane = self.__lanes.get(key, None)
+
+        if lane is not None:
+            # this key's lane is already running, and will pick this item up in order
+            lane.append(item)
+            return
+
+        lane = deque()
+        lane.append(item)
+        self.__lanes[key] = lane
+        self.__backgroundTaskHelper.createTask(self.__startLane(key))
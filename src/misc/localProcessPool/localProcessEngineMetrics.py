@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class LocalProcessEngineMetrics:
+    p95DurationSeconds: float
+    throughputPerMinute: float
+    completedProcesses: int
+    failedProcesses: int
+    retriedProcesses: int
+    timedOutProcesses: int
@@ -0,0 +1,268 @@
+import asyncio
+import itertools
+import math
+import time
+import traceback
+from asyncio.subprocess import Process
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Collection, Final
+
+from frozendict import frozendict
+
+from .localProcessEngineMetrics import LocalProcessEngineMetrics
+from .localProcessPoolInterface import LocalProcessPoolInterface
+from .localProcessPoolMetrics import LocalProcessPoolMetrics
+from .localProcessPriority import LocalProcessPriority
+from .localProcessResult import LocalProcessResult
+from .. import utils as utils
+from ..backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ...timber.timberInterface import TimberInterface
+
+
+class LocalProcessPool(LocalProcessPoolInterface):
+
+    @dataclass(frozen = True)
+    class QueuedProcess:
+        future: asyncio.Future[LocalProcessResult]
+        timeoutSeconds: float
+        maxAttempts: int
+        arguments: tuple[str, ...]
+        engineName: str
+
+    @dataclass
+    class EngineStats:
+        durations: deque[float] = field(default_factory = lambda: deque(maxlen = 256))
+        completionTimes: deque[float] = field(default_factory = deque)
+        completedProcesses: int = 0
+        failedProcesses: int = 0
+        retriedProcesses: int = 0
+        timedOutProcesses: int = 0
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
+        timber: TimberInterface,
+        maxConcurrentProcesses: int = 2,
+        throughputWindowSeconds: float = 60,
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidInt(maxConcurrentProcesses):
+            raise TypeError(f'maxConcurrentProcesses argument is malformed: \"{maxConcurrentProcesses}\"')
+        elif maxConcurrentProcesses < 1 or maxConcurrentProcesses > 32:
+            raise ValueError(f'maxConcurrentProcesses argument is out of bounds: {maxConcurrentProcesses}')
+        elif not utils.isValidNum(throughputWindowSeconds):
+            raise TypeError(f'throughputWindowSeconds argument is malformed: \"{throughputWindowSeconds}\"')
+        elif throughputWindowSeconds < 1 or throughputWindowSeconds > 3600:
+            raise ValueError(f'throughputWindowSeconds argument is out of bounds: {throughputWindowSeconds}')
+
+        self.__backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = backgroundTaskHelper
+        self.__timber: Final[TimberInterface] = timber
+        self.__maxConcurrentProcesses: Final[int] = maxConcurrentProcesses
+        self.__throughputWindowSeconds: Final[float] = throughputWindowSeconds
+
+        self.__queue: Final[asyncio.PriorityQueue[tuple[int, int, LocalProcessPool.QueuedProcess]]] = asyncio.PriorityQueue()
+        self.__sequence: Final[itertools.count[int]] = itertools.count()
+        self.__engineStats: Final[dict[str, LocalProcessPool.EngineStats]] = dict()
+        self.__isStarted: bool = False
+        self.__runningProcesses: int = 0
+
+    def __getEngineStats(self, engineName: str) -> EngineStats:
+        engineStats = self.__engineStats.get(engineName, None)
+
+        if engineStats is None:
+            engineStats = LocalProcessPool.EngineStats()
+            self.__engineStats[engineName] = engineStats
+
+        return engineStats
+
+    def getMetrics(self) -> LocalProcessPoolMetrics:
+        now = time.monotonic()
+        engineMetrics: dict[str, LocalProcessEngineMetrics] = dict()
+
+        for engineName, engineStats in self.__engineStats.items():
+            self.__pruneCompletionTimes(engineStats, now)
+
+            p95DurationSeconds = 0.0
+
+            if len(engineStats.durations) >= 1:
+                durations = sorted(engineStats.durations)
+                p95DurationSeconds = durations[math.ceil(len(durations) * 0.95) - 1]
+
+            engineMetrics[engineName] = LocalProcessEngineMetrics(
+                p95DurationSeconds = p95DurationSeconds,
+                throughputPerMinute = len(engineStats.completionTimes) * 60 / self.__throughputWindowSeconds,
+                completedProcesses = engineStats.completedProcesses,
+                failedProcesses = engineStats.failedProcesses,
+                retriedProcesses = engineStats.retriedProcesses,
+                timedOutProcesses = engineStats.timedOutProcesses,
+            )
+
+        return LocalProcessPoolMetrics(
+            engineMetrics = frozendict(engineMetrics),
+            maxConcurrentProcesses = self.__maxConcurrentProcesses,
+            queuedProcesses = self.__queue.qsize(),
+            runningProcesses = self.__runningProcesses,
+        )
+
+    async def __killProcess(self, engineName: str, process: Process):
+        if process.returncode is not None:
+            return
+
+        # the process is launched directly rather than through a shell, so there's no
+        # intermediate shell process whose children would also need to be hunted down
+        self.__timber.log('LocalProcessPool', f'Killing {engineName} process ({process=})...')
+
+        try:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), timeout = 1)
+        except ProcessLookupError:
+            pass
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+
+        self.__timber.log('LocalProcessPool', f'Finished killing {engineName} process ({process=}) ({process.returncode=})')
+
+    def __pruneCompletionTimes(self, engineStats: EngineStats, now: float):
+        while len(engineStats.completionTimes) >= 1 and now - engineStats.completionTimes[0] > self.__throughputWindowSeconds:
+            engineStats.completionTimes.popleft()
+
+    async def run(
+        self,
+        arguments: Collection[str],
+        engineName: str,
+        maxAttempts: int = 1,
+        priority: LocalProcessPriority = LocalProcessPriority.NORMAL,
+        timeoutSeconds: float = 3,
+    ) -> LocalProcessResult:
+        if not isinstance(arguments, Collection) or len(arguments) == 0:
+            raise TypeError(f'arguments argument is malformed: \"{arguments}\"')
+        elif not all(isinstance(argument, str) for argument in arguments):
+            raise TypeError(f'arguments argument contains a malformed argument: \"{arguments}\"')
+        elif not utils.isValidStr(engineName):
+            raise TypeError(f'engineName argument is malformed: \"{engineName}\"')
+        elif not utils.isValidInt(maxAttempts):
+            raise TypeError(f'maxAttempts argument is malformed: \"{maxAttempts}\"')
+        elif maxAttempts < 1 or maxAttempts > 8:
+            raise ValueError(f'maxAttempts argument is out of bounds: {maxAttempts}')
+        elif not isinstance(priority, LocalProcessPriority):
+            raise TypeError(f'priority argument is malformed: \"{priority}\"')
+        elif not utils.isValidNum(timeoutSeconds):
+            raise TypeError(f'timeoutSeconds argument is malformed: \"{timeoutSeconds}\"')
+        elif timeoutSeconds < 0.25 or timeoutSeconds > 300:
+            raise ValueError(f'timeoutSeconds argument is out of bounds: {timeoutSeconds}')
+
+        self.__start()
+
+        queuedProcess = LocalProcessPool.QueuedProcess(
+            future = self.__backgroundTaskHelper.eventLoop.create_future(),
+            timeoutSeconds = timeoutSeconds,
+            maxAttempts = maxAttempts,
+            arguments = tuple(arguments),
+            engineName = engineName,
+        )
+
+        self.__queue.put_nowait((priority.sortOrder, next(self.__sequence), queuedProcess))
+        return await queuedProcess.future
+
+    async def __runProcess(self, queuedProcess: QueuedProcess) -> LocalProcessResult:
+        engineStats = self.__getEngineStats(queuedProcess.engineName)
+        startTime = time.monotonic()
+        attempts = 0
+
+        while True:
+            attempts += 1
+
+            # The arguments are handed directly to the executable, rather than being glued
+            # together into a shell command, so there's no need to worry about shell quoting.
+            process = await asyncio.create_subprocess_exec(
+                *queuedProcess.arguments,
+                stdout = asyncio.subprocess.PIPE,
+                stderr = asyncio.subprocess.PIPE,
+            )
+
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    fut = process.communicate(),
+                    timeout = queuedProcess.timeoutSeconds,
+                )
+            except TimeoutError:
+                engineStats.timedOutProcesses += 1
+                await self.__killProcess(queuedProcess.engineName, process)
+
+                if attempts < queuedProcess.maxAttempts:
+                    engineStats.retriedProcesses += 1
+                    self.__timber.log('LocalProcessPool', f'{queuedProcess.engineName} process timed out, retrying... ({attempts=}) ({queuedProcess.maxAttempts=})')
+                    continue
+
+                return LocalProcessResult(
+                    timedOut = True,
+                    durationSeconds = time.monotonic() - startTime,
+                    attempts = attempts,
+                    returnCode = process.returncode,
+                    stderr = None,
+                    stdout = None,
+                )
+            except asyncio.CancelledError:
+                await self.__killProcess(queuedProcess.engineName, process)
+                raise
+
+            return LocalProcessResult(
+                timedOut = False,
+                durationSeconds = time.monotonic() - startTime,
+                attempts = attempts,
+                returnCode = process.returncode,
+                stderr = stderr.decode('utf-8', errors = 'replace').strip(),
+                stdout = stdout.decode('utf-8', errors = 'replace').strip(),
+            )
+
+    def __start(self):
+        if self.__isStarted:
+            return
+
+        self.__isStarted = True
+        self.__timber.log('LocalProcessPool', f'Starting LocalProcessPool ({self.__maxConcurrentProcesses=})...')
+
+        for _ in range(self.__maxConcurrentProcesses):
+            self.__backgroundTaskHelper.createTask(self.__startWorker())
+
+    async def __startWorker(self):
+        while True:
+            _, _, queuedProcess = await self.__queue.get()
+
+            if queuedProcess.future.done():
+                # whoever submitted this process has already given up on it
+                continue
+
+            engineStats = self.__getEngineStats(queuedProcess.engineName)
+            self.__runningProcesses += 1
+
+            try:
+                result = await self.__runProcess(queuedProcess)
+            except Exception as e:
+                engineStats.failedProcesses += 1
+                self.__timber.log('LocalProcessPool', f'Encountered an error when running {queuedProcess.engineName} process ({queuedProcess.arguments=})', e, traceback.format_exc())
+
+                if not queuedProcess.future.done():
+                    queuedProcess.future.set_exception(e)
+
+                continue
+            finally:
+                self.__runningProcesses -= 1
+
+            now = time.monotonic()
+            engineStats.durations.append(result.durationSeconds)
+
+            if result.timedOut or result.returnCode != 0:
+                engineStats.failedProcesses += 1
+            else:
+                engineStats.completedProcesses += 1
+                engineStats.completionTimes.append(now)
+                self.__pruneCompletionTimes(engineStats, now)
+
+            if not queuedProcess.future.done():
+                queuedProcess.future.set_result(result)
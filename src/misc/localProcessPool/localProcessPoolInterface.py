@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Collection
+
+from .localProcessPoolMetrics import LocalProcessPoolMetrics
+from .localProcessPriority import LocalProcessPriority
+from .localProcessResult import LocalProcessResult
+
+
+class LocalProcessPoolInterface(ABC):
+
+    @abstractmethod
+    def getMetrics(self) -> LocalProcessPoolMetrics:
+        pass
+
+    @abstractmethod
+    async def run(
+        self,
+        arguments: Collection[str],
+        engineName: str,
+        maxAttempts: int = 1,
+        priority: LocalProcessPriority = LocalProcessPriority.NORMAL,
+        timeoutSeconds: float = 3,
+    ) -> LocalProcessResult:
+        pass
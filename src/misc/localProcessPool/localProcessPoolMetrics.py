@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from frozendict import frozendict
+
+from .localProcessEngineMetrics import LocalProcessEngineMetrics
+
+
+@dataclass(frozen = True)
+class LocalProcessPoolMetrics:
+    engineMetrics: frozendict[str, LocalProcessEngineMetrics]
+    maxConcurrentProcesses: int
+    queuedProcesses: int
+    runningProcesses: int
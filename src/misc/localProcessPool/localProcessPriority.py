@@ -0,0 +1,16 @@
+from enum import Enum, auto
+
+
+class LocalProcessPriority(Enum):
+
+    HIGH = auto()
+    NORMAL = auto()
+    LOW = auto()
+
+    @property
+    def sortOrder(self) -> int:
+        match self:
+            case LocalProcessPriority.HIGH: return 0
+            case LocalProcessPriority.NORMAL: return 1
+            case LocalProcessPriority.LOW: return 2
+            case _: raise RuntimeError(f'Unknown LocalProcessPriority value: \"{self}\"')
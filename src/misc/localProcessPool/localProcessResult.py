@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class LocalProcessResult:
+    timedOut: bool
+    durationSeconds: float
+    attempts: int
+    returnCode: int | None
+    stderr: str | None
+    stdout: str | None
@@ -0,0 +1,22 @@
+class CircularServiceDependencyException(Exception):
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class DisabledServiceException(Exception):
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class NoSuchServiceException(Exception):
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class ServiceAlreadyRegisteredException(Exception):
+
+    def __init__(self, message: str):
+        super().__init__(message)
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class ServiceConstructionRecord:
+    constructionSeconds: float
+    importedModules: int
+    serviceName: str
@@ -0,0 +1,125 @@
+import sys
+import time
+from typing import Any, Callable, Final
+
+from frozenlist import FrozenList
+
+from .exceptions import CircularServiceDependencyException, DisabledServiceException, NoSuchServiceException, \
+    ServiceAlreadyRegisteredException
+from .serviceConstructionRecord import ServiceConstructionRecord
+from .serviceContainerInterface import ServiceContainerInterface
+from .. import utils as utils
+
+
+class ServiceContainer(ServiceContainerInterface):
+
+    def __init__(
+        self,
+        disabledServiceNames: frozenset[str] = frozenset(),
+        slowestServicesInReport: int = 10,
+    ):
+        if not isinstance(disabledServiceNames, frozenset):
+            raise TypeError(f'disabledServiceNames argument is malformed: \"{disabledServiceNames}\"')
+        elif not utils.isValidInt(slowestServicesInReport):
+            raise TypeError(f'slowestServicesInReport argument is malformed: \"{slowestServicesInReport}\"')
+        elif slowestServicesInReport < 1 or slowestServicesInReport > utils.getIntMaxSafeSize():
+            raise ValueError(f'slowestServicesInReport argument is out of bounds: {slowestServicesInReport}')
+
+        self.__disabledServiceNames: Final[frozenset[str]] = disabledServiceNames
+        self.__slowestServicesInReport: Final[int] = slowestServicesInReport
+
+        self.__factories: Final[dict[str, Callable[[], Any]]] = dict()
+        self.__services: Final[dict[str, Any]] = dict()
+        self.__constructionRecords: Final[list[ServiceConstructionRecord]] = list()
+
+        # services currently being constructed, in order, so that a factory that (indirectly)
+        # asks for its own service can be reported with its whole dependency chain
+        self.__constructionStack: Final[list[str]] = list()
+
+    def buildBootReport(self, importSeconds: float) -> str:
+        if not utils.isValidNum(importSeconds):
+            raise TypeError(f'importSeconds argument is malformed: \"{importSeconds}\"')
+
+        constructionSeconds = sum(record.constructionSeconds for record in self.__constructionRecords)
+        notConstructed = sorted(serviceName for serviceName in self.__factories.keys() if serviceName not in self.__services and serviceName not in self.__disabledServiceNames)
+        disabled = sorted(serviceName for serviceName in self.__factories.keys() if serviceName in self.__disabledServiceNames)
+
+        slowest = sorted(self.__constructionRecords, key = lambda record: record.constructionSeconds, reverse = True)
+        slowest = slowest[:self.__slowestServicesInReport]
+        slowestStrings = [ f'{record.serviceName} ({record.constructionSeconds:.3f}s, {record.importedModules} modules)' for record in slowest ]
+
+        return f'Boot report: imports took {importSeconds:.3f}s ({len(sys.modules)} modules loaded); constructed {len(self.__constructionRecords)} lazy service(s) in {constructionSeconds:.3f}s; slowest: {slowestStrings}; not yet constructed: {notConstructed}; disabled: {disabled}'
+
+    def get(self, serviceName: str) -> Any:
+        if not utils.isValidStr(serviceName):
+            raise TypeError(f'serviceName argument is malformed: \"{serviceName}\"')
+
+        service = self.__services.get(serviceName, None)
+
+        if service is not None:
+            return service
+
+        factory = self.__factories.get(serviceName, None)
+
+        if factory is None:
+            raise NoSuchServiceException(f'No service has been registered with this name ({serviceName=})')
+        elif serviceName in self.__disabledServiceNames:
+            raise DisabledServiceException(f'This service has been disabled for this deployment ({serviceName=})')
+        elif serviceName in self.__constructionStack:
+            raise CircularServiceDependencyException(f'Encountered a circular service dependency ({serviceName=}) ({self.__constructionStack=})')
+
+        self.__constructionStack.append(serviceName)
+        modulesBefore = len(sys.modules)
+        startTime = time.perf_counter()
+
+        try:
+            service = factory()
+        finally:
+            self.__constructionStack.pop()
+
+        if service is None:
+            raise RuntimeError(f'Service factory returned nothing ({serviceName=}) ({factory=})')
+
+        self.__constructionRecords.append(ServiceConstructionRecord(
+            constructionSeconds = time.perf_counter() - startTime,
+            importedModules = len(sys.modules) - modulesBefore,
+            serviceName = serviceName,
+        ))
+
+        self.__services[serviceName] = service
+        return service
+
+    def getConstructionRecords(self) -> FrozenList[ServiceConstructionRecord]:
+        records: FrozenList[ServiceConstructionRecord] = FrozenList(self.__constructionRecords)
+        records.freeze()
+        return records
+
+    def getOptional(self, serviceName: str) -> Any | None:
+        if not utils.isValidStr(serviceName):
+            raise TypeError(f'serviceName argument is malformed: \"{serviceName}\"')
+
+        if not self.isEnabled(serviceName):
+            return None
+
+        return self.get(serviceName)
+
+    def isEnabled(self, serviceName: str) -> bool:
+        if not utils.isValidStr(serviceName):
+            raise TypeError(f'serviceName argument is malformed: \"{serviceName}\"')
+
+        return serviceName in self.__factories and serviceName not in self.__disabledServiceNames
+
+    def register(
+        self,
+        serviceName: str,
+        factory: Callable[[], Any],
+    ):
+        if not utils.isValidStr(serviceName):
+            raise TypeError(f'serviceName argument is malformed: \"{serviceName}\"')
+        elif not callable(factory):
+            raise TypeError(f'factory argument is malformed: \"{factory}\"')
+
+        if serviceName in self.__factories:
+            raise ServiceAlreadyRegisteredException(f'A service has already been registered with this name ({serviceName=})')
+
+        self.__factories[serviceName] = factory
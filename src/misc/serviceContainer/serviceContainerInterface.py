@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+from frozenlist import FrozenList
+
+from .serviceConstructionRecord import ServiceConstructionRecord
+
+
+class ServiceContainerInterface(ABC):
+
+    @abstractmethod
+    def buildBootReport(self, importSeconds: float) -> str:
+        pass
+
+    @abstractmethod
+    def get(self, serviceName: str) -> Any:
+        pass
+
+    @abstractmethod
+    def getConstructionRecords(self) -> FrozenList[ServiceConstructionRecord]:
+        pass
+
+    @abstractmethod
+    def getOptional(self, serviceName: str) -> Any | None:
+        pass
+
+    @abstractmethod
+    def isEnabled(self, serviceName: str) -> bool:
+        pass
+
+    @abstractmethod
+    def register(
+        self,
+        serviceName: str,
+        factory: Callable[[], Any],
+    ):
+        pass
@@ -0,0 +1,33 @@
+from typing import Any, Final
+
+from .. import utils as utils
+from ...storage.jsonReaderInterface import JsonReaderInterface
+
+
+class ServiceContainerSettings:
+
+    def __init__(self, settingsJsonReader: JsonReaderInterface):
+        if not isinstance(settingsJsonReader, JsonReaderInterface):
+            raise TypeError(f'settingsJsonReader argument is malformed: \"{settingsJsonReader}\"')
+
+        self.__settingsJsonReader: Final[JsonReaderInterface] = settingsJsonReader
+
+    def getDisabledServiceNames(self) -> frozenset[str]:
+        # this is read synchronously (and only the once), as it's needed while the composition
+        # root is still being built, before the event loop is running
+        jsonContents: dict[str, Any] | None = None
+
+        if self.__settingsJsonReader.fileExists():
+            jsonContents = self.__settingsJsonReader.readJson()
+
+        if jsonContents is None:
+            return frozenset()
+        elif not isinstance(jsonContents, dict):
+            raise IOError(f'Error reading from Service Container settings file: {self.__settingsJsonReader}')
+
+        disabledServices: Any | None = jsonContents.get('disabledServices', None)
+
+        if not isinstance(disabledServices, list):
+            return frozenset()
+
+        return frozenset(serviceName for serviceName in disabledServices if utils.isValidStr(serviceName))
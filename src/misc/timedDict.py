@@ -1,7 +1,8 @@
-from datetime import datetime, timedelta, timezone, tzinfo
-from typing import Generic, TypeVar
+from datetime import timedelta
+from typing import Final, Generic, TypeVar
 
 from . import utils as utils
+from .ttlCache import TtlCache
 
 T = TypeVar('T')
 
@@ -11,50 +12,40 @@ class TimedDict(Generic[T]):
     def __init__(
         self,
         cacheTimeToLive: timedelta,
-        timeZone: tzinfo = timezone.utc
+        maxSize: int = 1024,
     ):
         if not isinstance(cacheTimeToLive, timedelta):
             raise TypeError(f'cacheTimeToLive argument is malformed: \"{cacheTimeToLive}\"')
-        elif not isinstance(timeZone, tzinfo):
-            raise TypeError(f'timeZone argument is malformed: \"{timeZone}\"')
+        elif not utils.isValidInt(maxSize):
+            raise TypeError(f'maxSize argument is malformed: \"{maxSize}\"')
+        elif maxSize < 1 or maxSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxSize argument is out of bounds: {maxSize}')
 
-        self.__cacheTimeToLive: timedelta = cacheTimeToLive
-        self.__timeZone: tzinfo = timeZone
-
-        self.__times: dict[str, datetime | None] = dict()
-        self.__values: dict[str, T | None] = dict()
+        self.__cache: Final[TtlCache[T]] = TtlCache(
+            maxSize = maxSize,
+            timeToLive = cacheTimeToLive,
+        )
 
     def clear(self):
-        self.__times.clear()
-        self.__values.clear()
+        self.__cache.clear()
 
     def __delitem__(self, key: str):
         if not utils.isValidStr(key):
             raise TypeError(f'key argument is malformed: \"{key}\"')
 
-        self.__times.pop(key, None)
-        self.__values.pop(key, None)
+        self.__cache.pop(key)
 
     def __getitem__(self, key: str) -> T | None:
         if not utils.isValidStr(key):
             raise TypeError(f'key argument is malformed: \"{key}\"')
 
-        if self.isReady(key):
-            return None
-        else:
-            return self.__values.get(key, None)
+        return self.__cache.get(key)
 
     def isReady(self, key: str) -> bool:
         if not utils.isValidStr(key):
             raise TypeError(f'key argument is malformed: \"{key}\"')
 
-        cachedTime = self.__times.get(key, None)
-
-        if cachedTime is None:
-            return True
-
-        nowDateTime = datetime.now(self.__timeZone)
-        return nowDateTime > cachedTime
+        return not self.__cache.contains(key)
 
     def isReadyAndUpdate(self, key: str) -> bool:
         if not utils.isValidStr(key):
@@ -70,11 +61,10 @@ class TimedDict(Generic[T]):
         if not utils.isValidStr(key):
             raise TypeError(f'key argument is malformed: \"{key}\"')
 
-        self.__times[key] = datetime.now(self.__timeZone) + self.__cacheTimeToLive
-        self.__values[key] = value
+        self.__cache.set(key, value)
 
     def update(self, key: str):
         if not utils.isValidStr(key):
             raise TypeError(f'key argument is malformed: \"{key}\"')
 
-        self.__times[key] = datetime.now(self.__timeZone) + self.__cacheTimeToLive
+        self.__cache.set(key, self.__cache.get(key))
@@ -0,0 +1,68 @@
+import asyncio
+import time
+from typing import Final
+
+from . import utils as utils
+
+
+class TokenBucket:
+
+    def __init__(
+        self,
+        capacity: int,
+        refillPeriodSeconds: float,
+    ):
+        if not utils.isValidInt(capacity):
+            raise TypeError(f'capacity argument is malformed: \"{capacity}\"')
+        elif capacity < 1 or capacity > utils.getShortMaxSafeSize():
+            raise ValueError(f'capacity argument is out of bounds: {capacity}')
+        elif not utils.isValidNum(refillPeriodSeconds):
+            raise TypeError(f'refillPeriodSeconds argument is malformed: \"{refillPeriodSeconds}\"')
+        elif refillPeriodSeconds <= 0 or refillPeriodSeconds > 3600:
+            raise ValueError(f'refillPeriodSeconds argument is out of bounds: {refillPeriodSeconds}')
+
+        self.__capacity: Final[int] = capacity
+        self.__tokensPerSecond: Final[float] = capacity / refillPeriodSeconds
+
+        self.__acquireLock: Final[asyncio.Lock] = asyncio.Lock()
+        self.__lastRefillTime: float = time.monotonic()
+        self.__tokens: float = float(capacity)
+
+    async def acquire(self):
+        # Waiters hold the lock while they sleep, so tokens are handed out in FIFO order.
+        async with self.__acquireLock:
+            while True:
+                self.__refill()
+
+                if self.__tokens >= 1:
+                    self.__tokens = self.__tokens - 1
+                    return
+
+                await asyncio.sleep((1 - self.__tokens) / self.__tokensPerSecond)
+
+    @property
+    def availableTokens(self) -> float:
+        self.__refill()
+        return self.__tokens
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    def __refill(self):
+        now = time.monotonic()
+        elapsedSeconds = now - self.__lastRefillTime
+        self.__lastRefillTime = now
+        self.__tokens = min(float(self.__capacity), self.__tokens + elapsedSeconds * self.__tokensPerSecond)
+
+    def tryAcquire(self) -> bool:
+        if self.__acquireLock.locked():
+            return False
+
+        self.__refill()
+
+        if self.__tokens >= 1:
+            self.__tokens = self.__tokens - 1
+            return True
+
+        return False
@@ -0,0 +1,233 @@
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Awaitable, Callable, Final, Generic, TypeVar
+
+from . import utils as utils
+from .clearable import Clearable
+from .ttlCacheStats import TtlCacheStats
+
+T = TypeVar('T')
+
+
+class TtlCache(Clearable, Generic[T]):
+
+    def __init__(
+        self,
+        maxSize: int = 512,
+        timeToLive: timedelta | None = None,
+        negativeTimeToLive: timedelta | None = None,
+        sweepInterval: timedelta = timedelta(minutes = 1),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not utils.isValidInt(maxSize):
+            raise TypeError(f'maxSize argument is malformed: \"{maxSize}\"')
+        elif maxSize < 1 or maxSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxSize argument is out of bounds: {maxSize}')
+        elif timeToLive is not None and not isinstance(timeToLive, timedelta):
+            raise TypeError(f'timeToLive argument is malformed: \"{timeToLive}\"')
+        elif negativeTimeToLive is not None and not isinstance(negativeTimeToLive, timedelta):
+            raise TypeError(f'negativeTimeToLive argument is malformed: \"{negativeTimeToLive}\"')
+        elif not isinstance(sweepInterval, timedelta):
+            raise TypeError(f'sweepInterval argument is malformed: \"{sweepInterval}\"')
+        elif not callable(clock):
+            raise TypeError(f'clock argument is malformed: \"{clock}\"')
+
+        self.__maxSize: Final[int] = maxSize
+        self.__clock: Final[Callable[[], float]] = clock
+
+        self.__timeToLiveSeconds: Final[float | None] = None if timeToLive is None else timeToLive.total_seconds()
+        self.__negativeTimeToLiveSeconds: Final[float | None] = None if negativeTimeToLive is None else negativeTimeToLive.total_seconds()
+        self.__sweepIntervalSeconds: Final[float] = sweepInterval.total_seconds()
+
+        # ordered from least to most recently used, each entry being (expiration time, value)
+        self.__entries: Final[OrderedDict[str, tuple[float | None, T | None]]] = OrderedDict()
+        self.__inFlightLoads: Final[dict[str, asyncio.Future[T | None]]] = dict()
+        self.__lastSweepTime: float = clock()
+
+        self.__deduplicatedLoads: int = 0
+        self.__evictions: int = 0
+        self.__expirations: int = 0
+        self.__hits: int = 0
+        self.__loads: int = 0
+        self.__misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def clear(self):
+        self.__entries.clear()
+        self.__inFlightLoads.clear()
+
+    async def clearCaches(self):
+        self.clear()
+
+    def contains(self, key: str) -> bool:
+        if not utils.isValidStr(key):
+            raise TypeError(f'key argument is malformed: \"{key}\"')
+
+        return self.__lookup(key) is not None
+
+    def get(self, key: str) -> T | None:
+        if not utils.isValidStr(key):
+            raise TypeError(f'key argument is malformed: \"{key}\"')
+
+        entry = self.__lookup(key)
+
+        if entry is None:
+            return None
+
+        return entry[1]
+
+    async def getOrLoad(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T | None]],
+    ) -> T | None:
+        if not utils.isValidStr(key):
+            raise TypeError(f'key argument is malformed: \"{key}\"')
+        elif not callable(loader):
+            raise TypeError(f'loader argument is malformed: \"{loader}\"')
+
+        while True:
+            entry = self.__lookup(key)
+
+            if entry is not None:
+                return entry[1]
+
+            inFlightLoad = self.__inFlightLoads.get(key, None)
+
+            if inFlightLoad is None:
+                break
+
+            # someone else is already loading this key, so just wait on their result
+            self.__deduplicatedLoads += 1
+
+            try:
+                return await asyncio.shield(inFlightLoad)
+            except asyncio.CancelledError:
+                if not inFlightLoad.cancelled():
+                    raise
+
+                # the load we were waiting on got cancelled (not us), so try again
+
+        inFlightLoad = asyncio.get_running_loop().create_future()
+        self.__inFlightLoads[key] = inFlightLoad
+        self.__loads += 1
+
+        try:
+            value = await loader()
+
+            # the key may have been invalidated while loading, in which case this result is
+            # handed back to whoever asked for it but must not be cached
+            isStillCurrent = self.__inFlightLoads.get(key, None) is inFlightLoad
+
+            if isStillCurrent and (value is not None or self.__negativeTimeToLiveSeconds is not None):
+                self.set(key, value)
+
+            inFlightLoad.set_result(value)
+            return value
+        except Exception as e:
+            inFlightLoad.set_exception(e)
+
+            # mark the exception as retrieved, as there may not be anyone else waiting on it
+            inFlightLoad.exception()
+            raise e
+        finally:
+            if self.__inFlightLoads.get(key, None) is inFlightLoad:
+                del self.__inFlightLoads[key]
+
+            if not inFlightLoad.done():
+                inFlightLoad.cancel()
+
+    def getStats(self) -> TtlCacheStats:
+        return TtlCacheStats(
+            deduplicatedLoads = self.__deduplicatedLoads,
+            evictions = self.__evictions,
+            expirations = self.__expirations,
+            hits = self.__hits,
+            loads = self.__loads,
+            maxSize = self.__maxSize,
+            misses = self.__misses,
+            size = len(self.__entries),
+        )
+
+    def __lookup(self, key: str) -> tuple[float | None, T | None] | None:
+        now = self.__clock()
+        self.__sweepIfNecessary(now)
+
+        entry = self.__entries.get(key, None)
+
+        if entry is None:
+            self.__misses += 1
+            return None
+
+        expirationTime = entry[0]
+
+        if expirationTime is not None and now >= expirationTime:
+            del self.__entries[key]
+            self.__expirations += 1
+            self.__misses += 1
+            return None
+
+        self.__entries.move_to_end(key)
+        self.__hits += 1
+        return entry
+
+    def pop(self, key: str) -> T | None:
+        if not utils.isValidStr(key):
+            raise TypeError(f'key argument is malformed: \"{key}\"')
+
+        self.__inFlightLoads.pop(key, None)
+        entry = self.__entries.pop(key, None)
+
+        if entry is None:
+            return None
+
+        return entry[1]
+
+    def set(self, key: str, value: T | None):
+        if not utils.isValidStr(key):
+            raise TypeError(f'key argument is malformed: \"{key}\"')
+
+        now = self.__clock()
+        self.__sweepIfNecessary(now)
+
+        # explicitly set values win over whatever may currently be loading
+        self.__inFlightLoads.pop(key, None)
+
+        timeToLiveSeconds = self.__timeToLiveSeconds
+
+        if value is None and self.__negativeTimeToLiveSeconds is not None:
+            timeToLiveSeconds = self.__negativeTimeToLiveSeconds
+
+        expirationTime: float | None = None
+
+        if timeToLiveSeconds is not None:
+            expirationTime = now + timeToLiveSeconds
+
+        if key in self.__entries:
+            self.__entries.move_to_end(key)
+        elif len(self.__entries) >= self.__maxSize:
+            self.__entries.popitem(last = False)
+            self.__evictions += 1
+
+        self.__entries[key] = (expirationTime, value)
+
+    def __sweepIfNecessary(self, now: float):
+        if self.__timeToLiveSeconds is None and self.__negativeTimeToLiveSeconds is None:
+            return
+        elif now - self.__lastSweepTime < self.__sweepIntervalSeconds:
+            return
+
+        self.__lastSweepTime = now
+
+        # expired entries are otherwise only dropped once they're looked up again, so
+        # periodically purge them all to keep long uptimes from hoarding dead entries
+        expiredKeys = [ key for key, (expirationTime, _) in self.__entries.items() if expirationTime is not None and now >= expirationTime ]
+
+        for expiredKey in expiredKeys:
+            del self.__entries[expiredKey]
+
+        self.__expirations += len(expiredKeys)
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class TtlCacheStats:
+    deduplicatedLoads: int
+    evictions: int
+    expirations: int
+    hits: int
+    loads: int
+    maxSize: int
+    misses: int
+    size: int
@@ -0,0 +1,112 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from typing import Final, Generic, TypeVar
+
+from frozenlist import FrozenList
+
+from .workQueueMetrics import WorkQueueMetrics
+from .. import utils as utils
+
+T = TypeVar('T')
+
+
+class WorkQueue(Generic[T]):
+
+    def __init__(
+        self,
+        eventLoop: AbstractEventLoop,
+        maxSize: int = 0,
+    ):
+        if not isinstance(eventLoop, AbstractEventLoop):
+            raise TypeError(f'eventLoop argument is malformed: \"{eventLoop}\"')
+        elif not utils.isValidInt(maxSize):
+            raise TypeError(f'maxSize argument is malformed: \"{maxSize}\"')
+        elif maxSize < 0 or maxSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxSize argument is out of bounds: {maxSize}')
+
+        self.__eventLoop: Final[AbstractEventLoop] = eventLoop
+        self.__maxSize: Final[int] = maxSize
+
+        self.__queue: Final[asyncio.Queue[T]] = asyncio.Queue(maxsize = maxSize)
+        self.__highWaterMark: int = 0
+        self.__totalDropped: int = 0
+        self.__totalSubmitted: int = 0
+        self.__totalTaken: int = 0
+
+    def empty(self) -> bool:
+        return self.__queue.empty()
+
+    async def get(self) -> T:
+        item = await self.__queue.get()
+        self.__totalTaken += 1
+        return item
+
+    async def getBatch(
+        self,
+        maxBatchSize: int = 100,
+        timeoutSeconds: float | None = None,
+    ) -> FrozenList[T]:
+        if not utils.isValidInt(maxBatchSize):
+            raise TypeError(f'maxBatchSize argument is malformed: \"{maxBatchSize}\"')
+        elif maxBatchSize < 1 or maxBatchSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxBatchSize argument is out of bounds: {maxBatchSize}')
+        elif timeoutSeconds is not None and not utils.isValidNum(timeoutSeconds):
+            raise TypeError(f'timeoutSeconds argument is malformed: \"{timeoutSeconds}\"')
+
+        items: FrozenList[T] = FrozenList()
+
+        try:
+            if timeoutSeconds is None:
+                items.append(await self.__queue.get())
+            else:
+                items.append(await asyncio.wait_for(self.__queue.get(), timeout = timeoutSeconds))
+        except TimeoutError:
+            items.freeze()
+            return items
+
+        # now that at least one item has arrived, grab anything else that's already waiting
+        while len(items) < maxBatchSize and not self.__queue.empty():
+            items.append(self.__queue.get_nowait())
+
+        self.__totalTaken += len(items)
+        items.freeze()
+        return items
+
+    @property
+    def metrics(self) -> WorkQueueMetrics:
+        return WorkQueueMetrics(
+            highWaterMark = self.__highWaterMark,
+            maxSize = self.__maxSize,
+            size = self.__queue.qsize(),
+            totalDropped = self.__totalDropped,
+            totalSubmitted = self.__totalSubmitted,
+            totalTaken = self.__totalTaken,
+        )
+
+    def put(self, item: T):
+        # This method can be safely called from any thread. If we're not already running on
+        # the queue's own event loop, then the item is handed over to that loop instead.
+        try:
+            runningLoop = asyncio.get_running_loop()
+        except RuntimeError:
+            runningLoop = None
+
+        if runningLoop is self.__eventLoop:
+            self.__putNowait(item)
+        elif self.__eventLoop.is_closed():
+            self.__totalDropped += 1
+        else:
+            self.__eventLoop.call_soon_threadsafe(self.__putNowait, item)
+
+    def __putNowait(self, item: T):
+        try:
+            self.__queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.__totalDropped += 1
+            return
+
+        self.__totalSubmitted += 1
+        self.__highWaterMark = max(self.__highWaterMark, self.__queue.qsize())
+
+    def qsize(self) -> int:
+        return self.__queue.qsize()
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class WorkQueueMetrics:
+    highWaterMark: int
+    maxSize: int
+    size: int
+    totalDropped: int
+    totalSubmitted: int
+    totalTaken: int
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime
-
-from lru import LRU
+from datetime import datetime, timedelta
+from typing import Final
 
 from .mostRecentChat import MostRecentChat
 from .mostRecentChatsRepositoryInterface import MostRecentChatsRepositoryInterface
 from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
+from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..misc.ttlCache import TtlCache
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
 from ..storage.databaseType import DatabaseType
+from ..storage.writeBehindBuffer import WriteBehindBuffer
+from ..storage.writeBehindBufferInterface import WriteBehindBufferInterface
 from ..timber.timberInterface import TimberInterface
 
 
@@ -19,12 +21,16 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
 
     def __init__(
         self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
         backingDatabase: BackingDatabase,
         timber: TimberInterface,
         timeZoneRepository: TimeZoneRepositoryInterface,
-        cacheSize: int = 100
+        cacheSize: int = 1024,
+        negativeCacheTimeToLive: timedelta = timedelta(minutes = 10),
     ):
-        if not isinstance(backingDatabase, BackingDatabase):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(backingDatabase, BackingDatabase):
             raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
@@ -34,17 +40,41 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
             raise TypeError(f'cacheSize argument is malformed: \"{cacheSize}\"')
         elif cacheSize < 1 or cacheSize > utils.getIntMaxSafeSize():
             raise ValueError(f'cacheSize argument is out of bounds: {cacheSize}')
+        elif not isinstance(negativeCacheTimeToLive, timedelta):
+            raise TypeError(f'negativeCacheTimeToLive argument is malformed: \"{negativeCacheTimeToLive}\"')
 
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
 
         self.__isDatabaseReady: bool = False
-        self.__caches: dict[str, LRU[str, MostRecentChat | None]] = defaultdict(lambda: LRU(cacheSize))
+
+        # every write goes through set(), so cached chats never go stale and only need to be
+        # bounded in size. Chatters that have never chatted are remembered for a little while.
+        self.__cache: Final[TtlCache[MostRecentChat]] = TtlCache(
+            maxSize = cacheSize,
+            negativeTimeToLive = negativeCacheTimeToLive,
+        )
+
+        self.__writeBehindBuffer: WriteBehindBufferInterface = WriteBehindBuffer(
+            backgroundTaskHelper = backgroundTaskHelper,
+            backingDatabase = backingDatabase,
+            timber = timber,
+            tableName = 'mostrecentchats',
+            columns = ( 'chatteruserid', 'mostrecentchat', 'twitchchannelid' ),
+            conflictColumns = ( 'chatteruserid', 'twitchchannelid' ),
+        )
 
     async def clearCaches(self):
-        self.__caches.clear()
-        self.__timber.log('MostRecentChatsRepository', 'Caches cleared')
+        cacheStats = self.__cache.getStats()
+        await self.__cache.clearCaches()
+        self.__timber.log('MostRecentChatsRepository', f'Caches cleared ({cacheStats=})')
+
+    def __createCacheKey(self, chatterUserId: str, twitchChannelId: str) -> str:
+        return f'{twitchChannelId}:{chatterUserId}'
+
+    async def flush(self):
+        await self.__writeBehindBuffer.flush()
 
     async def get(
         self,
@@ -56,22 +86,38 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        cache = self.__caches[twitchChannelId]
+        return await self.__cache.getOrLoad(
+            key = self.__createCacheKey(chatterUserId, twitchChannelId),
+            loader = lambda: self.__load(chatterUserId, twitchChannelId),
+        )
+
+    async def __load(
+        self,
+        chatterUserId: str,
+        twitchChannelId: str
+    ) -> MostRecentChat | None:
+        pendingRow = self.__writeBehindBuffer.getPendingRow(chatterUserId, twitchChannelId)
 
-        if chatterUserId in cache:
-            return cache[chatterUserId]
+        if pendingRow is not None:
+            return MostRecentChat(
+                mostRecentChat = datetime.fromisoformat(pendingRow[1]),
+                twitchChannelId = twitchChannelId,
+                userId = chatterUserId
+            )
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT mostrecentchat FROM mostrecentchats
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-                LIMIT 1
-            ''',
-            chatterUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT mostrecentchat FROM mostrecentchats
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                    LIMIT 1
+                ''',
+                chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
         mostRecentChat: MostRecentChat | None = None
 
         if record is not None and len(record) >= 1:
@@ -81,7 +127,6 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
                 userId = chatterUserId
             )
 
-        cache[chatterUserId] = mostRecentChat
         return mostRecentChat
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
@@ -95,35 +140,36 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS mostrecentchats (
-                            chatteruserid text NOT NULL,
-                            mostrecentchat text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS mostrecentchats (
-                            chatteruserid TEXT NOT NULL,
-                            mostrecentchat TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS mostrecentchats (
+                                chatteruserid text NOT NULL,
+                                mostrecentchat text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS mostrecentchats (
+                                chatteruserid TEXT NOT NULL,
+                                mostrecentchat TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def set(
         self,
@@ -137,20 +183,13 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
 
         mostRecentChat = datetime.now(self.__timeZoneRepository.getDefault())
 
-        self.__caches[twitchChannelId][chatterUserId] = MostRecentChat(
+        self.__cache.set(self.__createCacheKey(chatterUserId, twitchChannelId), MostRecentChat(
             mostRecentChat = mostRecentChat,
             twitchChannelId = twitchChannelId,
             userId = chatterUserId
-        )
+        ))
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO mostrecentchats (chatteruserid, mostrecentchat, twitchchannelid)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET mostrecentchat = EXCLUDED.mostrecentchat
-            ''',
-            chatterUserId, mostRecentChat.isoformat(), twitchChannelId
-        )
+        # the table has to exist before the write behind buffer is able to flush into it
+        await self.__initDatabaseTable()
 
-        await connection.close()
+        await self.__writeBehindBuffer.put(chatterUserId, mostRecentChat.isoformat(), twitchChannelId)
@@ -2,9 +2,10 @@ from abc import ABC, abstractmethod
 
 from .mostRecentChat import MostRecentChat
 from ..misc.clearable import Clearable
+from ..misc.flushable import Flushable
 
 
-class MostRecentChatsRepositoryInterface(Clearable, ABC):
+class MostRecentChatsRepositoryInterface(Clearable, Flushable, ABC):
 
     @abstractmethod
     async def get(
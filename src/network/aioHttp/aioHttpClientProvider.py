@@ -39,6 +39,15 @@ class AioHttpClientProvider(NetworkClientProvider):
 
         self.__clientSession: aiohttp.ClientSession | None = None
 
+    async def close(self):
+        clientSession = self.__clientSession
+
+        if clientSession is None:
+            return
+
+        self.__clientSession = None
+        await clientSession.close()
+
     async def get(self) -> NetworkHandle:
         clientSession = self.__clientSession
 
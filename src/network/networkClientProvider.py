@@ -6,6 +6,10 @@ from .networkHandle import NetworkHandle
 
 class NetworkClientProvider(ABC):
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @abstractmethod
     async def get(self) -> NetworkHandle:
         pass
@@ -1,6 +1,7 @@
 from typing import Final
 
 from .requestsHandle import RequestsHandle
+from .requestsSessionPool import RequestsSessionPool
 from ..networkClientProvider import NetworkClientProvider
 from ..networkClientType import NetworkClientType
 from ..networkHandle import NetworkHandle
@@ -13,6 +14,9 @@ class RequestsClientProvider(NetworkClientProvider):
     def __init__(
         self,
         timber: TimberInterface,
+        maxConcurrentRequestsPerHost: int = 4,
+        maxConnectionsPerHost: int = 8,
+        maxWorkers: int = 16,
         timeoutSeconds: int = 30,
     ):
         if not isinstance(timber, TimberInterface):
@@ -25,8 +29,18 @@ class RequestsClientProvider(NetworkClientProvider):
         self.__timber: Final[TimberInterface] = timber
         self.__timeoutSeconds: Final[int] = timeoutSeconds
 
+        self.__sessionPool: Final[RequestsSessionPool] = RequestsSessionPool(
+            maxConcurrentRequestsPerHost = maxConcurrentRequestsPerHost,
+            maxConnectionsPerHost = maxConnectionsPerHost,
+            maxWorkers = maxWorkers,
+        )
+
+    async def close(self):
+        await self.__sessionPool.close()
+
     async def get(self) -> NetworkHandle:
         return RequestsHandle(
+            sessionPool = self.__sessionPool,
             timber = self.__timber,
             timeoutSeconds = self.__timeoutSeconds,
         )
@@ -1,9 +1,9 @@
 from typing import Any, Final
 
-import requests
 from requests.models import Response
 
 from .requestsResponse import RequestsResponse
+from .requestsSessionPool import RequestsSessionPool
 from ..exceptions import GenericNetworkException
 from ..networkClientType import NetworkClientType
 from ..networkHandle import NetworkHandle
@@ -16,16 +16,20 @@ class RequestsHandle(NetworkHandle):
 
     def __init__(
         self,
+        sessionPool: RequestsSessionPool,
         timber: TimberInterface,
         timeoutSeconds: int = 30,
     ):
-        if not isinstance(timber, TimberInterface):
+        if not isinstance(sessionPool, RequestsSessionPool):
+            raise TypeError(f'sessionPool argument is malformed: \"{sessionPool}\"')
+        elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not utils.isValidInt(timeoutSeconds):
             raise TypeError(f'timeoutSeconds argument is malformed: \"{timeoutSeconds}\"')
         elif timeoutSeconds < 3 or timeoutSeconds > 60:
             raise ValueError(f'timeoutSeconds argument is out of bounds: {timeoutSeconds}')
 
+        self.__sessionPool: Final[RequestsSessionPool] = sessionPool
         self.__timber: Final[TimberInterface] = timber
         self.__timeoutSeconds: Final[int] = timeoutSeconds
 
@@ -37,10 +41,11 @@ class RequestsHandle(NetworkHandle):
         response: Response | None = None
 
         try:
-            response = requests.delete(
+            response = await self.__sessionPool.request(
+                method = 'DELETE',
                 url = url,
                 headers = headers,
-                timeout = self.__timeoutSeconds,
+                timeoutSeconds = self.__timeoutSeconds,
             )
         except Exception as e:
             self.__timber.log('RequestsHandle', f'Encountered network error (via {self.networkClientType}) when trying to HTTP DELETE \"{url}\" with headers \"{headers}\": {e}', e)
@@ -64,10 +69,11 @@ class RequestsHandle(NetworkHandle):
         response: Response | None = None
 
         try:
-            response = requests.get(
+            response = await self.__sessionPool.request(
+                method = 'GET',
                 url = url,
                 headers = headers,
-                timeout = self.__timeoutSeconds,
+                timeoutSeconds = self.__timeoutSeconds,
             )
         except Exception as e:
             self.__timber.log('RequestsHandle', f'Encountered network error (via {self.networkClientType}) when trying to HTTP GET \"{url}\" with headers \"{headers}\": {e}', e)
@@ -96,11 +102,12 @@ class RequestsHandle(NetworkHandle):
         response: Response | None = None
 
         try:
-            response = requests.post(
+            response = await self.__sessionPool.request(
+                method = 'POST',
                 url = url,
                 headers = headers,
                 json = json,
-                timeout = self.__timeoutSeconds,
+                timeoutSeconds = self.__timeoutSeconds,
             )
         except Exception as e:
             self.__timber.log('RequestsHandle', f'Encountered network error (via {self.networkClientType}) when trying to HTTP POST \"{url}\" with headers \"{headers}\" and json \"{json}\": {e}', e)
@@ -0,0 +1,136 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Final
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+
+from ...misc import utils as utils
+
+
+class RequestsSessionPool:
+
+    def __init__(
+        self,
+        maxConcurrentRequestsPerHost: int = 4,
+        maxConnectionsPerHost: int = 8,
+        maxWorkers: int = 16,
+    ):
+        if not utils.isValidInt(maxConcurrentRequestsPerHost):
+            raise TypeError(f'maxConcurrentRequestsPerHost argument is malformed: \"{maxConcurrentRequestsPerHost}\"')
+        elif maxConcurrentRequestsPerHost < 1 or maxConcurrentRequestsPerHost > 64:
+            raise ValueError(f'maxConcurrentRequestsPerHost argument is out of bounds: {maxConcurrentRequestsPerHost}')
+        elif not utils.isValidInt(maxConnectionsPerHost):
+            raise TypeError(f'maxConnectionsPerHost argument is malformed: \"{maxConnectionsPerHost}\"')
+        elif maxConnectionsPerHost < 1 or maxConnectionsPerHost > 64:
+            raise ValueError(f'maxConnectionsPerHost argument is out of bounds: {maxConnectionsPerHost}')
+        elif not utils.isValidInt(maxWorkers):
+            raise TypeError(f'maxWorkers argument is malformed: \"{maxWorkers}\"')
+        elif maxWorkers < 1 or maxWorkers > 128:
+            raise ValueError(f'maxWorkers argument is out of bounds: {maxWorkers}')
+
+        self.__maxConcurrentRequestsPerHost: Final[int] = maxConcurrentRequestsPerHost
+        self.__maxConnectionsPerHost: Final[int] = maxConnectionsPerHost
+
+        self.__isClosed: bool = False
+        self.__executor: Final[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers = maxWorkers,
+            thread_name_prefix = 'RequestsSessionPool',
+        )
+        self.__semaphores: Final[dict[str, asyncio.Semaphore]] = dict()
+        self.__sessions: Final[dict[str, requests.Session]] = dict()
+
+    async def close(self):
+        if self.__isClosed:
+            return
+
+        self.__isClosed = True
+        self.__executor.shutdown(wait = False, cancel_futures = True)
+
+        for session in self.__sessions.values():
+            session.close()
+
+        self.__sessions.clear()
+
+    def __getHost(self, url: str) -> str:
+        host = urlsplit(url).netloc.casefold()
+
+        if not utils.isValidStr(host):
+            raise ValueError(f'url argument has no host: \"{url}\"')
+
+        return host
+
+    def __getSemaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self.__semaphores.get(host, None)
+
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.__maxConcurrentRequestsPerHost)
+            self.__semaphores[host] = semaphore
+
+        return semaphore
+
+    def getSession(self, url: str) -> requests.Session:
+        if not utils.isValidStr(url):
+            raise TypeError(f'url argument is malformed: \"{url}\"')
+
+        host = self.__getHost(url)
+        session = self.__sessions.get(host, None)
+
+        if session is None:
+            # Each session only ever talks to a single host, so it only needs a single
+            # connection pool, but that pool should be able to hold a keep-alive connection
+            # for every request that we allow to be in flight to that host at once.
+            adapter = HTTPAdapter(
+                pool_connections = 1,
+                pool_maxsize = self.__maxConnectionsPerHost,
+            )
+
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self.__sessions[host] = session
+
+        return session
+
+    @property
+    def isClosed(self) -> bool:
+        return self.__isClosed
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeoutSeconds: float,
+        headers: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> Response:
+        if not utils.isValidStr(method):
+            raise TypeError(f'method argument is malformed: \"{method}\"')
+        elif not utils.isValidStr(url):
+            raise TypeError(f'url argument is malformed: \"{url}\"')
+        elif not utils.isValidNum(timeoutSeconds):
+            raise TypeError(f'timeoutSeconds argument is malformed: \"{timeoutSeconds}\"')
+        elif self.__isClosed:
+            raise RuntimeError(f'This session pool has already been closed! ({method=}) ({url=})')
+
+        session = self.getSession(url)
+        semaphore = self.__getSemaphore(self.__getHost(url))
+
+        # The requests library is entirely synchronous, so the actual network call happens on
+        # one of our worker threads. Since we don't use stream mode, the response body has been
+        # fully read by the time that the call returns, so reading it later won't block either.
+        async with semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.__executor,
+                partial(
+                    session.request,
+                    method = method,
+                    url = url,
+                    headers = headers,
+                    json = json,
+                    timeout = timeoutSeconds,
+                ),
+            )
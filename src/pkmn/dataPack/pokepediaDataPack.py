@@ -0,0 +1,138 @@
+import random
+from bisect import bisect_right
+from typing import Collection, Final
+
+from frozendict import frozendict
+from frozenlist import FrozenList
+
+from ..pokepediaGeneration import PokepediaGeneration
+from ..pokepediaMachine import PokepediaMachine
+from ..pokepediaMove import PokepediaMove
+from ..pokepediaPokemon import PokepediaPokemon
+from ...misc import utils as utils
+
+
+class PokepediaDataPack:
+
+    def __init__(
+        self,
+        moves: Collection[PokepediaMove],
+        pokemon: Collection[PokepediaPokemon]
+    ):
+        if not isinstance(moves, Collection):
+            raise TypeError(f'moves argument is malformed: \"{moves}\"')
+        elif not isinstance(pokemon, Collection):
+            raise TypeError(f'pokemon argument is malformed: \"{pokemon}\"')
+
+        machinesById: dict[int, PokepediaMachine] = dict()
+        movesById: dict[int, PokepediaMove] = dict()
+        movesByName: dict[str, PokepediaMove] = dict()
+
+        for move in moves:
+            movesById[move.getMoveId()] = move
+            movesByName[self.normalizeName(move.getRawName())] = move
+            movesByName[self.normalizeName(move.getName())] = move
+
+            generationMachines = move.getGenerationMachines()
+
+            if generationMachines is not None:
+                for machines in generationMachines.values():
+                    for machine in machines:
+                        machinesById[machine.machineId] = machine
+
+        pokemonById: dict[int, PokepediaPokemon] = dict()
+        pokemonByName: dict[str, PokepediaPokemon] = dict()
+
+        for individualPokemon in pokemon:
+            pokemonById[individualPokemon.getPokedexId()] = individualPokemon
+            pokemonByName[self.normalizeName(individualPokemon.getName())] = individualPokemon
+
+        sortedMoveIds: FrozenList[int] = FrozenList(sorted(movesById.keys()))
+        sortedMoveIds.freeze()
+
+        sortedPokedexIds: FrozenList[int] = FrozenList(sorted(pokemonById.keys()))
+        sortedPokedexIds.freeze()
+
+        self.__machinesById: Final[frozendict[int, PokepediaMachine]] = frozendict(machinesById)
+        self.__movesById: Final[frozendict[int, PokepediaMove]] = frozendict(movesById)
+        self.__movesByName: Final[frozendict[str, PokepediaMove]] = frozendict(movesByName)
+        self.__pokemonById: Final[frozendict[int, PokepediaPokemon]] = frozendict(pokemonById)
+        self.__pokemonByName: Final[frozendict[str, PokepediaPokemon]] = frozendict(pokemonByName)
+        self.__sortedMoveIds: Final[FrozenList[int]] = sortedMoveIds
+        self.__sortedPokedexIds: Final[FrozenList[int]] = sortedPokedexIds
+
+    def getMachine(self, machineId: int) -> PokepediaMachine | None:
+        if not utils.isValidInt(machineId):
+            raise TypeError(f'machineId argument is malformed: \"{machineId}\"')
+
+        return self.__machinesById.get(machineId, None)
+
+    def getMove(self, moveId: int) -> PokepediaMove | None:
+        if not utils.isValidInt(moveId):
+            raise TypeError(f'moveId argument is malformed: \"{moveId}\"')
+
+        return self.__movesById.get(moveId, None)
+
+    def getMovesSize(self) -> int:
+        return len(self.__movesById)
+
+    def getPokemon(self, pokedexId: int) -> PokepediaPokemon | None:
+        if not utils.isValidInt(pokedexId):
+            raise TypeError(f'pokedexId argument is malformed: \"{pokedexId}\"')
+
+        return self.__pokemonById.get(pokedexId, None)
+
+    def getPokemonSize(self) -> int:
+        return len(self.__pokemonById)
+
+    def getRandomMove(self, maxGeneration: PokepediaGeneration) -> PokepediaMove | None:
+        if not isinstance(maxGeneration, PokepediaGeneration):
+            raise TypeError(f'maxGeneration argument is malformed: \"{maxGeneration}\"')
+
+        # IDs are sorted, so every move up to and including the given generation is a prefix
+        eligibleMoves = bisect_right(self.__sortedMoveIds, maxGeneration.getMaxMoveId())
+
+        if eligibleMoves == 0:
+            return None
+
+        return self.__movesById[self.__sortedMoveIds[random.randrange(eligibleMoves)]]
+
+    def getRandomPokemon(self, maxGeneration: PokepediaGeneration) -> PokepediaPokemon | None:
+        if not isinstance(maxGeneration, PokepediaGeneration):
+            raise TypeError(f'maxGeneration argument is malformed: \"{maxGeneration}\"')
+
+        eligiblePokemon = bisect_right(self.__sortedPokedexIds, maxGeneration.getMaxPokedexId())
+
+        if eligiblePokemon == 0:
+            return None
+
+        return self.__pokemonById[self.__sortedPokedexIds[random.randrange(eligiblePokemon)]]
+
+    @classmethod
+    def normalizeName(cls, name: str) -> str:
+        if not utils.isValidStr(name):
+            raise TypeError(f'name argument is malformed: \"{name}\"')
+
+        return utils.cleanStr(name).casefold().replace(' ', '-')
+
+    def searchMoves(self, name: str) -> PokepediaMove | None:
+        if not utils.isValidStr(name):
+            raise TypeError(f'name argument is malformed: \"{name}\"')
+
+        name = self.normalizeName(name)
+
+        if name.isdecimal():
+            return self.__movesById.get(int(name), None)
+
+        return self.__movesByName.get(name, None)
+
+    def searchPokemon(self, name: str) -> PokepediaPokemon | None:
+        if not utils.isValidStr(name):
+            raise TypeError(f'name argument is malformed: \"{name}\"')
+
+        name = self.normalizeName(name)
+
+        if name.isdecimal():
+            return self.__pokemonById.get(int(name), None)
+
+        return self.__pokemonByName.get(name, None)
@@ -0,0 +1,133 @@
+import json
+import traceback
+from typing import Final
+
+import aiofiles.os
+import aiofiles.ospath
+import aiosqlite
+from aiosqlite import Connection
+
+from .pokepediaDataPack import PokepediaDataPack
+from .pokepediaDataPackBuilderInterface import PokepediaDataPackBuilderInterface
+from .pokepediaDataPackJsonMapperInterface import PokepediaDataPackJsonMapperInterface
+from ..pokepediaGeneration import PokepediaGeneration
+from ..pokepediaRepositoryInterface import PokepediaRepositoryInterface
+from ...misc import utils as utils
+from ...network.exceptions import GenericNetworkException
+from ...timber.timberInterface import TimberInterface
+
+
+class PokepediaDataPackBuilder(PokepediaDataPackBuilderInterface):
+
+    def __init__(
+        self,
+        pokepediaDataPackJsonMapper: PokepediaDataPackJsonMapperInterface,
+        pokepediaRepository: PokepediaRepositoryInterface,
+        timber: TimberInterface,
+        dataPackFile: str = '../db/pokepediaDataPack.sqlite'
+    ):
+        if not isinstance(pokepediaDataPackJsonMapper, PokepediaDataPackJsonMapperInterface):
+            raise TypeError(f'pokepediaDataPackJsonMapper argument is malformed: \"{pokepediaDataPackJsonMapper}\"')
+        elif not isinstance(pokepediaRepository, PokepediaRepositoryInterface):
+            raise TypeError(f'pokepediaRepository argument is malformed: \"{pokepediaRepository}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidStr(dataPackFile):
+            raise TypeError(f'dataPackFile argument is malformed: \"{dataPackFile}\"')
+
+        self.__pokepediaDataPackJsonMapper: Final[PokepediaDataPackJsonMapperInterface] = pokepediaDataPackJsonMapper
+        self.__pokepediaRepository: Final[PokepediaRepositoryInterface] = pokepediaRepository
+        self.__timber: Final[TimberInterface] = timber
+        self.__dataPackFile: Final[str] = dataPackFile
+
+    async def buildDataPack(self, maxGeneration: PokepediaGeneration):
+        if not isinstance(maxGeneration, PokepediaGeneration):
+            raise TypeError(f'maxGeneration argument is malformed: \"{maxGeneration}\"')
+
+        # build into a temporary file first, so that a running bot never sees a half written data pack
+        temporaryFile = f'{self.__dataPackFile}.tmp'
+
+        if await aiofiles.ospath.exists(temporaryFile):
+            await aiofiles.os.remove(temporaryFile)
+
+        connection = await aiosqlite.connect(temporaryFile)
+
+        try:
+            await self.__createTables(connection)
+            await self.__storeMoves(connection, maxGeneration)
+            await self.__storePokemon(connection, maxGeneration)
+            await connection.commit()
+        finally:
+            await connection.close()
+
+        await aiofiles.os.replace(temporaryFile, self.__dataPackFile)
+        self.__timber.log('PokepediaDataPackBuilder', f'Finished building Pokepedia data pack ({self.__dataPackFile=}) ({maxGeneration=})')
+
+    async def __createTables(self, connection: Connection):
+        cursor = await connection.execute(
+            '''
+                CREATE TABLE pokepediaMoves (
+                    moveId INTEGER NOT NULL PRIMARY KEY,
+                    searchName TEXT NOT NULL,
+                    initialGeneration TEXT NOT NULL,
+                    jsonData TEXT NOT NULL
+                ) STRICT
+            '''
+        )
+        await cursor.close()
+
+        cursor = await connection.execute(
+            '''
+                CREATE TABLE pokepediaPokemon (
+                    pokedexId INTEGER NOT NULL PRIMARY KEY,
+                    searchName TEXT NOT NULL,
+                    initialGeneration TEXT NOT NULL,
+                    jsonData TEXT NOT NULL
+                ) STRICT
+            '''
+        )
+        await cursor.close()
+
+    async def __storeMoves(self, connection: Connection, maxGeneration: PokepediaGeneration):
+        for moveId in range(1, maxGeneration.getMaxMoveId() + 1):
+            try:
+                move = await self.__pokepediaRepository.fetchMove(moveId)
+            except (GenericNetworkException, KeyError, RuntimeError, ValueError) as e:
+                self.__timber.log('PokepediaDataPackBuilder', f'Unable to fetch move, it will be left out of the data pack ({moveId=}): {e}', e, traceback.format_exc())
+                continue
+
+            jsonData = await self.__pokepediaDataPackJsonMapper.serializeMove(move)
+
+            cursor = await connection.execute(
+                '''
+                    INSERT INTO pokepediaMoves (moveId, searchName, initialGeneration, jsonData)
+                    VALUES ($1, $2, $3, $4)
+                ''',
+                (move.getMoveId(), PokepediaDataPack.normalizeName(move.getRawName()), move.getInitialGeneration().name, json.dumps(jsonData), ),
+            )
+            await cursor.close()
+
+            if moveId % 50 == 0:
+                self.__timber.log('PokepediaDataPackBuilder', f'Stored moves into the data pack ({moveId=}) ({maxGeneration.getMaxMoveId()=})')
+
+    async def __storePokemon(self, connection: Connection, maxGeneration: PokepediaGeneration):
+        for pokedexId in range(1, maxGeneration.getMaxPokedexId() + 1):
+            try:
+                pokemon = await self.__pokepediaRepository.searchPokemon(str(pokedexId))
+            except (GenericNetworkException, KeyError, RuntimeError, ValueError) as e:
+                self.__timber.log('PokepediaDataPackBuilder', f'Unable to fetch Pokemon, it will be left out of the data pack ({pokedexId=}): {e}', e, traceback.format_exc())
+                continue
+
+            jsonData = await self.__pokepediaDataPackJsonMapper.serializePokemon(pokemon)
+
+            cursor = await connection.execute(
+                '''
+                    INSERT INTO pokepediaPokemon (pokedexId, searchName, initialGeneration, jsonData)
+                    VALUES ($1, $2, $3, $4)
+                ''',
+                (pokemon.getPokedexId(), PokepediaDataPack.normalizeName(pokemon.getName()), pokemon.getInitialGeneration().name, json.dumps(jsonData), ),
+            )
+            await cursor.close()
+
+            if pokedexId % 50 == 0:
+                self.__timber.log('PokepediaDataPackBuilder', f'Stored Pokemon into the data pack ({pokedexId=}) ({maxGeneration.getMaxPokedexId()=})')
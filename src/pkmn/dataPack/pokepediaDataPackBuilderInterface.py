@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from ..pokepediaGeneration import PokepediaGeneration
+
+
+class PokepediaDataPackBuilderInterface(ABC):
+
+    @abstractmethod
+    async def buildDataPack(self, maxGeneration: PokepediaGeneration):
+        pass
@@ -0,0 +1,194 @@
+import traceback
+from typing import Any, Final
+
+from .pokepediaDataPackJsonMapperInterface import PokepediaDataPackJsonMapperInterface
+from ..pokepediaContestType import PokepediaContestType
+from ..pokepediaDamageClass import PokepediaDamageClass
+from ..pokepediaElementType import PokepediaElementType
+from ..pokepediaGeneration import PokepediaGeneration
+from ..pokepediaMachine import PokepediaMachine
+from ..pokepediaMachineType import PokepediaMachineType
+from ..pokepediaMove import PokepediaMove
+from ..pokepediaMoveGeneration import PokepediaMoveGeneration
+from ..pokepediaPokemon import PokepediaPokemon
+from ...misc import utils as utils
+from ...timber.timberInterface import TimberInterface
+
+
+class PokepediaDataPackJsonMapper(PokepediaDataPackJsonMapperInterface):
+
+    def __init__(self, timber: TimberInterface):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+
+        self.__timber: Final[TimberInterface] = timber
+
+    def __parseMachine(self, jsonContents: dict[str, Any]) -> PokepediaMachine:
+        return PokepediaMachine(
+            machineId = utils.getIntFromDict(jsonContents, 'machineId'),
+            machineNumber = utils.getIntFromDict(jsonContents, 'machineNumber'),
+            generation = PokepediaGeneration[utils.getStrFromDict(jsonContents, 'generation')],
+            machineType = PokepediaMachineType[utils.getStrFromDict(jsonContents, 'machineType')],
+            machineName = utils.getStrFromDict(jsonContents, 'machineName'),
+            moveName = utils.getStrFromDict(jsonContents, 'moveName')
+        )
+
+    async def parseMove(
+        self,
+        jsonContents: dict[str, Any] | Any | None
+    ) -> PokepediaMove | None:
+        if not isinstance(jsonContents, dict) or len(jsonContents) == 0:
+            return None
+
+        try:
+            contestType: PokepediaContestType | None = None
+            contestTypeString = utils.getStrFromDict(jsonContents, 'contestType', fallback = '')
+            if utils.isValidStr(contestTypeString):
+                contestType = PokepediaContestType[contestTypeString]
+
+            generationMachines: dict[PokepediaGeneration, list[PokepediaMachine]] | None = None
+            generationMachinesJson: dict[str, list[dict[str, Any]]] | Any | None = jsonContents.get('generationMachines')
+            if isinstance(generationMachinesJson, dict) and len(generationMachinesJson) >= 1:
+                generationMachines = dict()
+
+                for generationString, machinesJson in generationMachinesJson.items():
+                    generationMachines[PokepediaGeneration[generationString]] = [ self.__parseMachine(machineJson) for machineJson in machinesJson ]
+
+            generationMoves: dict[PokepediaGeneration, PokepediaMoveGeneration] = dict()
+            for generationString, moveGenerationJson in jsonContents['generationMoves'].items():
+                generationMoves[PokepediaGeneration[generationString]] = self.__parseMoveGeneration(moveGenerationJson)
+
+            return PokepediaMove(
+                contestType = contestType,
+                damageClass = PokepediaDamageClass[utils.getStrFromDict(jsonContents, 'damageClass')],
+                generationMachines = generationMachines,
+                generationMoves = generationMoves,
+                critRate = utils.getIntFromDict(jsonContents, 'critRate', fallback = 0),
+                drain = utils.getIntFromDict(jsonContents, 'drain', fallback = 0),
+                flinchChance = utils.getIntFromDict(jsonContents, 'flinchChance', fallback = 0),
+                moveId = utils.getIntFromDict(jsonContents, 'moveId'),
+                initialGeneration = PokepediaGeneration[utils.getStrFromDict(jsonContents, 'initialGeneration')],
+                description = utils.getStrFromDict(jsonContents, 'description'),
+                name = utils.getStrFromDict(jsonContents, 'name'),
+                rawName = utils.getStrFromDict(jsonContents, 'rawName')
+            )
+        except Exception as e:
+            self.__timber.log('PokepediaDataPackJsonMapper', f'Unable to parse move from data pack JSON ({jsonContents=}): {e}', e, traceback.format_exc())
+            return None
+
+    def __parseMoveGeneration(self, jsonContents: dict[str, Any]) -> PokepediaMoveGeneration:
+        accuracy: int | None = None
+        if utils.isValidInt(jsonContents.get('accuracy')):
+            accuracy = utils.getIntFromDict(jsonContents, 'accuracy')
+
+        power: int | None = None
+        if utils.isValidInt(jsonContents.get('power')):
+            power = utils.getIntFromDict(jsonContents, 'power')
+
+        return PokepediaMoveGeneration(
+            accuracy = accuracy,
+            power = power,
+            pp = utils.getIntFromDict(jsonContents, 'pp'),
+            damageClass = PokepediaDamageClass[utils.getStrFromDict(jsonContents, 'damageClass')],
+            elementType = PokepediaElementType[utils.getStrFromDict(jsonContents, 'elementType')],
+            generation = PokepediaGeneration[utils.getStrFromDict(jsonContents, 'generation')]
+        )
+
+    async def parsePokemon(
+        self,
+        jsonContents: dict[str, Any] | Any | None
+    ) -> PokepediaPokemon | None:
+        if not isinstance(jsonContents, dict) or len(jsonContents) == 0:
+            return None
+
+        try:
+            generationElementTypes: dict[PokepediaGeneration, list[PokepediaElementType]] = dict()
+            for generationString, elementTypeStrings in jsonContents['generationElementTypes'].items():
+                generationElementTypes[PokepediaGeneration[generationString]] = [ PokepediaElementType[elementTypeString] for elementTypeString in elementTypeStrings ]
+
+            return PokepediaPokemon(
+                generationElementTypes = generationElementTypes,
+                initialGeneration = PokepediaGeneration[utils.getStrFromDict(jsonContents, 'initialGeneration')],
+                height = utils.getIntFromDict(jsonContents, 'height'),
+                pokedexId = utils.getIntFromDict(jsonContents, 'pokedexId'),
+                weight = utils.getIntFromDict(jsonContents, 'weight'),
+                name = utils.getStrFromDict(jsonContents, 'name')
+            )
+        except Exception as e:
+            self.__timber.log('PokepediaDataPackJsonMapper', f'Unable to parse Pokemon from data pack JSON ({jsonContents=}): {e}', e, traceback.format_exc())
+            return None
+
+    def __serializeMachine(self, machine: PokepediaMachine) -> dict[str, Any]:
+        return {
+            'generation': machine.generation.name,
+            'machineId': machine.machineId,
+            'machineName': machine.machineName,
+            'machineNumber': machine.machineNumber,
+            'machineType': machine.machineType.name,
+            'moveName': machine.moveName
+        }
+
+    async def serializeMove(
+        self,
+        move: PokepediaMove
+    ) -> dict[str, Any]:
+        if not isinstance(move, PokepediaMove):
+            raise TypeError(f'move argument is malformed: \"{move}\"')
+
+        contestType = move.getContestType()
+        generationMachines = move.getGenerationMachines()
+        generationMachinesJson: dict[str, list[dict[str, Any]]] | None = None
+
+        if generationMachines is not None:
+            generationMachinesJson = dict()
+
+            for generation, machines in generationMachines.items():
+                generationMachinesJson[generation.name] = [ self.__serializeMachine(machine) for machine in machines ]
+
+        generationMovesJson: dict[str, dict[str, Any]] = dict()
+
+        for generation, moveGeneration in move.getGenerationMoves().items():
+            generationMovesJson[generation.name] = {
+                'accuracy': moveGeneration.accuracy,
+                'damageClass': moveGeneration.damageClass.name,
+                'elementType': moveGeneration.elementType.name,
+                'generation': moveGeneration.generation.name,
+                'power': moveGeneration.power,
+                'pp': moveGeneration.pp
+            }
+
+        return {
+            'contestType': None if contestType is None else contestType.name,
+            'critRate': move.getCritRate(),
+            'damageClass': move.getDamageClass().name,
+            'description': move.getDescription(),
+            'drain': move.getDrain(),
+            'flinchChance': move.getFlinchChance(),
+            'generationMachines': generationMachinesJson,
+            'generationMoves': generationMovesJson,
+            'initialGeneration': move.getInitialGeneration().name,
+            'moveId': move.getMoveId(),
+            'name': move.getName(),
+            'rawName': move.getRawName()
+        }
+
+    async def serializePokemon(
+        self,
+        pokemon: PokepediaPokemon
+    ) -> dict[str, Any]:
+        if not isinstance(pokemon, PokepediaPokemon):
+            raise TypeError(f'pokemon argument is malformed: \"{pokemon}\"')
+
+        generationElementTypesJson: dict[str, list[str]] = dict()
+
+        for generation, elementTypes in pokemon.getGenerationElementTypes().items():
+            generationElementTypesJson[generation.name] = [ elementType.name for elementType in elementTypes ]
+
+        return {
+            'generationElementTypes': generationElementTypesJson,
+            'height': pokemon.getHeight(),
+            'initialGeneration': pokemon.getInitialGeneration().name,
+            'name': pokemon.getName(),
+            'pokedexId': pokemon.getPokedexId(),
+            'weight': pokemon.getWeight()
+        }
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from ..pokepediaMove import PokepediaMove
+from ..pokepediaPokemon import PokepediaPokemon
+
+
+class PokepediaDataPackJsonMapperInterface(ABC):
+
+    @abstractmethod
+    async def parseMove(
+        self,
+        jsonContents: dict[str, Any] | Any | None
+    ) -> PokepediaMove | None:
+        pass
+
+    @abstractmethod
+    async def parsePokemon(
+        self,
+        jsonContents: dict[str, Any] | Any | None
+    ) -> PokepediaPokemon | None:
+        pass
+
+    @abstractmethod
+    async def serializeMove(
+        self,
+        move: PokepediaMove
+    ) -> dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def serializePokemon(
+        self,
+        pokemon: PokepediaPokemon
+    ) -> dict[str, Any]:
+        pass
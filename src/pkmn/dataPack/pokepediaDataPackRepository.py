@@ -0,0 +1,217 @@
+import asyncio
+import json
+import random
+import traceback
+from typing import Final
+
+import aiofiles.ospath
+import aiosqlite
+
+from .pokepediaDataPack import PokepediaDataPack
+from .pokepediaDataPackJsonMapperInterface import PokepediaDataPackJsonMapperInterface
+from ..exceptions import NoSuchPokepediaEntryException
+from ..pokepediaGeneration import PokepediaGeneration
+from ..pokepediaMachine import PokepediaMachine
+from ..pokepediaMove import PokepediaMove
+from ..pokepediaNature import PokepediaNature
+from ..pokepediaPokemon import PokepediaPokemon
+from ..pokepediaRepositoryInterface import PokepediaRepositoryInterface
+from ..pokepediaStat import PokepediaStat
+from ...misc import utils as utils
+from ...timber.timberInterface import TimberInterface
+
+
+class PokepediaDataPackRepository(PokepediaRepositoryInterface):
+
+    def __init__(
+        self,
+        pokepediaDataPackJsonMapper: PokepediaDataPackJsonMapperInterface,
+        timber: TimberInterface,
+        fallbackRepository: PokepediaRepositoryInterface | None = None,
+        dataPackFile: str = '../db/pokepediaDataPack.sqlite'
+    ):
+        if not isinstance(pokepediaDataPackJsonMapper, PokepediaDataPackJsonMapperInterface):
+            raise TypeError(f'pokepediaDataPackJsonMapper argument is malformed: \"{pokepediaDataPackJsonMapper}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif fallbackRepository is not None and not isinstance(fallbackRepository, PokepediaRepositoryInterface):
+            raise TypeError(f'fallbackRepository argument is malformed: \"{fallbackRepository}\"')
+        elif not utils.isValidStr(dataPackFile):
+            raise TypeError(f'dataPackFile argument is malformed: \"{dataPackFile}\"')
+
+        self.__pokepediaDataPackJsonMapper: Final[PokepediaDataPackJsonMapperInterface] = pokepediaDataPackJsonMapper
+        self.__timber: Final[TimberInterface] = timber
+        self.__fallbackRepository: Final[PokepediaRepositoryInterface | None] = fallbackRepository
+        self.__dataPackFile: Final[str] = dataPackFile
+
+        self.__loadLock: Final[asyncio.Lock] = asyncio.Lock()
+        self.__dataPack: PokepediaDataPack | None = None
+        self.__isDataPackLoaded: bool = False
+
+    async def fetchMachine(self, machineId: int) -> PokepediaMachine:
+        if not utils.isValidInt(machineId):
+            raise TypeError(f'machineId argument is malformed: \"{machineId}\"')
+
+        dataPack = await self.__getDataPack()
+
+        if dataPack is not None:
+            machine = dataPack.getMachine(machineId)
+
+            if machine is not None:
+                return machine
+
+        return await self.__requireFallbackRepository(f'machine ({machineId=})').fetchMachine(machineId)
+
+    async def fetchMove(self, moveId: int) -> PokepediaMove:
+        if not utils.isValidInt(moveId):
+            raise TypeError(f'moveId argument is malformed: \"{moveId}\"')
+
+        dataPack = await self.__getDataPack()
+
+        if dataPack is not None:
+            move = dataPack.getMove(moveId)
+
+            if move is not None:
+                return move
+
+        return await self.__requireFallbackRepository(f'move ({moveId=})').fetchMove(moveId)
+
+    async def fetchNature(self, natureId: int) -> PokepediaNature:
+        if not utils.isValidInt(natureId):
+            raise TypeError(f'natureId argument is malformed: \"{natureId}\"')
+
+        return PokepediaNature.fromInt(natureId)
+
+    async def fetchRandomMove(self, maxGeneration: PokepediaGeneration) -> PokepediaMove:
+        if not isinstance(maxGeneration, PokepediaGeneration):
+            raise TypeError(f'maxGeneration argument is malformed: \"{maxGeneration}\"')
+
+        dataPack = await self.__getDataPack()
+
+        if dataPack is not None:
+            move = dataPack.getRandomMove(maxGeneration)
+
+            if move is not None:
+                return move
+
+        return await self.__requireFallbackRepository(f'random move ({maxGeneration=})').fetchRandomMove(maxGeneration)
+
+    async def fetchRandomNature(self) -> PokepediaNature:
+        return random.choice(list(PokepediaNature))
+
+    async def fetchRandomPokemon(self, maxGeneration: PokepediaGeneration) -> PokepediaPokemon:
+        if not isinstance(maxGeneration, PokepediaGeneration):
+            raise TypeError(f'maxGeneration argument is malformed: \"{maxGeneration}\"')
+
+        dataPack = await self.__getDataPack()
+
+        if dataPack is not None:
+            pokemon = dataPack.getRandomPokemon(maxGeneration)
+
+            if pokemon is not None:
+                return pokemon
+
+        return await self.__requireFallbackRepository(f'random Pokemon ({maxGeneration=})').fetchRandomPokemon(maxGeneration)
+
+    async def fetchRandomStat(self) -> PokepediaStat:
+        return random.choice(list(PokepediaStat))
+
+    async def fetchStat(self, statId: int) -> PokepediaStat:
+        if not utils.isValidInt(statId):
+            raise TypeError(f'statId argument is malformed: \"{statId}\"')
+
+        return PokepediaStat.fromInt(statId)
+
+    async def __getDataPack(self) -> PokepediaDataPack | None:
+        if self.__isDataPackLoaded:
+            return self.__dataPack
+
+        async with self.__loadLock:
+            if not self.__isDataPackLoaded:
+                try:
+                    self.__dataPack = await self.__loadDataPack()
+                except Exception as e:
+                    self.__timber.log('PokepediaDataPackRepository', f'Encountered exception when loading the Pokepedia data pack ({self.__dataPackFile=}): {e}', e, traceback.format_exc())
+
+                # a missing or broken data pack isn't going to fix itself, so only try the once
+                self.__isDataPackLoaded = True
+
+        return self.__dataPack
+
+    async def __loadDataPack(self) -> PokepediaDataPack | None:
+        if not await aiofiles.ospath.exists(self.__dataPackFile):
+            self.__timber.log('PokepediaDataPackRepository', f'Pokepedia data pack file does not exist ({self.__dataPackFile=})')
+            return None
+
+        moves: list[PokepediaMove] = list()
+        pokemon: list[PokepediaPokemon] = list()
+
+        connection = await aiosqlite.connect(self.__dataPackFile)
+
+        try:
+            cursor = await connection.execute('SELECT jsonData FROM pokepediaMoves')
+
+            for row in await cursor.fetchall():
+                move = await self.__pokepediaDataPackJsonMapper.parseMove(json.loads(row[0]))
+
+                if move is not None:
+                    moves.append(move)
+
+            await cursor.close()
+
+            cursor = await connection.execute('SELECT jsonData FROM pokepediaPokemon')
+
+            for row in await cursor.fetchall():
+                individualPokemon = await self.__pokepediaDataPackJsonMapper.parsePokemon(json.loads(row[0]))
+
+                if individualPokemon is not None:
+                    pokemon.append(individualPokemon)
+
+            await cursor.close()
+        finally:
+            await connection.close()
+
+        dataPack = PokepediaDataPack(
+            moves = moves,
+            pokemon = pokemon
+        )
+
+        self.__timber.log('PokepediaDataPackRepository', f'Loaded Pokepedia data pack ({self.__dataPackFile=}) ({dataPack.getMovesSize()=}) ({dataPack.getPokemonSize()=})')
+        return dataPack
+
+    def __requireFallbackRepository(self, description: str) -> PokepediaRepositoryInterface:
+        fallbackRepository = self.__fallbackRepository
+
+        if fallbackRepository is None:
+            raise NoSuchPokepediaEntryException(f'The Pokepedia data pack has no entry for this {description}, and there is no fallback repository ({self.__dataPackFile=})')
+
+        self.__timber.log('PokepediaDataPackRepository', f'The Pokepedia data pack has no entry for this {description}, so the fallback repository will be used instead ({self.__dataPackFile=})')
+        return fallbackRepository
+
+    async def searchMoves(self, name: str) -> PokepediaMove:
+        if not utils.isValidStr(name):
+            raise TypeError(f'name argument is malformed: \"{name}\"')
+
+        dataPack = await self.__getDataPack()
+
+        if dataPack is not None:
+            move = dataPack.searchMoves(name)
+
+            if move is not None:
+                return move
+
+        return await self.__requireFallbackRepository(f'move ({name=})').searchMoves(name)
+
+    async def searchPokemon(self, name: str) -> PokepediaPokemon:
+        if not utils.isValidStr(name):
+            raise ValueError(f'name argument is malformed: \"{name}\"')
+
+        dataPack = await self.__getDataPack()
+
+        if dataPack is not None:
+            pokemon = dataPack.searchPokemon(name)
+
+            if pokemon is not None:
+                return pokemon
+
+        return await self.__requireFallbackRepository(f'Pokemon ({name=})').searchPokemon(name)
@@ -0,0 +1,4 @@
+class NoSuchPokepediaEntryException(ValueError):
+
+    def __init__(self, message: str):
+        super().__init__(message)
@@ -1,5 +1,9 @@
+from __future__ import annotations
+
 from enum import Enum, auto
 
+from ..misc import utils as utils
+
 
 class PokepediaDamageMultiplier(Enum):
 
@@ -10,6 +14,17 @@ class PokepediaDamageMultiplier(Enum):
     TWO = auto()
     FOUR = auto()
 
+    @classmethod
+    def fromMultiplier(cls, multiplier: float) -> PokepediaDamageMultiplier:
+        if not utils.isValidNum(multiplier):
+            raise TypeError(f'multiplier argument is malformed: \"{multiplier}\"')
+
+        for damageMultiplier in PokepediaDamageMultiplier:
+            if damageMultiplier.getMultiplier() == multiplier:
+                return damageMultiplier
+
+        raise ValueError(f'unknown PokepediaDamageMultiplier: \"{multiplier}\"')
+
     def getEffectDescription(self) -> str:
         if self is PokepediaDamageMultiplier.ZERO:
             return 'damage from'
@@ -22,6 +37,16 @@ class PokepediaDamageMultiplier(Enum):
         else:
             raise RuntimeError(f'unknown PokepediaDamageMultiplier: \"{self}\"')
 
+    def getMultiplier(self) -> float:
+        match self:
+            case PokepediaDamageMultiplier.ZERO: return 0.0
+            case PokepediaDamageMultiplier.ZERO_POINT_TWO_FIVE: return 0.25
+            case PokepediaDamageMultiplier.ZERO_POINT_FIVE: return 0.5
+            case PokepediaDamageMultiplier.ONE: return 1.0
+            case PokepediaDamageMultiplier.TWO: return 2.0
+            case PokepediaDamageMultiplier.FOUR: return 4.0
+            case _: raise RuntimeError(f'unknown PokepediaDamageMultiplier: \"{self}\"')
+
     def toStr(self) -> str:
         match self:
             case PokepediaDamageMultiplier.ZERO: return '0x'
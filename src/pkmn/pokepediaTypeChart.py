@@ -1,5 +1,7 @@
-from collections import Counter
 from enum import Enum, auto
+from functools import cache
+
+from frozendict import frozendict
 
 from .pokepediaDamageMultiplier import PokepediaDamageMultiplier
 from .pokepediaElementType import PokepediaElementType
@@ -12,106 +14,110 @@ class PokepediaTypeChart(Enum):
     GENERATION_2_THRU_5 = auto()
     GENERATION_6_AND_ON = auto()
 
-    def __buildDictionaryFromWeaknessesAndResistances(
+    @cache
+    def __buildWeaknessesAndResistancesFor(
         self,
-        noEffect: list[PokepediaElementType],
-        resistances: list[PokepediaElementType],
-        weaknesses: list[PokepediaElementType]
-    ) -> dict[PokepediaDamageMultiplier, list[PokepediaElementType]]:
-        if not isinstance(noEffect, list):
-            raise TypeError(f'noEffect argument is malformed: \"{noEffect}\"')
-        elif not isinstance(resistances, list):
-            raise TypeError(f'resistances argument is malformed: \"{resistances}\"')
-        elif not isinstance(weaknesses, list):
-            raise TypeError(f'noEffect argument is malformed: \"{weaknesses}\"')
+        types: tuple[PokepediaElementType, ...]
+    ) -> frozendict[PokepediaDamageMultiplier, tuple[PokepediaElementType, ...]]:
+        damageMatrix = self.getDamageMatrix()
+        buckets: dict[PokepediaDamageMultiplier, list[PokepediaElementType]] = dict()
 
-        for elementType in noEffect:
-            while elementType in resistances:
-                resistances.remove(elementType)
+        for elementType in types:
+            if elementType not in damageMatrix:
+                raise ValueError(f'illegal PokepediaElementType for this type chart ({self}): \"{elementType}\"')
 
-            while elementType in weaknesses:
-                weaknesses.remove(elementType)
+        for attackingType in PokepediaElementType:
+            multiplier = 1.0
 
-        noEffect.sort(key = lambda elementType: elementType.value)
+            for defendingType in types:
+                multiplier *= damageMatrix[defendingType][attackingType]
 
-        elementsToFullyRemove: list[PokepediaElementType] = list()
-        for elementType in resistances:
-            if elementType in weaknesses:
-                elementsToFullyRemove.append(elementType)
+            damageMultiplier = PokepediaDamageMultiplier.fromMultiplier(multiplier)
 
-        for elementToFullyRemove in elementsToFullyRemove:
-            while elementToFullyRemove in resistances:
-                resistances.remove(elementToFullyRemove)
+            if damageMultiplier is PokepediaDamageMultiplier.ONE:
+                continue
+            elif damageMultiplier not in buckets:
+                buckets[damageMultiplier] = list()
 
-            while elementToFullyRemove in weaknesses:
-                weaknesses.remove(elementToFullyRemove)
+            buckets[damageMultiplier].append(attackingType)
 
-        resistances.sort(key = lambda elementType: elementType.value)
-        weaknesses.sort(key = lambda elementType: elementType.value)
+        return frozendict({ damageMultiplier: tuple(elementTypes) for damageMultiplier, elementTypes in buckets.items() })
 
-        dictionary: dict[PokepediaDamageMultiplier, list[PokepediaElementType]] = dict()
+    @classmethod
+    def fromPokepediaGeneration(cls, pokepediaGeneration: PokepediaGeneration):
+        if not isinstance(pokepediaGeneration, PokepediaGeneration):
+            raise TypeError(f'pokepediaGeneration argument is malformed: \"{pokepediaGeneration}\"')
 
-        if len(noEffect) == 0:
-            dictionary[PokepediaDamageMultiplier.ZERO] = noEffect
+        if pokepediaGeneration is PokepediaGeneration.GENERATION_1:
+            return PokepediaTypeChart.GENERATION_1
+        elif pokepediaGeneration is PokepediaGeneration.GENERATION_2 or pokepediaGeneration is PokepediaGeneration.GENERATION_3 or pokepediaGeneration is PokepediaGeneration.GENERATION_4 or pokepediaGeneration is PokepediaGeneration.GENERATION_5:
+            return PokepediaTypeChart.GENERATION_2_THRU_5
+        else:
+            return PokepediaTypeChart.GENERATION_6_AND_ON
 
-        if len(resistances) >= 1:
-            counter = Counter(resistances)
-            regularResistances: list[PokepediaElementType] = list()
-            doubleResistances: list[PokepediaElementType] = list()
+    @cache
+    def getDamageMatrix(self) -> frozendict[PokepediaElementType, frozendict[PokepediaElementType, float]]:
+        # maps each defending element type to the damage multiplier of every attacking element
+        # type, computed once per type chart rather than on every weakness/resistance lookup
+        damageMatrix: dict[PokepediaElementType, frozendict[PokepediaElementType, float]] = dict()
 
-            for elementType in PokepediaElementType:
-                if elementType in counter:
-                    if counter[elementType] == 1:
-                        regularResistances.append(elementType)
-                    elif counter[elementType] == 2:
-                        doubleResistances.append(elementType)
-                    else:
-                        raise RuntimeError(f'illegal counter value ({counter[elementType]}) for {elementType}')
+        for defendingType in PokepediaElementType:
+            try:
+                noEffect, resistances, weaknesses = self.__getEffectivenessesFor([ defendingType ])
+            except ValueError:
+                # this element type doesn't exist within this type chart
+                continue
 
-            if len(regularResistances) >= 1:
-                dictionary[PokepediaDamageMultiplier.ZERO_POINT_FIVE] = regularResistances
+            damageRow: dict[PokepediaElementType, float] = dict()
 
-            if len(doubleResistances) >= 1:
-                dictionary[PokepediaDamageMultiplier.ZERO_POINT_TWO_FIVE] = doubleResistances
+            for attackingType in PokepediaElementType:
+                if attackingType in noEffect:
+                    damageRow[attackingType] = 0.0
+                else:
+                    damageRow[attackingType] = 2.0 ** (weaknesses.count(attackingType) - resistances.count(attackingType))
 
-        if len(weaknesses) >= 1:
-            counter = Counter(weaknesses)
-            regularWeaknesses: list[PokepediaElementType] = list()
-            doubleWeaknesses: list[PokepediaElementType] = list()
+            damageMatrix[defendingType] = frozendict(damageRow)
 
-            for elementType in PokepediaElementType:
-                if elementType in counter:
-                    if counter[elementType] == 1:
-                        regularWeaknesses.append(elementType)
-                    elif counter[elementType] == 2:
-                        doubleWeaknesses.append(elementType)
-                    else:
-                        raise RuntimeError(f'illegal counter value ({counter[elementType]}) for {elementType}')
+        return frozendict(damageMatrix)
 
-            if len(regularWeaknesses) >= 1:
-                dictionary[PokepediaDamageMultiplier.TWO] = regularWeaknesses
+    def getDamageMultiplier(
+        self,
+        attackingType: PokepediaElementType,
+        defendingTypes: list[PokepediaElementType]
+    ) -> PokepediaDamageMultiplier:
+        if not isinstance(attackingType, PokepediaElementType):
+            raise TypeError(f'attackingType argument is malformed: \"{attackingType}\"')
+        elif not isinstance(defendingTypes, list):
+            raise TypeError(f'defendingTypes argument is malformed: \"{defendingTypes}\"')
+        elif len(defendingTypes) == 0:
+            raise ValueError(f'defendingTypes argument can\'t be empty: \"{defendingTypes}\"')
 
-            if len(doubleWeaknesses) >= 1:
-                dictionary[PokepediaDamageMultiplier.FOUR] = doubleWeaknesses
+        weaknessesAndResistances = self.__buildWeaknessesAndResistancesFor(tuple(defendingTypes))
 
-        return dictionary
+        for damageMultiplier, elementTypes in weaknessesAndResistances.items():
+            if attackingType in elementTypes:
+                return damageMultiplier
 
-    @classmethod
-    def fromPokepediaGeneration(cls, pokepediaGeneration: PokepediaGeneration):
-        if not isinstance(pokepediaGeneration, PokepediaGeneration):
-            raise TypeError(f'pokepediaGeneration argument is malformed: \"{pokepediaGeneration}\"')
+        return PokepediaDamageMultiplier.ONE
 
-        if pokepediaGeneration is PokepediaGeneration.GENERATION_1:
-            return PokepediaTypeChart.GENERATION_1
-        elif pokepediaGeneration is PokepediaGeneration.GENERATION_2 or pokepediaGeneration is PokepediaGeneration.GENERATION_3 or pokepediaGeneration is PokepediaGeneration.GENERATION_4 or pokepediaGeneration is PokepediaGeneration.GENERATION_5:
-            return PokepediaTypeChart.GENERATION_2_THRU_5
-        else:
-            return PokepediaTypeChart.GENERATION_6_AND_ON
+    def __getEffectivenessesFor(
+        self,
+        types: list[PokepediaElementType]
+    ) -> tuple[list[PokepediaElementType], list[PokepediaElementType], list[PokepediaElementType]]:
+        match self:
+            case PokepediaTypeChart.GENERATION_1:
+                return self.__getGenerationOneEffectivenessesFor(types)
+            case PokepediaTypeChart.GENERATION_2_THRU_5:
+                return self.__getGenerationTwoThruFiveEffectivenessesFor(types)
+            case PokepediaTypeChart.GENERATION_6_AND_ON:
+                return self.__getGenerationSixAndOnEffectivenessesFor(types)
+            case _:
+                raise RuntimeError(f'unknown PokepediaTypeChart: \"{self}\"')
 
-    def __getGenerationOneWeaknessesAndResistancesFor(
+    def __getGenerationOneEffectivenessesFor(
         self,
         types: list[PokepediaElementType]
-    ) -> dict[PokepediaDamageMultiplier, list[PokepediaElementType]]:
+    ) -> tuple[list[PokepediaElementType], list[PokepediaElementType], list[PokepediaElementType]]:
         if not isinstance(types, list):
             raise TypeError(f'types argument is malformed: \"{types}\"')
         elif len(types) == 0:
@@ -228,16 +234,12 @@ class PokepediaTypeChart(Enum):
                 weaknesses.append(PokepediaElementType.ELECTRIC)
                 weaknesses.append(PokepediaElementType.GRASS)
 
-        return self.__buildDictionaryFromWeaknessesAndResistances(
-            noEffect = noEffect,
-            resistances = resistances,
-            weaknesses = weaknesses
-        )
+        return noEffect, resistances, weaknesses
 
-    def __getGenerationTwoThruFiveWeaknessesAndResistancesFor(
+    def __getGenerationTwoThruFiveEffectivenessesFor(
         self,
         types: list[PokepediaElementType]
-    ) -> dict[PokepediaDamageMultiplier, list[PokepediaElementType]]:
+    ) -> tuple[list[PokepediaElementType], list[PokepediaElementType], list[PokepediaElementType]]:
         if not isinstance(types, list):
             raise TypeError(f'types argument is malformed: \"{types}\"')
         elif len(types) == 0:
@@ -378,16 +380,12 @@ class PokepediaTypeChart(Enum):
                 weaknesses.append(PokepediaElementType.ELECTRIC)
                 weaknesses.append(PokepediaElementType.GRASS)
 
-        return self.__buildDictionaryFromWeaknessesAndResistances(
-            noEffect = noEffect,
-            resistances = resistances,
-            weaknesses = weaknesses
-        )
+        return noEffect, resistances, weaknesses
 
-    def __getGenerationSixAndOnWeaknessesAndResistancesFor(
+    def __getGenerationSixAndOnEffectivenessesFor(
         self,
         types: list[PokepediaElementType]
-    ) -> dict[PokepediaDamageMultiplier, list[PokepediaElementType]]:
+    ) -> tuple[list[PokepediaElementType], list[PokepediaElementType], list[PokepediaElementType]]:
         if not isinstance(types, list):
             raise TypeError(f'types argument is malformed: \"{types}\"')
         elif len(types) == 0:
@@ -530,11 +528,7 @@ class PokepediaTypeChart(Enum):
                 weaknesses.append(PokepediaElementType.ELECTRIC)
                 weaknesses.append(PokepediaElementType.GRASS)
 
-        return self.__buildDictionaryFromWeaknessesAndResistances(
-            noEffect = noEffect,
-            resistances = resistances,
-            weaknesses = weaknesses
-        )
+        return noEffect, resistances, weaknesses
 
     def getWeaknessesAndResistancesFor(
         self,
@@ -545,12 +539,8 @@ class PokepediaTypeChart(Enum):
         elif len(types) == 0:
             raise ValueError(f'types argument can\'t be empty: \"{types}\"')
 
-        match self:
-            case PokepediaTypeChart.GENERATION_1:
-                return self.__getGenerationOneWeaknessesAndResistancesFor(types)
-            case PokepediaTypeChart.GENERATION_2_THRU_5:
-                return self.__getGenerationTwoThruFiveWeaknessesAndResistancesFor(types)
-            case PokepediaTypeChart.GENERATION_6_AND_ON:
-                return self.__getGenerationSixAndOnWeaknessesAndResistancesFor(types)
-            case _:
-                raise RuntimeError(f'unknown PokepediaTypeChart: \"{self}\"')
+        weaknessesAndResistances = self.__buildWeaknessesAndResistancesFor(tuple(types))
+
+        return {
+            damageMultiplier: list(elementTypes) for damageMultiplier, elementTypes in weaknessesAndResistances.items()
+        }
@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from frozendict import frozendict
+
 from .actions.recurringAction import RecurringAction
 from .jsonParser.recurringActionsJsonParserInterface import RecurringActionsJsonParserInterface
 from .mostRecentRecurringAction import MostRecentRecurringAction
@@ -52,16 +54,18 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT actiontype, datetime FROM mostrecentrecurringaction
-                WHERE twitchchannelid = $1
-                LIMIT 1
-            ''',
-            twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT actiontype, datetime FROM mostrecentrecurringaction
+                    WHERE twitchchannelid = $1
+                    LIMIT 1
+                ''',
+                twitchChannelId
+            )
+        finally:
+            await connection.close()
 
         if record is None or len(record) == 0:
             return None
@@ -76,6 +80,48 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
             twitchChannelId = twitchChannelId
         )
 
+    async def getMostRecentRecurringActions(
+        self,
+        twitchChannelIdsToChannels: dict[str, str]
+    ) -> frozendict[str, MostRecentRecurringAction]:
+        if not isinstance(twitchChannelIdsToChannels, dict):
+            raise TypeError(f'twitchChannelIdsToChannels argument is malformed: \"{twitchChannelIdsToChannels}\"')
+
+        if len(twitchChannelIdsToChannels) == 0:
+            return frozendict()
+
+        connection = await self.__getDatabaseConnection()
+
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT actiontype, datetime, twitchchannelid FROM mostrecentrecurringaction
+                '''
+            )
+        finally:
+            await connection.close()
+
+        if records is None or len(records) == 0:
+            return frozendict()
+
+        mostRecentActions: dict[str, MostRecentRecurringAction] = dict()
+
+        for record in records:
+            twitchChannelId: str = record[2]
+            twitchChannel = twitchChannelIdsToChannels.get(twitchChannelId, None)
+
+            if not utils.isValidStr(twitchChannel):
+                continue
+
+            mostRecentActions[twitchChannelId] = MostRecentRecurringAction(
+                actionType = await self.__recurringActionsJsonParser.requireActionType(record[0]),
+                dateTime = datetime.fromisoformat(record[1]),
+                twitchChannel = twitchChannel,
+                twitchChannelId = twitchChannelId
+            )
+
+        return frozendict(mostRecentActions)
+
     async def __initDatabaseTable(self):
         if self.__isDatabaseReady:
             return
@@ -83,33 +129,34 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
-                            actiontype text NOT NULL,
-                            datetime text NOT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
-                            actiontype TEXT NOT NULL,
-                            datetime TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
+                                actiontype text NOT NULL,
+                                datetime text NOT NULL,
+                                twitchchannelid text NOT NULL PRIMARY KEY
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
+                                actiontype TEXT NOT NULL,
+                                datetime TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL PRIMARY KEY
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def setMostRecentRecurringAction(self, action: RecurringAction):
         if not isinstance(action, RecurringAction):
@@ -119,14 +166,16 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
         nowDateTime = datetime.now(self.__timeZoneRepository.getDefault())
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO mostrecentrecurringaction (actiontype, datetime, twitchchannelid)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (twitchchannelid) DO UPDATE SET actiontype = EXCLUDED.actiontype, datetime = EXCLUDED.datetime
-            ''',
-            actionTypeString, nowDateTime.isoformat(), action.twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO mostrecentrecurringaction (actiontype, datetime, twitchchannelid)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (twitchchannelid) DO UPDATE SET actiontype = EXCLUDED.actiontype, datetime = EXCLUDED.datetime
+                ''',
+                actionTypeString, nowDateTime.isoformat(), action.twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('MostRecentRecurringActionRepository', f'Updated most recent recurring action ({action=})')
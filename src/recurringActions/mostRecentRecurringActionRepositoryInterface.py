@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from frozendict import frozendict
+
 from .actions.recurringAction import RecurringAction
 from .mostRecentRecurringAction import MostRecentRecurringAction
 
@@ -14,6 +16,13 @@ class MostRecentRecurringActionRepositoryInterface(ABC):
     ) -> MostRecentRecurringAction | None:
         pass
 
+    @abstractmethod
+    async def getMostRecentRecurringActions(
+        self,
+        twitchChannelIdsToChannels: dict[str, str]
+    ) -> frozendict[str, MostRecentRecurringAction]:
+        pass
+
     @abstractmethod
     async def setMostRecentRecurringAction(self, action: RecurringAction):
         pass
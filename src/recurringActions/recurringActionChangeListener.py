@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from .actions.recurringAction import RecurringAction
+
+
+class RecurringActionChangeListener(ABC):
+
+    @abstractmethod
+    async def onRecurringActionChanged(self, action: RecurringAction):
+        pass
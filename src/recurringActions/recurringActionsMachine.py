@@ -2,6 +2,7 @@ import asyncio
 import queue
 import random
 import traceback
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from queue import SimpleQueue
 from typing import Final
@@ -18,9 +19,11 @@ from .events.superTriviaRecurringEvent import SuperTriviaRecurringEvent
 from .events.weatherRecurringEvent import WeatherRecurringEvent
 from .events.wordOfTheDayRecurringEvent import WordOfTheDayRecurringEvent
 from .mostRecentRecurringActionRepositoryInterface import MostRecentRecurringActionRepositoryInterface
+from .recurringActionChangeListener import RecurringActionChangeListener
 from .recurringActionEventListener import RecurringActionEventListener
 from .recurringActionsMachineInterface import RecurringActionsMachineInterface
 from .recurringActionsRepositoryInterface import RecurringActionsRepositoryInterface
+from .recurringActionsSchedule import RecurringActionsSchedule
 from ..cuteness.cutenessRepositoryInterface import CutenessRepositoryInterface
 from ..language.wordOfTheDay.wordOfTheDayRepositoryInterface import WordOfTheDayRepositoryInterface
 from ..location.exceptions import NoSuchLocationException
@@ -30,6 +33,7 @@ from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
 from ..network.exceptions import GenericNetworkException
 from ..timber.timberInterface import TimberInterface
+from ..trivia.actions.startNewSuperTriviaGameAction import StartNewSuperTriviaGameAction
 from ..trivia.builder.triviaGameBuilderInterface import TriviaGameBuilderInterface
 from ..trivia.triviaGameMachineInterface import TriviaGameMachineInterface
 from ..twitch.isLive.isLiveOnTwitchRepositoryInterface import IsLiveOnTwitchRepositoryInterface
@@ -39,7 +43,14 @@ from ..users.usersRepositoryInterface import UsersRepositoryInterface
 from ..weather.weatherRepositoryInterface import WeatherRepositoryInterface
 
 
-class RecurringActionsMachine(RecurringActionsMachineInterface):
+class RecurringActionsMachine(RecurringActionChangeListener, RecurringActionsMachineInterface):
+
+    @dataclass
+    class ScheduledChannel:
+        actions: dict[RecurringActionType, RecurringAction]
+        mostRecentDateTime: datetime | None
+        twitchChannelId: str
+        user: UserInterface
 
     def __init__(
         self,
@@ -59,6 +70,7 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
         wordOfTheDayRepository: WordOfTheDayRepositoryInterface,
         queueSleepTimeSeconds: float = 3,
         refreshSleepTimeSeconds: float = 90,
+        userRefreshSleepTimeSeconds: float = 300,
         queueTimeoutSeconds: int = 3,
         superTriviaCountdownSeconds: int = 5,
         cooldown: timedelta = timedelta(minutes = 3)
@@ -99,6 +111,10 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
             raise TypeError(f'refreshSleepTimeSeconds argument is malformed: \"{refreshSleepTimeSeconds}\"')
         elif refreshSleepTimeSeconds < 30 or refreshSleepTimeSeconds > 600:
             raise ValueError(f'refreshSleepTimeSeconds argument is out of bounds: {refreshSleepTimeSeconds}')
+        elif not utils.isValidNum(userRefreshSleepTimeSeconds):
+            raise TypeError(f'userRefreshSleepTimeSeconds argument is malformed: \"{userRefreshSleepTimeSeconds}\"')
+        elif userRefreshSleepTimeSeconds < 60 or userRefreshSleepTimeSeconds > 3600:
+            raise ValueError(f'userRefreshSleepTimeSeconds argument is out of bounds: {userRefreshSleepTimeSeconds}')
         elif not utils.isValidInt(queueTimeoutSeconds):
             raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
         elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
@@ -126,6 +142,7 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
         self.__wordOfTheDayRepository: Final[WordOfTheDayRepositoryInterface] = wordOfTheDayRepository
         self.__queueSleepTimeSeconds: Final[float] = queueSleepTimeSeconds
         self.__refreshSleepTimeSeconds: Final[float] = refreshSleepTimeSeconds
+        self.__userRefreshSleepTimeSeconds: Final[float] = userRefreshSleepTimeSeconds
         self.__queueTimeoutSeconds: Final[int] = queueTimeoutSeconds
         self.__superTriviaCountdownSeconds: Final[int] = superTriviaCountdownSeconds
         self.__cooldown: Final[timedelta] = cooldown
@@ -133,80 +150,115 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
         self.__isStarted: bool = False
         self.__eventListener: RecurringActionEventListener | None = None
         self.__eventQueue: Final[SimpleQueue[RecurringEvent]] = SimpleQueue()
+        self.__channels: Final[dict[str, RecurringActionsMachine.ScheduledChannel]] = dict()
+        self.__schedule: Final[RecurringActionsSchedule] = RecurringActionsSchedule()
+        self.__scheduleChanged: Final[asyncio.Event] = asyncio.Event()
+        self.__nextUserRefreshDateTime: datetime | None = None
+
+    def __computeDueDateTime(
+        self,
+        channel: ScheduledChannel,
+        action: RecurringAction,
+        now: datetime
+    ) -> datetime:
+        mostRecentDateTime = channel.mostRecentDateTime
+
+        if mostRecentDateTime is None:
+            return now
+
+        minutesBetweenInt = action.minutesBetween
+
+        if not utils.isValidInt(minutesBetweenInt):
+            minutesBetweenInt = action.actionType.defaultRecurringActionTimingMinutes
+
+        # the cooldown applies across all of a channel's action types, while each action's own
+        # minutesBetween is measured from whichever of the channel's actions happened most recently
+        return mostRecentDateTime + max(self.__cooldown, timedelta(minutes = minutesBetweenInt))
 
     async def __fetchViableUsers(self) -> list[UserInterface]:
         users = await self.__usersRepository.getUsersAsync()
         return [ user for user in users if user.isEnabled and user.areRecurringActionsEnabled ]
 
-    async def __findDueRecurringAction(
-        self,
-        twitchChannelId: str,
-        user: UserInterface
-    ) -> RecurringAction | None:
-        if not utils.isValidStr(twitchChannelId):
-            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
-        elif not isinstance(user, UserInterface):
-            raise TypeError(f'user argument is malformed: \"{user}\"')
+    async def __loadChannels(self, users: list[UserInterface]):
+        twitchChannelIdsToUsers: dict[str, UserInterface] = dict()
 
-        actionTypes: list[RecurringActionType] = list(RecurringActionType)
-        action: RecurringAction | None = None
+        for user in users:
+            twitchChannelId = await self.__userIdsRepository.fetchUserId(user.handle)
 
-        mostRecentAction = await self.__mostRecentRecurringActionsRepository.getMostRecentRecurringAction(
-            twitchChannel = user.handle,
-            twitchChannelId = twitchChannelId
-        )
+            if not utils.isValidStr(twitchChannelId):
+                self.__timber.log('RecurringActionsMachine', f'Unable to find Twitch user ID for \"{user.handle}\" when refreshing recurring actions')
+                continue
 
-        now = datetime.now(self.__timeZoneRepository.getDefault())
+            twitchChannelIdsToUsers[twitchChannelId] = user
 
-        while len(actionTypes) >= 1 and action is None:
-            actionType = random.choice(actionTypes)
-            actionTypes.remove(actionType)
+        for twitchChannelId in list(self.__channels.keys()):
+            if twitchChannelId not in twitchChannelIdsToUsers:
+                del self.__channels[twitchChannelId]
+                self.__schedule.unscheduleChannel(twitchChannelId)
 
-            match actionType:
-                case RecurringActionType.CUTENESS:
-                    action = await self.__recurringActionsRepository.getCutenessRecurringAction(
-                        twitchChannel = user.handle,
-                        twitchChannelId = twitchChannelId
-                    )
+        newTwitchChannelIdsToChannels: dict[str, str] = dict()
 
-                case RecurringActionType.SUPER_TRIVIA:
-                    action = await self.__recurringActionsRepository.getSuperTriviaRecurringAction(
-                        twitchChannel = user.handle,
-                        twitchChannelId = twitchChannelId
-                    )
+        for twitchChannelId, user in twitchChannelIdsToUsers.items():
+            channel = self.__channels.get(twitchChannelId, None)
 
-                case RecurringActionType.WEATHER:
-                    action = await self.__recurringActionsRepository.getWeatherRecurringAction(
-                        twitchChannel = user.handle,
-                        twitchChannelId = twitchChannelId
-                    )
+            if channel is None:
+                newTwitchChannelIdsToChannels[twitchChannelId] = user.handle
+            else:
+                channel.user = user
 
-                case RecurringActionType.WORD_OF_THE_DAY:
-                    action = await self.__recurringActionsRepository.getWordOfTheDayRecurringAction(
-                        twitchChannel = user.handle,
-                        twitchChannelId = twitchChannelId
-                    )
+        if len(newTwitchChannelIdsToChannels) == 0:
+            return
+
+        channelActions = await self.__recurringActionsRepository.getRecurringActionsForChannels(newTwitchChannelIdsToChannels)
+        mostRecentActions = await self.__mostRecentRecurringActionsRepository.getMostRecentRecurringActions(newTwitchChannelIdsToChannels)
+        now = datetime.now(self.__timeZoneRepository.getDefault())
+
+        for twitchChannelId in newTwitchChannelIdsToChannels.keys():
+            mostRecentAction = mostRecentActions.get(twitchChannelId, None)
 
-                case _:
-                    raise RuntimeError(f'Unknown RecurringActionType: \"{actionType}\"')
+            channel = RecurringActionsMachine.ScheduledChannel(
+                actions = { action.actionType: action for action in channelActions.get(twitchChannelId, list()) },
+                mostRecentDateTime = None if mostRecentAction is None else mostRecentAction.dateTime,
+                twitchChannelId = twitchChannelId,
+                user = twitchChannelIdsToUsers[twitchChannelId]
+            )
 
-            if action is not None and not action.isEnabled:
-                action = None
-            elif mostRecentAction is not None and action is not None:
-                if now < mostRecentAction.dateTime + self.__cooldown:
-                    action = None
-                else:
-                    minutesBetweenInt = action.minutesBetween
+            self.__channels[twitchChannelId] = channel
+            self.__scheduleChannel(channel, now)
 
-                    if not utils.isValidInt(minutesBetweenInt):
-                        minutesBetweenInt = action.actionType.defaultRecurringActionTimingMinutes
+        self.__timber.log('RecurringActionsMachine', f'Loaded recurring actions for {len(newTwitchChannelIdsToChannels)} channel(s) ({len(self.__channels)} channel(s) in total)')
 
-                    minutesBetween = timedelta(minutes = minutesBetweenInt)
+    async def onRecurringActionChanged(self, action: RecurringAction):
+        if not isinstance(action, RecurringAction):
+            raise TypeError(f'action argument is malformed: \"{action}\"')
 
-                    if now < mostRecentAction.dateTime + minutesBetween:
-                        action = None
+        channel = self.__channels.get(action.twitchChannelId, None)
+
+        if channel is None:
+            # this channel isn't being tracked yet, so it'll be picked up by the next user refresh
+            return
 
-        return action
+        if action.isEnabled:
+            channel.actions[action.actionType] = action
+
+            self.__schedule.schedule(
+                twitchChannelId = channel.twitchChannelId,
+                actionType = action.actionType,
+                dueDateTime = self.__computeDueDateTime(
+                    channel = channel,
+                    action = action,
+                    now = datetime.now(self.__timeZoneRepository.getDefault())
+                )
+            )
+        else:
+            channel.actions.pop(action.actionType, None)
+
+            self.__schedule.unschedule(
+                twitchChannelId = channel.twitchChannelId,
+                actionType = action.actionType
+            )
+
+        self.__scheduleChanged.set()
 
     async def __processCutenessRecurringAction(
         self,
@@ -297,10 +349,9 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
             twitchChannelId = action.twitchChannelId
         ))
 
-        # delay to allow users to prepare for an incoming trivia question
-        await asyncio.sleep(self.__superTriviaCountdownSeconds)
-
-        self.__triviaGameMachine.submitAction(newTriviaGame)
+        # delay to allow users to prepare for an incoming trivia question, without holding up
+        # any other channel's recurring actions while we wait
+        self.__backgroundTaskHelper.createTask(self.__startSuperTriviaCountdown(newTriviaGame))
         return True
 
     async def __processWeatherRecurringAction(
@@ -373,51 +424,98 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
 
         return True
 
-    async def __refreshActions(self):
+    async def __refreshUsersIfNecessary(self, now: datetime):
+        nextUserRefreshDateTime = self.__nextUserRefreshDateTime
+
+        if nextUserRefreshDateTime is not None and now < nextUserRefreshDateTime:
+            return
+
+        self.__nextUserRefreshDateTime = now + timedelta(seconds = self.__userRefreshSleepTimeSeconds)
         users = await self.__fetchViableUsers()
+        await self.__loadChannels(users)
 
-        userToRecurringAction: dict[UserInterface, RecurringAction] = dict()
-        twitchChannelIds: set[str] = set()
+    async def __runDueActions(self, now: datetime):
+        dueActions = self.__schedule.popDue(now)
 
-        for user in users:
-            twitchChannelId = await self.__userIdsRepository.fetchUserId(user.handle)
+        if len(dueActions) == 0:
+            return
 
-            if not utils.isValidStr(twitchChannelId):
-                self.__timber.log('RecurringActionsMachine', f'Unable to find Twitch user ID for \"{user.handle}\" when refreshing recurring actions')
-                continue
+        # Every popped channel must make it back into the schedule, even if the live check or
+        # one of the actions below raises. Otherwise that channel would silently stop getting
+        # recurring actions until it's next edited, or until the bot restarts.
+        retryDueActions = dict(dueActions)
 
-            action = await self.__findDueRecurringAction(
-                twitchChannelId = twitchChannelId,
-                user = user
+        try:
+            twitchChannelIdToLiveStatus = await self.__isLiveOnTwitchRepository.areLive(set(dueActions.keys()))
+
+            for twitchChannelId, actionTypes in dueActions.items():
+                channel = self.__channels.get(twitchChannelId, None)
+
+                if channel is None or not twitchChannelIdToLiveStatus.get(twitchChannelId, False):
+                    continue
+
+                action = channel.actions.get(random.choice(list(actionTypes)), None)
+
+                if action is not None and await self.__processRecurringAction(
+                    user = channel.user,
+                    action = action
+                ):
+                    await self.__mostRecentRecurringActionsRepository.setMostRecentRecurringAction(action)
+                    channel.mostRecentDateTime = datetime.now(self.__timeZoneRepository.getDefault())
+                    self.__scheduleChannel(channel, now)
+                    del retryDueActions[twitchChannelId]
+        finally:
+            # either these channels are offline, nothing came of their actions, or something
+            # went wrong along the way, so check back on them later
+            self.__scheduleRetries(
+                dueActions = retryDueActions,
+                retryDateTime = now + timedelta(seconds = self.__refreshSleepTimeSeconds)
             )
 
-            if action is not None:
-                userToRecurringAction[user] = action
-                twitchChannelIds.add(twitchChannelId)
-
-        if len(userToRecurringAction) == 0 or len(twitchChannelIds) == 0:
-            return
+    def __scheduleChannel(self, channel: ScheduledChannel, now: datetime):
+        self.__schedule.unscheduleChannel(channel.twitchChannelId)
+
+        for action in channel.actions.values():
+            self.__schedule.schedule(
+                twitchChannelId = channel.twitchChannelId,
+                actionType = action.actionType,
+                dueDateTime = self.__computeDueDateTime(
+                    channel = channel,
+                    action = action,
+                    now = now
+                )
+            )
 
-        twitchChannelIdToLiveStatus = await self.__isLiveOnTwitchRepository.areLive(twitchChannelIds)
+    def __scheduleRetries(
+        self,
+        dueActions: dict[str, set[RecurringActionType]],
+        retryDateTime: datetime
+    ):
+        for twitchChannelId, actionTypes in dueActions.items():
+            channel = self.__channels.get(twitchChannelId, None)
 
-        for user, action in userToRecurringAction.items():
-            if not twitchChannelIdToLiveStatus.get(action.twitchChannelId, False):
+            if channel is None:
                 continue
 
-            if await self.__processRecurringAction(
-                user = user,
-                action = action
-            ):
-                await self.__mostRecentRecurringActionsRepository.setMostRecentRecurringAction(action)
+            for actionType in actionTypes:
+                if actionType in channel.actions:
+                    self.__schedule.schedule(
+                        twitchChannelId = twitchChannelId,
+                        actionType = actionType,
+                        dueDateTime = retryDateTime
+                    )
 
     async def __startActionRefreshLoop(self):
         while True:
+            now = datetime.now(self.__timeZoneRepository.getDefault())
+
             try:
-                await self.__refreshActions()
+                await self.__refreshUsersIfNecessary(now)
+                await self.__runDueActions(now)
             except Exception as e:
                 self.__timber.log('RecurringActionsMachine', f'Encountered unknown Exception when refreshing actions: {e}', e, traceback.format_exc())
 
-            await asyncio.sleep(self.__refreshSleepTimeSeconds)
+            await self.__waitForNextDueAction()
 
     def setEventListener(self, listener: RecurringActionEventListener | None):
         if listener is not None and not isinstance(listener, RecurringActionEventListener):
@@ -453,9 +551,14 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
 
         self.__isStarted = True
         self.__timber.log('RecurringActionsMachine', 'Starting RecurringActionsMachine...')
+        self.__recurringActionsRepository.setChangeListener(self)
         self.__backgroundTaskHelper.createTask(self.__startActionRefreshLoop())
         self.__backgroundTaskHelper.createTask(self.__startEventLoop())
 
+    async def __startSuperTriviaCountdown(self, newTriviaGame: StartNewSuperTriviaGameAction):
+        await asyncio.sleep(self.__superTriviaCountdownSeconds)
+        self.__triviaGameMachine.submitAction(newTriviaGame)
+
     async def __submitEvent(self, event: RecurringEvent):
         if not isinstance(event, RecurringEvent):
             raise TypeError(f'event argument is malformed: \"{event}\"')
@@ -464,3 +567,23 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
             self.__eventQueue.put(event, block = True, timeout = self.__queueTimeoutSeconds)
         except queue.Full as e:
             self.__timber.log('RecurringActionsMachine', f'Encountered queue.Full when submitting a new event ({event}) into the event queue (queue size: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+
+    async def __waitForNextDueAction(self):
+        now = datetime.now(self.__timeZoneRepository.getDefault())
+        wakeDateTime = self.__nextUserRefreshDateTime
+        nextDueDateTime = self.__schedule.getNextDueDateTime()
+
+        if wakeDateTime is None or (nextDueDateTime is not None and nextDueDateTime < wakeDateTime):
+            wakeDateTime = nextDueDateTime
+
+        timeoutSeconds = self.__refreshSleepTimeSeconds
+
+        if wakeDateTime is not None:
+            timeoutSeconds = max(1, (wakeDateTime - now).total_seconds())
+
+        self.__scheduleChanged.clear()
+
+        try:
+            await asyncio.wait_for(self.__scheduleChanged.wait(), timeout = timeoutSeconds)
+        except TimeoutError:
+            pass
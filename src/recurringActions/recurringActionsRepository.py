@@ -1,5 +1,6 @@
 from typing import Any
 
+from frozendict import frozendict
 from frozenlist import FrozenList
 
 from .actions.cutenessRecurringAction import CutenessRecurringAction
@@ -9,6 +10,7 @@ from .actions.superTriviaRecurringAction import SuperTriviaRecurringAction
 from .actions.weatherRecurringAction import WeatherRecurringAction
 from .actions.wordOfTheDayRecurringAction import WordOfTheDayRecurringAction
 from .jsonParser.recurringActionsJsonParserInterface import RecurringActionsJsonParserInterface
+from .recurringActionChangeListener import RecurringActionChangeListener
 from .recurringActionsRepositoryInterface import RecurringActionsRepositoryInterface
 from ..misc import utils as utils
 from ..storage.backingDatabase import BackingDatabase
@@ -37,6 +39,7 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         self.__timber: TimberInterface = timber
 
         self.__isDatabaseReady: bool = False
+        self.__changeListener: RecurringActionChangeListener | None = None
 
     async def getAllRecurringActions(
         self,
@@ -128,22 +131,94 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         actionTypeString = await self.__recurringActionsJsonParser.serializeActionType(actionType)
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT configurationjson, isenabled, minutesbetween FROM recurringactions
-                WHERE actiontype = $1 AND twitchchannelid = $2
-                LIMIT 1
-            ''',
-            actionTypeString, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT configurationjson, isenabled, minutesbetween FROM recurringactions
+                    WHERE actiontype = $1 AND twitchchannelid = $2
+                    LIMIT 1
+                ''',
+                actionTypeString, twitchChannelId
+            )
+        finally:
+            await connection.close()
 
         if record is not None and len(record) >= 1:
             return record
         else:
             return None
 
+    async def getRecurringActionsForChannels(
+        self,
+        twitchChannelIdsToChannels: dict[str, str]
+    ) -> frozendict[str, FrozenList[RecurringAction]]:
+        if not isinstance(twitchChannelIdsToChannels, dict):
+            raise TypeError(f'twitchChannelIdsToChannels argument is malformed: \"{twitchChannelIdsToChannels}\"')
+
+        if len(twitchChannelIdsToChannels) == 0:
+            return frozendict()
+
+        # one query for every channel, rather than one query per action type per channel
+        twitchChannelIds = list(twitchChannelIdsToChannels.keys())
+        placeholders = ', '.join(f'${index}' for index in range(1, len(twitchChannelIds) + 1))
+
+        connection = await self.__getDatabaseConnection()
+
+        try:
+            records = await connection.fetchRows(
+                f'''
+                    SELECT actiontype, configurationjson, isenabled, minutesbetween, twitchchannelid FROM recurringactions
+                    WHERE twitchchannelid IN ({placeholders})
+                ''',
+                *twitchChannelIds
+            )
+        finally:
+            await connection.close()
+
+        if records is None or len(records) == 0:
+            return frozendict()
+
+        channelActions: dict[str, FrozenList[RecurringAction]] = dict()
+
+        for record in records:
+            twitchChannelId: str = record[4]
+            twitchChannel = twitchChannelIdsToChannels.get(twitchChannelId, None)
+
+            if not utils.isValidStr(twitchChannel):
+                continue
+
+            actionType = await self.__recurringActionsJsonParser.parseActionType(record[0])
+
+            if actionType is None:
+                self.__timber.log('RecurringActionsRepository', f'Encountered unknown action type when loading recurring actions ({record=}) ({twitchChannel=})')
+                continue
+
+            action = await self.__parseRecurringAction(
+                actionType = actionType,
+                enabled = utils.numToBool(record[2]),
+                minutesBetween = record[3],
+                jsonString = record[1],
+                twitchChannel = twitchChannel,
+                twitchChannelId = twitchChannelId
+            )
+
+            if action is None or not action.isEnabled:
+                continue
+
+            actions = channelActions.get(twitchChannelId, None)
+
+            if actions is None:
+                actions = FrozenList()
+                channelActions[twitchChannelId] = actions
+
+            actions.append(action)
+
+        for actions in channelActions.values():
+            actions.freeze()
+
+        return frozendict(channelActions)
+
     async def getSuperTriviaRecurringAction(
         self,
         twitchChannel: str,
@@ -229,39 +304,95 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS recurringactions (
-                            actiontype text NOT NULL,
-                            configurationjson jsonb DEFAULT NULL,
-                            isenabled smallint DEFAULT 1 NOT NULL,
-                            minutesbetween integer DEFAULT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (actiontype, twitchchannelid)
-                        )
-                    '''
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS recurringactions (
+                                actiontype text NOT NULL,
+                                configurationjson jsonb DEFAULT NULL,
+                                isenabled smallint DEFAULT 1 NOT NULL,
+                                minutesbetween integer DEFAULT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (actiontype, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS recurringactions (
+                                actiontype TEXT NOT NULL,
+                                configurationjson TEXT DEFAULT NULL,
+                                isenabled INTEGER DEFAULT 1 NOT NULL,
+                                minutesbetween INTEGER DEFAULT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (actiontype, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
+
+    async def __parseRecurringAction(
+        self,
+        actionType: RecurringActionType,
+        enabled: bool,
+        minutesBetween: int | None,
+        jsonString: str | None,
+        twitchChannel: str,
+        twitchChannelId: str
+    ) -> RecurringAction | None:
+        match actionType:
+            case RecurringActionType.CUTENESS:
+                return await self.__recurringActionsJsonParser.parseCuteness(
+                    enabled = enabled,
+                    minutesBetween = minutesBetween,
+                    jsonString = jsonString,
+                    twitchChannel = twitchChannel,
+                    twitchChannelId = twitchChannelId
+                )
+
+            case RecurringActionType.SUPER_TRIVIA:
+                return await self.__recurringActionsJsonParser.parseSuperTrivia(
+                    enabled = enabled,
+                    minutesBetween = minutesBetween,
+                    jsonString = jsonString,
+                    twitchChannel = twitchChannel,
+                    twitchChannelId = twitchChannelId
+                )
+
+            case RecurringActionType.WEATHER:
+                return await self.__recurringActionsJsonParser.parseWeather(
+                    enabled = enabled,
+                    minutesBetween = minutesBetween,
+                    jsonString = jsonString,
+                    twitchChannel = twitchChannel,
+                    twitchChannelId = twitchChannelId
                 )
 
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS recurringactions (
-                            actiontype TEXT NOT NULL,
-                            configurationjson TEXT DEFAULT NULL,
-                            isenabled INTEGER DEFAULT 1 NOT NULL,
-                            minutesbetween INTEGER DEFAULT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (actiontype, twitchchannelid)
-                        ) STRICT
-                    '''
+            case RecurringActionType.WORD_OF_THE_DAY:
+                return await self.__recurringActionsJsonParser.parseWordOfTheDay(
+                    enabled = enabled,
+                    minutesBetween = minutesBetween,
+                    jsonString = jsonString,
+                    twitchChannel = twitchChannel,
+                    twitchChannelId = twitchChannelId
                 )
 
             case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+                raise RuntimeError(f'Unknown RecurringActionType: \"{actionType}\"')
+
+    def setChangeListener(self, listener: RecurringActionChangeListener | None):
+        if listener is not None and not isinstance(listener, RecurringActionChangeListener):
+            raise TypeError(f'listener argument is malformed: \"{listener}\"')
 
-        await connection.close()
+        self.__changeListener = listener
 
     async def setRecurringAction(self, action: RecurringAction):
         if not isinstance(action, RecurringAction):
@@ -276,6 +407,10 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
 
         self.__timber.log('RecurringActionsRepository', f'Updated {action.actionType} action for \"{action.twitchChannel}\"')
 
+        changeListener = self.__changeListener
+        if changeListener is not None:
+            await changeListener.onRecurringActionChanged(action)
+
     async def __setRecurringAction(
         self,
         action: RecurringAction,
@@ -290,13 +425,15 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         isEnabled = utils.boolToInt(action.isEnabled)
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO recurringactions (actiontype, configurationjson, isenabled, minutesbetween, twitchchannelid)
-                VALUES ($1, $2, $3, $4, $5)
-                ON CONFLICT (actiontype, twitchchannelid) DO UPDATE SET configurationjson = EXCLUDED.configurationjson, isenabled = EXCLUDED.isenabled, minutesbetween = EXCLUDED.minutesbetween
-            ''',
-            actionTypeString, configurationJson, isEnabled, action.minutesBetween, action.twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO recurringactions (actiontype, configurationjson, isenabled, minutesbetween, twitchchannelid)
+                    VALUES ($1, $2, $3, $4, $5)
+                    ON CONFLICT (actiontype, twitchchannelid) DO UPDATE SET configurationjson = EXCLUDED.configurationjson, isenabled = EXCLUDED.isenabled, minutesbetween = EXCLUDED.minutesbetween
+                ''',
+                actionTypeString, configurationJson, isEnabled, action.minutesBetween, action.twitchChannelId
+            )
+        finally:
+            await connection.close()
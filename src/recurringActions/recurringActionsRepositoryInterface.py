@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from frozendict import frozendict
 from frozenlist import FrozenList
 
 from .actions.cutenessRecurringAction import CutenessRecurringAction
@@ -7,6 +8,7 @@ from .actions.recurringAction import RecurringAction
 from .actions.superTriviaRecurringAction import SuperTriviaRecurringAction
 from .actions.weatherRecurringAction import WeatherRecurringAction
 from .actions.wordOfTheDayRecurringAction import WordOfTheDayRecurringAction
+from .recurringActionChangeListener import RecurringActionChangeListener
 
 
 class RecurringActionsRepositoryInterface(ABC):
@@ -27,6 +29,13 @@ class RecurringActionsRepositoryInterface(ABC):
     ) -> CutenessRecurringAction | None:
         pass
 
+    @abstractmethod
+    async def getRecurringActionsForChannels(
+        self,
+        twitchChannelIdsToChannels: dict[str, str]
+    ) -> frozendict[str, FrozenList[RecurringAction]]:
+        pass
+
     @abstractmethod
     async def getSuperTriviaRecurringAction(
         self,
@@ -51,6 +60,10 @@ class RecurringActionsRepositoryInterface(ABC):
     ) -> WordOfTheDayRecurringAction | None:
         pass
 
+    @abstractmethod
+    def setChangeListener(self, listener: RecurringActionChangeListener | None):
+        pass
+
     @abstractmethod
     async def setRecurringAction(self, action: RecurringAction):
         pass
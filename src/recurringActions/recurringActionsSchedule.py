@@ -0,0 +1,98 @@
+import heapq
+import itertools
+from datetime import datetime
+from typing import Final
+
+from .actions.recurringActionType import RecurringActionType
+from ..misc import utils as utils
+
+
+class RecurringActionsSchedule:
+
+    def __init__(self):
+        self.__heap: Final[list[tuple[datetime, int, str, RecurringActionType]]] = list()
+        self.__sequence: Final[itertools.count[int]] = itertools.count()
+
+        # Maps each scheduled (channel, action type) pair to the sequence number of its live
+        # heap entry. Rescheduling or unscheduling just overwrites or removes the pair here,
+        # leaving the old heap entry behind to be skipped over whenever it surfaces.
+        self.__entries: Final[dict[tuple[str, RecurringActionType], int]] = dict()
+
+    def clear(self):
+        self.__heap.clear()
+        self.__entries.clear()
+
+    def __discardStaleEntries(self):
+        while len(self.__heap) >= 1:
+            _, sequence, twitchChannelId, actionType = self.__heap[0]
+
+            if self.__entries.get((twitchChannelId, actionType), None) == sequence:
+                return
+
+            heapq.heappop(self.__heap)
+
+    def getNextDueDateTime(self) -> datetime | None:
+        self.__discardStaleEntries()
+
+        if len(self.__heap) == 0:
+            return None
+
+        return self.__heap[0][0]
+
+    def popDue(self, now: datetime) -> dict[str, set[RecurringActionType]]:
+        if not isinstance(now, datetime):
+            raise TypeError(f'now argument is malformed: \"{now}\"')
+
+        dueActions: dict[str, set[RecurringActionType]] = dict()
+        self.__discardStaleEntries()
+
+        while len(self.__heap) >= 1 and self.__heap[0][0] <= now:
+            _, _, twitchChannelId, actionType = heapq.heappop(self.__heap)
+            del self.__entries[(twitchChannelId, actionType)]
+
+            actionTypes = dueActions.get(twitchChannelId, None)
+
+            if actionTypes is None:
+                actionTypes = set()
+                dueActions[twitchChannelId] = actionTypes
+
+            actionTypes.add(actionType)
+            self.__discardStaleEntries()
+
+        return dueActions
+
+    def schedule(
+        self,
+        twitchChannelId: str,
+        actionType: RecurringActionType,
+        dueDateTime: datetime
+    ):
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not isinstance(actionType, RecurringActionType):
+            raise TypeError(f'actionType argument is malformed: \"{actionType}\"')
+        elif not isinstance(dueDateTime, datetime):
+            raise TypeError(f'dueDateTime argument is malformed: \"{dueDateTime}\"')
+
+        sequence = next(self.__sequence)
+        self.__entries[(twitchChannelId, actionType)] = sequence
+        heapq.heappush(self.__heap, (dueDateTime, sequence, twitchChannelId, actionType))
+
+    def unschedule(
+        self,
+        twitchChannelId: str,
+        actionType: RecurringActionType
+    ):
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not isinstance(actionType, RecurringActionType):
+            raise TypeError(f'actionType argument is malformed: \"{actionType}\"')
+
+        self.__entries.pop((twitchChannelId, actionType), None)
+
+    def unscheduleChannel(self, twitchChannelId: str):
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+
+        for actionType in RecurringActionType:
+            self.__entries.pop((twitchChannelId, actionType), None)
@@ -93,14 +93,15 @@ class RedemptionCounterRepository(RedemptionCounterRepositoryInterface):
 
         connection = await self.__getDatabaseConnection()
 
-        redemptionCount = await self.__fetchFromDatabase(
-            connection = connection,
-            chatterUserId = chatterUserId,
-            counterName = counterName,
-            twitchChannelId = twitchChannelId
-        )
-
-        await connection.close()
+        try:
+            redemptionCount = await self.__fetchFromDatabase(
+                connection = connection,
+                chatterUserId = chatterUserId,
+                counterName = counterName,
+                twitchChannelId = twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__cache[f'{twitchChannelId}:{counterName}:{chatterUserId}'] = redemptionCount
 
         return redemptionCount
@@ -129,30 +130,31 @@ class RedemptionCounterRepository(RedemptionCounterRepositoryInterface):
 
         connection = await self.__getDatabaseConnection()
 
-        redemptionCount = await self.__fetchFromDatabase(
-            connection = connection,
-            chatterUserId = chatterUserId,
-            counterName = counterName,
-            twitchChannelId = twitchChannelId
-        )
-
-        newRedemptionCount = RedemptionCount(
-            count = redemptionCount.count + incrementAmount,
-            chatterUserId = chatterUserId,
-            counterName = counterName,
-            twitchChannelId = twitchChannelId
-        )
+        try:
+            redemptionCount = await self.__fetchFromDatabase(
+                connection = connection,
+                chatterUserId = chatterUserId,
+                counterName = counterName,
+                twitchChannelId = twitchChannelId
+            )
 
-        await connection.execute(
-            '''
-                INSERT INTO redemptioncounter (count, chatteruserid, countername, twitchchannelid)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (chatteruserid, countername, twitchchannelid) DO UPDATE SET count = EXCLUDED.count
-            ''',
-            newRedemptionCount.count, chatterUserId, counterName, twitchChannelId
-        )
+            newRedemptionCount = RedemptionCount(
+                count = redemptionCount.count + incrementAmount,
+                chatterUserId = chatterUserId,
+                counterName = counterName,
+                twitchChannelId = twitchChannelId
+            )
 
-        await connection.close()
+            await connection.execute(
+                '''
+                    INSERT INTO redemptioncounter (count, chatteruserid, countername, twitchchannelid)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (chatteruserid, countername, twitchchannelid) DO UPDATE SET count = EXCLUDED.count
+                ''',
+                newRedemptionCount.count, chatterUserId, counterName, twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__cache[f'{twitchChannelId}:{counterName}:{chatterUserId}'] = newRedemptionCount
         self.__timber.log('RedemptionCounterRepository', f'Incremented {counterName} from {redemptionCount.count} to {newRedemptionCount.count} for {chatterUserId} in {twitchChannelId}')
 
@@ -165,34 +167,35 @@ class RedemptionCounterRepository(RedemptionCounterRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS redemptioncounter (
-                            count bigint DEFAULT 0 NOT NULL,
-                            chatteruserid text NOT NULL,
-                            countername text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, countername, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS redemptioncounter (
-                            count INTEGER NOT NULL DEFAULT 0,
-                            chatteruserid TEXT NOT NULL,
-                            countername TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, countername, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS redemptioncounter (
+                                count bigint DEFAULT 0 NOT NULL,
+                                chatteruserid text NOT NULL,
+                                countername text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (chatteruserid, countername, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS redemptioncounter (
+                                count INTEGER NOT NULL DEFAULT 0,
+                                chatteruserid TEXT NOT NULL,
+                                countername TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (chatteruserid, countername, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 
 from frozenlist import FrozenList
@@ -33,3 +34,9 @@ class DatabaseConnection(ABC):
     @abstractmethod
     def isClosed(self) -> bool:
         pass
+
+    @abstractmethod
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        # Groups every `execute()` call made within this context into a single transaction,
+        # which is committed when the context exits normally, or rolled back if it raises.
+        pass
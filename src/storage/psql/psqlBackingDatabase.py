@@ -39,6 +39,15 @@ class PsqlBackingDatabase(BackingDatabase):
 
         self.__connectionPool: asyncpg.Pool | None = None
 
+    async def close(self):
+        connectionPool = self.__connectionPool
+
+        if connectionPool is None:
+            return
+
+        self.__connectionPool = None
+        await connectionPool.close()
+
     async def __createCollations(self, databaseConnection: DatabaseConnection):
         if not isinstance(databaseConnection, DatabaseConnection):
             raise TypeError(f'databaseConnection argument is malformed: \"{databaseConnection}\"')
@@ -1,3 +1,4 @@
+from contextlib import AbstractAsyncContextManager
 from typing import Any, Final
 
 import asyncpg
@@ -39,8 +40,11 @@ class PsqlDatabaseConnection(DatabaseConnection):
 
         self.__requireNotClosed()
 
-        async with self.__connection.transaction():
+        if self.__connection.is_in_transaction():
             await self.__connection.execute(query, *args)
+        else:
+            async with self.__connection.transaction():
+                await self.__connection.execute(query, *args)
 
     async def fetchRow(self, query: str, *args: Any | None) -> FrozenList[Any] | None:
         if not utils.isValidStr(query):
@@ -87,3 +91,7 @@ class PsqlDatabaseConnection(DatabaseConnection):
     def __requireNotClosed(self):
         if self.isClosed:
             raise DatabaseConnectionIsClosedException(f'This database connection has already been closed! ({self.databaseType})')
+
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        self.__requireNotClosed()
+        return self.__connection.transaction()
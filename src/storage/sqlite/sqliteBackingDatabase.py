@@ -1,8 +1,7 @@
 from asyncio import AbstractEventLoop
 from typing import Final
 
-import aiosqlite
-
+from .sqliteConnectionPool import SqliteConnectionPool
 from .sqliteDatabaseConnection import SqliteDatabaseConnection
 from ..backingDatabase import BackingDatabase
 from ..databaseConnection import DatabaseConnection
@@ -15,22 +14,41 @@ class SqliteBackingDatabase(BackingDatabase):
     def __init__(
         self,
         eventLoop: AbstractEventLoop,
-        backingDatabaseFile: str = '../db/database.sqlite'
+        backingDatabaseFile: str = '../db/database.sqlite',
+        cachedStatements: int = 256,
+        maxConnections: int = 16,
+        maxIdleConnections: int = 4,
     ):
         if not isinstance(eventLoop, AbstractEventLoop):
             raise TypeError(f'eventLoop argument is malformed: \"{eventLoop}\"')
         elif not utils.isValidStr(backingDatabaseFile):
             raise TypeError(f'backingDatabaseFile argument is malformed: \"{backingDatabaseFile}\"')
-
-        self.__eventLoop: Final[AbstractEventLoop] = eventLoop
-        self.__backingDatabaseFile: Final[str] = backingDatabaseFile
+        elif not utils.isValidInt(cachedStatements):
+            raise TypeError(f'cachedStatements argument is malformed: \"{cachedStatements}\"')
+        elif not utils.isValidInt(maxConnections):
+            raise TypeError(f'maxConnections argument is malformed: \"{maxConnections}\"')
+        elif not utils.isValidInt(maxIdleConnections):
+            raise TypeError(f'maxIdleConnections argument is malformed: \"{maxIdleConnections}\"')
+
+        self.__connectionPool: Final[SqliteConnectionPool] = SqliteConnectionPool(
+            eventLoop = eventLoop,
+            backingDatabaseFile = backingDatabaseFile,
+            cachedStatements = cachedStatements,
+            maxConnections = maxConnections,
+            maxIdleConnections = maxIdleConnections,
+        )
+
+    async def close(self):
+        await self.__connectionPool.close()
 
     @property
     def databaseType(self) -> DatabaseType:
         return DatabaseType.SQLITE
 
     async def getConnection(self) -> DatabaseConnection:
-        return SqliteDatabaseConnection(await aiosqlite.connect(
-            database = self.__backingDatabaseFile,
-            loop = self.__eventLoop
-        ))
+        connection = await self.__connectionPool.acquire()
+
+        return SqliteDatabaseConnection(
+            connection = connection,
+            pool = self.__connectionPool,
+        )
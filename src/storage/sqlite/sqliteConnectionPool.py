@@ -0,0 +1,125 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from typing import Final
+
+import aiosqlite
+
+from ...misc import utils as utils
+
+
+class SqliteConnectionPool:
+
+    def __init__(
+        self,
+        eventLoop: AbstractEventLoop,
+        backingDatabaseFile: str,
+        busyTimeoutSeconds: float = 5,
+        cachedStatements: int = 256,
+        maxConnections: int = 16,
+        maxIdleConnections: int = 4,
+    ):
+        if not isinstance(eventLoop, AbstractEventLoop):
+            raise TypeError(f'eventLoop argument is malformed: \"{eventLoop}\"')
+        elif not utils.isValidStr(backingDatabaseFile):
+            raise TypeError(f'backingDatabaseFile argument is malformed: \"{backingDatabaseFile}\"')
+        elif not utils.isValidNum(busyTimeoutSeconds):
+            raise TypeError(f'busyTimeoutSeconds argument is malformed: \"{busyTimeoutSeconds}\"')
+        elif busyTimeoutSeconds < 0 or busyTimeoutSeconds > 60:
+            raise ValueError(f'busyTimeoutSeconds argument is out of bounds: {busyTimeoutSeconds}')
+        elif not utils.isValidInt(cachedStatements):
+            raise TypeError(f'cachedStatements argument is malformed: \"{cachedStatements}\"')
+        elif cachedStatements < 0 or cachedStatements > utils.getShortMaxSafeSize():
+            raise ValueError(f'cachedStatements argument is out of bounds: {cachedStatements}')
+        elif not utils.isValidInt(maxConnections):
+            raise TypeError(f'maxConnections argument is malformed: \"{maxConnections}\"')
+        elif maxConnections < 1 or maxConnections > 64:
+            raise ValueError(f'maxConnections argument is out of bounds: {maxConnections}')
+        elif not utils.isValidInt(maxIdleConnections):
+            raise TypeError(f'maxIdleConnections argument is malformed: \"{maxIdleConnections}\"')
+        elif maxIdleConnections < 1 or maxIdleConnections > 32:
+            raise ValueError(f'maxIdleConnections argument is out of bounds: {maxIdleConnections}')
+        elif maxIdleConnections > maxConnections:
+            raise ValueError(f'maxIdleConnections argument can\'t be greater than maxConnections ({maxIdleConnections=}) ({maxConnections=})')
+
+        self.__eventLoop: Final[AbstractEventLoop] = eventLoop
+        self.__backingDatabaseFile: Final[str] = backingDatabaseFile
+        self.__busyTimeoutSeconds: Final[float] = busyTimeoutSeconds
+        self.__cachedStatements: Final[int] = cachedStatements
+        self.__maxIdleConnections: Final[int] = maxIdleConnections
+
+        # every connection that's been handed out holds one of these until it's released, so
+        # a burst of callers waits for a free connection instead of opening an unbounded number
+        self.__connectionSemaphore: Final[asyncio.Semaphore] = asyncio.Semaphore(maxConnections)
+
+        self.__isClosed: bool = False
+        self.__idleConnections: Final[list[aiosqlite.Connection]] = list()
+        self.__journalModeLock: Final[asyncio.Lock] = asyncio.Lock()
+        self.__isJournalModeSet: bool = False
+
+    async def acquire(self) -> aiosqlite.Connection:
+        if self.__isClosed:
+            raise RuntimeError(f'This connection pool has already been closed! ({self.__backingDatabaseFile=})')
+
+        await self.__connectionSemaphore.acquire()
+
+        try:
+            if self.__isClosed:
+                raise RuntimeError(f'This connection pool has already been closed! ({self.__backingDatabaseFile=})')
+            elif len(self.__idleConnections) >= 1:
+                return self.__idleConnections.pop()
+
+            return await self.__createConnection()
+        except BaseException:
+            self.__connectionSemaphore.release()
+            raise
+
+    async def close(self):
+        if self.__isClosed:
+            return
+
+        self.__isClosed = True
+
+        while len(self.__idleConnections) >= 1:
+            connection = self.__idleConnections.pop()
+            await connection.close()
+
+    async def __createConnection(self) -> aiosqlite.Connection:
+        connection = await aiosqlite.connect(
+            database = self.__backingDatabaseFile,
+            loop = self.__eventLoop,
+            cached_statements = self.__cachedStatements,
+            timeout = self.__busyTimeoutSeconds,
+        )
+
+        # Switching the journal mode needs an exclusive lock on the database file, so we only
+        # want one connection to attempt it. WAL mode is persistent on the database file itself,
+        # meaning that every connection created after this one will automatically use it.
+        async with self.__journalModeLock:
+            if not self.__isJournalModeSet:
+                await connection.execute('PRAGMA journal_mode = WAL')
+                self.__isJournalModeSet = True
+
+        # In WAL mode, NORMAL synchronous is still safe from corruption, but it no longer
+        # requires an fsync for every single committed transaction.
+        await connection.execute('PRAGMA synchronous = NORMAL')
+        return connection
+
+    @property
+    def isClosed(self) -> bool:
+        return self.__isClosed
+
+    async def release(self, connection: aiosqlite.Connection):
+        if not isinstance(connection, aiosqlite.Connection):
+            raise TypeError(f'connection argument is malformed: \"{connection}\"')
+
+        try:
+            if connection.in_transaction:
+                # don't hand out a connection that still has uncommitted work on it
+                await connection.rollback()
+
+            if self.__isClosed or len(self.__idleConnections) >= self.__maxIdleConnections:
+                await connection.close()
+            else:
+                self.__idleConnections.append(connection)
+        finally:
+            self.__connectionSemaphore.release()
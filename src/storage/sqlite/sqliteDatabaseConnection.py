@@ -1,9 +1,11 @@
 import sqlite3
-from typing import Any, Final
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Final
 
 import aiosqlite
 from frozenlist import FrozenList
 
+from .sqliteConnectionPool import SqliteConnectionPool
 from ..databaseConnection import DatabaseConnection
 from ..databaseType import DatabaseType
 from ..exceptions import DatabaseConnectionIsClosedException, DatabaseOperationalError
@@ -12,20 +14,24 @@ from ...misc import utils as utils
 
 class SqliteDatabaseConnection(DatabaseConnection):
 
-    def __init__(self, connection: aiosqlite.Connection):
+    def __init__(self, connection: aiosqlite.Connection, pool: SqliteConnectionPool):
         if not isinstance(connection, aiosqlite.Connection):
             raise TypeError(f'connection argument is malformed: \"{connection}\"')
+        elif not isinstance(pool, SqliteConnectionPool):
+            raise TypeError(f'pool argument is malformed: \"{pool}\"')
 
         self.__connection: Final[aiosqlite.Connection] = connection
+        self.__pool: Final[SqliteConnectionPool] = pool
 
         self.__isClosed: bool = False
+        self.__isInTransaction: bool = False
 
     async def close(self):
         if self.isClosed:
             return
 
         self.__isClosed = True
-        await self.__connection.close()
+        await self.__pool.release(self.__connection)
 
     @property
     def databaseType(self) -> DatabaseType:
@@ -38,7 +44,10 @@ class SqliteDatabaseConnection(DatabaseConnection):
         self.__requireNotClosed()
 
         cursor = await self.__connection.execute(query, args)
-        await self.__connection.commit()
+
+        if not self.__isInTransaction:
+            await self.__connection.commit()
+
         await cursor.close()
 
     async def fetchRow(self, query: str, *args: Any | None) -> FrozenList[Any] | None:
@@ -100,3 +109,25 @@ class SqliteDatabaseConnection(DatabaseConnection):
     def __requireNotClosed(self):
         if self.__isClosed:
             raise DatabaseConnectionIsClosedException(f'This database connection has already been closed! ({self.databaseType})')
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            # nested transactions just become a part of the outermost one
+            yield
+            return
+
+        self.__isInTransaction = True
+
+        try:
+            await self.__connection.execute('BEGIN')
+            yield
+        except BaseException:
+            await self.__connection.rollback()
+            raise
+        else:
+            await self.__connection.commit()
+        finally:
+            self.__isInTransaction = False
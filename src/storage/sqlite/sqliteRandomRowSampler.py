@@ -0,0 +1,175 @@
+import asyncio
+import random
+from array import array
+from typing import Any, Collection, Final
+
+import aiosqlite
+
+from ...misc import utils as utils
+
+
+class SqliteRandomRowSampler:
+
+    def __init__(
+        self,
+        databaseFile: str,
+        tableName: str,
+        whereClause: str | None = None,
+        whereParameters: Collection[Any] = tuple(),
+    ):
+        if not utils.isValidStr(databaseFile):
+            raise TypeError(f'databaseFile argument is malformed: \"{databaseFile}\"')
+        elif not utils.isValidStr(tableName) or not tableName.isidentifier():
+            raise TypeError(f'tableName argument is malformed: \"{tableName}\"')
+        elif whereClause is not None and not utils.isValidStr(whereClause):
+            raise TypeError(f'whereClause argument is malformed: \"{whereClause}\"')
+        elif not isinstance(whereParameters, Collection):
+            raise TypeError(f'whereParameters argument is malformed: \"{whereParameters}\"')
+
+        self.__databaseFile: Final[str] = databaseFile
+        self.__tableName: Final[str] = tableName
+        self.__whereClause: Final[str | None] = whereClause
+        self.__whereParameters: Final[tuple[Any, ...]] = tuple(whereParameters)
+
+        self.__connectionLock: Final[asyncio.Lock] = asyncio.Lock()
+        self.__rowIdsLock: Final[asyncio.Lock] = asyncio.Lock()
+        self.__connection: aiosqlite.Connection | None = None
+        self.__rowIds: array[int] | None = None
+        self.__rowIdsVersion: int = 0
+
+    def addRowId(self, rowId: int):
+        if not utils.isValidInt(rowId):
+            raise TypeError(f'rowId argument is malformed: \"{rowId}\"')
+
+        rowIds = self.__rowIds
+
+        if rowIds is None:
+            # Nothing is cached yet, but a load could already be in flight. Make sure that its
+            # (possibly stale) result isn't kept, as it may have been read before this row existed.
+            self.__rowIdsVersion += 1
+        elif rowId not in rowIds:
+            rowIds.append(rowId)
+
+    async def close(self):
+        connection = self.__connection
+        self.__connection = None
+        self.__rowIds = None
+
+        if connection is not None:
+            await connection.close()
+
+    async def fetchRandomRow(self, columns: Collection[str]) -> tuple[Any, ...] | None:
+        if not isinstance(columns, Collection) or len(columns) == 0:
+            raise TypeError(f'columns argument is malformed: \"{columns}\"')
+
+        for column in columns:
+            if not utils.isValidStr(column) or not column.isidentifier():
+                raise TypeError(f'columns argument contains a malformed column: \"{column}\" ({columns=})')
+
+        rowId = await self.__sampleRowId()
+
+        if rowId is None:
+            return None
+
+        row = await self.__fetchRowById(columns, rowId)
+
+        if row is None:
+            # The cached row ID has disappeared out from under us, so the cached ID list is
+            # stale. Reload it and try once more before giving up.
+            self.invalidate()
+            rowId = await self.__sampleRowId()
+
+            if rowId is not None:
+                row = await self.__fetchRowById(columns, rowId)
+
+        return row
+
+    async def __fetchRowIds(self) -> array[int]:
+        rowIds = self.__rowIds
+
+        if rowIds is not None:
+            return rowIds
+
+        async with self.__rowIdsLock:
+            rowIds = self.__rowIds
+
+            if rowIds is not None:
+                return rowIds
+
+            rowIdsVersion = self.__rowIdsVersion
+            query = f'SELECT rowid FROM {self.__tableName}'
+
+            if utils.isValidStr(self.__whereClause):
+                query = f'{query} WHERE {self.__whereClause}'
+
+            connection = await self.getConnection()
+            cursor = await connection.execute(query, self.__whereParameters)
+            rows = await cursor.fetchall()
+            await cursor.close()
+
+            rowIds = array('q', (row[0] for row in rows))
+
+            if rowIdsVersion == self.__rowIdsVersion:
+                self.__rowIds = rowIds
+
+            return rowIds
+
+    async def __fetchRowById(
+        self,
+        columns: Collection[str],
+        rowId: int,
+    ) -> tuple[Any, ...] | None:
+        connection = await self.getConnection()
+        cursor = await connection.execute(
+            f'SELECT {", ".join(columns)} FROM {self.__tableName} WHERE rowid = ?',
+            (rowId, ),
+        )
+        row = await cursor.fetchone()
+        await cursor.close()
+
+        if row is None:
+            return None
+
+        return tuple(row)
+
+    async def getConnection(self) -> aiosqlite.Connection:
+        connection = self.__connection
+
+        if connection is not None:
+            return connection
+
+        async with self.__connectionLock:
+            connection = self.__connection
+
+            if connection is None:
+                connection = await aiosqlite.connect(self.__databaseFile)
+                self.__connection = connection
+
+            return connection
+
+    def invalidate(self):
+        self.__rowIds = None
+        self.__rowIdsVersion += 1
+
+    def removeRowId(self, rowId: int):
+        if not utils.isValidInt(rowId):
+            raise TypeError(f'rowId argument is malformed: \"{rowId}\"')
+
+        rowIds = self.__rowIds
+
+        if rowIds is None:
+            self.__rowIdsVersion += 1
+        elif rowId in rowIds:
+            rowIds.remove(rowId)
+
+    async def __sampleRowId(self) -> int | None:
+        rowIds = await self.__fetchRowIds()
+
+        if len(rowIds) == 0:
+            return None
+
+        return random.choice(rowIds)
+
+    @property
+    def tableName(self) -> str:
+        return self.__tableName
@@ -0,0 +1,215 @@
+import asyncio
+import itertools
+import traceback
+from typing import Any, Callable, Collection, Final
+
+from frozenlist import FrozenList
+
+from .backingDatabase import BackingDatabase
+from .writeBehindBufferInterface import WriteBehindBufferInterface
+from ..misc import utils as utils
+from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..timber.timberInterface import TimberInterface
+
+
+class WriteBehindBuffer(WriteBehindBufferInterface):
+
+    # SQLite builds older than 3.32.0 cap the number of bound parameters in a single statement
+    # at 999, so we never go over that, regardless of the database type.
+    MAX_PARAMETERS_PER_STATEMENT: Final[int] = 999
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
+        backingDatabase: BackingDatabase,
+        timber: TimberInterface,
+        tableName: str,
+        columns: Collection[str],
+        conflictColumns: Collection[str],
+        flushDelaySeconds: float = 1,
+        maxBufferedRows: int = 4096,
+        maxPendingRows: int = 256,
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(backingDatabase, BackingDatabase):
+            raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidStr(tableName):
+            raise TypeError(f'tableName argument is malformed: \"{tableName}\"')
+        elif not isinstance(columns, Collection) or len(columns) == 0:
+            raise TypeError(f'columns argument is malformed: \"{columns}\"')
+        elif not isinstance(conflictColumns, Collection) or len(conflictColumns) == 0:
+            raise TypeError(f'conflictColumns argument is malformed: \"{conflictColumns}\"')
+        elif not utils.isValidNum(flushDelaySeconds):
+            raise TypeError(f'flushDelaySeconds argument is malformed: \"{flushDelaySeconds}\"')
+        elif flushDelaySeconds < 0.01 or flushDelaySeconds > 60:
+            raise ValueError(f'flushDelaySeconds argument is out of bounds: {flushDelaySeconds}')
+        elif not utils.isValidInt(maxBufferedRows):
+            raise TypeError(f'maxBufferedRows argument is malformed: \"{maxBufferedRows}\"')
+        elif maxBufferedRows < 1 or maxBufferedRows > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxBufferedRows argument is out of bounds: {maxBufferedRows}')
+        elif not utils.isValidInt(maxPendingRows):
+            raise TypeError(f'maxPendingRows argument is malformed: \"{maxPendingRows}\"')
+        elif maxPendingRows < 1 or maxPendingRows > utils.getShortMaxSafeSize():
+            raise ValueError(f'maxPendingRows argument is out of bounds: {maxPendingRows}')
+        elif maxPendingRows > maxBufferedRows:
+            raise ValueError(f'maxPendingRows argument can\'t be greater than maxBufferedRows ({maxPendingRows=}) ({maxBufferedRows=})')
+
+        columnsList: list[str] = list(columns)
+        conflictColumnIndexes: list[int] = list()
+
+        for conflictColumn in conflictColumns:
+            if conflictColumn not in columnsList:
+                raise ValueError(f'conflictColumns must all be present within columns ({columns=}) ({conflictColumns=})')
+
+            conflictColumnIndexes.append(columnsList.index(conflictColumn))
+
+        self.__backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = backgroundTaskHelper
+        self.__backingDatabase: Final[BackingDatabase] = backingDatabase
+        self.__timber: Final[TimberInterface] = timber
+        self.__tableName: Final[str] = tableName
+        self.__columns: Final[FrozenList[str]] = FrozenList(columnsList)
+        self.__columns.freeze()
+        self.__conflictColumns: Final[FrozenList[str]] = FrozenList(conflictColumns)
+        self.__conflictColumns.freeze()
+        self.__conflictColumnIndexes: Final[tuple[int, ...]] = tuple(conflictColumnIndexes)
+        self.__flushDelaySeconds: Final[float] = flushDelaySeconds
+        self.__maxBufferedRows: Final[int] = maxBufferedRows
+        self.__maxPendingRows: Final[int] = maxPendingRows
+
+        self.__isFlushScheduled: bool = False
+        self.__isImmediateFlushScheduled: bool = False
+        self.__flushLock: Final[asyncio.Lock] = asyncio.Lock()
+        self.__pendingRows: dict[tuple[Any, ...], tuple[Any, ...]] = dict()
+
+    def __buildUpsertQuery(self, rowCount: int) -> str:
+        columnCount = len(self.__columns)
+        valuesStrings: list[str] = list()
+
+        for rowIndex in range(rowCount):
+            placeholders = ', '.join(f'${rowIndex * columnCount + columnIndex + 1}' for columnIndex in range(columnCount))
+            valuesStrings.append(f'({placeholders})')
+
+        updateColumns = [ column for column in self.__columns if column not in self.__conflictColumns ]
+
+        if len(updateColumns) == 0:
+            conflictAction = 'DO NOTHING'
+        else:
+            conflictAction = 'DO UPDATE SET ' + ', '.join(f'{column} = EXCLUDED.{column}' for column in updateColumns)
+
+        return f'''
+            INSERT INTO {self.__tableName} ({', '.join(self.__columns)})
+            VALUES {', '.join(valuesStrings)}
+            ON CONFLICT ({', '.join(self.__conflictColumns)}) {conflictAction}
+        '''
+
+    def __dropOldestRows(self):
+        # If the database keeps failing, we'd rather lose the oldest writes than let this
+        # buffer grow without any bound.
+        overflow = len(self.__pendingRows) - self.__maxBufferedRows
+
+        if overflow <= 0:
+            return
+
+        for key in list(itertools.islice(self.__pendingRows.keys(), overflow)):
+            del self.__pendingRows[key]
+
+        self.__timber.log('WriteBehindBuffer', f'Dropped the oldest pending row(s) as the buffer is full ({self.__tableName=}) ({overflow=}) ({self.__maxBufferedRows=})')
+
+    def findPendingRow(self, predicate: Callable[[tuple[Any, ...]], bool]) -> tuple[Any, ...] | None:
+        if not callable(predicate):
+            raise TypeError(f'predicate argument is malformed: \"{predicate}\"')
+
+        for row in self.__pendingRows.values():
+            if predicate(row):
+                return row
+
+        return None
+
+    async def flush(self):
+        async with self.__flushLock:
+            if len(self.__pendingRows) == 0:
+                return
+
+            rows = list(self.__pendingRows.items())
+            self.__pendingRows = dict()
+
+            rowsPerStatement = max(1, WriteBehindBuffer.MAX_PARAMETERS_PER_STATEMENT // len(self.__columns))
+
+            try:
+                connection = await self.__backingDatabase.getConnection()
+
+                try:
+                    async with connection.transaction():
+                        for index in range(0, len(rows), rowsPerStatement):
+                            chunk = rows[index:index + rowsPerStatement]
+                            args: list[Any] = list()
+
+                            for _, row in chunk:
+                                args.extend(row)
+
+                            await connection.execute(self.__buildUpsertQuery(len(chunk)), *args)
+                finally:
+                    await connection.close()
+            except Exception as e:
+                self.__timber.log('WriteBehindBuffer', f'Failed to flush pending rows, they will be retried on the next flush ({self.__tableName=}) ({len(rows)=})', e, traceback.format_exc())
+
+                # Put the failed rows back ahead of anything that came in while we were attempting
+                # to flush, but never clobber a newer row for the same key.
+                restoredRows: dict[tuple[Any, ...], tuple[Any, ...]] = dict(rows)
+                restoredRows.update(self.__pendingRows)
+                self.__pendingRows = restoredRows
+                self.__dropOldestRows()
+                self.__scheduleFlush()
+
+    def getPendingRow(self, *keyValues: Any) -> tuple[Any, ...] | None:
+        return self.__pendingRows.get(keyValues, None)
+
+    @property
+    def pendingRowCount(self) -> int:
+        return len(self.__pendingRows)
+
+    async def put(self, *values: Any):
+        if len(values) != len(self.__columns):
+            raise ValueError(f'values argument must be the same length as columns ({values=}) ({self.__columns=})')
+
+        key = tuple(values[index] for index in self.__conflictColumnIndexes)
+
+        # re-insert the row so that the most recent write for a given key always wins
+        self.__pendingRows.pop(key, None)
+        self.__pendingRows[key] = values
+
+        self.__dropOldestRows()
+
+        # never make the caller wait on the database here, a full buffer just flushes sooner
+        if len(self.__pendingRows) >= self.__maxPendingRows:
+            self.__scheduleImmediateFlush()
+        else:
+            self.__scheduleFlush()
+
+    def __scheduleFlush(self):
+        if self.__isFlushScheduled:
+            return
+
+        self.__isFlushScheduled = True
+        self.__backgroundTaskHelper.createTask(self.__startDelayedFlush())
+
+    def __scheduleImmediateFlush(self):
+        if self.__isImmediateFlushScheduled:
+            return
+
+        self.__isImmediateFlushScheduled = True
+        self.__backgroundTaskHelper.createTask(self.__startImmediateFlush())
+
+    async def __startDelayedFlush(self):
+        await asyncio.sleep(self.__flushDelaySeconds)
+        self.__isFlushScheduled = False
+        await self.flush()
+
+    async def __startImmediateFlush(self):
+        try:
+            await self.flush()
+        finally:
+            self.__isImmediateFlushScheduled = False
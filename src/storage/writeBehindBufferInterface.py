@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+from ..misc.flushable import Flushable
+
+
+class WriteBehindBufferInterface(Flushable, ABC):
+
+    @abstractmethod
+    def findPendingRow(self, predicate: Callable[[tuple[Any, ...]], bool]) -> tuple[Any, ...] | None:
+        pass
+
+    @abstractmethod
+    def getPendingRow(self, *keyValues: Any) -> tuple[Any, ...] | None:
+        pass
+
+    @property
+    @abstractmethod
+    def pendingRowCount(self) -> int:
+        pass
+
+    @abstractmethod
+    async def put(self, *values: Any):
+        pass
@@ -0,0 +1,13 @@
+import asyncio
+from dataclasses import dataclass
+
+from ..soundPlayerManager.soundPlayerManagerInterface import SoundPlayerManagerInterface
+from ..tts.compositeTtsManagerInterface import CompositeTtsManagerInterface
+
+
+@dataclass(frozen = True)
+class StreamAlertsAudioOutput:
+    lock: asyncio.Lock
+    compositeTtsManager: CompositeTtsManagerInterface
+    soundPlayerManager: SoundPlayerManagerInterface
+    outputName: str
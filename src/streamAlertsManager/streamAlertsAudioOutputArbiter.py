@@ -0,0 +1,72 @@
+import asyncio
+from typing import Final
+
+from .streamAlertsAudioOutput import StreamAlertsAudioOutput
+from .streamAlertsSettingsRepositoryInterface import StreamAlertsSettingsRepositoryInterface
+from ..misc import utils as utils
+from ..soundPlayerManager.provider.soundPlayerManagerProviderInterface import SoundPlayerManagerProviderInterface
+from ..timber.timberInterface import TimberInterface
+from ..tts.provider.compositeTtsManagerProviderInterface import CompositeTtsManagerProviderInterface
+
+
+class StreamAlertsAudioOutputArbiter:
+
+    DEFAULT_OUTPUT_NAME: Final[str] = 'default'
+
+    def __init__(
+        self,
+        compositeTtsManagerProvider: CompositeTtsManagerProviderInterface,
+        soundPlayerManagerProvider: SoundPlayerManagerProviderInterface,
+        streamAlertsSettingsRepository: StreamAlertsSettingsRepositoryInterface,
+        timber: TimberInterface,
+    ):
+        if not isinstance(compositeTtsManagerProvider, CompositeTtsManagerProviderInterface):
+            raise TypeError(f'compositeTtsManagerProvider argument is malformed: \"{compositeTtsManagerProvider}\"')
+        elif not isinstance(soundPlayerManagerProvider, SoundPlayerManagerProviderInterface):
+            raise TypeError(f'soundPlayerManagerProvider argument is malformed: \"{soundPlayerManagerProvider}\"')
+        elif not isinstance(streamAlertsSettingsRepository, StreamAlertsSettingsRepositoryInterface):
+            raise TypeError(f'streamAlertsSettingsRepository argument is malformed: \"{streamAlertsSettingsRepository}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+
+        self.__compositeTtsManagerProvider: Final[CompositeTtsManagerProviderInterface] = compositeTtsManagerProvider
+        self.__soundPlayerManagerProvider: Final[SoundPlayerManagerProviderInterface] = soundPlayerManagerProvider
+        self.__streamAlertsSettingsRepository: Final[StreamAlertsSettingsRepositoryInterface] = streamAlertsSettingsRepository
+        self.__timber: Final[TimberInterface] = timber
+
+        self.__audioOutputs: Final[dict[str, StreamAlertsAudioOutput]] = dict()
+
+    def __createAudioOutput(self, outputName: str) -> StreamAlertsAudioOutput:
+        if outputName == self.DEFAULT_OUTPUT_NAME:
+            # the default output is the same one that everything else in the bot plays through
+            return StreamAlertsAudioOutput(
+                lock = asyncio.Lock(),
+                compositeTtsManager = self.__compositeTtsManagerProvider.getSharedInstance(),
+                soundPlayerManager = self.__soundPlayerManagerProvider.getSharedInstance(),
+                outputName = outputName,
+            )
+
+        self.__timber.log('StreamAlertsAudioOutputArbiter', f'Creating new audio output ({outputName=})')
+
+        return StreamAlertsAudioOutput(
+            lock = asyncio.Lock(),
+            compositeTtsManager = self.__compositeTtsManagerProvider.constructNewInstance(
+                useSharedSoundPlayerManager = False,
+            ),
+            soundPlayerManager = self.__soundPlayerManagerProvider.constructNewInstance(),
+            outputName = outputName,
+        )
+
+    async def getAudioOutput(self, twitchChannelId: str) -> StreamAlertsAudioOutput:
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+
+        audioOutputNames = await self.__streamAlertsSettingsRepository.getAudioOutputNames()
+        outputName = audioOutputNames.get(twitchChannelId, self.DEFAULT_OUTPUT_NAME)
+        audioOutput = self.__audioOutputs.get(outputName, None)
+
+        if audioOutput is None:
+            audioOutput = self.__createAudioOutput(outputName)
+            self.__audioOutputs[outputName] = audioOutput
+
+        return audioOutput
@@ -1,12 +1,14 @@
 import asyncio
-import queue
 import traceback
-from queue import SimpleQueue
+from collections import deque
+from itertools import islice
 from typing import Final
 
 from .currentStreamAlert import CurrentStreamAlert
 from .streamAlert import StreamAlert
 from .streamAlertState import StreamAlertState
+from .streamAlertsAudioOutput import StreamAlertsAudioOutput
+from .streamAlertsAudioOutputArbiter import StreamAlertsAudioOutputArbiter
 from .streamAlertsManagerInterface import StreamAlertsManagerInterface
 from .streamAlertsSettingsRepositoryInterface import StreamAlertsSettingsRepositoryInterface
 from ..misc import utils as utils
@@ -15,6 +17,7 @@ from ..soundPlayerManager.provider.soundPlayerManagerProviderInterface import So
 from ..soundPlayerManager.soundPlayerManagerInterface import SoundPlayerManagerInterface
 from ..timber.timberInterface import TimberInterface
 from ..tts.compositeTtsManagerInterface import CompositeTtsManagerInterface
+from ..tts.models.ttsEvent import TtsEvent
 from ..tts.models.ttsProvider import TtsProvider
 from ..tts.provider.compositeTtsManagerProviderInterface import CompositeTtsManagerProviderInterface
 
@@ -28,8 +31,10 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
         soundPlayerManagerProvider: SoundPlayerManagerProviderInterface,
         streamAlertsSettingsRepository: StreamAlertsSettingsRepositoryInterface,
         timber: TimberInterface,
+        mergeDuplicateAlerts: bool = True,
+        maxQueuedAlertsPerChannel: int = 32,
         queueSleepTimeSeconds: float = 0.25,
-        queueTimeoutSeconds: float = 3,
+        ttsPrefetchDepth: int = 3,
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -41,28 +46,48 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
             raise TypeError(f'streamAlertsSettingsRepository argument is malformed: \"{streamAlertsSettingsRepository}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidBool(mergeDuplicateAlerts):
+            raise TypeError(f'mergeDuplicateAlerts argument is malformed: \"{mergeDuplicateAlerts}\"')
+        elif not utils.isValidInt(maxQueuedAlertsPerChannel):
+            raise TypeError(f'maxQueuedAlertsPerChannel argument is malformed: \"{maxQueuedAlertsPerChannel}\"')
+        elif maxQueuedAlertsPerChannel < 1 or maxQueuedAlertsPerChannel > 256:
+            raise ValueError(f'maxQueuedAlertsPerChannel argument is out of bounds: {maxQueuedAlertsPerChannel}')
         elif not utils.isValidNum(queueSleepTimeSeconds):
             raise TypeError(f'queueSleepTimeSeconds argument is malformed: \"{queueSleepTimeSeconds}\"')
         elif queueSleepTimeSeconds < 0.10 or queueSleepTimeSeconds > 8:
             raise ValueError(f'queueSleepTimeSeconds argument is out of bounds: {queueSleepTimeSeconds}')
-        elif not utils.isValidNum(queueTimeoutSeconds):
-            raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
-        elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 3:
-            raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
+        elif not utils.isValidInt(ttsPrefetchDepth):
+            raise TypeError(f'ttsPrefetchDepth argument is malformed: \"{ttsPrefetchDepth}\"')
+        elif ttsPrefetchDepth < 0 or ttsPrefetchDepth > 8:
+            raise ValueError(f'ttsPrefetchDepth argument is out of bounds: {ttsPrefetchDepth}')
 
         self.__backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = backgroundTaskHelper
         self.__compositeTtsManagerProvider: Final[CompositeTtsManagerProviderInterface] = compositeTtsManagerProvider
         self.__soundPlayerManagerProvider: Final[SoundPlayerManagerProviderInterface] = soundPlayerManagerProvider
         self.__streamAlertsSettingsRepository: Final[StreamAlertsSettingsRepositoryInterface] = streamAlertsSettingsRepository
         self.__timber: Final[TimberInterface] = timber
+        self.__mergeDuplicateAlerts: Final[bool] = mergeDuplicateAlerts
+        self.__maxQueuedAlertsPerChannel: Final[int] = maxQueuedAlertsPerChannel
         self.__queueSleepTimeSeconds: Final[float] = queueSleepTimeSeconds
-        self.__queueTimeoutSeconds: Final[float] = queueTimeoutSeconds
+        self.__ttsPrefetchDepth: Final[int] = ttsPrefetchDepth
+
+        self.__audioOutputArbiter: Final[StreamAlertsAudioOutputArbiter] = StreamAlertsAudioOutputArbiter(
+            compositeTtsManagerProvider = compositeTtsManagerProvider,
+            soundPlayerManagerProvider = soundPlayerManagerProvider,
+            streamAlertsSettingsRepository = streamAlertsSettingsRepository,
+            timber = timber,
+        )
 
         self.__isStarted: bool = False
-        self.__currentAlert: CurrentStreamAlert | None = None
-        self.__alertQueue: Final[SimpleQueue[StreamAlert]] = SimpleQueue()
+        self.__channelAlerts: Final[dict[str, deque[StreamAlert]]] = dict()
+        self.__currentAlerts: Final[dict[str, CurrentStreamAlert]] = dict()
+        self.__preparingTtsEvents: Final[set[TtsEvent]] = set()
 
-    async def __createCurrentAlert(self, alert: StreamAlert) -> CurrentStreamAlert:
+    async def __createCurrentAlert(
+        self,
+        alert: StreamAlert,
+        audioOutput: StreamAlertsAudioOutput,
+    ) -> CurrentStreamAlert:
         compositeTtsManager: CompositeTtsManagerInterface
         soundPlayerManager: SoundPlayerManagerInterface
 
@@ -73,8 +98,8 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
 
             soundPlayerManager = self.__soundPlayerManagerProvider.constructNewInstance()
         else:
-            compositeTtsManager = self.__compositeTtsManagerProvider.getSharedInstance()
-            soundPlayerManager = self.__soundPlayerManagerProvider.getSharedInstance()
+            compositeTtsManager = audioOutput.compositeTtsManager
+            soundPlayerManager = audioOutput.soundPlayerManager
 
         return CurrentStreamAlert(
             compositeTtsManager = compositeTtsManager,
@@ -82,12 +107,56 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
             streamAlert = alert,
         )
 
-    async def __processCurrentAlert(self) -> bool:
-        currentAlert = self.__currentAlert
+    async def __playAlert(self, alert: StreamAlert):
+        audioOutput = await self.__audioOutputArbiter.getAudioOutput(alert.twitchChannelId)
 
-        if currentAlert is None:
-            return False
+        # channels that share an audio output have to take turns, but channels that are on
+        # different audio outputs are free to play their alerts at the same time
+        async with audioOutput.lock:
+            currentAlert = await self.__createCurrentAlert(
+                alert = alert,
+                audioOutput = audioOutput,
+            )
+
+            self.__currentAlerts[alert.twitchChannelId] = currentAlert
+
+            try:
+                alertsDelayBetweenSeconds = await self.__streamAlertsSettingsRepository.getAlertsDelayBetweenSeconds()
+                await asyncio.sleep(alertsDelayBetweenSeconds)
+
+                while await self.__processCurrentAlert(currentAlert):
+                    await asyncio.sleep(self.__queueSleepTimeSeconds)
+            except Exception as e:
+                self.__timber.log('StreamAlertsManager', f'Encountered an error while processing current alert ({currentAlert=})', e, traceback.format_exc())
+                await asyncio.sleep(self.__queueSleepTimeSeconds)
+            finally:
+                del self.__currentAlerts[alert.twitchChannelId]
+
+    async def __prepareTtsEvent(self, twitchChannelId: str, ttsEvent: TtsEvent):
+        try:
+            audioOutput = await self.__audioOutputArbiter.getAudioOutput(twitchChannelId)
+            await audioOutput.compositeTtsManager.prepareTtsEvent(ttsEvent)
+        except Exception as e:
+            self.__timber.log('StreamAlertsManager', f'Encountered an error while preparing TTS event ahead of time ({ttsEvent=})', e, traceback.format_exc())
+
+    def __prepareUpcomingTtsEvents(self, twitchChannelId: str):
+        alerts = self.__channelAlerts.get(twitchChannelId, None)
+
+        if alerts is None:
+            return
+
+        for alert in islice(alerts, self.__ttsPrefetchDepth):
+            ttsEvent = alert.ttsEvent
+
+            if ttsEvent is None or ttsEvent.provider is TtsProvider.SHOTGUN_TTS:
+                continue
+            elif ttsEvent in self.__preparingTtsEvents:
+                continue
+
+            self.__preparingTtsEvents.add(ttsEvent)
+            self.__backgroundTaskHelper.createTask(self.__prepareTtsEvent(twitchChannelId, ttsEvent))
 
+    async def __processCurrentAlert(self, currentAlert: CurrentStreamAlert) -> bool:
         soundAlert = currentAlert.soundAlert
         soundPlayerManager = currentAlert.soundPlayerManager
 
@@ -116,7 +185,6 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
             else:
                 currentAlert.setAlertState(StreamAlertState.TTS_FINISHED)
 
-        self.__currentAlert = None
         return False
 
     def start(self):
@@ -126,39 +194,74 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
 
         self.__isStarted = True
         self.__timber.log('StreamAlertsManager', 'Starting StreamAlertsManager...')
-        self.__backgroundTaskHelper.createTask(self.__startAlertLoop())
 
-    async def __startAlertLoop(self):
-        while True:
+        for twitchChannelId in self.__channelAlerts.keys():
+            self.__backgroundTaskHelper.createTask(self.__startChannelAlertLoop(twitchChannelId))
+
+    async def __startChannelAlertLoop(self, twitchChannelId: str):
+        alerts = self.__channelAlerts[twitchChannelId]
+
+        while len(alerts) >= 1:
+            alert = alerts.popleft()
+
+            if alert.ttsEvent is not None:
+                self.__preparingTtsEvents.discard(alert.ttsEvent)
+
+            self.__prepareUpcomingTtsEvents(twitchChannelId)
+
             try:
-                if await self.__processCurrentAlert():
-                    await asyncio.sleep(self.__queueSleepTimeSeconds)
-                    continue
+                await self.__playAlert(alert)
             except Exception as e:
-                self.__timber.log('StreamAlertsManager', f'Encountered an error while processing current alert ({self.__currentAlert=})', e, traceback.format_exc())
-                self.__currentAlert = None
+                self.__timber.log('StreamAlertsManager', f'Encountered an error while playing alert ({alert=})', e, traceback.format_exc())
                 await asyncio.sleep(self.__queueSleepTimeSeconds)
-                continue
 
-            nextAlert: StreamAlert | None = None
+        # the lane for this channel is drained, so get rid of it (it will be recreated when a
+        # new alert for this channel arrives)
+        del self.__channelAlerts[twitchChannelId]
 
-            if not self.__alertQueue.empty():
-                try:
-                    nextAlert = self.__alertQueue.get_nowait()
-                except queue.Empty as e:
-                    self.__timber.log('StreamAlertsManager', f'Encountered queue.Empty when grabbing next alert from queue ({nextAlert=}) (queue size: {self.__alertQueue.qsize()})', e, traceback.format_exc())
+    async def stopTtsEvent(self, twitchChannelId: str):
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-            if nextAlert is not None:
-                self.__currentAlert = await self.__createCurrentAlert(nextAlert)
+        currentAlert = self.__currentAlerts.get(twitchChannelId, None)
 
-            alertsDelayBetweenSeconds = await self.__streamAlertsSettingsRepository.getAlertsDelayBetweenSeconds()
-            await asyncio.sleep(alertsDelayBetweenSeconds)
+        if currentAlert is None:
+            # nothing is playing for this channel right now, but its audio output could still be
+            # busy with a TTS event that didn't come through here
+            audioOutput = await self.__audioOutputArbiter.getAudioOutput(twitchChannelId)
+            await audioOutput.compositeTtsManager.stopTtsEvent()
+        else:
+            # the current alert may be playing through its channel's own audio output, or through
+            # a TTS manager all of its own (e.g. Shotgun TTS), rather than the shared one
+            await currentAlert.compositeTtsManager.stopTtsEvent()
 
     def submitAlert(self, alert: StreamAlert):
         if not isinstance(alert, StreamAlert):
             raise TypeError(f'alert argument is malformed: \"{alert}\"')
 
-        try:
-            self.__alertQueue.put(alert, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('StreamAlertsManager', f'Encountered queue.Full when submitting a new alert ({alert}) into the alert queue (queue size: {self.__alertQueue.qsize()}): {e}', e, traceback.format_exc())
+        alerts = self.__channelAlerts.get(alert.twitchChannelId, None)
+        isNewChannel = alerts is None
+
+        if alerts is None:
+            alerts = deque()
+            self.__channelAlerts[alert.twitchChannelId] = alerts
+        elif self.__mergeDuplicateAlerts and alert in alerts:
+            # an identical alert is already waiting to be played (e.g. a chatter sending the
+            # same cheer over and over again), so just let that one stand in for both
+            self.__timber.log('StreamAlertsManager', f'Merged duplicate alert into one that is already queued ({alert=})')
+            return
+
+        if len(alerts) >= self.__maxQueuedAlertsPerChannel:
+            droppedAlert = alerts.popleft()
+
+            if droppedAlert.ttsEvent is not None:
+                self.__preparingTtsEvents.discard(droppedAlert.ttsEvent)
+
+            self.__timber.log('StreamAlertsManager', f'Dropped oldest queued alert as the alert queue for \"{alert.twitchChannel}\" is full ({self.__maxQueuedAlertsPerChannel=}) ({droppedAlert=})')
+
+        alerts.append(alert)
+
+        if isNewChannel and self.__isStarted:
+            self.__backgroundTaskHelper.createTask(self.__startChannelAlertLoop(alert.twitchChannelId))
+
+        self.__prepareUpcomingTtsEvents(alert.twitchChannelId)
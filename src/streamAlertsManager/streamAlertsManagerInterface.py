@@ -9,6 +9,10 @@ class StreamAlertsManagerInterface(ABC):
     def start(self):
         pass
 
+    @abstractmethod
+    async def stopTtsEvent(self, twitchChannelId: str):
+        pass
+
     @abstractmethod
     def submitAlert(self, alert: StreamAlert):
         pass
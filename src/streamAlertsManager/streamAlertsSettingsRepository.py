@@ -1,5 +1,7 @@
 from typing import Any
 
+from frozendict import frozendict
+
 from .streamAlertsSettingsRepositoryInterface import StreamAlertsSettingsRepositoryInterface
 from ..misc import utils as utils
 from ..storage.jsonReaderInterface import JsonReaderInterface
@@ -32,6 +34,22 @@ class StreamAlertsSettingsRepository(StreamAlertsSettingsRepositoryInterface):
 
         return alertsDelayBetweenSeconds
 
+    async def getAudioOutputNames(self) -> frozendict[str, str]:
+        jsonContents = await self.__readJson()
+        audioOutputsJson: dict[str, Any] | None = jsonContents.get('audioOutputs', None)
+        audioOutputNames: dict[str, str] = dict()
+
+        if not isinstance(audioOutputsJson, dict) or len(audioOutputsJson) == 0:
+            return frozendict(audioOutputNames)
+
+        for twitchChannelId, outputName in audioOutputsJson.items():
+            if not utils.isValidStr(twitchChannelId) or not utils.isValidStr(outputName):
+                raise ValueError(f'audioOutputs contains a malformed entry: \"{twitchChannelId}\": \"{outputName}\"')
+
+            audioOutputNames[twitchChannelId] = outputName
+
+        return frozendict(audioOutputNames)
+
     async def __readJson(self) -> dict[str, Any]:
         if self.__settingsCache is not None:
             return self.__settingsCache
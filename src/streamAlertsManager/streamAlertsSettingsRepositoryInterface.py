@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from frozendict import frozendict
+
 from ..misc.clearable import Clearable
 
 
@@ -8,3 +10,7 @@ class StreamAlertsSettingsRepositoryInterface(Clearable, ABC):
     @abstractmethod
     async def getAlertsDelayBetweenSeconds(self) -> float:
         pass
+
+    @abstractmethod
+    async def getAudioOutputNames(self) -> frozendict[str, str]:
+        pass
@@ -16,6 +16,7 @@ from ..parser.streamElementsJsonParserInterface import StreamElementsJsonParserI
 from ..parser.streamElementsMessageVoiceParserInterface import StreamElementsMessageVoiceParserInterface
 from ..settings.streamElementsSettingsRepositoryInterface import StreamElementsSettingsRepositoryInterface
 from ...glacialTtsStorage.fileRetriever.glacialTtsFileRetrieverInterface import GlacialTtsFileRetrieverInterface
+from ...glacialTtsStorage.models.glacialTtsFileReference import GlacialTtsFileReference
 from ...misc import utils as utils
 from ...timber.timberInterface import TimberInterface
 from ...tts.models.ttsProvider import TtsProvider
@@ -96,6 +97,31 @@ class StreamElementsHelper(StreamElementsHelperInterface):
         else:
             return None
 
+    async def __createSpeechFile(
+        self,
+        glacialFile: GlacialTtsFileReference,
+        fullMessage: str,
+        twitchChannelId: str,
+        voice: StreamElementsVoice,
+    ) -> bool:
+        speechBytes = await self.__streamElementsApiHelper.getSpeech(
+            message = fullMessage,
+            twitchChannelId = twitchChannelId,
+            voice = voice,
+        )
+
+        if speechBytes is None:
+            return False
+        elif await self.__saveSpeechBytes(
+            speechBytes = speechBytes,
+            fileName = glacialFile.fileName,
+            filePath = glacialFile.filePath,
+        ):
+            return True
+        else:
+            self.__timber.log('StreamElementsHelper', f'Failed to write Stream Elements TTS speechBytes to file ({fullMessage=}) ({glacialFile=})')
+            return False
+
     async def generateTts(
         self,
         donationPrefix: str | None,
@@ -135,48 +161,27 @@ class StreamElementsHelper(StreamElementsHelperInterface):
         if not utils.isValidStr(fullMessage):
             return None
 
-        glacialFile = await self.__glacialTtsFileRetriever.findFile(
+        glacialFile = await self.__glacialTtsFileRetriever.findOrCreateFile(
+            fileExtension = await self.__streamElementsSettingsRepository.getFileExtension(),
             message = fullMessage,
             voice = await self.__streamElementsJsonParser.serializeVoice(voice),
             provider = TtsProvider.STREAM_ELEMENTS,
+            createFile = lambda glacialFile: self.__createSpeechFile(
+                glacialFile = glacialFile,
+                fullMessage = fullMessage,
+                twitchChannelId = twitchChannelId,
+                voice = voice,
+            ),
         )
 
-        if glacialFile is not None:
-            return StreamElementsFileReference(
-                storeDateTime = glacialFile.storeDateTime,
-                filePath = glacialFile.filePath,
-                voice = await self.__streamElementsJsonParser.requireVoice(glacialFile.voice),
-            )
-
-        speechBytes = await self.__streamElementsApiHelper.getSpeech(
-            message = fullMessage,
-            twitchChannelId = twitchChannelId,
-            voice = voice,
-        )
-
-        if speechBytes is None:
+        if glacialFile is None:
             return None
 
-        glacialFile = await self.__glacialTtsFileRetriever.saveFile(
-            fileExtension = await self.__streamElementsSettingsRepository.getFileExtension(),
-            message = fullMessage,
-            voice = await self.__streamElementsJsonParser.serializeVoice(voice),
-            provider = TtsProvider.STREAM_ELEMENTS,
-        )
-
-        if await self.__saveSpeechBytes(
-            speechBytes = speechBytes,
-            fileName = glacialFile.fileName,
+        return StreamElementsFileReference(
+            storeDateTime = glacialFile.storeDateTime,
             filePath = glacialFile.filePath,
-        ):
-            return StreamElementsFileReference(
-                storeDateTime = glacialFile.storeDateTime,
-                filePath = glacialFile.filePath,
-                voice = voice,
-            )
-        else:
-            self.__timber.log('StreamElementsHelper', f'Failed to write Stream Elements TTS speechBytes to file ({fullMessage=}) ({glacialFile=})')
-            return None
+            voice = voice,
+        )
 
     async def __saveSpeechBytes(
         self,
@@ -98,31 +98,32 @@ class StreamElementsUserKeyRepository(StreamElementsUserKeyRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS streamelementsuserkeys (
-                            userkey text NOT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS streamelementsuserkeys (
-                            userkey TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS streamelementsuserkeys (
+                                userkey text NOT NULL,
+                                twitchchannelid text NOT NULL PRIMARY KEY
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS streamelementsuserkeys (
+                                userkey TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL PRIMARY KEY
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
         await self.__consumeSeedFile()
 
     async def __readFromDatabase(self, twitchChannelId: str) -> str | None:
@@ -130,20 +131,22 @@ class StreamElementsUserKeyRepository(StreamElementsUserKeyRepositoryInterface):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT userkey FROM streamelementsuserkeys
-                WHERE twitchchannelid = $1
-                LIMIT 1
-            ''',
-            twitchChannelId
-        )
-
-        userKey: str | None = None
-        if record is not None and len(record) >= 1:
-            userKey = record[0]
-
-        await connection.close()
+
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT userkey FROM streamelementsuserkeys
+                    WHERE twitchchannelid = $1
+                    LIMIT 1
+                ''',
+                twitchChannelId
+            )
+
+            userKey: str | None = None
+            if record is not None and len(record) >= 1:
+                userKey = record[0]
+        finally:
+            await connection.close()
         return userKey
 
     async def remove(
@@ -156,15 +159,17 @@ class StreamElementsUserKeyRepository(StreamElementsUserKeyRepositoryInterface):
         self.__cache.pop(twitchChannelId, None)
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM streamelementsuserkeys
-                WHERE twitchchannelid = $1
-            ''',
-            twitchChannelId
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM streamelementsuserkeys
+                    WHERE twitchchannelid = $1
+                ''',
+                twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('StreamElementsUserKeyRepository', f'Removed Stream Elements user key for \"{twitchChannelId}\"')
 
     async def set(
@@ -200,14 +205,16 @@ class StreamElementsUserKeyRepository(StreamElementsUserKeyRepositoryInterface):
         self.__cache[twitchChannelId] = userKey
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO streamelementsuserkeys (userkey, twitchchannelid)
-                VALUES ($1, $2)
-                ON CONFLICT (twitchchannelid) DO UPDATE SET userkey = EXCLUDED.userkey
-            ''',
-            userKey, twitchChannelId
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO streamelementsuserkeys (userkey, twitchchannelid)
+                    VALUES ($1, $2)
+                    ON CONFLICT (twitchchannelid) DO UPDATE SET userkey = EXCLUDED.userkey
+                ''',
+                userKey, twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('StreamElementsUserKeyRepository', f'Updated Stream Elements user key for \"{twitchChannelId}\"')
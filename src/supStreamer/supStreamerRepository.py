@@ -63,16 +63,18 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
             return cache[chatterUserId]
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT mostrecentsup FROM supstreamerchatters
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-                LIMIT 1
-            ''',
-            chatterUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT mostrecentsup FROM supstreamerchatters
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                    LIMIT 1
+                ''',
+                chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
         supStreamerChatter: SupStreamerChatter | None = None
 
         if record is not None and len(record) >= 1:
@@ -96,35 +98,36 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS supstreamerchatters (
-                            chatteruserid text NOT NULL,
-                            mostrecentsup text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS supstreamerchatters (
-                            chatteruserid TEXT NOT NULL,
-                            mostrecentsup TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS supstreamerchatters (
+                                chatteruserid text NOT NULL,
+                                mostrecentsup text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS supstreamerchatters (
+                                chatteruserid TEXT NOT NULL,
+                                mostrecentsup TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def set(
         self,
@@ -145,13 +148,15 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
         )
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO supstreamerchatters (chatteruserid, mostrecentsup, twitchchannelid)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET mostrecentsup = EXCLUDED.mostrecentsup
-            ''',
-            chatterUserId, mostRecentSup.isoformat(), twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO supstreamerchatters (chatteruserid, mostrecentsup, twitchchannelid)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET mostrecentsup = EXCLUDED.mostrecentsup
+                ''',
+                chatterUserId, mostRecentSup.isoformat(), twitchChannelId
+            )
+        finally:
+            await connection.close()
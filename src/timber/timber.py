@@ -1,20 +1,23 @@
 import asyncio
-import queue
-from collections import defaultdict
-from queue import SimpleQueue
-from typing import Final
-
-import aiofiles
-import aiofiles.os
-import aiofiles.ospath
-from frozenlist import FrozenList
+import json
+import random
+import sys
+import threading
+import time
+import traceback as tb
+from collections import defaultdict, deque
+from datetime import datetime, tzinfo
+from typing import Any, Callable, Final
 
 from .timberEntry import TimberEntry
+from .timberFileWriter import TimberFileWriter
 from .timberInterface import TimberInterface
+from .timberLevel import TimberLevel
+from .timberOutputFormat import TimberOutputFormat
+from .timberSettings import TimberSettings
 from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
-from ..misc.simpleDateTime import SimpleDateTime
 
 
 class Timber(TimberInterface):
@@ -23,34 +26,101 @@ class Timber(TimberInterface):
         self,
         backgroundTaskHelper: BackgroundTaskHelperInterface,
         timeZoneRepository: TimeZoneRepositoryInterface,
-        sleepTimeSeconds: float = 15,
+        timberSettings: TimberSettings = TimberSettings(),
+        sleepTimeSeconds: float = 0.5,
+        maxBatchSize: int = 512,
         timberRootDirectory: str = '../logs/timber',
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
         elif not isinstance(timeZoneRepository, TimeZoneRepositoryInterface):
             raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
+        elif not isinstance(timberSettings, TimberSettings):
+            raise TypeError(f'timberSettings argument is malformed: \"{timberSettings}\"')
+        elif not utils.isValidInt(timberSettings.ringBufferSize):
+            raise TypeError(f'timberSettings.ringBufferSize argument is malformed: \"{timberSettings.ringBufferSize}\"')
+        elif timberSettings.ringBufferSize < 1 or timberSettings.ringBufferSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'timberSettings.ringBufferSize argument is out of bounds: {timberSettings.ringBufferSize}')
         elif not utils.isValidNum(sleepTimeSeconds):
             raise TypeError(f'sleepTimeSeconds argument is malformed: \"{sleepTimeSeconds}\"')
-        elif sleepTimeSeconds < 1 or sleepTimeSeconds > 60:
+        elif sleepTimeSeconds < 0.1 or sleepTimeSeconds > 60:
             raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
+        elif not utils.isValidInt(maxBatchSize):
+            raise TypeError(f'maxBatchSize argument is malformed: \"{maxBatchSize}\"')
+        elif maxBatchSize < 1 or maxBatchSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxBatchSize argument is out of bounds: {maxBatchSize}')
         elif not utils.isValidStr(timberRootDirectory):
             raise TypeError(f'timberRootDirectory argument is malformed: \"{timberRootDirectory}\"')
 
+        for tag, sampleRate in timberSettings.tagSampleRates.items():
+            if not utils.isValidNum(sampleRate):
+                raise TypeError(f'timberSettings.tagSampleRates value is malformed ({tag=}): \"{sampleRate}\"')
+            elif sampleRate < 0 or sampleRate > 1:
+                raise ValueError(f'timberSettings.tagSampleRates value is out of bounds ({tag=}): {sampleRate}')
+
         self.__backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = backgroundTaskHelper
         self.__timeZoneRepository: Final[TimeZoneRepositoryInterface] = timeZoneRepository
+        self.__timberSettings: Final[TimberSettings] = timberSettings
         self.__sleepTimeSeconds: Final[float] = sleepTimeSeconds
+        self.__maxBatchSize: Final[int] = maxBatchSize
         self.__timberRootDirectory: Final[str] = timberRootDirectory
 
-        self.__isStarted: bool = False
-        self.__entryQueue: Final[SimpleQueue[TimberEntry]] = SimpleQueue()
-
-    def __getErrorStatement(self, ensureNewLine: bool, timberEntry: TimberEntry) -> str | None:
-        if not utils.isValidBool(ensureNewLine):
-            raise TypeError(f'ensureNewLine argument is malformed: \"{ensureNewLine}\"')
-        elif not isinstance(timberEntry, TimberEntry):
-            raise TypeError(f'timberEntry argument is malformed: \"{timberEntry}\"')
+        self.__timberFileWriter: Final[TimberFileWriter] = TimberFileWriter(
+            compressRotatedFiles = timberSettings.compressRotatedFiles,
+            maxFileSizeBytes = timberSettings.maxFileSizeBytes,
+        )
 
+        self.__isStarted: bool = False
+        self.__startTime: float = float('inf')
+        self.__droppedEntries: int = 0
+
+        # log() can be called from any thread, and incrementing an int isn't atomic, so the
+        # dropped entries counter is only ever touched under this lock.
+        self.__droppedEntriesLock: Final[threading.Lock] = threading.Lock()
+
+        # This is a bounded ring buffer: once it's full, appending a new entry pushes out the
+        # oldest one. A deque's append() and popleft() are atomic, so log() only ever has to
+        # take a lock once entries are being dropped, regardless of which thread it's on.
+        self.__entries: Final[deque[TimberEntry]] = deque(maxlen = timberSettings.ringBufferSize)
+
+    async def flush(self):
+        while len(self.__entries) >= 1 or self.__droppedEntries >= 1:
+            entries: list[TimberEntry] = list()
+
+            with self.__droppedEntriesLock:
+                droppedEntries = self.__droppedEntries
+                self.__droppedEntries = 0
+
+            if droppedEntries >= 1:
+                entries.append(TimberEntry(
+                    exception = None,
+                    logTime = time.time(),
+                    msg = f'Dropped {droppedEntries} log entries as the ring buffer was full ({self.__timberSettings.ringBufferSize=})',
+                    level = TimberLevel.WARNING,
+                    tag = 'Timber',
+                    traceback = None,
+                ))
+
+            while len(entries) < self.__maxBatchSize and len(self.__entries) >= 1:
+                entries.append(self.__entries.popleft())
+
+            # Lazy messages are built here, rather than on the worker thread, as they're likely
+            # to close over state that is only safe to read from the event loop.
+            messages = [ self.__getMessage(entry) for entry in entries ]
+
+            await asyncio.to_thread(
+                self.__writeEntries,
+                entries,
+                messages,
+                self.__timeZoneRepository.getDefault(),
+            )
+
+    def __formatDateTime(self, dateTime: datetime) -> str:
+        # matches SimpleDateTime.getDateAndTimeStr(includeMillis = True)
+        dateAndTimeStr = dateTime.strftime('%Y/%m/%d %H:%M:%S')
+        return f'{dateAndTimeStr}.{dateTime.microsecond // 1000:03d}'
+
+    def __getErrorStatement(self, timberEntry: TimberEntry) -> str | None:
         if timberEntry.exception is None:
             return None
 
@@ -59,161 +129,199 @@ class Timber(TimberInterface):
         if utils.isValidStr(timberEntry.traceback):
             errorStatement = f'{errorStatement}\n{timberEntry.traceback}'.strip()
 
-        if ensureNewLine:
-            errorStatement = f'{errorStatement}\n'
+        return f'{errorStatement}\n'
 
-        return errorStatement
+    def __getJsonStatement(
+        self,
+        dateTime: datetime,
+        msg: str,
+        timberEntry: TimberEntry,
+    ) -> str:
+        jsonContents: dict[str, Any] = {
+            'level': timberEntry.level.name,
+            'msg': msg,
+            'tag': timberEntry.tag,
+            'time': dateTime.isoformat(timespec = 'milliseconds'),
+        }
+
+        if timberEntry.exception is not None:
+            jsonContents['exception'] = str(timberEntry.exception)
 
-    def __getLogStatement(self, ensureNewLine: bool, timberEntry: TimberEntry) -> str:
-        if not utils.isValidBool(ensureNewLine):
-            raise TypeError(f'ensureNewLine argument is malformed: \"{ensureNewLine}\"')
-        elif not isinstance(timberEntry, TimberEntry):
-            raise TypeError(f'timberEntry argument is malformed: \"{timberEntry}\"')
+        if utils.isValidStr(timberEntry.traceback):
+            jsonContents['traceback'] = timberEntry.traceback
 
-        logStatement = f'{timberEntry.logTime.getDateAndTimeStr(True)} — {timberEntry.tag} — {timberEntry.msg}'.strip()
+        return f'{json.dumps(jsonContents, ensure_ascii = False)}\n'
+
+    def __getLogStatement(
+        self,
+        dateTime: datetime,
+        msg: str,
+        timberEntry: TimberEntry,
+    ) -> str:
+        logStatement = f'{self.__formatDateTime(dateTime)} — {timberEntry.tag} — {msg}'.strip()
 
         if utils.isValidStr(timberEntry.traceback):
             logStatement = f'{logStatement}\n{timberEntry.traceback}'.strip()
 
-        if ensureNewLine:
-            logStatement = f'{logStatement}\n'
+        return f'{logStatement}\n'
+
+    def __getMessage(self, timberEntry: TimberEntry) -> str:
+        msg = timberEntry.msg
+
+        if isinstance(msg, str):
+            return msg
+
+        try:
+            return str(msg())
+        except Exception as e:
+            return f'Encountered exception when building lazy log message ({msg=}): {e}\n{tb.format_exc()}'
+
+    def __isLoggable(self, tag: str, level: TimberLevel) -> bool:
+        timberSettings = self.__timberSettings
+        minimumLevel = timberSettings.tagMinimumLevels.get(tag, timberSettings.minimumLevel)
+
+        if not level.isAtLeast(minimumLevel):
+            return False
+        elif level is TimberLevel.ERROR:
+            # errors are always kept, regardless of any sampling
+            return True
 
-        return logStatement
+        sampleRate = timberSettings.tagSampleRates.get(tag, None)
+        return sampleRate is None or random.random() < sampleRate
 
     def log(
         self,
         tag: str,
-        msg: str,
+        msg: str | Callable[[], str],
         exception: Exception | None = None,
         traceback: str | None = None,
+        level: TimberLevel | None = None,
     ):
         if not utils.isValidStr(tag):
             raise TypeError(f'tag argument is malformed: \"{tag}\"')
-        elif not utils.isValidStr(msg):
+        elif not utils.isValidStr(msg) and not callable(msg):
             raise TypeError(f'msg argument is malformed: \"{msg}\"')
         elif exception is not None and not isinstance(exception, Exception):
             raise TypeError(f'exception argument is malformed: \"{exception}\"')
         elif traceback is not None and not isinstance(traceback, str):
             raise TypeError(f'traceback argument is malformed: \"{traceback}\"')
+        elif level is not None and not isinstance(level, TimberLevel):
+            raise TypeError(f'level argument is malformed: \"{level}\"')
 
-        logTime = SimpleDateTime(
-            timeZone = self.__timeZoneRepository.getDefault(),
-        )
+        if level is None:
+            if exception is None:
+                level = TimberLevel.INFO
+            else:
+                level = TimberLevel.ERROR
+
+        if not self.__isLoggable(tag, level):
+            return
+
+        # Everything beyond this point is kept as cheap as possible: formatting, console output,
+        # and file I/O are all left to the writer.
+        entries = self.__entries
+
+        if len(entries) == entries.maxlen:
+            with self.__droppedEntriesLock:
+                self.__droppedEntries += 1
 
         timberEntry = TimberEntry(
             exception = exception,
-            logTime = logTime,
+            logTime = time.time(),
             msg = msg,
+            level = level,
             tag = tag,
             traceback = traceback,
         )
 
-        self.__entryQueue.put(timberEntry)
-        print(self.__getLogStatement(False, timberEntry))
+        entries.append(timberEntry)
+
+        if not self.__isStarted:
+            # The writer isn't running yet (the bot is most likely still booting up), so echo
+            # to the console right away, so that nothing is lost should the boot fail.
+            self.__printToConsole([ timberEntry ], self.__timeZoneRepository.getDefault())
+
+    def __printToConsole(self, entries: list[TimberEntry], timeZone: tzinfo):
+        timberSettings = self.__timberSettings
+
+        if not timberSettings.consoleEnabled:
+            return
+
+        consoleStatements: list[str] = list()
+
+        for entry in entries:
+            if entry.level.isAtLeast(timberSettings.consoleMinimumLevel):
+                dateTime = datetime.fromtimestamp(entry.logTime, timeZone)
+                consoleStatements.append(self.__getLogStatement(dateTime, self.__getMessage(entry), entry))
+
+        if len(consoleStatements) >= 1:
+            sys.stdout.write(''.join(consoleStatements))
+            sys.stdout.flush()
 
     def start(self):
         if self.__isStarted:
             self.log('Timber', 'Not starting Timber as it has already been started')
             return
 
+        self.__startTime = time.time()
         self.__isStarted = True
         self.__backgroundTaskHelper.createTask(self.__startEventLoop())
 
     async def __startEventLoop(self):
         while True:
-            entries: FrozenList[TimberEntry] = FrozenList()
-
             try:
-                while not self.__entryQueue.empty():
-                    entry = self.__entryQueue.get_nowait()
-                    entries.append(entry)
-            except queue.Empty:
-                pass
-
-            entries.freeze()
-            await self.__writeToLogFiles(entries)
+                await self.flush()
+            except Exception as e:
+                # there's nowhere else to report this to, as it's Timber itself that has failed
+                print(f'Timber encountered exception when writing log entries: {e}\n{tb.format_exc()}', file = sys.stderr)
+
             await asyncio.sleep(self.__sleepTimeSeconds)
 
-    async def __writeToLogFiles(self, entries: FrozenList[TimberEntry]):
-        if len(entries) == 0:
-            return
+    def __writeEntries(
+        self,
+        entries: list[TimberEntry],
+        messages: list[str],
+        timeZone: tzinfo,
+    ):
+        # This runs on a worker thread. Each file gets all of its statements together, so that
+        # it only needs to be written to and flushed the once per batch.
+        timberSettings = self.__timberSettings
+        isJson = timberSettings.outputFormat is TimberOutputFormat.NDJSON
+        fileExtension = timberSettings.outputFormat.getFileExtension()
+        startTime = self.__startTime
 
-        # The logic below is kind of intense, but we do this in order to favor logical complexity
-        # in exchange for I/O simplicity. By doing things this way, we only need to attempt to
-        # create folders once, files once, and we also just open a file handle one time too.
+        consoleStatements: list[str] = list()
+        fileContents: dict[str, list[str]] = defaultdict(lambda: list())
 
-        # This dictionary stores a directory, and then a list of files, and then the contents to
-        # write into the files themselves. This dictionary does not make any attempt at handling
-        # error logging.
-        structure: dict[str, dict[str, list[TimberEntry]]] = defaultdict(lambda: defaultdict(lambda: list()))
+        for entry, msg in zip(entries, messages):
+            dateTime = datetime.fromtimestamp(entry.logTime, timeZone)
+            logStatement = self.__getLogStatement(dateTime, msg, entry)
 
-        # This dictionary is used for error logging, and just like the dictionary above, stores
-        # a directory, and then a list of files, and then the contents to write into the files
-        # themselves.
-        errorStructure: dict[str, dict[str, list[TimberEntry]]] = defaultdict(lambda: defaultdict(lambda: list()))
+            # entries from before Timber was started have already been echoed to the console
+            if timberSettings.consoleEnabled and entry.logTime >= startTime and entry.level.isAtLeast(timberSettings.consoleMinimumLevel):
+                consoleStatements.append(logStatement)
 
-        for entry in entries:
-            logTime = entry.logTime
-            timberDirectory = f'{self.__timberRootDirectory}/{logTime.getYearStr()}/{logTime.getMonthStr()}'
-            timberFile = f'{timberDirectory}/{logTime.getDayStr()}.log'
-            structure[timberDirectory][timberFile].append(entry)
-
-            if entry.exception is not None:
-                timberErrorDirectory = f'{timberDirectory}/errors'
-                timberErrorFile = f'{timberErrorDirectory}/{logTime.getDayStr()}.log'
-                errorStructure[timberErrorDirectory][timberErrorFile].append(entry)
-
-        for timberDirectory, timberFileToEntriesDict in structure.items():
-            if not await aiofiles.ospath.exists(
-                path = timberDirectory,
-                loop = self.__backgroundTaskHelper.eventLoop,
-            ):
-                await aiofiles.os.makedirs(
-                    name = timberDirectory,
-                    loop = self.__backgroundTaskHelper.eventLoop,
-                )
-
-            for timberFile, entriesList in timberFileToEntriesDict.items():
-                async with aiofiles.open(
-                    file = timberFile,
-                    mode = 'a',
-                    encoding = 'utf-8',
-                    loop = self.__backgroundTaskHelper.eventLoop,
-                ) as file:
-                    for entry in entriesList:
-                        logStatement = self.__getLogStatement(
-                            ensureNewLine = True,
-                            timberEntry = entry,
-                        )
-
-                        await file.write(logStatement)
-
-                    await file.flush()
-
-        for timberErrorDirectory, timberErrorFileToEntriesDict in errorStructure.items():
-            if not await aiofiles.ospath.exists(
-                path = timberErrorDirectory,
-                loop = self.__backgroundTaskHelper.eventLoop,
-            ):
-                await aiofiles.os.makedirs(
-                    name = timberErrorDirectory,
-                    loop = self.__backgroundTaskHelper.eventLoop,
-                )
-
-            for timberErrorFile, entriesList in timberErrorFileToEntriesDict.items():
-                async with aiofiles.open(
-                    file = timberErrorFile,
-                    mode = 'a',
-                    encoding = 'utf-8',
-                    loop = self.__backgroundTaskHelper.eventLoop,
-                ) as file:
-                    for entry in entriesList:
-                        errorStatement = self.__getErrorStatement(
-                            ensureNewLine = True,
-                            timberEntry = entry,
-                        )
-
-                        if utils.isValidStr(errorStatement):
-                            await file.write(errorStatement)
-
-                    await file.flush()
+            timberDirectory = f'{self.__timberRootDirectory}/{dateTime.year:04d}/{dateTime.month:02d}'
+            dayStr = f'{dateTime.day:02d}'
+
+            if isJson:
+                logStatement = self.__getJsonStatement(dateTime, msg, entry)
+
+            fileContents[f'{timberDirectory}/{dayStr}.{fileExtension}'].append(logStatement)
+
+            if entry.exception is None:
+                continue
+
+            if isJson:
+                errorStatement: str | None = logStatement
+            else:
+                errorStatement = self.__getErrorStatement(entry)
+
+            if utils.isValidStr(errorStatement):
+                fileContents[f'{timberDirectory}/errors/{dayStr}.{fileExtension}'].append(errorStatement)
+
+        if len(consoleStatements) >= 1:
+            sys.stdout.write(''.join(consoleStatements))
+            sys.stdout.flush()
+
+        self.__timberFileWriter.write(fileContents)
@@ -1,12 +1,18 @@
 from dataclasses import dataclass
+from typing import Callable
 
-from ..misc.simpleDateTime import SimpleDateTime
+from .timberLevel import TimberLevel
 
 
 @dataclass(frozen = True)
 class TimberEntry:
     exception: Exception | None
-    logTime: SimpleDateTime
-    msg: str
+    # seconds since the epoch, as from time.time(); turning this into a time zone aware
+    # date is left to the writer, off of the caller's path
+    logTime: float
+    # a message that is expensive to build can be handed over as a callable, and it will
+    # only be called if (and when) the entry is actually written out
+    msg: str | Callable[[], str]
+    level: TimberLevel
     tag: str
     traceback: str | None
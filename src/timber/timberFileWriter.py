@@ -0,0 +1,116 @@
+import gzip
+import os
+import shutil
+from typing import Final, TextIO
+
+from ..misc import utils as utils
+
+
+class TimberFileWriter:
+
+    # This class is fully synchronous, and is meant to only ever be driven from a single worker
+    # thread at a time (see Timber). Files are kept open in between writes, rather than being
+    # reopened for every batch, and are closed once a batch goes by without writing to them.
+    # Since log files are named by date, this also takes care of rotating them each day.
+
+    def __init__(
+        self,
+        compressRotatedFiles: bool = False,
+        maxFileSizeBytes: int | None = None,
+    ):
+        if not utils.isValidBool(compressRotatedFiles):
+            raise TypeError(f'compressRotatedFiles argument is malformed: \"{compressRotatedFiles}\"')
+        elif maxFileSizeBytes is not None and not utils.isValidInt(maxFileSizeBytes):
+            raise TypeError(f'maxFileSizeBytes argument is malformed: \"{maxFileSizeBytes}\"')
+        elif maxFileSizeBytes is not None and (maxFileSizeBytes < 1 or maxFileSizeBytes > utils.getLongMaxSafeSize()):
+            raise ValueError(f'maxFileSizeBytes argument is out of bounds: {maxFileSizeBytes}')
+
+        self.__compressRotatedFiles: Final[bool] = compressRotatedFiles
+        self.__maxFileSizeBytes: Final[int | None] = maxFileSizeBytes
+
+        self.__openFiles: Final[dict[str, TextIO]] = dict()
+        self.__fileSizes: Final[dict[str, int]] = dict()
+
+    def close(self):
+        for fileName in list(self.__openFiles.keys()):
+            self.__closeFile(fileName)
+
+    def __closeFile(self, fileName: str):
+        file = self.__openFiles.pop(fileName, None)
+        self.__fileSizes.pop(fileName, None)
+
+        if file is not None:
+            file.close()
+
+    def getOpenFileNames(self) -> frozenset[str]:
+        return frozenset(self.__openFiles.keys())
+
+    def __getRotatedFileName(self, fileName: str) -> str:
+        fileRoot, fileExtension = os.path.splitext(fileName)
+        segment = 1
+
+        while True:
+            rotatedFileName = f'{fileRoot}.{segment}{fileExtension}'
+
+            if not os.path.exists(rotatedFileName) and not os.path.exists(f'{rotatedFileName}.gz'):
+                return rotatedFileName
+
+            segment += 1
+
+    def __openFile(self, fileName: str) -> TextIO:
+        file = self.__openFiles.get(fileName, None)
+
+        if file is not None:
+            return file
+
+        directory = os.path.dirname(fileName)
+
+        if utils.isValidStr(directory):
+            os.makedirs(directory, exist_ok = True)
+
+        file = open(fileName, mode = 'a', encoding = 'utf-8')
+        self.__openFiles[fileName] = file
+        self.__fileSizes[fileName] = file.tell()
+        return file
+
+    def __rotateFile(self, fileName: str):
+        self.__closeFile(fileName)
+        rotatedFileName = self.__getRotatedFileName(fileName)
+        os.replace(fileName, rotatedFileName)
+
+        if not self.__compressRotatedFiles:
+            return
+
+        with open(rotatedFileName, mode = 'rb') as source, gzip.open(f'{rotatedFileName}.gz', mode = 'wb') as destination:
+            shutil.copyfileobj(source, destination)
+
+        os.remove(rotatedFileName)
+
+    def write(self, fileContents: dict[str, list[str]]):
+        if not isinstance(fileContents, dict):
+            raise TypeError(f'fileContents argument is malformed: \"{fileContents}\"')
+
+        for fileName in list(self.__openFiles.keys()):
+            if fileName not in fileContents:
+                self.__closeFile(fileName)
+
+        maxFileSizeBytes = self.__maxFileSizeBytes
+
+        for fileName, statements in fileContents.items():
+            file = self.__openFile(fileName)
+
+            for statement in statements:
+                if maxFileSizeBytes is not None:
+                    statementSize = len(statement.encode('utf-8'))
+                    fileSize = self.__fileSizes[fileName]
+
+                    if fileSize >= 1 and fileSize + statementSize > maxFileSizeBytes:
+                        file.flush()
+                        self.__rotateFile(fileName)
+                        file = self.__openFile(fileName)
+
+                    self.__fileSizes[fileName] += statementSize
+
+                file.write(statement)
+
+            file.flush()
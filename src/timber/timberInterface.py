@@ -1,15 +1,23 @@
 from abc import ABC, abstractmethod
+from typing import Callable
+
+from .timberLevel import TimberLevel
 
 
 class TimberInterface(ABC):
 
+    @abstractmethod
+    async def flush(self):
+        pass
+
     @abstractmethod
     def log(
         self,
         tag: str,
-        msg: str,
+        msg: str | Callable[[], str],
         exception: Exception | None = None,
         traceback: str | None = None,
+        level: TimberLevel | None = None,
     ):
         pass
 
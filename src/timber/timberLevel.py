@@ -0,0 +1,30 @@
+from enum import Enum, auto
+
+from ..misc import utils as utils
+
+
+class TimberLevel(Enum):
+
+    DEBUG = auto()
+    INFO = auto()
+    WARNING = auto()
+    ERROR = auto()
+
+    @classmethod
+    def fromStr(cls, text: str):
+        if not utils.isValidStr(text):
+            raise TypeError(f'text argument is malformed: \"{text}\"')
+
+        text = text.strip().lower()
+
+        for level in TimberLevel:
+            if level.name.lower() == text:
+                return level
+
+        raise ValueError(f'Unable to determine TimberLevel from text: \"{text}\"')
+
+    def isAtLeast(self, other) -> bool:
+        if not isinstance(other, TimberLevel):
+            raise TypeError(f'other argument is malformed: \"{other}\"')
+
+        return self.value >= other.value
@@ -0,0 +1,31 @@
+from enum import Enum, auto
+
+from ..misc import utils as utils
+
+
+class TimberOutputFormat(Enum):
+
+    NDJSON = auto()
+    TEXT = auto()
+
+    @classmethod
+    def fromStr(cls, text: str):
+        if not utils.isValidStr(text):
+            raise TypeError(f'text argument is malformed: \"{text}\"')
+
+        text = text.strip().lower()
+
+        if text == 'ndjson':
+            return TimberOutputFormat.NDJSON
+        elif text == 'text':
+            return TimberOutputFormat.TEXT
+        else:
+            raise ValueError(f'Unable to determine TimberOutputFormat from text: \"{text}\"')
+
+    def getFileExtension(self) -> str:
+        if self is TimberOutputFormat.NDJSON:
+            return 'ndjson'
+        elif self is TimberOutputFormat.TEXT:
+            return 'log'
+        else:
+            raise RuntimeError(f'Unknown TimberOutputFormat value: \"{self}\"')
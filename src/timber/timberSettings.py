@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from frozendict import frozendict
+
+from .timberLevel import TimberLevel
+from .timberOutputFormat import TimberOutputFormat
+
+
+@dataclass(frozen = True)
+class TimberSettings:
+    compressRotatedFiles: bool = False
+    consoleEnabled: bool = True
+    ringBufferSize: int = 65536
+    maxFileSizeBytes: int | None = None
+    tagMinimumLevels: frozendict[str, TimberLevel] = frozendict()
+    tagSampleRates: frozendict[str, float] = frozendict()
+    consoleMinimumLevel: TimberLevel = TimberLevel.DEBUG
+    minimumLevel: TimberLevel = TimberLevel.DEBUG
+    outputFormat: TimberOutputFormat = TimberOutputFormat.TEXT
@@ -0,0 +1,75 @@
+from typing import Any, Final
+
+from frozendict import frozendict
+
+from .timberLevel import TimberLevel
+from .timberOutputFormat import TimberOutputFormat
+from .timberSettings import TimberSettings
+from ..misc import utils as utils
+from ..storage.jsonReaderInterface import JsonReaderInterface
+
+
+class TimberSettingsReader:
+
+    def __init__(self, settingsJsonReader: JsonReaderInterface):
+        if not isinstance(settingsJsonReader, JsonReaderInterface):
+            raise TypeError(f'settingsJsonReader argument is malformed: \"{settingsJsonReader}\"')
+
+        self.__settingsJsonReader: Final[JsonReaderInterface] = settingsJsonReader
+
+    def readSettings(self) -> TimberSettings:
+        # this is read synchronously (and only the once), as Timber is one of the very first
+        # things to be built in the composition root, well before the event loop is running
+        jsonContents: dict[str, Any] | None = None
+
+        if self.__settingsJsonReader.fileExists():
+            jsonContents = self.__settingsJsonReader.readJson()
+
+        if jsonContents is None:
+            return TimberSettings()
+        elif not isinstance(jsonContents, dict):
+            raise IOError(f'Error reading from Timber settings file: {self.__settingsJsonReader}')
+
+        defaults = TimberSettings()
+
+        maxFileSizeBytes: int | None = None
+        if utils.isValidInt(jsonContents.get('maxFileSizeBytes')):
+            maxFileSizeBytes = utils.getIntFromDict(jsonContents, 'maxFileSizeBytes')
+
+        tagMinimumLevels: dict[str, TimberLevel] = dict()
+        tagMinimumLevelsJson: dict[str, Any] | Any | None = jsonContents.get('tagMinimumLevels', None)
+        if isinstance(tagMinimumLevelsJson, dict):
+            for tag, levelString in tagMinimumLevelsJson.items():
+                if utils.isValidStr(tag) and utils.isValidStr(levelString):
+                    tagMinimumLevels[tag] = TimberLevel.fromStr(levelString)
+
+        tagSampleRates: dict[str, float] = dict()
+        tagSampleRatesJson: dict[str, Any] | Any | None = jsonContents.get('tagSampleRates', None)
+        if isinstance(tagSampleRatesJson, dict):
+            for tag, sampleRate in tagSampleRatesJson.items():
+                if utils.isValidStr(tag) and utils.isValidNum(sampleRate):
+                    tagSampleRates[tag] = float(sampleRate)
+
+        consoleMinimumLevel = defaults.consoleMinimumLevel
+        if utils.isValidStr(jsonContents.get('consoleMinimumLevel')):
+            consoleMinimumLevel = TimberLevel.fromStr(utils.getStrFromDict(jsonContents, 'consoleMinimumLevel'))
+
+        minimumLevel = defaults.minimumLevel
+        if utils.isValidStr(jsonContents.get('minimumLevel')):
+            minimumLevel = TimberLevel.fromStr(utils.getStrFromDict(jsonContents, 'minimumLevel'))
+
+        outputFormat = defaults.outputFormat
+        if utils.isValidStr(jsonContents.get('outputFormat')):
+            outputFormat = TimberOutputFormat.fromStr(utils.getStrFromDict(jsonContents, 'outputFormat'))
+
+        return TimberSettings(
+            compressRotatedFiles = utils.getBoolFromDict(jsonContents, 'compressRotatedFiles', fallback = defaults.compressRotatedFiles),
+            consoleEnabled = utils.getBoolFromDict(jsonContents, 'consoleEnabled', fallback = defaults.consoleEnabled),
+            ringBufferSize = utils.getIntFromDict(jsonContents, 'ringBufferSize', fallback = defaults.ringBufferSize),
+            maxFileSizeBytes = maxFileSizeBytes,
+            tagMinimumLevels = frozendict(tagMinimumLevels),
+            tagSampleRates = frozendict(tagSampleRates),
+            consoleMinimumLevel = consoleMinimumLevel,
+            minimumLevel = minimumLevel,
+            outputFormat = outputFormat,
+        )
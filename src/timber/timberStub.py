@@ -1,15 +1,26 @@
+from typing import Callable
+
 from .timberInterface import TimberInterface
+from .timberLevel import TimberLevel
 
 
 class TimberStub(TimberInterface):
 
+    async def flush(self):
+        # this method is intentionally empty
+        pass
+
     def log(
         self,
         tag: str,
-        msg: str,
+        msg: str | Callable[[], str],
         exception: Exception | None = None,
         traceback: str | None = None,
+        level: TimberLevel | None = None,
     ):
+        if not isinstance(msg, str):
+            msg = msg()
+
         if exception is None:
             print(f'{tag} — {msg}')
         else:
@@ -99,15 +99,18 @@ class ChatterTimeoutHistoryRepository(ChatterTimeoutHistoryRepositoryInterface):
         )
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO chattertimeouthistory (totaldurationseconds, history, chatteruserid, twitchchannelid)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET totaldurationseconds = EXCLUDED.totaldurationseconds, history = EXCLUDED.history
-            ''',
-            newTotalDurationSeconds, historyEntriesJson, chatterUserId, twitchChannelId
-        )
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO chattertimeouthistory (totaldurationseconds, history, chatteruserid, twitchchannelid)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET totaldurationseconds = EXCLUDED.totaldurationseconds, history = EXCLUDED.history
+                ''',
+                newTotalDurationSeconds, historyEntriesJson, chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
 
         newTimeoutHistory = ChatterTimeoutHistory(
             entries = cleanedHistoryEntries,
@@ -162,16 +165,18 @@ class ChatterTimeoutHistoryRepository(ChatterTimeoutHistoryRepositoryInterface):
             return history
 
         connection = await self.__getDatabaseConnection()
-        row = await connection.fetchRow(
-            '''
-                SELECT totaldurationseconds, history FROM chattertimeouthistory
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-                LIMIT 1
-            ''',
-            chatterUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            row = await connection.fetchRow(
+                '''
+                    SELECT totaldurationseconds, history FROM chattertimeouthistory
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                    LIMIT 1
+                ''',
+                chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
         totalDurationSeconds: int = 0
         historyEntries: FrozenList[ChatterTimeoutHistoryEntry] | None = None
 
@@ -204,34 +209,35 @@ class ChatterTimeoutHistoryRepository(ChatterTimeoutHistoryRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS chattertimeouthistory (
-                            totaldurationseconds bigint DEFAULT 0 NOT NULL,
-                            history jsonb DEFAULT NULL,
-                            chatteruserid text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS chattertimeouthistory (
-                            totaldurationseconds INTEGER NOT NULL DEFAULT 0,
-                            history text DEFAULT NULL,
-                            chatteruserid TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS chattertimeouthistory (
+                                totaldurationseconds bigint DEFAULT 0 NOT NULL,
+                                history jsonb DEFAULT NULL,
+                                chatteruserid text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS chattertimeouthistory (
+                                totaldurationseconds INTEGER NOT NULL DEFAULT 0,
+                                history text DEFAULT NULL,
+                                chatteruserid TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
@@ -133,20 +133,22 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
             )
 
         connection = await self.__getDatabaseConnection()
-        exception: DatabaseOperationalError | None = None
 
         try:
-            await connection.execute(
-                '''
-                    INSERT INTO additionaltriviaanswers (additionalanswer, triviaid, triviasource, triviatype, userid)
-                    VALUES ($1, $2, $3, $4, $5)
-                ''',
-                additionalAnswer, triviaId, triviaSource.toStr(), triviaQuestionType.toStr(), userId
-            )
-        except DatabaseOperationalError as e:
-            exception = e
+            exception: DatabaseOperationalError | None = None
 
-        await connection.close()
+            try:
+                await connection.execute(
+                    '''
+                        INSERT INTO additionaltriviaanswers (additionalanswer, triviaid, triviasource, triviatype, userid)
+                        VALUES ($1, $2, $3, $4, $5)
+                    ''',
+                    additionalAnswer, triviaId, triviaSource.toStr(), triviaQuestionType.toStr(), userId
+                )
+            except DatabaseOperationalError as e:
+                exception = e
+        finally:
+            await connection.close()
 
         if exception is not None:
             self.__timber.log('AdditionalTriviaAnswersRepository', f'Encountered a database operational error when trying to insert additional trivia answer ({additionalAnswer=}) ({triviaId=}) ({triviaSource=}) ({triviaQuestionType=}): {exception}', exception, traceback.format_exc())
@@ -222,15 +224,17 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
             return None
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM additionaltriviaanswers
-                WHERE triviaid = $1 AND triviasource = $2 AND triviatype = $3
-            ''',
-            triviaId, triviaSource.toStr(), triviaQuestionType.toStr()
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM additionaltriviaanswers
+                    WHERE triviaid = $1 AND triviasource = $2 AND triviatype = $3
+                ''',
+                triviaId, triviaSource.toStr(), triviaQuestionType.toStr()
+            )
+        finally:
+            await connection.close()
         self.__timber.log('AdditionalTriviaAnswersRepository', f'Deleted additional answers for {triviaSource.toStr()}:{triviaId} ({reference=})')
 
         return reference
@@ -252,22 +256,24 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
             return None
 
         connection = await self.__getDatabaseConnection()
-        records: FrozenList[FrozenList[Any]] | None = None
 
         try:
-            records = await connection.fetchRows(
-                '''
-                    SELECT additionaltriviaanswers.additionalanswer, additionaltriviaanswers.userid, userids.username FROM additionaltriviaanswers
-                    INNER JOIN userids ON additionaltriviaanswers.userid = userids.userid
-                    WHERE additionaltriviaanswers.triviaid = $1 AND additionaltriviaanswers.triviasource = $2 AND additionaltriviaanswers.triviatype = $3
-                    ORDER BY additionaltriviaanswers.additionalanswer ASC
-                ''',
-                triviaId, triviaSource.toStr(), triviaQuestionType.toStr()
-            )
-        except DatabaseOperationalError as e:
-            self.__timber.log('AdditionalTriviaAnswersRepository', f'Encountered a database operational error when trying to retrieve additional trivia answers ({triviaId=}) ({triviaSource=}) ({triviaQuestionType=}): {e}', e, traceback.format_exc())
+            records: FrozenList[FrozenList[Any]] | None = None
 
-        await connection.close()
+            try:
+                records = await connection.fetchRows(
+                    '''
+                        SELECT additionaltriviaanswers.additionalanswer, additionaltriviaanswers.userid, userids.username FROM additionaltriviaanswers
+                        INNER JOIN userids ON additionaltriviaanswers.userid = userids.userid
+                        WHERE additionaltriviaanswers.triviaid = $1 AND additionaltriviaanswers.triviasource = $2 AND additionaltriviaanswers.triviatype = $3
+                        ORDER BY additionaltriviaanswers.additionalanswer ASC
+                    ''',
+                    triviaId, triviaSource.toStr(), triviaQuestionType.toStr()
+                )
+            except DatabaseOperationalError as e:
+                self.__timber.log('AdditionalTriviaAnswersRepository', f'Encountered a database operational error when trying to retrieve additional trivia answers ({triviaId=}) ({triviaSource=}) ({triviaQuestionType=}): {e}', e, traceback.format_exc())
+        finally:
+            await connection.close()
 
         if records is None or len(records) == 0:
             return None
@@ -304,36 +310,37 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
-                            additionalanswer public.citext NOT NULL,
-                            triviaid text NOT NULL,
-                            triviasource text NOT NULL,
-                            triviatype text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
-                            additionalanswer TEXT NOT NULL COLLATE NOCASE,
-                            triviaid TEXT NOT NULL,
-                            triviasource TEXT NOT NULL,
-                            triviatype TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
-                        ) STRICT
-                    '''
-                )
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
+                                additionalanswer public.citext NOT NULL,
+                                triviaid text NOT NULL,
+                                triviasource text NOT NULL,
+                                triviatype text NOT NULL,
+                                userid text NOT NULL,
+                                PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
+                            )
+                        '''
+                    )
 
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
+                                additionalanswer TEXT NOT NULL COLLATE NOCASE,
+                                triviaid TEXT NOT NULL,
+                                triviasource TEXT NOT NULL,
+                                triviatype TEXT NOT NULL,
+                                userid TEXT NOT NULL,
+                                PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
+                            ) STRICT
+                        '''
+                    )
 
-        await connection.close()
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
@@ -1,6 +1,9 @@
+import itertools
 import math
 import re
 import traceback
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any, Final, Generator, Pattern
 
 import polyleven
@@ -22,11 +25,25 @@ from ...timber.timberInterface import TimberInterface
 
 class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
 
+    @dataclass
+    class QuestionMatcher:
+        questionKey: tuple[str, tuple[str, ...], frozenset[str] | None]
+        compiledCorrectAnswers: frozenset[str]
+        answerWords: tuple[list[str], ...]
+        mergedAnswerWords: dict[tuple[int, int], list[list[str]]] = field(default_factory = dict)
+        compiledGuessResults: dict[frozenset[str], TriviaAnswerCheckResult] = field(default_factory = dict)
+        guessResults: dict[str, TriviaAnswerCheckResult] = field(default_factory = dict)
+        wordComparisons: dict[tuple[str, str, int], bool] = field(default_factory = dict)
+
     def __init__(
         self,
         timber: TimberInterface,
         triviaAnswerCompiler: TriviaAnswerCompilerInterface,
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
+        maxCachedGuessesPerQuestion: int = 1024,
+        maxCachedQuestions: int = 16,
+        maxCachedWords: int = 8192,
+        maxWordMergeCombinations: int = 256,
     ):
         if not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
@@ -34,10 +51,33 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
             raise TypeError(f'triviaAnswerCompiler argument is malformed: \"{triviaAnswerCompiler}\"')
         elif not isinstance(triviaSettingsRepository, TriviaSettingsRepositoryInterface):
             raise TypeError(f'triviaSettingsRepository argument is malformed: \"{triviaSettingsRepository}\"')
+        elif not utils.isValidInt(maxCachedGuessesPerQuestion):
+            raise TypeError(f'maxCachedGuessesPerQuestion argument is malformed: \"{maxCachedGuessesPerQuestion}\"')
+        elif maxCachedGuessesPerQuestion < 1 or maxCachedGuessesPerQuestion > 65536:
+            raise ValueError(f'maxCachedGuessesPerQuestion argument is out of bounds: {maxCachedGuessesPerQuestion}')
+        elif not utils.isValidInt(maxCachedQuestions):
+            raise TypeError(f'maxCachedQuestions argument is malformed: \"{maxCachedQuestions}\"')
+        elif maxCachedQuestions < 1 or maxCachedQuestions > 256:
+            raise ValueError(f'maxCachedQuestions argument is out of bounds: {maxCachedQuestions}')
+        elif not utils.isValidInt(maxCachedWords):
+            raise TypeError(f'maxCachedWords argument is malformed: \"{maxCachedWords}\"')
+        elif maxCachedWords < 1 or maxCachedWords > 1048576:
+            raise ValueError(f'maxCachedWords argument is out of bounds: {maxCachedWords}')
+        elif not utils.isValidInt(maxWordMergeCombinations):
+            raise TypeError(f'maxWordMergeCombinations argument is malformed: \"{maxWordMergeCombinations}\"')
+        elif maxWordMergeCombinations < 1 or maxWordMergeCombinations > 65536:
+            raise ValueError(f'maxWordMergeCombinations argument is out of bounds: {maxWordMergeCombinations}')
 
         self.__timber: Final[TimberInterface] = timber
         self.__triviaAnswerCompiler: Final[TriviaAnswerCompilerInterface] = triviaAnswerCompiler
         self.__triviaSettingsRepository: Final[TriviaSettingsRepositoryInterface] = triviaSettingsRepository
+        self.__maxCachedGuessesPerQuestion: Final[int] = maxCachedGuessesPerQuestion
+        self.__maxCachedQuestions: Final[int] = maxCachedQuestions
+        self.__maxCachedWords: Final[int] = maxCachedWords
+        self.__maxWordMergeCombinations: Final[int] = maxWordMergeCombinations
+
+        self.__questionMatchers: Final[OrderedDict[str, TriviaAnswerChecker.QuestionMatcher]] = OrderedDict()
+        self.__wordVariants: Final[dict[str, tuple[str, ...]]] = dict()
 
         self.__extraWhitespacePattern: Final[Pattern] = re.compile(r'\s{2,}', re.IGNORECASE)
 
@@ -164,6 +204,16 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
         if utils.isValidStr(answer) and len(answer) > maxPhraseGuessLength:
             answer = answer[0:maxPhraseGuessLength].strip()
 
+        # During super trivia, lots of chatters will tend to submit the exact same guess within
+        # just a few seconds of each other, so results are remembered per question. Guesses that
+        # differ in their raw text but compile down to the same thing share a result too.
+        matcher = self.__getQuestionMatcher(triviaQuestion)
+        guessKey = answer.strip() if utils.isValidStr(answer) else ''
+        result = matcher.guessResults.get(guessKey, None)
+
+        if result is not None:
+            return result
+
         compiledUserAnswers = await self.__triviaAnswerCompiler.compileTextAnswersList(
             answers = [ answer ],
             allWords = triviaQuestion.allWords,
@@ -171,35 +221,23 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
         )
 
         if not all(utils.isValidStr(cleanedAnswer) for cleanedAnswer in compiledUserAnswers):
-            return TriviaAnswerCheckResult.INCORRECT
-
-        self.__timber.log('TriviaAnswerChecker', f'In depth question/answer debug information ({answer=}) ({triviaQuestion=}) ({extras=}) ({compiledUserAnswers=})')
-
-        for compiledCorrectAnswer in triviaQuestion.compiledCorrectAnswers:
-            for compiledUserAnswer in compiledUserAnswers:
-                expandedUserAnswers = await self.__triviaAnswerCompiler.expandNumerals(compiledUserAnswer)
+            result = TriviaAnswerCheckResult.INCORRECT
+        else:
+            compiledGuessKey = frozenset(compiledUserAnswers)
+            result = matcher.compiledGuessResults.get(compiledGuessKey, None)
 
-                for expandedUserAnswer in expandedUserAnswers:
-                    if expandedUserAnswer == compiledCorrectAnswer:
-                        return TriviaAnswerCheckResult.CORRECT
+            if result is None:
+                self.__timber.log('TriviaAnswerChecker', f'In depth question/answer debug information ({answer=}) ({triviaQuestion=}) ({extras=}) ({compiledUserAnswers=})')
 
-                    guessWords = self.__extraWhitespacePattern.sub(' ', expandedUserAnswer).split(' ')
-                    answerWords = self.__extraWhitespacePattern.sub(' ', compiledCorrectAnswer).split(' ')
-                    minWords = min(len(guessWords), len(answerWords))
+                result = await self.__matchCompiledUserAnswers(
+                    compiledUserAnswers = compiledUserAnswers,
+                    matcher = matcher,
+                )
 
-                    for gWords in self.__mergeWords(guessWords, minWords):
-                        for aWords in self.__mergeWords(answerWords, minWords):
-                            # This expansion of all() is required because you can't perform list comprehension on async
-                            #   generators yet. :(
-                            valid = True
-                            for i in range(len(gWords)):
-                                if not await self.__compareWords(gWords[i], aWords[i]):
-                                    valid = False
-                                    break
-                            if valid:
-                                return TriviaAnswerCheckResult.CORRECT
+                self.__putCachedResult(matcher.compiledGuessResults, compiledGuessKey, result)
 
-        return TriviaAnswerCheckResult.INCORRECT
+        self.__putCachedResult(matcher.guessResults, guessKey, result)
+        return result
 
     async def __checkAnswerTrueFalse(
         self,
@@ -242,28 +280,37 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
                     yield [''.join(wordList[0:i + 1])] + w
 
     # compare two individual words, returns true if any valid variants match between the two words
-    async def __compareWords(
+    def __compareWords(
         self,
         word1: str,
         word2: str,
+        thresholdGrowthRate: int,
+        matcher: QuestionMatcher,
     ) -> bool:
-        thresholdGrowthRate = await self.__triviaSettingsRepository.getLevenshteinThresholdGrowthRate()
+        comparisonKey = (word1, word2, thresholdGrowthRate)
+        isMatch = matcher.wordComparisons.get(comparisonKey, None)
 
-        for w1 in self.__genVariantPossibilities(word1):
-            if not utils.isValidStr(w1):
-                continue
+        if isMatch is not None:
+            return isMatch
+        elif len(matcher.wordComparisons) >= self.__maxCachedWords:
+            matcher.wordComparisons.clear()
 
-            for w2 in self.__genVariantPossibilities(word2):
-                if not utils.isValidStr(w2):
-                    continue
+        isMatch = False
 
+        for w1 in self.__getWordVariants(word1):
+            for w2 in self.__getWordVariants(word2):
                 # calculate threshold based on shorter word length
                 threshold = math.floor(min(len(w1), len(w2)) / thresholdGrowthRate)
                 distance = polyleven.levenshtein(w1, w2, threshold + 1)
                 if distance <= threshold:
-                    return True
+                    isMatch = True
+                    break
 
-        return False
+            if isMatch:
+                break
+
+        matcher.wordComparisons[comparisonKey] = isMatch
+        return isMatch
 
     def __genVariantPossibilities(self, word: str) -> Generator[str, None, None]:
         yield word
@@ -1616,3 +1663,123 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
             yield 'world war 2'
         if word == 'xmas':
             yield 'christmas'
+
+    def __getMergedAnswerWords(
+        self,
+        matcher: QuestionMatcher,
+        answerIndex: int,
+        targetLength: int,
+    ) -> list[list[str]]:
+        mergeKey = (answerIndex, targetLength)
+        mergedAnswerWords = matcher.mergedAnswerWords.get(mergeKey, None)
+
+        if mergedAnswerWords is None:
+            mergedAnswerWords = list(itertools.islice(
+                self.__mergeWords(matcher.answerWords[answerIndex], targetLength),
+                self.__maxWordMergeCombinations,
+            ))
+
+            matcher.mergedAnswerWords[mergeKey] = mergedAnswerWords
+
+        return mergedAnswerWords
+
+    def __getQuestionMatcher(self, triviaQuestion: QuestionAnswerTriviaQuestion) -> QuestionMatcher:
+        # additional answers can be added to a question while its game is still going, so
+        # the correct answers are part of the key rather than just the trivia ID
+        questionKey = (triviaQuestion.triviaId, tuple(triviaQuestion.compiledCorrectAnswers), triviaQuestion.allWords)
+        matcher = self.__questionMatchers.get(triviaQuestion.triviaId, None)
+
+        if matcher is not None and matcher.questionKey == questionKey:
+            self.__questionMatchers.move_to_end(triviaQuestion.triviaId)
+            return matcher
+
+        answerWords = tuple(
+            self.__extraWhitespacePattern.sub(' ', compiledCorrectAnswer).split(' ')
+            for compiledCorrectAnswer in triviaQuestion.compiledCorrectAnswers
+        )
+
+        matcher = TriviaAnswerChecker.QuestionMatcher(
+            questionKey = questionKey,
+            compiledCorrectAnswers = frozenset(triviaQuestion.compiledCorrectAnswers),
+            answerWords = answerWords,
+        )
+
+        # precompute every grouping of the correct answers' words, along with each of those
+        # words' variants, so that the first wave of guesses doesn't have to
+        for answerIndex, words in enumerate(answerWords):
+            for targetLength in range(1, len(words) + 1):
+                for mergedWords in self.__getMergedAnswerWords(matcher, answerIndex, targetLength):
+                    for word in mergedWords:
+                        self.__getWordVariants(word)
+
+        self.__questionMatchers[triviaQuestion.triviaId] = matcher
+        self.__questionMatchers.move_to_end(triviaQuestion.triviaId)
+
+        while len(self.__questionMatchers) > self.__maxCachedQuestions:
+            self.__questionMatchers.popitem(last = False)
+
+        return matcher
+
+    def __getWordVariants(self, word: str) -> tuple[str, ...]:
+        variants = self.__wordVariants.get(word, None)
+
+        if variants is not None:
+            return variants
+        elif not utils.isValidStr(word):
+            return tuple()
+
+        variants = tuple(dict.fromkeys(
+            variant for variant in self.__genVariantPossibilities(word) if utils.isValidStr(variant)
+        ))
+
+        if len(self.__wordVariants) >= self.__maxCachedWords:
+            del self.__wordVariants[next(iter(self.__wordVariants))]
+
+        self.__wordVariants[word] = variants
+        return variants
+
+    async def __matchCompiledUserAnswers(
+        self,
+        compiledUserAnswers: list[str],
+        matcher: QuestionMatcher,
+    ) -> TriviaAnswerCheckResult:
+        thresholdGrowthRate = await self.__triviaSettingsRepository.getLevenshteinThresholdGrowthRate()
+        expandedUserAnswers: dict[str, None] = dict()
+
+        for compiledUserAnswer in compiledUserAnswers:
+            expandedUserAnswers.update(dict.fromkeys(await self.__triviaAnswerCompiler.expandNumerals(compiledUserAnswer)))
+
+        if not matcher.compiledCorrectAnswers.isdisjoint(expandedUserAnswers):
+            return TriviaAnswerCheckResult.CORRECT
+
+        for expandedUserAnswer in expandedUserAnswers:
+            guessWords = self.__extraWhitespacePattern.sub(' ', expandedUserAnswer).split(' ')
+
+            for answerIndex, answerWords in enumerate(matcher.answerWords):
+                minWords = min(len(guessWords), len(answerWords))
+                mergedAnswerWords = self.__getMergedAnswerWords(matcher, answerIndex, minWords)
+
+                for gWords in itertools.islice(self.__mergeWords(guessWords, minWords), self.__maxWordMergeCombinations):
+                    for aWords in mergedAnswerWords:
+                        if all(self.__compareWords(gWord, aWord, thresholdGrowthRate, matcher) for gWord, aWord in zip(gWords, aWords)):
+                            return TriviaAnswerCheckResult.CORRECT
+
+        return TriviaAnswerCheckResult.INCORRECT
+
+    async def prepareQuestion(self, triviaQuestion: AbsTriviaQuestion):
+        if not isinstance(triviaQuestion, AbsTriviaQuestion):
+            raise TypeError(f'triviaQuestion argument is malformed: \"{triviaQuestion}\"')
+
+        if isinstance(triviaQuestion, QuestionAnswerTriviaQuestion):
+            self.__getQuestionMatcher(triviaQuestion)
+
+    def __putCachedResult(
+        self,
+        cache: dict[Any, TriviaAnswerCheckResult],
+        key: Any,
+        result: TriviaAnswerCheckResult,
+    ):
+        if key not in cache and len(cache) >= self.__maxCachedGuessesPerQuestion:
+            del cache[next(iter(cache))]
+
+        cache[key] = result
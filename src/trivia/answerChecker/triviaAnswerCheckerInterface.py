@@ -15,3 +15,7 @@ class TriviaAnswerCheckerInterface(ABC):
         extras: dict[str, Any] | None = None,
     ) -> TriviaAnswerCheckResult:
         pass
+
+    @abstractmethod
+    async def prepareQuestion(self, triviaQuestion: AbsTriviaQuestion):
+        pass
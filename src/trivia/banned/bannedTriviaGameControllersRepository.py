@@ -52,16 +52,18 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
         self.__cache = None
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO bannedtriviagamecontrollers (userid)
-                VALUES ($1)
-                ON CONFLICT (userid) DO NOTHING
-            ''',
-            userId
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO bannedtriviagamecontrollers (userid)
+                    VALUES ($1)
+                    ON CONFLICT (userid) DO NOTHING
+                ''',
+                userId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('BannedTriviaGameControllersRepository', f'Added banned trivia game controller ({userId=})')
         return AddBannedTriviaGameControllerResult.ADDED
 
@@ -76,13 +78,15 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
             return bannedControllers
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT userid FROM bannedtriviagamecontrollers
-            '''
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT userid FROM bannedtriviagamecontrollers
+                '''
+            )
+        finally:
+            await connection.close()
         controllers: set[str] = set()
 
         if records is not None and len(records) >= 1:
@@ -104,29 +108,30 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
-                            userid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
-                            userid TEXT NOT NULL PRIMARY KEY
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
+                                userid text NOT NULL PRIMARY KEY
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
+                                userid TEXT NOT NULL PRIMARY KEY
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def removeBannedController(
         self,
@@ -143,14 +148,16 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
         self.__cache = None
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM bannedtriviagamecontrollers
-                WHERE userid = $1
-            ''',
-            userId
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM bannedtriviagamecontrollers
+                    WHERE userid = $1
+                ''',
+                userId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('BannedTriviaGameControllersRepository', f'Removed user from banned trivia game controllers ({userId=})')
         return RemoveBannedTriviaGameControllerResult.REMOVED
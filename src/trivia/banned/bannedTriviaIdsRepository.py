@@ -59,15 +59,17 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         self.__timber.log('BannedTriviaIdsRepository', f'Banning trivia question (triviaId=\"{triviaId}\", userId=\"{userId}\", triviaSource=\"{triviaSource}\")...')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO bannedtriviaids (triviaid, triviasource, userid)
-                VALUES ($1, $2, $3)
-            ''',
-            triviaId, triviaSource.toStr(), userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO bannedtriviaids (triviaid, triviasource, userid)
+                    VALUES ($1, $2, $3)
+                ''',
+                triviaId, triviaSource.toStr(), userId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('BannedTriviaIdsRepository', f'Banned trivia question (triviaId=\"{triviaId}\", userId=\"{userId}\", triviaSource=\"{triviaSource}\")')
 
         return BanTriviaQuestionResult.BANNED
@@ -87,17 +89,19 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
             raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT bannedtriviaids.triviaid, bannedtriviaids.triviasource, bannedtriviaids.userid, userids.username FROM bannedtriviaids
-                INNER JOIN userids ON bannedtriviaids.userid = userids.userid
-                WHERE bannedtriviaids.triviaid = $1 AND bannedtriviaids.triviasource = $2
-                LIMIT 1
-            ''',
-            triviaId, triviaSource.toStr()
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT bannedtriviaids.triviaid, bannedtriviaids.triviasource, bannedtriviaids.userid, userids.username FROM bannedtriviaids
+                    INNER JOIN userids ON bannedtriviaids.userid = userids.userid
+                    WHERE bannedtriviaids.triviaid = $1 AND bannedtriviaids.triviasource = $2
+                    LIMIT 1
+                ''',
+                triviaId, triviaSource.toStr()
+            )
+        finally:
+            await connection.close()
 
         if record is None or len(record) == 0:
             return None
@@ -116,35 +120,36 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS bannedtriviaids (
-                            triviaid public.citext NOT NULL,
-                            triviasource public.citext NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (triviaid, triviasource)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS bannedtriviaids (
-                            triviaid TEXT NOT NULL COLLATE NOCASE,
-                            triviasource TEXT NOT NULL COLLATE NOCASE,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (triviaid, triviasource)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS bannedtriviaids (
+                                triviaid public.citext NOT NULL,
+                                triviasource public.citext NOT NULL,
+                                userid text NOT NULL,
+                                PRIMARY KEY (triviaid, triviasource)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS bannedtriviaids (
+                                triviaid TEXT NOT NULL COLLATE NOCASE,
+                                triviasource TEXT NOT NULL COLLATE NOCASE,
+                                userid TEXT NOT NULL,
+                                PRIMARY KEY (triviaid, triviasource)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def isBanned(self, triviaId: str, triviaSource: TriviaSource) -> bool:
         if not utils.isValidStr(triviaId):
@@ -185,14 +190,16 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         self.__timber.log('BannedTriviaIdsRepository', f'Unbanning trivia question (triviaId=\"{triviaId}\", triviaSource=\"{triviaSource}\")...')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM bannedtriviaids
-                WHERE triviaid = $1 AND triviasource = $2
-            ''',
-            triviaId, triviaSource.toStr()
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM bannedtriviaids
+                    WHERE triviaid = $1 AND triviasource = $2
+                ''',
+                triviaId, triviaSource.toStr()
+            )
+        finally:
+            await connection.close()
         self.__timber.log('BannedTriviaIdsRepository', f'Unbanned trivia question (triviaId=\"{triviaId}\", triviaSource=\"{triviaSource}\")')
         return BanTriviaQuestionResult.UNBANNED
@@ -3,8 +3,6 @@ from .triviaContentScannerInterface import TriviaContentScannerInterface
 from ..questions.absTriviaQuestion import AbsTriviaQuestion
 from ..questions.triviaQuestionType import TriviaQuestionType
 from ..settings.triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
-from ...contentScanner.bannedPhrase import BannedPhrase
-from ...contentScanner.bannedWord import BannedWord
 from ...contentScanner.bannedWordsRepositoryInterface import BannedWordsRepositoryInterface
 from ...contentScanner.contentScannerInterface import ContentScannerInterface
 from ...misc import utils as utils
@@ -127,24 +125,12 @@ class TriviaContentScanner(TriviaContentScannerInterface):
 
         phrases = await self.__getAllPhrasesFromQuestion(question)
         words = await self.__getAllWordsFromQuestion(question)
-        absBannedWords = await self.__bannedWordsRepository.getBannedWordsAsync()
-
-        for absBannedWord in absBannedWords:
-            if isinstance(absBannedWord, BannedWord):
-                bannedWord: BannedWord = absBannedWord
-
-                if bannedWord.word in words:
-                    self.__timber.log('TriviaContentScanner', f'Trivia content contains a banned word ({absBannedWord}) ({question=})')
-                    return TriviaContentCode.CONTAINS_BANNED_CONTENT
-            elif isinstance(absBannedWord, BannedPhrase):
-                bannedPhrase: BannedPhrase = absBannedWord
-
-                for phrase in phrases:
-                    if bannedPhrase.phrase in phrase:
-                        self.__timber.log('TriviaContentScanner', f'Trivia content contains a banned phrase ({absBannedWord}) ({question=})')
-                        return TriviaContentCode.CONTAINS_BANNED_CONTENT
-            else:
-                raise RuntimeError(f'unknown BannedWordType ({absBannedWord=})')
+        matcher = await self.__bannedWordsRepository.getBannedWordsMatcherAsync()
+        bannedContent = matcher.findBannedContent(phrases, words)
+
+        if bannedContent is not None:
+            self.__timber.log('TriviaContentScanner', f'Trivia content contains banned content ({bannedContent=}) ({question=})')
+            return TriviaContentCode.CONTAINS_BANNED_CONTENT
 
         return TriviaContentCode.OK
 
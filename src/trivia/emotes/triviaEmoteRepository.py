@@ -23,21 +23,23 @@ class TriviaEmoteRepository(TriviaEmoteRepositoryInterface):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT emoteindex FROM triviaemotes
-                WHERE twitchchannelid = $1
-                LIMIT 1
-            ''',
-            twitchChannelId
-        )
 
-        emoteIndex: int | None = None
-
-        if record is not None and len(record) >= 1:
-            emoteIndex = record[0]
-
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT emoteindex FROM triviaemotes
+                    WHERE twitchchannelid = $1
+                    LIMIT 1
+                ''',
+                twitchChannelId
+            )
+
+            emoteIndex: int | None = None
+
+            if record is not None and len(record) >= 1:
+                emoteIndex = record[0]
+        finally:
+            await connection.close()
         return emoteIndex
 
     async def __initDatabaseTable(self):
@@ -47,31 +49,32 @@ class TriviaEmoteRepository(TriviaEmoteRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviaemotes (
-                            emoteindex smallint DEFAULT 0 NOT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviaemotes (
-                            emoteindex INTEGER NOT NULL DEFAULT 0,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviaemotes (
+                                emoteindex smallint DEFAULT 0 NOT NULL,
+                                twitchchannelid text NOT NULL PRIMARY KEY
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviaemotes (
+                                emoteindex INTEGER NOT NULL DEFAULT 0,
+                                twitchchannelid TEXT NOT NULL PRIMARY KEY
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def setEmoteIndexFor(self, emoteIndex: int, twitchChannelId: str):
         if not utils.isValidInt(emoteIndex):
@@ -82,13 +85,15 @@ class TriviaEmoteRepository(TriviaEmoteRepositoryInterface):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO triviaemotes (emoteindex, twitchchannelid)
-                VALUES ($1, $2)
-                ON CONFLICT (twitchchannelid) DO UPDATE SET emoteindex = EXCLUDED.emoteindex
-            ''',
-            emoteIndex, twitchChannelId
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO triviaemotes (emoteindex, twitchchannelid)
+                    VALUES ($1, $2)
+                    ON CONFLICT (twitchchannelid) DO UPDATE SET emoteindex = EXCLUDED.emoteindex
+                ''',
+                emoteIndex, twitchChannelId
+            )
+        finally:
+            await connection.close()
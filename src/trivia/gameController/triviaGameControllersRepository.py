@@ -48,16 +48,18 @@ class TriviaGameControllersRepository(TriviaGameControllersRepositoryInterface):
         self.__cache.pop(twitchChannelId, None)
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO triviagamecontrollers (twitchchannelid, userid)
-                VALUES ($1, $2)
-                ON CONFLICT (twitchchannelid, userid) DO NOTHING
-            ''',
-            twitchChannelId, userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO triviagamecontrollers (twitchchannelid, userid)
+                    VALUES ($1, $2)
+                    ON CONFLICT (twitchchannelid, userid) DO NOTHING
+                ''',
+                twitchChannelId, userId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('TriviaGameControllersRepository', f'Added a new trivia game controller ({twitchChannelId=}) ({userId=})')
         return AddTriviaGameControllerResult.ADDED
 
@@ -78,15 +80,17 @@ class TriviaGameControllersRepository(TriviaGameControllersRepositoryInterface):
             return cachedControllers
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT userid FROM triviagamecontrollers
-                WHERE triviagamecontrollers.twitchchannelid = $1
-            ''',
-            twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT userid FROM triviagamecontrollers
+                    WHERE triviagamecontrollers.twitchchannelid = $1
+                ''',
+                twitchChannelId
+            )
+        finally:
+            await connection.close()
         controllers: set[str] = set()
 
         if records is not None and len(records) >= 1:
@@ -108,33 +112,34 @@ class TriviaGameControllersRepository(TriviaGameControllersRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviagamecontrollers (
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviagamecontrollers (
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviagamecontrollers (
+                                twitchchannelid text NOT NULL,
+                                userid text NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviagamecontrollers (
+                                twitchchannelid TEXT NOT NULL,
+                                userid TEXT NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def removeController(
         self,
@@ -156,14 +161,16 @@ class TriviaGameControllersRepository(TriviaGameControllersRepositoryInterface):
         self.__cache.pop(twitchChannelId, None)
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM triviagamecontrollers
-                WHERE twitchchannelid = $1 AND userid = $2
-            ''',
-            twitchChannelId, userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM triviagamecontrollers
+                    WHERE twitchchannelid = $1 AND userid = $2
+                ''',
+                twitchChannelId, userId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('TriviaGameControllersRepository', f'Finished removing trivia game controller ({twitchChannelId=}) ({userId=})')
         return RemoveTriviaGameControllerResult.REMOVED
@@ -43,16 +43,18 @@ class TriviaGameGlobalControllersRepository(TriviaGameGlobalControllersRepositor
         self.__cache = None
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO triviagameglobalcontrollers (userid)
-                VALUES ($1)
-                ON CONFLICT (userid) DO NOTHING
-            ''',
-            userId
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO triviagameglobalcontrollers (userid)
+                    VALUES ($1)
+                    ON CONFLICT (userid) DO NOTHING
+                ''',
+                userId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('TriviaGameGlobalControllersRepository', f'Added user to trivia game global controllers ({userId=})')
         return AddTriviaGameControllerResult.ADDED
 
@@ -67,13 +69,15 @@ class TriviaGameGlobalControllersRepository(TriviaGameGlobalControllersRepositor
             return cachedControllers
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT userid FROM triviagameglobalcontrollers
-            '''
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT userid FROM triviagameglobalcontrollers
+                '''
+            )
+        finally:
+            await connection.close()
         controllers: set[str] = set()
 
         if records is not None and len(records) >= 1:
@@ -95,29 +99,30 @@ class TriviaGameGlobalControllersRepository(TriviaGameGlobalControllersRepositor
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
-                            userid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
-                            userid TEXT NOT NULL PRIMARY KEY
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
+                                userid text NOT NULL PRIMARY KEY
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
+                                userid TEXT NOT NULL PRIMARY KEY
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def removeController(
         self,
@@ -134,14 +139,16 @@ class TriviaGameGlobalControllersRepository(TriviaGameGlobalControllersRepositor
         self.__cache = None
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM triviagameglobalcontrollers
-                WHERE userid = $1
-            ''',
-            userId
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM triviagameglobalcontrollers
+                    WHERE userid = $1
+                ''',
+                userId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('TriviaGameGlobalControllersRepository', f'Removed user from trivia game global controllers ({userId=})')
         return RemoveTriviaGameControllerResult.REMOVED
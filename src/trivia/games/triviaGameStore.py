@@ -1,3 +1,5 @@
+import heapq
+from datetime import datetime
 from typing import Final
 
 from frozenlist import FrozenList
@@ -13,8 +15,14 @@ from ...misc import utils as utils
 class TriviaGameStore(TriviaGameStoreInterface):
 
     def __init__(self):
-        self.__normalGameStates: Final[list[TriviaGameState]] = list()
-        self.__superGameStates: Final[list[SuperTriviaGameState]] = list()
+        self.__normalGameStates: Final[dict[tuple[str, str], TriviaGameState]] = dict()
+        self.__superGameStates: Final[dict[str, SuperTriviaGameState]] = dict()
+
+        # A min-heap of every added game, ordered by end time. Games that get removed early
+        # (e.g. someone answered correctly) are left in here and are just skipped over once
+        # they reach the top, as that's cheaper than searching the heap to remove them.
+        self.__expiryHeap: list[tuple[datetime, int, AbsTriviaGameState]] = list()
+        self.__expiryHeapSequence: int = 0
 
     async def add(
         self,
@@ -30,25 +38,33 @@ class TriviaGameStore(TriviaGameStoreInterface):
         else:
             raise UnknownTriviaGameTypeException(f'Unknown TriviaGameType ({state=}): \"{state.triviaGameType}\"')
 
+        self.__pushExpiry(state)
+
     async def __addNormalGame(self, state: TriviaGameState):
         if not isinstance(state, TriviaGameState):
             raise TypeError(f'state argument is malformed: \"{state}\"')
 
-        self.__normalGameStates.append(state)
+        self.__normalGameStates[(state.getTwitchChannelId(), state.getUserId())] = state
 
     async def __addSuperGame(self, state: SuperTriviaGameState):
         if not isinstance(state, SuperTriviaGameState):
             raise TypeError(f'state argument is malformed: \"{state}\"')
 
-        self.__superGameStates.append(state)
+        self.__superGameStates[state.getTwitchChannelId()] = state
 
-    async def getAll(self) -> FrozenList[AbsTriviaGameState]:
-        normalGames = await self.getNormalGames()
-        superGames = await self.getSuperGames()
+    def __compactExpiryHeap(self):
+        liveGameCount = len(self.__normalGameStates) + len(self.__superGameStates)
 
+        if len(self.__expiryHeap) <= 2 * liveGameCount + 16:
+            return
+
+        self.__expiryHeap = [ entry for entry in self.__expiryHeap if self.__isStored(entry[2]) ]
+        heapq.heapify(self.__expiryHeap)
+
+    async def getAll(self) -> FrozenList[AbsTriviaGameState]:
         allGames: FrozenList[AbsTriviaGameState] = FrozenList()
-        allGames.extend(normalGames)
-        allGames.extend(superGames)
+        allGames.extend(self.__normalGameStates.values())
+        allGames.extend(self.__superGameStates.values())
         allGames.freeze()
 
         return allGames
@@ -63,16 +79,10 @@ class TriviaGameStore(TriviaGameStoreInterface):
         elif not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        normalGames = await self.getNormalGames()
-
-        for state in normalGames:
-            if twitchChannelId == state.getTwitchChannelId() and userId == state.getUserId():
-                return state
-
-        return None
+        return self.__normalGameStates.get((twitchChannelId, userId), None)
 
     async def getNormalGames(self) -> FrozenList[TriviaGameState]:
-        frozenNormalGames: FrozenList[TriviaGameState] = FrozenList(self.__normalGameStates)
+        frozenNormalGames: FrozenList[TriviaGameState] = FrozenList(self.__normalGameStates.values())
         frozenNormalGames.freeze()
         return frozenNormalGames
 
@@ -80,27 +90,51 @@ class TriviaGameStore(TriviaGameStoreInterface):
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        superGames = await self.getSuperGames()
-
-        for state in superGames:
-            if twitchChannelId == state.getTwitchChannelId():
-                return state
-
-        return None
+        return self.__superGameStates.get(twitchChannelId, None)
 
     async def getSuperGames(self) -> FrozenList[SuperTriviaGameState]:
-        frozenSuperGames: FrozenList[SuperTriviaGameState] = FrozenList(self.__superGameStates)
+        frozenSuperGames: FrozenList[SuperTriviaGameState] = FrozenList(self.__superGameStates.values())
         frozenSuperGames.freeze()
         return frozenSuperGames
 
     async def getTwitchChannelIdsWithActiveSuperGames(self) -> frozenset[str]:
-        superGames = await self.getSuperGames()
-        twitchChannelIds: set[str] = set()
+        return frozenset(self.__superGameStates.keys())
+
+    def __isStored(self, state: AbsTriviaGameState) -> bool:
+        if isinstance(state, TriviaGameState):
+            return self.__normalGameStates.get((state.getTwitchChannelId(), state.getUserId()), None) is state
+        elif isinstance(state, SuperTriviaGameState):
+            return self.__superGameStates.get(state.getTwitchChannelId(), None) is state
+        else:
+            return False
+
+    async def popExpiredGames(self, now: datetime) -> FrozenList[AbsTriviaGameState]:
+        if not isinstance(now, datetime):
+            raise TypeError(f'now argument is malformed: \"{now}\"')
+
+        expiredGames: FrozenList[AbsTriviaGameState] = FrozenList()
+
+        while len(self.__expiryHeap) >= 1 and self.__expiryHeap[0][0] < now:
+            _, _, state = heapq.heappop(self.__expiryHeap)
+
+            if not self.__isStored(state):
+                # this game was already removed some other way
+                continue
 
-        for state in superGames:
-            twitchChannelIds.add(state.getTwitchChannelId())
+            if isinstance(state, TriviaGameState):
+                del self.__normalGameStates[(state.getTwitchChannelId(), state.getUserId())]
+            elif isinstance(state, SuperTriviaGameState):
+                del self.__superGameStates[state.getTwitchChannelId()]
 
-        return frozenset(twitchChannelIds)
+            expiredGames.append(state)
+
+        expiredGames.freeze()
+        return expiredGames
+
+    def __pushExpiry(self, state: AbsTriviaGameState):
+        self.__expiryHeapSequence += 1
+        heapq.heappush(self.__expiryHeap, (state.endTime, self.__expiryHeapSequence, state))
+        self.__compactExpiryHeap()
 
     async def removeNormalGame(
         self,
@@ -112,24 +146,10 @@ class TriviaGameStore(TriviaGameStoreInterface):
         elif not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        normalGames = await self.getNormalGames()
-
-        for index, state in enumerate(normalGames):
-            if twitchChannelId == state.getTwitchChannelId() and userId == state.getUserId():
-                del self.__normalGameStates[index]
-                return True
-
-        return False
+        return self.__normalGameStates.pop((twitchChannelId, userId), None) is not None
 
     async def removeSuperGame(self, twitchChannelId: str) -> bool:
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        superGames = await self.getSuperGames()
-
-        for index, state in enumerate(superGames):
-            if twitchChannelId == state.getTwitchChannelId():
-                del self.__superGameStates[index]
-                return True
-
-        return False
+        return self.__superGameStates.pop(twitchChannelId, None) is not None
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from frozenlist import FrozenList
 
@@ -47,6 +48,10 @@ class TriviaGameStoreInterface(ABC):
     async def getTwitchChannelIdsWithActiveSuperGames(self) -> frozenset[str]:
         pass
 
+    @abstractmethod
+    async def popExpiredGames(self, now: datetime) -> FrozenList[AbsTriviaGameState]:
+        pass
+
     @abstractmethod
     async def removeNormalGame(
         self,
@@ -66,17 +66,19 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT datetime, emote, triviaid, triviasource, triviatype FROM triviahistory
-                WHERE emote IS NOT NULL AND emote = $1 AND twitchchannelid = $2
-                ORDER BY datetime DESC
-                LIMIT 1
-            ''',
-            emote, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT datetime, emote, triviaid, triviasource, triviatype FROM triviahistory
+                    WHERE emote IS NOT NULL AND emote = $1 AND twitchchannelid = $2
+                    ORDER BY datetime DESC
+                    LIMIT 1
+                ''',
+                emote, twitchChannelId
+            )
+        finally:
+            await connection.close()
 
         if record is None or len(record) == 0:
             return None
@@ -98,41 +100,42 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviahistory (
-                            datetime text NOT NULL,
-                            emote text NOT NULL,
-                            triviaid text NOT NULL,
-                            triviasource text NOT NULL,
-                            triviatype text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviahistory (
-                            datetime TEXT NOT NULL,
-                            emote TEXT NOT NULL,
-                            triviaid TEXT NOT NULL,
-                            triviasource TEXT NOT NULL,
-                            triviatype TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviahistory (
+                                datetime text NOT NULL,
+                                emote text NOT NULL,
+                                triviaid text NOT NULL,
+                                triviasource text NOT NULL,
+                                triviatype text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviahistory (
+                                datetime TEXT NOT NULL,
+                                emote TEXT NOT NULL,
+                                triviaid TEXT NOT NULL,
+                                triviasource TEXT NOT NULL,
+                                triviatype TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def verify(
         self,
@@ -158,48 +161,48 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
         triviaType = await self.__triviaQuestionTypeParser.serialize(question.triviaType)
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT datetime FROM triviahistory
-                WHERE triviaid = $1 AND triviasource = $2 AND triviatype = $3 AND twitchchannelid = $4
-                LIMIT 1
-            ''',
-            question.triviaId, triviaSource, triviaType, twitchChannelId
-        )
 
-        nowDateTime = datetime.now(self.__timeZoneRepository.getDefault())
-        nowDateTimeStr = nowDateTime.isoformat()
-
-        if record is None or len(record) == 0:
-            await connection.execute(
+        try:
+            record = await connection.fetchRow(
                 '''
-                    INSERT INTO triviahistory (datetime, emote, triviaid, triviasource, triviatype, twitchchannelid)
-                    VALUES ($1, $2, $3, $4, $5, $6)
+                    SELECT datetime FROM triviahistory
+                    WHERE triviaid = $1 AND triviasource = $2 AND triviatype = $3 AND twitchchannelid = $4
+                    LIMIT 1
                 ''',
-                nowDateTimeStr, emote, question.triviaId, triviaSource, triviaType, twitchChannelId
+                question.triviaId, triviaSource, triviaType, twitchChannelId
             )
 
-            await connection.close()
-            return TriviaContentCode.OK
+            nowDateTime = datetime.now(self.__timeZoneRepository.getDefault())
+            nowDateTimeStr = nowDateTime.isoformat()
 
-        questionDateTimeStr: str = record[0]
-        questionDateTime = datetime.fromisoformat(questionDateTimeStr)
-        minimumTimeDelta = timedelta(days = await self.__triviaSettingsRepository.getMinDaysBeforeRepeatQuestion())
+            if record is None or len(record) == 0:
+                await connection.execute(
+                    '''
+                        INSERT INTO triviahistory (datetime, emote, triviaid, triviasource, triviatype, twitchchannelid)
+                        VALUES ($1, $2, $3, $4, $5, $6)
+                    ''',
+                    nowDateTimeStr, emote, question.triviaId, triviaSource, triviaType, twitchChannelId
+                )
 
-        if questionDateTime + minimumTimeDelta >= nowDateTime:
-            await connection.close()
-            self.__timber.log('TriviaHistoryRepository', f'Encountered duplicate triviaHistory entry that is within the window of being a repeat ({nowDateTimeStr=}) ({questionDateTimeStr=}) ({emote=}) ({workingTriviaSource=}) ({question.originalTriviaSource=}) ({question.triviaId=}) ({question.triviaSource=}) ({question.triviaType=}) ({twitchChannel=}) ({twitchChannelId=})')
-            return TriviaContentCode.REPEAT
-
-        await connection.execute(
-            '''
-                UPDATE triviahistory
-                SET datetime = $1, emote = $2
-                WHERE triviaid = $3 AND triviasource = $4 AND triviatype = $5 AND twitchchannelid = $6
-            ''',
-            nowDateTimeStr, emote, question.triviaId, triviaSource, triviaType, twitchChannelId
-        )
+                return TriviaContentCode.OK
+
+            questionDateTimeStr: str = record[0]
+            questionDateTime = datetime.fromisoformat(questionDateTimeStr)
+            minimumTimeDelta = timedelta(days = await self.__triviaSettingsRepository.getMinDaysBeforeRepeatQuestion())
+
+            if questionDateTime + minimumTimeDelta >= nowDateTime:
+                self.__timber.log('TriviaHistoryRepository', f'Encountered duplicate triviaHistory entry that is within the window of being a repeat ({nowDateTimeStr=}) ({questionDateTimeStr=}) ({emote=}) ({workingTriviaSource=}) ({question.originalTriviaSource=}) ({question.triviaId=}) ({question.triviaSource=}) ({question.triviaType=}) ({twitchChannel=}) ({twitchChannelId=})')
+                return TriviaContentCode.REPEAT
 
-        await connection.close()
+            await connection.execute(
+                '''
+                    UPDATE triviahistory
+                    SET datetime = $1, emote = $2
+                    WHERE triviaid = $3 AND triviasource = $4 AND triviatype = $5 AND twitchchannelid = $6
+                ''',
+                nowDateTimeStr, emote, question.triviaId, triviaSource, triviaType, twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('TriviaHistoryRepository', f'Updated triviaHistory entry ({nowDateTimeStr=}) ({questionDateTimeStr=}) ({emote=}) ({workingTriviaSource=}) ({question.originalTriviaSource=}) ({question.triviaId=}) ({question.triviaSource=}) ({question.triviaType=}) ({twitchChannel=}) ({twitchChannelId=})')
         return TriviaContentCode.OK
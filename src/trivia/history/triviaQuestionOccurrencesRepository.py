@@ -41,13 +41,15 @@ class TriviaQuestionOccurrencesRepository(TriviaQuestionOccurrencesRepositoryInt
             raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
 
         connection = await self.__getDatabaseConnection()
-        occurrences = await self.__getOccurrences(
-            connection = connection,
-            triviaId = triviaId,
-            triviaSource = triviaSource
-        )
 
-        await connection.close()
+        try:
+            occurrences = await self.__getOccurrences(
+                connection = connection,
+                triviaId = triviaId,
+                triviaSource = triviaSource
+            )
+        finally:
+            await connection.close()
         return occurrences
 
     async def __getOccurrences(
@@ -106,28 +108,29 @@ class TriviaQuestionOccurrencesRepository(TriviaQuestionOccurrencesRepositoryInt
 
         connection = await self.__getDatabaseConnection()
 
-        occurrences = await self.__getOccurrences(
-            connection = connection,
-            triviaId = triviaId,
-            triviaSource = triviaSource
-        )
-
-        newOccurrences = TriviaQuestionOccurrences(
-            occurrences = occurrences.occurrences + 1,
-            triviaId = triviaId,
-            triviaSource = triviaSource
-        )
+        try:
+            occurrences = await self.__getOccurrences(
+                connection = connection,
+                triviaId = triviaId,
+                triviaSource = triviaSource
+            )
 
-        await connection.execute(
-            '''
-                INSERT INTO triviaquestionoccurrences
-                VALUES ($1, $2, $3)
-                ON CONFLICT (triviaid, triviasource) DO UPDATE SET occurrences = EXCLUDED.occurrences
-            ''',
-            newOccurrences.occurrences, triviaId, triviaSource.toStr()
-        )
+            newOccurrences = TriviaQuestionOccurrences(
+                occurrences = occurrences.occurrences + 1,
+                triviaId = triviaId,
+                triviaSource = triviaSource
+            )
 
-        await connection.close()
+            await connection.execute(
+                '''
+                    INSERT INTO triviaquestionoccurrences
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (triviaid, triviasource) DO UPDATE SET occurrences = EXCLUDED.occurrences
+                ''',
+                newOccurrences.occurrences, triviaId, triviaSource.toStr()
+            )
+        finally:
+            await connection.close()
         return newOccurrences
 
     async def incrementOccurrencesFromQuestion(
@@ -153,32 +156,33 @@ class TriviaQuestionOccurrencesRepository(TriviaQuestionOccurrencesRepositoryInt
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviaquestionoccurrences (
-                            occurrences int DEFAULT 0 NOT NULL,
-                            triviaid text NOT NULL,
-                            triviasource text NOT NULL,
-                            PRIMARY KEY (triviaid, triviasource)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviaquestionoccurrences (
-                            occurrences INTEGER NOT NULL DEFAULT 0,
-                            triviaid TEXT NOT NULL,
-                            triviasource TEXT NOT NULL,
-                            PRIMARY KEY (triviaid, triviasource)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviaquestionoccurrences (
+                                occurrences int DEFAULT 0 NOT NULL,
+                                triviaid text NOT NULL,
+                                triviasource text NOT NULL,
+                                PRIMARY KEY (triviaid, triviasource)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviaquestionoccurrences (
+                                occurrences INTEGER NOT NULL DEFAULT 0,
+                                triviaid TEXT NOT NULL,
+                                triviasource TEXT NOT NULL,
+                                PRIMARY KEY (triviaid, triviasource)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
@@ -30,38 +30,39 @@ class TriviaScoreRepository(TriviaScoreRepositoryInterface):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT streak, supertriviawins, trivialosses, triviawins, twitchchannelid, userid FROM triviascores
-                WHERE twitchchannelid = $1 AND userid = $2
-                LIMIT 1
-            ''',
-            twitchChannelId, userId
-        )
 
-        if record is not None and len(record) >= 1:
-            result = TriviaScoreResult(
-                streak = record[0],
-                superTriviaWins = record[1],
-                triviaLosses = record[2],
-                triviaWins = record[3],
-                twitchChannel = record[4],
-                twitchChannelId = twitchChannelId,
-                userId = record[5]
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT streak, supertriviawins, trivialosses, triviawins, twitchchannelid, userid FROM triviascores
+                    WHERE twitchchannelid = $1 AND userid = $2
+                    LIMIT 1
+                ''',
+                twitchChannelId, userId
             )
 
-            await connection.close()
-            return result
-
-        await connection.execute(
-            '''
-                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannelid, userid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-            ''',
-            0, 0, 0, 0, twitchChannelId, userId
-        )
+            if record is not None and len(record) >= 1:
+                result = TriviaScoreResult(
+                    streak = record[0],
+                    superTriviaWins = record[1],
+                    triviaLosses = record[2],
+                    triviaWins = record[3],
+                    twitchChannel = record[4],
+                    twitchChannelId = twitchChannelId,
+                    userId = record[5]
+                )
 
-        await connection.close()
+                return result
+
+            await connection.execute(
+                '''
+                    INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannelid, userid)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                ''',
+                0, 0, 0, 0, twitchChannelId, userId
+            )
+        finally:
+            await connection.close()
 
         return TriviaScoreResult(
             streak = 0,
@@ -225,41 +226,42 @@ class TriviaScoreRepository(TriviaScoreRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviascores (
-                            streak integer DEFAULT 0 NOT NULL,
-                            supertriviawins integer DEFAULT 0 NOT NULL,
-                            trivialosses integer DEFAULT 0 NOT NULL,
-                            triviawins integer DEFAULT 0 NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviascores (
-                            streak INTEGER NOT NULL DEFAULT 0,
-                            supertriviawins INTEGER NOT NULL DEFAULT 0,
-                            trivialosses INTEGER NOT NULL DEFAULT 0,
-                            triviawins INTEGER NOT NULL DEFAULT 0,
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviascores (
+                                streak integer DEFAULT 0 NOT NULL,
+                                supertriviawins integer DEFAULT 0 NOT NULL,
+                                trivialosses integer DEFAULT 0 NOT NULL,
+                                triviawins integer DEFAULT 0 NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                userid text NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS triviascores (
+                                streak INTEGER NOT NULL DEFAULT 0,
+                                supertriviawins INTEGER NOT NULL DEFAULT 0,
+                                trivialosses INTEGER NOT NULL DEFAULT 0,
+                                triviawins INTEGER NOT NULL DEFAULT 0,
+                                twitchchannelid TEXT NOT NULL,
+                                userid TEXT NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def __updateTriviaScore(
         self,
@@ -295,13 +297,15 @@ class TriviaScoreRepository(TriviaScoreRepositoryInterface):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
         connection = await self.__backingDatabase.getConnection()
-        await connection.execute(
-            '''
-                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannelid, userid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                ON CONFLICT (twitchchannelid, userid) DO UPDATE SET streak = EXCLUDED.streak, supertriviawins = EXCLUDED.supertriviawins, triviaLosses = EXCLUDED.trivialosses, triviawins = EXCLUDED.triviawins
-            ''',
-            newStreak, newSuperTriviaWins, newTriviaLosses, newTriviaWins, twitchChannelId, userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannelid, userid)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    ON CONFLICT (twitchchannelid, userid) DO UPDATE SET streak = EXCLUDED.streak, supertriviawins = EXCLUDED.supertriviawins, triviaLosses = EXCLUDED.trivialosses, triviawins = EXCLUDED.triviawins
+                ''',
+                newStreak, newSuperTriviaWins, newTriviaLosses, newTriviaWins, twitchChannelId, userId
+            )
+        finally:
+            await connection.close()
@@ -40,23 +40,25 @@ class ShinyTriviaOccurencesRepository(ShinyTriviaOccurencesRepositoryInterface):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT count, mostrecent FROM shinytriviaoccurences
-                WHERE twitchchannelid = $1 AND userid = $2
-                LIMIT 1
-            ''',
-            twitchChannelId, userId
-        )
-
-        shinyCount = 0
-        mostRecent: datetime | None = None
 
-        if record is not None and len(record) >= 1:
-            shinyCount = record[0]
-            mostRecent = datetime.fromisoformat(record[1])
-
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT count, mostrecent FROM shinytriviaoccurences
+                    WHERE twitchchannelid = $1 AND userid = $2
+                    LIMIT 1
+                ''',
+                twitchChannelId, userId
+            )
+
+            shinyCount = 0
+            mostRecent: datetime | None = None
+
+            if record is not None and len(record) >= 1:
+                shinyCount = record[0]
+                mostRecent = datetime.fromisoformat(record[1])
+        finally:
+            await connection.close()
 
         return ShinyTriviaResult(
             mostRecent = mostRecent,
@@ -117,37 +119,38 @@ class ShinyTriviaOccurencesRepository(ShinyTriviaOccurencesRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
-                            count integer DEFAULT 0 NOT NULL,
-                            mostrecent text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
-                            count INTEGER NOT NULL DEFAULT 0,
-                            mostrecent TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
+                                count integer DEFAULT 0 NOT NULL,
+                                mostrecent text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                userid text NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
+                                count INTEGER NOT NULL DEFAULT 0,
+                                mostrecent TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                userid TEXT NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def __updateShinyCount(
         self,
@@ -170,13 +173,15 @@ class ShinyTriviaOccurencesRepository(ShinyTriviaOccurencesRepositoryInterface):
         nowDateTime = datetime.now(self.__timeZoneRepository.getDefault())
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO shinytriviaoccurences (count, mostrecent, twitchchannelid, userid)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (twitchchannelid, userid) DO UPDATE SET count = EXCLUDED.count, mostrecent = EXCLUDED.mostrecent
-            ''',
-            newShinyCount, nowDateTime.isoformat(), twitchChannelId, userId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO shinytriviaoccurences (count, mostrecent, twitchchannelid, userid)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (twitchchannelid, userid) DO UPDATE SET count = EXCLUDED.count, mostrecent = EXCLUDED.mostrecent
+                ''',
+                newShinyCount, nowDateTime.isoformat(), twitchChannelId, userId
+            )
+        finally:
+            await connection.close()
@@ -1,12 +1,8 @@
 import asyncio
-import queue
 import traceback
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 from typing import Any, Final
 
-from frozenlist import FrozenList
-
 from .actions.absTriviaAction import AbsTriviaAction
 from .actions.checkAnswerTriviaAction import CheckAnswerTriviaAction
 from .actions.checkSuperAnswerTriviaAction import CheckSuperAnswerTriviaAction
@@ -36,7 +32,6 @@ from .events.outOfTimeSuperTriviaEvent import OutOfTimeSuperTriviaEvent
 from .events.outOfTimeTriviaEvent import OutOfTimeTriviaEvent
 from .events.superGameNotReadyCheckAnswerTriviaEvent import SuperGameNotReadyCheckAnswerTriviaEvent
 from .events.wrongUserCheckAnswerTriviaEvent import WrongUserCheckAnswerTriviaEvent
-from .games.absTriviaGameState import AbsTriviaGameState
 from .games.queuedTriviaGameStoreInterface import QueuedTriviaGameStoreInterface
 from .games.superTriviaGameState import SuperTriviaGameState
 from .games.triviaGameState import TriviaGameState
@@ -61,6 +56,7 @@ from ..cuteness.cutenessRepositoryInterface import CutenessRepositoryInterface
 from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..misc.workQueue.workQueue import WorkQueue
 from ..timber.timberInterface import TimberInterface
 from ..twitch.tokens.twitchTokensRepositoryInterface import TwitchTokensRepositoryInterface
 from ..users.userIdsRepositoryInterface import UserIdsRepositoryInterface
@@ -89,7 +85,6 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         twitchTokensRepository: TwitchTokensRepositoryInterface,
         userIdsRepository: UserIdsRepositoryInterface,
         sleepTimeSeconds: float = 0.5,
-        queueTimeoutSeconds: int = 3,
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -131,10 +126,6 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             raise TypeError(f'sleepTimeSeconds argument is malformed: \"{sleepTimeSeconds}\"')
         elif sleepTimeSeconds < 0.25 or sleepTimeSeconds > 3:
             raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
-        elif not utils.isValidInt(queueTimeoutSeconds):
-            raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
-        elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
-            raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
 
         self.__backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = backgroundTaskHelper
         self.__cutenessRepository: Final[CutenessRepositoryInterface] = cutenessRepository
@@ -155,12 +146,11 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         self.__twitchTokensRepository: Final[TwitchTokensRepositoryInterface] = twitchTokensRepository
         self.__userIdsRepository: Final[UserIdsRepositoryInterface] = userIdsRepository
         self.__sleepTimeSeconds: Final[float] = sleepTimeSeconds
-        self.__queueTimeoutSeconds: Final[int] = queueTimeoutSeconds
 
         self.__isStarted: bool = False
         self.__eventListener: TriviaEventListener | None = None
-        self.__actionQueue: Final[SimpleQueue[AbsTriviaAction]] = SimpleQueue()
-        self.__eventQueue: Final[SimpleQueue[AbsTriviaEvent]] = SimpleQueue()
+        self.__actionQueue: Final[WorkQueue[AbsTriviaAction]] = WorkQueue(backgroundTaskHelper.eventLoop)
+        self.__eventQueue: Final[WorkQueue[AbsTriviaEvent]] = WorkQueue(backgroundTaskHelper.eventLoop)
 
     async def __applyToxicSuperTriviaPunishment(
         self,
@@ -657,6 +647,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         )
 
         await self.__triviaGameStore.add(state)
+        await self.__triviaAnswerChecker.prepareQuestion(triviaQuestion)
 
         await self.__submitEvent(NewTriviaGameEvent(
             triviaQuestion = triviaQuestion,
@@ -783,6 +774,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         )
 
         await self.__triviaGameStore.add(state)
+        await self.__triviaAnswerChecker.prepareQuestion(triviaQuestion)
 
         await self.__submitEvent(NewSuperTriviaGameEvent(
             triviaQuestion = triviaQuestion,
@@ -803,12 +795,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
 
     async def __removeDeadTriviaGames(self):
         now = datetime.now(self.__timeZoneRepository.getDefault())
-        gameStates = await self.__triviaGameStore.getAll()
-        gameStatesToRemove: list[AbsTriviaGameState] = list()
-
-        for state in gameStates:
-            if state.endTime < now:
-                gameStatesToRemove.append(state)
+        gameStatesToRemove = await self.__triviaGameStore.popExpiredGames(now)
 
         for state in gameStatesToRemove:
             if isinstance(state, TriviaGameState):
@@ -822,11 +809,6 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         if not isinstance(state, TriviaGameState):
             raise TypeError(f'state argument is malformed: \"{state}\"')
 
-        await self.__removeNormalTriviaGame(
-            twitchChannelId = state.getTwitchChannelId(),
-            userId = state.getUserId(),
-        )
-
         outOfTimeEmote = await self.__triviaTwitchEmoteHelper.getOutOfTimeEmote()
 
         triviaScoreResult = await self.__triviaScoreRepository.incrementTriviaLosses(
@@ -855,7 +837,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         if not isinstance(state, SuperTriviaGameState):
             raise TypeError(f'state argument is malformed: \"{state}\"')
 
-        await self.__removeSuperTriviaGame(
+        await self.__superTriviaCooldownHelper.update(
             twitchChannelId = state.getTwitchChannelId(),
         )
 
@@ -923,16 +905,11 @@ class TriviaGameMachine(TriviaGameMachineInterface):
 
     async def __startActionLoop(self):
         while True:
-            actions: FrozenList[AbsTriviaAction] = FrozenList()
-
-            try:
-                while not self.__actionQueue.empty():
-                    action = self.__actionQueue.get_nowait()
-                    actions.append(action)
-            except queue.Empty as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered queue.Empty when building up actions list (queue size: {self.__actionQueue.qsize()}) ({len(actions)=}) ({actions=}): {e}', e)
-
-            actions.freeze()
+            # wake up as soon as a new action arrives, but never wait any longer than our sleep
+            # time, as trivia games still need to be checked for being out of time
+            actions = await self.__actionQueue.getBatch(
+                timeoutSeconds = self.__sleepTimeSeconds,
+            )
 
             for index, action in enumerate(actions):
                 try:
@@ -945,30 +922,23 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             except Exception as e:
                 self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when refreshing status of trivia games: {e}', e, traceback.format_exc())
 
+    async def __startEventLoop(self):
+        while self.__eventListener is None:
             await asyncio.sleep(self.__sleepTimeSeconds)
 
-    async def __startEventLoop(self):
         while True:
+            events = await self.__eventQueue.getBatch()
             eventListener = self.__eventListener
 
-            if eventListener is not None:
-                events: FrozenList[AbsTriviaEvent] = FrozenList()
+            if eventListener is None:
+                self.__timber.log('TriviaGameMachine', f'Dropping events as there is no event listener ({len(events)=}) ({events=})')
+                continue
 
+            for index, event in enumerate(events):
                 try:
-                    while not self.__eventQueue.empty():
-                        events.append(self.__eventQueue.get_nowait())
-                except queue.Empty as e:
-                    self.__timber.log('TriviaGameMachine', f'Encountered queue.Empty when building up events list (queue size: {self.__eventQueue.qsize()}) ({len(events)=}) ({events=}): {e}', e, traceback.format_exc())
-
-                events.freeze()
-
-                for index, event in enumerate(events):
-                    try:
-                        await eventListener.onNewTriviaEvent(event)
-                    except Exception as e:
-                        self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through events (queue size: {self.__eventQueue.qsize()}) ({len(events)=}) ({index=}) ({event=}): {e}', e, traceback.format_exc())
-
-            await asyncio.sleep(self.__sleepTimeSeconds)
+                    await eventListener.onNewTriviaEvent(event)
+                except Exception as e:
+                    self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through events (queue size: {self.__eventQueue.qsize()}) ({len(events)=}) ({index=}) ({event=}): {e}', e, traceback.format_exc())
 
     def startMachine(self):
         if self.__isStarted:
@@ -984,16 +954,10 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         if not isinstance(action, AbsTriviaAction):
             raise TypeError(f'action argument is malformed: \"{action}\"')
 
-        try:
-            self.__actionQueue.put(action, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TriviaGameMachine', f'Encountered queue.Full when submitting a new action ({action}) into the action queue (queue size: {self.__actionQueue.qsize()}): {e}', e, traceback.format_exc())
+        self.__actionQueue.put(action)
 
     async def __submitEvent(self, event: AbsTriviaEvent):
         if not isinstance(event, AbsTriviaEvent):
             raise TypeError(f'event argument is malformed: \"{event}\"')
 
-        try:
-            self.__eventQueue.put(event, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TriviaGameMachine', f'Encountered queue.Full when submitting a new event ({event}) into the event queue (queue size: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+        self.__eventQueue.put(event)
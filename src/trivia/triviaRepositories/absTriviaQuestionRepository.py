@@ -65,6 +65,11 @@ class AbsTriviaQuestionRepository(TriviaQuestionRepositoryInterface, ABC):
 
         return filteredMultipleChoiceResponses
 
+    async def close(self):
+        # this method is intentionally empty, as most repositories don't hold onto anything
+        # that needs to be released
+        pass
+
     async def _verifyIsActuallyMultipleChoiceQuestion(
         self,
         correctAnswers: list[str],
@@ -29,6 +29,7 @@ from ..triviaExceptions import (BadTriviaTypeException,
                                 UnsupportedTriviaTypeException)
 from ..triviaFetchOptions import TriviaFetchOptions
 from ...misc import utils as utils
+from ...storage.sqlite.sqliteRandomRowSampler import SqliteRandomRowSampler
 from ...timber.timberInterface import TimberInterface
 from ...twitch.twitchHandleProviderInterface import TwitchHandleProviderInterface
 from ...users.userIdsRepositoryInterface import UserIdsRepositoryInterface
@@ -85,6 +86,35 @@ class GlacialTriviaQuestionRepository(
         self.__hasQuestionSetAvailable: bool | None = None
         self.__twitchChannelId: str | None = None
 
+        self.__anyQuestionSampler: Final[SqliteRandomRowSampler] = SqliteRandomRowSampler(
+            databaseFile = triviaDatabaseFile,
+            tableName = 'glacialQuestions',
+        )
+
+        self.__multipleChoiceOrTrueFalseSampler: Final[SqliteRandomRowSampler] = SqliteRandomRowSampler(
+            databaseFile = triviaDatabaseFile,
+            tableName = 'glacialQuestions',
+            whereClause = 'triviaType = $1 OR triviaType = $2',
+            whereParameters = ( TriviaQuestionType.MULTIPLE_CHOICE.toStr(), TriviaQuestionType.TRUE_FALSE.toStr(), ),
+        )
+
+        self.__questionAnswerSampler: Final[SqliteRandomRowSampler] = SqliteRandomRowSampler(
+            databaseFile = triviaDatabaseFile,
+            tableName = 'glacialQuestions',
+            whereClause = 'triviaType = $1',
+            whereParameters = ( TriviaQuestionType.QUESTION_ANSWER.toStr(), ),
+        )
+
+    def __addRowIdToSamplers(self, rowId: int, triviaType: TriviaQuestionType):
+        self.__anyQuestionSampler.addRowId(rowId)
+
+        match triviaType:
+            case TriviaQuestionType.MULTIPLE_CHOICE | TriviaQuestionType.TRUE_FALSE:
+                self.__multipleChoiceOrTrueFalseSampler.addRowId(rowId)
+
+            case TriviaQuestionType.QUESTION_ANSWER:
+                self.__questionAnswerSampler.addRowId(rowId)
+
     async def __buildCompiledCorrectAnswersForQuestionAnswerTrivia(
         self,
         correctAnswers: list[str],
@@ -118,6 +148,11 @@ class GlacialTriviaQuestionRepository(
 
         return row is not None and len(row) >= 1 and utils.isValidInt(row[0]) and row[0] == 1
 
+    async def close(self):
+        await self.__anyQuestionSampler.close()
+        await self.__multipleChoiceOrTrueFalseSampler.close()
+        await self.__questionAnswerSampler.close()
+
     async def __createTablesIfNotExists(self, connection: Connection):
         if self.__areTablesCreated:
             return
@@ -172,7 +207,7 @@ class GlacialTriviaQuestionRepository(
         if not isinstance(fetchOptions, TriviaFetchOptions):
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
+        connection = await self.__questionAnswerSampler.getConnection()
         cursor = await connection.execute(
             '''
                 SELECT category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId FROM glacialQuestions
@@ -185,7 +220,6 @@ class GlacialTriviaQuestionRepository(
         await cursor.close()
 
         if rows is None or sum(1 for _ in rows) == 0:
-            await connection.close()
             self.__timber.log('GlacialTriviaQuestionRepository', f'Unable to find any {TriviaQuestionType.QUESTION_ANSWER} questions in the database! ({fetchOptions=})')
             return None
 
@@ -223,7 +257,6 @@ class GlacialTriviaQuestionRepository(
                 triviaSource = self.triviaSource,
             ))
 
-        await connection.close()
         questions.freeze()
 
         return questions
@@ -235,23 +268,15 @@ class GlacialTriviaQuestionRepository(
         if not isinstance(fetchOptions, TriviaFetchOptions):
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId, triviaType FROM glacialQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
+        row = await self.__anyQuestionSampler.fetchRandomRow(
+            columns = ( 'category', 'categoryId', 'originalTriviaSource', 'question', 'triviaDifficulty', 'triviaId', 'triviaType', ),
         )
 
-        row = await cursor.fetchone()
-        await cursor.close()
-
         if row is None or len(row) == 0:
-            await connection.close()
             self.__timber.log('GlacialTriviaQuestionRepository', f'Unable to find any trivia question in the database! ({fetchOptions=})')
             return None
 
+        connection = await self.__anyQuestionSampler.getConnection()
         category = await self.__triviaQuestionCompiler.compileCategory(row[0])
         categoryId: str | None = row[1]
         originalTriviaSource = await self.__triviaSourceParser.parse(row[2])
@@ -277,8 +302,6 @@ class GlacialTriviaQuestionRepository(
                     originalTriviaSource = originalTriviaSource,
                 )
 
-                await connection.close()
-
                 return MultipleChoiceTriviaQuestion(
                     correctAnswers = correctAnswers,
                     multipleChoiceResponses = multipleChoiceResponses,
@@ -292,7 +315,6 @@ class GlacialTriviaQuestionRepository(
                 )
 
             case TriviaQuestionType.QUESTION_ANSWER:
-                await connection.close()
                 compiledCorrectAnswers = await self.__buildCompiledCorrectAnswersForQuestionAnswerTrivia(originalCorrectAnswers)
 
                 return QuestionAnswerTriviaQuestion(
@@ -310,8 +332,6 @@ class GlacialTriviaQuestionRepository(
                 )
 
             case TriviaQuestionType.TRUE_FALSE:
-                await connection.close()
-
                 return TrueFalseTriviaQuestion(
                     correctAnswer = utils.strictStrToBool(originalCorrectAnswers[0]),
                     category = category,
@@ -335,25 +355,15 @@ class GlacialTriviaQuestionRepository(
         if not isinstance(fetchOptions, TriviaFetchOptions):
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId, triviaType FROM glacialQuestions
-                WHERE triviaType = $1 OR triviaType = $2
-                ORDER BY RANDOM()
-                LIMIT 1
-            ''',
-            (TriviaQuestionType.MULTIPLE_CHOICE.toStr(), TriviaQuestionType.TRUE_FALSE.toStr(), )
+        row = await self.__multipleChoiceOrTrueFalseSampler.fetchRandomRow(
+            columns = ( 'category', 'categoryId', 'originalTriviaSource', 'question', 'triviaDifficulty', 'triviaId', 'triviaType', ),
         )
 
-        row = await cursor.fetchone()
-        await cursor.close()
-
         if row is None or len(row) == 0:
-            await connection.close()
             self.__timber.log('GlacialTriviaQuestionRepository', f'Unable to find any {TriviaQuestionType.MULTIPLE_CHOICE} or {TriviaQuestionType.TRUE_FALSE} question in the database! ({fetchOptions=})')
             return None
 
+        connection = await self.__multipleChoiceOrTrueFalseSampler.getConnection()
         category = await self.__triviaQuestionCompiler.compileCategory(row[0])
         categoryId: str | None = row[1]
         originalTriviaSource = await self.__triviaSourceParser.parse(row[2])
@@ -377,8 +387,6 @@ class GlacialTriviaQuestionRepository(
                     originalTriviaSource = originalTriviaSource,
                 )
 
-                await connection.close()
-
                 return MultipleChoiceTriviaQuestion(
                     correctAnswers = originalCorrectAnswers,
                     multipleChoiceResponses = multipleChoiceResponses,
@@ -392,8 +400,6 @@ class GlacialTriviaQuestionRepository(
                 )
 
             case TriviaQuestionType.TRUE_FALSE:
-                await connection.close()
-
                 return TrueFalseTriviaQuestion(
                     correctAnswer = utils.strictStrToBool(originalCorrectAnswers[0]),
                     category = category,
@@ -406,7 +412,6 @@ class GlacialTriviaQuestionRepository(
                 )
 
             case _:
-                await connection.close()
                 exception = UnsupportedTriviaTypeException(f'Received an invalid trivia question type! ({triviaType=}) ({fetchOptions=}) ({row=})')
                 self.__timber.log('GlacialTriviaQuestionRepository', f'Received an invalid trivia question type when fetching a multiple choice or true false trivia question ({triviaType=}) ({fetchOptions=}) ({row=}): {exception}', exception, traceback.format_exc())
                 raise exception
@@ -418,25 +423,15 @@ class GlacialTriviaQuestionRepository(
         if not isinstance(fetchOptions, TriviaFetchOptions):
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId FROM glacialQuestions
-                WHERE triviaType = $1
-                ORDER BY RANDOM()
-                LIMIT 1
-            ''',
-            (TriviaQuestionType.QUESTION_ANSWER.toStr(), )
+        row = await self.__questionAnswerSampler.fetchRandomRow(
+            columns = ( 'category', 'categoryId', 'originalTriviaSource', 'question', 'triviaDifficulty', 'triviaId', ),
         )
 
-        row = await cursor.fetchone()
-        await cursor.close()
-
         if row is None or len(row) == 0:
-            await connection.close()
             self.__timber.log('GlacialTriviaQuestionRepository', f'Unable to find any {TriviaQuestionType.QUESTION_ANSWER} question in the database! ({fetchOptions=})')
             return None
 
+        connection = await self.__questionAnswerSampler.getConnection()
         category = await self.__triviaQuestionCompiler.compileCategory(row[0])
         categoryId: str | None = row[1]
         originalTriviaSource = await self.__triviaSourceParser.parse(row[2])
@@ -451,8 +446,6 @@ class GlacialTriviaQuestionRepository(
             originalTriviaSource = originalTriviaSource,
         )
 
-        await connection.close()
-
         correctAnswers = await self.__triviaQuestionCompiler.compileResponses(originalCorrectAnswers)
         compiledCorrectAnswers = await self.__buildCompiledCorrectAnswersForQuestionAnswerTrivia(originalCorrectAnswers)
 
@@ -532,7 +525,6 @@ class GlacialTriviaQuestionRepository(
                 correctAnswersSet.add(row[0])
 
         if len(correctAnswersSet) == 0:
-            await connection.close()
             exception = NoTriviaCorrectAnswersException(f'No trivia answers found! ({triviaId=}) ({originalTriviaSource=})')
             self.__timber.log('GlacialTriviaQuestionRepository', f'Unable to find any trivia answers for {triviaId=} and {originalTriviaSource=}: {exception}', exception, traceback.format_exc())
             raise exception
@@ -572,7 +564,6 @@ class GlacialTriviaQuestionRepository(
                 multipleChoiceResponses.add(row[0])
 
         if len(multipleChoiceResponses) == 0:
-            await connection.close()
             exception = NoTriviaMultipleChoiceResponsesException(f'No trivia responses found! ({triviaId=}) ({originalTriviaSource=})')
             self.__timber.log('GlacialTriviaQuestionRepository', f'Unable to find any trivia responses for {triviaId=} and {originalTriviaSource=}: {exception}', exception, traceback.format_exc())
             raise exception
@@ -620,6 +611,11 @@ class GlacialTriviaQuestionRepository(
         self.__hasQuestionSetAvailable = hasQuestionSetAvailable
         return hasQuestionSetAvailable
 
+    def __removeRowIdFromSamplers(self, rowId: int):
+        self.__anyQuestionSampler.removeRowId(rowId)
+        self.__multipleChoiceOrTrueFalseSampler.removeRowId(rowId)
+        self.__questionAnswerSampler.removeRowId(rowId)
+
     async def remove(
         self,
         triviaId: str,
@@ -632,6 +628,16 @@ class GlacialTriviaQuestionRepository(
 
         connection = await aiosqlite.connect(self.__triviaDatabaseFile)
 
+        cursor = await connection.execute(
+            '''
+                SELECT rowid FROM glacialQuestions
+                WHERE originalTriviaSource = $1 AND triviaId = $2
+            ''',
+            (originalTriviaSource.toStr(), triviaId, ),
+        )
+        rows = await cursor.fetchall()
+        await cursor.close()
+
         cursor = await connection.execute(
             '''
                 DELETE FROM glacialAnswers
@@ -661,6 +667,12 @@ class GlacialTriviaQuestionRepository(
 
         await connection.commit()
         await connection.close()
+
+        # the samplers cache which rows exist, so drop the removed rows from them rather than
+        # having them rescan the whole table
+        for row in rows:
+            self.__removeRowIdFromSamplers(row[0])
+
         self.__timber.log('GlacialTriviaQuestionRepository', f'Removed trivia question ({triviaId=}) ({originalTriviaSource=})')
 
     async def store(self, question: AbsTriviaQuestion) -> bool:
@@ -683,7 +695,7 @@ class GlacialTriviaQuestionRepository(
             self.__timber.log('GlacialTriviaQuestionRepository', f'The given question already exists in the glacial trivia question database ({question=})')
             return False
 
-        await self.__storeBaseTriviaQuestionData(
+        rowId = await self.__storeBaseTriviaQuestionData(
             question = question,
             connection = connection,
         )
@@ -712,6 +724,7 @@ class GlacialTriviaQuestionRepository(
         await connection.commit()
         await connection.close()
         self.__hasQuestionSetAvailable = None
+        self.__addRowIdToSamplers(rowId, question.triviaType)
         self.__timber.log('GlacialTriviaQuestionRepository', f'Added a new question into the glacial trivia question database ({question=})')
         return True
 
@@ -719,13 +732,13 @@ class GlacialTriviaQuestionRepository(
         self,
         question: AbsTriviaQuestion,
         connection: Connection,
-    ):
+    ) -> int:
         if not isinstance(question, AbsTriviaQuestion):
             raise TypeError(f'question argument is malformed: \"{question}\"')
         elif not isinstance(connection, Connection):
             raise TypeError(f'connection argument is malformed: \"{connection}\"')
 
-        await connection.execute_insert(
+        row = await connection.execute_insert(
             '''
                 INSERT INTO glacialQuestions (category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId, triviaType)
                 VALUES ($1, $2, $3, $4, $5, $6, $7)
@@ -733,6 +746,11 @@ class GlacialTriviaQuestionRepository(
             (question.category, question.categoryId, question.triviaSource.toStr(), question.question, question.triviaDifficulty.toStr(), question.triviaId, question.triviaType.toStr(), ),
         )
 
+        if row is None or not utils.isValidInt(row[0]):
+            raise RuntimeError(f'Failed to retrieve the rowid of the newly stored glacial trivia question ({question=}) ({row=})')
+
+        return row[0]
+
     async def __storeMultipleChoiceTriviaQuestion(
         self,
         connection: Connection,
@@ -4,7 +4,6 @@ from typing import Final
 import aiofiles
 import aiofiles.os
 import aiofiles.ospath
-import aiosqlite
 from frozenlist import FrozenList
 
 from .exceptions import (NoTriviaAnswersException,
@@ -13,6 +12,7 @@ from .exceptions import (NoTriviaAnswersException,
 from .lotrDatabaseQuestionStorageInterface import LotrDatabaseQuestionStorageInterface
 from .lotrTriviaQuestion import LotrTriviaQuestion
 from ....misc import utils as utils
+from ....storage.sqlite.sqliteRandomRowSampler import SqliteRandomRowSampler
 from ....timber.timberInterface import TimberInterface
 
 
@@ -32,6 +32,10 @@ class LotrDatabaseQuestionStorage(LotrDatabaseQuestionStorageInterface):
         self.__databaseFile: Final[str] = databaseFile
 
         self.__hasQuestionSetAvailable: bool | None = None
+        self.__sampler: Final[SqliteRandomRowSampler] = SqliteRandomRowSampler(
+            databaseFile = databaseFile,
+            tableName = 'lotrQuestions',
+        )
 
     async def __buildAnswersList(
         self,
@@ -67,23 +71,19 @@ class LotrDatabaseQuestionStorage(LotrDatabaseQuestionStorageInterface):
 
         return frozenAnswers
 
+    async def close(self):
+        await self.__sampler.close()
+
     async def fetchTriviaQuestion(self) -> LotrTriviaQuestion:
         if not await aiofiles.ospath.exists(self.__databaseFile):
             raise TriviaDatabaseFileDoesNotExistException(f'LOTR database question file not found: \"{self.__databaseFile}\"')
 
         self.__timber.log('LotrDatabaseQuestionStorage', f'Fetching trivia question...')
 
-        connection = await aiosqlite.connect(self.__databaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT answerA, answerB, answerC, answerD, category, question, triviaId FROM lotrQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            ''',
+        row = await self.__sampler.fetchRandomRow(
+            columns = ( 'answerA', 'answerB', 'answerC', 'answerD', 'category', 'question', 'triviaId', ),
         )
 
-        row = await cursor.fetchone()
-
         if row is None or len(row) != 7:
             raise NoTriviaQuestionsAvailableException(f'Unable to fetch trivia question data from LOTR! ({self.__databaseFile=}) ({row=})')
 
@@ -95,9 +95,6 @@ class LotrDatabaseQuestionStorage(LotrDatabaseQuestionStorageInterface):
         question: str = row[5]
         triviaId: str = row[6]
 
-        await cursor.close()
-        await connection.close()
-
         answers = await self.__buildAnswersList(
             answerA = answerA,
             answerB = answerB,
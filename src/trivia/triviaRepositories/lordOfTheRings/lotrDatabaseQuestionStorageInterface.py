@@ -5,6 +5,10 @@ from .lotrTriviaQuestion import LotrTriviaQuestion
 
 class LotrDatabaseQuestionStorageInterface(ABC):
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @abstractmethod
     async def fetchTriviaQuestion(self) -> LotrTriviaQuestion:
         pass
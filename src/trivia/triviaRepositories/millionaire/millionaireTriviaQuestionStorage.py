@@ -3,7 +3,6 @@ import traceback
 import aiofiles
 import aiofiles.os
 import aiofiles.ospath
-import aiosqlite
 from frozenlist import FrozenList
 
 from .exceptions import NoTriviaIncorrectAnswersException, NoTriviaQuestionsAvailableException, \
@@ -11,6 +10,7 @@ from .exceptions import NoTriviaIncorrectAnswersException, NoTriviaQuestionsAvai
 from .millionaireTriviaQuestion import MillionaireTriviaQuestion
 from .millionaireTriviaQuestionStorageInterface import MillionaireTriviaQuestionStorageInterface
 from ....misc import utils as utils
+from ....storage.sqlite.sqliteRandomRowSampler import SqliteRandomRowSampler
 from ....timber.timberInterface import TimberInterface
 
 
@@ -30,6 +30,10 @@ class MillionaireTriviaQuestionStorage(MillionaireTriviaQuestionStorageInterface
         self.__databaseFile: str = databaseFile
 
         self.__hasQuestionSetAvailable: bool | None = None
+        self.__sampler: SqliteRandomRowSampler = SqliteRandomRowSampler(
+            databaseFile = databaseFile,
+            tableName = 'millionaireQuestions',
+        )
 
     async def __buildIncorrectAnswersList(
         self,
@@ -62,29 +66,22 @@ class MillionaireTriviaQuestionStorage(MillionaireTriviaQuestionStorageInterface
 
         return frozenIncorrectAnswers
 
+    async def close(self):
+        await self.__sampler.close()
+
     async def fetchTriviaQuestion(self) -> MillionaireTriviaQuestion:
         if not await aiofiles.ospath.exists(self.__databaseFile):
             raise TriviaDatabaseFileDoesNotExistException(f'Millionaire database file not found: \"{self.__databaseFile}\"')
 
         self.__timber.log('MillionaireQuestionStorage', f'Fetching trivia question...')
 
-        connection = await aiosqlite.connect(self.__databaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT answer, question, responseA, responseB, responseC, responseD, triviaId FROM millionaireQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
+        row = await self.__sampler.fetchRandomRow(
+            columns = ( 'answer', 'question', 'responseA', 'responseB', 'responseC', 'responseD', 'triviaId', ),
         )
 
-        row = await cursor.fetchone()
-
         if row is None or len(row) == 0:
             raise NoTriviaQuestionsAvailableException(f'Unable to fetch trivia question data from Millionaire! ({self.__databaseFile=}) ({row=})')
 
-        await cursor.close()
-        await connection.close()
-
         correctAnswer: str = row[0]
         question: str = row[1]
         incorrectAnswer0: str | None = row[2]
@@ -5,6 +5,10 @@ from .millionaireTriviaQuestion import MillionaireTriviaQuestion
 
 class MillionaireTriviaQuestionStorageInterface(ABC):
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @abstractmethod
     async def fetchTriviaQuestion(self) -> MillionaireTriviaQuestion:
         pass
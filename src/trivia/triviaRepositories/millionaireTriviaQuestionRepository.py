@@ -30,6 +30,9 @@ class MillionaireTriviaQuestionRepository(AbsTriviaQuestionRepository):
         self.__millionaireTriviaQuestionStorage: MillionaireTriviaQuestionStorageInterface = millionaireTriviaQuestionStorage
         self.__triviaQuestionCompiler: TriviaQuestionCompilerInterface = triviaQuestionCompiler
 
+    async def close(self):
+        await self.__millionaireTriviaQuestionStorage.close()
+
     async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
         if not isinstance(fetchOptions, TriviaFetchOptions):
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
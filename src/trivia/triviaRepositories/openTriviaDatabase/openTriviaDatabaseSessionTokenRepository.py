@@ -36,16 +36,18 @@ class OpenTriviaDatabaseSessionTokenRepository(OpenTriviaDatabaseSessionTokenRep
             return self.__cache.get(twitchChannelId, None)
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT sessiontoken FROM opentriviadatabasesessiontokens
-                WHERE twitchchannelid = $1
-                LIMIT 1
-            ''',
-            twitchChannelId
-        )
-
-        await connection.close()
+
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT sessiontoken FROM opentriviadatabasesessiontokens
+                    WHERE twitchchannelid = $1
+                    LIMIT 1
+                ''',
+                twitchChannelId
+            )
+        finally:
+            await connection.close()
         sessionToken: str | None = None
 
         if record is not None and len(record) >= 1:
@@ -65,46 +67,49 @@ class OpenTriviaDatabaseSessionTokenRepository(OpenTriviaDatabaseSessionTokenRep
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
-                            sessiontoken text DEFAULT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
-                            sessiontoken TEXT DEFAULT NULL,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
+                                sessiontoken text DEFAULT NULL,
+                                twitchchannelid text NOT NULL PRIMARY KEY
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
+                                sessiontoken TEXT DEFAULT NULL,
+                                twitchchannelid TEXT NOT NULL PRIMARY KEY
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def remove(self, twitchChannelId: str):
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM opentriviadatabasesessiontokens
-                WHERE twitchchannelid = $1
-            ''',
-            twitchChannelId
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM opentriviadatabasesessiontokens
+                    WHERE twitchchannelid = $1
+                ''',
+                twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__cache.pop(twitchChannelId, None)
         self.__timber.log('OpenTriviaDatabaseSessionTokenRepository', f'Session token for \"{twitchChannelId}\" has been removed')
 
@@ -115,16 +120,18 @@ class OpenTriviaDatabaseSessionTokenRepository(OpenTriviaDatabaseSessionTokenRep
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO opentriviadatabasesessiontokens (sessiontoken, twitchchannelid)
-                VALUES ($1, $2)
-                ON CONFLICT (twitchchannelid) DO UPDATE SET sessiontoken = EXCLUDED.sessiontoken
-            ''',
-            sessionToken, twitchChannelId
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO opentriviadatabasesessiontokens (sessiontoken, twitchchannelid)
+                    VALUES ($1, $2)
+                    ON CONFLICT (twitchchannelid) DO UPDATE SET sessiontoken = EXCLUDED.sessiontoken
+                ''',
+                sessionToken, twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__cache[twitchChannelId] = sessionToken
         self.__timber.log('OpenTriviaDatabaseSessionTokenRepository', f'Session token for \"{twitchChannelId}\" has been set to \"{sessionToken}\"')
 
@@ -3,7 +3,6 @@ import traceback
 import aiofiles
 import aiofiles.os
 import aiofiles.ospath
-import aiosqlite
 from frozenlist import FrozenList
 
 from .booleanOpenTriviaQaTriviaQuestion import BooleanOpenTriviaQaTriviaQuestion
@@ -16,6 +15,7 @@ from .openTriviaQaQuestionTypeParserInterface import OpenTriviaQaQuestionTypePar
 from .openTriviaQaTriviaQuestion import OpenTriviaQaTriviaQuestion
 from ...triviaExceptions import UnsupportedTriviaTypeException
 from ....misc import utils as utils
+from ....storage.sqlite.sqliteRandomRowSampler import SqliteRandomRowSampler
 from ....timber.timberInterface import TimberInterface
 
 
@@ -39,6 +39,10 @@ class OpenTriviaQaQuestionStorage(OpenTriviaQaQuestionStorageInterface):
         self.__databaseFile: str = databaseFile
 
         self.__hasQuestionSetAvailable: bool | None = None
+        self.__sampler: SqliteRandomRowSampler = SqliteRandomRowSampler(
+            databaseFile = databaseFile,
+            tableName = 'triviaQuestions',
+        )
 
     async def __buildIncorrectAnswersList(
         self,
@@ -70,23 +74,19 @@ class OpenTriviaQaQuestionStorage(OpenTriviaQaQuestionStorageInterface):
 
         return frozenIncorrectAnswers
 
+    async def close(self):
+        await self.__sampler.close()
+
     async def fetchTriviaQuestion(self) -> OpenTriviaQaTriviaQuestion:
         if not await aiofiles.ospath.exists(self.__databaseFile):
             raise TriviaDatabaseFileDoesNotExistException(f'Open Trivia QA database file not found: \"{self.__databaseFile}\"')
 
         self.__timber.log('OpenTriviaQaQuestionStorage', f'Fetching trivia question...')
 
-        connection = await aiosqlite.connect(self.__databaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT correctAnswer, newCategory, question, questionId, questionType, response1, response2, response3, response4 FROM triviaQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
+        row = await self.__sampler.fetchRandomRow(
+            columns = ( 'correctAnswer', 'newCategory', 'question', 'questionId', 'questionType', 'response1', 'response2', 'response3', 'response4', ),
         )
 
-        row = await cursor.fetchone()
-
         if row is None or len(row) == 0:
             raise NoTriviaQuestionsAvailableException(f'Unable to fetch trivia question data from Open Trivia QA! ({self.__databaseFile=}) ({row=})')
 
@@ -99,9 +99,6 @@ class OpenTriviaQaQuestionStorage(OpenTriviaQaQuestionStorageInterface):
         incorrectAnswer1: str | None = row[6]
         incorrectAnswer2: str | None = row[7]
 
-        await cursor.close()
-        await connection.close()
-
         match questionType:
             case OpenTriviaQaQuestionType.BOOLEAN:
                 return BooleanOpenTriviaQaTriviaQuestion(
@@ -5,6 +5,10 @@ from .openTriviaQaTriviaQuestion import OpenTriviaQaTriviaQuestion
 
 class OpenTriviaQaQuestionStorageInterface(ABC):
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @abstractmethod
     async def fetchTriviaQuestion(self) -> OpenTriviaQaTriviaQuestion:
         pass
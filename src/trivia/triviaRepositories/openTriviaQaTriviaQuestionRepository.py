@@ -34,6 +34,9 @@ class OpenTriviaQaTriviaQuestionRepository(AbsTriviaQuestionRepository):
         self.__openTriviaQaQuestionStorage: OpenTriviaQaQuestionStorageInterface = openTriviaQaQuestionStorage
         self.__triviaQuestionCompiler: TriviaQuestionCompilerInterface = triviaQuestionCompiler
 
+    async def close(self):
+        await self.__openTriviaQaQuestionStorage.close()
+
     async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
         if not isinstance(fetchOptions, TriviaFetchOptions):
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
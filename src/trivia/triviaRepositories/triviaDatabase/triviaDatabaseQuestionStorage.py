@@ -3,7 +3,6 @@ import traceback
 import aiofiles
 import aiofiles.os
 import aiofiles.ospath
-import aiosqlite
 from frozenlist import FrozenList
 
 from .booleanTriviaDatabaseTriviaQuestion import BooleanTriviaDatabaseTriviaQuestion
@@ -18,6 +17,7 @@ from ...misc.triviaQuestionTypeParserInterface import TriviaQuestionTypeParserIn
 from ...questions.triviaQuestionType import TriviaQuestionType
 from ...triviaExceptions import UnsupportedTriviaTypeException
 from ....misc import utils as utils
+from ....storage.sqlite.sqliteRandomRowSampler import SqliteRandomRowSampler
 from ....timber.timberInterface import TimberInterface
 
 
@@ -45,6 +45,10 @@ class TriviaDatabaseQuestionStorage(TriviaDatabaseQuestionStorageInterface):
         self.__databaseFile: str = databaseFile
 
         self.__hasQuestionSetAvailable: bool | None = None
+        self.__sampler: SqliteRandomRowSampler = SqliteRandomRowSampler(
+            databaseFile = databaseFile,
+            tableName = 'tdQuestions',
+        )
 
     async def __buildIncorrectAnswersList(
         self,
@@ -76,23 +80,19 @@ class TriviaDatabaseQuestionStorage(TriviaDatabaseQuestionStorageInterface):
 
         return frozenIncorrectAnswers
 
+    async def close(self):
+        await self.__sampler.close()
+
     async def fetchTriviaQuestion(self) -> TriviaDatabaseTriviaQuestion:
         if not await aiofiles.ospath.exists(self.__databaseFile):
             raise TriviaDatabaseFileDoesNotExistException(f'Trivia Database database file not found: \"{self.__databaseFile}\"')
 
         self.__timber.log('TriviaDatabaseQuestionStorage', f'Fetching trivia question...')
 
-        connection = await aiosqlite.connect(self.__databaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, correctAnswer, difficulty, question, questionId, triviaType, wrongAnswer1, wrongAnswer2, wrongAnswer3 FROM tdQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
+        row = await self.__sampler.fetchRandomRow(
+            columns = ( 'category', 'correctAnswer', 'difficulty', 'question', 'questionId', 'triviaType', 'wrongAnswer1', 'wrongAnswer2', 'wrongAnswer3', ),
         )
 
-        row = await cursor.fetchone()
-
         if row is None or len(row) != 9:
             raise NoTriviaQuestionsAvailableException(f'Unable to fetch trivia question data from Trivia Database! ({self.__databaseFile=}) ({row=})')
 
@@ -106,9 +106,6 @@ class TriviaDatabaseQuestionStorage(TriviaDatabaseQuestionStorageInterface):
         incorrectAnswer1: str | None = row[7]
         incorrectAnswer2: str | None = row[8]
 
-        await cursor.close()
-        await connection.close()
-
         match triviaType:
             case TriviaQuestionType.MULTIPLE_CHOICE:
                 incorrectAnswers = await self.__buildIncorrectAnswersList(
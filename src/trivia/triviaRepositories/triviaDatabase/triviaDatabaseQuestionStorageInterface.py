@@ -5,6 +5,10 @@ from .triviaDatabaseTriviaQuestion import TriviaDatabaseTriviaQuestion
 
 class TriviaDatabaseQuestionStorageInterface(ABC):
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @abstractmethod
     async def fetchTriviaQuestion(self) -> TriviaDatabaseTriviaQuestion:
         pass
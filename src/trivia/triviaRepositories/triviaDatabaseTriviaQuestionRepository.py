@@ -33,6 +33,9 @@ class TriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository):
         self.__triviaDatabaseQuestionStorage: TriviaDatabaseQuestionStorageInterface = triviaDatabaseQuestionStorage
         self.__triviaQuestionCompiler: TriviaQuestionCompilerInterface = triviaQuestionCompiler
 
+    async def close(self):
+        await self.__triviaDatabaseQuestionStorage.close()
+
     async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
         if not isinstance(fetchOptions, TriviaFetchOptions):
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
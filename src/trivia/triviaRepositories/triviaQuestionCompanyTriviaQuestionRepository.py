@@ -2,7 +2,6 @@ from typing import Any
 
 import aiofiles
 import aiofiles.ospath
-import aiosqlite
 
 from .absTriviaQuestionRepository import AbsTriviaQuestionRepository
 from ..compilers.triviaQuestionCompilerInterface import TriviaQuestionCompilerInterface
@@ -15,6 +14,7 @@ from ..triviaDifficulty import TriviaDifficulty
 from ..triviaExceptions import UnsupportedTriviaTypeException
 from ..triviaFetchOptions import TriviaFetchOptions
 from ...misc import utils as utils
+from ...storage.sqlite.sqliteRandomRowSampler import SqliteRandomRowSampler
 from ...timber.timberInterface import TimberInterface
 
 
@@ -43,6 +43,13 @@ class TriviaQuestionCompanyTriviaQuestionRepository(AbsTriviaQuestionRepository)
         self.__triviaDatabaseFile: str = triviaDatabaseFile
 
         self.__hasQuestionSetAvailable: bool | None = None
+        self.__sampler: SqliteRandomRowSampler = SqliteRandomRowSampler(
+            databaseFile = triviaDatabaseFile,
+            tableName = 'tqcQuestions',
+        )
+
+    async def close(self):
+        await self.__sampler.close()
 
     async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
         if not isinstance(fetchOptions, TriviaFetchOptions):
@@ -94,16 +101,10 @@ class TriviaQuestionCompanyTriviaQuestionRepository(AbsTriviaQuestionRepository)
         if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
             raise FileNotFoundError(f'Trivia Question Company trivia database file not found: \"{self.__triviaDatabaseFile}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, correctAnswerIndex, difficulty, question, questionId, questionType, response0, response1, response2, response3 FROM tqcQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
+        row = await self.__sampler.fetchRandomRow(
+            columns = ( 'category', 'correctAnswerIndex', 'difficulty', 'question', 'questionId', 'questionType', 'response0', 'response1', 'response2', 'response3', ),
         )
 
-        row = await cursor.fetchone()
         if row is None or len(row) != 10:
             raise RuntimeError(f'Received malformed data from {self.triviaSource} database: {row}')
 
@@ -117,8 +118,6 @@ class TriviaQuestionCompanyTriviaQuestionRepository(AbsTriviaQuestionRepository)
             'responses': [ row[6], row[7], row[8], row[9] ]
         }
 
-        await cursor.close()
-        await connection.close()
         return questionDict
 
     async def hasQuestionSetAvailable(self) -> bool:
@@ -8,6 +8,10 @@ from ..triviaFetchOptions import TriviaFetchOptions
 
 class TriviaQuestionRepositoryInterface(ABC):
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @abstractmethod
     async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
         pass
@@ -1,8 +1,10 @@
 import asyncio
-import queue
+import math
 import random
+import time
 import traceback
-from queue import SimpleQueue
+from collections import deque
+from typing import Any, Coroutine
 
 from frozendict import frozendict
 
@@ -20,6 +22,7 @@ from .triviaDatabaseTriviaQuestionRepository import TriviaDatabaseTriviaQuestion
 from .triviaQuestionCompanyTriviaQuestionRepository import TriviaQuestionCompanyTriviaQuestionRepository
 from .triviaQuestionRepositoryInterface import TriviaQuestionRepositoryInterface
 from .triviaRepositoryInterface import TriviaRepositoryInterface
+from .triviaSpoolMetrics import TriviaSpoolMetrics
 from .willFryTriviaQuestionRepository import WillFryTriviaQuestionRepository
 from .wwtbamTriviaQuestionRepository import WwtbamTriviaQuestionRepository
 from ..content.triviaContentCode import TriviaContentCode
@@ -75,7 +78,10 @@ class TriviaRepository(TriviaRepositoryInterface):
         userIdsRepository: UserIdsRepositoryInterface,
         willFryTriviaQuestionRepository: WillFryTriviaQuestionRepository,
         wwtbamTriviaQuestionRepository: WwtbamTriviaQuestionRepository,
+        maxConcurrentSpoolFetches: int = 6,
+        maxConcurrentSpoolFetchesPerSource: int = 2,
         spoolerLoopSleepTimeSeconds: float = 120,
+        spoolLowWaterMarkRatio: float = 0.5,
         triviaRetrySleepTimeSeconds: float = 0.25
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
@@ -124,10 +130,22 @@ class TriviaRepository(TriviaRepositoryInterface):
             raise TypeError(f'willFryTriviaQuestionRepository argument is malformed: \"{willFryTriviaQuestionRepository}\"')
         elif not isinstance(wwtbamTriviaQuestionRepository, WwtbamTriviaQuestionRepository):
             raise TypeError(f'wwtbamTriviaQuestionRepository argument is malformed: \"{wwtbamTriviaQuestionRepository}\"')
+        elif not utils.isValidInt(maxConcurrentSpoolFetches):
+            raise TypeError(f'maxConcurrentSpoolFetches argument is malformed: \"{maxConcurrentSpoolFetches}\"')
+        elif maxConcurrentSpoolFetches < 1 or maxConcurrentSpoolFetches > 32:
+            raise ValueError(f'maxConcurrentSpoolFetches argument is out of bounds: {maxConcurrentSpoolFetches}')
+        elif not utils.isValidInt(maxConcurrentSpoolFetchesPerSource):
+            raise TypeError(f'maxConcurrentSpoolFetchesPerSource argument is malformed: \"{maxConcurrentSpoolFetchesPerSource}\"')
+        elif maxConcurrentSpoolFetchesPerSource < 1 or maxConcurrentSpoolFetchesPerSource > 8:
+            raise ValueError(f'maxConcurrentSpoolFetchesPerSource argument is out of bounds: {maxConcurrentSpoolFetchesPerSource}')
         elif not utils.isValidNum(spoolerLoopSleepTimeSeconds):
             raise TypeError(f'spoolerLoopSleepTimeSeconds argument is malformed: \"{spoolerLoopSleepTimeSeconds}\"')
         elif spoolerLoopSleepTimeSeconds < 15 or spoolerLoopSleepTimeSeconds > 300:
             raise ValueError(f'spoolerLoopSleepTimeSeconds argument is out of bounds: {spoolerLoopSleepTimeSeconds}')
+        elif not utils.isValidNum(spoolLowWaterMarkRatio):
+            raise TypeError(f'spoolLowWaterMarkRatio argument is malformed: \"{spoolLowWaterMarkRatio}\"')
+        elif spoolLowWaterMarkRatio < 0 or spoolLowWaterMarkRatio > 1:
+            raise ValueError(f'spoolLowWaterMarkRatio argument is out of bounds: {spoolLowWaterMarkRatio}')
         elif not utils.isValidNum(triviaRetrySleepTimeSeconds):
             raise TypeError(f'triviaRetrySleepTimeSeconds argument is malformed: \"{triviaRetrySleepTimeSeconds}\"')
         elif triviaRetrySleepTimeSeconds < 0.25 or triviaRetrySleepTimeSeconds > 3:
@@ -156,15 +174,30 @@ class TriviaRepository(TriviaRepositoryInterface):
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
         self.__willFryTriviaQuestionRepository: TriviaQuestionRepositoryInterface = willFryTriviaQuestionRepository
         self.__wwtbamTriviaQuestionRepository: TriviaQuestionRepositoryInterface = wwtbamTriviaQuestionRepository
+        self.__maxConcurrentSpoolFetchesPerSource: int = maxConcurrentSpoolFetchesPerSource
         self.__spoolerLoopSleepTimeSeconds: float = spoolerLoopSleepTimeSeconds
+        self.__spoolLowWaterMarkRatio: float = spoolLowWaterMarkRatio
         self.__triviaRetrySleepTimeSeconds: float = triviaRetrySleepTimeSeconds
 
         self.__isSpoolerStarted: bool = False
         self.__triviaSourceToRepositoryMap: frozendict[TriviaSource, TriviaQuestionRepositoryInterface | None] = self.__createTriviaSourceToRepositoryMap()
-        self.__superTriviaQuestionSpool: SimpleQueue[QuestionAnswerTriviaQuestion] = SimpleQueue()
-        self.__triviaQuestionSpool: SimpleQueue[AbsTriviaQuestion] = SimpleQueue()
         self.__twitchChannelId: str | None = None
 
+        # The spools are shared by every channel. None of the content checks that a question has
+        # to pass before it can be spooled depend on the channel, so questions are spooled using
+        # our own channel's fetch options. The checks that do depend on the channel (such as its
+        # trivia history) are run by fetchTrivia() once a spooled question has been retrieved.
+        self.__superTriviaQuestionSpool: deque[QuestionAnswerTriviaQuestion] = deque()
+        self.__triviaQuestionSpool: deque[AbsTriviaQuestion] = deque()
+        self.__spoolFetchSemaphore: asyncio.Semaphore = asyncio.Semaphore(maxConcurrentSpoolFetches)
+        self.__spoolSourceSemaphores: dict[TriviaSource, asyncio.Semaphore] = dict()
+        self.__spoolerWakeEvent: asyncio.Event = asyncio.Event()
+
+        self.__spoolHits: int = 0
+        self.__spoolMisses: int = 0
+        self.__totalFillLatencySeconds: float = 0
+        self.__totalFilled: int = 0
+
     async def __chooseRandomTriviaSource(
         self,
         triviaFetchOptions: TriviaFetchOptions
@@ -201,6 +234,16 @@ class TriviaRepository(TriviaRepositoryInterface):
 
         return randomlyChosenTriviaRepository
 
+    async def close(self):
+        for triviaSource, triviaQuestionRepository in self.__triviaSourceToRepositoryMap.items():
+            if triviaQuestionRepository is None:
+                continue
+
+            try:
+                await triviaQuestionRepository.close()
+            except Exception as e:
+                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when closing trivia question repository ({triviaSource=})', e, traceback.format_exc())
+
     def __createTriviaSourceToRepositoryMap(self) -> frozendict[TriviaSource, TriviaQuestionRepositoryInterface | None]:
         triviaSourceToRepositoryMap: dict[TriviaSource, TriviaQuestionRepositoryInterface | None] = {
             TriviaSource.BONGO: self.__bongoTriviaQuestionRepository,
@@ -418,22 +461,31 @@ class TriviaRepository(TriviaRepositoryInterface):
         if not isinstance(triviaFetchOptions, TriviaFetchOptions):
             raise TypeError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
 
+        spool: deque[Any]
+        maxSpoolSize: int
+
         if triviaFetchOptions.requireQuestionAnswerTriviaQuestion():
-            if not self.__superTriviaQuestionSpool.empty():
-                try:
-                    self.__timber.log('TriviaRepository', f'Retrieving spooled super trivia question (current qsize: {self.__superTriviaQuestionSpool.qsize()})')
-                    return self.__superTriviaQuestionSpool.get_nowait()
-                except queue.Empty as e:
-                    self.__timber.log('TriviaRepository', f'Encountered queue.Empty when trying to retrieve a spooled super trivia question', e, traceback.format_exc())
+            spool = self.__superTriviaQuestionSpool
+            maxSpoolSize = await self.__triviaSettingsRepository.getMaxSuperTriviaQuestionSpoolSize()
         else:
-            if not self.__triviaQuestionSpool.empty():
-                try:
-                    self.__timber.log('TriviaRepository', f'Retrieving spooled trivia question (current qsize: {self.__triviaQuestionSpool.qsize()})')
-                    return self.__triviaQuestionSpool.get_nowait()
-                except queue.Empty as e:
-                    self.__timber.log('TriviaRepository', f'Encountered queue.Empty when trying to retrieve a spooled trivia question', e, traceback.format_exc())
+            spool = self.__triviaQuestionSpool
+            maxSpoolSize = await self.__triviaSettingsRepository.getMaxTriviaQuestionSpoolSize()
 
-        return None
+        question: AbsTriviaQuestion | None = None
+
+        if len(spool) == 0:
+            self.__spoolMisses += 1
+        else:
+            self.__spoolHits += 1
+            question = spool.popleft()
+            self.__timber.log('TriviaRepository', f'Retrieved spooled trivia question ({triviaFetchOptions.twitchChannelId=}) ({question.triviaType=}) (remaining spool size: {len(spool)})')
+
+        # only wake the spooler up early once this spool has been drained below its low water
+        # mark, rather than on every single retrieval
+        if len(spool) < math.ceil(maxSpoolSize * self.__spoolLowWaterMarkRatio):
+            self.__spoolerWakeEvent.set()
+
+        return question
 
     async def __scrapeAndStore(self, question: AbsTriviaQuestion | None):
         if question is None:
@@ -449,34 +501,102 @@ class TriviaRepository(TriviaRepositoryInterface):
         if triviaScraper is not None:
             await triviaScraper.store(question)
 
-    async def __spoolNewSuperTriviaQuestion(self):
-        if self.__superTriviaQuestionSpool.qsize() >= await self.__triviaSettingsRepository.getMaxSuperTriviaQuestionSpoolSize():
-            return
-
-        triviaFetchOptions = TriviaFetchOptions(
-            twitchChannel = await self.__twitchHandleProvider.getTwitchHandle(),
-            twitchChannelId = await self.__getTwitchChannelId(),
-            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
-        )
-
-        self.__timber.log('TriviaRepository', f'Spooling up a super trivia question (current qsize: {self.__superTriviaQuestionSpool.qsize()})')
+    async def __fetchSpoolTriviaQuestion(
+        self,
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> AbsTriviaQuestion | None:
+        # Sources that have blown through their error budget are already excluded here, via the
+        # TriviaSourceInstabilityHelper, so a flaky source will stop being picked for a while.
         triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
         triviaSource = triviaQuestionRepository.triviaSource
-        question: AbsTriviaQuestion | None = None
+
+        sourceSemaphore = self.__spoolSourceSemaphores.get(triviaSource, None)
+        if sourceSemaphore is None:
+            sourceSemaphore = asyncio.Semaphore(self.__maxConcurrentSpoolFetchesPerSource)
+            self.__spoolSourceSemaphores[triviaSource] = sourceSemaphore
 
         try:
-            question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
+            async with sourceSemaphore:
+                return await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
         except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
             self.__timber.log('TriviaRepository', f'Failed to fetch trivia question for spool due to malformed data ({triviaSource=}): {e}', e, traceback.format_exc())
         except GenericTriviaNetworkException as e:
             self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching super trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
+            self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
         except MalformedTriviaJsonException as e:
             self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching super trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
+            self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
         except Exception as e:
             self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching super trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
+            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
+
+        return None
+
+    async def fillSpools(self):
+        twitchChannel = await self.__twitchHandleProvider.getTwitchHandle()
+        twitchChannelId = await self.__getTwitchChannelId()
+        maxSuperTriviaQuestionSpoolSize = await self.__triviaSettingsRepository.getMaxSuperTriviaQuestionSpoolSize()
+        maxTriviaQuestionSpoolSize = await self.__triviaSettingsRepository.getMaxTriviaQuestionSpoolSize()
+        spoolFills: list[Coroutine[Any, Any, None]] = list()
+
+        for _ in range(maxTriviaQuestionSpoolSize - len(self.__triviaQuestionSpool)):
+            spoolFills.append(self.__spoolNewTriviaQuestion(
+                twitchChannel = twitchChannel,
+                twitchChannelId = twitchChannelId,
+                maxSpoolSize = maxTriviaQuestionSpoolSize
+            ))
+
+        for _ in range(maxSuperTriviaQuestionSpoolSize - len(self.__superTriviaQuestionSpool)):
+            spoolFills.append(self.__spoolNewSuperTriviaQuestion(
+                twitchChannel = twitchChannel,
+                twitchChannelId = twitchChannelId,
+                maxSpoolSize = maxSuperTriviaQuestionSpoolSize
+            ))
+
+        if len(spoolFills) == 0:
+            return
+
+        results = await asyncio.gather(*spoolFills, return_exceptions = True)
+
+        for result in results:
+            if isinstance(result, Exception):
+                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refreshing trivia question spool: {result}', result, ''.join(traceback.format_exception(result)))
+
+    def getSpoolMetrics(self) -> TriviaSpoolMetrics:
+        averageFillLatencySeconds: float = 0
+        if self.__totalFilled >= 1:
+            averageFillLatencySeconds = self.__totalFillLatencySeconds / self.__totalFilled
+
+        hitRate: float = 0
+        if self.__spoolHits + self.__spoolMisses >= 1:
+            hitRate = self.__spoolHits / (self.__spoolHits + self.__spoolMisses)
+
+        return TriviaSpoolMetrics(
+            superTriviaQuestionSpoolSize = len(self.__superTriviaQuestionSpool),
+            triviaQuestionSpoolSize = len(self.__triviaQuestionSpool),
+            averageFillLatencySeconds = averageFillLatencySeconds,
+            hitRate = hitRate,
+            spoolHits = self.__spoolHits,
+            spoolMisses = self.__spoolMisses,
+            totalFilled = self.__totalFilled
+        )
+
+    async def __spoolNewSuperTriviaQuestion(
+        self,
+        twitchChannel: str,
+        twitchChannelId: str,
+        maxSpoolSize: int
+    ):
+        triviaFetchOptions = TriviaFetchOptions(
+            twitchChannel = twitchChannel,
+            twitchChannelId = twitchChannelId,
+            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
+        )
+
+        startTime = time.monotonic()
+
+        async with self.__spoolFetchSemaphore:
+            question = await self.__fetchSpoolTriviaQuestion(triviaFetchOptions)
 
         if question is None:
             return
@@ -491,38 +611,31 @@ class TriviaRepository(TriviaRepositoryInterface):
             self.__timber.log('TriviaRepository', f'Encountered bad trivia question content when spooling a super trivia question ({question=})')
             return
 
-        self.__superTriviaQuestionSpool.put(question)
-        self.__timber.log('TriviaRepository', f'Finished spooling up a super trivia question (new qsize: {self.__superTriviaQuestionSpool.qsize()})')
-        await self.__scrapeAndStore(question)
-
-    async def __spoolNewTriviaQuestion(self):
-        if self.__triviaQuestionSpool.qsize() >= await self.__triviaSettingsRepository.getMaxTriviaQuestionSpoolSize():
+        superTriviaQuestionSpool = self.__superTriviaQuestionSpool
+        if len(superTriviaQuestionSpool) >= maxSpoolSize:
             return
 
+        superTriviaQuestionSpool.append(question)
+        self.__recordSpoolFill(startTime)
+        self.__timber.log('TriviaRepository', f'Finished spooling up a super trivia question (new spool size: {len(superTriviaQuestionSpool)})')
+        await self.__scrapeAndStore(question)
+
+    async def __spoolNewTriviaQuestion(
+        self,
+        twitchChannel: str,
+        twitchChannelId: str,
+        maxSpoolSize: int
+    ):
         triviaFetchOptions = TriviaFetchOptions(
-            twitchChannel = await self.__twitchHandleProvider.getTwitchHandle(),
-            twitchChannelId = await self.__getTwitchChannelId(),
+            twitchChannel = twitchChannel,
+            twitchChannelId = twitchChannelId,
             questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.NOT_ALLOWED
         )
 
-        self.__timber.log('TriviaRepository', f'Spooling up a trivia question (current qsize: {self.__triviaQuestionSpool.qsize()})')
-        triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
-        triviaSource = triviaQuestionRepository.triviaSource
-        question: AbsTriviaQuestion | None = None
+        startTime = time.monotonic()
 
-        try:
-            question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
-        except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
-            self.__timber.log('TriviaRepository', f'Failed to fetch trivia question for spool due to malformed data ({triviaSource=}): {e}', e, traceback.format_exc())
-        except GenericTriviaNetworkException as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
-        except MalformedTriviaJsonException as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
-        except Exception as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
+        async with self.__spoolFetchSemaphore:
+            question = await self.__fetchSpoolTriviaQuestion(triviaFetchOptions)
 
         if question is None:
             return
@@ -537,10 +650,19 @@ class TriviaRepository(TriviaRepositoryInterface):
             self.__timber.log('TriviaRepository', f'Encountered bad trivia question content when spooling a trivia question ({question=})')
             return
 
-        self.__triviaQuestionSpool.put(question)
-        self.__timber.log('TriviaRepository', f'Finished spooling up a trivia question (new qsize: {self.__triviaQuestionSpool.qsize()})')
+        triviaQuestionSpool = self.__triviaQuestionSpool
+        if len(triviaQuestionSpool) >= maxSpoolSize:
+            return
+
+        triviaQuestionSpool.append(question)
+        self.__recordSpoolFill(startTime)
+        self.__timber.log('TriviaRepository', f'Finished spooling up a trivia question (new spool size: {len(triviaQuestionSpool)})')
         await self.__scrapeAndStore(question)
 
+    def __recordSpoolFill(self, startTime: float):
+        self.__totalFillLatencySeconds += time.monotonic() - startTime
+        self.__totalFilled += 1
+
     def startSpooler(self):
         if self.__isSpoolerStarted:
             self.__timber.log('TriviaRepository', 'Not starting spooler as it has already been started')
@@ -552,17 +674,17 @@ class TriviaRepository(TriviaRepositoryInterface):
 
     async def __startTriviaQuestionSpooler(self):
         while True:
-            try:
-                await self.__spoolNewTriviaQuestion()
-            except Exception as e:
-                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refreshing trivia question spool', e, traceback.format_exc())
+            self.__spoolerWakeEvent.clear()
 
             try:
-                await self.__spoolNewSuperTriviaQuestion()
+                await self.fillSpools()
             except Exception as e:
-                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refreshing super trivia question spool', e, traceback.format_exc())
+                self.__timber.log('TriviaRepository', 'Encountered unknown Exception when refreshing trivia question spools', e, traceback.format_exc())
 
-            await asyncio.sleep(self.__spoolerLoopSleepTimeSeconds)
+            try:
+                await asyncio.wait_for(self.__spoolerWakeEvent.wait(), timeout = self.__spoolerLoopSleepTimeSeconds)
+            except asyncio.TimeoutError:
+                pass
 
     async def __verifyTriviaQuestionContent(
         self,
@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
 
+from .triviaSpoolMetrics import TriviaSpoolMetrics
 from ..questions.absTriviaQuestion import AbsTriviaQuestion
 from ..triviaFetchOptions import TriviaFetchOptions
 
 
 class TriviaRepositoryInterface(ABC):
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @abstractmethod
     async def fetchTrivia(
         self,
@@ -14,6 +19,14 @@ class TriviaRepositoryInterface(ABC):
     ) -> AbsTriviaQuestion | None:
         pass
 
+    @abstractmethod
+    async def fillSpools(self):
+        pass
+
+    @abstractmethod
+    def getSpoolMetrics(self) -> TriviaSpoolMetrics:
+        pass
+
     @abstractmethod
     def startSpooler(self):
         pass
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class TriviaSpoolMetrics:
+    superTriviaQuestionSpoolSize: int
+    triviaQuestionSpoolSize: int
+    averageFillLatencySeconds: float
+    hitRate: float
+    spoolHits: int
+    spoolMisses: int
+    totalFilled: int
@@ -2,7 +2,6 @@ from typing import Any
 
 import aiofiles
 import aiofiles.ospath
-import aiosqlite
 
 from .absTriviaQuestionRepository import AbsTriviaQuestionRepository
 from ..compilers.triviaQuestionCompilerInterface import TriviaQuestionCompilerInterface
@@ -14,6 +13,7 @@ from ..settings.triviaSettingsRepositoryInterface import TriviaSettingsRepositor
 from ..triviaDifficulty import TriviaDifficulty
 from ..triviaFetchOptions import TriviaFetchOptions
 from ...misc import utils as utils
+from ...storage.sqlite.sqliteRandomRowSampler import SqliteRandomRowSampler
 from ...timber.timberInterface import TimberInterface
 
 
@@ -42,6 +42,13 @@ class WwtbamTriviaQuestionRepository(AbsTriviaQuestionRepository):
         self.__triviaDatabaseFile: str = triviaDatabaseFile
 
         self.__hasQuestionSetAvailable: bool | None = None
+        self.__sampler: SqliteRandomRowSampler = SqliteRandomRowSampler(
+            databaseFile = triviaDatabaseFile,
+            tableName = 'wwtbamTriviaQuestions',
+        )
+
+    async def close(self):
+        await self.__sampler.close()
 
     async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
         if not isinstance(fetchOptions, TriviaFetchOptions):
@@ -107,16 +114,10 @@ class WwtbamTriviaQuestionRepository(AbsTriviaQuestionRepository):
         if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
             raise FileNotFoundError(f'WWTBAM trivia database file not found: \"{self.__triviaDatabaseFile}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT correctAnswer, question, responseA, responseB, responseC, responseD, triviaId FROM wwtbamTriviaQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
+        row = await self.__sampler.fetchRandomRow(
+            columns = ( 'correctAnswer', 'question', 'responseA', 'responseB', 'responseC', 'responseD', 'triviaId', ),
         )
 
-        row = await cursor.fetchone()
         if row is None or len(row) != 7:
             raise RuntimeError(f'Received malformed data from WWTBAM database: {row}')
 
@@ -130,8 +131,6 @@ class WwtbamTriviaQuestionRepository(AbsTriviaQuestionRepository):
             'triviaId': row[6]
         }
 
-        await cursor.close()
-        await connection.close()
         return triviaQuestionDict
 
     async def hasQuestionSetAvailable(self) -> bool:
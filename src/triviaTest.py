@@ -206,6 +206,7 @@ twitchApiService: TwitchApiServiceInterface = TwitchApiService(
 officialTwitchAccountUserIdProvider: OfficialTwitchAccountUserIdProviderInterface = OfficialTwitchAccountUserIdProvider()
 
 userIdsRepository: Final[UserIdsRepositoryInterface] = UserIdsRepository(
+    backgroundTaskHelper = backgroundTaskHelper,
     backingDatabase = backingDatabase,
     timber = timber,
     twitchApiService = twitchApiService,
@@ -6,6 +6,7 @@ from .commodoreSamTtsManagerInterface import CommodoreSamTtsManagerInterface
 from ..commandBuilder.ttsCommandBuilderInterface import TtsCommandBuilderInterface
 from ..models.ttsEvent import TtsEvent
 from ..settings.ttsSettingsRepositoryInterface import TtsSettingsRepositoryInterface
+from ..ttsPreparationCache import TtsPreparationCache
 from ...commodoreSam.commodoreSamMessageCleanerInterface import CommodoreSamMessageCleanerInterface
 from ...commodoreSam.helper.commodoreSamHelperInterface import CommodoreSamHelperInterface
 from ...commodoreSam.models.commodoreSamFileReference import CommodoreSamFileReference
@@ -49,6 +50,11 @@ class CommodoreSamTtsManager(CommodoreSamTtsManagerInterface):
         self.__ttsCommandBuilder: Final[TtsCommandBuilderInterface] = ttsCommandBuilder
         self.__ttsSettingsRepository: Final[TtsSettingsRepositoryInterface] = ttsSettingsRepository
 
+        self.__preparationCache: Final[TtsPreparationCache[CommodoreSamFileReference]] = TtsPreparationCache(
+            timber = timber,
+            timberTag = 'CommodoreSamTtsManager',
+        )
+
         self.__isLoadingOrPlaying: bool = False
 
     async def __executeTts(self, fileReference: CommodoreSamFileReference):
@@ -87,7 +93,7 @@ class CommodoreSamTtsManager(CommodoreSamTtsManagerInterface):
             return
 
         self.__isLoadingOrPlaying = True
-        fileReference = await self.__processTtsEvent(event)
+        fileReference = await self.__preparationCache.take(event, lambda: self.__processTtsEvent(event))
 
         if fileReference is None:
             self.__timber.log('CommodoreSamTtsManager', f'Failed to generate TTS ({event=}) ({fileReference=})')
@@ -97,6 +103,15 @@ class CommodoreSamTtsManager(CommodoreSamTtsManagerInterface):
         self.__timber.log('CommodoreSamTtsManager', f'Executing TTS in \"{event.twitchChannel}\"...')
         await self.__executeTts(fileReference)
 
+    async def prepareTtsEvent(self, event: TtsEvent):
+        if not isinstance(event, TtsEvent):
+            raise TypeError(f'event argument is malformed: \"{event}\"')
+
+        if not await self.__ttsSettingsRepository.isEnabled():
+            return
+
+        await self.__preparationCache.prepare(event, lambda: self.__processTtsEvent(event))
+
     async def __processTtsEvent(self, event: TtsEvent) -> CommodoreSamFileReference | None:
         donationPrefix = await self.__ttsCommandBuilder.buildDonationPrefix(event)
         message = await self.__commodoreSamMessageCleaner.clean(event.message)
@@ -109,6 +124,8 @@ class CommodoreSamTtsManager(CommodoreSamTtsManagerInterface):
         )
 
     async def stopTtsEvent(self):
+        self.__preparationCache.cancelCurrent()
+
         if not self.isLoadingOrPlaying:
             return
 
@@ -1,4 +1,5 @@
 import random
+from collections import OrderedDict
 from typing import Final
 
 from frozendict import frozendict
@@ -21,6 +22,7 @@ from .streamElements.streamElementsTtsManagerInterface import StreamElementsTtsM
 from .ttsManagerInterface import TtsManagerInterface
 from .ttsMonster.ttsMonsterTtsManagerInterface import TtsMonsterTtsManagerInterface
 from ..chatterPreferredTts.helper.chatterPreferredTtsHelperInterface import ChatterPreferredTtsHelperInterface
+from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
 from ..timber.timberInterface import TimberInterface
 
@@ -42,6 +44,7 @@ class CompositeTtsManager(CompositeTtsManagerInterface):
         timber: TimberInterface,
         ttsMonsterTtsManager: TtsMonsterTtsManagerInterface | None,
         ttsSettingsRepository: TtsSettingsRepositoryInterface,
+        maxPreparedProviders: int = 16,
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -69,11 +72,16 @@ class CompositeTtsManager(CompositeTtsManagerInterface):
             raise TypeError(f'ttsMonsterTtsManager argument is malformed: \"{ttsMonsterTtsManager}\"')
         elif not isinstance(ttsSettingsRepository, TtsSettingsRepositoryInterface):
             raise TypeError(f'ttsSettingsRepository argument is malformed: \"{ttsSettingsRepository}\"')
+        elif not utils.isValidInt(maxPreparedProviders):
+            raise TypeError(f'maxPreparedProviders argument is malformed: \"{maxPreparedProviders}\"')
+        elif maxPreparedProviders < 1 or maxPreparedProviders > 128:
+            raise ValueError(f'maxPreparedProviders argument is out of bounds: {maxPreparedProviders}')
 
         self.__backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = backgroundTaskHelper
         self.__chatterPreferredTtsHelper: Final[ChatterPreferredTtsHelperInterface | None] = chatterPreferredTtsHelper
         self.__timber: Final[TimberInterface] = timber
         self.__ttsSettingsRepository: Final[TtsSettingsRepositoryInterface] = ttsSettingsRepository
+        self.__maxPreparedProviders: Final[int] = maxPreparedProviders
 
         self.__ttsProviderToManagerMap: Final[frozendict[TtsProvider, TtsManagerInterface | None]] = frozendict({
             TtsProvider.COMMODORE_SAM: commodoreSamTtsManager,
@@ -89,6 +97,10 @@ class CompositeTtsManager(CompositeTtsManagerInterface):
 
         self.__currentTtsManager: TtsManagerInterface | None = None
 
+        # remembers which provider was chosen when an event was prepared ahead of time, so that
+        # a randomly chosen provider doesn't change between preparation and playback
+        self.__preparedProviders: Final[OrderedDict[TtsEvent, TtsProvider]] = OrderedDict()
+
     async def __determineTtsProvider(self, event: TtsEvent) -> TtsProvider:
         if event.providerOverridableStatus is not TtsProviderOverridableStatus.CHATTER_OVERRIDABLE:
             return event.provider
@@ -265,7 +277,11 @@ class CompositeTtsManager(CompositeTtsManagerInterface):
             self.__timber.log('CompositeTtsManager', f'Will not play the given TTS event as there is one already an ongoing! ({event=})')
             return False
 
-        provider = await self.__determineTtsProvider(event)
+        provider = self.__preparedProviders.pop(event, None)
+
+        if provider is None:
+            provider = await self.__determineTtsProvider(event)
+
         manager = self.__ttsProviderToManagerMap.get(provider, None)
 
         if provider is TtsProvider.SHOTGUN_TTS:
@@ -278,6 +294,32 @@ class CompositeTtsManager(CompositeTtsManagerInterface):
             self.__backgroundTaskHelper.createTask(manager.playTtsEvent(event))
             return True
 
+    async def prepareTtsEvent(self, event: TtsEvent):
+        if not isinstance(event, TtsEvent):
+            raise TypeError(f'event argument is malformed: \"{event}\"')
+
+        if not await self.__ttsSettingsRepository.isEnabled():
+            return
+
+        provider = self.__preparedProviders.get(event, None)
+
+        if provider is None:
+            provider = await self.__determineTtsProvider(event)
+
+            while len(self.__preparedProviders) >= self.__maxPreparedProviders:
+                self.__preparedProviders.popitem(last = False)
+
+            self.__preparedProviders[event] = provider
+
+        if provider is TtsProvider.SHOTGUN_TTS:
+            # shotgun TTS events are played by many managers at once, so they aren't prepared
+            return
+
+        manager = self.__ttsProviderToManagerMap.get(provider, None)
+
+        if manager is not None:
+            await manager.prepareTtsEvent(event)
+
     async def stopTtsEvent(self):
         currentTtsManager = self.__currentTtsManager
 
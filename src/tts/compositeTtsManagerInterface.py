@@ -14,6 +14,10 @@ class CompositeTtsManagerInterface(ABC):
     async def playTtsEvent(self, event: TtsEvent) -> bool:
         pass
 
+    @abstractmethod
+    async def prepareTtsEvent(self, event: TtsEvent):
+        pass
+
     @abstractmethod
     async def stopTtsEvent(self):
         pass
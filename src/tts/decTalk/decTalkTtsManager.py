@@ -11,6 +11,7 @@ from ..models.ttsEvent import TtsEvent
 from ..models.ttsProvider import TtsProvider
 from ..models.ttsProviderOverridableStatus import TtsProviderOverridableStatus
 from ..settings.ttsSettingsRepositoryInterface import TtsSettingsRepositoryInterface
+from ..ttsPreparationCache import TtsPreparationCache
 from ...chatterPreferredTts.helper.chatterPreferredTtsHelperInterface import ChatterPreferredTtsHelperInterface
 from ...chatterPreferredTts.models.decTalk.decTalkTtsProperties import DecTalkTtsProperties
 from ...decTalk.decTalkMessageCleanerInterface import DecTalkMessageCleanerInterface
@@ -61,6 +62,11 @@ class DecTalkTtsManager(DecTalkTtsManagerInterface):
         self.__ttsCommandBuilder: Final[TtsCommandBuilderInterface] = ttsCommandBuilder
         self.__ttsSettingsRepository: Final[TtsSettingsRepositoryInterface] = ttsSettingsRepository
 
+        self.__preparationCache: Final[TtsPreparationCache[DecTalkFileReference]] = TtsPreparationCache(
+            timber = timber,
+            timberTag = 'DecTalkTtsManager',
+        )
+
         self.__isLoadingOrPlaying: bool = False
 
     async def __determineVoice(self, event: TtsEvent) -> DecTalkVoice | None:
@@ -128,7 +134,7 @@ class DecTalkTtsManager(DecTalkTtsManagerInterface):
             return
 
         self.__isLoadingOrPlaying = True
-        fileReference = await self.__processTtsEvent(event)
+        fileReference = await self.__preparationCache.take(event, lambda: self.__processTtsEvent(event))
 
         if fileReference is None:
             self.__timber.log('DecTalkTtsManager', f'Failed to generate TTS ({event=}) ({fileReference=})')
@@ -138,6 +144,15 @@ class DecTalkTtsManager(DecTalkTtsManagerInterface):
         self.__timber.log('DecTalkTtsManager', f'Executing TTS in \"{event.twitchChannel}\"...')
         await self.__executeTts(fileReference)
 
+    async def prepareTtsEvent(self, event: TtsEvent):
+        if not isinstance(event, TtsEvent):
+            raise TypeError(f'event argument is malformed: \"{event}\"')
+
+        if not await self.__ttsSettingsRepository.isEnabled():
+            return
+
+        await self.__preparationCache.prepare(event, lambda: self.__processTtsEvent(event))
+
     async def __processTtsEvent(self, event: TtsEvent) -> DecTalkFileReference | None:
         donationPrefix = await self.__ttsCommandBuilder.buildDonationPrefix(event)
         message = await self.__decTalkMessageCleaner.clean(event.message)
@@ -152,6 +167,8 @@ class DecTalkTtsManager(DecTalkTtsManagerInterface):
         )
 
     async def stopTtsEvent(self):
+        self.__preparationCache.cancelCurrent()
+
         if not self.isLoadingOrPlaying:
             return
 
@@ -9,6 +9,7 @@ from ..models.ttsEvent import TtsEvent
 from ..models.ttsProvider import TtsProvider
 from ..models.ttsProviderOverridableStatus import TtsProviderOverridableStatus
 from ..settings.ttsSettingsRepositoryInterface import TtsSettingsRepositoryInterface
+from ..ttsPreparationCache import TtsPreparationCache
 from ...chatterPreferredTts.helper.chatterPreferredTtsHelperInterface import ChatterPreferredTtsHelperInterface
 from ...chatterPreferredTts.models.google.googleTtsProperties import GoogleTtsProperties
 from ...google.googleTtsMessageCleanerInterface import GoogleTtsMessageCleanerInterface
@@ -65,6 +66,11 @@ class GoogleTtsManager(GoogleTtsManagerInterface):
         self.__ttsCommandBuilder: Final[TtsCommandBuilderInterface] = ttsCommandBuilder
         self.__ttsSettingsRepository: Final[TtsSettingsRepositoryInterface] = ttsSettingsRepository
 
+        self.__preparationCache: Final[TtsPreparationCache[GoogleTtsFileReference]] = TtsPreparationCache(
+            timber = timber,
+            timberTag = 'GoogleTtsManager',
+        )
+
         self.__isLoadingOrPlaying: bool = False
 
     async def __determineVoicePreset(self, event: TtsEvent) -> AbsGoogleVoicePreset | None:
@@ -134,7 +140,7 @@ class GoogleTtsManager(GoogleTtsManagerInterface):
             return
 
         self.__isLoadingOrPlaying = True
-        fileReference = await self.__processTtsEvent(event)
+        fileReference = await self.__preparationCache.take(event, lambda: self.__processTtsEvent(event))
 
         if fileReference is None:
             self.__timber.log('GoogleTtsManager', f'Failed to generate TTS ({event=}) ({fileReference=})')
@@ -144,6 +150,15 @@ class GoogleTtsManager(GoogleTtsManagerInterface):
         self.__timber.log('GoogleTtsManager', f'Playing TTS in \"{event.twitchChannel}\"...')
         await self.__executeTts(fileReference)
 
+    async def prepareTtsEvent(self, event: TtsEvent):
+        if not isinstance(event, TtsEvent):
+            raise TypeError(f'event argument is malformed: \"{event}\"')
+
+        if not await self.__ttsSettingsRepository.isEnabled():
+            return
+
+        await self.__preparationCache.prepare(event, lambda: self.__processTtsEvent(event))
+
     async def __processTtsEvent(self, event: TtsEvent) -> GoogleTtsFileReference | None:
         donationPrefix = await self.__ttsCommandBuilder.buildDonationPrefix(event)
         message = await self.__googleTtsMessageCleaner.clean(event.message)
@@ -159,6 +174,8 @@ class GoogleTtsManager(GoogleTtsManagerInterface):
         )
 
     async def stopTtsEvent(self):
+        self.__preparationCache.cancelCurrent()
+
         if not self.isLoadingOrPlaying:
             return
 
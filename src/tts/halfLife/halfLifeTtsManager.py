@@ -9,6 +9,7 @@ from ..models.ttsEvent import TtsEvent
 from ..models.ttsProvider import TtsProvider
 from ..models.ttsProviderOverridableStatus import TtsProviderOverridableStatus
 from ..settings.ttsSettingsRepositoryInterface import TtsSettingsRepositoryInterface
+from ..ttsPreparationCache import TtsPreparationCache
 from ...chatterPreferredTts.helper.chatterPreferredTtsHelperInterface import ChatterPreferredTtsHelperInterface
 from ...chatterPreferredTts.models.halfLife.halfLifeTtsProperties import HalfLifeTtsProperties
 from ...halfLife.halfLifeMessageCleanerInterface import HalfLifeMessageCleanerInterface
@@ -56,6 +57,11 @@ class HalfLifeTtsManager(HalfLifeTtsManagerInterface):
         self.__timber: Final[TimberInterface] = timber
         self.__ttsSettingsRepository: Final[TtsSettingsRepositoryInterface] = ttsSettingsRepository
 
+        self.__preparationCache: Final[TtsPreparationCache[SoundPlayerPlaylist]] = TtsPreparationCache(
+            timber = timber,
+            timberTag = 'HalfLifeTtsManager',
+        )
+
         self.__isLoadingOrPlaying: bool = False
 
     async def __determineVoice(self, event: TtsEvent) -> HalfLifeVoice | None:
@@ -113,7 +119,7 @@ class HalfLifeTtsManager(HalfLifeTtsManagerInterface):
             return
 
         self.__isLoadingOrPlaying = True
-        playlist = await self.__processTtsEvent(event)
+        playlist = await self.__preparationCache.take(event, lambda: self.__processTtsEvent(event))
 
         if playlist is None or len(playlist.playlistFiles) == 0:
             self.__timber.log('HalfLifeTtsManager', f'Failed to find any TTS files ({event=}) ({playlist=})')
@@ -123,6 +129,15 @@ class HalfLifeTtsManager(HalfLifeTtsManagerInterface):
         self.__timber.log('HalfLifeTtsManager', f'Playing {len(playlist.playlistFiles)} TTS message(s) in \"{event.twitchChannel}\"...')
         await self.__executeTts(playlist)
 
+    async def prepareTtsEvent(self, event: TtsEvent):
+        if not isinstance(event, TtsEvent):
+            raise TypeError(f'event argument is malformed: \"{event}\"')
+
+        if not await self.__ttsSettingsRepository.isEnabled():
+            return
+
+        await self.__preparationCache.prepare(event, lambda: self.__processTtsEvent(event))
+
     async def __processTtsEvent(self, event: TtsEvent) -> SoundPlayerPlaylist | None:
         cleanedMessage = await self.__halfLifeMessageCleaner.clean(event.message)
         voice = await self.__determineVoice(event)
@@ -152,6 +167,8 @@ class HalfLifeTtsManager(HalfLifeTtsManagerInterface):
         )
 
     async def stopTtsEvent(self):
+        self.__preparationCache.cancelCurrent()
+
         if not self.isLoadingOrPlaying:
             return
 
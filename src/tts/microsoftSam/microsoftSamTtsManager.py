@@ -9,6 +9,7 @@ from ..models.ttsEvent import TtsEvent
 from ..models.ttsProvider import TtsProvider
 from ..models.ttsProviderOverridableStatus import TtsProviderOverridableStatus
 from ..settings.ttsSettingsRepositoryInterface import TtsSettingsRepositoryInterface
+from ..ttsPreparationCache import TtsPreparationCache
 from ...chatterPreferredTts.helper.chatterPreferredTtsHelperInterface import ChatterPreferredTtsHelperInterface
 from ...chatterPreferredTts.models.microsoftSam.microsoftSamTtsProperties import MicrosoftSamTtsProperties
 from ...microsoftSam.helper.microsoftSamHelperInterface import MicrosoftSamHelperInterface
@@ -59,6 +60,11 @@ class MicrosoftSamTtsManager(MicrosoftSamTtsManagerInterface):
         self.__ttsCommandBuilder: Final[TtsCommandBuilderInterface] = ttsCommandBuilder
         self.__ttsSettingsRepository: Final[TtsSettingsRepositoryInterface] = ttsSettingsRepository
 
+        self.__preparationCache: Final[TtsPreparationCache[MicrosoftSamFileReference]] = TtsPreparationCache(
+            timber = timber,
+            timberTag = 'MicrosoftSamTtsManager',
+        )
+
         self.__isLoadingOrPlaying: bool = False
 
     async def __determineVoice(self, event: TtsEvent) -> MicrosoftSamVoice | None:
@@ -118,7 +124,7 @@ class MicrosoftSamTtsManager(MicrosoftSamTtsManagerInterface):
             return
 
         self.__isLoadingOrPlaying = True
-        fileReference = await self.__processTtsEvent(event)
+        fileReference = await self.__preparationCache.take(event, lambda: self.__processTtsEvent(event))
 
         if fileReference is None:
             self.__timber.log('MicrosoftSamTtsManager', f'Failed to generate TTS ({event=}) ({fileReference=})')
@@ -128,6 +134,15 @@ class MicrosoftSamTtsManager(MicrosoftSamTtsManagerInterface):
         self.__timber.log('MicrosoftSamTtsManager', f'Playing TTS in \"{event.twitchChannel}\"...')
         await self.__executeTts(fileReference)
 
+    async def prepareTtsEvent(self, event: TtsEvent):
+        if not isinstance(event, TtsEvent):
+            raise TypeError(f'event argument is malformed: \"{event}\"')
+
+        if not await self.__ttsSettingsRepository.isEnabled():
+            return
+
+        await self.__preparationCache.prepare(event, lambda: self.__processTtsEvent(event))
+
     async def __processTtsEvent(self, event: TtsEvent) -> MicrosoftSamFileReference | None:
         donationPrefix = await self.__ttsCommandBuilder.buildDonationPrefix(event)
         message = await self.__microsoftSamMessageCleaner.clean(event.message)
@@ -142,6 +157,8 @@ class MicrosoftSamTtsManager(MicrosoftSamTtsManagerInterface):
         )
 
     async def stopTtsEvent(self):
+        self.__preparationCache.cancelCurrent()
+
         if not self.isLoadingOrPlaying:
             return
 
@@ -13,6 +13,10 @@ class StubCompositeTtsManager(CompositeTtsManagerInterface):
         # this method is intentionally empty
         return False
 
+    async def prepareTtsEvent(self, event: TtsEvent):
+        # this method is intentionally empty
+        pass
+
     async def stopTtsEvent(self):
         # this method is intentionally empty
         pass
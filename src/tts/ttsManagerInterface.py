@@ -15,6 +15,10 @@ class TtsManagerInterface(ABC):
     async def playTtsEvent(self, event: TtsEvent):
         pass
 
+    @abstractmethod
+    async def prepareTtsEvent(self, event: TtsEvent):
+        pass
+
     @abstractmethod
     async def stopTtsEvent(self):
         pass
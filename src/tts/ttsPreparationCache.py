@@ -0,0 +1,103 @@
+import asyncio
+import traceback
+from collections import OrderedDict
+from typing import Awaitable, Callable, Final, Generic, TypeVar
+
+from .models.ttsEvent import TtsEvent
+from ..misc import utils as utils
+from ..timber.timberInterface import TimberInterface
+
+T = TypeVar('T')
+
+
+class TtsPreparationCache(Generic[T]):
+
+    def __init__(
+        self,
+        timber: TimberInterface,
+        timberTag: str,
+        maxPreparedEvents: int = 8,
+    ):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidStr(timberTag):
+            raise TypeError(f'timberTag argument is malformed: \"{timberTag}\"')
+        elif not utils.isValidInt(maxPreparedEvents):
+            raise TypeError(f'maxPreparedEvents argument is malformed: \"{maxPreparedEvents}\"')
+        elif maxPreparedEvents < 1 or maxPreparedEvents > 64:
+            raise ValueError(f'maxPreparedEvents argument is out of bounds: {maxPreparedEvents}')
+
+        self.__timber: Final[TimberInterface] = timber
+        self.__timberTag: Final[str] = timberTag
+        self.__maxPreparedEvents: Final[int] = maxPreparedEvents
+
+        self.__preparations: Final[OrderedDict[TtsEvent, asyncio.Task[T | None]]] = OrderedDict()
+        self.__currentPreparation: asyncio.Task[T | None] | None = None
+
+    def cancelCurrent(self):
+        currentPreparation = self.__currentPreparation
+        self.__currentPreparation = None
+
+        if currentPreparation is not None:
+            currentPreparation.cancel()
+
+    async def prepare(
+        self,
+        event: TtsEvent,
+        generator: Callable[[], Awaitable[T | None]],
+    ):
+        if not isinstance(event, TtsEvent):
+            raise TypeError(f'event argument is malformed: \"{event}\"')
+        elif not callable(generator):
+            raise TypeError(f'generator argument is malformed: \"{generator}\"')
+
+        if event in self.__preparations:
+            return
+
+        while len(self.__preparations) >= self.__maxPreparedEvents:
+            # the oldest preparation is the one least likely to still be wanted
+            _, oldestPreparation = self.__preparations.popitem(last = False)
+            oldestPreparation.cancel()
+
+        preparation: asyncio.Task[T | None] = asyncio.ensure_future(generator())
+        self.__preparations[event] = preparation
+
+        try:
+            await asyncio.shield(preparation)
+        except asyncio.CancelledError:
+            if not preparation.cancelled():
+                raise
+        except Exception as e:
+            self.__timber.log(self.__timberTag, f'Failed to prepare TTS event ahead of time ({event=}): {e}', e, traceback.format_exc())
+
+    async def take(
+        self,
+        event: TtsEvent,
+        generator: Callable[[], Awaitable[T | None]],
+    ) -> T | None:
+        if not isinstance(event, TtsEvent):
+            raise TypeError(f'event argument is malformed: \"{event}\"')
+        elif not callable(generator):
+            raise TypeError(f'generator argument is malformed: \"{generator}\"')
+
+        preparation = self.__preparations.pop(event, None)
+
+        if preparation is None:
+            preparation = asyncio.ensure_future(generator())
+        elif preparation.done() and not preparation.cancelled() and preparation.exception() is not None:
+            # the earlier attempt failed, so give it one more go now that it's actually needed
+            preparation = asyncio.ensure_future(generator())
+
+        self.__currentPreparation = preparation
+
+        try:
+            return await preparation
+        except asyncio.CancelledError:
+            if not preparation.cancelled():
+                raise
+
+            self.__timber.log(self.__timberTag, f'TTS event preparation was cancelled ({event=})')
+            return None
+        finally:
+            if self.__currentPreparation is preparation:
+                self.__currentPreparation = None
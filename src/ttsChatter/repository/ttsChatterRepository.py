@@ -44,16 +44,18 @@ class TtsChatterRepository(TtsChatterRepositoryInterface):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO ttschatter (chatteruserid, twitchchannelid)
-                VALUES ($1, $2)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO NOTHING
-            ''',
-            chatterUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO ttschatter (chatteruserid, twitchchannelid)
+                    VALUES ($1, $2)
+                    ON CONFLICT (chatteruserid, twitchchannelid) DO NOTHING
+                ''',
+                chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__cache[f'{twitchChannelId}:{chatterUserId}'] = True
         self.__timber.log('TtsChatterRepository', f'Added TTS Chatter ({chatterUserId=}) ({twitchChannelId=})')
 
@@ -72,33 +74,34 @@ class TtsChatterRepository(TtsChatterRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS ttschatter (
-                            chatteruserid text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS ttschatter (
-                            chatteruserid TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS ttschatter (
+                                chatteruserid text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS ttschatter (
+                                chatteruserid TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                PRIMARY KEY (chatteruserid, twitchchannelid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def isTtsChatter(
         self,
@@ -115,16 +118,18 @@ class TtsChatterRepository(TtsChatterRepositoryInterface):
             return cachedValue
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT COUNT(1) FROM ttschatter
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-                LIMIT 1
-            ''',
-            chatterUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT COUNT(1) FROM ttschatter
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                    LIMIT 1
+                ''',
+                chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
 
         count: int | None = None
         if record is not None and len(record) >= 1:
@@ -156,15 +161,17 @@ class TtsChatterRepository(TtsChatterRepositoryInterface):
             return False
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM ttschatter
-                WHERE chatteruserid = $1 AND twitchchannelid = $2
-            ''',
-            chatterUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM ttschatter
+                    WHERE chatteruserid = $1 AND twitchchannelid = $2
+                ''',
+                chatterUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__cache[f'{twitchChannelId}:{chatterUserId}'] = False
         self.__timber.log('TtsChatterRepository', f'Removed TTS Chatter ({chatterUserId=}) ({twitchChannelId=})')
 
@@ -19,6 +19,7 @@ from ..models.ttsMonsterMessageChunk import TtsMonsterMessageChunk
 from ..models.ttsMonsterVoice import TtsMonsterVoice
 from ..settings.ttsMonsterSettingsRepositoryInterface import TtsMonsterSettingsRepositoryInterface
 from ...glacialTtsStorage.fileRetriever.glacialTtsFileRetrieverInterface import GlacialTtsFileRetrieverInterface
+from ...glacialTtsStorage.models.glacialTtsFileReference import GlacialTtsFileReference
 from ...misc import utils as utils
 from ...timber.timberInterface import TimberInterface
 from ...tts.models.ttsProvider import TtsProvider
@@ -143,6 +144,31 @@ class TtsMonsterHelper(TtsMonsterHelperInterface):
             primaryVoice = primaryVoice,
         )
 
+    async def __createSpeechFile(
+        self,
+        glacialFile: GlacialTtsFileReference,
+        fullMessage: str,
+        twitchChannel: str,
+        twitchChannelId: str,
+    ) -> bool:
+        speechBytes = await self.__ttsMonsterPrivateApiHelper.getSpeech(
+            message = fullMessage,
+            twitchChannel = twitchChannel,
+            twitchChannelId = twitchChannelId,
+        )
+
+        if speechBytes is None:
+            return False
+        elif await self.__saveSpeechBytes(
+            speechBytes = speechBytes,
+            fileName = glacialFile.fileName,
+            filePath = glacialFile.filePath,
+        ):
+            return True
+        else:
+            self.__timber.log('TtsMonsterHelper', f'Failed to write TTS Monster speechBytes to file ({fullMessage=}) ({glacialFile=})')
+            return False
+
     async def generateTts(
         self,
         donationPrefix: str | None,
@@ -178,50 +204,28 @@ class TtsMonsterHelper(TtsMonsterHelperInterface):
 
         messageVoices = await self.__determineMessageVoices(fullMessage)
 
-        glacialFile = await self.__glacialTtsFileRetriever.findFile(
+        glacialFile = await self.__glacialTtsFileRetriever.findOrCreateFile(
+            fileExtension = await self.__ttsMonsterSettingsRepository.getFileExtension(),
             message = fullMessage,
             voice = None,
             provider = TtsProvider.TTS_MONSTER,
+            createFile = lambda glacialFile: self.__createSpeechFile(
+                glacialFile = glacialFile,
+                fullMessage = fullMessage,
+                twitchChannel = twitchChannel,
+                twitchChannelId = twitchChannelId,
+            ),
         )
 
-        if glacialFile is not None:
-            return TtsMonsterFileReference(
-                storeDateTime = glacialFile.storeDateTime,
-                allVoices = messageVoices.allVoices,
-                filePath = glacialFile.filePath,
-                primaryVoice = messageVoices.primaryVoice,
-            )
-
-        speechBytes = await self.__ttsMonsterPrivateApiHelper.getSpeech(
-            message = fullMessage,
-            twitchChannel = twitchChannel,
-            twitchChannelId = twitchChannelId,
-        )
-
-        if speechBytes is None:
+        if glacialFile is None:
             return None
 
-        glacialFile = await self.__glacialTtsFileRetriever.saveFile(
-            fileExtension = await self.__ttsMonsterSettingsRepository.getFileExtension(),
-            message = fullMessage,
-            voice = None,
-            provider = TtsProvider.TTS_MONSTER,
-        )
-
-        if await self.__saveSpeechBytes(
-            speechBytes = speechBytes,
-            fileName = glacialFile.fileName,
+        return TtsMonsterFileReference(
+            storeDateTime = glacialFile.storeDateTime,
+            allVoices = messageVoices.allVoices,
             filePath = glacialFile.filePath,
-        ):
-            return TtsMonsterFileReference(
-                storeDateTime = glacialFile.storeDateTime,
-                allVoices = messageVoices.allVoices,
-                filePath = glacialFile.filePath,
-                primaryVoice = messageVoices.primaryVoice,
-            )
-        else:
-            self.__timber.log('TtsMonsterHelper', f'Failed to write TTS Monster speechBytes to file ({fullMessage=}) ({glacialFile=})')
-            return None
+            primaryVoice = messageVoices.primaryVoice,
+        )
 
     async def __saveSpeechBytes(
         self,
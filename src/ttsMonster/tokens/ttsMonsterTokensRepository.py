@@ -97,16 +97,18 @@ class TtsMonsterTokensRepository(TtsMonsterTokensRepositoryInterface):
             return self.__cache[twitchChannelId]
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT key, userid FROM ttsmonstertokens
-                WHERE twitchchannelid = $1
-                LIMIT 1
-            ''',
-            twitchChannelId,
-        )
-
-        await connection.close()
+
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT key, userid FROM ttsmonstertokens
+                    WHERE twitchchannelid = $1
+                    LIMIT 1
+                ''',
+                twitchChannelId,
+            )
+        finally:
+            await connection.close()
         tokens: TtsMonsterTokens | None = None
 
         if record is not None and len(record) >= 1:
@@ -130,33 +132,34 @@ class TtsMonsterTokensRepository(TtsMonsterTokensRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS ttsmonstertokens (
-                            key text NOT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY,
-                            userid text NOT NULL
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS ttsmonstertokens (
-                            key TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY,
-                            userid TEXT NOT NULL
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS ttsmonstertokens (
+                                key text NOT NULL,
+                                twitchchannelid text NOT NULL PRIMARY KEY,
+                                userid text NOT NULL
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS ttsmonstertokens (
+                                key TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL PRIMARY KEY,
+                                userid TEXT NOT NULL
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
         await self.__consumeSeedFile()
 
     async def set(
@@ -174,34 +177,35 @@ class TtsMonsterTokensRepository(TtsMonsterTokensRepositoryInterface):
 
         connection = await self.__getDatabaseConnection()
 
-        if utils.isValidStr(ttsMonsterKey) and utils.isValidStr(ttsMonsterUserId):
-            await connection.execute(
-                '''
-                    INSERT INTO ttsmonstertokens (key, twitchchannelid, userid)
-                    VALUES ($1, $2, $3)
-                    ON CONFLICT (twitchchannelid) DO UPDATE SET key = EXCLUDED.key, userid = EXCLUDED.userid
-                ''',
-                ttsMonsterKey, twitchChannelId, ttsMonsterUserId,
-            )
-
-            tokens = TtsMonsterTokens(
-                key = ttsMonsterKey,
-                twitchChannelId = twitchChannelId,
-                userId = ttsMonsterUserId,
-            )
+        try:
+            if utils.isValidStr(ttsMonsterKey) and utils.isValidStr(ttsMonsterUserId):
+                await connection.execute(
+                    '''
+                        INSERT INTO ttsmonstertokens (key, twitchchannelid, userid)
+                        VALUES ($1, $2, $3)
+                        ON CONFLICT (twitchchannelid) DO UPDATE SET key = EXCLUDED.key, userid = EXCLUDED.userid
+                    ''',
+                    ttsMonsterKey, twitchChannelId, ttsMonsterUserId,
+                )
 
-            self.__cache[twitchChannelId] = tokens
-            self.__timber.log('TtsMonsterTokensRepository', f'TTS Monster key and user ID has been updated ({tokens=})')
-        else:
-            await connection.execute(
-                '''
-                    DELETE FROM ttsmonstertokens
-                    WHERE twitchchannelid = $1
-                ''',
-                twitchChannelId,
-            )
+                tokens = TtsMonsterTokens(
+                    key = ttsMonsterKey,
+                    twitchChannelId = twitchChannelId,
+                    userId = ttsMonsterUserId,
+                )
 
-            self.__cache[twitchChannelId] = None
-            self.__timber.log('TtsMonsterTokensRepository', f'TTS Monster key and user ID has been deleted ({twitchChannelId=})')
+                self.__cache[twitchChannelId] = tokens
+                self.__timber.log('TtsMonsterTokensRepository', f'TTS Monster key and user ID has been updated ({tokens=})')
+            else:
+                await connection.execute(
+                    '''
+                        DELETE FROM ttsmonstertokens
+                        WHERE twitchchannelid = $1
+                    ''',
+                    twitchChannelId,
+                )
 
-        await connection.close()
+                self.__cache[twitchChannelId] = None
+                self.__timber.log('TtsMonsterTokensRepository', f'TTS Monster key and user ID has been deleted ({twitchChannelId=})')
+        finally:
+            await connection.close()
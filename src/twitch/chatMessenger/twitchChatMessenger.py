@@ -1,14 +1,14 @@
 import asyncio
-import queue
+import time
 import traceback
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 from typing import Final
 
 from frozenlist import FrozenList
 
 from .chatMessage import ChatMessage
 from .twitchChatMessengerInterface import TwitchChatMessengerInterface
+from .twitchChatMessengerMetrics import TwitchChatMessengerMetrics
 from ..api.models.twitchSendChatMessageRequest import TwitchSendChatMessageRequest
 from ..api.models.twitchSendChatMessageResponse import TwitchSendChatMessageResponse
 from ..api.twitchApiServiceInterface import TwitchApiServiceInterface
@@ -18,6 +18,10 @@ from ..twitchHandleProviderInterface import TwitchHandleProviderInterface
 from ...location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ...misc import utils as utils
 from ...misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ...misc.keyedLanes import KeyedLanes
+from ...misc.tokenBucket import TokenBucket
+from ...misc.ttlCache import TtlCache
+from ...misc.workQueue.workQueue import WorkQueue
 from ...sentMessageLogger.messageMethod import MessageMethod
 from ...sentMessageLogger.sentMessageLoggerInterface import SentMessageLoggerInterface
 from ...timber.timberInterface import TimberInterface
@@ -37,9 +41,13 @@ class TwitchChatMessenger(TwitchChatMessengerInterface):
         twitchHandleProvider: TwitchHandleProviderInterface,
         twitchTokensRepository: TwitchTokensRepositoryInterface,
         userIdsRepository: UserIdsRepositoryInterface,
-        sleepTimeSeconds: float = 0.125,
+        accessTokenCacheSeconds: float = 300,
         maxMessageSplits: int = 3,
-        queueTimeoutSeconds: int = 3,
+        maxMessagesPerPeriod: int = 20,
+        maxModeratorMessagesPerPeriod: int = 100,
+        rateLimitPeriodSeconds: float = 30,
+        moderatorCacheTimeToLive: timedelta = timedelta(minutes = 30),
+        twitchChannelNameCacheTimeToLive: timedelta = timedelta(hours = 6),
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -59,18 +67,30 @@ class TwitchChatMessenger(TwitchChatMessengerInterface):
             raise TypeError(f'twitchTokensRepository argument is malformed: \"{twitchTokensRepository}\"')
         elif not isinstance(userIdsRepository, UserIdsRepositoryInterface):
             raise TypeError(f'userIdsRepository argument is malformed: \"{userIdsRepository}\"')
-        elif not utils.isValidNum(sleepTimeSeconds):
-            raise TypeError(f'sleepTimeSeconds argument is malformed: \"{sleepTimeSeconds}\"')
-        elif sleepTimeSeconds < 0.125 or sleepTimeSeconds > 3:
-            raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
+        elif not utils.isValidNum(accessTokenCacheSeconds):
+            raise TypeError(f'accessTokenCacheSeconds argument is malformed: \"{accessTokenCacheSeconds}\"')
+        elif accessTokenCacheSeconds < 0 or accessTokenCacheSeconds > 3600:
+            raise ValueError(f'accessTokenCacheSeconds argument is out of bounds: {accessTokenCacheSeconds}')
         elif not utils.isValidInt(maxMessageSplits):
             raise TypeError(f'maxMessageSplits argument is malformed: \"{maxMessageSplits}\"')
         elif maxMessageSplits < 0 or maxMessageSplits > 5:
             raise ValueError(f'maxMessageSplits argument is out of bounds: {maxMessageSplits}')
-        elif not utils.isValidInt(queueTimeoutSeconds):
-            raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
-        elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
-            raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
+        elif not utils.isValidInt(maxMessagesPerPeriod):
+            raise TypeError(f'maxMessagesPerPeriod argument is malformed: \"{maxMessagesPerPeriod}\"')
+        elif maxMessagesPerPeriod < 1 or maxMessagesPerPeriod > 1000:
+            raise ValueError(f'maxMessagesPerPeriod argument is out of bounds: {maxMessagesPerPeriod}')
+        elif not utils.isValidInt(maxModeratorMessagesPerPeriod):
+            raise TypeError(f'maxModeratorMessagesPerPeriod argument is malformed: \"{maxModeratorMessagesPerPeriod}\"')
+        elif maxModeratorMessagesPerPeriod < maxMessagesPerPeriod or maxModeratorMessagesPerPeriod > 1000:
+            raise ValueError(f'maxModeratorMessagesPerPeriod argument is out of bounds: {maxModeratorMessagesPerPeriod}')
+        elif not utils.isValidNum(rateLimitPeriodSeconds):
+            raise TypeError(f'rateLimitPeriodSeconds argument is malformed: \"{rateLimitPeriodSeconds}\"')
+        elif rateLimitPeriodSeconds < 1 or rateLimitPeriodSeconds > 300:
+            raise ValueError(f'rateLimitPeriodSeconds argument is out of bounds: {rateLimitPeriodSeconds}')
+        elif not isinstance(moderatorCacheTimeToLive, timedelta):
+            raise TypeError(f'moderatorCacheTimeToLive argument is malformed: \"{moderatorCacheTimeToLive}\"')
+        elif not isinstance(twitchChannelNameCacheTimeToLive, timedelta):
+            raise TypeError(f'twitchChannelNameCacheTimeToLive argument is malformed: \"{twitchChannelNameCacheTimeToLive}\"')
 
         self.__backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = backgroundTaskHelper
         self.__globalTwitchConstants: Final[GlobalTwitchConstants] = globalTwitchConstants
@@ -81,14 +101,44 @@ class TwitchChatMessenger(TwitchChatMessengerInterface):
         self.__twitchHandleProvider: Final[TwitchHandleProviderInterface] = twitchHandleProvider
         self.__twitchTokensRepository: Final[TwitchTokensRepositoryInterface] = twitchTokensRepository
         self.__userIdsRepository: Final[UserIdsRepositoryInterface] = userIdsRepository
-        self.__sleepTimeSeconds: Final[float] = sleepTimeSeconds
+        self.__accessTokenCacheSeconds: Final[float] = accessTokenCacheSeconds
         self.__maxMessageSplits: Final[int] = maxMessageSplits
-        self.__queueTimeoutSeconds: Final[int] = queueTimeoutSeconds
+
+        # Twitch limits how many messages a single sender can send within a rolling window. That
+        # limit is much higher in channels where the sender is a moderator (or the broadcaster),
+        # so every send consumes a token from the sender-wide bucket, and sends to channels where
+        # we aren't a moderator additionally consume a token from the stricter regular bucket.
+        self.__regularTokenBucket: Final[TokenBucket] = TokenBucket(
+            capacity = maxMessagesPerPeriod,
+            refillPeriodSeconds = rateLimitPeriodSeconds,
+        )
+
+        self.__senderTokenBucket: Final[TokenBucket] = TokenBucket(
+            capacity = maxModeratorMessagesPerPeriod,
+            refillPeriodSeconds = rateLimitPeriodSeconds,
+        )
 
         self.__isStarted: bool = False
-        self.__messageQueue: Final[SimpleQueue[ChatMessage]] = SimpleQueue()
+        self.__messageQueue: Final[WorkQueue[ChatMessage]] = WorkQueue(backgroundTaskHelper.eventLoop)
+
+        self.__channelLanes: Final[KeyedLanes[tuple[float, ChatMessage]]] = KeyedLanes(
+            backgroundTaskHelper = backgroundTaskHelper,
+            laneHandler = self.__sendQueuedChatMessage,
+            timber = timber,
+        )
+
+        self.__isModeratorByChannelId: Final[TtlCache[bool]] = TtlCache(timeToLive = moderatorCacheTimeToLive)
+        self.__twitchChannelNamesById: Final[TtlCache[str]] = TtlCache(timeToLive = twitchChannelNameCacheTimeToLive)
+        self.__selfTwitchAccessToken: str | None = None
+        self.__selfTwitchAccessTokenTime: float = 0
         self.__selfTwitchUserId: str | None = None
 
+        self.__maxSendLatencySeconds: float = 0
+        self.__totalMessagesFailed: int = 0
+        self.__totalMessagesSent: int = 0
+        self.__totalSendLatencySeconds: float = 0
+        self.__totalSendLatencySamples: int = 0
+
     async def __checkIfChatMessageWasSuccessfullySent(
         self,
         sendChatMessageResponse: TwitchSendChatMessageResponse | None,
@@ -102,13 +152,47 @@ class TwitchChatMessenger(TwitchChatMessengerInterface):
 
         return True
 
+    async def clearCaches(self):
+        self.__isModeratorByChannelId.clear()
+        self.__twitchChannelNamesById.clear()
+        self.__selfTwitchAccessToken = None
+        self.__selfTwitchUserId = None
+        self.__timber.log('TwitchChatMessenger', 'Caches cleared')
+
+    def __enqueueChatMessage(self, chatMessage: ChatMessage):
+        self.__channelLanes.submit(chatMessage.twitchChannelId, (time.monotonic(), chatMessage))
+
+    def getMetrics(self) -> TwitchChatMessengerMetrics:
+        averageSendLatencySeconds: float = 0
+
+        if self.__totalSendLatencySamples >= 1:
+            averageSendLatencySeconds = self.__totalSendLatencySeconds / self.__totalSendLatencySamples
+
+        return TwitchChatMessengerMetrics(
+            channelQueueDepths = self.__channelLanes.getQueueDepths(),
+            averageSendLatencySeconds = averageSendLatencySeconds,
+            maxSendLatencySeconds = self.__maxSendLatencySeconds,
+            pendingMessages = self.__messageQueue.qsize() + len(self.__channelLanes),
+            totalMessagesFailed = self.__totalMessagesFailed,
+            totalMessagesSent = self.__totalMessagesSent,
+        )
+
     async def __getSelfTwitchAccessToken(self) -> str:
+        selfTwitchAccessToken = self.__selfTwitchAccessToken
+
+        if selfTwitchAccessToken is not None and time.monotonic() - self.__selfTwitchAccessTokenTime < self.__accessTokenCacheSeconds:
+            return selfTwitchAccessToken
+
         selfTwitchUserId = await self.__getSelfTwitchUserId()
 
-        return await self.__twitchTokensRepository.requireAccessTokenById(
+        selfTwitchAccessToken = await self.__twitchTokensRepository.requireAccessTokenById(
             twitchChannelId = selfTwitchUserId,
         )
 
+        self.__selfTwitchAccessToken = selfTwitchAccessToken
+        self.__selfTwitchAccessTokenTime = time.monotonic()
+        return selfTwitchAccessToken
+
     async def __getSelfTwitchUserId(self) -> str:
         selfTwitchUserId = self.__selfTwitchUserId
 
@@ -119,20 +203,81 @@ class TwitchChatMessenger(TwitchChatMessengerInterface):
 
         return selfTwitchUserId
 
+    async def __getTwitchChannelName(
+        self,
+        twitchChannelId: str,
+        selfTwitchAccessToken: str,
+    ) -> str:
+        twitchChannel = self.__twitchChannelNamesById.get(twitchChannelId)
+
+        if twitchChannel is None:
+            twitchChannel = await self.__userIdsRepository.requireUserName(
+                userId = twitchChannelId,
+                twitchAccessToken = selfTwitchAccessToken,
+            )
+
+            self.__twitchChannelNamesById.set(twitchChannelId, twitchChannel)
+
+        return twitchChannel
+
     async def __handleChatMessage(self, chatMessage: ChatMessage):
         if not isinstance(chatMessage, ChatMessage):
             raise TypeError(f'chatMessage argument is malformed: \"{chatMessage}\"')
 
         if chatMessage.sendAfter is None:
-            await self.__sendChatMessage(chatMessage)
+            self.__enqueueChatMessage(chatMessage)
             return
 
         now = datetime.now(self.__timeZoneRepository.getDefault())
 
         if now < chatMessage.sendAfter:
-            self.__submitChatMessage(chatMessage)
+            delaySeconds = (chatMessage.sendAfter - now).total_seconds()
+            self.__backgroundTaskHelper.createTask(self.__submitChatMessageAfterDelay(chatMessage, delaySeconds))
         else:
-            await self.__sendChatMessage(chatMessage)
+            self.__enqueueChatMessage(chatMessage)
+
+    async def __isModerator(
+        self,
+        twitchChannelId: str,
+        selfTwitchUserId: str,
+    ) -> bool:
+        isModerator = self.__isModeratorByChannelId.get(twitchChannelId)
+
+        if isModerator is not None:
+            return isModerator
+        elif twitchChannelId == selfTwitchUserId:
+            self.__isModeratorByChannelId.set(twitchChannelId, True)
+            return True
+
+        # we can only look up the moderator list with the broadcaster's own access token
+        twitchChannelAccessToken = await self.__twitchTokensRepository.getAccessTokenById(
+            twitchChannelId = twitchChannelId,
+        )
+
+        if not utils.isValidStr(twitchChannelAccessToken):
+            self.__isModeratorByChannelId.set(twitchChannelId, False)
+            return False
+
+        try:
+            moderatorsResponse = await self.__twitchApiService.fetchModerator(
+                broadcasterId = twitchChannelId,
+                twitchAccessToken = twitchChannelAccessToken,
+                userId = selfTwitchUserId,
+            )
+        except Exception as e:
+            # don't cache this result, so that we try again for this channel's next message
+            self.__timber.log('TwitchChatMessenger', f'Failed to fetch Twitch moderator info, falling back to the regular rate limit ({twitchChannelId=}) ({selfTwitchUserId=})', e, traceback.format_exc())
+            return False
+
+        isModerator = False
+
+        for moderatorUser in moderatorsResponse.data:
+            if moderatorUser.userId == selfTwitchUserId:
+                isModerator = True
+                break
+
+        self.__isModeratorByChannelId.set(twitchChannelId, isModerator)
+        return isModerator
 
     async def __prepareChatMessageTexts(
         self,
@@ -198,13 +343,23 @@ class TwitchChatMessenger(TwitchChatMessengerInterface):
         selfTwitchAccessToken = await self.__getSelfTwitchAccessToken()
         selfTwitchUserId = await self.__getSelfTwitchUserId()
 
-        twitchChannel = await self.__userIdsRepository.requireUserName(
-            userId = chatMessage.twitchChannelId,
-            twitchAccessToken = selfTwitchAccessToken,
+        twitchChannel = await self.__getTwitchChannelName(
+            twitchChannelId = chatMessage.twitchChannelId,
+            selfTwitchAccessToken = selfTwitchAccessToken,
+        )
+
+        isModerator = await self.__isModerator(
+            twitchChannelId = chatMessage.twitchChannelId,
+            selfTwitchUserId = selfTwitchUserId,
         )
 
         for text in texts:
-            await self.__sendChatMessageText(
+            if not isModerator:
+                await self.__regularTokenBucket.acquire()
+
+            await self.__senderTokenBucket.acquire()
+
+            successfullySent = await self.__sendChatMessageText(
                 chatMessage = chatMessage,
                 selfTwitchAccessToken = selfTwitchAccessToken,
                 selfTwitchUserId = selfTwitchUserId,
@@ -212,6 +367,14 @@ class TwitchChatMessenger(TwitchChatMessengerInterface):
                 twitchChannel = twitchChannel,
             )
 
+            if successfullySent:
+                self.__totalMessagesSent += 1
+            else:
+                self.__totalMessagesFailed += 1
+
+                # the cached access token may have been refreshed out from under us
+                self.__selfTwitchAccessToken = None
+
     async def __sendChatMessageText(
         self,
         chatMessage: ChatMessage,
@@ -219,7 +382,7 @@ class TwitchChatMessenger(TwitchChatMessengerInterface):
         selfTwitchUserId: str,
         text: str,
         twitchChannel: str,
-    ):
+    ) -> bool:
         sendAttempt = 0
         shouldRetry = False
         successfullySent = False
@@ -271,6 +434,25 @@ class TwitchChatMessenger(TwitchChatMessengerInterface):
             twitchChannel = twitchChannel,
         )
 
+        return successfullySent
+
+    async def __sendQueuedChatMessage(
+        self,
+        twitchChannelId: str,
+        queuedChatMessage: tuple[float, ChatMessage],
+    ):
+        enqueueTime, chatMessage = queuedChatMessage
+
+        try:
+            await self.__sendChatMessage(chatMessage)
+        except Exception as e:
+            self.__timber.log('TwitchChatMessenger', f'Encountered unknown Exception when sending chat message ({twitchChannelId=}) ({chatMessage=}): {e}', e, traceback.format_exc())
+
+        sendLatencySeconds = time.monotonic() - enqueueTime
+        self.__maxSendLatencySeconds = max(self.__maxSendLatencySeconds, sendLatencySeconds)
+        self.__totalSendLatencySeconds += sendLatencySeconds
+        self.__totalSendLatencySamples += 1
+
     def start(self):
         if self.__isStarted:
             self.__timber.log('TwitchChatMessenger', 'Not starting TwitchChatMessenger as it has already been started')
@@ -282,16 +464,7 @@ class TwitchChatMessenger(TwitchChatMessengerInterface):
 
     async def __startMessageLoop(self):
         while True:
-            chatMessages: FrozenList[ChatMessage] = FrozenList()
-
-            try:
-                while not self.__messageQueue.empty():
-                    chatMessage = self.__messageQueue.get_nowait()
-                    chatMessages.append(chatMessage)
-            except queue.Empty as e:
-                self.__timber.log('TwitchChatMessenger', f'Encountered queue.Empty when building up chat messages list (queue size: {self.__messageQueue.qsize()}) ({len(chatMessages)=}): {e}', e, traceback.format_exc())
-
-            chatMessages.freeze()
+            chatMessages = await self.__messageQueue.getBatch()
 
             for index, chatMessage in enumerate(chatMessages):
                 try:
@@ -299,17 +472,12 @@ class TwitchChatMessenger(TwitchChatMessengerInterface):
                 except Exception as e:
                     self.__timber.log('TwitchChatMessenger', f'Encountered unknown Exception when looping through chat messages (queue size: {self.__messageQueue.qsize()}) ({len(chatMessages)=}) ({index=}) ({chatMessage=}): {e}', e, traceback.format_exc())
 
-            await asyncio.sleep(self.__sleepTimeSeconds)
-
     def __submitChatMessage(self, chatMessage: ChatMessage):
         if not isinstance(chatMessage, ChatMessage):
             raise TypeError(f'chatMessage argument is malformed: \"{chatMessage}\"')
 
-        try:
-            self.__messageQueue.put(
-                item = chatMessage,
-                block = True,
-                timeout = self.__queueTimeoutSeconds,
-            )
-        except queue.Full as e:
-            self.__timber.log('TwitchChatMessenger', f'Encountered queue.Full when submitting a new chat message ({chatMessage}) into the action queue (queue size: {self.__messageQueue.qsize()}): {e}', e, traceback.format_exc())
+        self.__messageQueue.put(chatMessage)
+
+    async def __submitChatMessageAfterDelay(self, chatMessage: ChatMessage, delaySeconds: float):
+        await asyncio.sleep(delaySeconds)
+        self.__submitChatMessage(chatMessage)
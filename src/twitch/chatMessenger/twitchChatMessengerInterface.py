@@ -1,7 +1,14 @@
 from abc import ABC, abstractmethod
 
+from .twitchChatMessengerMetrics import TwitchChatMessengerMetrics
+from ...misc.clearable import Clearable
 
-class TwitchChatMessengerInterface(ABC):
+
+class TwitchChatMessengerInterface(Clearable, ABC):
+
+    @abstractmethod
+    def getMetrics(self) -> TwitchChatMessengerMetrics:
+        pass
 
     @abstractmethod
     def send(
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from frozendict import frozendict
+
+
+@dataclass(frozen = True)
+class TwitchChatMessengerMetrics:
+    channelQueueDepths: frozendict[str, int]
+    averageSendLatencySeconds: float
+    maxSendLatencySeconds: float
+    pendingMessages: int
+    totalMessagesFailed: int
+    totalMessagesSent: int
@@ -99,16 +99,18 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
         userId: str,
     ) -> TwitchFollowingStatus | None:
         connection = await self.__getDatabaseConnection()
-        record = await connection.execute(
-            '''
-                SELECT datetime FROM twitchfollowingstatus
-                WHERE twitchchannelid = $1 AND userid = $2
-                LIMIT 1
-            ''',
-            twitchChannelId, userId,
-        )
 
-        await connection.close()
+        try:
+            record = await connection.execute(
+                '''
+                    SELECT datetime FROM twitchfollowingstatus
+                    WHERE twitchchannelid = $1 AND userid = $2
+                    LIMIT 1
+                ''',
+                twitchChannelId, userId,
+            )
+        finally:
+            await connection.close()
 
         if record is None or len(record) == 0:
             return None
@@ -156,35 +158,36 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchfollowingstatus (
-                            datetime text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchfollowingstatus (
-                            datetime TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS twitchfollowingstatus (
+                                datetime text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                userid text NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS twitchfollowingstatus (
+                                datetime TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                userid TEXT NOT NULL,
+                                PRIMARY KEY (twitchchannelid, userid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def isFollowing(
         self,
@@ -222,22 +225,23 @@ class TwitchFollowingStatusRepository(TwitchFollowingStatusRepositoryInterface):
 
         connection = await self.__getDatabaseConnection()
 
-        if followedAt is None:
-            await connection.execute(
-                '''
-                    DELETE FROM twitchfollowingstatus
-                    WHERE twitchchannelid = $1 AND userid = $2
-                ''',
-                twitchChannelId, userId,
-            )
-        else:
-            await connection.execute(
-                '''
-                    INSERT INTO twitchfollowingstatus (datetime, twitchchannelid, userid)
-                    VALUES ($1, $2, $3)
-                    ON CONFLICT (twitchchannelid, userid) DO UPDATE SET datetime = EXCLUDED.datetime
-                ''',
-                followedAt.isoformat(), twitchChannelId, userId,
-            )
-
-        await connection.close()
+        try:
+            if followedAt is None:
+                await connection.execute(
+                    '''
+                        DELETE FROM twitchfollowingstatus
+                        WHERE twitchchannelid = $1 AND userid = $2
+                    ''',
+                    twitchChannelId, userId,
+                )
+            else:
+                await connection.execute(
+                    '''
+                        INSERT INTO twitchfollowingstatus (datetime, twitchchannelid, userid)
+                        VALUES ($1, $2, $3)
+                        ON CONFLICT (twitchchannelid, userid) DO UPDATE SET datetime = EXCLUDED.datetime
+                    ''',
+                    followedAt.isoformat(), twitchChannelId, userId,
+                )
+        finally:
+            await connection.close()
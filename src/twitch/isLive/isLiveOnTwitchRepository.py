@@ -1,4 +1,5 @@
 from datetime import timedelta
+from typing import Final
 
 from frozendict import frozendict
 
@@ -8,7 +9,7 @@ from ..api.twitchApiServiceInterface import TwitchApiServiceInterface
 from ..tokens.twitchTokensRepositoryInterface import TwitchTokensRepositoryInterface
 from ...misc import utils as utils
 from ...misc.administratorProviderInterface import AdministratorProviderInterface
-from ...misc.timedDict import TimedDict
+from ...misc.ttlCache import TtlCache
 from ...timber.timberInterface import TimberInterface
 
 
@@ -20,7 +21,8 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
         timber: TimberInterface,
         twitchApiService: TwitchApiServiceInterface,
         twitchTokensRepository: TwitchTokensRepositoryInterface,
-        cacheTimeDelta: timedelta = timedelta(minutes = 10)
+        cacheTimeDelta: timedelta = timedelta(minutes = 10),
+        cacheSize: int = 256,
     ):
         if not isinstance(administratorProvider, AdministratorProviderInterface):
             raise TypeError(f'administratorProvider argument is malformed: \"{administratorProvider}\"')
@@ -32,13 +34,20 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
             raise TypeError(f'twitchTokensRepositoryInterface argument is malformed: \"{twitchTokensRepository}\"')
         elif not isinstance(cacheTimeDelta, timedelta):
             raise TypeError(f'cacheTimeDelta argument is malformed: \"{cacheTimeDelta}\"')
+        elif not utils.isValidInt(cacheSize):
+            raise TypeError(f'cacheSize argument is malformed: \"{cacheSize}\"')
+        elif cacheSize < 1 or cacheSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'cacheSize argument is out of bounds: {cacheSize}')
 
         self.__administratorProvider: AdministratorProviderInterface = administratorProvider
         self.__timber: TimberInterface = timber
         self.__twitchApiService: TwitchApiServiceInterface = twitchApiService
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
 
-        self.__cache: TimedDict[bool] = TimedDict(cacheTimeDelta)
+        self.__cache: Final[TtlCache[bool]] = TtlCache(
+            maxSize = cacheSize,
+            timeToLive = cacheTimeDelta,
+        )
 
     async def areLive(self, twitchChannelIds: set[str]) -> frozendict[str, bool]:
         if not isinstance(twitchChannelIds, set):
@@ -62,8 +71,9 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
         return frozendict(twitchChannelIdToLiveStatus)
 
     async def clearCaches(self):
-        self.__cache.clear()
-        self.__timber.log('IsLiveOnTwitchRepository', 'Caches cleared')
+        cacheStats = self.__cache.getStats()
+        await self.__cache.clearCaches()
+        self.__timber.log('IsLiveOnTwitchRepository', f'Caches cleared ({cacheStats=})')
 
     async def __fetchLiveUserDetails(
         self,
@@ -92,12 +102,12 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
         for liveUserDetail in liveUserDetails:
             isLive = liveUserDetail.streamType is TwitchStreamType.LIVE
             twitchChannelIdToLiveStatus[liveUserDetail.userId] = isLive
-            self.__cache[liveUserDetail.userId] = isLive
+            self.__cache.set(liveUserDetail.userId, isLive)
 
         for twitchChannelId in twitchChannelIds:
             if twitchChannelId not in twitchChannelIdToLiveStatus:
                 twitchChannelIdToLiveStatus[twitchChannelId] = False
-                self.__cache[twitchChannelId] = False
+                self.__cache.set(twitchChannelId, False)
 
     async def isLive(self, twitchChannelId: str) -> bool:
         if not utils.isValidStr(twitchChannelId):
@@ -115,7 +125,7 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
         twitchChannelIdToLiveStatus: dict[str, bool]
     ):
         for twitchChannelId in twitchChannelIds:
-            isLive = self.__cache[twitchChannelId]
+            isLive = self.__cache.get(twitchChannelId)
 
             if utils.isValidBool(isLive):
                 twitchChannelIdToLiveStatus[twitchChannelId] = isLive
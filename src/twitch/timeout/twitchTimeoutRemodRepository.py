@@ -43,16 +43,18 @@ class TwitchTimeoutRemodRepository(TwitchTimeoutRemodRepositoryInterface):
             raise TypeError(f'data argument is malformed: \"{data}\"')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO twitchtimeoutremodactions (broadcasteruserid, remoddatetime, userid)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (broadcasteruserid, userid) DO UPDATE SET remoddatetime = EXCLUDED.remoddatetime
-            ''',
-            data.broadcasterUserId, data.remodDateTime.isoformat(), data.userId,
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    INSERT INTO twitchtimeoutremodactions (broadcasteruserid, remoddatetime, userid)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (broadcasteruserid, userid) DO UPDATE SET remoddatetime = EXCLUDED.remoddatetime
+                ''',
+                data.broadcasterUserId, data.remodDateTime.isoformat(), data.userId,
+            )
+        finally:
+            await connection.close()
         self.__timber.log('TwitchTimeoutRemodRepository', f'Added remod action ({data=})')
 
     async def delete(self, broadcasterUserId: str, userId: str):
@@ -62,28 +64,32 @@ class TwitchTimeoutRemodRepository(TwitchTimeoutRemodRepositoryInterface):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM twitchtimeoutremodactions
-                WHERE broadcasteruserid = $1 AND userid = $2
-            ''',
-            broadcasterUserId, userId,
-        )
-
-        await connection.close()
+
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM twitchtimeoutremodactions
+                    WHERE broadcasteruserid = $1 AND userid = $2
+                ''',
+                broadcasterUserId, userId,
+            )
+        finally:
+            await connection.close()
         self.__timber.log('TwitchTimeoutRemodRepository', f'Deleted remod action ({broadcasterUserId=}) ({userId=})')
 
     async def getAll(self) -> Collection[TwitchTimeoutRemodData]:
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT twitchtimeoutremodactions.broadcasteruserid, twitchtimeoutremodactions.remoddatetime, twitchtimeoutremodactions.userid, userids.username FROM twitchtimeoutremodactions
-                INNER JOIN userids ON twitchtimeoutremodactions.broadcasteruserid = userids.userid
-                ORDER BY twitchtimeoutremodactions.remoddatetime ASC
-            ''',
-        )
-
-        await connection.close()
+
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT twitchtimeoutremodactions.broadcasteruserid, twitchtimeoutremodactions.remoddatetime, twitchtimeoutremodactions.userid, userids.username FROM twitchtimeoutremodactions
+                    INNER JOIN userids ON twitchtimeoutremodactions.broadcasteruserid = userids.userid
+                    ORDER BY twitchtimeoutremodactions.remoddatetime ASC
+                ''',
+            )
+        finally:
+            await connection.close()
         data: FrozenList[TwitchTimeoutRemodData] = FrozenList()
         now = datetime.now(self.__timeZoneRepository.getDefault())
 
@@ -115,32 +121,33 @@ class TwitchTimeoutRemodRepository(TwitchTimeoutRemodRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchtimeoutremodactions (
-                            broadcasteruserid text NOT NULL,
-                            remoddatetime text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (broadcasteruserid, userid)
-                        )
-                    ''',
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchtimeoutremodactions (
-                            broadcasteruserid TEXT NOT NULL,
-                            remoddatetime TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (broadcasteruserid, userid)
-                        ) STRICT
-                    ''',
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS twitchtimeoutremodactions (
+                                broadcasteruserid text NOT NULL,
+                                remoddatetime text NOT NULL,
+                                userid text NOT NULL,
+                                PRIMARY KEY (broadcasteruserid, userid)
+                            )
+                        ''',
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS twitchtimeoutremodactions (
+                                broadcasteruserid TEXT NOT NULL,
+                                remoddatetime TEXT NOT NULL,
+                                userid TEXT NOT NULL,
+                                PRIMARY KEY (broadcasteruserid, userid)
+                            ) STRICT
+                        ''',
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
@@ -231,16 +231,18 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT expirationtime, accesstoken, refreshtoken FROM twitchtokens
-                WHERE twitchchannelid = $1
-                LIMIT 1
-            ''',
-            twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT expirationtime, accesstoken, refreshtoken FROM twitchtokens
+                    WHERE twitchchannelid = $1
+                    LIMIT 1
+                ''',
+                twitchChannelId
+            )
+        finally:
+            await connection.close()
 
         if record is None or len(record) == 0:
             return None
@@ -361,35 +363,36 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchtokens (
-                            expirationtime text DEFAULT NULL,
-                            accesstoken text NOT NULL,
-                            refreshtoken text NOT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchtokens (
-                            expirationtime TEXT DEFAULT NULL,
-                            accesstoken TEXT NOT NULL,
-                            refreshtoken TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS twitchtokens (
+                                expirationtime text DEFAULT NULL,
+                                accesstoken text NOT NULL,
+                                refreshtoken text NOT NULL,
+                                twitchchannelid text NOT NULL PRIMARY KEY
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS twitchtokens (
+                                expirationtime TEXT DEFAULT NULL,
+                                accesstoken TEXT NOT NULL,
+                                refreshtoken TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL PRIMARY KEY
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
         await self.__consumeSeedFile()
 
     async def __notifyOfNoSeedFile(self, seedFileReader: JsonReaderInterface):
@@ -442,15 +445,17 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         self.__timber.log('TwitchTokensRepository', f'Removing user \"{twitchChannelId}\"...')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM twitchtokens
-                WHERE twitchchannelid = $1
-            ''',
-            twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    DELETE FROM twitchtokens
+                    WHERE twitchchannelid = $1
+                ''',
+                twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__cache.pop(twitchChannelId, None)
 
     async def requireAccessToken(
@@ -492,16 +497,18 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                UPDATE twitchtokens
-                SET expirationtime = $1
-                WHERE twitchchannelid = $2
-            ''',
-            expirationTime.isoformat(), twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            await connection.execute(
+                '''
+                    UPDATE twitchtokens
+                    SET expirationtime = $1
+                    WHERE twitchchannelid = $2
+                ''',
+                expirationTime.isoformat(), twitchChannelId
+            )
+        finally:
+            await connection.close()
         self.__cache.pop(twitchChannelId, None)
 
     async def __setTokensDetails(
@@ -516,33 +523,34 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
 
         connection = await self.__getDatabaseConnection()
 
-        if tokensDetails is None:
-            await connection.execute(
-                '''
-                    DELETE FROM twitchtokens
-                    WHERE twitchchannelid = $1
-                ''',
-                twitchChannelId
-            )
-
-            self.__cache.pop(twitchChannelId, None)
-            self.__timber.log('TwitchTokensRepository', f'Twitch tokens details have been deleted ({twitchChannelId=}) ({tokensDetails=})')
-        else:
-            expirationTime = tokensDetails.expirationTime
+        try:
+            if tokensDetails is None:
+                await connection.execute(
+                    '''
+                        DELETE FROM twitchtokens
+                        WHERE twitchchannelid = $1
+                    ''',
+                    twitchChannelId
+                )
 
-            await connection.execute(
-                '''
-                    INSERT INTO twitchtokens (expirationtime, accesstoken, refreshtoken, twitchchannelid)
-                    VALUES ($1, $2, $3, $4)
-                    ON CONFLICT (twitchchannelid) DO UPDATE SET expirationtime = EXCLUDED.expirationtime, accesstoken = EXCLUDED.accesstoken, refreshtoken = EXCLUDED.refreshtoken
-                ''',
-                expirationTime.isoformat(), tokensDetails.accessToken, tokensDetails.refreshToken, twitchChannelId
-            )
+                self.__cache.pop(twitchChannelId, None)
+                self.__timber.log('TwitchTokensRepository', f'Twitch tokens details have been deleted ({twitchChannelId=}) ({tokensDetails=})')
+            else:
+                expirationTime = tokensDetails.expirationTime
 
-            self.__cache[twitchChannelId] = tokensDetails
-            self.__timber.log('TwitchTokensRepository', f'Twitch tokens details have been updated ({twitchChannelId=}) ({tokensDetails=})')
+                await connection.execute(
+                    '''
+                        INSERT INTO twitchtokens (expirationtime, accesstoken, refreshtoken, twitchchannelid)
+                        VALUES ($1, $2, $3, $4)
+                        ON CONFLICT (twitchchannelid) DO UPDATE SET expirationtime = EXCLUDED.expirationtime, accesstoken = EXCLUDED.accesstoken, refreshtoken = EXCLUDED.refreshtoken
+                    ''',
+                    expirationTime.isoformat(), tokensDetails.accessToken, tokensDetails.refreshToken, twitchChannelId
+                )
 
-        await connection.close()
+                self.__cache[twitchChannelId] = tokensDetails
+                self.__timber.log('TwitchTokensRepository', f'Twitch tokens details have been updated ({twitchChannelId=}) ({tokensDetails=})')
+        finally:
+            await connection.close()
 
     def start(self):
         if self.__isStarted:
@@ -1,5 +1,11 @@
+import asyncio
+import time
+import traceback
+from dataclasses import dataclass
 from typing import Final
 
+from frozendict import frozendict
+
 from .absTwitchChannelPointRedemptionHandler import AbsTwitchChannelPointRedemptionHandler
 from .absTwitchChatHandler import AbsTwitchChatHandler
 from .absTwitchCheerHandler import AbsTwitchCheerHandler
@@ -12,8 +18,11 @@ from .absTwitchSubscriptionHandler import AbsTwitchSubscriptionHandler
 from .api.models.twitchWebsocketDataBundle import TwitchWebsocketDataBundle
 from .api.models.twitchWebsocketEvent import TwitchWebsocketEvent
 from .api.models.twitchWebsocketSubscriptionType import TwitchWebsocketSubscriptionType
+from .twitchWebsocketDataBundleHandlerMetrics import TwitchWebsocketDataBundleHandlerMetrics
 from .websocket.listener.twitchWebsocketDataBundleListener import TwitchWebsocketDataBundleListener
 from ..misc import utils as utils
+from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..misc.keyedLanes import KeyedLanes
 from ..timber.timberInterface import TimberInterface
 from ..users.userIdsRepositoryInterface import UserIdsRepositoryInterface
 from ..users.usersRepositoryInterface import UsersRepositoryInterface
@@ -21,8 +30,15 @@ from ..users.usersRepositoryInterface import UsersRepositoryInterface
 
 class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
 
+    @dataclass(frozen = True)
+    class QueuedDataBundle:
+        dataBundle: TwitchWebsocketDataBundle
+        event: TwitchWebsocketEvent
+        userLogin: str
+
     def __init__(
         self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
         channelPointRedemptionHandler: AbsTwitchChannelPointRedemptionHandler | None,
         chatHandler: AbsTwitchChatHandler | None,
         cheerHandler: AbsTwitchCheerHandler | None,
@@ -35,8 +51,11 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
         timber: TimberInterface,
         userIdsRepository: UserIdsRepositoryInterface,
         usersRepository: UsersRepositoryInterface,
+        maxConcurrentDataBundles: int = 8,
     ):
-        if channelPointRedemptionHandler is not None and not isinstance(channelPointRedemptionHandler, AbsTwitchChannelPointRedemptionHandler):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif channelPointRedemptionHandler is not None and not isinstance(channelPointRedemptionHandler, AbsTwitchChannelPointRedemptionHandler):
             raise TypeError(f'channelPointRedemptionHandler argument is malformed: \"{channelPointRedemptionHandler}\"')
         elif chatHandler is not None and not isinstance(chatHandler, AbsTwitchChatHandler):
             raise TypeError(f'chatHandler argument is malformed: \"{chatHandler}\"')
@@ -60,6 +79,10 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
             raise TypeError(f'userIdsRepository argument is malformed: \"{userIdsRepository}\"')
         elif not isinstance(usersRepository, UsersRepositoryInterface):
             raise TypeError(f'usersRepository argument is malformed: \"{usersRepository}\"')
+        elif not utils.isValidInt(maxConcurrentDataBundles):
+            raise TypeError(f'maxConcurrentDataBundles argument is malformed: \"{maxConcurrentDataBundles}\"')
+        elif maxConcurrentDataBundles < 1 or maxConcurrentDataBundles > 64:
+            raise ValueError(f'maxConcurrentDataBundles argument is out of bounds: {maxConcurrentDataBundles}')
 
         self.__channelPointRedemptionHandler: Final[AbsTwitchChannelPointRedemptionHandler | None] = channelPointRedemptionHandler
         self.__chatHandler: Final[AbsTwitchChatHandler | None] = chatHandler
@@ -74,6 +97,46 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
         self.__userIdsRepository: Final[UserIdsRepositoryInterface] = userIdsRepository
         self.__usersRepository: Final[UsersRepositoryInterface] = usersRepository
 
+        self.__concurrencySemaphore: Final[asyncio.Semaphore] = asyncio.Semaphore(maxConcurrentDataBundles)
+
+        self.__lanes: Final[KeyedLanes[TwitchWebsocketDataBundleHandler.QueuedDataBundle]] = KeyedLanes(
+            backgroundTaskHelper = backgroundTaskHelper,
+            laneHandler = self.__handleQueuedDataBundle,
+            timber = timber,
+        )
+
+        self.__laneHandlerLatencySeconds: Final[dict[str, float]] = dict()
+        self.__laneHandlerLatencySamples: Final[dict[str, int]] = dict()
+        self.__maxHandlerLatencySeconds: float = 0
+        self.__totalDataBundlesFailed: int = 0
+        self.__totalDataBundlesHandled: int = 0
+
+    def getMetrics(self) -> TwitchWebsocketDataBundleHandlerMetrics:
+        laneAverageHandlerLatencySeconds: dict[str, float] = dict()
+        totalHandlerLatencySeconds: float = 0
+        totalHandlerLatencySamples = 0
+
+        for twitchChannelId, handlerLatencySeconds in self.__laneHandlerLatencySeconds.items():
+            handlerLatencySamples = self.__laneHandlerLatencySamples[twitchChannelId]
+            laneAverageHandlerLatencySeconds[twitchChannelId] = handlerLatencySeconds / handlerLatencySamples
+            totalHandlerLatencySeconds += handlerLatencySeconds
+            totalHandlerLatencySamples += handlerLatencySamples
+
+        averageHandlerLatencySeconds: float = 0
+
+        if totalHandlerLatencySamples >= 1:
+            averageHandlerLatencySeconds = totalHandlerLatencySeconds / totalHandlerLatencySamples
+
+        return TwitchWebsocketDataBundleHandlerMetrics(
+            laneAverageHandlerLatencySeconds = frozendict(laneAverageHandlerLatencySeconds),
+            laneQueueDepths = self.__lanes.getQueueDepths(),
+            averageHandlerLatencySeconds = averageHandlerLatencySeconds,
+            maxHandlerLatencySeconds = self.__maxHandlerLatencySeconds,
+            pendingDataBundles = len(self.__lanes),
+            totalDataBundlesFailed = self.__totalDataBundlesFailed,
+            totalDataBundlesHandled = self.__totalDataBundlesHandled,
+        )
+
     async def __isChannelPointsRedemptionType(
         self,
         subscriptionType: TwitchWebsocketSubscriptionType | None
@@ -166,8 +229,22 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
             self.__timber.log('TwitchWebsocketDataBundleHandler', f'Unable to find broadcaster user information in data bundle ({userId=}) ({userLogin=}) ({dataBundle=})')
             return
 
-        await self.__persistUserInfo(event)
-        user = await self.__usersRepository.getUserAsync(userLogin)
+        queuedDataBundle = TwitchWebsocketDataBundleHandler.QueuedDataBundle(
+            dataBundle = dataBundle,
+            event = event,
+            userLogin = userLogin,
+        )
+
+        self.__lanes.submit(userId, queuedDataBundle)
+
+    async def __handleDataBundle(
+        self,
+        userId: str,
+        queuedDataBundle: QueuedDataBundle,
+    ):
+        dataBundle = queuedDataBundle.dataBundle
+        await self.__persistUserInfo(queuedDataBundle.event)
+        user = await self.__usersRepository.getUserAsync(queuedDataBundle.userLogin)
         subscriptionType = dataBundle.metadata.subscriptionType
 
         if await self.__isChannelPointsRedemptionType(subscriptionType):
@@ -245,6 +322,31 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
         else:
             self.__timber.log('TwitchWebsocketDataBundleHandler', f'Received unhandled data bundle ({userId=}) ({user=}) ({subscriptionType=}) ({dataBundle=})')
 
+    async def __handleQueuedDataBundle(
+        self,
+        userId: str,
+        queuedDataBundle: QueuedDataBundle,
+    ):
+        async with self.__concurrencySemaphore:
+            startTime = time.monotonic()
+
+            try:
+                await self.__handleDataBundle(
+                    userId = userId,
+                    queuedDataBundle = queuedDataBundle,
+                )
+
+                self.__totalDataBundlesHandled += 1
+            except Exception as e:
+                self.__totalDataBundlesFailed += 1
+                self.__timber.log('TwitchWebsocketDataBundleHandler', f'Encountered unknown Exception when handling data bundle ({userId=}) ({queuedDataBundle=}): {e}', e, traceback.format_exc())
+
+            handlerLatencySeconds = time.monotonic() - startTime
+
+        self.__maxHandlerLatencySeconds = max(self.__maxHandlerLatencySeconds, handlerLatencySeconds)
+        self.__laneHandlerLatencySeconds[userId] = self.__laneHandlerLatencySeconds.get(userId, 0) + handlerLatencySeconds
+        self.__laneHandlerLatencySamples[userId] = self.__laneHandlerLatencySamples.get(userId, 0) + 1
+
     async def __persistUserInfo(self, event: TwitchWebsocketEvent | None):
         if event is None:
             return
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from frozendict import frozendict
+
+
+@dataclass(frozen = True)
+class TwitchWebsocketDataBundleHandlerMetrics:
+    laneAverageHandlerLatencySeconds: frozendict[str, float]
+    laneQueueDepths: frozendict[str, int]
+    averageHandlerLatencySeconds: float
+    maxHandlerLatencySeconds: float
+    pendingDataBundles: int
+    totalDataBundlesFailed: int
+    totalDataBundlesHandled: int
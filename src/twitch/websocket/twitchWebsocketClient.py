@@ -1,13 +1,10 @@
 import asyncio
 import json
-import queue
 import traceback
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 from typing import Any, Final
 
 import websockets
-from frozenlist import FrozenList
 
 from .connectionAction.twitchWebsocketConnectionAction import TwitchWebsocketConnectionAction
 from .connectionAction.twitchWebsocketConnectionActionHelperInterface import \
@@ -29,6 +26,7 @@ from ...location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ...misc import utils as utils
 from ...misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
 from ...misc.lruCache import LruCache
+from ...misc.workQueue.workQueue import WorkQueue
 from ...timber.timberInterface import TimberInterface
 
 
@@ -48,7 +46,6 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         twitchWebsocketSettingsRepository: TwitchWebsocketSettingsRepositoryInterface,
         twitchWebsocketSubscriptionHelper: TwitchWebsocketSubscriptionHelperInterface,
         queueSleepTimeSeconds: float = 1,
-        queueTimeoutSeconds: float = 3,
         websocketCreationDelayTimeSeconds: float = 0.5,
         websocketRetrySleepTimeSeconds: float = 3,
         twitchWebsocketInstabilityThreshold: int = 3,
@@ -81,10 +78,6 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
             raise TypeError(f'queueSleepTimeSeconds argument is malformed: \"{queueSleepTimeSeconds}\"')
         elif queueSleepTimeSeconds < 1 or queueSleepTimeSeconds > 15:
             raise ValueError(f'queueSleepTimeSeconds argument is out of bounds: {queueSleepTimeSeconds}')
-        elif not utils.isValidNum(queueTimeoutSeconds):
-            raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
-        elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
-            raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
         elif not utils.isValidNum(websocketCreationDelayTimeSeconds):
             raise TypeError(f'websocketCreationDelayTimeSeconds argument is malformed: \"{websocketCreationDelayTimeSeconds}\"')
         elif websocketCreationDelayTimeSeconds < 0.1 or websocketCreationDelayTimeSeconds > 8:
@@ -116,7 +109,6 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         self.__twitchWebsocketSettingsRepository: Final[TwitchWebsocketSettingsRepositoryInterface] = twitchWebsocketSettingsRepository
         self.__twitchWebsocketSubscriptionHelper: Final[TwitchWebsocketSubscriptionHelperInterface] = twitchWebsocketSubscriptionHelper
         self.__queueSleepTimeSeconds: Final[float] = queueSleepTimeSeconds
-        self.__queueTimeoutSeconds: Final[float] = queueTimeoutSeconds
         self.__websocketCreationDelayTimeSeconds: Final[float] = websocketCreationDelayTimeSeconds
         self.__websocketRetrySleepTimeSeconds: Final[float] = websocketRetrySleepTimeSeconds
         self.__twitchWebsocketInstabilityThreshold: Final[int] = twitchWebsocketInstabilityThreshold
@@ -124,7 +116,7 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
 
         self.__isStarted: bool = False
         self.__messageIdCache: Final[LruCache] = LruCache(twitchWebsocketMessageIdCacheSize)
-        self.__dataBundleQueue: Final[SimpleQueue[TwitchWebsocketDataBundle]] = SimpleQueue()
+        self.__dataBundleQueue: Final[WorkQueue[TwitchWebsocketDataBundle]] = WorkQueue(backgroundTaskHelper.eventLoop)
         self.__dataBundleListener: TwitchWebsocketDataBundleListener | None = None
 
     async def __isValidDataBundle(self, dataBundle: TwitchWebsocketDataBundle) -> bool:
@@ -165,7 +157,11 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         if not shouldLog or jsonLoggingLevel is TwitchWebsocketJsonLoggingLevel.NONE:
             return
 
-        self.__timber.log('TwitchWebsocketClient', f'Websocket message: ({user=}) ({jsonLoggingLevel=}) ({message=}) ({dataBundle=})')
+        # these can be big, so they're only formatted if they actually make it out to a log file
+        self.__timber.log(
+            tag = 'TwitchWebsocketClient',
+            msg = lambda: f'Websocket message: ({user=}) ({jsonLoggingLevel=}) ({message=}) ({dataBundle=})',
+        )
 
     async def __parseMessageToDataBundleFor(
         self,
@@ -237,28 +233,22 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         self.__backgroundTaskHelper.createTask(self.__startDataBundleLoop())
 
     async def __startDataBundleLoop(self):
+        while self.__dataBundleListener is None:
+            await asyncio.sleep(self.__queueSleepTimeSeconds)
+
         while True:
+            dataBundles = await self.__dataBundleQueue.getBatch()
             dataBundleListener = self.__dataBundleListener
 
-            if dataBundleListener is not None:
-                dataBundles: FrozenList[TwitchWebsocketDataBundle] = FrozenList()
+            if dataBundleListener is None:
+                self.__timber.log('TwitchWebsocketClient', f'Dropping dataBundles as there is no dataBundle listener ({len(dataBundles)=})')
+                continue
 
+            for index, dataBundle in enumerate(dataBundles):
                 try:
-                    while not self.__dataBundleQueue.empty():
-                        dataBundle = self.__dataBundleQueue.get_nowait()
-                        dataBundles.append(dataBundle)
-                except queue.Empty as e:
-                    self.__timber.log('TwitchWebsocketClient', f'Encountered queue.Empty when building up dataBundles list (queue size: {self.__dataBundleQueue.qsize()}) (dataBundles size: {len(dataBundles)}): {e}', e, traceback.format_exc())
-
-                dataBundles.freeze()
-
-                for index, dataBundle in enumerate(dataBundles):
-                    try:
-                        await dataBundleListener.onNewWebsocketDataBundle(dataBundle)
-                    except Exception as e:
-                        self.__timber.log('TwitchWebsocketClient', f'Encountered unknown Exception when looping through dataBundles (queue size: {self.__dataBundleQueue.qsize()}) ({index=}) ({dataBundle=}): {e}', e, traceback.format_exc())
-
-            await asyncio.sleep(self.__queueSleepTimeSeconds)
+                    await dataBundleListener.onNewWebsocketDataBundle(dataBundle)
+                except Exception as e:
+                    self.__timber.log('TwitchWebsocketClient', f'Encountered unknown Exception when looping through dataBundles (queue size: {self.__dataBundleQueue.qsize()}) ({index=}) ({dataBundle=}): {e}', e, traceback.format_exc())
 
     async def __startWebsocketConnectionFor(self, user: TwitchWebsocketUser):
         if not isinstance(user, TwitchWebsocketUser):
@@ -341,7 +331,4 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         if not isinstance(dataBundle, TwitchWebsocketDataBundle):
             raise TypeError(f'dataBundle argument is malformed: \"{dataBundle}\"')
 
-        try:
-            self.__dataBundleQueue.put(dataBundle, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TwitchWebsocketClient', f'Encountered queue.Full when submitting a new dataBundle ({dataBundle}) into the dataBundle queue (queue size: {self.__dataBundleQueue.qsize()}): {e}', e, traceback.format_exc())
+        self.__dataBundleQueue.put(dataBundle)
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 import traceback
+from datetime import timedelta
 from typing import Final
 
-from lru import LRU
-
 from .exceptions import NoSuchUserException
 from .userIdsRepositoryInterface import UserIdsRepositoryInterface
 from ..misc import utils as utils
+from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..misc.ttlCache import TtlCache
 from ..network.exceptions import GenericNetworkException
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
 from ..storage.databaseType import DatabaseType
+from ..storage.writeBehindBuffer import WriteBehindBuffer
+from ..storage.writeBehindBufferInterface import WriteBehindBufferInterface
 from ..timber.timberInterface import TimberInterface
 from ..twitch.api.models.twitchUserDetails import TwitchUserDetails
 from ..twitch.api.twitchApiServiceInterface import TwitchApiServiceInterface
@@ -21,12 +24,16 @@ class UserIdsRepository(UserIdsRepositoryInterface):
 
     def __init__(
         self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
         backingDatabase: BackingDatabase,
         timber: TimberInterface,
         twitchApiService: TwitchApiServiceInterface,
         cacheSize: int = 512,
+        cacheTimeToLive: timedelta = timedelta(hours = 12),
     ):
-        if not isinstance(backingDatabase, BackingDatabase):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(backingDatabase, BackingDatabase):
             raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
@@ -36,17 +43,35 @@ class UserIdsRepository(UserIdsRepositoryInterface):
             raise TypeError(f'cacheSize argument is malformed: \"{cacheSize}\"')
         elif cacheSize < 1 or cacheSize > utils.getIntMaxSafeSize():
             raise ValueError(f'cacheSize argument is out of bounds: {cacheSize}')
+        elif not isinstance(cacheTimeToLive, timedelta):
+            raise TypeError(f'cacheTimeToLive argument is malformed: \"{cacheTimeToLive}\"')
 
         self.__backingDatabase: Final[BackingDatabase] = backingDatabase
         self.__timber: Final[TimberInterface] = timber
         self.__twitchApiService: Final[TwitchApiServiceInterface] = twitchApiService
 
         self.__isDatabaseReady: bool = False
-        self.__cache: Final[LRU[str, str | None]] = LRU(cacheSize)
+        self.__cache: Final[TtlCache[str]] = TtlCache(
+            maxSize = cacheSize,
+            timeToLive = cacheTimeToLive,
+        )
+
+        self.__writeBehindBuffer: Final[WriteBehindBufferInterface] = WriteBehindBuffer(
+            backgroundTaskHelper = backgroundTaskHelper,
+            backingDatabase = backingDatabase,
+            timber = timber,
+            tableName = 'userids',
+            columns = ( 'userid', 'username' ),
+            conflictColumns = ( 'userid', ),
+        )
 
     async def clearCaches(self):
-        self.__cache.clear()
-        self.__timber.log('UserIdsRepository', 'Caches cleared')
+        cacheStats = self.__cache.getStats()
+        await self.__cache.clearCaches()
+        self.__timber.log('UserIdsRepository', f'Caches cleared ({cacheStats=})')
+
+    async def flush(self):
+        await self.__writeBehindBuffer.flush()
 
     async def fetchUserId(
         self,
@@ -58,21 +83,29 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         elif twitchAccessToken is not None and not utils.isValidStr(twitchAccessToken):
             raise TypeError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
 
+        userNameCasefolded = userName.casefold()
+        pendingRow = self.__writeBehindBuffer.findPendingRow(lambda row: row[1].casefold() == userNameCasefolded)
+
+        if pendingRow is not None:
+            return pendingRow[0]
+
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT userid FROM userids
-                WHERE username = $1
-                LIMIT 1
-            ''',
-            userName,
-        )
 
-        userId: str | None = None
-        if record is not None and len(record) >= 1:
-            userId = record[0]
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT userid FROM userids
+                    WHERE username = $1
+                    LIMIT 1
+                ''',
+                userName,
+            )
 
-        await connection.close()
+            userId: str | None = None
+            if record is not None and len(record) >= 1:
+                userId = record[0]
+        finally:
+            await connection.close()
 
         if utils.isValidStr(userId):
             return userId
@@ -138,31 +171,78 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         elif twitchAccessToken is not None and not utils.isValidStr(twitchAccessToken):
             raise TypeError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
 
-        userName: str | None = None
+        return await self.__cache.getOrLoad(
+            key = userId,
+            loader = lambda: self.__loadUserName(userId, twitchAccessToken),
+        )
+
+    async def __getDatabaseConnection(self) -> DatabaseConnection:
+        await self.__initDatabaseTable()
+        return await self.__backingDatabase.getConnection()
 
-        if userId in self.__cache:
-            userName = self.__cache[userId]
+    async def __initDatabaseTable(self):
+        if self.__isDatabaseReady:
+            return
 
-            if utils.isValidStr(userName):
-                return userName
+        self.__isDatabaseReady = True
+        connection = await self.__backingDatabase.getConnection()
 
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS userids (
+                                userid text NOT NULL PRIMARY KEY,
+                                username public.citext NOT NULL
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS userids (
+                                userid TEXT NOT NULL PRIMARY KEY,
+                                username TEXT NOT NULL COLLATE NOCASE
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
+
+    async def __loadUserName(
+        self,
+        userId: str,
+        twitchAccessToken: str | None,
+    ) -> str | None:
+        pendingRow = self.__writeBehindBuffer.getPendingRow(userId)
+
+        if pendingRow is not None:
+            return pendingRow[1]
+
+        userName: str | None = None
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT username FROM userids
-                WHERE userid = $1
-                LIMIT 1
-            ''',
-            userId,
-        )
 
-        if record is not None and len(record) >= 1:
-            userName = record[0]
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT username FROM userids
+                    WHERE userid = $1
+                    LIMIT 1
+                ''',
+                userId,
+            )
 
-        await connection.close()
+            if record is not None and len(record) >= 1:
+                userName = record[0]
+        finally:
+            await connection.close()
 
         if utils.isValidStr(userName):
-            self.__cache[userId] = userName
             return userName
         elif not utils.isValidStr(twitchAccessToken):
             self.__timber.log('UserIdsRepository', f'Can\'t lookup Twitch username for user ID \"{userId}\" as no Twitch access token was specified')
@@ -185,8 +265,6 @@ class UserIdsRepository(UserIdsRepositoryInterface):
             self.__timber.log('UserIdsRepository', f'Unable to retrieve Twitch username for user ID \"{userId}\" ({userDetails=})')
             return None
 
-        self.__cache[userId] = userDetails.login
-
         await self.setUser(
             userId = userId,
             userName = userDetails.login,
@@ -194,43 +272,6 @@ class UserIdsRepository(UserIdsRepositoryInterface):
 
         return userDetails.login
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS userids (
-                            userid text NOT NULL PRIMARY KEY,
-                            username public.citext NOT NULL
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS userids (
-                            userid TEXT NOT NULL PRIMARY KEY,
-                            username TEXT NOT NULL COLLATE NOCASE
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-
     async def requireUserId(
         self,
         userName: str,
@@ -297,18 +338,15 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         elif not utils.isValidStr(userName):
             raise TypeError(f'userName argument is malformed: \"{userName}\"')
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO userids (userid, username)
-                VALUES ($1, $2)
-                ON CONFLICT (userid) DO UPDATE SET username = EXCLUDED.username
-            ''',
-            userId, userName,
-        )
+        if self.__cache.get(userId) == userName:
+            # this exact user has already been persisted, so there's nothing new to write
+            return
+
+        # the table has to exist before the write behind buffer is able to flush into it
+        await self.__initDatabaseTable()
 
-        await connection.close()
-        self.__cache[userId] = userName
+        await self.__writeBehindBuffer.put(userId, userName)
+        self.__cache.set(userId, userName)
 
     async def setUsers(self, userIdToUserName: dict[str, str]):
         if not isinstance(userIdToUserName, dict):
@@ -316,18 +354,8 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         elif len(userIdToUserName) == 0:
             return
 
-        connection = await self.__getDatabaseConnection()
+        await self.__initDatabaseTable()
 
         for userId, userName in userIdToUserName.items():
-            await connection.execute(
-                '''
-                    INSERT INTO userids (userid, username)
-                    VALUES ($1, $2)
-                    ON CONFLICT (userid) DO UPDATE SET username = EXCLUDED.username
-                ''',
-                userId, userName,
-            )
-
-            self.__cache[userId] = userName
-
-        await connection.close()
+            await self.__writeBehindBuffer.put(userId, userName)
+            self.__cache.set(userId, userName)
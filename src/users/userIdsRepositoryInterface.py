@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
 
 from ..misc.clearable import Clearable
+from ..misc.flushable import Flushable
 
 
-class UserIdsRepositoryInterface(Clearable, ABC):
+class UserIdsRepositoryInterface(Clearable, Flushable, ABC):
 
     @abstractmethod
     async def fetchUserId(
@@ -1,9 +1,13 @@
+import asyncio
+import hashlib
 import json
 import os
+import traceback
 from datetime import tzinfo
 from typing import Any, Collection
 
 import aiofiles
+import aiofiles.os
 import aiofiles.ospath
 from frozendict import frozendict
 from frozenlist import FrozenList
@@ -113,28 +117,86 @@ class UsersRepository(UsersRepositoryInterface):
         self.__ttsJsonMapper: TtsJsonMapperInterface = ttsJsonMapper
         self.__usersFile: str = usersFile
 
+        self.__writeLock: asyncio.Lock = asyncio.Lock()
+        self.__fileHash: str | None = None
+        self.__fileSignature: tuple[int, int] | None = None
         self.__jsonCache: dict[str, Any] | None = None
-        self.__userCache: dict[str, User | None] = dict()
+        self.__users: FrozenList[User] | None = None
+        self.__userCache: dict[str, User] = dict()
+        self.__userHashes: dict[str, str] = dict()
 
     async def addUser(self, handle: str):
         if not utils.isValidStr(handle):
             raise TypeError(f'handle argument is malformed: \"{handle}\"')
 
         self.__timber.log('UsersRepository', f'Adding user \"{handle}\"...')
-        jsonContents = await self.__readJsonAsync()
 
-        for key in jsonContents.keys():
-            if key.casefold() == handle.casefold():
+        async with self.__writeLock:
+            jsonContents = await self.__readJsonAsync()
+
+            if handle.casefold() in self.__userCache:
                 self.__timber.log('UsersRepository', f'Unable to add user \"{handle}\" as a user with that handle already exists')
                 return
 
-        jsonContents[handle] = dict()
-        await self.__writeAndFlushUsersFileAsync(jsonContents)
+            jsonContents = dict(jsonContents)
+            jsonContents[handle] = dict()
+            await self.__writeAndFlushUsersFileAsync(jsonContents)
+
         self.__timber.log('UsersRepository', f'Finished adding user \"{handle}\"')
 
+    def __applyJsonContents(
+        self,
+        jsonContents: dict[str, Any],
+        fileHash: str,
+        fileSignature: tuple[int, int] | None,
+    ):
+        if not isinstance(jsonContents, dict):
+            raise TypeError(f'jsonContents argument is malformed: \"{jsonContents}\"')
+        elif not utils.isValidStr(fileHash):
+            raise TypeError(f'fileHash argument is malformed: \"{fileHash}\"')
+
+        userCache: dict[str, User] = dict()
+        userHashes: dict[str, str] = dict()
+        createdUsers = 0
+
+        for key, userJson in jsonContents.items():
+            casefoldedHandle = key.casefold()
+            userHash = self.__hashString(json.dumps(userJson, sort_keys = True))
+            user = self.__userCache.get(casefoldedHandle, None)
+
+            # only users whose JSON has actually changed need to be rebuilt, everyone else keeps
+            # their existing (immutable) User instance
+            if user is None or user.handle != key or self.__userHashes.get(casefoldedHandle, None) != userHash:
+                user = self.__createUser(key, userJson)
+                createdUsers += 1
+
+            userCache[casefoldedHandle] = user
+            userHashes[casefoldedHandle] = userHash
+
+        if len(userCache) == 0:
+            raise NoUsersException(f'Unable to read in any users from users repository file: \"{self.__usersFile}\"')
+
+        users: list[User] = list(userCache.values())
+        users.sort(key = lambda element: element.handle.casefold())
+        frozenUsers: FrozenList[User] = FrozenList(users)
+        frozenUsers.freeze()
+
+        self.__fileHash = fileHash
+        self.__fileSignature = fileSignature
+        self.__jsonCache = jsonContents
+        self.__users = frozenUsers
+        self.__userCache = userCache
+        self.__userHashes = userHashes
+
+        self.__timber.log('UsersRepository', f'Loaded users repository JSON file ({len(frozenUsers)=}) ({createdUsers=})')
+
     async def clearCaches(self):
+        self.__fileHash = None
+        self.__fileSignature = None
         self.__jsonCache = None
+        self.__users = None
         self.__userCache.clear()
+        self.__userHashes.clear()
         self.__timber.log('UsersRepository', 'Caches cleared')
 
     def containsUser(self, handle: str) -> bool:
@@ -518,66 +580,69 @@ class UsersRepository(UsersRepositoryInterface):
             timeZones = timeZones,
         )
 
-        self.__userCache[handle.casefold()] = user
         return user
 
-    def __createUsers(self, jsonContents: dict[str, Any]) -> FrozenList[User]:
-        if not isinstance(jsonContents, dict):
-            raise TypeError(f'jsonContents argument is malformed: \"{jsonContents}\"')
-
-        users: list[User] = list()
-
-        for key, userJson in jsonContents.items():
-            user = self.__createUser(key, userJson)
-            users.append(user)
-
-        if len(users) == 0:
-            raise NoUsersException(f'Unable to read in any users from users repository file: \"{self.__usersFile}\"')
-
-        users.sort(key = lambda element: element.handle.casefold())
-        frozenUsers: FrozenList[User] = FrozenList(users)
-        frozenUsers.freeze()
-
-        return frozenUsers
-
-    def __findAndCreateUser(self, handle: str, jsonContents: dict[str, Any]) -> User:
+    def __findUser(self, handle: str) -> User:
         if not utils.isValidStr(handle):
             raise TypeError(f'handle argument is malformed: \"{handle}\"')
-        elif jsonContents is None:
-            raise TypeError(f'jsonContents argument is malformed: \"{jsonContents}\"')
 
         user = self.__userCache.get(handle.casefold(), None)
 
-        if user is not None:
-            return user
-
-        for key, userJson in jsonContents.items():
-            if handle.casefold() == key.casefold():
-                return self.__createUser(handle, userJson)
+        if user is None:
+            raise NoSuchUserException(f'Unable to find user with handle \"{handle}\" in users repository file: \"{self.__usersFile}\"')
 
-        raise NoSuchUserException(f'Unable to find user with handle \"{handle}\" in users repository file: \"{self.__usersFile}\"')
+        return user
 
     def getUser(self, handle: str) -> User:
         if not utils.isValidStr(handle):
             raise TypeError(f'handle argument is malformed: \"{handle}\"')
 
-        jsonContents = self.__readJson()
-        return self.__findAndCreateUser(handle, jsonContents)
+        self.__readJson()
+        return self.__findUser(handle)
 
     async def getUserAsync(self, handle: str) -> User:
         if not utils.isValidStr(handle):
             raise TypeError(f'handle argument is malformed: \"{handle}\"')
 
-        jsonContents = await self.__readJsonAsync()
-        return self.__findAndCreateUser(handle, jsonContents)
+        await self.__readJsonAsync()
+        return self.__findUser(handle)
 
     def getUsers(self) -> Collection[User]:
-        jsonContents = self.__readJson()
-        return self.__createUsers(jsonContents)
+        self.__readJson()
+        return self.__requireUsers()
 
     async def getUsersAsync(self) -> Collection[User]:
-        jsonContents = await self.__readJsonAsync()
-        return self.__createUsers(jsonContents)
+        await self.__readJsonAsync()
+        return self.__requireUsers()
+
+    def __hashString(self, string: str) -> str:
+        encodedString = string.encode('utf-8')
+        return hashlib.sha256(encodedString).hexdigest()
+
+    def __loadJsonString(
+        self,
+        jsonString: str,
+        fileSignature: tuple[int, int]
+    ):
+        fileHash = self.__hashString(jsonString)
+
+        if self.__jsonCache is not None and self.__fileHash == fileHash:
+            # the file was touched but its contents are unchanged
+            self.__fileSignature = fileSignature
+            return
+
+        jsonContents = json.loads(jsonString)
+
+        if not isinstance(jsonContents, dict):
+            raise IOError(f'Error reading from users repository file: \"{self.__usersFile}\"')
+        elif len(jsonContents) == 0:
+            raise ValueError(f'JSON contents of users repository file \"{self.__usersFile}\" is empty')
+
+        self.__applyJsonContents(
+            jsonContents = jsonContents,
+            fileHash = fileHash,
+            fileSignature = fileSignature,
+        )
 
     async def modifyUserValue(
         self,
@@ -590,12 +655,31 @@ class UsersRepository(UsersRepositoryInterface):
         elif not isinstance(jsonConstant, UserJsonConstant):
             raise TypeError(f'jsonConstant argument is malformed: \"{jsonConstant}\"')
 
+        async with self.__writeLock:
+            await self.__modifyUserValue(
+                handle = handle,
+                jsonConstant = jsonConstant,
+                value = value,
+            )
+
+    async def __modifyUserValue(
+        self,
+        handle: str,
+        jsonConstant: UserJsonConstant,
+        value: Any | None
+    ):
         jsonContents = await self.__readJsonAsync()
-        userJson = jsonContents.get(handle.casefold(), None)
+        user = self.__findUser(handle)
+        userJson = jsonContents.get(user.handle, None)
 
         if not isinstance(userJson, dict):
             raise NoSuchUserException(f'Unable to find user with handle \"{handle}\" in users repository file: \"{self.__usersFile}\"')
 
+        # modify copies so that the cached JSON is left untouched should writing out the file fail
+        jsonContents = dict(jsonContents)
+        userJson = dict(userJson)
+        jsonContents[user.handle] = userJson
+
         match jsonConstant:
             case UserJsonConstant.ANIV_MESSAGE_COPY_TIMEOUT_ENABLED:
                 await self.__modifyUserBooleanValue(
@@ -716,41 +800,65 @@ class UsersRepository(UsersRepositoryInterface):
         userJson[jsonConstant.jsonKey] = value
 
     def __readJson(self) -> dict[str, Any]:
-        if self.__jsonCache is not None:
-            return self.__jsonCache
+        jsonCache = self.__jsonCache
 
-        if not os.path.exists(self.__usersFile):
-            raise FileNotFoundError(f'Users repository file not found: \"{self.__usersFile}\"')
+        try:
+            statResult = os.stat(self.__usersFile)
+        except FileNotFoundError as e:
+            if jsonCache is None:
+                raise FileNotFoundError(f'Users repository file not found: \"{self.__usersFile}\"') from e
 
-        with open(self.__usersFile, mode = 'r') as file:
-            jsonContents = json.load(file)
+            return jsonCache
 
-        if jsonContents is None:
-            raise IOError(f'Error reading from users repository file: \"{self.__usersFile}\"')
-        elif len(jsonContents) == 0:
-            raise ValueError(f'JSON contents of users repository file \"{self.__usersFile}\" is empty')
+        fileSignature = (statResult.st_mtime_ns, statResult.st_size)
 
-        self.__jsonCache = jsonContents
-        return jsonContents
+        if jsonCache is not None and self.__fileSignature == fileSignature:
+            return jsonCache
+
+        try:
+            with open(self.__usersFile, mode = 'r', encoding = 'utf-8') as file:
+                jsonString = file.read()
+
+            self.__loadJsonString(jsonString, fileSignature)
+        except Exception as e:
+            self.__onReloadFailure(e, fileSignature)
+
+        return self.__requireJsonCache()
 
     async def __readJsonAsync(self) -> dict[str, Any]:
-        if self.__jsonCache is not None:
-            return self.__jsonCache
+        jsonCache = self.__jsonCache
 
-        if not await aiofiles.ospath.exists(self.__usersFile):
-            raise FileNotFoundError(f'Users repository file not found: \"{self.__usersFile}\"')
+        try:
+            statResult = await aiofiles.os.stat(self.__usersFile)
+        except FileNotFoundError as e:
+            if jsonCache is None:
+                raise FileNotFoundError(f'Users repository file not found: \"{self.__usersFile}\"') from e
 
-        async with aiofiles.open(self.__usersFile, mode = 'r', encoding = 'utf-8') as file:
-            data = await file.read()
-            jsonContents = json.loads(data)
+            return jsonCache
 
-        if jsonContents is None:
-            raise IOError(f'Error reading from users repository file: \"{self.__usersFile}\"')
-        elif len(jsonContents) == 0:
-            raise ValueError(f'JSON contents of users repository file \"{self.__usersFile}\" is empty')
+        fileSignature = (statResult.st_mtime_ns, statResult.st_size)
 
-        self.__jsonCache = jsonContents
-        return jsonContents
+        if jsonCache is not None and self.__fileSignature == fileSignature:
+            return jsonCache
+
+        try:
+            async with aiofiles.open(self.__usersFile, mode = 'r', encoding = 'utf-8') as file:
+                jsonString = await file.read()
+
+            self.__loadJsonString(jsonString, fileSignature)
+        except Exception as e:
+            self.__onReloadFailure(e, fileSignature)
+
+        return self.__requireJsonCache()
+
+    def __onReloadFailure(self, exception: Exception, fileSignature: tuple[int, int]):
+        if self.__jsonCache is None:
+            raise exception
+
+        # keep serving the last good snapshot (the file may be mid-edit), and don't retry
+        # until the file changes again
+        self.__fileSignature = fileSignature
+        self.__timber.log('UsersRepository', f'Failed to reload users repository file, keeping previously loaded users (\"{self.__usersFile}\")', exception, traceback.format_exc())
 
     async def removeUser(self, handle: str):
         if not utils.isValidStr(handle):
@@ -767,32 +875,69 @@ class UsersRepository(UsersRepositoryInterface):
             raise TypeError(f'enabled argument is malformed: \"{enabled}\"')
 
         self.__timber.log('UsersRepository', f'Changing enabled status for user \"{handle}\" to \"{enabled}\"...')
-        jsonContents = await self.__readJsonAsync()
-        preExistingHandle: str | None = None
 
-        for key in jsonContents.keys():
-            if key.casefold() == handle.casefold():
-                preExistingHandle = key
-                break
+        async with self.__writeLock:
+            jsonContents = await self.__readJsonAsync()
+            user = self.__userCache.get(handle.casefold(), None)
 
-        if not utils.isValidStr(preExistingHandle):
-            self.__timber.log('UsersRepository', f'Unable to change enabled status for user \"{handle}\" as no user with that handle currently exists')
-            return
+            if user is None:
+                self.__timber.log('UsersRepository', f'Unable to change enabled status for user \"{handle}\" as no user with that handle currently exists')
+                return
+
+            userJson = dict(jsonContents[user.handle])
+            userJson[UserJsonConstant.ENABLED.jsonKey] = enabled
+            jsonContents = dict(jsonContents)
+            jsonContents[user.handle] = userJson
+            await self.__writeAndFlushUsersFileAsync(jsonContents)
 
-        jsonContents[preExistingHandle][UserJsonConstant.ENABLED.jsonKey] = enabled
-        await self.__writeAndFlushUsersFileAsync(jsonContents)
         self.__timber.log('UsersRepository', f'Finished changing enabled status for user ({handle=}) ({enabled=})')
 
+    def __requireJsonCache(self) -> dict[str, Any]:
+        jsonCache = self.__jsonCache
+
+        if jsonCache is None:
+            raise IOError(f'Error reading from users repository file: \"{self.__usersFile}\"')
+
+        return jsonCache
+
+    def __requireUsers(self) -> FrozenList[User]:
+        users = self.__users
+
+        if users is None:
+            raise NoUsersException(f'Unable to read in any users from users repository file: \"{self.__usersFile}\"')
+
+        return users
+
     async def __writeAndFlushUsersFileAsync(self, jsonContents: dict[str, Any]):
         if not isinstance(jsonContents, dict):
             raise TypeError(f'jsonContents argument is malformed: \"{jsonContents}\"')
 
-        async with aiofiles.open(self.__usersFile, mode = 'w', encoding = 'utf-8') as file:
-            jsonString = json.dumps(jsonContents, indent = 4, sort_keys = True)
-            await file.write(jsonString)
-            await file.flush()
+        jsonString = json.dumps(jsonContents, indent = 4, sort_keys = True)
+        temporaryFile = f'{self.__usersFile}.tmp'
 
-        # be sure to clear caches, as JSON file contents have now been updated
-        await self.clearCaches()
+        # write to a temporary file and then rename it over the real one, so that a crash
+        # mid-write can never leave behind a truncated users repository file
+        try:
+            async with aiofiles.open(temporaryFile, mode = 'w', encoding = 'utf-8') as file:
+                await file.write(jsonString)
+                await file.flush()
+                await asyncio.to_thread(os.fsync, file.fileno())
+
+            await aiofiles.os.replace(temporaryFile, self.__usersFile)
+        except Exception:
+            if await aiofiles.ospath.exists(temporaryFile):
+                await aiofiles.os.remove(temporaryFile)
+
+            raise
+
+        statResult = await aiofiles.os.stat(self.__usersFile)
+
+        # the new contents are already in hand, so apply them directly rather than clearing
+        # caches, which only rebuilds the users that were actually changed
+        self.__applyJsonContents(
+            jsonContents = jsonContents,
+            fileHash = self.__hashString(jsonString),
+            fileSignature = (statResult.st_mtime_ns, statResult.st_size),
+        )
 
         self.__timber.log('UsersRepository', f'Finished writing out changes to users repository JSON file (\"{self.__usersFile}\")')
@@ -62,18 +62,20 @@ class VoicemailsRepository(VoicemailsRepositoryInterface):
         self.__cache[twitchChannelId].pop(targetUserId, None)
 
         connection = await self.__getDatabaseConnection()
-        now = datetime.now(self.__timeZoneRepository.getDefault())
-        voicemailId = await self.__generateNewVoicemailId(connection)
-
-        await connection.execute(
-            '''
-                INSERT INTO voicemails (createddatetime, message, originatinguserid, targetuserid, twitchchannelid, voicemailid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-            ''',
-            now.isoformat(), message, originatingUserId, targetUserId, twitchChannelId, voicemailId
-        )
 
-        await connection.close()
+        try:
+            now = datetime.now(self.__timeZoneRepository.getDefault())
+            voicemailId = await self.__generateNewVoicemailId(connection)
+
+            await connection.execute(
+                '''
+                    INSERT INTO voicemails (createddatetime, message, originatinguserid, targetuserid, twitchchannelid, voicemailid)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                ''',
+                now.isoformat(), message, originatingUserId, targetUserId, twitchChannelId, voicemailId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('VoicemailsRepository', f'Added new voicemail ({originatingUserId=}) ({targetUserId=}) ({twitchChannelId=}) ({voicemailId=})')
 
         return AddVoicemailResult.OK
@@ -121,16 +123,18 @@ class VoicemailsRepository(VoicemailsRepositoryInterface):
             return cachedVoicemails
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT createddatetime, message, targetuserid, voicemailid FROM voicemails
-                WHERE originatinguserid = $1 AND twitchchannelid = $2
-                ORDER BY createddatetime ASC
-            ''',
-            originatingUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT createddatetime, message, targetuserid, voicemailid FROM voicemails
+                    WHERE originatinguserid = $1 AND twitchchannelid = $2
+                    ORDER BY createddatetime ASC
+                ''',
+                originatingUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
         voicemails: FrozenList[VoicemailData] = FrozenList()
         self.__cache[twitchChannelId][originatingUserId] = voicemails
 
@@ -166,16 +170,18 @@ class VoicemailsRepository(VoicemailsRepositoryInterface):
             return cachedVoicemails
 
         connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT createddatetime, message, originatinguserid, voicemailid FROM voicemails
-                WHERE targetuserid = $1 AND twitchchannelid = $2
-                ORDER BY createddatetime ASC
-            ''',
-            targetUserId, twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            records = await connection.fetchRows(
+                '''
+                    SELECT createddatetime, message, originatinguserid, voicemailid FROM voicemails
+                    WHERE targetuserid = $1 AND twitchchannelid = $2
+                    ORDER BY createddatetime ASC
+                ''',
+                targetUserId, twitchChannelId
+            )
+        finally:
+            await connection.close()
         voicemails: FrozenList[VoicemailData] = FrozenList()
         self.__cache[twitchChannelId][targetUserId] = voicemails
 
@@ -227,41 +233,42 @@ class VoicemailsRepository(VoicemailsRepositoryInterface):
         self.__isDatabaseReady = True
         connection = await self.__backingDatabase.getConnection()
 
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS voicemails (
-                            createddatetime text NOT NULL,
-                            message text NOT NULL,
-                            originatinguserid text NOT NULL,
-                            targetuserid text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            voicemailid text NOT NULL,
-                            PRIMARY KEY (originatinguserid, targetuserid, twitchchannelid, voicemailid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.execute(
-                    '''
-                        CREATE TABLE IF NOT EXISTS voicemails (
-                            createddatetime TEXT NOT NULL,
-                            message TEXT NOT NULL,
-                            originatinguserid TEXT NOT NULL,
-                            targetuserid TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            voicemailid TEXT NOT NULL,
-                            PRIMARY KEY (originatinguserid, targetuserid, twitchchannelid, voicemailid)
-                        ) STRICT
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        try:
+            match connection.databaseType:
+                case DatabaseType.POSTGRESQL:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS voicemails (
+                                createddatetime text NOT NULL,
+                                message text NOT NULL,
+                                originatinguserid text NOT NULL,
+                                targetuserid text NOT NULL,
+                                twitchchannelid text NOT NULL,
+                                voicemailid text NOT NULL,
+                                PRIMARY KEY (originatinguserid, targetuserid, twitchchannelid, voicemailid)
+                            )
+                        '''
+                    )
+
+                case DatabaseType.SQLITE:
+                    await connection.execute(
+                        '''
+                            CREATE TABLE IF NOT EXISTS voicemails (
+                                createddatetime TEXT NOT NULL,
+                                message TEXT NOT NULL,
+                                originatinguserid TEXT NOT NULL,
+                                targetuserid TEXT NOT NULL,
+                                twitchchannelid TEXT NOT NULL,
+                                voicemailid TEXT NOT NULL,
+                                PRIMARY KEY (originatinguserid, targetuserid, twitchchannelid, voicemailid)
+                            ) STRICT
+                        '''
+                    )
+
+                case _:
+                    raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        finally:
+            await connection.close()
 
     async def removeVoicemail(
         self,
@@ -276,32 +283,33 @@ class VoicemailsRepository(VoicemailsRepositoryInterface):
         self.__cache.pop(twitchChannelId, None)
 
         connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT COUNT(1) FROM voicemails
-                WHERE twitchchannelid = $1 AND voicemailid = $2
-                LIMIT 1
-            ''',
-            twitchChannelId, voicemailId
-        )
 
-        count: int | None = None
-        if record is not None and len(record) >= 1:
-            count = record[0]
+        try:
+            record = await connection.fetchRow(
+                '''
+                    SELECT COUNT(1) FROM voicemails
+                    WHERE twitchchannelid = $1 AND voicemailid = $2
+                    LIMIT 1
+                ''',
+                twitchChannelId, voicemailId
+            )
 
-        if not utils.isValidInt(count) or count == 0:
-            await connection.close()
-            return RemoveVoicemailResult.NOT_FOUND
-
-        await connection.execute(
-            '''
-                DELETE FROM voicemails
-                WHERE twitchchannelid = $1 AND voicemailid = $2
-            ''',
-            twitchChannelId, voicemailId
-        )
+            count: int | None = None
+            if record is not None and len(record) >= 1:
+                count = record[0]
+
+            if not utils.isValidInt(count) or count == 0:
+                return RemoveVoicemailResult.NOT_FOUND
 
-        await connection.close()
+            await connection.execute(
+                '''
+                    DELETE FROM voicemails
+                    WHERE twitchchannelid = $1 AND voicemailid = $2
+                ''',
+                twitchChannelId, voicemailId
+            )
+        finally:
+            await connection.close()
         self.__timber.log('VoicemailsRepository', f'Deleted voicemail ({twitchChannelId=}) ({voicemailId=})')
 
         return RemoveVoicemailResult.OK
@@ -0,0 +1,87 @@
+from collections import deque
+from datetime import datetime
+from typing import Final
+
+from .websocketBroadcastHubInterface import WebsocketBroadcastHubInterface
+from .websocketSubscriber import WebsocketSubscriber
+from .websocketSubscription import WebsocketSubscription
+from ..websocketEvent import WebsocketEvent
+from ...misc import utils as utils
+
+
+class WebsocketBroadcastHub(WebsocketBroadcastHubInterface):
+
+    def __init__(
+        self,
+        replayBufferSize: int = 64,
+        subscriberBufferSize: int = 32,
+    ):
+        if not utils.isValidInt(replayBufferSize):
+            raise TypeError(f'replayBufferSize argument is malformed: \"{replayBufferSize}\"')
+        elif replayBufferSize < 1 or replayBufferSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'replayBufferSize argument is out of bounds: {replayBufferSize}')
+        elif not utils.isValidInt(subscriberBufferSize):
+            raise TypeError(f'subscriberBufferSize argument is malformed: \"{subscriberBufferSize}\"')
+        elif subscriberBufferSize < 1 or subscriberBufferSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'subscriberBufferSize argument is out of bounds: {subscriberBufferSize}')
+
+        self.__subscriberBufferSize: Final[int] = subscriberBufferSize
+
+        self.__replayBuffer: Final[deque[WebsocketEvent]] = deque(maxlen = replayBufferSize)
+        self.__subscribers: Final[set[WebsocketSubscriber]] = set()
+
+    def getSubscriberCount(self) -> int:
+        return len(self.__subscribers)
+
+    def publish(self, event: WebsocketEvent) -> int:
+        if not isinstance(event, WebsocketEvent):
+            raise TypeError(f'event argument is malformed: \"{event}\"')
+
+        self.__replayBuffer.append(event)
+        deliveries = 0
+
+        for subscriber in self.__subscribers:
+            if subscriber.offer(event):
+                deliveries += 1
+
+        return deliveries
+
+    def subscribe(
+        self,
+        subscription: WebsocketSubscription,
+        replayEventsSince: datetime,
+    ) -> WebsocketSubscriber:
+        if not isinstance(subscription, WebsocketSubscription):
+            raise TypeError(f'subscription argument is malformed: \"{subscription}\"')
+        elif not isinstance(replayEventsSince, datetime):
+            raise TypeError(f'replayEventsSince argument is malformed: \"{replayEventsSince}\"')
+
+        subscriber = WebsocketSubscriber(
+            subscription = subscription,
+            bufferSize = self.__subscriberBufferSize,
+        )
+
+        lastEventId = subscription.lastEventId
+
+        if lastEventId is not None and len(self.__replayBuffer) >= 1 and lastEventId > self.__replayBuffer[-1].eventId:
+            # this subscriber has seen event IDs that we never handed out, which means that
+            # we've been restarted since, so fall back to replaying by event time instead
+            lastEventId = None
+
+        for event in self.__replayBuffer:
+            if lastEventId is None:
+                if event.eventTime < replayEventsSince:
+                    continue
+            elif event.eventId <= lastEventId:
+                continue
+
+            subscriber.offer(event)
+
+        self.__subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: WebsocketSubscriber):
+        if not isinstance(subscriber, WebsocketSubscriber):
+            raise TypeError(f'subscriber argument is malformed: \"{subscriber}\"')
+
+        self.__subscribers.discard(subscriber)
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from .websocketSubscriber import WebsocketSubscriber
+from .websocketSubscription import WebsocketSubscription
+from ..websocketEvent import WebsocketEvent
+
+
+class WebsocketBroadcastHubInterface(ABC):
+
+    @abstractmethod
+    def getSubscriberCount(self) -> int:
+        pass
+
+    @abstractmethod
+    def publish(self, event: WebsocketEvent) -> int:
+        pass
+
+    @abstractmethod
+    def subscribe(
+        self,
+        subscription: WebsocketSubscription,
+        replayEventsSince: datetime,
+    ) -> WebsocketSubscriber:
+        pass
+
+    @abstractmethod
+    def unsubscribe(self, subscriber: WebsocketSubscriber):
+        pass
@@ -0,0 +1,63 @@
+import asyncio
+from collections import deque
+from typing import Final
+
+from .websocketSubscription import WebsocketSubscription
+from ..websocketEvent import WebsocketEvent
+from ...misc import utils as utils
+
+
+class WebsocketSubscriber:
+
+    def __init__(
+        self,
+        subscription: WebsocketSubscription,
+        bufferSize: int,
+    ):
+        if not isinstance(subscription, WebsocketSubscription):
+            raise TypeError(f'subscription argument is malformed: \"{subscription}\"')
+        elif not utils.isValidInt(bufferSize):
+            raise TypeError(f'bufferSize argument is malformed: \"{bufferSize}\"')
+        elif bufferSize < 1 or bufferSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'bufferSize argument is out of bounds: {bufferSize}')
+
+        self.__subscription: Final[WebsocketSubscription] = subscription
+
+        self.__buffer: Final[deque[WebsocketEvent]] = deque(maxlen = bufferSize)
+        self.__bufferReady: Final[asyncio.Event] = asyncio.Event()
+        self.__droppedEvents: int = 0
+
+    @property
+    def droppedEvents(self) -> int:
+        return self.__droppedEvents
+
+    async def next(self) -> WebsocketEvent:
+        while len(self.__buffer) == 0:
+            self.__bufferReady.clear()
+            await self.__bufferReady.wait()
+
+        return self.__buffer.popleft()
+
+    def offer(self, event: WebsocketEvent) -> bool:
+        if not isinstance(event, WebsocketEvent):
+            raise TypeError(f'event argument is malformed: \"{event}\"')
+
+        if not self.__subscription.matches(event):
+            return False
+
+        if len(self.__buffer) == self.__buffer.maxlen:
+            # this subscriber isn't keeping up, so its oldest pending event gets dropped (the
+            # deque does this for us) rather than holding back everyone else
+            self.__droppedEvents += 1
+
+        self.__buffer.append(event)
+        self.__bufferReady.set()
+        return True
+
+    @property
+    def pendingEvents(self) -> int:
+        return len(self.__buffer)
+
+    @property
+    def subscription(self) -> WebsocketSubscription:
+        return self.__subscription
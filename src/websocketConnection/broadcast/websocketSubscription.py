@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from ..websocketEvent import WebsocketEvent
+from ..websocketEventType import WebsocketEventType
+
+
+@dataclass(frozen = True)
+class WebsocketSubscription:
+    eventTypes: frozenset[WebsocketEventType] | None
+    lastEventId: int | None
+    twitchChannelIds: frozenset[str] | None
+
+    def matches(self, event: WebsocketEvent) -> bool:
+        if self.eventTypes is not None and event.eventType not in self.eventTypes:
+            return False
+        elif self.twitchChannelIds is not None and event.twitchChannelId not in self.twitchChannelIds:
+            return False
+        else:
+            return True
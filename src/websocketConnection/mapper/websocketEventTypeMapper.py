@@ -1,9 +1,25 @@
+from typing import Any
+
 from .websocketEventTypeMapperInterface import WebsocketEventTypeMapperInterface
 from ..websocketEventType import WebsocketEventType
+from ...misc import utils as utils
 
 
 class WebsocketEventTypeMapper(WebsocketEventTypeMapperInterface):
 
+    def parseWebsocketEventType(
+        self,
+        string: str | Any | None,
+    ) -> WebsocketEventType | None:
+        if not utils.isValidStr(string):
+            return None
+
+        string = string.lower()
+
+        match string:
+            case 'channelprediction': return WebsocketEventType.CHANNEL_PREDICTION
+            case _: return None
+
     def toString(self, eventType: WebsocketEventType) -> str:
         if not isinstance(eventType, WebsocketEventType):
             raise TypeError(f'eventType argument is malformed: \"{eventType}\"')
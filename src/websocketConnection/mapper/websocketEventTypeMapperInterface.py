@@ -1,10 +1,18 @@
 from abc import ABC, abstractmethod
+from typing import Any
 
 from ..websocketEventType import WebsocketEventType
 
 
 class WebsocketEventTypeMapperInterface(ABC):
 
+    @abstractmethod
+    def parseWebsocketEventType(
+        self,
+        string: str | Any | None,
+    ) -> WebsocketEventType | None:
+        pass
+
     @abstractmethod
     def toString(self, eventType: WebsocketEventType) -> str:
         pass
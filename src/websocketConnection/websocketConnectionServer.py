@@ -1,15 +1,18 @@
 import asyncio
+import itertools
 import json
-import queue
 import traceback
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 from typing import Any, Final
+from urllib.parse import parse_qs, urlsplit
 
 import websockets
-from frozenlist import FrozenList
 from websockets.asyncio.server import ServerConnection
 
+from .broadcast.websocketBroadcastHub import WebsocketBroadcastHub
+from .broadcast.websocketBroadcastHubInterface import WebsocketBroadcastHubInterface
+from .broadcast.websocketSubscriber import WebsocketSubscriber
+from .broadcast.websocketSubscription import WebsocketSubscription
 from .mapper.websocketEventTypeMapperInterface import WebsocketEventTypeMapperInterface
 from .settings.websocketConnectionServerSettingsInterface import WebsocketConnectionServerSettingsInterface
 from .websocketConnectionServerInterface import WebsocketConnectionServerInterface
@@ -30,8 +33,9 @@ class WebsocketConnectionServer(WebsocketConnectionServerInterface):
         timeZoneRepository: TimeZoneRepositoryInterface,
         websocketConnectionServerSettings: WebsocketConnectionServerSettingsInterface,
         websocketEventTypeMapper: WebsocketEventTypeMapperInterface,
-        websocketSleepTimeSeconds: float = 3,
-        queueTimeoutSeconds: int = 3,
+        serverLoopSleepTimeSeconds: float = 3,
+        replayBufferSize: int = 64,
+        subscriberBufferSize: int = 32,
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -43,58 +47,108 @@ class WebsocketConnectionServer(WebsocketConnectionServerInterface):
             raise TypeError(f'websocketConnectionServerSettings argument is malformed: \"{websocketConnectionServerSettings}\"')
         elif not isinstance(websocketEventTypeMapper, WebsocketEventTypeMapperInterface):
             raise TypeError(f'websocketEventTypeMapper argument is malformed: \"{websocketEventTypeMapper}\"')
-        elif not utils.isValidNum(websocketSleepTimeSeconds):
-            raise TypeError(f'websocketSleepTimeSeconds argument is malformed: \"{websocketSleepTimeSeconds}\"')
-        elif websocketSleepTimeSeconds < 3 or websocketSleepTimeSeconds > 10:
-            raise TypeError(f'websocketSleepTimeSeconds argument is out of bounds: {websocketSleepTimeSeconds}')
-        elif not utils.isValidInt(queueTimeoutSeconds):
-            raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
-        elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
-            raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
+        elif not utils.isValidNum(serverLoopSleepTimeSeconds):
+            raise TypeError(f'serverLoopSleepTimeSeconds argument is malformed: \"{serverLoopSleepTimeSeconds}\"')
+        elif serverLoopSleepTimeSeconds < 1 or serverLoopSleepTimeSeconds > 10:
+            raise ValueError(f'serverLoopSleepTimeSeconds argument is out of bounds: {serverLoopSleepTimeSeconds}')
+        elif not utils.isValidInt(replayBufferSize):
+            raise TypeError(f'replayBufferSize argument is malformed: \"{replayBufferSize}\"')
+        elif replayBufferSize < 1 or replayBufferSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'replayBufferSize argument is out of bounds: {replayBufferSize}')
+        elif not utils.isValidInt(subscriberBufferSize):
+            raise TypeError(f'subscriberBufferSize argument is malformed: \"{subscriberBufferSize}\"')
+        elif subscriberBufferSize < 1 or subscriberBufferSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'subscriberBufferSize argument is out of bounds: {subscriberBufferSize}')
 
         self.__backgroundTaskHelper: Final[BackgroundTaskHelperInterface] = backgroundTaskHelper
         self.__timber: Final[TimberInterface] = timber
         self.__timeZoneRepository: Final[TimeZoneRepositoryInterface] = timeZoneRepository
         self.__websocketConnectionServerSettings: Final[WebsocketConnectionServerSettingsInterface] = websocketConnectionServerSettings
         self.__websocketEventTypeMapper: Final[WebsocketEventTypeMapperInterface] = websocketEventTypeMapper
-        self.__websocketSleepTimeSeconds: Final[float] = websocketSleepTimeSeconds
-        self.__queueTimeoutSeconds: Final[int] = queueTimeoutSeconds
+        self.__serverLoopSleepTimeSeconds: Final[float] = serverLoopSleepTimeSeconds
 
         self.__isStarted: bool = False
-        self.__eventQueue: Final[SimpleQueue[WebsocketEvent]] = SimpleQueue()
+        self.__eventIds: Final[itertools.count[int]] = itertools.count(1)
 
-    async def __handleWebsocketEvents(
-        self,
-        events: FrozenList[WebsocketEvent],
-        serverConnection: ServerConnection,
-    ):
-        if len(events) == 0:
-            return
+        self.__broadcastHub: Final[WebsocketBroadcastHubInterface] = WebsocketBroadcastHub(
+            replayBufferSize = replayBufferSize,
+            subscriberBufferSize = subscriberBufferSize,
+        )
 
-        eventTimeToLive = timedelta(
-            seconds = await self.__websocketConnectionServerSettings.getEventTimeToLiveSeconds()
+    def __parseSubscription(self, serverConnection: ServerConnection) -> WebsocketSubscription:
+        # overlays may narrow down what they receive via query parameters, for example:
+        # ws://host:port/?twitchChannelId=12345&eventType=channelPrediction&lastEventId=67
+        query: dict[str, list[str]] = dict()
+        request = serverConnection.request
+
+        if request is not None:
+            query = parse_qs(urlsplit(request.path).query)
+
+        eventTypes: set[WebsocketEventType] | None = None
+        twitchChannelIds: set[str] | None = None
+        lastEventId: int | None = None
+
+        for value in query.get('eventType', list()):
+            for eventTypeString in value.split(','):
+                eventType = self.__websocketEventTypeMapper.parseWebsocketEventType(eventTypeString.strip())
+
+                if eventType is None:
+                    self.__timber.log('WebsocketConnectionServer', f'Ignoring unknown event type in subscription ({serverConnection=}) ({eventTypeString=})')
+                    continue
+                elif eventTypes is None:
+                    eventTypes = set()
+
+                eventTypes.add(eventType)
+
+        for value in query.get('twitchChannelId', list()):
+            for twitchChannelId in value.split(','):
+                twitchChannelId = twitchChannelId.strip()
+
+                if not utils.isValidStr(twitchChannelId):
+                    continue
+                elif twitchChannelIds is None:
+                    twitchChannelIds = set()
+
+                twitchChannelIds.add(twitchChannelId)
+
+        lastEventIdStrings = query.get('lastEventId', list())
+
+        if len(lastEventIdStrings) >= 1:
+            try:
+                lastEventId = int(lastEventIdStrings[-1])
+            except ValueError:
+                self.__timber.log('WebsocketConnectionServer', f'Ignoring malformed lastEventId in subscription ({serverConnection=}) ({lastEventIdStrings=})')
+
+        return WebsocketSubscription(
+            eventTypes = None if eventTypes is None else frozenset(eventTypes),
+            lastEventId = lastEventId,
+            twitchChannelIds = None if twitchChannelIds is None else frozenset(twitchChannelIds),
         )
 
-        now = datetime.now(self.__timeZoneRepository.getDefault())
+    async def __sendEvents(
+        self,
+        subscriber: WebsocketSubscriber,
+        serverConnection: ServerConnection,
+    ):
+        while True:
+            event = await subscriber.next()
 
-        for index, event in enumerate(events):
-            if event.eventTime + eventTimeToLive >= now:
-                eventJson = await self.__serializeEventToJson(event)
+            eventTimeToLive = timedelta(
+                seconds = await self.__websocketConnectionServerSettings.getEventTimeToLiveSeconds()
+            )
 
-                try:
-                    await serverConnection.send(eventJson)
-                    self.__timber.log('WebsocketConnectionServer', f'Successfully sent websocket event ({serverConnection=}) ({event=}) ({index=})')
-                except Exception as e:
-                    self.__timber.log('WebsocketConnectionServer', f'Failed to send websocket event ({serverConnection=}) ({event=}) ({index=}): {e}', e, traceback.format_exc())
-            else:
-                self.__timber.log('WebsocketConnectionServer', f'Discarded websocket event as it is too old ({serverConnection=}) ({event=}) ({index=})')
+            now = datetime.now(self.__timeZoneRepository.getDefault())
 
-    async def __serializeEventToJson(self, event: WebsocketEvent) -> str:
-        if not isinstance(event, WebsocketEvent):
-            raise TypeError(f'event argument is malformed: \"{event}\"')
+            if event.eventTime + eventTimeToLive < now:
+                self.__timber.log('WebsocketConnectionServer', f'Discarded websocket event as it is too old ({serverConnection=}) ({event.eventId=}) ({event.eventType=})')
+                continue
 
-        # may need to add more logic here in the future if there are ever more event types
-        return json.dumps(event.eventData, sort_keys = True)
+            try:
+                await serverConnection.send(event.eventJson)
+                self.__timber.log('WebsocketConnectionServer', f'Successfully sent websocket event ({serverConnection=}) ({event.eventId=}) ({event.eventType=})')
+            except Exception as e:
+                self.__timber.log('WebsocketConnectionServer', f'Failed to send websocket event ({serverConnection=}) ({event.eventId=}) ({event.eventType=}): {e}', e, traceback.format_exc())
+                return
 
     def start(self):
         if self.__isStarted:
@@ -127,7 +181,7 @@ class WebsocketConnectionServer(WebsocketConnectionServerInterface):
 
                 self.__timber.log('WebsocketConnectionServer', f'Encountered exception during server loop ({host=}) ({port=})', e, traceback.format_exc())
 
-            await asyncio.sleep(self.__websocketSleepTimeSeconds)
+            await asyncio.sleep(self.__serverLoopSleepTimeSeconds)
 
     def submitEvent(
         self,
@@ -148,7 +202,10 @@ class WebsocketConnectionServer(WebsocketConnectionServerInterface):
         if len(eventData) == 0:
             return
 
+        eventId = next(self.__eventIds)
+
         event: dict[str, Any] = {
+            'eventId': eventId,
             'twitchChannel': twitchChannel,
             'twitchChannelId': twitchChannelId,
             'eventType': self.__websocketEventTypeMapper.toString(eventType),
@@ -158,13 +215,15 @@ class WebsocketConnectionServer(WebsocketConnectionServerInterface):
         websocketEvent = WebsocketEvent(
             eventTime = datetime.now(self.__timeZoneRepository.getDefault()),
             eventData = event,
+            eventId = eventId,
+            # serialized just the once here, no matter how many overlays this gets sent to
+            eventJson = json.dumps(event, sort_keys = True),
+            twitchChannelId = twitchChannelId,
             eventType = eventType,
         )
 
-        try:
-            self.__eventQueue.put(websocketEvent, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('WebsocketConnectionServer', f'Encountered queue.Full when submitting a new event ({websocketEvent=}) into the event queue (queue size: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+        deliveries = self.__broadcastHub.publish(websocketEvent)
+        self.__timber.log('WebsocketConnectionServer', f'Submitted websocket event ({eventId=}) ({eventType=}) ({twitchChannelId=}) ({deliveries=})')
 
     async def __websocketConnectionReceived(
         self,
@@ -173,23 +232,28 @@ class WebsocketConnectionServer(WebsocketConnectionServerInterface):
         if not isinstance(serverConnection, ServerConnection):
             raise TypeError(f'serverConnection argument is malformed: \"{serverConnection}\"')
 
-        self.__timber.log('WebsocketConnectionServer', f'Entered `__websocketConnectionReceived()` ({serverConnection=}) (qsize: {self.__eventQueue.qsize()})')
+        subscription = self.__parseSubscription(serverConnection)
 
-        while True:
-            events: FrozenList[WebsocketEvent] = FrozenList()
+        eventTimeToLive = timedelta(
+            seconds = await self.__websocketConnectionServerSettings.getEventTimeToLiveSeconds()
+        )
 
-            try:
-                while not self.__eventQueue.empty():
-                    event = self.__eventQueue.get_nowait()
-                    events.append(event)
-            except queue.Empty as e:
-                self.__timber.log('WebsocketConnectionServer', f'Encountered queue.Empty error when looping through events ({serverConnection=}) (qsize: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+        # events submitted a short while ago (perhaps while this overlay was reconnecting) get replayed
+        subscriber = self.__broadcastHub.subscribe(
+            subscription = subscription,
+            replayEventsSince = datetime.now(self.__timeZoneRepository.getDefault()) - eventTimeToLive,
+        )
 
-            events.freeze()
+        self.__timber.log('WebsocketConnectionServer', f'Entered `__websocketConnectionReceived()` ({serverConnection=}) ({subscription=}) ({subscriber.pendingEvents=}) (subscribers: {self.__broadcastHub.getSubscriberCount()})')
 
-            await self.__handleWebsocketEvents(
-                events = events,
-                serverConnection = serverConnection,
-            )
+        sendEventsTask = self.__backgroundTaskHelper.createTask(self.__sendEvents(
+            subscriber = subscriber,
+            serverConnection = serverConnection,
+        ))
 
-            await asyncio.sleep(self.__websocketSleepTimeSeconds)
+        try:
+            await serverConnection.wait_closed()
+        finally:
+            sendEventsTask.cancel()
+            self.__broadcastHub.unsubscribe(subscriber)
+            self.__timber.log('WebsocketConnectionServer', f'Exited `__websocketConnectionReceived()` ({serverConnection=}) ({subscriber.droppedEvents=}) (subscribers: {self.__broadcastHub.getSubscriberCount()})')
@@ -9,4 +9,7 @@ from .websocketEventType import WebsocketEventType
 class WebsocketEvent:
     eventTime: datetime
     eventData: dict[str, Any]
+    eventId: int
+    eventJson: str
+    twitchChannelId: str
     eventType: WebsocketEventType
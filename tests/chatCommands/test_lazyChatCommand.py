@@ -0,0 +1,47 @@
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from src.chatCommands.absChatCommand import AbsChatCommand
+from src.chatCommands.lazyChatCommand import LazyChatCommand
+from src.twitch.configuration.twitchContext import TwitchContext
+
+
+class TestLazyChatCommand:
+
+    @pytest.mark.asyncio
+    async def test_handleChatCommand_buildsCommandOnFirstUse(self):
+        command = create_autospec(AbsChatCommand, instance = True)
+        command.handleChatCommand = AsyncMock()
+        factoryCalls = 0
+
+        def commandFactory() -> AbsChatCommand:
+            nonlocal factoryCalls
+            factoryCalls += 1
+            return command
+
+        lazyChatCommand = LazyChatCommand(commandFactory)
+        assert not lazyChatCommand.isConstructed
+        assert factoryCalls == 0
+
+        ctx = create_autospec(TwitchContext, instance = True)
+        await lazyChatCommand.handleChatCommand(ctx)
+        await lazyChatCommand.handleChatCommand(ctx)
+
+        assert lazyChatCommand.isConstructed
+        assert factoryCalls == 1
+        assert command.handleChatCommand.await_count == 2
+        command.handleChatCommand.assert_awaited_with(ctx)
+
+    @pytest.mark.asyncio
+    async def test_handleChatCommand_withMalformedCommand(self):
+        lazyChatCommand = LazyChatCommand(lambda: 'not a command')
+
+        with pytest.raises(TypeError):
+            await lazyChatCommand.handleChatCommand(create_autospec(TwitchContext, instance = True))
+
+        assert not lazyChatCommand.isConstructed
+
+    def test_sanity(self):
+        with pytest.raises(TypeError):
+            LazyChatCommand(None) # type: ignore
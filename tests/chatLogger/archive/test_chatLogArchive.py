@@ -0,0 +1,92 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.chatLogger.archive.chatLogArchive import ChatLogArchive
+from src.chatLogger.archive.chatLogArchiveQuery import ChatLogArchiveQuery
+from src.chatLogger.chatEventType import ChatEventType
+from src.chatLogger.models.messageChatLog import MessageChatLog
+from src.chatLogger.models.raidChatLog import RaidChatLog
+from src.misc.simpleDateTime import SimpleDateTime
+from src.timber.timberStub import TimberStub
+
+
+class TestChatLogArchive:
+
+    startDateTime = datetime(2026, 10, 1, 12, 0, tzinfo = timezone.utc)
+
+    def __createChatLogArchive(self, tmp_path) -> ChatLogArchive:
+        return ChatLogArchive(
+            timber = TimberStub(),
+            archiveRootDirectory = str(tmp_path / 'chatLogArchive'),
+            databaseFile = str(tmp_path / 'db' / 'chatLogArchive.sqlite'),
+        )
+
+    def __createMessage(self, minutes: int, chatterUserLogin: str, message: str, twitchChannel: str = 'smCharles') -> MessageChatLog:
+        return MessageChatLog(
+            bits = None,
+            dateTime = SimpleDateTime(now = self.startDateTime + timedelta(minutes = minutes)),
+            chatterUserId = f'{chatterUserLogin}Id',
+            chatterUserLogin = chatterUserLogin,
+            message = message,
+            twitchChannel = twitchChannel,
+            twitchChannelId = f'{twitchChannel}Id',
+        )
+
+    @pytest.mark.asyncio
+    async def test_archive_writesCompressedSegments(self, tmp_path):
+        chatLogArchive = self.__createChatLogArchive(tmp_path)
+        await chatLogArchive.archive([ self.__createMessage(0, 'Eddie', 'hello') ])
+        await chatLogArchive.archive([ self.__createMessage(1, 'Eddie', 'world') ])
+
+        segmentFile = tmp_path / 'chatLogArchive' / 'smcharles' / '2026' / '10' / '01.ndjson.gz'
+
+        with gzip.open(str(segmentFile), mode = 'rt', encoding = 'utf-8') as file:
+            records = [ json.loads(line) for line in file.read().splitlines() ]
+
+        assert [ record['message'] for record in records ] == [ 'hello', 'world' ]
+        assert records[0]['userLogin'] == 'eddie'
+
+    @pytest.mark.asyncio
+    async def test_search(self, tmp_path):
+        chatLogArchive = self.__createChatLogArchive(tmp_path)
+
+        await chatLogArchive.archive([
+            self.__createMessage(0, 'Eddie', 'good morning everyone'),
+            self.__createMessage(5, 'Stashiocat', 'good morning Eddie'),
+            self.__createMessage(10, 'Eddie', 'what a "great" stream'),
+            self.__createMessage(15, 'Eddie', 'hi from elsewhere', twitchChannel = 'imyt'),
+            self.__createMessage(60, 'Eddie', 'good night'),
+            RaidChatLog(
+                viewers = 42,
+                dateTime = SimpleDateTime(now = self.startDateTime + timedelta(minutes = 20)),
+                raidUserId = 'eddieId',
+                raidUserLogin = 'Eddie',
+                twitchChannel = 'smCharles',
+                twitchChannelId = 'smCharlesId',
+            ),
+        ])
+
+        results = await chatLogArchive.search(ChatLogArchiveQuery(
+            startDateTime = self.startDateTime,
+            endDateTime = self.startDateTime + timedelta(minutes = 30),
+            twitchChannel = 'SMCHARLES',
+            userLogin = 'eddie',
+        ))
+
+        assert [ result.chatEventType for result in results ] == [ ChatEventType.MESSAGE, ChatEventType.MESSAGE, ChatEventType.RAID ]
+        assert results[0].message == 'good morning everyone'
+        assert results[0].dateTime == self.startDateTime
+        assert results[2].viewers == 42
+
+        results = await chatLogArchive.search(ChatLogArchiveQuery(text = 'good morning'))
+        assert [ result.userLogin for result in results ] == [ 'eddie', 'stashiocat' ]
+
+        # query syntax characters are searched for as plain text
+        results = await chatLogArchive.search(ChatLogArchiveQuery(text = '"great" stream'))
+        assert len(results) == 1
+
+        results = await chatLogArchive.search(ChatLogArchiveQuery(userId = 'EddieId', limit = 2))
+        assert len(results) == 2
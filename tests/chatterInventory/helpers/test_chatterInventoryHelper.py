@@ -0,0 +1,92 @@
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+from frozendict import frozendict
+
+from src.chatterInventory.helpers.chatterInventoryHelper import ChatterInventoryHelper
+from src.chatterInventory.models.chatterInventoryData import ChatterInventoryData
+from src.chatterInventory.models.chatterItemType import ChatterItemType
+from src.chatterInventory.repositories.chatterInventoryRepositoryInterface import ChatterInventoryRepositoryInterface
+from src.chatterInventory.settings.chatterInventorySettingsInterface import ChatterInventorySettingsInterface
+from src.twitch.tokens.twitchTokensUtilsInterface import TwitchTokensUtilsInterface
+from src.users.userIdsRepositoryInterface import UserIdsRepositoryInterface
+
+
+class TestChatterInventoryHelper:
+
+    def __createHelper(
+        self,
+        chatterInventoryRepository: ChatterInventoryRepositoryInterface,
+        isEnabled: bool,
+    ) -> ChatterInventoryHelper:
+        chatterInventorySettings = create_autospec(ChatterInventorySettingsInterface, instance = True)
+        chatterInventorySettings.isEnabled = AsyncMock(return_value = isEnabled)
+
+        return ChatterInventoryHelper(
+            chatterInventoryRepository = chatterInventoryRepository,
+            chatterInventorySettings = chatterInventorySettings,
+            twitchTokensUtils = create_autospec(TwitchTokensUtilsInterface, instance = True),
+            userIdsRepository = create_autospec(UserIdsRepositoryInterface, instance = True),
+        )
+
+    @pytest.mark.asyncio
+    async def test_giveToChatters(self):
+        inventories = frozendict({
+            chatterUserId: ChatterInventoryData(
+                inventory = frozendict({ ChatterItemType.GASHAPON: 2 }),
+                chatterUserId = chatterUserId,
+                twitchChannelId = 'channel',
+            )
+            for chatterUserId in [ 'a', 'b' ]
+        })
+
+        chatterInventoryRepository = create_autospec(ChatterInventoryRepositoryInterface, instance = True)
+        chatterInventoryRepository.updateForChatters = AsyncMock(return_value = inventories)
+        helper = self.__createHelper(chatterInventoryRepository, isEnabled = True)
+
+        result = await helper.giveToChatters(
+            itemType = ChatterItemType.GASHAPON,
+            giveAmount = 2,
+            chatterUserIds = [ 'a', 'b' ],
+            twitchChannelId = 'channel',
+        )
+
+        # the whole fan out is handed to the repository in a single call
+        assert result == inventories
+        chatterInventoryRepository.updateForChatters.assert_awaited_once_with(
+            itemType = ChatterItemType.GASHAPON,
+            changeAmount = 2,
+            chatterUserIds = [ 'a', 'b' ],
+            twitchChannelId = 'channel',
+        )
+
+    @pytest.mark.asyncio
+    async def test_giveToChatters_whenDisabled(self):
+        chatterInventoryRepository = create_autospec(ChatterInventoryRepositoryInterface, instance = True)
+        helper = self.__createHelper(chatterInventoryRepository, isEnabled = False)
+
+        result = await helper.giveToChatters(
+            itemType = ChatterItemType.GASHAPON,
+            giveAmount = 2,
+            chatterUserIds = [ 'a', 'b', 'a' ],
+            twitchChannelId = 'channel',
+        )
+
+        assert set(result.keys()) == { 'a', 'b' }
+        assert all(len(inventoryData.inventory) == 0 for inventoryData in result.values())
+        chatterInventoryRepository.updateForChatters.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_giveToChatters_withEmptyChatterIds(self):
+        chatterInventoryRepository = create_autospec(ChatterInventoryRepositoryInterface, instance = True)
+        helper = self.__createHelper(chatterInventoryRepository, isEnabled = True)
+
+        result = await helper.giveToChatters(
+            itemType = ChatterItemType.GASHAPON,
+            giveAmount = 2,
+            chatterUserIds = list(),
+            twitchChannelId = 'channel',
+        )
+
+        assert len(result) == 0
+        chatterInventoryRepository.updateForChatters.assert_not_called()
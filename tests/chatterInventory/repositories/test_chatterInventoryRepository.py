@@ -0,0 +1,234 @@
+import asyncio
+import pytest
+from frozendict import frozendict
+
+from src.chatterInventory.mappers.chatterInventoryMapper import ChatterInventoryMapper
+from src.chatterInventory.models.chatterItemType import ChatterItemType
+from src.chatterInventory.repositories.chatterInventoryRepository import ChatterInventoryRepository
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.storage.sqlite.sqliteBackingDatabase import SqliteBackingDatabase
+from src.timber.timberStub import TimberStub
+
+
+class FailingChatterInventoryMapper(ChatterInventoryMapper):
+
+    def __init__(self):
+        super().__init__()
+        self.failOnSerializeCall: int | None = None
+        self.serializeCalls: int = 0
+
+    async def serializeInventory(
+        self,
+        inventory: dict[ChatterItemType, int] | frozendict[ChatterItemType, int],
+    ) -> dict[str, int]:
+        self.serializeCalls += 1
+
+        if self.failOnSerializeCall == self.serializeCalls:
+            raise RuntimeError('serializeInventory failure')
+
+        return await super().serializeInventory(inventory)
+
+
+class TestChatterInventoryRepository:
+
+    twitchChannelId = 'channel'
+
+    def __createBackingDatabase(self, tmp_path) -> SqliteBackingDatabase:
+        return SqliteBackingDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite'),
+        )
+
+    def __createRepository(
+        self,
+        backingDatabase: SqliteBackingDatabase,
+        chatterInventoryMapper: ChatterInventoryMapper | None = None,
+    ) -> ChatterInventoryRepository:
+        if chatterInventoryMapper is None:
+            chatterInventoryMapper = ChatterInventoryMapper()
+
+        return ChatterInventoryRepository(
+            backingDatabase = backingDatabase,
+            chatterInventoryMapper = chatterInventoryMapper,
+            timber = TimberStub(),
+            timeZoneRepository = TimeZoneRepository(),
+        )
+
+    async def __getFromDatabase(
+        self,
+        repository: ChatterInventoryRepository,
+        chatterUserId: str,
+        itemType: ChatterItemType,
+    ) -> int:
+        await repository.clearCaches()
+        inventory = await repository.get(chatterUserId, self.twitchChannelId)
+        return inventory[itemType]
+
+    @pytest.mark.asyncio
+    async def test_trade(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+        await repository.update(ChatterItemType.BANANA, 5, 'a', self.twitchChannelId)
+
+        result = await repository.trade(ChatterItemType.BANANA, 3, 'a', 'b', self.twitchChannelId)
+        assert result.tradeAmount == 3
+        assert result.fromChatterInventory[ChatterItemType.BANANA] == 2
+        assert result.toChatterInventory[ChatterItemType.BANANA] == 3
+
+        assert await self.__getFromDatabase(repository, 'a', ChatterItemType.BANANA) == 2
+        assert await self.__getFromDatabase(repository, 'b', ChatterItemType.BANANA) == 3
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_trade_clampsToWhatTheSenderHas(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+        await repository.update(ChatterItemType.GRENADE, 2, 'a', self.twitchChannelId)
+
+        result = await repository.trade(ChatterItemType.GRENADE, 10, 'a', 'b', self.twitchChannelId)
+        assert result.tradeAmount == 2
+        assert result.fromChatterInventory[ChatterItemType.GRENADE] == 0
+        assert result.toChatterInventory[ChatterItemType.GRENADE] == 2
+
+        # the sender has nothing left, so this trade must not take them negative
+        result = await repository.trade(ChatterItemType.GRENADE, 1, 'a', 'b', self.twitchChannelId)
+        assert result.tradeAmount == 0
+        assert result.fromChatterInventory[ChatterItemType.GRENADE] == 0
+        assert result.toChatterInventory[ChatterItemType.GRENADE] == 2
+
+        assert await self.__getFromDatabase(repository, 'a', ChatterItemType.GRENADE) == 0
+        assert await self.__getFromDatabase(repository, 'b', ChatterItemType.GRENADE) == 2
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_trade_rollsBackWhenSaveFails(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        chatterInventoryMapper = FailingChatterInventoryMapper()
+        repository = self.__createRepository(backingDatabase, chatterInventoryMapper)
+        await repository.update(ChatterItemType.BANANA, 5, 'a', self.twitchChannelId)
+        await repository.update(ChatterItemType.BANANA, 1, 'b', self.twitchChannelId)
+
+        # the sender's new inventory is written first, and then saving the receiver's fails
+        chatterInventoryMapper.failOnSerializeCall = chatterInventoryMapper.serializeCalls + 2
+
+        with pytest.raises(RuntimeError):
+            await repository.trade(ChatterItemType.BANANA, 3, 'a', 'b', self.twitchChannelId)
+
+        assert (await repository.get('a', self.twitchChannelId))[ChatterItemType.BANANA] == 5
+        assert (await repository.get('b', self.twitchChannelId))[ChatterItemType.BANANA] == 1
+        assert await self.__getFromDatabase(repository, 'a', ChatterItemType.BANANA) == 5
+        assert await self.__getFromDatabase(repository, 'b', ChatterItemType.BANANA) == 1
+
+        # and the repository is still usable afterwards
+        result = await repository.trade(ChatterItemType.BANANA, 3, 'a', 'b', self.twitchChannelId)
+        assert result.tradeAmount == 3
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_trade_withConcurrentOppositeTrades(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+        await repository.update(ChatterItemType.BANANA, 50, 'a', self.twitchChannelId)
+        await repository.update(ChatterItemType.BANANA, 50, 'b', self.twitchChannelId)
+
+        trades = list()
+
+        for _ in range(20):
+            trades.append(repository.trade(ChatterItemType.BANANA, 1, 'a', 'b', self.twitchChannelId))
+            trades.append(repository.trade(ChatterItemType.BANANA, 2, 'b', 'a', self.twitchChannelId))
+
+        results = await asyncio.wait_for(asyncio.gather(*trades), timeout = 10)
+        assert all(result.tradeAmount >= 1 for result in results)
+
+        aBananas = await self.__getFromDatabase(repository, 'a', ChatterItemType.BANANA)
+        bBananas = await self.__getFromDatabase(repository, 'b', ChatterItemType.BANANA)
+        assert aBananas == 70
+        assert bBananas == 30
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_updateForChatters_withDuplicateChatterIds(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+
+        inventories = await repository.updateForChatters(
+            itemType = ChatterItemType.GASHAPON,
+            changeAmount = 3,
+            chatterUserIds = [ 'a', 'b', 'a' ],
+            twitchChannelId = self.twitchChannelId,
+        )
+
+        # every chatter is given the items once, no matter how many times they were listed
+        assert set(inventories.keys()) == { 'a', 'b' }
+        assert inventories['a'][ChatterItemType.GASHAPON] == 3
+        assert inventories['b'][ChatterItemType.GASHAPON] == 3
+
+        assert await self.__getFromDatabase(repository, 'a', ChatterItemType.GASHAPON) == 3
+        assert await self.__getFromDatabase(repository, 'b', ChatterItemType.GASHAPON) == 3
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_updateForChatters_withEmptyChatterIds(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+
+        inventories = await repository.updateForChatters(
+            itemType = ChatterItemType.GASHAPON,
+            changeAmount = 3,
+            chatterUserIds = list(),
+            twitchChannelId = self.twitchChannelId,
+        )
+
+        assert len(inventories) == 0
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_updateMultiple(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+        await repository.update(ChatterItemType.TM_36, 2, 'a', self.twitchChannelId)
+
+        inventory = await repository.updateMultiple(
+            changes = {
+                ChatterItemType.CASSETTE_TAPE: 4,
+                ChatterItemType.TM_36: -5,
+            },
+            chatterUserId = 'a',
+            twitchChannelId = self.twitchChannelId,
+        )
+
+        assert inventory[ChatterItemType.CASSETTE_TAPE] == 4
+        assert inventory[ChatterItemType.TM_36] == 0
+
+        assert await self.__getFromDatabase(repository, 'a', ChatterItemType.CASSETTE_TAPE) == 4
+        assert await self.__getFromDatabase(repository, 'a', ChatterItemType.TM_36) == 0
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_updateMultiple_withConcurrentUpdatesForTheSameChatter(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+
+        await asyncio.wait_for(asyncio.gather(*[
+            repository.updateMultiple(
+                changes = {
+                    ChatterItemType.AIR_STRIKE: 1,
+                    ChatterItemType.VORE: 2,
+                },
+                chatterUserId = 'a',
+                twitchChannelId = self.twitchChannelId,
+            )
+            for _ in range(10)
+        ]), timeout = 10)
+
+        assert await self.__getFromDatabase(repository, 'a', ChatterItemType.AIR_STRIKE) == 10
+        assert await self.__getFromDatabase(repository, 'a', ChatterItemType.VORE) == 20
+
+        await backingDatabase.close()
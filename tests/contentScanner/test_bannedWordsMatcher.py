@@ -0,0 +1,71 @@
+from src.contentScanner.bannedPhrase import BannedPhrase
+from src.contentScanner.bannedWord import BannedWord
+from src.contentScanner.bannedWordsMatcher import BannedWordsMatcher
+
+
+class TestBannedWordsMatcher:
+
+    matcher: BannedWordsMatcher = BannedWordsMatcher(frozenset({
+        BannedPhrase('he'),
+        BannedPhrase('hers'),
+        BannedPhrase('his'),
+        BannedPhrase('she'),
+        BannedPhrase('nintendo switch'),
+        BannedWord('qanon')
+    }))
+
+    emptyMatcher: BannedWordsMatcher = BannedWordsMatcher(frozenset())
+
+    def test_counts(self):
+        assert self.matcher.exactWordCount == 1
+        assert self.matcher.phraseCount == 5
+
+    def test_findBannedContent(self):
+        result = self.matcher.findBannedContent(
+            phrases = { 'hello world' },
+            words = { 'hello', 'world' }
+        )
+
+        assert result == BannedPhrase('he')
+
+    def test_findBannedContent_withExactWord(self):
+        result = self.matcher.findBannedContent(
+            phrases = { 'qanon believers' },
+            words = { 'qanon', 'believers' }
+        )
+
+        assert result == BannedWord('qanon')
+
+    def test_findBannedContent_withNoMatch(self):
+        result = self.matcher.findBannedContent(
+            phrases = { 'qanonbelievers' },
+            words = { 'qanonbelievers' }
+        )
+
+        assert result is None
+
+    def test_findBannedPhrase_withEmptyMatcher(self):
+        assert self.emptyMatcher.findBannedPhrase('she sells sea shells') is None
+
+    def test_findBannedPhrase_withFailureLink(self):
+        # "sh" followed by "is" only matches "his" by following the failure link out of "sh"
+        assert self.matcher.findBannedPhrase('shis') == BannedPhrase('his')
+
+    def test_findBannedPhrase_withMultiWordPhrase(self):
+        assert self.matcher.findBannedPhrase('i got a nintendo switch today') == BannedPhrase('nintendo switch')
+        assert self.matcher.findBannedPhrase('i got a nintendo today') is None
+
+    def test_findBannedPhrase_withSuffixMatch(self):
+        # "she" is matched while scanning, and it also contains "he" as a suffix
+        assert self.matcher.findBannedPhrase('ushe') == BannedPhrase('she')
+
+    def test_findBannedPhrase_withNoMatch(self):
+        assert self.matcher.findBannedPhrase('xyz') is None
+        assert self.matcher.findBannedPhrase('') is None
+
+    def test_findBannedWord(self):
+        assert self.matcher.findBannedWord([ 'hello', 'qanon' ]) == BannedWord('qanon')
+        assert self.matcher.findBannedWord([ 'hello', 'qanonbelievers' ]) is None
+
+    def test_findBannedWord_withEmptyMatcher(self):
+        assert self.emptyMatcher.findBannedWord([ 'qanon' ]) is None
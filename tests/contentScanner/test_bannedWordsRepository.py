@@ -67,3 +67,18 @@ class TestBannedWordsRepository:
 
         bannedWords = await bannedWordsRepository.getBannedWordsAsync()
         assert len(bannedWords) == 0
+
+    @pytest.mark.asyncio
+    async def test_getBannedWordsMatcherAsync(self):
+        bannedWordsRepository: BannedWordsRepositoryInterface = BannedWordsRepository(
+            bannedWordsLinesReader = self.bannedWordsLinesReader,
+            timber = self.timber
+        )
+
+        matcher = await bannedWordsRepository.getBannedWordsMatcherAsync()
+        assert matcher.exactWordCount == 1
+        assert matcher.phraseCount == 2
+        assert matcher is await bannedWordsRepository.getBannedWordsMatcherAsync()
+
+        await bannedWordsRepository.clearCaches()
+        assert matcher is not await bannedWordsRepository.getBannedWordsMatcherAsync()
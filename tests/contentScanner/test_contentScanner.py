@@ -77,6 +77,28 @@ class TestContentScanner:
         result = await self.contentScanner.scan('Hello https://google.com/ World!')
         assert result is ContentCode.CONTAINS_URL
 
+    @pytest.mark.asyncio
+    async def test_scanMany(self):
+        results = await self.contentScanner.scanMany([
+            'Hello, World!',
+            'qanon believers need help',
+            None,
+            '',
+            'Hello https://google.com/ World!'
+        ])
+
+        assert len(results) == 5
+        assert results[0] is ContentCode.OK
+        assert results[1] is ContentCode.CONTAINS_BANNED_CONTENT
+        assert results[2] is ContentCode.IS_NONE
+        assert results[3] is ContentCode.IS_EMPTY
+        assert results[4] is ContentCode.CONTAINS_URL
+
+    @pytest.mark.asyncio
+    async def test_scanMany_withEmptyList(self):
+        results = await self.contentScanner.scanMany(list())
+        assert len(results) == 0
+
     @pytest.mark.asyncio
     async def test_updatePhrasesContent(self):
         # TODO
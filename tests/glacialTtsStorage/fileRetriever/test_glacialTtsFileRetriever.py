@@ -0,0 +1,171 @@
+import asyncio
+import os
+
+import pytest
+
+from src.glacialTtsStorage.fileRetriever.glacialTtsFileRetriever import GlacialTtsFileRetriever
+from src.glacialTtsStorage.idGenerator.glacialTtsIdGenerator import GlacialTtsIdGenerator
+from src.glacialTtsStorage.mapper.glacialTtsDataMapper import GlacialTtsDataMapper
+from src.glacialTtsStorage.repository.glacialTtsStorageRepository import GlacialTtsStorageRepository
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.timber.timberStub import TimberStub
+from src.tts.directoryProvider.ttsDirectoryProvider import TtsDirectoryProvider
+from src.tts.models.ttsProvider import TtsProvider
+
+
+class TestGlacialTtsFileRetriever:
+
+    def __createFileRetriever(
+        self,
+        tmp_path,
+        maxCacheSizeBytes: int = 1024 * 1024,
+    ) -> tuple[GlacialTtsStorageRepository, GlacialTtsFileRetriever]:
+        timber = TimberStub()
+
+        glacialTtsStorageRepository = GlacialTtsStorageRepository(
+            glacialTtsDataMapper = GlacialTtsDataMapper(),
+            glacialTtsIdGenerator = GlacialTtsIdGenerator(),
+            timber = timber,
+            timeZoneRepository = TimeZoneRepository(),
+            databaseFile = str(tmp_path / 'glacialTtsStorage.sqlite'),
+        )
+
+        fileRetriever = GlacialTtsFileRetriever(
+            eventLoop = asyncio.get_running_loop(),
+            glacialTtsStorageRepository = glacialTtsStorageRepository,
+            timber = timber,
+            ttsDirectoryProvider = TtsDirectoryProvider(
+                rootTtsDirectory = str(tmp_path / 'tts'),
+            ),
+            maxCacheSizeBytes = maxCacheSizeBytes,
+        )
+
+        return glacialTtsStorageRepository, fileRetriever
+
+    def __writeFile(self, filePath: str, sizeBytes: int):
+        os.makedirs(os.path.dirname(filePath), exist_ok = True)
+
+        with open(filePath, 'wb') as file:
+            file.write(bytes(sizeBytes))
+
+    @pytest.mark.asyncio
+    async def test_findFile_afterSaveFile(self, tmp_path):
+        glacialTtsStorageRepository, fileRetriever = self.__createFileRetriever(tmp_path)
+
+        assert await fileRetriever.findFile('hello world', 'Voice', TtsProvider.GOOGLE) is None
+
+        savedFile = await fileRetriever.saveFile('mp3', 'hello world', 'Voice', TtsProvider.GOOGLE)
+        self.__writeFile(savedFile.filePath, 16)
+
+        foundFile = await fileRetriever.findFile('hello world', 'voice', TtsProvider.GOOGLE)
+        assert foundFile is not None
+        assert foundFile.filePath == savedFile.filePath
+
+        assert await fileRetriever.findFile('hello world', 'Voice', TtsProvider.MICROSOFT) is None
+
+        metrics = fileRetriever.getCacheMetrics()
+        assert metrics.hits == 1
+        assert metrics.misses == 2
+        assert metrics.cachedFiles == 1
+
+        await glacialTtsStorageRepository.close()
+
+    @pytest.mark.asyncio
+    async def test_findFile_withDeletedFile(self, tmp_path):
+        glacialTtsStorageRepository, fileRetriever = self.__createFileRetriever(tmp_path)
+
+        savedFile = await fileRetriever.saveFile('mp3', 'hello world', None, TtsProvider.DEC_TALK)
+        self.__writeFile(savedFile.filePath, 16)
+        assert await fileRetriever.findFile('hello world', None, TtsProvider.DEC_TALK) is not None
+
+        os.remove(savedFile.filePath)
+        assert await fileRetriever.findFile('hello world', None, TtsProvider.DEC_TALK) is None
+        assert fileRetriever.getCacheMetrics().cachedFiles == 0
+
+        await glacialTtsStorageRepository.close()
+
+    @pytest.mark.asyncio
+    async def test_findFile_withExistingFilesOnDisk(self, tmp_path):
+        glacialTtsStorageRepository, fileRetriever = self.__createFileRetriever(tmp_path)
+        savedFile = await fileRetriever.saveFile('wav', 'good morning', None, TtsProvider.COMMODORE_SAM)
+        self.__writeFile(savedFile.filePath, 32)
+        await glacialTtsStorageRepository.close()
+
+        # a fresh retriever has to rebuild both of its indexes from what's on disk
+        glacialTtsStorageRepository, fileRetriever = self.__createFileRetriever(tmp_path)
+        foundFile = await fileRetriever.findFile('good morning', None, TtsProvider.COMMODORE_SAM)
+        assert foundFile is not None
+        assert foundFile.filePath == savedFile.filePath
+        assert fileRetriever.getCacheMetrics().cachedSizeBytes == 32
+
+        await glacialTtsStorageRepository.close()
+
+    @pytest.mark.asyncio
+    async def test_saveFile_evictsLeastRecentlyUsedFiles(self, tmp_path):
+        glacialTtsStorageRepository, fileRetriever = self.__createFileRetriever(tmp_path, maxCacheSizeBytes = 100)
+
+        first = await fileRetriever.saveFile('mp3', 'first', None, TtsProvider.GOOGLE)
+        self.__writeFile(first.filePath, 40)
+
+        second = await fileRetriever.saveFile('mp3', 'second', None, TtsProvider.GOOGLE)
+        self.__writeFile(second.filePath, 40)
+
+        # touch the first file so that the second one becomes the least recently used
+        assert await fileRetriever.findFile('first', None, TtsProvider.GOOGLE) is not None
+
+        third = await fileRetriever.saveFile('mp3', 'third', None, TtsProvider.GOOGLE)
+        self.__writeFile(third.filePath, 40)
+
+        fourth = await fileRetriever.saveFile('mp3', 'fourth', None, TtsProvider.GOOGLE)
+        self.__writeFile(fourth.filePath, 40)
+
+        assert not os.path.exists(second.filePath)
+        assert os.path.exists(first.filePath)
+        assert await glacialTtsStorageRepository.get('second', None, TtsProvider.GOOGLE) is None
+        assert await fileRetriever.findFile('first', None, TtsProvider.GOOGLE) is not None
+
+        metrics = fileRetriever.getCacheMetrics()
+        assert metrics.evictedFiles == 1
+        assert metrics.cachedSizeBytes <= 100
+
+        await glacialTtsStorageRepository.close()
+
+    @pytest.mark.asyncio
+    async def test_findOrCreateFile_concurrentRequestsCreateOnce(self, tmp_path):
+        glacialTtsStorageRepository, fileRetriever = self.__createFileRetriever(tmp_path)
+
+        creations: list[str] = list()
+        release = asyncio.Event()
+
+        async def createFile(glacialFile) -> bool:
+            creations.append(glacialFile.filePath)
+            await release.wait()
+            self.__writeFile(glacialFile.filePath, 16)
+            return True
+
+        tasks = [
+            asyncio.create_task(fileRetriever.findOrCreateFile('wav', 'hello world', 'Paul', TtsProvider.DEC_TALK, createFile))
+            for _ in range(3)
+        ]
+
+        await asyncio.sleep(0.1)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert len(creations) == 1
+        assert all(result is not None and result.filePath == creations[0] for result in results)
+        assert fileRetriever.getCacheMetrics().deduplicatedRequests == 2
+
+        await glacialTtsStorageRepository.close()
+
+    @pytest.mark.asyncio
+    async def test_findOrCreateFile_withFailedCreation(self, tmp_path):
+        glacialTtsStorageRepository, fileRetriever = self.__createFileRetriever(tmp_path)
+
+        async def failToCreateFile(glacialFile) -> bool:
+            return False
+
+        assert await fileRetriever.findOrCreateFile('wav', 'hello world', None, TtsProvider.COMMODORE_SAM, failToCreateFile) is None
+        assert await fileRetriever.findFile('hello world', None, TtsProvider.COMMODORE_SAM) is None
+
+        await glacialTtsStorageRepository.close()
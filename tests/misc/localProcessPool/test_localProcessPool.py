@@ -0,0 +1,82 @@
+import asyncio
+import sys
+
+import pytest
+
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.misc.localProcessPool.localProcessPool import LocalProcessPool
+from src.misc.localProcessPool.localProcessPriority import LocalProcessPriority
+from src.timber.timberStub import TimberStub
+
+
+class TestLocalProcessPool:
+
+    def __createPool(self, maxConcurrentProcesses: int = 2) -> LocalProcessPool:
+        return LocalProcessPool(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            timber = TimberStub(),
+            maxConcurrentProcesses = maxConcurrentProcesses,
+        )
+
+    @pytest.mark.asyncio
+    async def test_run(self):
+        pool = self.__createPool()
+
+        result = await pool.run(
+            arguments = [ sys.executable, '-c', 'import sys; print(sys.argv[1])', 'hello "world"; exit 1' ],
+            engineName = 'Python',
+        )
+
+        assert result.timedOut is False
+        assert result.returnCode == 0
+        assert result.stdout == 'hello "world"; exit 1'
+        assert result.attempts == 1
+
+        metrics = pool.getMetrics()
+        assert metrics.engineMetrics['Python'].completedProcesses == 1
+        assert metrics.engineMetrics['Python'].failedProcesses == 0
+
+    @pytest.mark.asyncio
+    async def test_run_withTimeout_retries(self):
+        pool = self.__createPool()
+
+        result = await pool.run(
+            arguments = [ sys.executable, '-c', 'import time; time.sleep(30)' ],
+            engineName = 'Python',
+            maxAttempts = 2,
+            timeoutSeconds = 0.5,
+        )
+
+        assert result.timedOut is True
+        assert result.attempts == 2
+
+        metrics = pool.getMetrics()
+        assert metrics.engineMetrics['Python'].timedOutProcesses == 2
+        assert metrics.engineMetrics['Python'].retriedProcesses == 1
+        assert metrics.engineMetrics['Python'].failedProcesses == 1
+
+    @pytest.mark.asyncio
+    async def test_run_withPriorities(self):
+        pool = self.__createPool(maxConcurrentProcesses = 1)
+        finishOrder: list[str] = list()
+
+        async def run(name: str, priority: LocalProcessPriority, sleepSeconds: float):
+            await pool.run(
+                arguments = [ sys.executable, '-c', f'import time; time.sleep({sleepSeconds})' ],
+                engineName = 'Python',
+                priority = priority,
+            )
+
+            finishOrder.append(name)
+
+        # the first process keeps the only worker busy while the others are queued up behind it
+        first = asyncio.create_task(run('first', LocalProcessPriority.NORMAL, 0.5))
+        await asyncio.sleep(0.1)
+
+        await asyncio.gather(
+            first,
+            run('low', LocalProcessPriority.LOW, 0),
+            run('high', LocalProcessPriority.HIGH, 0),
+        )
+
+        assert finishOrder == [ 'first', 'high', 'low' ]
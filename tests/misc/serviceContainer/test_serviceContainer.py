@@ -0,0 +1,75 @@
+import pytest
+
+from src.misc.serviceContainer.exceptions import CircularServiceDependencyException, DisabledServiceException, \
+    NoSuchServiceException, ServiceAlreadyRegisteredException
+from src.misc.serviceContainer.serviceContainer import ServiceContainer
+
+
+class TestServiceContainer:
+
+    def test_get_buildsLazilyAndOnlyOnce(self):
+        serviceContainer = ServiceContainer()
+        constructions = 0
+
+        def factory() -> str:
+            nonlocal constructions
+            constructions += 1
+            return 'pikachu'
+
+        serviceContainer.register('pokemon', factory)
+        assert constructions == 0
+        assert len(serviceContainer.getConstructionRecords()) == 0
+
+        assert serviceContainer.get('pokemon') == 'pikachu'
+        assert serviceContainer.get('pokemon') == 'pikachu'
+        assert constructions == 1
+
+        records = serviceContainer.getConstructionRecords()
+        assert len(records) == 1
+        assert records[0].serviceName == 'pokemon'
+        assert records[0].constructionSeconds >= 0
+
+    def test_get_withCircularDependency(self):
+        serviceContainer = ServiceContainer()
+        serviceContainer.register('chicken', lambda: serviceContainer.get('egg'))
+        serviceContainer.register('egg', lambda: serviceContainer.get('chicken'))
+
+        with pytest.raises(CircularServiceDependencyException):
+            serviceContainer.get('chicken')
+
+        # a failed construction must not leave anything half built behind
+        serviceContainer.register('rooster', lambda: 'rooster')
+        assert serviceContainer.get('rooster') == 'rooster'
+
+    def test_get_withDisabledService(self):
+        constructions = 0
+
+        def factory() -> str:
+            nonlocal constructions
+            constructions += 1
+            return 'jisho'
+
+        serviceContainer = ServiceContainer(disabledServiceNames = frozenset({ 'jishoHelper' }))
+        serviceContainer.register('jishoHelper', factory)
+        assert not serviceContainer.isEnabled('jishoHelper')
+        assert serviceContainer.getOptional('jishoHelper') is None
+
+        with pytest.raises(DisabledServiceException):
+            serviceContainer.get('jishoHelper')
+
+        assert constructions == 0
+        assert 'jishoHelper' in serviceContainer.buildBootReport(0.5)
+
+    def test_get_withUnknownService(self):
+        serviceContainer = ServiceContainer()
+        assert serviceContainer.getOptional('missingno') is None
+
+        with pytest.raises(NoSuchServiceException):
+            serviceContainer.get('missingno')
+
+    def test_register_withDuplicateServiceName(self):
+        serviceContainer = ServiceContainer()
+        serviceContainer.register('eccoHelper', lambda: 'ecco')
+
+        with pytest.raises(ServiceAlreadyRegisteredException):
+            serviceContainer.register('eccoHelper', lambda: 'ecco')
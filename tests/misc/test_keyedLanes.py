@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.misc.keyedLanes import KeyedLanes
+from src.timber.timberStub import TimberStub
+
+
+class TestKeyedLanes:
+
+    async def __waitUntil(self, condition, timeoutSeconds: float = 2):
+        async with asyncio.timeout(timeoutSeconds):
+            while not condition():
+                await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_submit_keepsOrderWithinKey(self):
+        handledItems: list[tuple[str, int]] = list()
+
+        async def laneHandler(key: str, item: int):
+            # yield in between items, so that a later item could overtake an earlier one
+            await asyncio.sleep(0)
+            handledItems.append((key, item))
+
+        keyedLanes: KeyedLanes[int] = KeyedLanes(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            laneHandler = laneHandler,
+            timber = TimberStub(),
+        )
+
+        for item in range(5):
+            keyedLanes.submit('key', item)
+
+        assert keyedLanes.getQueueDepths() == { 'key': 5 }
+        assert len(keyedLanes) == 5
+
+        await self.__waitUntil(lambda: len(handledItems) == 5)
+
+        assert handledItems == [ ('key', item) for item in range(5) ]
+        assert len(keyedLanes.getQueueDepths()) == 0
+        assert len(keyedLanes) == 0
+
+    @pytest.mark.asyncio
+    async def test_submit_slowKeyDoesNotBlockOthers(self):
+        slowKeyReleased = asyncio.Event()
+        handledItems: list[str] = list()
+
+        async def laneHandler(key: str, item: str):
+            if key == 'slow':
+                await slowKeyReleased.wait()
+
+            handledItems.append(item)
+
+        keyedLanes: KeyedLanes[str] = KeyedLanes(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            laneHandler = laneHandler,
+            timber = TimberStub(),
+        )
+
+        keyedLanes.submit('slow', 'slow 1')
+        keyedLanes.submit('slow', 'slow 2')
+        keyedLanes.submit('fast', 'fast 1')
+
+        await self.__waitUntil(lambda: 'fast 1' in handledItems)
+        assert handledItems == [ 'fast 1' ]
+        assert keyedLanes.getQueueDepths() == { 'slow': 1 }
+
+        slowKeyReleased.set()
+        await self.__waitUntil(lambda: len(handledItems) == 3)
+
+        assert handledItems == [ 'fast 1', 'slow 1', 'slow 2' ]
+        assert len(keyedLanes) == 0
+
+    @pytest.mark.asyncio
+    async def test_submit_withFailingItem(self):
+        handledItems: list[int] = list()
+
+        async def laneHandler(key: str, item: int):
+            if item == 1:
+                raise ValueError('bad item')
+
+            handledItems.append(item)
+
+        keyedLanes: KeyedLanes[int] = KeyedLanes(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            laneHandler = laneHandler,
+            timber = TimberStub(),
+        )
+
+        for item in range(3):
+            keyedLanes.submit('key', item)
+
+        await self.__waitUntil(lambda: len(keyedLanes.getQueueDepths()) == 0)
+
+        # the failing item doesn't take the rest of its lane down with it
+        assert handledItems == [ 0, 2 ]
+
+        # and a new lane is started for the key once another item arrives
+        keyedLanes.submit('key', 3)
+        await self.__waitUntil(lambda: len(handledItems) == 3)
+        assert handledItems == [ 0, 2, 3 ]
+
+    @pytest.mark.asyncio
+    async def test_submit_withMalformedKey(self):
+        async def laneHandler(key: str, item: int):
+            pass
+
+        keyedLanes: KeyedLanes[int] = KeyedLanes(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            laneHandler = laneHandler,
+            timber = TimberStub(),
+        )
+
+        with pytest.raises(TypeError):
+            keyedLanes.submit('', 1)
@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+import pytest
+
+from src.misc.tokenBucket import TokenBucket
+
+
+class TestTokenBucket:
+
+    @pytest.mark.asyncio
+    async def test_acquire_waitsForRefill(self):
+        tokenBucket = TokenBucket(
+            capacity = 2,
+            refillPeriodSeconds = 0.2,
+        )
+
+        start = time.monotonic()
+
+        # the first two tokens are available right away, the third one takes 0.1 seconds to refill
+        await tokenBucket.acquire()
+        await tokenBucket.acquire()
+        await tokenBucket.acquire()
+
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_acquire_withConcurrentWaiters(self):
+        tokenBucket = TokenBucket(
+            capacity = 1,
+            refillPeriodSeconds = 0.05,
+        )
+
+        start = time.monotonic()
+        await asyncio.gather(*[ tokenBucket.acquire() for _ in range(4) ])
+
+        assert time.monotonic() - start >= 0.14
+
+    def test_constructor_withBadArguments(self):
+        with pytest.raises(ValueError):
+            TokenBucket(capacity = 0, refillPeriodSeconds = 1)
+
+        with pytest.raises(TypeError):
+            TokenBucket(capacity = 1, refillPeriodSeconds = None) # type: ignore
+
+    def test_tryAcquire(self):
+        tokenBucket = TokenBucket(
+            capacity = 2,
+            refillPeriodSeconds = 60,
+        )
+
+        assert tokenBucket.capacity == 2
+        assert tokenBucket.tryAcquire()
+        assert tokenBucket.tryAcquire()
+        assert not tokenBucket.tryAcquire()
+        assert tokenBucket.availableTokens < 1
@@ -0,0 +1,135 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from src.misc.ttlCache import TtlCache
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now: float = 0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTtlCache:
+
+    def test_constructWithZeroMaxSize(self):
+        with pytest.raises(ValueError):
+            TtlCache(maxSize = 0)
+
+    def test_get_withExpiredEntry(self):
+        clock = FakeClock()
+        cache: TtlCache[str] = TtlCache(timeToLive = timedelta(seconds = 10), clock = clock)
+        cache.set('pikachu', 'electric')
+        assert cache.get('pikachu') == 'electric'
+
+        clock.now = 10
+        assert cache.get('pikachu') is None
+        assert len(cache) == 0
+
+        stats = cache.getStats()
+        assert stats.expirations == 1
+        assert stats.hits == 1
+        assert stats.misses == 1
+
+    def test_set_evictsLeastRecentlyUsed(self):
+        cache: TtlCache[int] = TtlCache(maxSize = 2)
+        cache.set('bulbasaur', 1)
+        cache.set('charmander', 4)
+        assert cache.contains('bulbasaur')
+
+        cache.set('squirtle', 7)
+        assert cache.contains('bulbasaur')
+        assert not cache.contains('charmander')
+        assert cache.contains('squirtle')
+        assert cache.getStats().evictions == 1
+
+    def test_set_sweepsExpiredEntries(self):
+        clock = FakeClock()
+
+        cache: TtlCache[int] = TtlCache(
+            timeToLive = timedelta(seconds = 10),
+            sweepInterval = timedelta(seconds = 30),
+            clock = clock,
+        )
+
+        cache.set('bulbasaur', 1)
+        cache.set('charmander', 4)
+
+        clock.now = 30
+        cache.set('squirtle', 7)
+        assert len(cache) == 1
+        assert cache.getStats().expirations == 2
+
+    @pytest.mark.asyncio
+    async def test_getOrLoad_concurrentMissesLoadOnce(self):
+        cache: TtlCache[str] = TtlCache()
+        loads = 0
+
+        async def loader() -> str:
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0.01)
+            return 'eevee'
+
+        results = await asyncio.gather(*[ cache.getOrLoad('133', loader) for _ in range(10) ])
+        assert results == [ 'eevee' ] * 10
+        assert loads == 1
+        assert await cache.getOrLoad('133', loader) == 'eevee'
+        assert loads == 1
+
+        stats = cache.getStats()
+        assert stats.deduplicatedLoads == 9
+        assert stats.loads == 1
+
+    @pytest.mark.asyncio
+    async def test_getOrLoad_withFailedLoad(self):
+        cache: TtlCache[str] = TtlCache()
+
+        async def loader() -> str:
+            await asyncio.sleep(0.01)
+            raise RuntimeError('missingno')
+
+        results = await asyncio.gather(*[ cache.getOrLoad('0', loader) for _ in range(3) ], return_exceptions = True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert not cache.contains('0')
+
+    @pytest.mark.asyncio
+    async def test_getOrLoad_withNegativeCaching(self):
+        clock = FakeClock()
+        loads = 0
+
+        async def loader() -> str | None:
+            nonlocal loads
+            loads += 1
+            return None
+
+        cache: TtlCache[str] = TtlCache(clock = clock)
+        assert await cache.getOrLoad('151', loader) is None
+        assert await cache.getOrLoad('151', loader) is None
+        assert loads == 2
+
+        cache = TtlCache(negativeTimeToLive = timedelta(seconds = 5), clock = clock)
+        assert await cache.getOrLoad('151', loader) is None
+        assert await cache.getOrLoad('151', loader) is None
+        assert loads == 3
+
+        clock.now = 5
+        assert await cache.getOrLoad('151', loader) is None
+        assert loads == 4
+
+    @pytest.mark.asyncio
+    async def test_getOrLoad_withInvalidationDuringLoad(self):
+        cache: TtlCache[str] = TtlCache()
+
+        async def loader() -> str:
+            await asyncio.sleep(0)
+            cache.pop('25')
+            return 'stale'
+
+        assert await cache.getOrLoad('25', loader) == 'stale'
+        assert not cache.contains('25')
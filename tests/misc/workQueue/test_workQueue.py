@@ -0,0 +1,85 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.misc.workQueue.workQueue import WorkQueue
+
+
+class TestWorkQueue:
+
+    def test_constructWithNegativeMaxSize(self):
+        with pytest.raises(ValueError):
+            WorkQueue(asyncio.new_event_loop(), maxSize = -1)
+
+    @pytest.mark.asyncio
+    async def test_get(self):
+        workQueue: WorkQueue[str] = WorkQueue(asyncio.get_running_loop())
+        workQueue.put('hello')
+        workQueue.put('world')
+
+        assert await workQueue.get() == 'hello'
+        assert await workQueue.get() == 'world'
+        assert workQueue.empty()
+
+    @pytest.mark.asyncio
+    async def test_get_wakesUpWhenItemArrives(self):
+        workQueue: WorkQueue[str] = WorkQueue(asyncio.get_running_loop())
+        getTask = asyncio.create_task(workQueue.get())
+
+        await asyncio.sleep(0)
+        assert not getTask.done()
+
+        workQueue.put('hello')
+        assert await asyncio.wait_for(getTask, timeout = 1) == 'hello'
+
+    @pytest.mark.asyncio
+    async def test_getBatch(self):
+        workQueue: WorkQueue[int] = WorkQueue(asyncio.get_running_loop())
+
+        for item in range(5):
+            workQueue.put(item)
+
+        batch = await workQueue.getBatch(maxBatchSize = 3)
+        assert list(batch) == [ 0, 1, 2 ]
+
+        batch = await workQueue.getBatch(maxBatchSize = 3)
+        assert list(batch) == [ 3, 4 ]
+
+    @pytest.mark.asyncio
+    async def test_getBatch_withTimeout(self):
+        workQueue: WorkQueue[int] = WorkQueue(asyncio.get_running_loop())
+
+        batch = await workQueue.getBatch(timeoutSeconds = 0.01)
+        assert len(batch) == 0
+
+    @pytest.mark.asyncio
+    async def test_metrics(self):
+        workQueue: WorkQueue[int] = WorkQueue(asyncio.get_running_loop(), maxSize = 2)
+        workQueue.put(1)
+        workQueue.put(2)
+        workQueue.put(3)
+
+        metrics = workQueue.metrics
+        assert metrics.highWaterMark == 2
+        assert metrics.maxSize == 2
+        assert metrics.size == 2
+        assert metrics.totalDropped == 1
+        assert metrics.totalSubmitted == 2
+        assert metrics.totalTaken == 0
+
+        await workQueue.getBatch()
+
+        metrics = workQueue.metrics
+        assert metrics.size == 0
+        assert metrics.totalTaken == 2
+
+    @pytest.mark.asyncio
+    async def test_put_fromAnotherThread(self):
+        workQueue: WorkQueue[str] = WorkQueue(asyncio.get_running_loop())
+
+        thread = threading.Thread(target = lambda: workQueue.put('hello'))
+        thread.start()
+        thread.join()
+
+        assert await asyncio.wait_for(workQueue.get(), timeout = 1) == 'hello'
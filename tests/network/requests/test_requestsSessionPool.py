@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Generator
+
+import pytest
+
+from src.network.requests.requestsSessionPool import RequestsSessionPool
+
+
+class SlowRequestHandler(BaseHTTPRequestHandler):
+
+    activeRequests: int = 0
+    maxActiveRequests: int = 0
+    lock: threading.Lock = threading.Lock()
+
+    def do_GET(self):
+        with SlowRequestHandler.lock:
+            SlowRequestHandler.activeRequests = SlowRequestHandler.activeRequests + 1
+            SlowRequestHandler.maxActiveRequests = max(SlowRequestHandler.maxActiveRequests, SlowRequestHandler.activeRequests)
+
+        time.sleep(0.2)
+
+        with SlowRequestHandler.lock:
+            SlowRequestHandler.activeRequests = SlowRequestHandler.activeRequests - 1
+
+        body = b'hello'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+
+class TestRequestsSessionPool:
+
+    @pytest.fixture
+    def serverUrl(self) -> Generator[str, None, None]:
+        SlowRequestHandler.activeRequests = 0
+        SlowRequestHandler.maxActiveRequests = 0
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), SlowRequestHandler)
+        thread = threading.Thread(target = server.serve_forever, daemon = True)
+        thread.start()
+
+        yield f'http://127.0.0.1:{server.server_address[1]}/'
+
+        server.shutdown()
+        server.server_close()
+
+    @pytest.mark.asyncio
+    async def test_getSession_isReusedPerHost(self):
+        sessionPool = RequestsSessionPool()
+
+        session = sessionPool.getSession('https://www.example.com/a')
+        assert session is sessionPool.getSession('https://WWW.EXAMPLE.COM/b')
+        assert session is not sessionPool.getSession('https://www.example.org/a')
+
+        await sessionPool.close()
+        assert sessionPool.isClosed
+
+    @pytest.mark.asyncio
+    async def test_request(self, serverUrl: str):
+        sessionPool = RequestsSessionPool()
+
+        response = await sessionPool.request(
+            method = 'GET',
+            url = serverUrl,
+            timeoutSeconds = 5,
+        )
+
+        assert response.status_code == 200
+        assert response.content == b'hello'
+
+        await sessionPool.close()
+
+    @pytest.mark.asyncio
+    async def test_request_doesNotBlockEventLoopAndRespectsHostLimit(self, serverUrl: str):
+        sessionPool = RequestsSessionPool(
+            maxConcurrentRequestsPerHost = 2,
+        )
+
+        ticks = 0
+        isDone = False
+
+        async def tick():
+            nonlocal ticks
+
+            while not isDone:
+                ticks = ticks + 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+
+        responses = await asyncio.gather(*[
+            sessionPool.request(method = 'GET', url = serverUrl, timeoutSeconds = 5) for _ in range(4)
+        ])
+
+        isDone = True
+        await ticker
+
+        assert all(response.status_code == 200 for response in responses)
+        assert SlowRequestHandler.maxActiveRequests == 2
+
+        # four 0.2 second requests, two at a time, means the event loop had ~0.4 seconds to tick
+        assert ticks >= 10
+
+        await sessionPool.close()
+
+    @pytest.mark.asyncio
+    async def test_request_afterClose(self):
+        sessionPool = RequestsSessionPool()
+        await sessionPool.close()
+
+        with pytest.raises(RuntimeError):
+            await sessionPool.request(method = 'GET', url = 'https://www.example.com/', timeoutSeconds = 5)
+
+    def test_constructor_withBadArguments(self):
+        with pytest.raises(ValueError):
+            RequestsSessionPool(maxConcurrentRequestsPerHost = 0)
+
+        with pytest.raises(TypeError):
+            RequestsSessionPool(maxWorkers = None) # type: ignore
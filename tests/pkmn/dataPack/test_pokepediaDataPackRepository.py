@@ -0,0 +1,167 @@
+import pytest
+
+from src.pkmn.dataPack.pokepediaDataPackBuilder import PokepediaDataPackBuilder
+from src.pkmn.dataPack.pokepediaDataPackJsonMapper import PokepediaDataPackJsonMapper
+from src.pkmn.dataPack.pokepediaDataPackRepository import PokepediaDataPackRepository
+from src.pkmn.exceptions import NoSuchPokepediaEntryException
+from src.pkmn.pokepediaDamageClass import PokepediaDamageClass
+from src.pkmn.pokepediaElementType import PokepediaElementType
+from src.pkmn.pokepediaGeneration import PokepediaGeneration
+from src.pkmn.pokepediaMachine import PokepediaMachine
+from src.pkmn.pokepediaMachineType import PokepediaMachineType
+from src.pkmn.pokepediaMove import PokepediaMove
+from src.pkmn.pokepediaMoveGeneration import PokepediaMoveGeneration
+from src.pkmn.pokepediaNature import PokepediaNature
+from src.pkmn.pokepediaPokemon import PokepediaPokemon
+from src.pkmn.pokepediaRepositoryInterface import PokepediaRepositoryInterface
+from src.pkmn.pokepediaStat import PokepediaStat
+from src.timber.timberStub import TimberStub
+
+
+class FakePokepediaRepository(PokepediaRepositoryInterface):
+
+    def __init__(self):
+        self.calls: int = 0
+
+        self.move = PokepediaMove(
+            contestType = None,
+            damageClass = PokepediaDamageClass.PHYSICAL,
+            generationMachines = {
+                PokepediaGeneration.GENERATION_1: [ PokepediaMachine(
+                    machineId = 1,
+                    machineNumber = 1,
+                    generation = PokepediaGeneration.GENERATION_1,
+                    machineType = PokepediaMachineType.TM,
+                    machineName = 'tm01',
+                    moveName = 'mega-punch'
+                ) ]
+            },
+            generationMoves = {
+                PokepediaGeneration.GENERATION_1: PokepediaMoveGeneration(
+                    accuracy = 85,
+                    power = 80,
+                    pp = 20,
+                    damageClass = PokepediaDamageClass.PHYSICAL,
+                    elementType = PokepediaElementType.NORMAL,
+                    generation = PokepediaGeneration.GENERATION_1
+                )
+            },
+            critRate = 0,
+            drain = 0,
+            flinchChance = 0,
+            moveId = 5,
+            initialGeneration = PokepediaGeneration.GENERATION_1,
+            description = 'A powerful punch thrown very hard.',
+            name = 'Mega Punch',
+            rawName = 'mega-punch'
+        )
+
+        self.pokemon = PokepediaPokemon(
+            generationElementTypes = {
+                PokepediaGeneration.GENERATION_1: [ PokepediaElementType.NORMAL ],
+                PokepediaGeneration.GENERATION_6: [ PokepediaElementType.FAIRY ]
+            },
+            initialGeneration = PokepediaGeneration.GENERATION_1,
+            height = 6,
+            pokedexId = 35,
+            weight = 75,
+            name = 'Clefairy'
+        )
+
+    async def fetchMachine(self, machineId: int) -> PokepediaMachine:
+        raise NotImplementedError()
+
+    async def fetchMove(self, moveId: int) -> PokepediaMove:
+        self.calls += 1
+
+        if moveId == self.move.getMoveId():
+            return self.move
+
+        raise ValueError(f'no such move: {moveId}')
+
+    async def fetchNature(self, natureId: int) -> PokepediaNature:
+        raise NotImplementedError()
+
+    async def fetchRandomMove(self, maxGeneration: PokepediaGeneration) -> PokepediaMove:
+        raise NotImplementedError()
+
+    async def fetchRandomNature(self) -> PokepediaNature:
+        raise NotImplementedError()
+
+    async def fetchRandomPokemon(self, maxGeneration: PokepediaGeneration) -> PokepediaPokemon:
+        raise NotImplementedError()
+
+    async def fetchRandomStat(self) -> PokepediaStat:
+        raise NotImplementedError()
+
+    async def fetchStat(self, statId: int) -> PokepediaStat:
+        raise NotImplementedError()
+
+    async def searchMoves(self, name: str) -> PokepediaMove:
+        raise NotImplementedError()
+
+    async def searchPokemon(self, name: str) -> PokepediaPokemon:
+        self.calls += 1
+
+        if name == str(self.pokemon.getPokedexId()):
+            return self.pokemon
+
+        raise ValueError(f'no such Pokemon: {name}')
+
+
+class TestPokepediaDataPackRepository:
+
+    timber = TimberStub()
+    pokepediaDataPackJsonMapper = PokepediaDataPackJsonMapper(timber = timber)
+
+    @pytest.mark.asyncio
+    async def test_buildDataPackAndReadItBack(self, tmp_path):
+        dataPackFile = str(tmp_path / 'pokepediaDataPack.sqlite')
+        fakeRepository = FakePokepediaRepository()
+
+        await PokepediaDataPackBuilder(
+            pokepediaDataPackJsonMapper = self.pokepediaDataPackJsonMapper,
+            pokepediaRepository = fakeRepository,
+            timber = self.timber,
+            dataPackFile = dataPackFile
+        ).buildDataPack(PokepediaGeneration.GENERATION_1)
+
+        repository = PokepediaDataPackRepository(
+            pokepediaDataPackJsonMapper = self.pokepediaDataPackJsonMapper,
+            timber = self.timber,
+            dataPackFile = dataPackFile
+        )
+
+        calls = fakeRepository.calls
+
+        move = await repository.searchMoves('MEGA PUNCH')
+        assert move.getMoveId() == 5
+        assert move.toStrList() == fakeRepository.move.toStrList()
+        assert move is await repository.fetchMove(5)
+        assert move is await repository.fetchRandomMove(PokepediaGeneration.GENERATION_1)
+        assert (await repository.fetchMachine(1)).machineName == 'tm01'
+
+        pokemon = await repository.searchPokemon('clefairy')
+        assert pokemon.toStrList() == fakeRepository.pokemon.toStrList()
+        assert pokemon is await repository.searchPokemon('35')
+        assert pokemon is await repository.fetchRandomPokemon(PokepediaGeneration.GENERATION_1)
+
+        # everything above must have been served without touching the original repository
+        assert fakeRepository.calls == calls
+
+        with pytest.raises(NoSuchPokepediaEntryException):
+            await repository.searchPokemon('missingno')
+
+    @pytest.mark.asyncio
+    async def test_searchPokemon_withMissingDataPackUsesFallback(self, tmp_path):
+        fakeRepository = FakePokepediaRepository()
+
+        repository = PokepediaDataPackRepository(
+            pokepediaDataPackJsonMapper = self.pokepediaDataPackJsonMapper,
+            timber = self.timber,
+            fallbackRepository = fakeRepository,
+            dataPackFile = str(tmp_path / 'missing.sqlite')
+        )
+
+        assert await repository.searchPokemon('35') is fakeRepository.pokemon
+        assert fakeRepository.calls == 1
@@ -0,0 +1,47 @@
+import pytest
+
+from src.pkmn.pokepediaDamageMultiplier import PokepediaDamageMultiplier
+from src.pkmn.pokepediaElementType import PokepediaElementType
+from src.pkmn.pokepediaTypeChart import PokepediaTypeChart
+
+
+class TestPokepediaTypeChart:
+
+    def test_getDamageMatrix_withGenerationOne(self):
+        damageMatrix = PokepediaTypeChart.GENERATION_1.getDamageMatrix()
+        assert PokepediaElementType.DARK not in damageMatrix
+        assert PokepediaElementType.STEEL not in damageMatrix
+        assert damageMatrix[PokepediaElementType.NORMAL][PokepediaElementType.GHOST] == 0
+        assert damageMatrix[PokepediaElementType.PSYCHIC][PokepediaElementType.GHOST] == 0
+
+    def test_getDamageMultiplier_withDualType(self):
+        typeChart = PokepediaTypeChart.GENERATION_6_AND_ON
+        defendingTypes = [ PokepediaElementType.GROUND, PokepediaElementType.ROCK ]
+
+        assert typeChart.getDamageMultiplier(PokepediaElementType.WATER, defendingTypes) is PokepediaDamageMultiplier.FOUR
+        assert typeChart.getDamageMultiplier(PokepediaElementType.POISON, defendingTypes) is PokepediaDamageMultiplier.ZERO_POINT_TWO_FIVE
+        assert typeChart.getDamageMultiplier(PokepediaElementType.ELECTRIC, defendingTypes) is PokepediaDamageMultiplier.ZERO
+        assert typeChart.getDamageMultiplier(PokepediaElementType.DARK, defendingTypes) is PokepediaDamageMultiplier.ONE
+
+    def test_getWeaknessesAndResistancesFor_withIllegalType(self):
+        with pytest.raises(ValueError):
+            PokepediaTypeChart.GENERATION_1.getWeaknessesAndResistancesFor([ PokepediaElementType.FAIRY ])
+
+    def test_getWeaknessesAndResistancesFor_withNormalFlying(self):
+        weaknessesAndResistances = PokepediaTypeChart.GENERATION_6_AND_ON.getWeaknessesAndResistancesFor([
+            PokepediaElementType.NORMAL,
+            PokepediaElementType.FLYING
+        ])
+
+        assert weaknessesAndResistances == {
+            PokepediaDamageMultiplier.ZERO: [ PokepediaElementType.GHOST, PokepediaElementType.GROUND ],
+            PokepediaDamageMultiplier.ZERO_POINT_FIVE: [ PokepediaElementType.BUG, PokepediaElementType.GRASS ],
+            PokepediaDamageMultiplier.TWO: [ PokepediaElementType.ELECTRIC, PokepediaElementType.ICE, PokepediaElementType.ROCK ]
+        }
+
+        # callers get their own copy, so they can't corrupt the precomputed results
+        weaknessesAndResistances[PokepediaDamageMultiplier.TWO].clear()
+        assert len(PokepediaTypeChart.GENERATION_6_AND_ON.getWeaknessesAndResistancesFor([
+            PokepediaElementType.NORMAL,
+            PokepediaElementType.FLYING
+        ])[PokepediaDamageMultiplier.TWO]) == 3
@@ -0,0 +1,142 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import create_autospec
+
+import pytest
+from frozendict import frozendict
+
+from src.cuteness.cutenessRepositoryInterface import CutenessRepositoryInterface
+from src.cuteness.cutenessLeaderboardResult import CutenessLeaderboardResult
+from src.language.wordOfTheDay.wordOfTheDayRepositoryInterface import WordOfTheDayRepositoryInterface
+from src.location.locationsRepositoryInterface import LocationsRepositoryInterface
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.network.exceptions import GenericNetworkException
+from src.recurringActions.actions.cutenessRecurringAction import CutenessRecurringAction
+from src.recurringActions.mostRecentRecurringActionRepositoryInterface import MostRecentRecurringActionRepositoryInterface
+from src.recurringActions.recurringActionsMachine import RecurringActionsMachine
+from src.recurringActions.recurringActionsRepositoryInterface import RecurringActionsRepositoryInterface
+from src.timber.timberStub import TimberStub
+from src.trivia.builder.triviaGameBuilderInterface import TriviaGameBuilderInterface
+from src.trivia.triviaGameMachineInterface import TriviaGameMachineInterface
+from src.twitch.isLive.isLiveOnTwitchRepositoryInterface import IsLiveOnTwitchRepositoryInterface
+from src.users.userIdsRepositoryInterface import UserIdsRepositoryInterface
+from src.users.userInterface import UserInterface
+from src.users.usersRepositoryInterface import UsersRepositoryInterface
+
+
+class TestRecurringActionsMachine:
+
+    refreshSleepTimeSeconds = 90
+
+    def __createMachine(self):
+        timeZoneRepository = TimeZoneRepository()
+
+        user = create_autospec(UserInterface, instance = True)
+        user.handle = 'smCharles'
+        user.isEnabled = True
+        user.areRecurringActionsEnabled = True
+
+        usersRepository = create_autospec(UsersRepositoryInterface, instance = True)
+        usersRepository.getUsersAsync.return_value = [ user ]
+
+        userIdsRepository = create_autospec(UserIdsRepositoryInterface, instance = True)
+        userIdsRepository.fetchUserId.return_value = 'smCharlesId'
+
+        recurringActionsRepository = create_autospec(RecurringActionsRepositoryInterface, instance = True)
+        recurringActionsRepository.getRecurringActionsForChannels.return_value = frozendict({
+            'smCharlesId': [ CutenessRecurringAction(
+                enabled = True,
+                twitchChannel = 'smCharles',
+                twitchChannelId = 'smCharlesId'
+            ) ]
+        })
+
+        mostRecentRecurringActionRepository = create_autospec(MostRecentRecurringActionRepositoryInterface, instance = True)
+        mostRecentRecurringActionRepository.getMostRecentRecurringActions.return_value = frozendict()
+
+        cutenessRepository = create_autospec(CutenessRepositoryInterface, instance = True)
+        cutenessRepository.fetchCutenessLeaderboard.return_value = create_autospec(CutenessLeaderboardResult, instance = True)
+        isLiveOnTwitchRepository = create_autospec(IsLiveOnTwitchRepositoryInterface, instance = True)
+
+        machine = RecurringActionsMachine(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            cutenessRepository = cutenessRepository,
+            isLiveOnTwitchRepository = isLiveOnTwitchRepository,
+            locationsRepository = create_autospec(LocationsRepositoryInterface, instance = True),
+            mostRecentRecurringActionRepository = mostRecentRecurringActionRepository,
+            recurringActionsRepository = recurringActionsRepository,
+            timber = TimberStub(),
+            timeZoneRepository = timeZoneRepository,
+            triviaGameBuilder = create_autospec(TriviaGameBuilderInterface, instance = True),
+            triviaGameMachine = create_autospec(TriviaGameMachineInterface, instance = True),
+            userIdsRepository = userIdsRepository,
+            usersRepository = usersRepository,
+            weatherRepository = None,
+            wordOfTheDayRepository = create_autospec(WordOfTheDayRepositoryInterface, instance = True),
+            refreshSleepTimeSeconds = self.refreshSleepTimeSeconds
+        )
+
+        return machine, isLiveOnTwitchRepository, cutenessRepository, mostRecentRecurringActionRepository
+
+    async def __refreshAndRunDueActions(self, machine: RecurringActionsMachine, now: datetime):
+        # these are the two steps that the machine's refresh loop runs through on every pass
+        await machine._RecurringActionsMachine__refreshUsersIfNecessary(now)
+        await machine._RecurringActionsMachine__runDueActions(now)
+
+    @pytest.mark.asyncio
+    async def test_runDueActions_reschedulesWhenLiveCheckFails(self):
+        machine, isLiveOnTwitchRepository, cutenessRepository, mostRecentRecurringActionRepository = self.__createMachine()
+        isLiveOnTwitchRepository.areLive.side_effect = [
+            GenericNetworkException('Twitch is down'),
+            frozendict({ 'smCharlesId': True })
+        ]
+
+        # a little ahead, so that newly loaded channels (which are due right away) are already due
+        now = datetime.now(TimeZoneRepository().getDefault()) + timedelta(seconds = 1)
+
+        with pytest.raises(GenericNetworkException):
+            await self.__refreshAndRunDueActions(machine, now)
+
+        cutenessRepository.fetchCutenessLeaderboard.assert_not_awaited()
+
+        # the channel must still be in the schedule, and get its action once the retry is due
+        await self.__refreshAndRunDueActions(machine, now + timedelta(seconds = self.refreshSleepTimeSeconds))
+        cutenessRepository.fetchCutenessLeaderboard.assert_awaited_once()
+        mostRecentRecurringActionRepository.setMostRecentRecurringAction.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_runDueActions_reschedulesWhenActionFails(self):
+        machine, isLiveOnTwitchRepository, cutenessRepository, mostRecentRecurringActionRepository = self.__createMachine()
+        isLiveOnTwitchRepository.areLive.return_value = frozendict({ 'smCharlesId': True })
+        cutenessRepository.fetchCutenessLeaderboard.side_effect = [ RuntimeError('database is locked'), create_autospec(CutenessLeaderboardResult, instance = True) ]
+
+        # a little ahead, so that newly loaded channels (which are due right away) are already due
+        now = datetime.now(TimeZoneRepository().getDefault()) + timedelta(seconds = 1)
+
+        with pytest.raises(RuntimeError):
+            await self.__refreshAndRunDueActions(machine, now)
+
+        mostRecentRecurringActionRepository.setMostRecentRecurringAction.assert_not_awaited()
+
+        await self.__refreshAndRunDueActions(machine, now + timedelta(seconds = self.refreshSleepTimeSeconds))
+        assert cutenessRepository.fetchCutenessLeaderboard.await_count == 2
+        mostRecentRecurringActionRepository.setMostRecentRecurringAction.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_runDueActions_reschedulesWhenOffline(self):
+        machine, isLiveOnTwitchRepository, cutenessRepository, _ = self.__createMachine()
+        isLiveOnTwitchRepository.areLive.return_value = frozendict({ 'smCharlesId': False })
+
+        # a little ahead, so that newly loaded channels (which are due right away) are already due
+        now = datetime.now(TimeZoneRepository().getDefault()) + timedelta(seconds = 1)
+        await self.__refreshAndRunDueActions(machine, now)
+
+        # not due again until the retry time has passed
+        isLiveOnTwitchRepository.areLive.reset_mock()
+        await self.__refreshAndRunDueActions(machine, now + timedelta(seconds = 1))
+        isLiveOnTwitchRepository.areLive.assert_not_awaited()
+
+        await self.__refreshAndRunDueActions(machine, now + timedelta(seconds = self.refreshSleepTimeSeconds))
+        isLiveOnTwitchRepository.areLive.assert_awaited_once()
+        cutenessRepository.fetchCutenessLeaderboard.assert_not_awaited()
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from src.language.languagesRepository import LanguagesRepository
+from src.recurringActions.actions.cutenessRecurringAction import CutenessRecurringAction
+from src.recurringActions.actions.recurringActionType import RecurringActionType
+from src.recurringActions.jsonParser.recurringActionsJsonParser import RecurringActionsJsonParser
+from src.recurringActions.recurringActionsRepository import RecurringActionsRepository
+from src.storage.sqlite.sqliteBackingDatabase import SqliteBackingDatabase
+from src.timber.timberStub import TimberStub
+
+
+class TestRecurringActionsRepository:
+
+    @pytest.mark.asyncio
+    async def test_getRecurringActionsForChannels_onlyReturnsRequestedChannels(self, tmp_path):
+        timber = TimberStub()
+
+        backingDatabase = SqliteBackingDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite'),
+        )
+
+        recurringActionsRepository = RecurringActionsRepository(
+            backingDatabase = backingDatabase,
+            recurringActionsJsonParser = RecurringActionsJsonParser(
+                languagesRepository = LanguagesRepository(),
+                timber = timber
+            ),
+            timber = timber
+        )
+
+        for twitchChannel in [ 'smCharles', 'stashiocat', 'imyt' ]:
+            await recurringActionsRepository.setRecurringAction(CutenessRecurringAction(
+                enabled = True,
+                twitchChannel = twitchChannel,
+                twitchChannelId = f'{twitchChannel}Id'
+            ))
+
+        channelActions = await recurringActionsRepository.getRecurringActionsForChannels({
+            'smCharlesId': 'smCharles',
+            'imytId': 'imyt'
+        })
+
+        assert set(channelActions.keys()) == { 'smCharlesId', 'imytId' }
+        assert channelActions['smCharlesId'][0].actionType is RecurringActionType.CUTENESS
+        assert channelActions['imytId'][0].twitchChannel == 'imyt'
+
+        await backingDatabase.close()
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, timezone
+
+from src.recurringActions.actions.recurringActionType import RecurringActionType
+from src.recurringActions.recurringActionsSchedule import RecurringActionsSchedule
+
+
+class TestRecurringActionsSchedule:
+
+    now = datetime(2024, 1, 1, 12, 0, tzinfo = timezone.utc)
+
+    def test_getNextDueDateTime_withEmptySchedule(self):
+        schedule = RecurringActionsSchedule()
+        assert schedule.getNextDueDateTime() is None
+        assert schedule.popDue(self.now) == dict()
+
+    def test_popDue_groupsDueActionsByChannel(self):
+        schedule = RecurringActionsSchedule()
+        schedule.schedule('abc123', RecurringActionType.CUTENESS, self.now - timedelta(minutes = 1))
+        schedule.schedule('abc123', RecurringActionType.WEATHER, self.now)
+        schedule.schedule('def456', RecurringActionType.SUPER_TRIVIA, self.now - timedelta(minutes = 5))
+        schedule.schedule('def456', RecurringActionType.WORD_OF_THE_DAY, self.now + timedelta(minutes = 5))
+
+        assert schedule.getNextDueDateTime() == self.now - timedelta(minutes = 5)
+
+        dueActions = schedule.popDue(self.now)
+        assert dueActions == {
+            'abc123': { RecurringActionType.CUTENESS, RecurringActionType.WEATHER },
+            'def456': { RecurringActionType.SUPER_TRIVIA },
+        }
+
+        assert schedule.getNextDueDateTime() == self.now + timedelta(minutes = 5)
+        assert schedule.popDue(self.now) == dict()
+
+    def test_schedule_replacesPreviousDueDateTime(self):
+        schedule = RecurringActionsSchedule()
+        schedule.schedule('abc123', RecurringActionType.CUTENESS, self.now - timedelta(minutes = 1))
+        schedule.schedule('abc123', RecurringActionType.CUTENESS, self.now + timedelta(minutes = 10))
+
+        assert schedule.popDue(self.now) == dict()
+        assert schedule.getNextDueDateTime() == self.now + timedelta(minutes = 10)
+
+    def test_unscheduleChannel(self):
+        schedule = RecurringActionsSchedule()
+        schedule.schedule('abc123', RecurringActionType.CUTENESS, self.now)
+        schedule.schedule('abc123', RecurringActionType.WEATHER, self.now)
+        schedule.schedule('def456', RecurringActionType.WEATHER, self.now + timedelta(minutes = 1))
+
+        schedule.unscheduleChannel('abc123')
+        assert schedule.getNextDueDateTime() == self.now + timedelta(minutes = 1)
+        assert schedule.popDue(self.now + timedelta(minutes = 1)) == {
+            'def456': { RecurringActionType.WEATHER },
+        }
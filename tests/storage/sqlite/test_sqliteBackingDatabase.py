@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from src.storage.databaseConnection import DatabaseConnection
+from src.storage.databaseType import DatabaseType
+from src.storage.sqlite.sqliteBackingDatabase import SqliteBackingDatabase
+
+
+class TestSqliteBackingDatabase:
+
+    async def __createBackingDatabase(self, tmp_path) -> SqliteBackingDatabase:
+        backingDatabase = SqliteBackingDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite'),
+            maxConnections = 2,
+            maxIdleConnections = 2,
+        )
+
+        connection = await backingDatabase.getConnection()
+        await connection.execute('CREATE TABLE IF NOT EXISTS things (id TEXT NOT NULL PRIMARY KEY, value INTEGER NOT NULL) STRICT')
+        await connection.close()
+
+        return backingDatabase
+
+    @pytest.mark.asyncio
+    async def test_databaseType(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        assert backingDatabase.databaseType is DatabaseType.SQLITE
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_getConnection_raisesAfterClose(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        await backingDatabase.close()
+
+        with pytest.raises(RuntimeError):
+            await backingDatabase.getConnection()
+
+    @pytest.mark.asyncio
+    async def test_getConnection_reusesReleasedConnection(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+
+        connection = await backingDatabase.getConnection()
+        assert isinstance(connection, DatabaseConnection)
+        assert connection.isClosed is False
+
+        record = await connection.fetchRow('PRAGMA journal_mode')
+        assert record is not None
+        assert record[0] == 'wal'
+
+        await connection.close()
+        assert connection.isClosed is True
+
+        connection = await backingDatabase.getConnection()
+        assert connection.isClosed is False
+        await connection.close()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_getConnection_waitsForReleaseWhenAtCapacity(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+
+        first = await backingDatabase.getConnection()
+        second = await backingDatabase.getConnection()
+
+        third = asyncio.create_task(backingDatabase.getConnection())
+        await asyncio.sleep(0.1)
+        assert third.done() is False
+
+        await first.close()
+
+        async with asyncio.timeout(5):
+            connection = await third
+
+        assert connection.isClosed is False
+
+        await connection.close()
+        await second.close()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_transaction_commits(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+
+        connection = await backingDatabase.getConnection()
+
+        async with connection.transaction():
+            await connection.execute('INSERT INTO things (id, value) VALUES ($1, $2)', 'a', 1)
+            await connection.execute('INSERT INTO things (id, value) VALUES ($1, $2)', 'b', 2)
+
+        await connection.close()
+
+        connection = await backingDatabase.getConnection()
+        records = await connection.fetchRows('SELECT id, value FROM things ORDER BY id')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert records is not None
+        assert len(records) == 2
+        assert records[0][0] == 'a'
+        assert records[1][0] == 'b'
+
+    @pytest.mark.asyncio
+    async def test_transaction_rollsBackOnException(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+
+        connection = await backingDatabase.getConnection()
+
+        with pytest.raises(RuntimeError):
+            async with connection.transaction():
+                await connection.execute('INSERT INTO things (id, value) VALUES ($1, $2)', 'a', 1)
+                raise RuntimeError()
+
+        records = await connection.fetchRows('SELECT id FROM things')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert records is not None
+        assert len(records) == 0
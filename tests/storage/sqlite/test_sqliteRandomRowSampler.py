@@ -0,0 +1,196 @@
+import sqlite3
+from typing import Any, Collection
+
+import pytest
+
+from src.storage.sqlite.sqliteRandomRowSampler import SqliteRandomRowSampler
+
+
+class TestSqliteRandomRowSampler:
+
+    def __createDatabase(self, tmp_path, rowCount: int) -> str:
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        connection = sqlite3.connect(databaseFile)
+        connection.execute('CREATE TABLE questions (question TEXT NOT NULL, questionId TEXT NOT NULL PRIMARY KEY, questionType TEXT NOT NULL)')
+
+        for index in range(rowCount):
+            questionType = 'even' if index % 2 == 0 else 'odd'
+            connection.execute('INSERT INTO questions (question, questionId, questionType) VALUES (?, ?, ?)', (f'question {index}', f'id{index}', questionType))
+
+        connection.commit()
+        connection.close()
+        return databaseFile
+
+    async def __sampleAllRows(
+        self,
+        sampler: SqliteRandomRowSampler,
+        columns: Collection[str],
+    ) -> set[tuple[Any, ...]]:
+        # every test table is tiny, so this many samples is all but guaranteed to hit every row
+        rows: set[tuple[Any, ...]] = set()
+
+        for _ in range(500):
+            row = await sampler.fetchRandomRow(columns = columns)
+
+            if row is not None:
+                rows.add(row)
+
+        return rows
+
+    @pytest.mark.asyncio
+    async def test_fetchRandomRow(self, tmp_path):
+        sampler = SqliteRandomRowSampler(
+            databaseFile = self.__createDatabase(tmp_path, 10),
+            tableName = 'questions',
+        )
+
+        row = await sampler.fetchRandomRow(columns = ( 'question', 'questionId', ))
+        assert row is not None
+        assert len(row) == 2
+        assert row[0] == f'question {row[1][2:]}'
+
+        await sampler.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchRandomRow_withEmptyTable(self, tmp_path):
+        sampler = SqliteRandomRowSampler(
+            databaseFile = self.__createDatabase(tmp_path, 0),
+            tableName = 'questions',
+        )
+
+        assert await sampler.fetchRandomRow(columns = ( 'question', )) is None
+        await sampler.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchRandomRow_withWhereClause(self, tmp_path):
+        sampler = SqliteRandomRowSampler(
+            databaseFile = self.__createDatabase(tmp_path, 20),
+            tableName = 'questions',
+            whereClause = 'questionType = $1',
+            whereParameters = ( 'odd', ),
+        )
+
+        rows = await self.__sampleAllRows(sampler, ( 'questionId', 'questionType', ))
+        assert len(rows) == 10
+        assert all(row[1] == 'odd' for row in rows)
+
+        await sampler.close()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_picksUpNewRows(self, tmp_path):
+        databaseFile = self.__createDatabase(tmp_path, 3)
+        sampler = SqliteRandomRowSampler(
+            databaseFile = databaseFile,
+            tableName = 'questions',
+        )
+
+        rows = await self.__sampleAllRows(sampler, ( 'questionId', ))
+        assert len(rows) == 3
+
+        connection = sqlite3.connect(databaseFile)
+        connection.execute('INSERT INTO questions (question, questionId, questionType) VALUES (?, ?, ?)', ('question 3', 'id3', 'odd'))
+        connection.commit()
+        connection.close()
+
+        rows = await self.__sampleAllRows(sampler, ( 'questionId', ))
+        assert len(rows) == 3
+
+        sampler.invalidate()
+        rows = await self.__sampleAllRows(sampler, ( 'questionId', ))
+        assert len(rows) == 4
+
+        await sampler.close()
+
+    @pytest.mark.asyncio
+    async def test_addRowId_picksUpNewRowWithoutRescanning(self, tmp_path):
+        databaseFile = self.__createDatabase(tmp_path, 3)
+        sampler = SqliteRandomRowSampler(
+            databaseFile = databaseFile,
+            tableName = 'questions',
+        )
+
+        rows = await self.__sampleAllRows(sampler, ( 'questionId', ))
+        assert len(rows) == 3
+
+        connection = sqlite3.connect(databaseFile)
+        cursor = connection.execute('INSERT INTO questions (question, questionId, questionType) VALUES (?, ?, ?)', ('question 3', 'id3', 'odd'))
+        rowId = cursor.lastrowid
+        connection.execute('INSERT INTO questions (question, questionId, questionType) VALUES (?, ?, ?)', ('question 4', 'id4', 'even'))
+        connection.commit()
+        connection.close()
+
+        assert rowId is not None
+        sampler.addRowId(rowId)
+        sampler.addRowId(rowId)
+
+        # only the row that was explicitly added shows up, as the table was not rescanned
+        rows = await self.__sampleAllRows(sampler, ( 'questionId', ))
+        assert rows == { ( 'id0', ), ( 'id1', ), ( 'id2', ), ( 'id3', ) }
+
+        await sampler.close()
+
+    @pytest.mark.asyncio
+    async def test_addRowId_beforeAnyFetch(self, tmp_path):
+        sampler = SqliteRandomRowSampler(
+            databaseFile = self.__createDatabase(tmp_path, 2),
+            tableName = 'questions',
+        )
+
+        sampler.addRowId(1)
+        rows = await self.__sampleAllRows(sampler, ( 'questionId', ))
+        assert len(rows) == 2
+
+        await sampler.close()
+
+    @pytest.mark.asyncio
+    async def test_removeRowId(self, tmp_path):
+        databaseFile = self.__createDatabase(tmp_path, 3)
+        sampler = SqliteRandomRowSampler(
+            databaseFile = databaseFile,
+            tableName = 'questions',
+        )
+
+        rows = await self.__sampleAllRows(sampler, ( 'questionId', ))
+        assert len(rows) == 3
+
+        connection = sqlite3.connect(databaseFile)
+        rowId = connection.execute('SELECT rowid FROM questions WHERE questionId = ?', ('id1', )).fetchone()[0]
+        connection.execute('DELETE FROM questions WHERE questionId = ?', ('id1', ))
+        connection.commit()
+        connection.close()
+
+        sampler.removeRowId(rowId)
+        sampler.removeRowId(rowId)
+
+        rows = await self.__sampleAllRows(sampler, ( 'questionId', ))
+        assert rows == { ( 'id0', ), ( 'id2', ) }
+
+        await sampler.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchRandomRow_recoversFromDeletedRows(self, tmp_path):
+        databaseFile = self.__createDatabase(tmp_path, 2)
+        sampler = SqliteRandomRowSampler(
+            databaseFile = databaseFile,
+            tableName = 'questions',
+        )
+
+        rows = await self.__sampleAllRows(sampler, ( 'questionId', ))
+        assert len(rows) == 2
+
+        connection = sqlite3.connect(databaseFile)
+        connection.execute('DELETE FROM questions WHERE questionId = ?', ('id0', ))
+        connection.commit()
+        connection.close()
+
+        rows = await self.__sampleAllRows(sampler, ( 'questionId', ))
+        assert rows == { ( 'id1', ) }
+
+        await sampler.close()
+
+    def test_tableName_isValidated(self, tmp_path):
+        with pytest.raises(TypeError):
+            SqliteRandomRowSampler(
+                databaseFile = str(tmp_path / 'questions.sqlite'),
+                tableName = 'questions; DROP TABLE questions',
+            )
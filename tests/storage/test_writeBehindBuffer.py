@@ -0,0 +1,163 @@
+import asyncio
+from typing import Callable
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.storage.backingDatabase import BackingDatabase
+from src.storage.sqlite.sqliteBackingDatabase import SqliteBackingDatabase
+from src.storage.writeBehindBuffer import WriteBehindBuffer
+from src.timber.timberStub import TimberStub
+
+
+class TestWriteBehindBuffer:
+
+    async def __createBackingDatabase(self, tmp_path) -> SqliteBackingDatabase:
+        backingDatabase = SqliteBackingDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite'),
+        )
+
+        connection = await backingDatabase.getConnection()
+        await connection.execute('CREATE TABLE IF NOT EXISTS things (id TEXT NOT NULL, channel TEXT NOT NULL, value INTEGER NOT NULL, PRIMARY KEY (id, channel)) STRICT')
+        await connection.close()
+
+        return backingDatabase
+
+    def __createFailingBackingDatabase(self) -> BackingDatabase:
+        backingDatabase = create_autospec(BackingDatabase, instance = True)
+        backingDatabase.getConnection = AsyncMock(side_effect = RuntimeError('database is locked'))
+        return backingDatabase
+
+    def __createWriteBehindBuffer(
+        self,
+        backingDatabase: BackingDatabase,
+        maxBufferedRows: int = 4096,
+        maxPendingRows: int = 256,
+    ) -> WriteBehindBuffer:
+        return WriteBehindBuffer(
+            backgroundTaskHelper = BackgroundTaskHelper(asyncio.get_running_loop()),
+            backingDatabase = backingDatabase,
+            timber = TimberStub(),
+            tableName = 'things',
+            columns = ( 'id', 'channel', 'value' ),
+            conflictColumns = ( 'id', 'channel' ),
+            flushDelaySeconds = 60,
+            maxBufferedRows = maxBufferedRows,
+            maxPendingRows = maxPendingRows,
+        )
+
+    async def __fetchAll(self, backingDatabase: SqliteBackingDatabase) -> list[tuple]:
+        connection = await backingDatabase.getConnection()
+        records = await connection.fetchRows('SELECT id, channel, value FROM things ORDER BY id, channel')
+        await connection.close()
+
+        if records is None:
+            return list()
+
+        return [ tuple(record) for record in records ]
+
+    async def __waitUntil(self, condition: Callable[[], bool]):
+        async with asyncio.timeout(5):
+            while not condition():
+                await asyncio.sleep(0.01)
+
+    def test_constructWithUnknownConflictColumn(self):
+        with pytest.raises(ValueError):
+            WriteBehindBuffer(
+                backgroundTaskHelper = BackgroundTaskHelper(asyncio.new_event_loop()),
+                backingDatabase = SqliteBackingDatabase(asyncio.new_event_loop()),
+                timber = TimberStub(),
+                tableName = 'things',
+                columns = ( 'id', 'value' ),
+                conflictColumns = ( 'channel', ),
+            )
+
+    @pytest.mark.asyncio
+    async def test_flush_mergesWritesByKey(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        writeBehindBuffer = self.__createWriteBehindBuffer(backingDatabase)
+
+        await writeBehindBuffer.put('a', 'x', 1)
+        await writeBehindBuffer.put('b', 'x', 2)
+        await writeBehindBuffer.put('a', 'x', 3)
+        await writeBehindBuffer.put('a', 'y', 4)
+        assert writeBehindBuffer.pendingRowCount == 3
+        assert writeBehindBuffer.getPendingRow('a', 'x') == ('a', 'x', 3)
+        assert await self.__fetchAll(backingDatabase) == list()
+
+        await writeBehindBuffer.flush()
+        assert writeBehindBuffer.pendingRowCount == 0
+        assert writeBehindBuffer.getPendingRow('a', 'x') is None
+        assert await self.__fetchAll(backingDatabase) == [ ('a', 'x', 3), ('a', 'y', 4), ('b', 'x', 2) ]
+
+        await writeBehindBuffer.put('b', 'x', 5)
+        await writeBehindBuffer.flush()
+        assert await self.__fetchAll(backingDatabase) == [ ('a', 'x', 3), ('a', 'y', 4), ('b', 'x', 5) ]
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_put_flushesWhenFull(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        writeBehindBuffer = self.__createWriteBehindBuffer(backingDatabase, maxPendingRows = 500)
+
+        for index in range(500):
+            await writeBehindBuffer.put(str(index), 'x', index)
+
+        await self.__waitUntil(lambda: writeBehindBuffer.pendingRowCount == 0)
+
+        # waits on the flush lock, so this returns once the background flush has committed
+        await writeBehindBuffer.flush()
+        assert len(await self.__fetchAll(backingDatabase)) == 500
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_dropsOldestRowsWhenDatabaseKeepsFailing(self):
+        backingDatabase = self.__createFailingBackingDatabase()
+        writeBehindBuffer = self.__createWriteBehindBuffer(backingDatabase, maxBufferedRows = 4, maxPendingRows = 4)
+
+        for index in range(3):
+            await writeBehindBuffer.put(str(index), 'x', index)
+
+        await writeBehindBuffer.flush()
+        assert writeBehindBuffer.pendingRowCount == 3
+
+        for index in range(3, 6):
+            await writeBehindBuffer.put(str(index), 'x', index)
+
+        await writeBehindBuffer.flush()
+        assert writeBehindBuffer.pendingRowCount == 4
+        assert writeBehindBuffer.getPendingRow('0', 'x') is None
+        assert writeBehindBuffer.getPendingRow('1', 'x') is None
+        assert writeBehindBuffer.getPendingRow('5', 'x') == ('5', 'x', 5)
+
+    @pytest.mark.asyncio
+    async def test_put_doesNotWaitOnFailingDatabase(self):
+        backingDatabase = self.__createFailingBackingDatabase()
+        writeBehindBuffer = self.__createWriteBehindBuffer(backingDatabase, maxBufferedRows = 8, maxPendingRows = 2)
+
+        for index in range(20):
+            await writeBehindBuffer.put(str(index), 'x', index)
+
+        assert writeBehindBuffer.pendingRowCount == 8
+        assert backingDatabase.getConnection.await_count == 0
+
+        await self.__waitUntil(lambda: backingDatabase.getConnection.await_count >= 1)
+        assert writeBehindBuffer.pendingRowCount == 8
+        assert writeBehindBuffer.getPendingRow('19', 'x') == ('19', 'x', 19)
+
+    @pytest.mark.asyncio
+    async def test_findPendingRow(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        writeBehindBuffer = self.__createWriteBehindBuffer(backingDatabase)
+
+        await writeBehindBuffer.put('a', 'x', 1)
+        await writeBehindBuffer.put('b', 'x', 2)
+
+        assert writeBehindBuffer.findPendingRow(lambda row: row[2] == 2) == ('b', 'x', 2)
+        assert writeBehindBuffer.findPendingRow(lambda row: row[2] == 3) is None
+
+        await backingDatabase.close()
@@ -0,0 +1,50 @@
+import pytest
+
+from src.soundPlayerManager.provider.stub.stubSoundPlayerManagerProvider import StubSoundPlayerManagerProvider
+from src.storage.jsonStaticReader import JsonStaticReader
+from src.streamAlertsManager.streamAlertsAudioOutputArbiter import StreamAlertsAudioOutputArbiter
+from src.streamAlertsManager.streamAlertsSettingsRepository import StreamAlertsSettingsRepository
+from src.timber.timberStub import TimberStub
+from src.tts.provider.stub.stubCompositeTtsManagerProvider import StubCompositeTtsManagerProvider
+
+
+class TestStreamAlertsAudioOutputArbiter:
+
+    def __createArbiter(self) -> StreamAlertsAudioOutputArbiter:
+        return StreamAlertsAudioOutputArbiter(
+            compositeTtsManagerProvider = StubCompositeTtsManagerProvider(),
+            soundPlayerManagerProvider = StubSoundPlayerManagerProvider(),
+            streamAlertsSettingsRepository = StreamAlertsSettingsRepository(
+                settingsJsonReader = JsonStaticReader({
+                    'audioOutputs': {
+                        'abc123': 'secondary',
+                        'def456': 'secondary',
+                        'ghi789': 'tertiary',
+                    }
+                })
+            ),
+            timber = TimberStub(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_getAudioOutput_withConfiguredChannels(self):
+        arbiter = self.__createArbiter()
+
+        first = await arbiter.getAudioOutput('abc123')
+        second = await arbiter.getAudioOutput('def456')
+        third = await arbiter.getAudioOutput('ghi789')
+
+        assert first.outputName == 'secondary'
+        assert first is second
+        assert third.outputName == 'tertiary'
+        assert third.lock is not first.lock
+
+    @pytest.mark.asyncio
+    async def test_getAudioOutput_withUnconfiguredChannels(self):
+        arbiter = self.__createArbiter()
+
+        first = await arbiter.getAudioOutput('jkl012')
+        second = await arbiter.getAudioOutput('mno345')
+
+        assert first.outputName == StreamAlertsAudioOutputArbiter.DEFAULT_OUTPUT_NAME
+        assert first is second
@@ -0,0 +1,256 @@
+import asyncio
+
+import pytest
+
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.soundPlayerManager.provider.stub.stubSoundPlayerManagerProvider import StubSoundPlayerManagerProvider
+from src.storage.jsonStaticReader import JsonStaticReader
+from src.streamAlertsManager.streamAlert import StreamAlert
+from src.streamAlertsManager.streamAlertsManager import StreamAlertsManager
+from src.streamAlertsManager.streamAlertsSettingsRepository import StreamAlertsSettingsRepository
+from src.timber.timberStub import TimberStub
+from src.tts.compositeTtsManagerInterface import CompositeTtsManagerInterface
+from src.tts.models.ttsEvent import TtsEvent
+from src.tts.models.ttsProvider import TtsProvider
+from src.tts.models.ttsProviderOverridableStatus import TtsProviderOverridableStatus
+from src.tts.provider.compositeTtsManagerProviderInterface import CompositeTtsManagerProviderInterface
+
+
+class FakeCompositeTtsManager(CompositeTtsManagerInterface):
+
+    def __init__(self):
+        self.playedEvents: list[TtsEvent] = list()
+        self.preparedEvents: list[TtsEvent] = list()
+        self.stopCount: int = 0
+        self.__isPlaying: bool = False
+
+    @property
+    def isLoadingOrPlaying(self) -> bool:
+        return self.__isPlaying
+
+    async def playTtsEvent(self, event: TtsEvent) -> bool:
+        self.playedEvents.append(event)
+        self.__isPlaying = True
+        return True
+
+    async def prepareTtsEvent(self, event: TtsEvent):
+        self.preparedEvents.append(event)
+
+    async def stopTtsEvent(self):
+        self.stopCount += 1
+        self.__isPlaying = False
+
+
+class FakeCompositeTtsManagerProvider(CompositeTtsManagerProviderInterface):
+
+    def __init__(self):
+        self.sharedInstance: FakeCompositeTtsManager = FakeCompositeTtsManager()
+        self.newInstances: list[FakeCompositeTtsManager] = list()
+
+    def constructNewInstance(
+        self,
+        useSharedSoundPlayerManager: bool = True
+    ) -> CompositeTtsManagerInterface:
+        instance = FakeCompositeTtsManager()
+        self.newInstances.append(instance)
+        return instance
+
+    def getSharedInstance(self) -> CompositeTtsManagerInterface:
+        return self.sharedInstance
+
+
+class TestStreamAlertsManager:
+
+    def __createAlert(
+        self,
+        message: str,
+        twitchChannelId: str,
+        provider: TtsProvider = TtsProvider.DEC_TALK,
+    ) -> StreamAlert:
+        return StreamAlert(
+            soundAlert = None,
+            twitchChannel = f'channel-{twitchChannelId}',
+            twitchChannelId = twitchChannelId,
+            ttsEvent = TtsEvent(
+                message = message,
+                twitchChannel = f'channel-{twitchChannelId}',
+                twitchChannelId = twitchChannelId,
+                userId = 'userId',
+                userName = 'userName',
+                donation = None,
+                provider = provider,
+                providerOverridableStatus = TtsProviderOverridableStatus.CHATTER_OVERRIDABLE,
+                raidInfo = None,
+            ),
+        )
+
+    def __createManager(
+        self,
+        compositeTtsManagerProvider: FakeCompositeTtsManagerProvider,
+        audioOutputs: dict[str, str] | None = None,
+        mergeDuplicateAlerts: bool = True,
+        maxQueuedAlertsPerChannel: int = 32,
+    ) -> StreamAlertsManager:
+        if audioOutputs is None:
+            audioOutputs = dict()
+
+        return StreamAlertsManager(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            compositeTtsManagerProvider = compositeTtsManagerProvider,
+            soundPlayerManagerProvider = StubSoundPlayerManagerProvider(),
+            streamAlertsSettingsRepository = StreamAlertsSettingsRepository(
+                settingsJsonReader = JsonStaticReader({
+                    'alertsDelayBetweenSeconds': 0,
+                    'audioOutputs': audioOutputs,
+                })
+            ),
+            timber = TimberStub(),
+            mergeDuplicateAlerts = mergeDuplicateAlerts,
+            maxQueuedAlertsPerChannel = maxQueuedAlertsPerChannel,
+            queueSleepTimeSeconds = 0.1,
+        )
+
+    def __getPlayedMessages(
+        self,
+        compositeTtsManager: FakeCompositeTtsManager,
+        twitchChannelId: str,
+    ) -> list[str | None]:
+        return [ event.message for event in compositeTtsManager.playedEvents if event.twitchChannelId == twitchChannelId ]
+
+    async def __playThroughAlerts(self, compositeTtsManager: FakeCompositeTtsManager, alertCount: int):
+        for index in range(alertCount):
+            await self.__waitUntil(lambda: len(compositeTtsManager.playedEvents) == index + 1)
+            await compositeTtsManager.stopTtsEvent()
+
+        await self.__waitUntilDrained(compositeTtsManager)
+
+    async def __waitUntilDrained(self, *compositeTtsManagers: FakeCompositeTtsManager):
+        playedEventCounts = [ len(compositeTtsManager.playedEvents) for compositeTtsManager in compositeTtsManagers ]
+
+        # give the manager a few passes through its queues, to make sure that nothing else plays
+        await asyncio.sleep(0.3)
+
+        assert [ len(compositeTtsManager.playedEvents) for compositeTtsManager in compositeTtsManagers ] == playedEventCounts
+        assert all(not compositeTtsManager.isLoadingOrPlaying for compositeTtsManager in compositeTtsManagers)
+
+    async def __waitUntil(self, condition, timeoutSeconds: float = 2):
+        async with asyncio.timeout(timeoutSeconds):
+            while not condition():
+                await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_channelLanes_separateAudioOutputsPlayAtTheSameTime(self):
+        provider = FakeCompositeTtsManagerProvider()
+        manager = self.__createManager(provider, audioOutputs = { 'second': 'secondary' })
+        manager.start()
+
+        manager.submitAlert(self.__createAlert('hello', twitchChannelId = 'first'))
+        manager.submitAlert(self.__createAlert('world', twitchChannelId = 'second'))
+
+        await self.__waitUntil(lambda: len(provider.sharedInstance.playedEvents) == 1 and len(provider.newInstances) == 1 and len(provider.newInstances[0].playedEvents) == 1)
+
+        # neither alert has finished playing, yet both channels have started theirs
+        assert provider.sharedInstance.isLoadingOrPlaying
+        assert provider.newInstances[0].isLoadingOrPlaying
+
+        await provider.sharedInstance.stopTtsEvent()
+        await provider.newInstances[0].stopTtsEvent()
+        await self.__waitUntilDrained(provider.sharedInstance, provider.newInstances[0])
+
+    @pytest.mark.asyncio
+    async def test_channelLanes_keepOrderWithinChannel(self):
+        provider = FakeCompositeTtsManagerProvider()
+        manager = self.__createManager(provider)
+
+        for index in range(3):
+            manager.submitAlert(self.__createAlert(f'message {index}', twitchChannelId = 'channel'))
+
+        manager.start()
+        await self.__playThroughAlerts(provider.sharedInstance, alertCount = 3)
+
+        assert self.__getPlayedMessages(provider.sharedInstance, 'channel') == [ 'message 0', 'message 1', 'message 2' ]
+
+    @pytest.mark.asyncio
+    async def test_submitAlert_dropsOldestWhenChannelQueueIsFull(self):
+        provider = FakeCompositeTtsManagerProvider()
+        manager = self.__createManager(provider, maxQueuedAlertsPerChannel = 2)
+
+        for index in range(4):
+            manager.submitAlert(self.__createAlert(f'message {index}', twitchChannelId = 'channel'))
+
+        manager.submitAlert(self.__createAlert('other', twitchChannelId = 'otherChannel'))
+        manager.start()
+        await self.__playThroughAlerts(provider.sharedInstance, alertCount = 3)
+
+        assert self.__getPlayedMessages(provider.sharedInstance, 'channel') == [ 'message 2', 'message 3' ]
+        assert self.__getPlayedMessages(provider.sharedInstance, 'otherChannel') == [ 'other' ]
+
+    @pytest.mark.asyncio
+    async def test_submitAlert_mergesDuplicateAlerts(self):
+        provider = FakeCompositeTtsManagerProvider()
+        manager = self.__createManager(provider)
+
+        manager.submitAlert(self.__createAlert('cheer', twitchChannelId = 'channel'))
+        manager.submitAlert(self.__createAlert('cheer', twitchChannelId = 'channel'))
+        manager.submitAlert(self.__createAlert('something else', twitchChannelId = 'channel'))
+        manager.submitAlert(self.__createAlert('cheer', twitchChannelId = 'otherChannel'))
+        manager.start()
+        await self.__playThroughAlerts(provider.sharedInstance, alertCount = 3)
+
+        assert self.__getPlayedMessages(provider.sharedInstance, 'channel') == [ 'cheer', 'something else' ]
+        assert self.__getPlayedMessages(provider.sharedInstance, 'otherChannel') == [ 'cheer' ]
+
+    @pytest.mark.asyncio
+    async def test_submitAlert_withoutMergingDuplicateAlerts(self):
+        provider = FakeCompositeTtsManagerProvider()
+        manager = self.__createManager(provider, mergeDuplicateAlerts = False)
+
+        manager.submitAlert(self.__createAlert('cheer', twitchChannelId = 'channel'))
+        manager.submitAlert(self.__createAlert('cheer', twitchChannelId = 'channel'))
+        manager.start()
+        await self.__playThroughAlerts(provider.sharedInstance, alertCount = 2)
+
+        assert self.__getPlayedMessages(provider.sharedInstance, 'channel') == [ 'cheer', 'cheer' ]
+
+    @pytest.mark.asyncio
+    async def test_stopTtsEvent_withAlertOnOwnAudioOutput(self):
+        provider = FakeCompositeTtsManagerProvider()
+        manager = self.__createManager(provider, audioOutputs = { 'channel': 'secondary' })
+        manager.start()
+
+        manager.submitAlert(self.__createAlert('hello', twitchChannelId = 'channel'))
+        await self.__waitUntil(lambda: len(provider.newInstances) == 1 and provider.newInstances[0].isLoadingOrPlaying)
+
+        await manager.stopTtsEvent('channel')
+
+        assert provider.newInstances[0].stopCount == 1
+        assert provider.sharedInstance.stopCount == 0
+        await self.__waitUntilDrained(provider.sharedInstance, provider.newInstances[0])
+
+    @pytest.mark.asyncio
+    async def test_stopTtsEvent_withShotgunAlert(self):
+        provider = FakeCompositeTtsManagerProvider()
+        manager = self.__createManager(provider)
+        manager.start()
+
+        manager.submitAlert(self.__createAlert('hello', twitchChannelId = 'channel', provider = TtsProvider.SHOTGUN_TTS))
+        await self.__waitUntil(lambda: len(provider.newInstances) == 1 and provider.newInstances[0].isLoadingOrPlaying)
+
+        await manager.stopTtsEvent('channel')
+
+        assert provider.newInstances[0].stopCount == 1
+        assert provider.sharedInstance.stopCount == 0
+        await self.__waitUntilDrained(provider.sharedInstance, provider.newInstances[0])
+
+    @pytest.mark.asyncio
+    async def test_stopTtsEvent_withNothingPlaying(self):
+        provider = FakeCompositeTtsManagerProvider()
+        manager = self.__createManager(provider, audioOutputs = { 'channel': 'secondary' })
+
+        await manager.stopTtsEvent('channel')
+        await manager.stopTtsEvent('otherChannel')
+
+        # each channel's own audio output is stopped, even when no alert is playing on it
+        assert len(provider.newInstances) == 1
+        assert provider.newInstances[0].stopCount == 1
+        assert provider.sharedInstance.stopCount == 1
@@ -0,0 +1,189 @@
+import asyncio
+import gzip
+import json
+import os
+import threading
+
+import pytest
+from frozendict import frozendict
+
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.timber.timber import Timber
+from src.timber.timberFileWriter import TimberFileWriter
+from src.timber.timberLevel import TimberLevel
+from src.timber.timberOutputFormat import TimberOutputFormat
+from src.timber.timberSettings import TimberSettings
+
+
+class TestTimber:
+
+    def __createTimber(self, timberRootDirectory: str, timberSettings: TimberSettings) -> Timber:
+        return Timber(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            timeZoneRepository = TimeZoneRepository(),
+            timberSettings = timberSettings,
+            timberRootDirectory = timberRootDirectory,
+        )
+
+    def __readLogLines(self, timberRootDirectory: str, fileExtension: str = 'log') -> list[str]:
+        lines: list[str] = list()
+
+        for directory, _, fileNames in os.walk(timberRootDirectory):
+            if os.path.basename(directory) == 'errors':
+                continue
+
+            for fileName in fileNames:
+                if fileName.endswith(f'.{fileExtension}'):
+                    with open(os.path.join(directory, fileName), mode = 'r', encoding = 'utf-8') as file:
+                        lines.extend(file.read().splitlines())
+
+        return lines
+
+    @pytest.mark.asyncio
+    async def test_flush_withLazyMessages(self, tmp_path):
+        timberRootDirectory = str(tmp_path / 'timber')
+        timber = self.__createTimber(timberRootDirectory, TimberSettings(
+            consoleEnabled = False,
+            tagMinimumLevels = frozendict({ 'Quiet': TimberLevel.WARNING }),
+        ))
+
+        calls = 0
+
+        def buildMessage() -> str:
+            nonlocal calls
+            calls += 1
+            return 'a very large data bundle'
+
+        timber.log('Loud', buildMessage, level = TimberLevel.DEBUG)
+        timber.log('Quiet', buildMessage, level = TimberLevel.DEBUG)
+
+        # nothing is formatted on the caller's path, and filtered out entries never are at all
+        assert calls == 0
+
+        await timber.flush()
+        assert calls == 1
+
+        lines = self.__readLogLines(timberRootDirectory)
+        assert len(lines) == 1
+        assert lines[0].endswith(' — Loud — a very large data bundle')
+
+    @pytest.mark.asyncio
+    async def test_flush_withLazyMessagesBuiltOnEventLoopThread(self, tmp_path):
+        timberRootDirectory = str(tmp_path / 'timber')
+        timber = self.__createTimber(timberRootDirectory, TimberSettings(consoleEnabled = False))
+        threadIds: list[int] = list()
+
+        def buildMessage() -> str:
+            threadIds.append(threading.get_ident())
+            return 'hello'
+
+        timber.log('Test', buildMessage)
+        await timber.flush()
+
+        assert threadIds == [ threading.get_ident() ]
+
+    @pytest.mark.asyncio
+    async def test_flush_withNdjsonOutputFormat(self, tmp_path):
+        timberRootDirectory = str(tmp_path / 'timber')
+        timber = self.__createTimber(timberRootDirectory, TimberSettings(
+            consoleEnabled = False,
+            outputFormat = TimberOutputFormat.NDJSON,
+        ))
+
+        timber.log('Test', 'hello')
+        timber.log('Test', 'uh oh', exception = ValueError('bad'))
+        await timber.flush()
+
+        records = [ json.loads(line) for line in self.__readLogLines(timberRootDirectory, 'ndjson') ]
+        assert len(records) == 2
+
+        assert records[0]['level'] == 'INFO'
+        assert records[0]['msg'] == 'hello'
+        assert records[0]['tag'] == 'Test'
+        assert 'exception' not in records[0]
+
+        assert records[1]['level'] == 'ERROR'
+        assert records[1]['exception'] == 'bad'
+
+    @pytest.mark.asyncio
+    async def test_flush_withFullRingBuffer(self, tmp_path):
+        timberRootDirectory = str(tmp_path / 'timber')
+        timber = self.__createTimber(timberRootDirectory, TimberSettings(
+            consoleEnabled = False,
+            ringBufferSize = 4,
+        ))
+
+        for index in range(10):
+            timber.log('Test', f'entry {index}')
+
+        await timber.flush()
+
+        lines = self.__readLogLines(timberRootDirectory)
+        assert len(lines) == 5
+        assert 'Dropped 6 log entries' in lines[0]
+        assert [ line.split(' — ')[-1] for line in lines[1:] ] == [ 'entry 6', 'entry 7', 'entry 8', 'entry 9' ]
+
+    @pytest.mark.asyncio
+    async def test_flush_withFullRingBufferFromOtherThreads(self, tmp_path):
+        timberRootDirectory = str(tmp_path / 'timber')
+        timber = self.__createTimber(timberRootDirectory, TimberSettings(
+            consoleEnabled = False,
+            ringBufferSize = 4,
+        ))
+
+        def logEntries():
+            for index in range(1000):
+                timber.log('Test', f'entry {index}')
+
+        # fill the buffer up first, so that every one of the logs below is a drop
+        for index in range(4):
+            timber.log('Test', f'first {index}')
+
+        await asyncio.gather(*[ asyncio.to_thread(logEntries) for _ in range(4) ])
+        await timber.flush()
+
+        lines = self.__readLogLines(timberRootDirectory)
+        assert len(lines) == 5
+        assert 'Dropped 4000 log entries' in lines[0]
+
+    @pytest.mark.asyncio
+    async def test_log_withZeroSampleRate(self, tmp_path):
+        timberRootDirectory = str(tmp_path / 'timber')
+        timber = self.__createTimber(timberRootDirectory, TimberSettings(
+            consoleEnabled = False,
+            tagSampleRates = frozendict({ 'Test': 0.0 }),
+        ))
+
+        timber.log('Test', 'sampled out')
+        timber.log('Test', 'errors are never sampled out', exception = RuntimeError('oops'))
+        await timber.flush()
+
+        lines = self.__readLogLines(timberRootDirectory)
+        assert len(lines) == 1
+        assert lines[0].endswith('errors are never sampled out')
+
+    def test_timberFileWriter_rotatesAndCompresses(self, tmp_path):
+        fileName = str(tmp_path / 'logs' / '01.log')
+        timberFileWriter = TimberFileWriter(
+            compressRotatedFiles = True,
+            maxFileSizeBytes = 10,
+        )
+
+        timberFileWriter.write({ fileName: [ 'aaaaaaaa\n', 'bbbbbbbb\n' ] })
+        timberFileWriter.write({ fileName: [ 'cccccccc\n' ] })
+
+        # the file is kept open in between writes
+        assert timberFileWriter.getOpenFileNames() == frozenset({ fileName })
+
+        timberFileWriter.write(dict())
+        assert len(timberFileWriter.getOpenFileNames()) == 0
+
+        with open(fileName, mode = 'r', encoding = 'utf-8') as file:
+            assert file.read() == 'cccccccc\n'
+
+        with gzip.open(str(tmp_path / 'logs' / '01.1.log.gz'), mode = 'rt', encoding = 'utf-8') as file:
+            assert file.read() == 'aaaaaaaa\n'
+
+        with gzip.open(str(tmp_path / 'logs' / '01.2.log.gz'), mode = 'rt', encoding = 'utf-8') as file:
+            assert file.read() == 'bbbbbbbb\n'
@@ -0,0 +1,160 @@
+from typing import Collection
+
+import pytest
+
+from src.storage.jsonStaticReader import JsonStaticReader
+from src.timber.timberStub import TimberStub
+from src.trivia.answerChecker.triviaAnswerCheckResult import TriviaAnswerCheckResult
+from src.trivia.answerChecker.triviaAnswerChecker import TriviaAnswerChecker
+from src.trivia.compilers.triviaAnswerCompiler import TriviaAnswerCompiler
+from src.trivia.compilers.triviaQuestionCompiler import TriviaQuestionCompiler
+from src.trivia.misc.triviaSourceParser import TriviaSourceParser
+from src.trivia.questions.questionAnswerTriviaQuestion import QuestionAnswerTriviaQuestion
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.settings.triviaSettingsRepository import TriviaSettingsRepository
+from src.trivia.triviaDifficulty import TriviaDifficulty
+
+
+class CountingTriviaAnswerCompiler(TriviaAnswerCompiler):
+
+    def __init__(self):
+        super().__init__(timber = TimberStub())
+        self.compiledAnswersLists = 0
+        self.expandedNumerals = 0
+
+    async def compileTextAnswersList(
+        self,
+        answers: Collection[str | None] | None,
+        allWords: frozenset[str] | None = None,
+        expandParentheses: bool = True,
+    ) -> list[str]:
+        self.compiledAnswersLists += 1
+
+        return await super().compileTextAnswersList(
+            answers = answers,
+            allWords = allWords,
+            expandParentheses = expandParentheses,
+        )
+
+    async def expandNumerals(self, answer: str) -> list[str]:
+        self.expandedNumerals += 1
+        return await super().expandNumerals(answer)
+
+
+class TestTriviaAnswerCheckerMemoization:
+
+    # a sampling of the kinds of guesses that chat actually sends in during a super trivia burst
+    corpus: dict[str, dict[str, TriviaAnswerCheckResult]] = {
+        'The Legend of Zelda: Ocarina of Time': {
+            'the legend of zelda ocarina of time': TriviaAnswerCheckResult.CORRECT,
+            'The Legend of Zelda: Ocarina of Time': TriviaAnswerCheckResult.CORRECT,
+            'legend  of zelda   ocarina of time!!': TriviaAnswerCheckResult.CORRECT,
+            'legend of zelda ocarrina of time': TriviaAnswerCheckResult.CORRECT,
+            'ocarina of time': TriviaAnswerCheckResult.INCORRECT,
+            'majoras mask': TriviaAnswerCheckResult.INCORRECT,
+            'zelda': TriviaAnswerCheckResult.INCORRECT,
+            'oot': TriviaAnswerCheckResult.INCORRECT,
+        },
+        'George Washington': {
+            'George Washington': TriviaAnswerCheckResult.CORRECT,
+            'george washingtn': TriviaAnswerCheckResult.CORRECT,
+            'georgewashington': TriviaAnswerCheckResult.CORRECT,
+            'washington': TriviaAnswerCheckResult.INCORRECT,
+            'lincoln': TriviaAnswerCheckResult.INCORRECT,
+            'abraham lincoln': TriviaAnswerCheckResult.INCORRECT,
+            'thomas jefferson': TriviaAnswerCheckResult.INCORRECT,
+        },
+        'World War II': {
+            'world war 2': TriviaAnswerCheckResult.CORRECT,
+            'world war two': TriviaAnswerCheckResult.CORRECT,
+            'World War II': TriviaAnswerCheckResult.CORRECT,
+            'world war 1': TriviaAnswerCheckResult.INCORRECT,
+            'the cold war': TriviaAnswerCheckResult.INCORRECT,
+            'ww2': TriviaAnswerCheckResult.INCORRECT,
+        },
+    }
+
+    async def __createQuestion(
+        self,
+        triviaAnswerCompiler: TriviaAnswerCompiler,
+        originalCorrectAnswer: str,
+        triviaId: str,
+    ) -> QuestionAnswerTriviaQuestion:
+        originalCorrectAnswers: list[str] = [ originalCorrectAnswer ]
+        correctAnswers = await TriviaQuestionCompiler(timber = TimberStub()).compileResponses(originalCorrectAnswers)
+        compiledCorrectAnswers = await triviaAnswerCompiler.compileTextAnswersList(originalCorrectAnswers)
+
+        expandedCompiledCorrectAnswers: set[str] = set()
+        for compiledCorrectAnswer in compiledCorrectAnswers:
+            expandedCompiledCorrectAnswers.update(await triviaAnswerCompiler.expandNumerals(compiledCorrectAnswer))
+
+        return QuestionAnswerTriviaQuestion(
+            allWords = None,
+            compiledCorrectAnswers = list(expandedCompiledCorrectAnswers),
+            correctAnswers = correctAnswers,
+            originalCorrectAnswers = originalCorrectAnswers,
+            category = None,
+            categoryId = None,
+            question = 'What is the answer?',
+            triviaId = triviaId,
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = TriviaSource.FUNTOON,
+        )
+
+    def __createTriviaAnswerChecker(self, triviaAnswerCompiler: TriviaAnswerCompiler) -> TriviaAnswerChecker:
+        return TriviaAnswerChecker(
+            timber = TimberStub(),
+            triviaAnswerCompiler = triviaAnswerCompiler,
+            triviaSettingsRepository = TriviaSettingsRepository(
+                settingsJsonReader = JsonStaticReader(dict()),
+                triviaSourceParser = TriviaSourceParser(),
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withCorpus(self):
+        triviaAnswerCompiler = CountingTriviaAnswerCompiler()
+        triviaAnswerChecker = self.__createTriviaAnswerChecker(triviaAnswerCompiler)
+
+        for index, (originalCorrectAnswer, guesses) in enumerate(self.corpus.items()):
+            question = await self.__createQuestion(triviaAnswerCompiler, originalCorrectAnswer, f'question{index}')
+            await triviaAnswerChecker.prepareQuestion(question)
+
+            for guess, expectedResult in guesses.items():
+                result = await triviaAnswerChecker.checkAnswer(guess, question)
+                assert result is expectedResult, f'{guess=} {originalCorrectAnswer=}'
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withSuperTriviaBurst(self):
+        triviaAnswerCompiler = CountingTriviaAnswerCompiler()
+        triviaAnswerChecker = self.__createTriviaAnswerChecker(triviaAnswerCompiler)
+
+        question = await self.__createQuestion(triviaAnswerCompiler, 'The Legend of Zelda: Ocarina of Time', 'burst')
+        guesses = self.corpus['The Legend of Zelda: Ocarina of Time']
+        await triviaAnswerChecker.prepareQuestion(question)
+
+        # guesses that compile down to the same thing should share the one in depth match
+        plainTriviaAnswerCompiler = TriviaAnswerCompiler(timber = TimberStub())
+        compiledGuesses: set[frozenset[str]] = set()
+
+        for guess in guesses.keys():
+            compiledGuesses.add(frozenset(await plainTriviaAnswerCompiler.compileTextAnswersList(
+                answers = [ guess ],
+                expandParentheses = False,
+            )))
+
+        assert len(compiledGuesses) < len(guesses)
+
+        triviaAnswerCompiler.compiledAnswersLists = 0
+        triviaAnswerCompiler.expandedNumerals = 0
+
+        for _ in range(50):
+            for guess, expectedResult in guesses.items():
+                assert await triviaAnswerChecker.checkAnswer(guess, question) is expectedResult
+
+        # each distinct guess only ever needs to be compiled the one time
+        assert triviaAnswerCompiler.compiledAnswersLists == len(guesses)
+
+        # and each distinct compiled guess only ever needs to be matched the one time
+        assert triviaAnswerCompiler.expandedNumerals == sum(len(compiledGuess) for compiledGuess in compiledGuesses)
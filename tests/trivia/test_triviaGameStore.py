@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 
@@ -339,3 +339,94 @@ class TriviaGameStoreTests:
     def test_sanity(self):
         assert self.triviaGameStore is not None
         assert isinstance(self.triviaGameStore, TriviaGameStoreInterface)
+
+
+class TestTriviaGameStoreExpiry:
+
+    timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
+
+    question: AbsTriviaQuestion = TrueFalseTriviaQuestion(
+        correctAnswer = True,
+        category = None,
+        categoryId = None,
+        question = 'Is stashiocat a member of the Chicago Bullies?',
+        triviaId = 'def456',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        originalTriviaSource = None,
+        triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+    )
+
+    def createNormalGame(self, endTime: datetime, twitchChannelId: str, userId: str) -> TriviaGameState:
+        return TriviaGameState(
+            triviaQuestion = self.question,
+            endTime = endTime,
+            basePointsForWinning = 5,
+            pointsForWinning = 5,
+            secondsToLive = 60,
+            specialTriviaStatus = None,
+            actionId = 'abc123',
+            emote = '🍔',
+            gameId = f'{twitchChannelId}:{userId}',
+            twitchChannel = twitchChannelId,
+            twitchChannelId = twitchChannelId,
+            userId = userId,
+            userName = userId
+        )
+
+    def createSuperGame(self, endTime: datetime, twitchChannelId: str) -> SuperTriviaGameState:
+        return SuperTriviaGameState(
+            triviaQuestion = self.question,
+            endTime = endTime,
+            basePointsForWinning = 25,
+            perUserAttempts = 2,
+            pointsForWinning = 25,
+            regularTriviaPointsForWinning = 5,
+            secondsToLive = 60,
+            toxicTriviaPunishmentMultiplier = 2,
+            specialTriviaStatus = None,
+            actionId = 'abc123',
+            emote = '🍔',
+            gameId = twitchChannelId,
+            twitchChannel = twitchChannelId,
+            twitchChannelId = twitchChannelId
+        )
+
+    @pytest.mark.asyncio
+    async def test_popExpiredGames(self):
+        triviaGameStore: TriviaGameStoreInterface = TriviaGameStore()
+        now = datetime.now(self.timeZoneRepository.getDefault())
+
+        expiredNormalGame = self.createNormalGame(now - timedelta(seconds = 10), 'c', 'e')
+        expiredSuperGame = self.createSuperGame(now - timedelta(seconds = 5), 'c')
+        liveNormalGame = self.createNormalGame(now + timedelta(seconds = 30), 'c', 's')
+
+        await triviaGameStore.add(liveNormalGame)
+        await triviaGameStore.add(expiredSuperGame)
+        await triviaGameStore.add(expiredNormalGame)
+
+        expiredGames = await triviaGameStore.popExpiredGames(now)
+        assert list(expiredGames) == [ expiredNormalGame, expiredSuperGame ]
+
+        assert await triviaGameStore.getNormalGame('c', 'e') is None
+        assert await triviaGameStore.getNormalGame('c', 's') is liveNormalGame
+        assert await triviaGameStore.getSuperGame('c') is None
+        assert len(await triviaGameStore.popExpiredGames(now)) == 0
+
+    @pytest.mark.asyncio
+    async def test_popExpiredGames_skipsRemovedAndReplacedGames(self):
+        triviaGameStore: TriviaGameStoreInterface = TriviaGameStore()
+        now = datetime.now(self.timeZoneRepository.getDefault())
+
+        removedGame = self.createNormalGame(now - timedelta(seconds = 10), 'c', 'e')
+        replacedGame = self.createSuperGame(now - timedelta(seconds = 10), 'i')
+        replacementGame = self.createSuperGame(now + timedelta(seconds = 30), 'i')
+
+        await triviaGameStore.add(removedGame)
+        await triviaGameStore.add(replacedGame)
+        assert await triviaGameStore.removeNormalGame('c', 'e')
+        assert await triviaGameStore.removeSuperGame('i')
+        await triviaGameStore.add(replacementGame)
+
+        assert len(await triviaGameStore.popExpiredGames(now)) == 0
+        assert await triviaGameStore.getSuperGame('i') is replacementGame
+        assert await triviaGameStore.getTwitchChannelIdsWithActiveSuperGames() == frozenset({ 'i' })
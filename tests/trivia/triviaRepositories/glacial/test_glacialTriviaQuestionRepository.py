@@ -0,0 +1,117 @@
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from src.timber.timberStub import TimberStub
+from src.trivia.additionalAnswers.additionalTriviaAnswersRepositoryInterface import \
+    AdditionalTriviaAnswersRepositoryInterface
+from src.trivia.compilers.triviaAnswerCompiler import TriviaAnswerCompiler
+from src.trivia.compilers.triviaQuestionCompiler import TriviaQuestionCompiler
+from src.trivia.misc.triviaSourceParser import TriviaSourceParser
+from src.trivia.questionAnswerTriviaConditions import QuestionAnswerTriviaConditions
+from src.trivia.questions.multipleChoiceTriviaQuestion import MultipleChoiceTriviaQuestion
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.questions.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+from src.trivia.settings.triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
+from src.trivia.triviaDifficulty import TriviaDifficulty
+from src.trivia.triviaExceptions import NoTriviaQuestionException
+from src.trivia.triviaFetchOptions import TriviaFetchOptions
+from src.trivia.triviaRepositories.glacialTriviaQuestionRepository import GlacialTriviaQuestionRepository
+from src.twitch.twitchHandleProviderInterface import TwitchHandleProviderInterface
+from src.users.userIdsRepositoryInterface import UserIdsRepositoryInterface
+
+
+class TestGlacialTriviaQuestionRepository:
+
+    multipleChoiceQuestion = MultipleChoiceTriviaQuestion(
+        correctAnswers = [ 'Nintendo' ],
+        multipleChoiceResponses = [ 'Microsoft', 'Nintendo', 'Sega', 'Sony' ],
+        category = None,
+        categoryId = None,
+        question = 'Which company made the SNES?',
+        triviaId = 'abc123',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        originalTriviaSource = None,
+        triviaSource = TriviaSource.MILLIONAIRE,
+    )
+
+    trueFalseQuestion = TrueFalseTriviaQuestion(
+        correctAnswer = True,
+        category = None,
+        categoryId = None,
+        question = 'Is stashiocat a member of the Chicago Bullies?',
+        triviaId = 'def456',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        originalTriviaSource = None,
+        triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE,
+    )
+
+    def __createFetchOptions(self, questionAnswerTriviaConditions: QuestionAnswerTriviaConditions) -> TriviaFetchOptions:
+        return TriviaFetchOptions(
+            twitchChannel = 'smCharles',
+            twitchChannelId = '12345',
+            questionAnswerTriviaConditions = questionAnswerTriviaConditions,
+        )
+
+    def __createRepository(self, tmp_path) -> GlacialTriviaQuestionRepository:
+        timber = TimberStub()
+
+        triviaSettingsRepository = create_autospec(TriviaSettingsRepositoryInterface, instance = True)
+        triviaSettingsRepository.isScraperEnabled = AsyncMock(return_value = True)
+
+        return GlacialTriviaQuestionRepository(
+            additionalTriviaAnswersRepository = create_autospec(AdditionalTriviaAnswersRepositoryInterface, instance = True),
+            timber = timber,
+            triviaAnswerCompiler = TriviaAnswerCompiler(timber = timber),
+            triviaQuestionCompiler = TriviaQuestionCompiler(timber = timber),
+            triviaSettingsRepository = triviaSettingsRepository,
+            triviaSourceParser = TriviaSourceParser(),
+            twitchHandleProvider = create_autospec(TwitchHandleProviderInterface, instance = True),
+            userIdsRepository = create_autospec(UserIdsRepositoryInterface, instance = True),
+            triviaDatabaseFile = str(tmp_path / 'glacial.sqlite'),
+        )
+
+    async def __sampleQuestionIds(
+        self,
+        repository: GlacialTriviaQuestionRepository,
+        questionAnswerTriviaConditions: QuestionAnswerTriviaConditions,
+    ) -> set[str]:
+        # the test database only ever holds a couple of questions, so this many samples is all
+        # but guaranteed to hit every one of them
+        fetchOptions = self.__createFetchOptions(questionAnswerTriviaConditions)
+        triviaIds: set[str] = set()
+
+        for _ in range(200):
+            try:
+                question = await repository.fetchTriviaQuestion(fetchOptions)
+            except NoTriviaQuestionException:
+                continue
+
+            triviaIds.add(question.triviaId)
+
+        return triviaIds
+
+    @pytest.mark.asyncio
+    async def test_storeAndRemove_updateSamplersInPlace(self, tmp_path):
+        repository = self.__createRepository(tmp_path)
+
+        assert await repository.store(self.multipleChoiceQuestion)
+        assert await self.__sampleQuestionIds(repository, QuestionAnswerTriviaConditions.ALLOWED) == { 'abc123' }
+        assert await self.__sampleQuestionIds(repository, QuestionAnswerTriviaConditions.REQUIRED) == set()
+
+        # the samplers now have their row IDs cached, so any further changes must be applied
+        # to them directly, as they will not be rescanning the table
+        assert await repository.store(self.trueFalseQuestion)
+        assert await self.__sampleQuestionIds(repository, QuestionAnswerTriviaConditions.ALLOWED) == { 'abc123', 'def456' }
+        assert await self.__sampleQuestionIds(repository, QuestionAnswerTriviaConditions.NOT_ALLOWED) == { 'abc123', 'def456' }
+        assert await self.__sampleQuestionIds(repository, QuestionAnswerTriviaConditions.REQUIRED) == set()
+
+        await repository.remove(
+            triviaId = 'abc123',
+            originalTriviaSource = TriviaSource.MILLIONAIRE,
+        )
+
+        assert await self.__sampleQuestionIds(repository, QuestionAnswerTriviaConditions.ALLOWED) == { 'def456' }
+        assert await self.__sampleQuestionIds(repository, QuestionAnswerTriviaConditions.NOT_ALLOWED) == { 'def456' }
+
+        await repository.close()
@@ -0,0 +1,364 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+from frozendict import frozendict
+
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from src.timber.timberStub import TimberStub
+from src.trivia.content.triviaContentCode import TriviaContentCode
+from src.trivia.history.triviaQuestionOccurrencesRepositoryInterface import \
+    TriviaQuestionOccurrencesRepositoryInterface
+from src.trivia.questionAnswerTriviaConditions import QuestionAnswerTriviaConditions
+from src.trivia.questions.absTriviaQuestion import AbsTriviaQuestion
+from src.trivia.questions.questionAnswerTriviaQuestion import QuestionAnswerTriviaQuestion
+from src.trivia.questions.triviaQuestionType import TriviaQuestionType
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.questions.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+from src.trivia.settings.triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
+from src.trivia.settings.triviaSourceAndProperties import TriviaSourceAndProperties
+from src.trivia.triviaDifficulty import TriviaDifficulty
+from src.trivia.triviaFetchOptions import TriviaFetchOptions
+from src.trivia.triviaRepositories.bongoTriviaQuestionRepository import BongoTriviaQuestionRepository
+from src.trivia.triviaRepositories.funtoonTriviaQuestionRepository import FuntoonTriviaQuestionRepository
+from src.trivia.triviaRepositories.millionaireTriviaQuestionRepository import MillionaireTriviaQuestionRepository
+from src.trivia.triviaRepositories.openTriviaDatabaseTriviaQuestionRepository import \
+    OpenTriviaDatabaseTriviaQuestionRepository
+from src.trivia.triviaRepositories.openTriviaQaTriviaQuestionRepository import OpenTriviaQaTriviaQuestionRepository
+from src.trivia.triviaRepositories.pkmnTriviaQuestionRepository import PkmnTriviaQuestionRepository
+from src.trivia.triviaRepositories.triviaDatabaseTriviaQuestionRepository import \
+    TriviaDatabaseTriviaQuestionRepository
+from src.trivia.triviaRepositories.triviaQuestionCompanyTriviaQuestionRepository import \
+    TriviaQuestionCompanyTriviaQuestionRepository
+from src.trivia.triviaRepositories.triviaRepository import TriviaRepository
+from src.trivia.triviaRepositories.willFryTriviaQuestionRepository import WillFryTriviaQuestionRepository
+from src.trivia.triviaRepositories.wwtbamTriviaQuestionRepository import WwtbamTriviaQuestionRepository
+from src.trivia.triviaSourceInstabilityHelper import TriviaSourceInstabilityHelper
+from src.trivia.triviaVerifierInterface import TriviaVerifierInterface
+from src.twitch.twitchHandleProviderInterface import TwitchHandleProviderInterface
+from src.users.userIdsRepositoryInterface import UserIdsRepositoryInterface
+
+
+class TestTriviaRepository:
+
+    fetchOptions = TriviaFetchOptions(
+        twitchChannel = 'smCharles',
+        twitchChannelId = '12345',
+        questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.NOT_ALLOWED,
+    )
+
+    def __createQuestion(self, index: int) -> AbsTriviaQuestion:
+        return TrueFalseTriviaQuestion(
+            correctAnswer = True,
+            category = None,
+            categoryId = None,
+            question = f'Is this question number {index}?',
+            triviaId = f'question{index}',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = TriviaSource.MILLIONAIRE,
+        )
+
+    def __createSuperQuestion(self, index: int) -> AbsTriviaQuestion:
+        return QuestionAnswerTriviaQuestion(
+            allWords = None,
+            compiledCorrectAnswers = [ 'chicago bullies' ],
+            correctAnswers = [ 'Chicago Bullies' ],
+            originalCorrectAnswers = [ 'Chicago Bullies' ],
+            category = None,
+            categoryId = None,
+            question = f'Super question number {index}.',
+            triviaId = f'superQuestion{index}',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = TriviaSource.OPEN_TRIVIA_QA,
+        )
+
+    def __createQuestionRepository(
+        self,
+        repositoryClass: type,
+        triviaSource: TriviaSource,
+        supportedTriviaTypes: set[TriviaQuestionType],
+    ) -> Any:
+        questionRepository = create_autospec(repositoryClass, instance = True)
+        questionRepository.hasQuestionSetAvailable = AsyncMock(return_value = True)
+        questionRepository.supportedTriviaTypes = supportedTriviaTypes
+        questionRepository.triviaSource = triviaSource
+        return questionRepository
+
+    def __createRepository(
+        self,
+        millionaireTriviaQuestionRepository: Any,
+        openTriviaQaTriviaQuestionRepository: Any | None = None,
+        maxSuperTriviaQuestionSpoolSize: int = 0,
+        maxTriviaQuestionSpoolSize: int = 4,
+        maxConcurrentSpoolFetchesPerSource: int = 2,
+        backgroundTaskHelper: BackgroundTaskHelperInterface | None = None,
+    ) -> TriviaRepository:
+        triviaSourcesAndProperties: dict[TriviaSource, TriviaSourceAndProperties] = {
+            TriviaSource.MILLIONAIRE: TriviaSourceAndProperties(
+                isEnabled = True,
+                weight = 1,
+                triviaSource = TriviaSource.MILLIONAIRE,
+            ),
+        }
+
+        if openTriviaQaTriviaQuestionRepository is None:
+            openTriviaQaTriviaQuestionRepository = create_autospec(OpenTriviaQaTriviaQuestionRepository, instance = True)
+        else:
+            triviaSourcesAndProperties[TriviaSource.OPEN_TRIVIA_QA] = TriviaSourceAndProperties(
+                isEnabled = True,
+                weight = 1,
+                triviaSource = TriviaSource.OPEN_TRIVIA_QA,
+            )
+
+        if backgroundTaskHelper is None:
+            backgroundTaskHelper = create_autospec(BackgroundTaskHelperInterface, instance = True)
+
+        triviaSettingsRepository = create_autospec(TriviaSettingsRepositoryInterface, instance = True)
+        triviaSettingsRepository.getMaxRetryCount = AsyncMock(return_value = 1)
+        triviaSettingsRepository.getMaxSuperTriviaQuestionSpoolSize = AsyncMock(return_value = maxSuperTriviaQuestionSpoolSize)
+        triviaSettingsRepository.getMaxTriviaQuestionSpoolSize = AsyncMock(return_value = maxTriviaQuestionSpoolSize)
+        triviaSettingsRepository.getTriviaSourceInstabilityThreshold = AsyncMock(return_value = 3)
+        triviaSettingsRepository.getTriviaSourcesAndProperties = AsyncMock(return_value = frozendict(triviaSourcesAndProperties))
+        triviaSettingsRepository.isScraperEnabled = AsyncMock(return_value = False)
+
+        triviaVerifier = create_autospec(TriviaVerifierInterface, instance = True)
+        triviaVerifier.checkContent = AsyncMock(return_value = TriviaContentCode.OK)
+        triviaVerifier.checkHistory = AsyncMock(return_value = TriviaContentCode.OK)
+
+        twitchHandleProvider = create_autospec(TwitchHandleProviderInterface, instance = True)
+        twitchHandleProvider.getTwitchHandle = AsyncMock(return_value = 'smCharles')
+
+        userIdsRepository = create_autospec(UserIdsRepositoryInterface, instance = True)
+        userIdsRepository.requireUserId = AsyncMock(return_value = '12345')
+
+        timber = TimberStub()
+
+        return TriviaRepository(
+            backgroundTaskHelper = backgroundTaskHelper,
+            bongoTriviaQuestionRepository = create_autospec(BongoTriviaQuestionRepository, instance = True),
+            funtoonTriviaQuestionRepository = create_autospec(FuntoonTriviaQuestionRepository, instance = True),
+            glacialTriviaQuestionRepository = None,
+            jServiceTriviaQuestionRepository = None,
+            lotrTriviaQuestionRepository = None,
+            millionaireTriviaQuestionRepository = millionaireTriviaQuestionRepository,
+            quizApiTriviaQuestionRepository = None,
+            openTriviaDatabaseTriviaQuestionRepository = create_autospec(OpenTriviaDatabaseTriviaQuestionRepository, instance = True),
+            openTriviaQaTriviaQuestionRepository = openTriviaQaTriviaQuestionRepository,
+            pkmnTriviaQuestionRepository = create_autospec(PkmnTriviaQuestionRepository, instance = True),
+            timber = timber,
+            triviaDatabaseTriviaQuestionRepository = create_autospec(TriviaDatabaseTriviaQuestionRepository, instance = True),
+            triviaQuestionCompanyTriviaQuestionRepository = create_autospec(TriviaQuestionCompanyTriviaQuestionRepository, instance = True),
+            triviaQuestionOccurrencesRepository = create_autospec(TriviaQuestionOccurrencesRepositoryInterface, instance = True),
+            triviaScraper = None,
+            triviaSettingsRepository = triviaSettingsRepository,
+            triviaSourceInstabilityHelper = TriviaSourceInstabilityHelper(
+                timber = timber,
+                timeZoneRepository = TimeZoneRepository(),
+            ),
+            triviaVerifier = triviaVerifier,
+            twitchHandleProvider = twitchHandleProvider,
+            userIdsRepository = userIdsRepository,
+            willFryTriviaQuestionRepository = create_autospec(WillFryTriviaQuestionRepository, instance = True),
+            wwtbamTriviaQuestionRepository = create_autospec(WwtbamTriviaQuestionRepository, instance = True),
+            maxConcurrentSpoolFetchesPerSource = maxConcurrentSpoolFetchesPerSource,
+        )
+
+    def __createMillionaireRepository(self) -> Any:
+        millionaireTriviaQuestionRepository = self.__createQuestionRepository(
+            repositoryClass = MillionaireTriviaQuestionRepository,
+            triviaSource = TriviaSource.MILLIONAIRE,
+            supportedTriviaTypes = { TriviaQuestionType.MULTIPLE_CHOICE, TriviaQuestionType.TRUE_FALSE },
+        )
+
+        questionIndices = iter(range(1000))
+
+        async def fetchTriviaQuestion(fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
+            return self.__createQuestion(next(questionIndices))
+
+        millionaireTriviaQuestionRepository.fetchTriviaQuestion = AsyncMock(side_effect = fetchTriviaQuestion)
+        return millionaireTriviaQuestionRepository
+
+    async def __waitUntil(self, condition, timeoutSeconds: float = 5):
+        async with asyncio.timeout(timeoutSeconds):
+            while not condition():
+                await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_close_closesEveryQuestionRepository(self):
+        millionaireTriviaQuestionRepository = self.__createMillionaireRepository()
+        millionaireTriviaQuestionRepository.close = AsyncMock(side_effect = RuntimeError('already closed'))
+
+        openTriviaQaTriviaQuestionRepository = self.__createQuestionRepository(
+            repositoryClass = OpenTriviaQaTriviaQuestionRepository,
+            triviaSource = TriviaSource.OPEN_TRIVIA_QA,
+            supportedTriviaTypes = { TriviaQuestionType.MULTIPLE_CHOICE, TriviaQuestionType.TRUE_FALSE },
+        )
+
+        repository = self.__createRepository(
+            millionaireTriviaQuestionRepository = millionaireTriviaQuestionRepository,
+            openTriviaQaTriviaQuestionRepository = openTriviaQaTriviaQuestionRepository,
+        )
+
+        # one repository failing to close must not stop the others from being closed
+        await repository.close()
+        millionaireTriviaQuestionRepository.close.assert_awaited_once()
+        openTriviaQaTriviaQuestionRepository.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_fillSpools_respectsPerSourceConcurrency(self):
+        millionaireTriviaQuestionRepository = self.__createQuestionRepository(
+            repositoryClass = MillionaireTriviaQuestionRepository,
+            triviaSource = TriviaSource.MILLIONAIRE,
+            supportedTriviaTypes = { TriviaQuestionType.MULTIPLE_CHOICE, TriviaQuestionType.TRUE_FALSE },
+        )
+
+        inFlight = 0
+        maxInFlight = 0
+        questionIndices = iter(range(1000))
+
+        async def fetchTriviaQuestion(fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
+            nonlocal inFlight, maxInFlight
+            inFlight += 1
+            maxInFlight = max(maxInFlight, inFlight)
+            await asyncio.sleep(0.01)
+            inFlight -= 1
+            return self.__createQuestion(next(questionIndices))
+
+        millionaireTriviaQuestionRepository.fetchTriviaQuestion = AsyncMock(side_effect = fetchTriviaQuestion)
+
+        repository = self.__createRepository(
+            millionaireTriviaQuestionRepository = millionaireTriviaQuestionRepository,
+            maxTriviaQuestionSpoolSize = 6,
+            maxConcurrentSpoolFetchesPerSource = 2,
+        )
+
+        await repository.fillSpools()
+
+        assert millionaireTriviaQuestionRepository.fetchTriviaQuestion.await_count == 6
+        assert maxInFlight == 2
+        assert repository.getSpoolMetrics().triviaQuestionSpoolSize == 6
+
+    @pytest.mark.asyncio
+    async def test_fillSpools_sharesSpoolsBetweenChannels(self):
+        openTriviaQaTriviaQuestionRepository = self.__createQuestionRepository(
+            repositoryClass = OpenTriviaQaTriviaQuestionRepository,
+            triviaSource = TriviaSource.OPEN_TRIVIA_QA,
+            supportedTriviaTypes = { TriviaQuestionType.QUESTION_ANSWER },
+        )
+
+        superQuestionIndices = iter(range(1000))
+
+        async def fetchSuperTriviaQuestion(fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
+            return self.__createSuperQuestion(next(superQuestionIndices))
+
+        openTriviaQaTriviaQuestionRepository.fetchTriviaQuestion = AsyncMock(side_effect = fetchSuperTriviaQuestion)
+
+        repository = self.__createRepository(
+            millionaireTriviaQuestionRepository = self.__createMillionaireRepository(),
+            openTriviaQaTriviaQuestionRepository = openTriviaQaTriviaQuestionRepository,
+            maxSuperTriviaQuestionSpoolSize = 2,
+            maxTriviaQuestionSpoolSize = 3,
+        )
+
+        await repository.fillSpools()
+
+        otherChannelFetchOptions = TriviaFetchOptions(
+            twitchChannel = 'stashiocat',
+            twitchChannelId = '67890',
+            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED,
+        )
+
+        question = await repository.fetchTrivia('emote', otherChannelFetchOptions)
+        assert isinstance(question, QuestionAnswerTriviaQuestion)
+
+        # the other channel got its question straight out of the spool
+        assert openTriviaQaTriviaQuestionRepository.fetchTriviaQuestion.await_count == 2
+
+        metrics = repository.getSpoolMetrics()
+        assert metrics.superTriviaQuestionSpoolSize == 1
+        assert metrics.triviaQuestionSpoolSize == 3
+
+    @pytest.mark.asyncio
+    async def test_fillSpools_topsUpSpoolToMaxSize(self):
+        millionaireTriviaQuestionRepository = self.__createMillionaireRepository()
+
+        repository = self.__createRepository(
+            millionaireTriviaQuestionRepository = millionaireTriviaQuestionRepository,
+            maxTriviaQuestionSpoolSize = 4,
+        )
+
+        await repository.fillSpools()
+        assert millionaireTriviaQuestionRepository.fetchTriviaQuestion.await_count == 4
+        assert repository.getSpoolMetrics().triviaQuestionSpoolSize == 4
+
+        await repository.fetchTrivia('emote', self.fetchOptions)
+        await repository.fetchTrivia('emote', self.fetchOptions)
+        assert millionaireTriviaQuestionRepository.fetchTriviaQuestion.await_count == 4
+        assert repository.getSpoolMetrics().triviaQuestionSpoolSize == 2
+
+        # only the questions that were taken out of the spool should be fetched again
+        await repository.fillSpools()
+        assert millionaireTriviaQuestionRepository.fetchTriviaQuestion.await_count == 6
+        assert repository.getSpoolMetrics().triviaQuestionSpoolSize == 4
+
+        await repository.fillSpools()
+        assert millionaireTriviaQuestionRepository.fetchTriviaQuestion.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_fetchTrivia_countsSpoolHitsAndMisses(self):
+        millionaireTriviaQuestionRepository = self.__createMillionaireRepository()
+
+        repository = self.__createRepository(
+            millionaireTriviaQuestionRepository = millionaireTriviaQuestionRepository,
+            maxTriviaQuestionSpoolSize = 1,
+        )
+
+        # with nothing spooled yet, the question has to be fetched from its source directly
+        assert isinstance(await repository.fetchTrivia('emote', self.fetchOptions), TrueFalseTriviaQuestion)
+        assert isinstance(await repository.fetchTrivia('emote', self.fetchOptions), TrueFalseTriviaQuestion)
+        assert millionaireTriviaQuestionRepository.fetchTriviaQuestion.await_count == 2
+
+        await repository.fillSpools()
+        assert millionaireTriviaQuestionRepository.fetchTriviaQuestion.await_count == 3
+
+        question = await repository.fetchTrivia('emote', self.fetchOptions)
+        assert isinstance(question, TrueFalseTriviaQuestion)
+        assert millionaireTriviaQuestionRepository.fetchTriviaQuestion.await_count == 3
+
+        metrics = repository.getSpoolMetrics()
+        assert metrics.spoolHits == 1
+        assert metrics.spoolMisses == 2
+        assert metrics.hitRate == pytest.approx(1 / 3)
+        assert metrics.totalFilled == 1
+
+    @pytest.mark.asyncio
+    async def test_fetchTrivia_onlyWakesSpoolerBelowLowWaterMark(self):
+        millionaireTriviaQuestionRepository = self.__createMillionaireRepository()
+
+        repository = self.__createRepository(
+            millionaireTriviaQuestionRepository = millionaireTriviaQuestionRepository,
+            maxTriviaQuestionSpoolSize = 4,
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+        )
+
+        repository.startSpooler()
+        await self.__waitUntil(lambda: repository.getSpoolMetrics().triviaQuestionSpoolSize == 4)
+
+        await repository.fetchTrivia('emote', self.fetchOptions)
+        await asyncio.sleep(0.1)
+        assert millionaireTriviaQuestionRepository.fetchTriviaQuestion.await_count == 4
+
+        await repository.fetchTrivia('emote', self.fetchOptions)
+        await asyncio.sleep(0.1)
+        assert millionaireTriviaQuestionRepository.fetchTriviaQuestion.await_count == 4
+
+        # this retrieval drains the spool below its low water mark, so the spooler tops it up
+        # right away, rather than waiting until its next scheduled refresh
+        await repository.fetchTrivia('emote', self.fetchOptions)
+        await self.__waitUntil(lambda: repository.getSpoolMetrics().triviaQuestionSpoolSize == 4)
+        assert millionaireTriviaQuestionRepository.fetchTriviaQuestion.await_count == 7
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from src.timber.timberStub import TimberStub
+from src.tts.models.ttsEvent import TtsEvent
+from src.tts.models.ttsProvider import TtsProvider
+from src.tts.models.ttsProviderOverridableStatus import TtsProviderOverridableStatus
+from src.tts.ttsPreparationCache import TtsPreparationCache
+
+
+class TestTtsPreparationCache:
+
+    def __createEvent(self, message: str) -> TtsEvent:
+        return TtsEvent(
+            message = message,
+            twitchChannel = 'smCharles',
+            twitchChannelId = 'abc123',
+            userId = 'def456',
+            userName = 'stashiocat',
+            donation = None,
+            provider = TtsProvider.DEC_TALK,
+            providerOverridableStatus = TtsProviderOverridableStatus.THIS_EVENT_DISABLED,
+            raidInfo = None
+        )
+
+    @pytest.mark.asyncio
+    async def test_take_afterPrepare_doesNotGenerateTwice(self):
+        cache: TtsPreparationCache[str] = TtsPreparationCache(
+            timber = TimberStub(),
+            timberTag = 'TestTtsPreparationCache',
+        )
+
+        generations: list[str] = list()
+
+        async def generate() -> str:
+            generations.append('generated')
+            return 'hello.wav'
+
+        event = self.__createEvent('Hello, World!')
+        await cache.prepare(event, generate)
+
+        result = await cache.take(event, generate)
+        assert result == 'hello.wav'
+        assert len(generations) == 1
+
+        result = await cache.take(event, generate)
+        assert result == 'hello.wav'
+        assert len(generations) == 2
+
+    @pytest.mark.asyncio
+    async def test_take_whileStillPreparing_waitsForPreparation(self):
+        cache: TtsPreparationCache[str] = TtsPreparationCache(
+            timber = TimberStub(),
+            timberTag = 'TestTtsPreparationCache',
+        )
+
+        generations: list[str] = list()
+        release = asyncio.Event()
+
+        async def generate() -> str:
+            generations.append('generated')
+            await release.wait()
+            return 'hello.wav'
+
+        event = self.__createEvent('Hello, World!')
+        prepareTask = asyncio.create_task(cache.prepare(event, generate))
+        await asyncio.sleep(0)
+
+        takeTask = asyncio.create_task(cache.take(event, generate))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await takeTask == 'hello.wav'
+        await prepareTask
+        assert len(generations) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelCurrent_returnsNone(self):
+        cache: TtsPreparationCache[str] = TtsPreparationCache(
+            timber = TimberStub(),
+            timberTag = 'TestTtsPreparationCache',
+        )
+
+        async def generate() -> str:
+            await asyncio.sleep(60)
+            return 'hello.wav'
+
+        event = self.__createEvent('Hello, World!')
+        takeTask = asyncio.create_task(cache.take(event, generate))
+        await asyncio.sleep(0)
+
+        cache.cancelCurrent()
+        assert await takeTask is None
+
+    @pytest.mark.asyncio
+    async def test_prepare_evictsOldestPreparation(self):
+        cache: TtsPreparationCache[str] = TtsPreparationCache(
+            timber = TimberStub(),
+            timberTag = 'TestTtsPreparationCache',
+            maxPreparedEvents = 1,
+        )
+
+        generations: list[str] = list()
+
+        def generator(message: str):
+            async def generate() -> str:
+                generations.append(message)
+                return message
+
+            return generate
+
+        first = self.__createEvent('first')
+        second = self.__createEvent('second')
+        await cache.prepare(first, generator('first'))
+        await cache.prepare(second, generator('second'))
+
+        assert await cache.take(second, generator('second')) == 'second'
+        assert await cache.take(first, generator('first')) == 'first'
+        assert generations == [ 'first', 'second', 'first' ]
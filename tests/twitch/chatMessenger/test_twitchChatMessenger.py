@@ -0,0 +1,282 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+from frozenlist import FrozenList
+
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.sentMessageLogger.sentMessageLoggerInterface import SentMessageLoggerInterface
+from src.timber.timberInterface import TimberInterface
+from src.twitch.api.models.twitchModeratorUser import TwitchModeratorUser
+from src.twitch.api.models.twitchModeratorsResponse import TwitchModeratorsResponse
+from src.twitch.api.models.twitchSendChatMessageRequest import TwitchSendChatMessageRequest
+from src.twitch.api.models.twitchSendChatMessageResponse import TwitchSendChatMessageResponse
+from src.twitch.api.models.twitchSendChatMessageResponseEntry import TwitchSendChatMessageResponseEntry
+from src.twitch.api.twitchApiServiceInterface import TwitchApiServiceInterface
+from src.twitch.chatMessenger.twitchChatMessenger import TwitchChatMessenger
+from src.twitch.globalTwitchConstants import GlobalTwitchConstants
+from src.twitch.tokens.twitchTokensRepositoryInterface import TwitchTokensRepositoryInterface
+from src.users.userIdsRepositoryInterface import UserIdsRepositoryInterface
+from tests.twitch.fakeTwitchHandleProvider import FakeTwitchHandleProvider
+
+
+class TestTwitchChatMessenger:
+
+    selfTwitchUserId: str = 'selfUserId'
+
+    def __createMessenger(
+        self,
+        twitchApiService: TwitchApiServiceInterface,
+        channelAccessTokens: dict[str, str] | None = None,
+        maxMessagesPerPeriod: int = 20,
+        maxModeratorMessagesPerPeriod: int = 100,
+        moderatorCacheTimeToLive: timedelta = timedelta(minutes = 30),
+    ) -> tuple[TwitchChatMessenger, TwitchTokensRepositoryInterface]:
+        if channelAccessTokens is None:
+            channelAccessTokens = dict()
+
+        async def getAccessTokenById(twitchChannelId: str) -> str | None:
+            return channelAccessTokens.get(twitchChannelId, None)
+
+        twitchTokensRepository = create_autospec(TwitchTokensRepositoryInterface, instance = True)
+        twitchTokensRepository.getAccessTokenById = AsyncMock(side_effect = getAccessTokenById)
+        twitchTokensRepository.requireAccessTokenById = AsyncMock(return_value = 'selfAccessToken')
+
+        async def requireUserName(userId: str, twitchAccessToken: str | None = None) -> str:
+            return f'name-{userId}'
+
+        userIdsRepository = create_autospec(UserIdsRepositoryInterface, instance = True)
+        userIdsRepository.requireUserId = AsyncMock(return_value = self.selfTwitchUserId)
+        userIdsRepository.requireUserName = AsyncMock(side_effect = requireUserName)
+
+        messenger = TwitchChatMessenger(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            globalTwitchConstants = GlobalTwitchConstants(),
+            sentMessageLogger = create_autospec(SentMessageLoggerInterface, instance = True),
+            timber = create_autospec(TimberInterface, instance = True),
+            timeZoneRepository = TimeZoneRepository(),
+            twitchApiService = twitchApiService,
+            twitchHandleProvider = FakeTwitchHandleProvider(),
+            twitchTokensRepository = twitchTokensRepository,
+            userIdsRepository = userIdsRepository,
+            maxMessagesPerPeriod = maxMessagesPerPeriod,
+            maxModeratorMessagesPerPeriod = maxModeratorMessagesPerPeriod,
+            rateLimitPeriodSeconds = 300,
+            moderatorCacheTimeToLive = moderatorCacheTimeToLive,
+        )
+
+        messenger.start()
+        return messenger, twitchTokensRepository
+
+    def __createModeratorsResponse(self, userIds: list[str]) -> TwitchModeratorsResponse:
+        moderators: FrozenList[TwitchModeratorUser] = FrozenList()
+
+        for userId in userIds:
+            moderators.append(TwitchModeratorUser(
+                userId = userId,
+                userLogin = f'login-{userId}',
+                userName = f'name-{userId}',
+            ))
+
+        moderators.freeze()
+
+        return TwitchModeratorsResponse(
+            data = moderators,
+            pagination = None,
+        )
+
+    def __createSentResponse(self) -> TwitchSendChatMessageResponse:
+        entries: FrozenList[TwitchSendChatMessageResponseEntry] = FrozenList()
+        entries.append(TwitchSendChatMessageResponseEntry(
+            isSent = True,
+            messageId = 'messageId',
+            dropReason = None,
+        ))
+        entries.freeze()
+
+        return TwitchSendChatMessageResponse(data = entries)
+
+    async def __waitUntil(self, condition, timeoutSeconds: float = 2):
+        async with asyncio.timeout(timeoutSeconds):
+            while not condition():
+                await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_channelLanes_keepOrderWithinChannel(self):
+        sentTexts: list[str] = list()
+
+        async def sendChatMessage(twitchAccessToken: str, chatRequest: TwitchSendChatMessageRequest) -> TwitchSendChatMessageResponse:
+            # yield in between sends, so that a later message could overtake an earlier one
+            await asyncio.sleep(0)
+            sentTexts.append(chatRequest.message)
+            return self.__createSentResponse()
+
+        twitchApiService = create_autospec(TwitchApiServiceInterface, instance = True)
+        twitchApiService.sendChatMessage = AsyncMock(side_effect = sendChatMessage)
+        messenger, _ = self.__createMessenger(twitchApiService)
+
+        for index in range(5):
+            messenger.send(f'message {index}', twitchChannelId = 'channel')
+
+        await self.__waitUntil(lambda: len(sentTexts) == 5)
+
+        assert sentTexts == [ f'message {index}' for index in range(5) ]
+        assert messenger.getMetrics().totalMessagesSent == 5
+        assert messenger.getMetrics().pendingMessages == 0
+        assert len(messenger.getMetrics().channelQueueDepths) == 0
+
+    @pytest.mark.asyncio
+    async def test_channelLanes_slowChannelDoesNotBlockOthers(self):
+        slowChannelReleased = asyncio.Event()
+        sentChannelIds: list[str] = list()
+
+        async def sendChatMessage(twitchAccessToken: str, chatRequest: TwitchSendChatMessageRequest) -> TwitchSendChatMessageResponse:
+            if chatRequest.broadcasterId == 'slowChannel':
+                await slowChannelReleased.wait()
+
+            sentChannelIds.append(chatRequest.broadcasterId)
+            return self.__createSentResponse()
+
+        twitchApiService = create_autospec(TwitchApiServiceInterface, instance = True)
+        twitchApiService.sendChatMessage = AsyncMock(side_effect = sendChatMessage)
+        messenger, _ = self.__createMessenger(twitchApiService)
+
+        messenger.send('first', twitchChannelId = 'slowChannel')
+        messenger.send('second', twitchChannelId = 'slowChannel')
+        messenger.send('hello', twitchChannelId = 'fastChannel')
+
+        await self.__waitUntil(lambda: 'fastChannel' in sentChannelIds)
+
+        # the fast channel went out while the slow channel is still stuck on its first message
+        assert sentChannelIds == [ 'fastChannel' ]
+        assert messenger.getMetrics().channelQueueDepths == { 'slowChannel': 1 }
+
+        slowChannelReleased.set()
+        await self.__waitUntil(lambda: len(sentChannelIds) == 3)
+
+        assert sentChannelIds == [ 'fastChannel', 'slowChannel', 'slowChannel' ]
+        assert len(messenger.getMetrics().channelQueueDepths) == 0
+
+    @pytest.mark.asyncio
+    async def test_clearCaches_refetchesModeratorStatus(self):
+        twitchApiService = create_autospec(TwitchApiServiceInterface, instance = True)
+        twitchApiService.fetchModerator = AsyncMock(return_value = self.__createModeratorsResponse([ self.selfTwitchUserId ]))
+        twitchApiService.sendChatMessage = AsyncMock(return_value = self.__createSentResponse())
+        messenger, _ = self.__createMessenger(twitchApiService, channelAccessTokens = { 'channel': 'channelAccessToken' })
+
+        messenger.send('first', twitchChannelId = 'channel')
+        await self.__waitUntil(lambda: messenger.getMetrics().totalMessagesSent == 1)
+        messenger.send('second', twitchChannelId = 'channel')
+        await self.__waitUntil(lambda: messenger.getMetrics().totalMessagesSent == 2)
+        assert twitchApiService.fetchModerator.await_count == 1
+
+        await messenger.clearCaches()
+        messenger.send('third', twitchChannelId = 'channel')
+        await self.__waitUntil(lambda: messenger.getMetrics().totalMessagesSent == 3)
+        assert twitchApiService.fetchModerator.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_isModerator_expiresAfterTimeToLive(self):
+        twitchApiService = create_autospec(TwitchApiServiceInterface, instance = True)
+        twitchApiService.fetchModerator = AsyncMock(return_value = self.__createModeratorsResponse([ self.selfTwitchUserId ]))
+        twitchApiService.sendChatMessage = AsyncMock(return_value = self.__createSentResponse())
+
+        messenger, _ = self.__createMessenger(
+            twitchApiService = twitchApiService,
+            channelAccessTokens = { 'channel': 'channelAccessToken' },
+            moderatorCacheTimeToLive = timedelta(milliseconds = 50),
+        )
+
+        messenger.send('first', twitchChannelId = 'channel')
+        await self.__waitUntil(lambda: messenger.getMetrics().totalMessagesSent == 1)
+
+        await asyncio.sleep(0.1)
+        messenger.send('second', twitchChannelId = 'channel')
+        await self.__waitUntil(lambda: messenger.getMetrics().totalMessagesSent == 2)
+        assert twitchApiService.fetchModerator.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_isModerator_withoutChannelAccessToken(self):
+        twitchApiService = create_autospec(TwitchApiServiceInterface, instance = True)
+        twitchApiService.sendChatMessage = AsyncMock(return_value = self.__createSentResponse())
+        messenger, _ = self.__createMessenger(twitchApiService)
+
+        messenger.send('hello', twitchChannelId = 'channel')
+        await self.__waitUntil(lambda: messenger.getMetrics().totalMessagesSent == 1)
+        twitchApiService.fetchModerator.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_isModerator_withOwnChannel(self):
+        twitchApiService = create_autospec(TwitchApiServiceInterface, instance = True)
+        twitchApiService.sendChatMessage = AsyncMock(return_value = self.__createSentResponse())
+        messenger, twitchTokensRepository = self.__createMessenger(twitchApiService)
+
+        messenger.send('hello', twitchChannelId = self.selfTwitchUserId)
+        await self.__waitUntil(lambda: messenger.getMetrics().totalMessagesSent == 1)
+        twitchTokensRepository.getAccessTokenById.assert_not_called()
+        twitchApiService.fetchModerator.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sendChatMessage_moderatorIsLimitedBySenderBucket(self):
+        twitchApiService = create_autospec(TwitchApiServiceInterface, instance = True)
+        twitchApiService.fetchModerator = AsyncMock(return_value = self.__createModeratorsResponse([ self.selfTwitchUserId ]))
+        twitchApiService.sendChatMessage = AsyncMock(return_value = self.__createSentResponse())
+
+        messenger, _ = self.__createMessenger(
+            twitchApiService = twitchApiService,
+            channelAccessTokens = { 'channel': 'channelAccessToken' },
+            maxMessagesPerPeriod = 1,
+            maxModeratorMessagesPerPeriod = 2,
+        )
+
+        for index in range(3):
+            messenger.send(f'message {index}', twitchChannelId = 'channel')
+
+        await self.__waitUntil(lambda: messenger.getMetrics().totalMessagesSent == 2)
+
+        # the third message has to wait for the sender bucket to refill
+        await asyncio.sleep(0.1)
+        assert messenger.getMetrics().totalMessagesSent == 2
+
+    @pytest.mark.asyncio
+    async def test_sendChatMessage_moderatorSkipsRegularBucket(self):
+        twitchApiService = create_autospec(TwitchApiServiceInterface, instance = True)
+        twitchApiService.fetchModerator = AsyncMock(return_value = self.__createModeratorsResponse([ self.selfTwitchUserId ]))
+        twitchApiService.sendChatMessage = AsyncMock(return_value = self.__createSentResponse())
+
+        messenger, _ = self.__createMessenger(
+            twitchApiService = twitchApiService,
+            channelAccessTokens = { 'channel': 'channelAccessToken' },
+            maxMessagesPerPeriod = 1,
+        )
+
+        for index in range(3):
+            messenger.send(f'message {index}', twitchChannelId = 'channel')
+
+        await self.__waitUntil(lambda: messenger.getMetrics().totalMessagesSent == 3)
+        assert twitchApiService.fetchModerator.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sendChatMessage_nonModeratorUsesRegularBucket(self):
+        twitchApiService = create_autospec(TwitchApiServiceInterface, instance = True)
+        twitchApiService.fetchModerator = AsyncMock(return_value = self.__createModeratorsResponse([ 'someoneElse' ]))
+        twitchApiService.sendChatMessage = AsyncMock(return_value = self.__createSentResponse())
+
+        messenger, _ = self.__createMessenger(
+            twitchApiService = twitchApiService,
+            channelAccessTokens = { 'channel': 'channelAccessToken' },
+            maxMessagesPerPeriod = 2,
+        )
+
+        for index in range(3):
+            messenger.send(f'message {index}', twitchChannelId = 'channel')
+
+        await self.__waitUntil(lambda: messenger.getMetrics().totalMessagesSent == 2)
+
+        # the third message has to wait for the regular bucket to refill
+        await asyncio.sleep(0.1)
+        assert messenger.getMetrics().totalMessagesSent == 2
+        assert twitchApiService.sendChatMessage.await_count == 2
+        assert twitchApiService.fetchModerator.await_count == 1
@@ -0,0 +1,181 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.timber.timberStub import TimberStub
+from src.twitch.absTwitchChatHandler import AbsTwitchChatHandler
+from src.twitch.absTwitchCheerHandler import AbsTwitchCheerHandler
+from src.twitch.api.models.twitchWebsocketDataBundle import TwitchWebsocketDataBundle
+from src.twitch.api.models.twitchWebsocketEvent import TwitchWebsocketEvent
+from src.twitch.api.models.twitchWebsocketMessageType import TwitchWebsocketMessageType
+from src.twitch.api.models.twitchWebsocketMetadata import TwitchWebsocketMetadata
+from src.twitch.api.models.twitchWebsocketPayload import TwitchWebsocketPayload
+from src.twitch.api.models.twitchWebsocketSubscriptionType import TwitchWebsocketSubscriptionType
+from src.twitch.twitchWebsocketDataBundleHandler import TwitchWebsocketDataBundleHandler
+from src.users.userIdsRepositoryInterface import UserIdsRepositoryInterface
+from src.users.userInterface import UserInterface
+from src.users.usersRepositoryInterface import UsersRepositoryInterface
+
+
+class TestTwitchWebsocketDataBundleHandler:
+
+    def __createDataBundle(
+        self,
+        broadcasterUserId: str,
+        message: str,
+        subscriptionType: TwitchWebsocketSubscriptionType = TwitchWebsocketSubscriptionType.CHANNEL_CHAT_MESSAGE,
+    ) -> TwitchWebsocketDataBundle:
+        return TwitchWebsocketDataBundle(
+            metadata = TwitchWebsocketMetadata(
+                messageTimestamp = datetime.now(),
+                messageId = f'{broadcasterUserId}-{message}',
+                subscriptionVersion = '1',
+                messageType = TwitchWebsocketMessageType.NOTIFICATION,
+                subscriptionType = subscriptionType,
+            ),
+            payload = TwitchWebsocketPayload(
+                event = TwitchWebsocketEvent(
+                    broadcasterUserId = broadcasterUserId,
+                    broadcasterUserLogin = f'login-{broadcasterUserId}',
+                    message = message,
+                    userId = 'chatterId',
+                    userLogin = 'chatterLogin',
+                ),
+                session = None,
+                subscription = None,
+            ),
+        )
+
+    def __createHandler(
+        self,
+        chatHandler: AbsTwitchChatHandler | None = None,
+        cheerHandler: AbsTwitchCheerHandler | None = None,
+        userIdsRepository: UserIdsRepositoryInterface | None = None,
+    ) -> TwitchWebsocketDataBundleHandler:
+        if userIdsRepository is None:
+            userIdsRepository = create_autospec(UserIdsRepositoryInterface, instance = True)
+
+        usersRepository = create_autospec(UsersRepositoryInterface, instance = True)
+        usersRepository.getUserAsync = AsyncMock(return_value = create_autospec(UserInterface, instance = True))
+
+        return TwitchWebsocketDataBundleHandler(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = asyncio.get_running_loop()),
+            channelPointRedemptionHandler = None,
+            chatHandler = chatHandler,
+            cheerHandler = cheerHandler,
+            followHandler = None,
+            hypeTrainHandler = None,
+            pollHandler = None,
+            predictionHandler = None,
+            raidHandler = None,
+            subscriptionHandler = None,
+            timber = TimberStub(),
+            userIdsRepository = userIdsRepository,
+            usersRepository = usersRepository,
+        )
+
+    async def __waitUntil(self, condition, timeoutSeconds: float = 2):
+        async with asyncio.timeout(timeoutSeconds):
+            while not condition():
+                await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_onNewWebsocketDataBundle_routesBySubscriptionType(self):
+        chatHandler = create_autospec(AbsTwitchChatHandler, instance = True)
+        chatHandler.onNewChatDataBundle = AsyncMock()
+        cheerHandler = create_autospec(AbsTwitchCheerHandler, instance = True)
+        cheerHandler.onNewCheerDataBundle = AsyncMock()
+        userIdsRepository = create_autospec(UserIdsRepositoryInterface, instance = True)
+        handler = self.__createHandler(chatHandler, cheerHandler, userIdsRepository)
+
+        cheerDataBundle = self.__createDataBundle('channel', 'cheer100', TwitchWebsocketSubscriptionType.CHANNEL_CHEER)
+        await handler.onNewWebsocketDataBundle(cheerDataBundle)
+        await self.__waitUntil(lambda: handler.getMetrics().totalDataBundlesHandled == 1)
+
+        cheerHandler.onNewCheerDataBundle.assert_awaited_once()
+        assert cheerHandler.onNewCheerDataBundle.await_args.kwargs['twitchChannelId'] == 'channel'
+        assert cheerHandler.onNewCheerDataBundle.await_args.kwargs['dataBundle'] is cheerDataBundle
+        chatHandler.onNewChatDataBundle.assert_not_called()
+
+        # the user IDs found in the event are persisted along the way
+        userIdsRepository.setUsers.assert_awaited_once_with({
+            'channel': 'login-channel',
+            'chatterId': 'chatterLogin',
+        })
+
+    @pytest.mark.asyncio
+    async def test_onNewWebsocketDataBundle_withFailingHandler(self):
+        async def onNewChatDataBundle(twitchChannelId: str, user: UserInterface, dataBundle: TwitchWebsocketDataBundle):
+            if dataBundle.requirePayload().event.message == 'bad':
+                raise ValueError('bad data bundle')
+
+        chatHandler = create_autospec(AbsTwitchChatHandler, instance = True)
+        chatHandler.onNewChatDataBundle = AsyncMock(side_effect = onNewChatDataBundle)
+        handler = self.__createHandler(chatHandler)
+
+        for message in [ 'good', 'bad', 'good again' ]:
+            await handler.onNewWebsocketDataBundle(self.__createDataBundle('channel', message))
+
+        await self.__waitUntil(lambda: handler.getMetrics().totalDataBundlesHandled + handler.getMetrics().totalDataBundlesFailed == 3)
+
+        metrics = handler.getMetrics()
+        assert metrics.totalDataBundlesHandled == 2
+        assert metrics.totalDataBundlesFailed == 1
+        assert metrics.pendingDataBundles == 0
+        assert 'channel' in metrics.laneAverageHandlerLatencySeconds
+
+    @pytest.mark.asyncio
+    async def test_onNewWebsocketDataBundle_withoutBroadcaster(self):
+        chatHandler = create_autospec(AbsTwitchChatHandler, instance = True)
+        chatHandler.onNewChatDataBundle = AsyncMock()
+        handler = self.__createHandler(chatHandler)
+
+        dataBundle = TwitchWebsocketDataBundle(
+            metadata = self.__createDataBundle('channel', 'hello').metadata,
+            payload = TwitchWebsocketPayload(
+                event = TwitchWebsocketEvent(message = 'hello'),
+                session = None,
+                subscription = None,
+            ),
+        )
+
+        await handler.onNewWebsocketDataBundle(dataBundle)
+        await asyncio.sleep(0.05)
+
+        assert handler.getMetrics().pendingDataBundles == 0
+        chatHandler.onNewChatDataBundle.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_onNewWebsocketDataBundle_lanesPerChannel(self):
+        slowChannelReleased = asyncio.Event()
+        handledMessages: list[str] = list()
+
+        async def onNewChatDataBundle(twitchChannelId: str, user: UserInterface, dataBundle: TwitchWebsocketDataBundle):
+            if twitchChannelId == 'slowChannel':
+                await slowChannelReleased.wait()
+
+            handledMessages.append(dataBundle.requirePayload().event.message)
+
+        chatHandler = create_autospec(AbsTwitchChatHandler, instance = True)
+        chatHandler.onNewChatDataBundle = AsyncMock(side_effect = onNewChatDataBundle)
+        handler = self.__createHandler(chatHandler)
+
+        await handler.onNewWebsocketDataBundle(self.__createDataBundle('slowChannel', 'slow 1'))
+        await handler.onNewWebsocketDataBundle(self.__createDataBundle('slowChannel', 'slow 2'))
+        await handler.onNewWebsocketDataBundle(self.__createDataBundle('fastChannel', 'fast 1'))
+        await handler.onNewWebsocketDataBundle(self.__createDataBundle('fastChannel', 'fast 2'))
+
+        await self.__waitUntil(lambda: len(handledMessages) == 2)
+
+        # the fast channel is fully handled, while the slow channel is still on its first message
+        assert handledMessages == [ 'fast 1', 'fast 2' ]
+        assert handler.getMetrics().laneQueueDepths == { 'slowChannel': 1 }
+
+        slowChannelReleased.set()
+        await self.__waitUntil(lambda: len(handledMessages) == 4)
+
+        assert handledMessages == [ 'fast 1', 'fast 2', 'slow 1', 'slow 2' ]
+        assert handler.getMetrics().pendingDataBundles == 0
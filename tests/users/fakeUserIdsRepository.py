@@ -18,6 +18,10 @@ class FakeUserIdsRepository(UserIdsRepositoryInterface):
         # this method is intentionally empty
         pass
 
+    async def flush(self):
+        # this method is intentionally empty
+        pass
+
     async def fetchUserId(
         self,
         userName: str,
@@ -0,0 +1,142 @@
+import json
+import os
+from typing import Any
+
+import pytest
+
+from src.aniv.mapper.anivJsonMapper import AnivJsonMapper
+from src.language.jsonMapper.languageEntryJsonMapper import LanguageEntryJsonMapper
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.soundPlayerManager.jsonMapper.soundAlertJsonMapper import SoundAlertJsonMapper
+from src.timber.timberStub import TimberStub
+from src.tts.jsonMapper.ttsJsonMapper import TtsJsonMapper
+from src.users.chatSoundAlert.chatSoundAlertJsonParser import ChatSoundAlertJsonParser
+from src.users.crowdControl.crowdControlJsonParser import CrowdControlJsonParser
+from src.users.cuteness.cutenessBoosterPackJsonParser import CutenessBoosterPackJsonParser
+from src.users.decTalkSongs.decTalkSongBoosterPackParser import DecTalkSongBoosterPackParser
+from src.users.exceptions import NoSuchUserException
+from src.users.pkmn.pkmnBoosterPackJsonParser import PkmnBoosterPackJsonParser
+from src.users.redemptionCounter.redemptionCounterBoosterPackParser import RedemptionCounterBoosterPackParser
+from src.users.soundAlert.soundAlertRedemptionJsonParser import SoundAlertRedemptionJsonParser
+from src.users.supStreamer.supStreamerBoosterPackJsonParser import SupStreamerBoosterPackJsonParser
+from src.users.timeout.timeoutBoosterPackJsonParser import TimeoutBoosterPackJsonParser
+from src.users.tts.ttsBoosterPackParser import TtsBoosterPackParser
+from src.users.userJsonConstant import UserJsonConstant
+from src.users.usersRepository import UsersRepository
+
+
+class TestUsersRepository:
+
+    def __createUsersRepository(self, usersFile: str) -> UsersRepository:
+        timber = TimberStub()
+        soundAlertJsonMapper = SoundAlertJsonMapper()
+        ttsJsonMapper = TtsJsonMapper(timber = timber)
+
+        return UsersRepository(
+            anivJsonMapper = AnivJsonMapper(),
+            chatSoundAlertJsonParser = ChatSoundAlertJsonParser(soundAlertJsonMapper = soundAlertJsonMapper),
+            crowdControlJsonParser = CrowdControlJsonParser(),
+            cutenessBoosterPackJsonParser = CutenessBoosterPackJsonParser(),
+            decTalkSongBoosterPackParser = DecTalkSongBoosterPackParser(),
+            languageEntryJsonMapper = LanguageEntryJsonMapper(),
+            pkmnBoosterPackJsonParser = PkmnBoosterPackJsonParser(timber = timber),
+            redemptionCounterBoosterPackParser = RedemptionCounterBoosterPackParser(),
+            soundAlertRedemptionJsonParser = SoundAlertRedemptionJsonParser(soundAlertJsonMapper = soundAlertJsonMapper),
+            supStreamerBoosterPackJsonParser = SupStreamerBoosterPackJsonParser(),
+            timber = timber,
+            timeoutBoosterPackJsonParser = TimeoutBoosterPackJsonParser(),
+            timeZoneRepository = TimeZoneRepository(),
+            ttsBoosterPackParser = TtsBoosterPackParser(ttsJsonMapper = ttsJsonMapper),
+            ttsJsonMapper = ttsJsonMapper,
+            usersFile = usersFile,
+        )
+
+    def __writeUsersFile(self, usersFile: str, jsonContents: dict[str, Any], modifiedTime: int):
+        with open(usersFile, mode = 'w', encoding = 'utf-8') as file:
+            json.dump(jsonContents, file)
+
+        # force a distinct mtime, as quick successive writes can otherwise share a timestamp
+        os.utime(usersFile, ns = (modifiedTime, modifiedTime))
+
+    @pytest.mark.asyncio
+    async def test_getUserAsync_isCaseInsensitive(self, tmp_path):
+        usersFile = str(tmp_path / 'usersRepository.json')
+        self.__writeUsersFile(usersFile, { 'SmashingGames': { 'triviaGameEnabled': True } }, 1_000_000_000)
+        usersRepository = self.__createUsersRepository(usersFile)
+
+        user = await usersRepository.getUserAsync('smashinggames')
+        assert user.handle == 'SmashingGames'
+        assert user is await usersRepository.getUserAsync('SMASHINGGAMES')
+        assert user is usersRepository.getUser('SmashingGames')
+
+        with pytest.raises(NoSuchUserException):
+            await usersRepository.getUserAsync('stashiocat')
+
+    @pytest.mark.asyncio
+    async def test_getUsersAsync_onlyRebuildsChangedUsers(self, tmp_path):
+        usersFile = str(tmp_path / 'usersRepository.json')
+
+        self.__writeUsersFile(usersFile, {
+            'imyt': { 'triviaGameEnabled': False },
+            'smashinggames': { 'triviaGameEnabled': False },
+        }, 1_000_000_000)
+
+        usersRepository = self.__createUsersRepository(usersFile)
+        users = await usersRepository.getUsersAsync()
+        assert users is await usersRepository.getUsersAsync()
+
+        imyt = await usersRepository.getUserAsync('imyt')
+        smashingGames = await usersRepository.getUserAsync('smashinggames')
+
+        self.__writeUsersFile(usersFile, {
+            'imyt': { 'triviaGameEnabled': False },
+            'smashinggames': { 'triviaGameEnabled': True },
+        }, 2_000_000_000)
+
+        reloadedUsers = await usersRepository.getUsersAsync()
+        assert reloadedUsers is not users
+        assert await usersRepository.getUserAsync('imyt') is imyt
+
+        reloadedSmashingGames = await usersRepository.getUserAsync('smashinggames')
+        assert reloadedSmashingGames is not smashingGames
+        assert reloadedSmashingGames.isTriviaGameEnabled
+
+    @pytest.mark.asyncio
+    async def test_getUsersAsync_withMalformedReloadKeepsPreviousUsers(self, tmp_path):
+        usersFile = str(tmp_path / 'usersRepository.json')
+        self.__writeUsersFile(usersFile, { 'imyt': { } }, 1_000_000_000)
+        usersRepository = self.__createUsersRepository(usersFile)
+        users = await usersRepository.getUsersAsync()
+
+        with open(usersFile, mode = 'w', encoding = 'utf-8') as file:
+            file.write('{ "imyt": ')
+
+        os.utime(usersFile, ns = (2_000_000_000, 2_000_000_000))
+        assert await usersRepository.getUsersAsync() is users
+
+    @pytest.mark.asyncio
+    async def test_modifyUserValue_writesFileAtomically(self, tmp_path):
+        usersFile = str(tmp_path / 'usersRepository.json')
+
+        self.__writeUsersFile(usersFile, {
+            'imyt': { },
+            'SmashingGames': { UserJsonConstant.TTS_ENABLED.jsonKey: False },
+        }, 1_000_000_000)
+
+        usersRepository = self.__createUsersRepository(usersFile)
+        imyt = await usersRepository.getUserAsync('imyt')
+
+        await usersRepository.modifyUserValue(
+            handle = 'smashinggames',
+            jsonConstant = UserJsonConstant.TTS_ENABLED,
+            value = True,
+        )
+
+        assert (await usersRepository.getUserAsync('smashinggames')).isTtsEnabled
+        assert await usersRepository.getUserAsync('imyt') is imyt
+        assert os.listdir(tmp_path) == [ 'usersRepository.json' ]
+
+        with open(usersFile, mode = 'r', encoding = 'utf-8') as file:
+            jsonContents = json.load(file)
+
+        assert jsonContents['SmashingGames'][UserJsonConstant.TTS_ENABLED.jsonKey] is True
@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.websocketConnection.broadcast.websocketBroadcastHub import WebsocketBroadcastHub
+from src.websocketConnection.broadcast.websocketSubscription import WebsocketSubscription
+from src.websocketConnection.websocketEvent import WebsocketEvent
+from src.websocketConnection.websocketEventType import WebsocketEventType
+
+
+class TestWebsocketBroadcastHub:
+
+    everything = WebsocketSubscription(
+        eventTypes = None,
+        lastEventId = None,
+        twitchChannelIds = None,
+    )
+
+    def __createEvent(
+        self,
+        eventId: int,
+        twitchChannelId: str = '12345',
+        eventTime: datetime | None = None,
+    ) -> WebsocketEvent:
+        return WebsocketEvent(
+            eventTime = eventTime or datetime.now(timezone.utc),
+            eventData = { 'eventId': eventId },
+            eventId = eventId,
+            eventJson = f'{{"eventId": {eventId}}}',
+            twitchChannelId = twitchChannelId,
+            eventType = WebsocketEventType.CHANNEL_PREDICTION,
+        )
+
+    @pytest.mark.asyncio
+    async def test_publish_fansOutToEverySubscriber(self):
+        hub = WebsocketBroadcastHub()
+        now = datetime.now(timezone.utc)
+        first = hub.subscribe(self.everything, now)
+        second = hub.subscribe(self.everything, now)
+
+        assert hub.publish(self.__createEvent(1)) == 2
+        assert (await first.next()).eventId == 1
+        assert (await second.next()).eventId == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_withChannelFilter(self):
+        hub = WebsocketBroadcastHub()
+
+        subscriber = hub.subscribe(WebsocketSubscription(
+            eventTypes = None,
+            lastEventId = None,
+            twitchChannelIds = frozenset({ '67890' }),
+        ), datetime.now(timezone.utc))
+
+        assert hub.publish(self.__createEvent(1, twitchChannelId = '12345')) == 0
+        assert hub.publish(self.__createEvent(2, twitchChannelId = '67890')) == 1
+        assert (await subscriber.next()).eventId == 2
+        assert subscriber.pendingEvents == 0
+
+    def test_publish_withSlowSubscriberDropsOldest(self):
+        hub = WebsocketBroadcastHub(subscriberBufferSize = 2)
+        subscriber = hub.subscribe(self.everything, datetime.now(timezone.utc))
+
+        for eventId in range(1, 6):
+            hub.publish(self.__createEvent(eventId))
+
+        assert subscriber.pendingEvents == 2
+        assert subscriber.droppedEvents == 3
+
+    @pytest.mark.asyncio
+    async def test_subscribe_replaysRecentEvents(self):
+        hub = WebsocketBroadcastHub()
+        now = datetime.now(timezone.utc)
+        hub.publish(self.__createEvent(1, eventTime = now - timedelta(minutes = 5)))
+        hub.publish(self.__createEvent(2, eventTime = now))
+
+        subscriber = hub.subscribe(self.everything, now - timedelta(seconds = 30))
+        assert subscriber.pendingEvents == 1
+        assert (await subscriber.next()).eventId == 2
+
+    @pytest.mark.asyncio
+    async def test_subscribe_withLastEventId(self):
+        hub = WebsocketBroadcastHub()
+        now = datetime.now(timezone.utc)
+
+        for eventId in range(1, 5):
+            hub.publish(self.__createEvent(eventId, eventTime = now - timedelta(minutes = 5)))
+
+        subscriber = hub.subscribe(WebsocketSubscription(
+            eventTypes = None,
+            lastEventId = 2,
+            twitchChannelIds = None,
+        ), now)
+
+        assert (await subscriber.next()).eventId == 3
+        assert (await subscriber.next()).eventId == 4
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self):
+        hub = WebsocketBroadcastHub()
+        subscriber = hub.subscribe(self.everything, datetime.now(timezone.utc))
+        hub.unsubscribe(subscriber)
+
+        assert hub.getSubscriberCount() == 0
+        assert hub.publish(self.__createEvent(1)) == 0
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(subscriber.next(), timeout = 0.01)
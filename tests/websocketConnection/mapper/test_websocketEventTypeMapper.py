@@ -10,3 +10,19 @@ class TestWebsocketEventTypeMapper:
     def test_toString_withChannelPrediction(self):
         result = self.mapper.toString(WebsocketEventType.CHANNEL_PREDICTION)
         assert result == 'channelPrediction'
+
+    def test_parseWebsocketEventType_withChannelPrediction(self):
+        result = self.mapper.parseWebsocketEventType('channelPrediction')
+        assert result is WebsocketEventType.CHANNEL_PREDICTION
+
+    def test_parseWebsocketEventType_withEmptyString(self):
+        result = self.mapper.parseWebsocketEventType('')
+        assert result is None
+
+    def test_parseWebsocketEventType_withNone(self):
+        result = self.mapper.parseWebsocketEventType(None)
+        assert result is None
+
+    def test_parseWebsocketEventType_withWhitespaceString(self):
+        result = self.mapper.parseWebsocketEventType(' ')
+        assert result is None